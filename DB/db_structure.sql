@@ -326,6 +326,7 @@ CREATE TABLE `product` (
   `batch_id` int DEFAULT NULL,
   `warehouse_id` int DEFAULT NULL,
   `line_id` int DEFAULT NULL,
+  `type` varchar(10) DEFAULT NULL,
   PRIMARY KEY (`product_id`),
   KEY `batch_id` (`batch_id`),
   KEY `warehouse_id` (`warehouse_id`),
@@ -344,7 +345,7 @@ CREATE TABLE `product` (
 
 LOCK TABLES `product` WRITE;
 /*!40000 ALTER TABLE `product` DISABLE KEYS */;
-INSERT INTO `product` VALUES ('W8L801B576P1',0.9936,0.078,10.8,0.79,3.2,7.25,0.41,0.33,55.8,160.5,9.17,576,8,801),('W8L801B576P10',0.9925,0.02,9.8,0.75,3.53,8.2,0.3,0.89,42.2,66.2,15.31,576,8,801),('W8L801B576P11',0.9972,0.045,10,0.9,2.86,9.08,0.72,0.15,19.1,61.5,19.9,576,8,801),('W8L801B576P12',0.997,0.064,12.1,0.87,2.83,6.21,0.19,0.75,49.9,20.2,19.32,576,8,801),('W8L801B576P13',0.9918,0.091,8.7,0.69,3.13,6.65,0.65,0.35,59.4,205.8,14.03,576,8,801),('W8L801B576P14',1.0031,0.031,12.6,0.89,3.67,7.86,0.11,0.78,7.7,178.1,14.83,576,8,801),('W8L801B576P15',1.0049,0.095,8.6,0.84,3.49,6.4,0.27,0.9,8.4,164.4,2.67,576,8,801),('W8L801B576P16',0.9905,0.09,12.7,0.4,3.47,5.86,0.36,0.67,21.8,92.9,6.79,576,8,801),('W8L801B576P17',1.0007,0.021,13.6,0.67,3.77,5.85,0.68,0.52,16.2,115.5,13.19,576,8,801),('W8L801B576P18',1,0.014,10.7,0.77,3.16,5.29,0.46,0.29,18.6,91.1,7.66,576,8,801),('W8L801B576P19',0.992,0.057,11.9,0.89,3.2,6.11,0.21,0.55,21.3,200.2,17.12,576,8,801),('W8L801B576P2',1.0017,0.046,11.9,0.43,2.92,5.62,0.03,0.4,33.7,202.2,17.68,576,8,801),('W8L801B576P20',1.0001,0.1,10.7,0.58,3.51,7.89,0.31,0.23,45,52.6,17.48,576,8,801),('W8L801B576P21',0.9935,0.051,12.1,0.47,2.95,5.93,0.25,0.95,64.3,221.1,3.21,576,8,801),('W8L801B576P22',0.9956,0.03,9.2,0.91,3.01,5.77,0.34,0.41,26.9,217.2,16.2,576,8,801),('W8L801B576P23',0.9999,0.083,11.6,0.77,3.12,8.15,0.3,0.27,45.9,167.6,5.88,576,8,801),('W8L801B576P24',1.0022,0.026,9.8,0.61,3.25,5.67,0.24,0.96,32.7,193.7,6.76,576,8,801),('W8L801B576P25',0.9959,0.069,12.1,0.65,3.3,9.2,0.14,0.18,34.5,206.2,17.12,576,8,801),('W8L801B576P26',1.001,0.085,11.3,0.51,3.38,9.84,0.05,0.25,14.2,122.5,5.62,576,8,801),('W8L801B576P27',0.9925,0.078,9.9,0.37,3.79,8.81,0.22,0.97,44.3,103.3,13.55,576,8,801),('W8L801B576P3',0.9965,0.046,10.9,0.57,3.13,9.2,0.76,0.49,34.8,89.9,0.79,576,8,801),('W8L801B576P4',0.994,0.016,9.4,0.89,3.73,6.24,0.26,0.51,58.1,59.7,17.89,576,8,801),('W8L801B576P5',0.9956,0.056,10.3,0.99,3.62,6.42,0.56,0.43,57.6,92.7,18.67,576,8,801),('W8L801B576P6',0.995,0.049,11.6,0.93,3.41,8.74,0.17,0.65,15,237,7.59,576,8,801),('W8L801B576P7',0.9962,0.086,14,0.3,2.94,9.8,0.5,0.98,50.6,214,16.71,576,8,801),('W8L801B576P8',1.0022,0.088,8.3,0.8,3.1,7.67,0.66,0.37,9.5,171.5,16.2,576,8,801),('W8L801B576P9',0.994,0.079,13.1,0.69,3.08,9.51,0.34,0.92,16.1,194.5,13.37,576,8,801),('W8L801B577P1',1.0026,0.032,11.1,1,3.01,5.86,0.73,0.49,21.2,22.7,11.68,577,8,801),('W8L801B577P10',0.9906,0.098,8.1,0.92,3.31,9.61,0.6,0.85,55,45.1,11.69,577,8,801),('W8L801B577P11',1.003,0.075,11.4,0.97,3.66,9.29,0.55,0.16,21.2,75,5.03,577,8,801),('W8L801B577P12',1.0037,0.026,8.5,0.92,3.73,8.65,0.14,0.68,31.4,153.3,5.89,577,8,801),('W8L801B577P13',1.0012,0.066,11,0.72,3.71,8.47,0.3,0.61,26.6,104.4,12.93,577,8,801),('W8L801B577P14',1.0041,0.06,12.5,0.63,3.79,6.39,0.04,0.3,16.3,159.7,3.55,577,8,801),('W8L801B577P15',0.992,0.013,9.3,0.75,3.2,9.22,0.38,0.12,31.4,16.1,18.68,577,8,801),('W8L801B577P16',1.0013,0.065,11.2,0.64,2.95,7.07,0.43,0.38,28.6,220.4,14.47,577,8,801),('W8L801B577P17',0.9956,0.016,13.5,0.65,3.17,9.54,0.05,0.98,14,96.4,16.54,577,8,801),('W8L801B577P18',0.9938,0.082,11.8,0.34,2.92,8.96,0.33,0.38,48.3,31.8,2.68,577,8,801),('W8L801B577P19',1.0012,0.093,10.4,0.37,3.66,9.91,0.47,0.24,28.8,84.2,3.16,577,8,801),('W8L801B577P2',1.0028,0.082,8.3,0.46,3.59,7.02,0.29,0.96,27.8,222.6,1.68,577,8,801),('W8L801B577P20',1.0014,0.038,10.8,0.36,3.07,9.95,0.04,0.54,63.8,237.4,16.7,577,8,801),('W8L801B577P3',0.9939,0.016,9.2,0.94,3.55,7.83,0.31,0.13,35.2,57.7,13.29,577,8,801),('W8L801B577P4',0.9911,0.047,10.5,0.95,3.06,7.25,0.33,0.31,50.6,223.7,17.54,577,8,801),('W8L801B577P5',0.9938,0.038,12.7,0.32,2.91,6.78,0.52,0.72,62.2,180.4,5.34,577,8,801),('W8L801B577P6',1.0015,0.091,9.5,0.99,3.77,9.26,0.61,0.64,12.4,15.9,9.56,577,8,801),('W8L801B577P7',1.0004,0.086,9.9,0.77,3.04,6.97,0.61,0.85,58.6,84.1,13.98,577,8,801),('W8L801B577P8',1.0019,0.017,8.4,0.32,2.88,9.74,0.35,0.91,42.4,202.9,19.14,577,8,801),('W8L801B577P9',0.9948,0.074,11.1,0.41,2.88,6.92,0.51,0.62,28.1,113.5,19.55,577,8,801),('W8L801B578P1',0.993,0.019,9.3,0.39,3.43,5.68,0.29,0.68,41.1,58.3,10.54,578,8,801),('W8L801B578P10',0.9974,0.029,9.9,0.85,3.25,8.16,0.2,0.83,28.6,49,8.21,578,8,801),('W8L801B578P11',1.0013,0.046,11.3,0.43,3.73,8.01,0.59,0.29,8.6,169.3,10.84,578,8,801),('W8L801B578P12',0.9917,0.097,12.1,0.98,2.81,9.39,0.24,0.21,15.8,192.2,6.38,578,8,801),('W8L801B578P13',0.996,0.048,14,0.58,3.5,9.73,0.18,0.72,43.8,154.2,6.03,578,8,801),('W8L801B578P14',1.0008,0.093,13.4,0.36,3.46,5.65,0.1,0.5,10.3,26,2.29,578,8,801),('W8L801B578P15',0.9989,0.073,11,0.35,3.5,9.53,0.65,0.11,7,242.7,12.8,578,8,801),('W8L801B578P16',1.0009,0.079,12.7,0.45,3.55,8.92,0.03,0.77,43.6,191.6,3,578,8,801),('W8L801B578P17',0.9959,0.024,8.5,0.69,3.09,8.43,0.45,0.96,49.8,190.7,1.76,578,8,801),('W8L801B578P18',0.999,0.011,12.4,0.48,2.87,8.77,0.3,0.23,54.1,231.3,14,578,8,801),('W8L801B578P19',0.9973,0.061,8.8,0.41,3.09,8.87,0.41,0.52,9.3,48.1,10.76,578,8,801),('W8L801B578P2',1.0049,0.062,12.7,0.74,3.42,8.23,0.28,0.74,32.1,151,15.6,578,8,801),('W8L801B578P20',0.9918,0.028,10.2,0.32,3.48,6.89,0.08,0.3,40.6,177,18.81,578,8,801),('W8L801B578P21',1.0013,0.1,9.1,0.48,3.47,5.55,0.76,0.93,69.8,74.6,17,578,8,801),('W8L801B578P22',1.002,0.091,9.3,0.49,3.78,9.11,0.67,0.31,24.1,100.7,14.89,578,8,801),('W8L801B578P23',0.9957,0.032,13.1,0.88,3,5.2,0.37,0.2,29.8,139.9,18.59,578,8,801),('W8L801B578P24',1.0002,0.059,12.2,0.81,3.58,6.04,0.43,0.87,20.8,235.1,16.02,578,8,801),('W8L801B578P25',1.0001,0.043,12.5,0.93,3.42,7.91,0.76,0.64,50,196.1,17.35,578,8,801),('W8L801B578P26',1.0026,0.058,9.4,0.79,3.08,5.51,0.61,0.19,17.7,71.1,11.47,578,8,801),('W8L801B578P27',0.9994,0.069,13.7,0.95,3.26,6.28,0.36,0.86,38.1,67.2,19.06,578,8,801),('W8L801B578P3',0.9982,0.082,10.3,0.49,3.29,7.66,0.62,0.35,67.7,212.6,14.43,578,8,801),('W8L801B578P4',0.9922,0.074,12.3,0.95,3.42,8.82,0.07,0.86,43.6,114.8,4.97,578,8,801),('W8L801B578P5',0.9957,0.029,12.8,0.45,3.78,9.82,0.5,0.18,24,96.3,10.9,578,8,801),('W8L801B578P6',1.0034,0.036,8.8,0.42,3.62,5.59,0.6,0.83,15.5,114.9,15.6,578,8,801),('W8L801B578P7',1.001,0.062,9.4,0.53,3.48,8.93,0.38,0.11,19.2,138.7,3.31,578,8,801),('W8L801B578P8',1.0001,0.074,10.7,0.63,3.78,5.98,0.08,0.43,61.4,51.7,3.09,578,8,801),('W8L801B578P9',1.0038,0.037,11.5,0.93,3.26,9.48,0.28,0.1,64.6,22.7,19.18,578,8,801),('W8L801B579P1',0.9924,0.023,8.2,0.79,3.22,9.72,0.78,0.18,37.2,116.1,10.17,579,8,801),('W8L801B579P10',1,0.077,10.9,0.44,3.48,8.68,0.63,0.93,34.9,244.5,4.13,579,8,801),('W8L801B579P11',0.9961,0.034,8.5,0.87,3.29,6.05,0.48,0.92,28.2,107.1,2.12,579,8,801),('W8L801B579P12',1.0002,0.048,9.9,0.53,3.5,5.7,0.72,0.27,15.2,37,11.67,579,8,801),('W8L801B579P13',1.0043,0.022,11.9,0.46,3.4,8.63,0.17,0.48,13.9,182.5,16.07,579,8,801),('W8L801B579P14',0.9981,0.086,11.9,0.35,3.3,7.44,0.53,0.71,67.3,181.8,6.21,579,8,801),('W8L801B579P15',1.0009,0.018,10.1,0.68,3.67,5.35,0.6,0.71,16.5,51.5,10.02,579,8,801),('W8L801B579P16',0.995,0.032,10.3,0.86,2.82,9.5,0.23,0.36,48.5,146.5,1.52,579,8,801),('W8L801B579P17',1.0039,0.075,8.6,0.91,3.28,9,0.17,0.31,31,140.1,4.66,579,8,801),('W8L801B579P18',1.0047,0.045,11.7,0.86,3.02,9.94,0.19,0.48,43.9,35.2,3.37,579,8,801),('W8L801B579P19',0.9938,0.062,10.6,0.95,3.28,8.26,0.03,0.6,8.9,142.5,2.67,579,8,801),('W8L801B579P2',0.9917,0.077,10.9,0.79,3.31,8.45,0.23,0.5,29.6,53.9,18.94,579,8,801),('W8L801B579P20',1.0023,0.051,13.8,0.96,3.4,5.15,0.32,0.29,31,132.2,12.26,579,8,801),('W8L801B579P21',0.9942,0.077,9.1,0.51,3.18,7.4,0.61,0.88,49.9,22.8,14.34,579,8,801),('W8L801B579P22',1.003,0.03,9.4,0.7,2.9,7.3,0.49,0.83,33.6,226.5,0.66,579,8,801),('W8L801B579P23',0.9947,0.084,13.5,0.83,3.68,5.33,0.24,0.78,24.5,95.1,1.71,579,8,801),('W8L801B579P24',0.9913,0.06,12,0.81,3.28,7.14,0.69,0.9,10.8,96.7,8.14,579,8,801),('W8L801B579P25',1.0005,0.06,9.7,0.47,3.52,9.74,0.35,0.41,21.6,163,12.25,579,8,801),('W8L801B579P3',0.999,0.02,9.6,0.51,3.42,8.82,0.32,0.3,68.9,165,14.24,579,8,801),('W8L801B579P4',1.0006,0.04,8.5,0.72,2.91,7.09,0.27,0.39,21.3,194.1,4.98,579,8,801),('W8L801B579P5',0.998,0.019,9.6,0.87,3.32,9.97,0.26,0.61,30.9,193,7.03,579,8,801),('W8L801B579P6',1.0021,0.077,9.6,0.63,3.62,7.72,0.1,0.15,59,124.7,10.73,579,8,801),('W8L801B579P7',0.9942,0.021,10.5,0.4,3.67,7.85,0.53,0.97,60.1,217.4,2.66,579,8,801),('W8L801B579P8',1.0034,0.017,13.1,0.7,3.38,6.07,0.1,0.16,67.5,28.2,19.45,579,8,801),('W8L801B579P9',1.0012,0.065,8.5,0.58,3.52,5.94,0.4,0.83,33.4,211.5,3.43,579,8,801),('W8L801B580P1',0.9972,0.082,11,0.99,3.58,8.19,0.58,0.6,6.3,78.8,1.23,580,8,801),('W8L801B580P10',0.9979,0.03,9.3,0.82,3.8,5.81,0.64,0.14,55.1,56.6,15.99,580,8,801),('W8L801B580P11',1.0037,0.019,8.8,0.78,3.68,5.49,0.2,0.88,38.6,135,8.17,580,8,801),('W8L801B580P12',0.9916,0.025,13.2,0.74,3.57,6,0.25,0.43,36.5,74.3,17.67,580,8,801),('W8L801B580P13',0.9953,0.099,9.5,0.54,3.58,5.04,0.37,0.21,11.2,229.9,16.91,580,8,801),('W8L801B580P14',0.9934,0.067,12.9,0.88,2.89,6.08,0.11,0.74,67.7,112.1,2.91,580,8,801),('W8L801B580P15',0.9962,0.091,9.1,0.76,3.13,9.76,0.43,0.59,9.3,92.2,16.73,580,8,801),('W8L801B580P16',0.9984,0.071,9.6,0.45,3.59,8.82,0.07,0.7,32.7,192.3,6.23,580,8,801),('W8L801B580P17',0.9977,0.076,12.3,0.3,3.01,5.42,0,0.74,57.3,29.6,5.16,580,8,801),('W8L801B580P18',0.9963,0.011,12,0.88,3.13,6.21,0.53,0.38,56.5,225.4,12.46,580,8,801),('W8L801B580P19',1.0005,0.066,8.8,0.36,3.08,6.8,0.37,0.98,51.7,151.2,19.28,580,8,801),('W8L801B580P2',0.999,0.067,9.8,0.71,3.27,9.7,0.07,0.13,55.4,100.8,19,580,8,801),('W8L801B580P20',0.9905,0.086,10.2,0.36,3.47,7.92,0.29,0.88,39.7,21.3,11.12,580,8,801),('W8L801B580P21',1.0008,0.043,11.7,0.55,3.79,8.64,0.25,0.5,25,44.6,8.83,580,8,801),('W8L801B580P22',0.9935,0.051,13.8,0.87,3.33,8.04,0.76,0.81,45.4,196.1,6.5,580,8,801),('W8L801B580P23',0.9921,0.04,9,0.31,2.82,5.03,0.53,0.46,36.3,10.9,18.23,580,8,801),('W8L801B580P24',1.0001,0.051,11.3,0.46,3.59,5.81,0.08,0.35,40.1,153.7,10.88,580,8,801),('W8L801B580P3',0.9948,0.056,9.9,0.33,3.37,6.98,0.42,0.24,29.2,27.5,14.5,580,8,801),('W8L801B580P4',0.9995,0.049,11.9,0.61,3.23,7.23,0.36,0.7,11.1,81.2,6.36,580,8,801),('W8L801B580P5',0.9903,0.069,10.1,0.73,3.56,8.1,0.1,0.18,5.7,227.4,11.17,580,8,801),('W8L801B580P6',0.9975,0.042,9.3,0.48,3.8,6.6,0.44,0.72,15.7,238.3,1.46,580,8,801),('W8L801B580P7',1.0046,0.02,9.3,0.74,3.47,8.97,0.02,0.69,18.3,29.1,14.13,580,8,801),('W8L801B580P8',0.992,0.042,10.6,0.48,2.81,8.55,0.32,0.37,42.8,10.8,5.57,580,8,801),('W8L801B580P9',0.9957,0.043,12.2,0.96,3.58,6.85,0.11,0.12,59.4,11.8,9.18,580,8,801),('W8L801B581P1',0.9973,0.065,13.4,0.59,2.99,7.98,0.12,0.66,47.3,89.2,13.76,581,8,801),('W8L801B581P10',1.0049,0.073,12.5,0.79,2.86,8.37,0.34,0.66,38.3,81.1,4.09,581,8,801),('W8L801B581P11',0.9963,0.017,10.5,0.97,3.08,5.3,0.23,0.53,15.8,143.6,9.49,581,8,801),('W8L801B581P12',0.9923,0.083,10.8,0.76,3.19,8.78,0.09,0.23,28.5,72.4,12.96,581,8,801),('W8L801B581P13',0.9953,0.014,11.1,0.84,2.9,9.76,0.17,0.34,64.7,160.5,10.73,581,8,801),('W8L801B581P14',0.996,0.075,10.8,0.95,3.65,7.71,0.34,0.31,66.9,142.4,5.25,581,8,801),('W8L801B581P15',1.0016,0.069,9,0.38,3.53,8.38,0.34,0.53,11.6,212.8,16.5,581,8,801),('W8L801B581P16',0.9998,0.091,12.1,0.42,2.93,8.65,0.44,0.4,14.4,192.2,12.75,581,8,801),('W8L801B581P17',0.9963,0.063,11.1,0.33,2.83,6.99,0.63,0.17,59.4,185.3,5.41,581,8,801),('W8L801B581P18',0.9981,0.048,13.9,0.94,3.38,5.5,0.45,0.43,23.6,142.9,6.21,581,8,801),('W8L801B581P19',0.9934,0.06,8.8,0.51,3.25,8.49,0.71,0.3,13.9,180.8,6.37,581,8,801),('W8L801B581P2',1.0023,0.032,12.9,0.55,2.99,9.64,0.39,0.79,59.4,155.8,9.12,581,8,801),('W8L801B581P20',1.004,0.013,10.4,0.32,2.96,8.55,0.17,0.38,64.5,217.5,12.31,581,8,801),('W8L801B581P21',1.0008,0.035,13.1,0.71,3.19,6.37,0.69,0.14,29.9,139.6,11.54,581,8,801),('W8L801B581P22',1.0004,0.058,9.6,0.35,3.05,8.89,0.44,0.45,60.8,89.9,9.2,581,8,801),('W8L801B581P23',1.0017,0.019,10.5,0.74,3.45,9.59,0.23,0.74,49.8,16.9,17.04,581,8,801),('W8L801B581P24',1.0007,0.018,13.2,0.47,3.3,7.74,0.61,0.57,28.5,33.8,16.12,581,8,801),('W8L801B581P25',0.9989,0.056,12.7,0.98,3.1,9.21,0.43,0.17,55.9,80,1.22,581,8,801),('W8L801B581P3',0.9939,0.086,9.7,0.93,3.27,5.78,0.11,0.95,46.5,194.3,16.38,581,8,801),('W8L801B581P4',1.0032,0.095,10.2,0.34,3.62,6.39,0.57,0.63,69.1,195.4,6.43,581,8,801),('W8L801B581P5',0.9946,0.021,10.9,0.96,3.65,5.1,0.01,0.41,62.8,118.4,4.53,581,8,801),('W8L801B581P6',0.9998,0.029,11.5,0.86,3.32,5.14,0.64,0.85,55.1,100.6,6.08,581,8,801),('W8L801B581P7',0.9988,0.024,13.2,0.67,2.81,6.5,0.1,0.43,45.3,196.9,7.63,581,8,801),('W8L801B581P8',0.9992,0.06,10.6,0.72,3.38,9.31,0.29,0.92,30.3,48.4,13.07,581,8,801),('W8L801B581P9',1.0024,0.075,10.8,0.51,3.33,7.64,0.13,0.37,38.1,197.3,1.34,581,8,801),('W8L801B582P1',1.002,0.075,11.4,0.92,3.43,7.95,0.37,0.72,50.3,94.8,5.81,582,8,801),('W8L801B582P10',0.9945,0.067,12.5,0.95,3.1,7.58,0.73,0.56,61.6,12,14.75,582,8,801),('W8L801B582P11',0.9961,0.017,8.4,0.5,3.74,6.63,0.03,0.55,62.8,151.8,16.28,582,8,801),('W8L801B582P12',0.9933,0.097,9.6,0.56,3.62,5.85,0.24,0.25,32.6,182.4,5.03,582,8,801),('W8L801B582P13',0.994,0.012,12.4,1,3.55,7.99,0.08,0.55,15.1,132.4,8.05,582,8,801),('W8L801B582P14',1.0017,0.012,10.9,0.87,3.18,6.42,0.65,0.71,6.4,114.4,6.3,582,8,801),('W8L801B582P15',0.997,0.061,12.3,0.42,3.57,8.64,0.01,0.58,31.2,38.4,9.21,582,8,801),('W8L801B582P16',0.9973,0.067,10.4,0.88,3.1,7.52,0.23,0.47,26.2,156.8,0.99,582,8,801),('W8L801B582P17',0.9902,0.059,11.4,0.63,3.32,6.64,0.31,0.94,49.1,216.6,11.59,582,8,801),('W8L801B582P18',1.0045,0.092,8.5,0.45,2.87,8.96,0.41,0.14,44.7,14.5,18.4,582,8,801),('W8L801B582P19',1.0045,0.093,10,0.35,3.01,7.15,0.02,0.41,42.3,11.7,0.99,582,8,801),('W8L801B582P2',0.9977,0.041,12.8,0.91,2.98,5.64,0.72,0.45,64.7,101.7,8.15,582,8,801),('W8L801B582P20',1.0029,0.011,9.8,0.8,3.63,8.48,0.17,0.76,53.4,211.6,10.78,582,8,801),('W8L801B582P21',1.0018,0.062,13.7,0.77,3.72,8.23,0.62,0.69,36,217.8,16.85,582,8,801),('W8L801B582P22',0.9943,0.082,10.4,0.99,3.64,5.37,0.23,0.84,60.1,30.7,9.14,582,8,801),('W8L801B582P23',0.9981,0.036,10.9,0.53,3.01,7.81,0.41,0.24,39,123,11.77,582,8,801),('W8L801B582P3',1.0028,0.033,13.6,0.38,3.13,9.79,0.2,0.54,62.5,153.2,6.32,582,8,801),('W8L801B582P4',0.9996,0.038,10.5,0.56,3.57,7.35,0.25,0.29,46.1,212.6,15.8,582,8,801),('W8L801B582P5',0.9949,0.05,13.3,0.71,3.49,9.15,0.49,0.45,53.2,210.9,9.04,582,8,801),('W8L801B582P6',1.0033,0.018,13.8,0.76,3.08,7.04,0.15,0.71,68.1,85.2,15.52,582,8,801),('W8L801B582P7',0.9902,0.065,9.2,0.89,3.58,5.06,0.25,0.74,8.6,61.4,2.18,582,8,801),('W8L801B582P8',1.004,0.051,11.1,0.61,3.11,7.14,0.18,0.59,18.1,121,5.42,582,8,801),('W8L801B582P9',0.9901,0.051,10.2,0.77,3.31,6.6,0.55,0.12,46.1,215.1,19.01,582,8,801),('W8L801B583P1',0.9914,0.093,13.3,0.84,3.27,6.48,0.07,0.14,30.5,166.1,5.84,583,8,801),('W8L801B583P10',0.9981,0.012,8.8,0.91,2.99,6.38,0.1,0.75,7,200.1,6.21,583,8,801),('W8L801B583P11',0.9917,0.02,9.7,0.95,3.74,8.17,0.01,0.19,30.1,144.9,17.13,583,8,801),('W8L801B583P12',1.0011,0.049,8.5,0.48,3.58,7.12,0.68,0.28,23.9,67.3,4.36,583,8,801),('W8L801B583P13',0.9919,0.021,13.5,0.44,3.21,9.19,0.13,0.86,15.4,233.1,15.83,583,8,801),('W8L801B583P14',0.9918,0.028,13.7,0.39,3.4,5.47,0.4,0.31,16.7,37.8,6.4,583,8,801),('W8L801B583P15',0.9992,0.096,11.8,0.51,3.77,7.18,0.28,0.4,57.4,229.4,6.72,583,8,801),('W8L801B583P16',0.9996,0.031,8.8,0.31,3.08,6.5,0.66,0.5,9.2,229.4,1.36,583,8,801),('W8L801B583P17',0.9954,0.073,10.6,0.76,3.12,5.95,0.39,0.2,19,46.3,12.6,583,8,801),('W8L801B583P18',0.9938,0.053,13.2,0.94,2.88,7.75,0.19,0.27,11.8,160.2,5.56,583,8,801),('W8L801B583P19',0.9997,0.039,12.3,0.96,2.83,8.72,0.43,0.55,34.6,141.4,16.59,583,8,801),('W8L801B583P2',0.9965,0.046,11,0.83,3.46,7.18,0.71,0.5,31.2,23.9,18.84,583,8,801),('W8L801B583P20',1.0023,0.033,9.4,0.48,3.49,7.8,0.55,0.28,19.3,111.9,8.09,583,8,801),('W8L801B583P21',0.9936,0.054,13.1,0.68,3.18,6.5,0.05,0.12,35.5,179.7,15.75,583,8,801),('W8L801B583P22',0.9979,0.028,9.7,0.72,2.96,5.04,0.67,0.38,50.5,224.8,4.44,583,8,801),('W8L801B583P3',0.9913,0.043,12.7,0.89,3.35,7.1,0.45,0.46,56.3,52.9,15.59,583,8,801),('W8L801B583P4',1.0012,0.025,13.9,0.83,2.92,7.36,0.4,0.1,24.7,209.9,6.39,583,8,801),('W8L801B583P5',0.9937,0.014,8.9,0.55,3.67,7,0.43,0.77,14.1,161.7,5.53,583,8,801),('W8L801B583P6',0.992,0.039,10.9,0.69,3.03,8.34,0.44,0.24,48,210.2,1.56,583,8,801),('W8L801B583P7',0.9963,0.08,11.6,0.56,3.5,5.86,0.59,0.33,49.6,186.2,3.39,583,8,801),('W8L801B583P8',0.9952,0.075,13.9,0.68,3.71,8.05,0.71,0.84,17.5,208.8,3.1,583,8,801),('W8L801B583P9',0.9933,0.011,12,0.33,3.54,7.22,0.75,0.55,56.9,180.7,19.05,583,8,801),('W8L801B584P1',1.001,0.074,12.1,0.7,3.34,8.77,0.56,0.76,12.7,140.3,11.98,584,8,801),('W8L801B584P10',0.995,0.071,8.1,0.42,3.17,7.77,0.28,0.39,55,132.9,14.1,584,8,801),('W8L801B584P11',0.9972,0.012,8.1,0.77,3.17,9.31,0.53,0.59,54.9,86.7,19.05,584,8,801),('W8L801B584P12',0.9908,0.043,13,0.55,3.23,8.6,0.52,0.56,5.7,67.4,15.95,584,8,801),('W8L801B584P13',1.0028,0.042,12.2,0.53,3.23,7.57,0.03,0.37,52.3,81.3,5.17,584,8,801),('W8L801B584P14',1.0048,0.054,9,0.32,3.5,6.28,0.07,0.89,69.2,140.1,6.38,584,8,801),('W8L801B584P15',1.0016,0.093,10.1,0.42,2.9,6.6,0.15,0.78,69.9,76.7,17.16,584,8,801),('W8L801B584P16',1.0028,0.016,12.4,0.57,2.88,9.27,0.2,0.67,21.4,40.8,1.32,584,8,801),('W8L801B584P17',0.9991,0.016,8.3,0.88,3.25,7.16,0.38,0.67,69.9,60.3,8.2,584,8,801),('W8L801B584P18',0.993,0.033,11,0.32,2.82,6.28,0.01,0.83,20.6,206,2.66,584,8,801),('W8L801B584P19',0.9942,0.027,8.8,0.57,3.11,9.18,0.06,0.7,37.4,87.5,15,584,8,801),('W8L801B584P2',0.9942,0.039,8.1,0.52,3.39,9.32,0.6,0.79,23.6,154.9,6.02,584,8,801),('W8L801B584P20',1.0024,0.01,8.8,0.68,3.6,8.35,0.56,0.52,35.9,77.2,1.22,584,8,801),('W8L801B584P21',0.9911,0.013,11.9,0.65,2.83,6.57,0.73,0.47,33,74.8,13.05,584,8,801),('W8L801B584P22',1.0039,0.028,11.4,0.52,3.11,8.2,0.17,0.11,24.7,17.8,7.9,584,8,801),('W8L801B584P23',0.9938,0.068,11.2,0.96,3.51,6.96,0.34,0.62,29.6,36.1,3.26,584,8,801),('W8L801B584P24',1.0006,0.088,13.4,0.54,3.72,7.65,0.74,0.97,42.6,109.5,19.11,584,8,801),('W8L801B584P25',0.992,0.017,9.5,0.47,3.69,5.29,0.15,0.37,60.5,105.1,6.98,584,8,801),('W8L801B584P26',0.993,0.088,9,0.56,3.74,6.62,0.05,0.8,39.6,100.8,2.14,584,8,801),('W8L801B584P3',1.0032,0.025,9.5,0.54,3.38,7.39,0.8,0.39,51.4,175.8,2.02,584,8,801),('W8L801B584P4',0.9915,0.02,9.1,0.63,3.15,7.59,0.43,0.32,22.2,116.5,19.76,584,8,801),('W8L801B584P5',1.0041,0.037,11.6,0.9,3.04,9.6,0.34,0.48,10.5,135.1,15.86,584,8,801),('W8L801B584P6',1.0002,0.094,10.3,0.79,3.46,6.96,0.05,0.32,49.6,98.1,7.89,584,8,801),('W8L801B584P7',0.9927,0.076,13,0.49,3.6,5.35,0.17,0.23,49.8,134.5,5,584,8,801),('W8L801B584P8',1.0016,0.066,9.7,0.3,3.58,7.92,0.62,0.18,37.4,32,10.3,584,8,801),('W8L801B584P9',1.0039,0.011,8.7,0.54,3.51,9.92,0.69,0.54,61.6,128.4,12.46,584,8,801),('W8L801B585P1',0.9994,0.04,13.9,0.49,3.56,5.04,0.19,0.68,54.3,67.3,5.75,585,8,801),('W8L801B585P10',0.9997,0.043,8.6,0.62,3.06,7.98,0.12,0.27,50.6,72.9,1.94,585,8,801),('W8L801B585P11',0.9906,0.075,13.6,0.35,3.68,5.1,0.06,0.35,46.5,77.5,18.95,585,8,801),('W8L801B585P12',1.0038,0.025,12,0.75,3.51,7.27,0.18,0.19,66.4,51,2.1,585,8,801),('W8L801B585P13',0.9933,0.028,13,0.88,3.78,7.78,0.38,0.46,8.7,120.3,6.51,585,8,801),('W8L801B585P14',0.9965,0.044,12.2,0.43,3.46,6.86,0.41,0.26,54.6,169.3,4.7,585,8,801),('W8L801B585P15',1.0023,0.047,13.4,0.4,3.41,7.37,0.76,0.68,33.5,40.4,14.63,585,8,801),('W8L801B585P16',0.9956,0.054,8.4,0.37,3.5,9.71,0.63,0.75,44.2,236.3,19.31,585,8,801),('W8L801B585P17',0.9901,0.048,10.3,0.98,3.14,7.12,0,0.37,7.4,222.4,1.88,585,8,801),('W8L801B585P18',0.9976,0.091,11.4,0.46,3.46,6.62,0.71,0.6,63.9,13.2,8.34,585,8,801),('W8L801B585P19',0.9979,0.082,11.7,0.95,3.58,5.23,0.35,0.37,39.7,105.3,13.19,585,8,801),('W8L801B585P2',0.9985,0.088,12.2,0.92,3.21,9.05,0.33,0.41,41.2,116.5,8.36,585,8,801),('W8L801B585P20',0.994,0.046,10.9,0.81,3.28,9.33,0.18,0.89,13.7,222.7,13.86,585,8,801),('W8L801B585P21',0.9953,0.015,9.4,0.82,2.87,8.72,0.6,0.29,59.1,27,19.59,585,8,801),('W8L801B585P22',0.9931,0.074,9.3,0.3,3.13,6.24,0.55,0.94,13.7,56.8,8.76,585,8,801),('W8L801B585P23',0.9912,0.03,13.5,0.33,3.58,9.94,0.07,0.75,29.5,116.2,16.38,585,8,801),('W8L801B585P24',0.9984,0.039,8.6,0.93,3.55,6.02,0.76,0.39,63.6,156.6,3.65,585,8,801),('W8L801B585P25',0.9982,0.094,13.2,0.65,3.09,6.06,0.29,0.14,41.8,169.2,14.36,585,8,801),('W8L801B585P26',0.9917,0.018,12,0.77,3.44,6.87,0.76,0.43,18.5,161.4,4.83,585,8,801),('W8L801B585P27',1.0007,0.025,12.2,0.6,3.14,8.05,0.33,0.73,35.8,243,17.36,585,8,801),('W8L801B585P28',1.0002,0.019,9.4,0.7,3.29,5.04,0.49,0.49,62.3,106.9,6.38,585,8,801),('W8L801B585P29',1.0021,0.063,12.4,0.81,3.57,7,0.69,0.26,31.4,127.7,8.85,585,8,801),('W8L801B585P3',0.9913,0.082,8.6,0.41,3.34,8.92,0.79,0.98,58.1,143.5,7.86,585,8,801),('W8L801B585P30',0.993,0.087,13.6,0.52,3.59,7.39,0.73,0.94,55.7,226,1.05,585,8,801),('W8L801B585P4',1.001,0.087,14,0.91,3.5,6,0.5,0.13,27.2,170.9,17.69,585,8,801),('W8L801B585P5',0.9947,0.095,13.7,0.75,3.44,7.27,0.37,0.1,13.9,234.2,13.54,585,8,801),('W8L801B585P6',0.9927,0.078,13,0.58,2.97,5.62,0.41,0.45,69.6,43,15.88,585,8,801),('W8L801B585P7',0.9937,0.051,10,0.82,3.36,7.71,0.18,0.64,42.1,84.5,11.11,585,8,801),('W8L801B585P8',0.9932,0.047,12.1,0.9,3.3,7.45,0.01,0.34,19.6,106,5.72,585,8,801),('W8L801B585P9',1.0041,0.079,11.4,0.95,2.84,6.41,0.56,0.13,18.2,41.7,2.28,585,8,801),('W8L801B586P1',0.991,0.09,8.2,0.36,3.47,6.3,0.57,0.37,45.3,233.9,12.48,586,8,801),('W8L801B586P10',0.9928,0.058,10.3,0.39,3.01,8.96,0.52,0.69,53.7,160.7,11.05,586,8,801),('W8L801B586P11',0.992,0.046,10.6,0.37,3.7,5.13,0.21,0.82,5.7,206.1,19.36,586,8,801),('W8L801B586P12',1.001,0.057,11.1,0.64,3.73,9.89,0.67,0.84,50.7,102.4,18.11,586,8,801),('W8L801B586P13',0.9969,0.068,11.1,0.92,3.2,5.39,0.06,0.91,30.4,73.1,6.88,586,8,801),('W8L801B586P14',0.9975,0.099,11.6,0.82,3.71,6.82,0.75,0.41,47.8,30,18.95,586,8,801),('W8L801B586P15',0.9925,0.063,9.9,0.89,3.01,9.32,0.29,0.31,33.6,127.8,11.78,586,8,801),('W8L801B586P16',0.9911,0.051,12.4,0.55,3.52,5.67,0.56,0.81,6.1,208.1,8.96,586,8,801),('W8L801B586P17',0.9971,0.018,13.2,0.64,3.5,6.81,0.24,0.37,29.7,52.9,7.32,586,8,801),('W8L801B586P18',1.0048,0.021,9.8,0.94,3.5,9.26,0.75,0.16,40.9,163,2.8,586,8,801),('W8L801B586P19',0.9956,0.062,10.5,0.97,3.62,9.71,0.44,0.32,58.4,45,10.06,586,8,801),('W8L801B586P2',0.9945,0.057,8.3,0.76,3.66,8.99,0.56,0.31,21.9,116.3,16.81,586,8,801),('W8L801B586P20',0.9956,0.013,11.7,0.61,2.88,8.42,0.05,0.77,11,246,12.21,586,8,801),('W8L801B586P21',1.0006,0.066,12.7,0.97,3.5,5.95,0.59,0.47,40.6,128.8,19.93,586,8,801),('W8L801B586P22',0.9962,0.082,9.3,0.77,3.56,8.59,0.23,0.59,53.6,60.6,7.03,586,8,801),('W8L801B586P23',0.991,0.014,13.8,0.88,3.27,9.48,0.76,0.53,66.7,157.2,16.88,586,8,801),('W8L801B586P24',0.9938,0.029,12.7,0.94,3.08,7.91,0.15,0.54,42.1,167.8,4.88,586,8,801),('W8L801B586P3',1.0013,0.028,11.4,0.43,3.26,5.27,0.13,0.41,64.3,223.4,3.7,586,8,801),('W8L801B586P4',1.0026,0.091,14,0.97,3.28,7.45,0.55,0.78,8.3,212,2.4,586,8,801),('W8L801B586P5',0.996,0.058,12.9,0.72,2.97,8.69,0.77,0.68,16.1,28.2,5.5,586,8,801),('W8L801B586P6',0.9961,0.045,11.7,0.71,3.79,5.26,0.33,0.25,31.9,28.2,19.97,586,8,801),('W8L801B586P7',1.0039,0.034,12.8,0.61,3.18,9.11,0.2,0.1,44.4,27,7.17,586,8,801),('W8L801B586P8',0.9993,0.046,8,0.56,3.8,9.45,0.29,0.61,38.8,143.2,1.58,586,8,801),('W8L801B586P9',0.9938,0.094,13.3,0.73,2.83,5.17,0.68,0.28,24.6,106.6,7.65,586,8,801),('W8L801B587P1',0.9958,0.054,9.2,0.79,3.64,8.33,0.37,0.35,10.8,124.3,10.67,587,8,801),('W8L801B587P10',1.0039,0.067,11.9,0.81,3.8,6.24,0.24,0.74,38.6,100.5,12.04,587,8,801),('W8L801B587P11',0.9973,0.044,9.6,0.68,3.31,9.55,0.75,0.78,33.6,203.6,10.3,587,8,801),('W8L801B587P12',1.0037,0.081,9.8,0.95,3.71,5.74,0.62,0.66,29.6,228.3,10.8,587,8,801),('W8L801B587P13',1.0005,0.039,10.8,0.54,3.71,7.64,0.21,0.88,39.9,65.4,10.71,587,8,801),('W8L801B587P14',0.9918,0.066,11.7,0.49,3.8,5.16,0.22,0.2,24.4,129.7,2.69,587,8,801),('W8L801B587P15',1.0009,0.032,11,0.73,3.31,5.6,0.46,0.6,57.6,215.8,3.46,587,8,801),('W8L801B587P16',0.9904,0.041,12.6,0.43,3.71,5.86,0.08,0.81,58.3,119.5,2.18,587,8,801),('W8L801B587P17',0.9973,0.085,11.7,0.74,3.64,5.97,0.19,0.66,69.9,165.4,15.88,587,8,801),('W8L801B587P18',0.9958,0.024,12.3,0.73,2.9,5.7,0.05,0.41,28,196.7,6.91,587,8,801),('W8L801B587P19',1.0034,0.058,11.3,0.41,2.86,9.91,0.56,0.34,33.8,88.3,14.91,587,8,801),('W8L801B587P2',0.9932,0.033,12.7,0.88,3.19,5.88,0.09,0.34,11.7,240.4,18.19,587,8,801),('W8L801B587P20',0.992,0.049,8.2,0.66,3.16,7.68,0.74,0.6,27.5,23.2,14.25,587,8,801),('W8L801B587P21',0.9913,0.027,8.5,0.86,2.95,8.95,0.75,0.29,44.2,130.9,17.69,587,8,801),('W8L801B587P22',1.0043,0.022,12.6,0.51,3.45,9.8,0.74,0.55,49.4,209.4,14,587,8,801),('W8L801B587P23',0.9994,0.044,9.4,0.59,2.82,6.97,0.12,0.15,20.1,203.6,18.05,587,8,801),('W8L801B587P24',1.001,0.09,10.4,0.56,3.36,6.33,0.51,0.61,52.9,222.9,7.94,587,8,801),('W8L801B587P25',1.001,0.046,10.3,0.45,3.56,9.06,0.09,0.79,34.6,50.8,13.25,587,8,801),('W8L801B587P3',1.0045,0.023,10.3,0.71,3.3,5.11,0.24,0.22,30.6,100.6,18.7,587,8,801),('W8L801B587P4',1.0011,0.081,12.2,0.79,3.29,5.76,0.52,0.87,36.4,123.3,12.07,587,8,801),('W8L801B587P5',1.0013,0.089,12.3,0.92,3.8,5.69,0.23,0.58,67.8,44.4,15.1,587,8,801),('W8L801B587P6',0.9943,0.011,9,0.54,3.25,6.76,0.27,0.4,36.4,230.5,14.36,587,8,801),('W8L801B587P7',0.9958,0.076,12,0.74,3.19,9.31,0.43,0.2,57.8,208,12.89,587,8,801),('W8L801B587P8',1.0009,0.092,10.1,0.52,3.76,6.08,0.49,0.2,63.7,131.2,12.34,587,8,801),('W8L801B587P9',1.0041,0.069,12.3,0.68,3.41,6.3,0.61,0.58,15.2,234.1,1.25,587,8,801),('W8L801B588P1',1.004,0.027,12.7,0.7,3.13,9.75,0.63,0.13,39.4,235.1,3.57,588,8,801),('W8L801B588P10',1.0002,0.031,13.5,0.86,3.33,8.32,0.27,0.45,61.4,115.8,14.4,588,8,801),('W8L801B588P11',1.0038,0.036,11.7,0.84,3.7,9.09,0.63,0.91,67.9,81.6,5.42,588,8,801),('W8L801B588P12',0.995,0.038,9.8,0.83,3.45,9.59,0.28,0.4,43.8,213,6.99,588,8,801),('W8L801B588P13',1.004,0.08,12.4,0.62,3.62,6.32,0.56,0.36,46.4,205.6,15.89,588,8,801),('W8L801B588P14',0.9954,0.078,14,0.92,2.8,8.64,0.33,0.69,8.1,69.4,17.89,588,8,801),('W8L801B588P15',0.9991,0.014,11.2,0.96,3.41,9.84,0.38,0.35,53.4,92.4,10.11,588,8,801),('W8L801B588P16',0.9989,0.037,11.7,0.45,3.02,5.92,0.78,0.84,20.6,230.3,14.3,588,8,801),('W8L801B588P17',0.9901,0.013,8.4,0.95,2.85,6.96,0.3,0.64,42,190.8,3.8,588,8,801),('W8L801B588P18',0.9925,0.091,14,0.5,3.27,8.6,0.68,0.66,11.7,56.7,15.86,588,8,801),('W8L801B588P19',1.0044,0.078,11.7,0.76,2.97,9.73,0.33,0.27,56.6,153.1,6.7,588,8,801),('W8L801B588P2',1.0029,0.038,13.5,0.58,3.67,9.88,0.15,0.37,51.8,131.7,3.89,588,8,801),('W8L801B588P20',0.996,0.058,10.7,0.42,3.49,6.54,0.16,0.9,62.6,115.7,16.42,588,8,801),('W8L801B588P21',0.9945,0.056,9.5,0.52,3.38,8.28,0.8,0.39,23.5,137.3,4.27,588,8,801),('W8L801B588P22',1.0019,0.065,13.8,0.69,3.75,9.92,0.3,0.99,5.3,207.9,10.98,588,8,801),('W8L801B588P3',1.003,0.048,10.8,0.61,3.45,5.89,0.12,0.2,10.8,77.8,14.39,588,8,801),('W8L801B588P4',0.9961,0.075,8.7,0.56,3.52,8.8,0.05,0.12,53.6,217,15.73,588,8,801),('W8L801B588P5',0.9938,0.021,10.3,0.42,3.02,5.51,0.56,0.89,39,104.2,5.94,588,8,801),('W8L801B588P6',1.0037,0.025,12.2,0.82,3.42,5.52,0.31,0.98,46,110.7,15.93,588,8,801),('W8L801B588P7',0.9913,0.02,11.3,0.64,3.41,5.44,0.15,0.28,5.7,246.7,14.4,588,8,801),('W8L801B588P8',1.0004,0.066,10.5,0.95,3.75,9.44,0.01,0.91,41.6,196.5,9.05,588,8,801),('W8L801B588P9',0.9962,0.077,11.3,0.93,2.91,9.27,0.67,0.81,13.8,88.2,18.09,588,8,801),('W8L801B589P1',0.9947,0.061,9.4,0.36,2.8,8.88,0.72,0.93,69.9,108.6,14.45,589,8,801),('W8L801B589P2',1.0044,0.026,9.9,0.74,2.91,8.59,0.51,0.98,24.6,29.5,12.08,589,8,801),('W8L801B589P3',0.9971,0.035,9.3,0.69,3.14,6.94,0.7,0.7,52.4,37.2,10.13,589,8,801),('W8L802B399P1',0.9968,0.042,8.2,0.43,3.41,9.38,0.59,0.95,54,132.7,9.65,399,8,802),('W8L802B399P10',1.0026,0.036,10.5,0.59,3.79,8.78,0.53,0.19,40.8,10.4,18.46,399,8,802),('W8L802B399P11',0.9997,0.03,9,0.46,2.86,5.08,0.29,0.4,17.9,69.5,10.83,399,8,802),('W8L802B399P12',0.9919,0.059,10,0.99,3.45,8.5,0.13,0.46,48.4,63.6,6.95,399,8,802),('W8L802B399P13',0.9962,0.046,12.9,0.75,3.22,6.23,0.26,0.69,19.9,134.3,17.18,399,8,802),('W8L802B399P14',0.9903,0.038,8.9,0.84,3.04,8.42,0.64,0.87,62.7,106.1,8.92,399,8,802),('W8L802B399P15',1.004,0.075,8.7,0.71,3.12,8.33,0.75,0.92,63.5,248.9,11.83,399,8,802),('W8L802B399P16',1.001,0.023,9.7,0.51,3.24,6.82,0.38,0.59,20.4,190.1,18.65,399,8,802),('W8L802B399P17',0.9956,0.07,10.6,0.83,3.4,8.51,0.61,0.39,33.1,62.1,17.32,399,8,802),('W8L802B399P18',0.9916,0.052,12.5,0.63,3.62,8.77,0.69,0.82,55.2,243.7,11.77,399,8,802),('W8L802B399P19',1.0004,0.068,9.4,0.68,2.96,6.81,0.69,0.68,54.6,215.2,1.48,399,8,802),('W8L802B399P2',0.9993,0.024,12.5,0.42,2.93,7.4,0.57,0.53,66.8,71.8,19.57,399,8,802),('W8L802B399P20',0.9985,0.058,11.1,0.73,2.94,5.59,0.68,0.79,58.5,129,7.19,399,8,802),('W8L802B399P21',1.0044,0.019,12.4,0.59,3.47,8.89,0.41,0.71,55.5,13.4,0.93,399,8,802),('W8L802B399P22',0.9914,0.013,8.6,0.65,2.89,6.07,0.2,0.78,13.6,104.9,12.48,399,8,802),('W8L802B399P23',0.9904,0.096,8.4,0.84,2.99,5.65,0.45,0.15,55.1,53,8.28,399,8,802),('W8L802B399P24',1.0034,0.097,9.1,0.67,3.73,7.55,0.21,0.55,69.8,129.5,18.88,399,8,802),('W8L802B399P3',0.9985,0.039,11.4,0.3,3.75,6.76,0.16,0.47,11.3,236.8,17.55,399,8,802),('W8L802B399P4',0.9913,0.014,9.7,0.8,2.82,6.96,0.28,0.4,60.8,193.5,4.3,399,8,802),('W8L802B399P5',0.9946,0.038,13.5,0.45,2.89,8.25,0.63,0.24,63.1,210.2,17.42,399,8,802),('W8L802B399P6',0.9934,0.093,9.9,0.42,3.06,6.43,0.02,0.31,37.7,82.8,8.83,399,8,802),('W8L802B399P7',0.9982,0.084,9.9,0.31,3.54,5.4,0.77,0.37,8,190.9,16.09,399,8,802),('W8L802B399P8',0.995,0.011,10.3,0.41,3.09,9.64,0.58,0.12,33.1,66.9,12.45,399,8,802),('W8L802B399P9',1.0004,0.044,8.6,0.34,3.55,9.93,0.41,0.39,59.9,101,13.23,399,8,802),('W8L802B400P1',0.9953,0.026,12.9,0.78,3.25,6.97,0.41,0.55,14.8,55.2,9.82,400,8,802),('W8L802B400P10',0.9986,0.072,11.9,0.87,3.54,8.7,0.6,0.25,9.9,243.7,3.55,400,8,802),('W8L802B400P11',1.0004,0.014,13,0.55,3.51,8.34,0.12,0.57,5.9,62.1,12.18,400,8,802),('W8L802B400P12',0.9933,0.078,8.1,0.36,3.53,7.13,0.72,0.62,45.3,58.1,14.76,400,8,802),('W8L802B400P13',0.9945,0.061,8.1,0.48,3.7,5.57,0.15,0.29,59.6,85.4,8.97,400,8,802),('W8L802B400P14',1.001,0.043,12.1,0.35,3.12,8.21,0.34,0.82,46.2,32.2,8.58,400,8,802),('W8L802B400P15',1.0049,0.067,13.9,0.63,3.29,9.71,0.11,0.51,14,146.1,14.77,400,8,802),('W8L802B400P16',0.9996,0.046,9.3,0.78,3.66,9.21,0.06,0.43,64.5,81.8,17.85,400,8,802),('W8L802B400P17',0.9945,0.043,9.2,0.98,2.92,9.69,0.06,0.49,9,219.7,17.31,400,8,802),('W8L802B400P18',1.0042,0.087,14,0.37,3.66,7.11,0.17,0.28,54.6,109.6,9.77,400,8,802),('W8L802B400P19',0.9964,0.052,11.7,0.34,3.68,8.33,0.64,0.32,38.7,57.1,17.85,400,8,802),('W8L802B400P2',0.9917,0.054,13,0.37,3.54,5.07,0.32,0.19,34,213,18.42,400,8,802),('W8L802B400P20',1.0045,0.033,13.3,0.62,3.54,7.92,0.31,0.47,20,156,12.63,400,8,802),('W8L802B400P21',0.9992,0.02,8.6,0.58,3.37,5.65,0.25,0.11,69.6,249.4,6,400,8,802),('W8L802B400P22',0.9913,0.011,11.1,0.56,2.88,5.3,0.7,0.8,34,42.7,1.71,400,8,802),('W8L802B400P23',0.9986,0.098,10.7,0.55,3.67,7.3,0.62,0.33,9.5,65.8,11.26,400,8,802),('W8L802B400P24',1.0007,0.053,13.6,0.53,2.95,5.36,0.49,0.69,11.5,219.2,5.7,400,8,802),('W8L802B400P25',1.0007,0.074,13.2,0.46,3.46,5.69,0.68,0.77,16.7,134.8,12.64,400,8,802),('W8L802B400P26',0.9993,0.073,12.3,0.37,3.44,5.82,0.19,0.97,61.1,79.1,3.33,400,8,802),('W8L802B400P27',0.99,0.062,9.9,0.94,3.75,9.5,0.17,0.14,12.4,168.2,7.1,400,8,802),('W8L802B400P3',0.9999,0.012,10.6,0.64,3.26,6.76,0.29,0.59,57.3,33.8,5.82,400,8,802),('W8L802B400P4',0.9966,0.084,13.5,0.34,3.72,6.07,0.17,0.46,15.5,27.1,0.88,400,8,802),('W8L802B400P5',0.9977,0.081,11.9,0.6,3.34,5.06,0.17,0.94,65.5,207.7,1.14,400,8,802),('W8L802B400P6',0.997,0.024,10.7,0.99,3.62,6.43,0.62,0.73,58.1,185,10.31,400,8,802),('W8L802B400P7',1.0039,0.079,11.8,0.57,3.7,9.86,0.71,0.43,37.7,42.4,19.31,400,8,802),('W8L802B400P8',0.994,0.041,13.8,0.52,3.47,9.11,0.44,0.95,45.9,81.1,15.85,400,8,802),('W8L802B400P9',0.9924,0.013,12.6,0.34,2.87,9.11,0.61,0.96,44,249.9,10.2,400,8,802),('W8L802B401P1',0.9959,0.032,11.2,0.6,3.53,5.62,0.43,0.64,13.9,135.2,1.76,401,8,802),('W8L802B401P10',0.9905,0.077,13.7,0.72,3.31,5.18,0.57,0.71,21.1,219.4,6.64,401,8,802),('W8L802B401P11',1.0022,0.051,9.7,0.48,3.47,7.35,0.46,0.71,17.8,49.7,5.55,401,8,802),('W8L802B401P12',0.9939,0.085,13.1,0.73,2.9,8.54,0.2,0.7,53.9,64.7,6.79,401,8,802),('W8L802B401P13',0.9971,0.026,8.5,0.86,3.18,8.83,0.15,0.43,35.3,221.2,12.82,401,8,802),('W8L802B401P14',1.0018,0.08,9.4,0.91,2.89,9.32,0.73,0.54,52.5,116.4,11.48,401,8,802),('W8L802B401P15',0.9955,0.081,10.9,0.49,3.69,7.98,0.38,0.64,16.6,242.8,13.99,401,8,802),('W8L802B401P16',0.9928,0.021,10.2,0.78,2.94,5.8,0.56,0.31,46.5,124.1,9.37,401,8,802),('W8L802B401P17',1.0048,0.086,13.7,0.4,3.29,8.19,0.79,0.55,27.2,57.9,6.63,401,8,802),('W8L802B401P18',1.0002,0.011,13,0.46,3.54,5.42,0.09,0.37,7.7,157.9,16.55,401,8,802),('W8L802B401P19',0.9967,0.028,8.7,0.77,3.25,7.93,0.35,0.41,17.5,137.8,2.64,401,8,802),('W8L802B401P2',1.0032,0.087,11.4,0.61,3.29,7.58,0.31,0.32,19.3,38.7,11.89,401,8,802),('W8L802B401P20',0.991,0.063,8.2,0.83,3,5.41,0.43,0.49,52.8,162.3,12.38,401,8,802),('W8L802B401P21',0.9982,0.015,10,0.39,3.18,7.55,0.74,0.43,64.9,22.8,2.92,401,8,802),('W8L802B401P22',0.9981,0.054,11.5,0.38,3.32,7.35,0.02,0.55,28.9,97.6,13.99,401,8,802),('W8L802B401P23',0.9963,0.015,11.8,0.4,3.54,8.58,0.64,0.27,54.3,46.9,14.24,401,8,802),('W8L802B401P24',0.9985,0.038,9,0.41,3.46,6.88,0.7,0.32,18.4,26.9,11.38,401,8,802),('W8L802B401P3',0.997,0.052,9.1,0.55,3.72,8.33,0.53,0.61,61.8,33.8,14.95,401,8,802),('W8L802B401P4',1.0025,0.078,10.8,0.81,3.04,6.04,0.41,0.19,15.7,34.8,15.54,401,8,802),('W8L802B401P5',1.0003,0.024,8.7,0.34,3.28,5.25,0.8,0.51,44.7,44.6,19.38,401,8,802),('W8L802B401P6',1.0035,0.084,9.2,0.91,3.15,9.16,0.16,0.69,24.2,13,12.67,401,8,802),('W8L802B401P7',0.9937,0.013,11,0.92,3.07,5.17,0.79,0.38,10,98.7,4.36,401,8,802),('W8L802B401P8',0.9942,0.058,10.2,0.36,3.51,5.61,0.47,0.29,8.1,166.3,8.32,401,8,802),('W8L802B401P9',1.0031,0.092,11,0.52,2.9,7.57,0.3,0.25,29.8,196.8,0.87,401,8,802),('W8L802B402P1',0.9901,0.096,11.9,0.3,2.96,8.99,0.59,0.19,28.9,141.5,7.44,402,8,802),('W8L802B402P10',0.9979,0.06,10.4,0.71,3.41,8.64,0.66,0.83,13,182.5,9.23,402,8,802),('W8L802B402P11',0.9923,0.033,8.6,0.85,3.55,7.8,0.36,0.13,50.9,38.1,9.75,402,8,802),('W8L802B402P12',0.9912,0.044,11.4,0.88,2.94,8.82,0.23,0.14,16,235.1,2.29,402,8,802),('W8L802B402P13',1.0034,0.014,11,0.86,2.87,7.2,0.4,0.19,26.1,193.9,8.24,402,8,802),('W8L802B402P14',0.9965,0.016,13.9,0.59,3.52,9.99,0.36,0.59,59.6,47.2,5.65,402,8,802),('W8L802B402P15',0.9906,0.051,13.9,0.51,3,5.15,0.57,0.78,54.8,53.4,7.37,402,8,802),('W8L802B402P16',0.9999,0.013,9.6,0.91,3.35,5.06,0.45,0.2,60.1,28.8,8.86,402,8,802),('W8L802B402P17',0.9947,0.011,10.3,0.77,3.42,6.5,0.53,0.19,20.5,145.9,19.17,402,8,802),('W8L802B402P18',0.992,0.017,11,0.91,3.43,8.69,0.77,0.68,65.2,127.2,9.63,402,8,802),('W8L802B402P19',0.9937,0.03,10.7,0.78,3.28,8.9,0.21,0.59,7.5,117.8,16.73,402,8,802),('W8L802B402P2',0.9987,0.079,8.2,0.84,3.24,6.96,0.46,0.73,51.2,221,16.17,402,8,802),('W8L802B402P20',0.9944,0.033,11.5,0.47,3.19,5.99,0.14,0.25,6,220.3,7.96,402,8,802),('W8L802B402P21',0.9936,0.012,12.6,0.49,3.68,5.94,0.07,0.22,16.1,86.5,5.5,402,8,802),('W8L802B402P22',0.9983,0.075,11.3,0.61,3.24,6.33,0.66,0.76,67.9,133.1,3.41,402,8,802),('W8L802B402P23',1.0012,0.036,8.6,0.44,2.9,5.49,0.55,0.55,62,239.1,3.12,402,8,802),('W8L802B402P24',0.9977,0.015,8.3,0.68,3.77,8.76,0.48,0.91,69.5,222.4,15.84,402,8,802),('W8L802B402P3',0.9904,0.024,8.9,0.76,2.84,5.14,0.4,0.45,43.1,214.5,9.93,402,8,802),('W8L802B402P4',1.0021,0.037,12.6,0.37,3.07,5.59,0.05,0.82,25.9,27.4,7.48,402,8,802),('W8L802B402P5',1,0.085,9.4,0.57,3.34,5.59,0.55,0.25,64.6,198.9,15.65,402,8,802),('W8L802B402P6',1.002,0.063,11.3,0.53,3.53,8.22,0.47,0.89,58.7,160.7,10.8,402,8,802),('W8L802B402P7',0.9938,0.079,9,0.5,2.93,5.95,0.41,0.9,10.8,34,3.47,402,8,802),('W8L802B402P8',0.9937,0.08,11,0.52,3.31,8.22,0.63,0.98,69.6,109.9,0.75,402,8,802),('W8L802B402P9',1.0039,0.029,12.8,0.77,3.78,8.5,0.37,0.83,28.8,147.3,13.38,402,8,802),('W8L802B403P1',1.0017,0.069,9.3,0.53,3.57,6.88,0.02,0.45,61.5,225.9,3.28,403,8,802),('W8L802B403P10',0.9928,0.052,12.3,0.47,3.71,6.75,0.6,0.4,22.3,51.5,1.65,403,8,802),('W8L802B403P11',1.0005,0.055,13.6,0.95,3.02,8.39,0.16,0.41,5.9,146.3,9.21,403,8,802),('W8L802B403P12',0.9929,0.077,11.5,0.9,3.07,6.35,0.41,0.27,24.8,108,4.71,403,8,802),('W8L802B403P13',1.0043,0.047,13.4,0.68,3.7,5.66,0.74,0.4,50.8,69.6,11.46,403,8,802),('W8L802B403P14',1.0034,0.029,13.4,0.92,3.7,6.19,0.02,0.24,43.6,235.3,2.42,403,8,802),('W8L802B403P15',0.9998,0.024,10.7,0.58,3.34,9.28,0.6,0.55,63.2,23.1,17,403,8,802),('W8L802B403P16',0.9921,0.091,11.9,0.6,3.69,7.71,0.04,0.22,12.3,64,1.94,403,8,802),('W8L802B403P17',0.9995,0.094,12.7,0.89,3.7,6.28,0.1,0.79,45.2,167.8,13.57,403,8,802),('W8L802B403P18',0.9952,0.069,8.8,0.57,3.68,9.3,0.5,0.1,36.5,229.2,10.95,403,8,802),('W8L802B403P19',0.9996,0.091,10,0.36,3.36,7.38,0.73,0.28,5.4,193.2,2.12,403,8,802),('W8L802B403P2',0.9965,0.015,8.2,0.7,3.45,5.77,0.33,0.71,43.8,210.3,3.95,403,8,802),('W8L802B403P20',1.0032,0.095,9.3,0.35,2.86,7.93,0.47,0.12,15.8,138.3,2.17,403,8,802),('W8L802B403P21',1.0045,0.019,11,0.6,3.75,7.89,0.01,0.65,24,125.3,11.32,403,8,802),('W8L802B403P22',0.9976,0.076,9.7,0.96,2.83,7.29,0.62,0.96,44.5,44.9,15.1,403,8,802),('W8L802B403P23',1.0021,0.087,10.9,0.56,2.96,6.27,0.16,0.1,23.1,217.7,14.52,403,8,802),('W8L802B403P24',0.994,0.042,8.3,0.67,3.07,5.95,0.56,0.13,24.9,191.7,12.49,403,8,802),('W8L802B403P25',1.0009,0.076,13.1,0.36,2.81,9.96,0.1,0.34,59.7,96.8,13.93,403,8,802),('W8L802B403P26',0.9937,0.019,12.3,0.46,3.17,6.85,0.07,0.47,54.4,22.8,2.89,403,8,802),('W8L802B403P27',1.0042,0.034,13.7,0.72,2.9,8.64,0.69,0.98,26.7,222.2,10.85,403,8,802),('W8L802B403P3',0.9953,0.027,11.3,0.8,3.56,9.72,0.46,0.99,22.9,39.3,5.3,403,8,802),('W8L802B403P4',0.9958,0.04,8.6,0.9,3.17,7.44,0.78,0.89,32.2,43.5,2.59,403,8,802),('W8L802B403P5',0.9963,0.024,8.4,0.51,3.1,7.37,0.43,0.45,38,15.4,5.05,403,8,802),('W8L802B403P6',0.9957,0.088,12.6,0.96,3.49,8.19,0.62,0.8,21.7,77.6,11.32,403,8,802),('W8L802B403P7',0.9907,0.073,13.9,0.97,2.97,7.16,0.73,0.99,54.8,206,5.68,403,8,802),('W8L802B403P8',0.9938,0.067,12.5,0.97,3.77,6.76,0.08,0.71,29.1,231.6,6.46,403,8,802),('W8L802B403P9',1.0041,0.024,8.7,0.63,3.38,5.24,0.16,0.85,48.6,161,14.24,403,8,802),('W8L802B404P1',1.0022,0.044,13.4,0.93,3.12,7.01,0.11,0.32,43.7,54.4,9.32,404,8,802),('W8L802B404P10',1.0006,0.084,12.3,0.35,3.45,6.53,0.07,0.65,42,189.9,15.97,404,8,802),('W8L802B404P11',0.9955,0.088,10.1,0.8,3.37,8.36,0.51,0.86,42.7,177.4,12.72,404,8,802),('W8L802B404P12',0.9908,0.068,10.1,0.76,2.96,9.94,0.61,0.98,16.7,12.9,17.29,404,8,802),('W8L802B404P13',1.002,0.046,8.2,0.5,3.44,9.43,0.15,0.62,50.9,219.8,11.9,404,8,802),('W8L802B404P14',0.9912,0.033,8.8,0.34,3.67,9.85,0,0.85,56.6,34.4,11.8,404,8,802),('W8L802B404P15',1.0036,0.062,9.6,0.39,3.1,9.8,0.7,0.56,48.7,14,2.92,404,8,802),('W8L802B404P16',0.9932,0.059,11.6,0.64,3.18,9.4,0.37,0.19,11.5,229.3,10.6,404,8,802),('W8L802B404P17',0.9926,0.062,11.7,0.83,3.18,8.81,0.6,0.18,43.7,114.5,8.35,404,8,802),('W8L802B404P18',1.0027,0.024,12,0.7,3.5,7.63,0.21,0.42,22.2,221.4,13.73,404,8,802),('W8L802B404P19',0.9921,0.054,9.3,0.65,3.07,8.45,0.34,0.87,7.5,20.2,15.99,404,8,802),('W8L802B404P2',0.9938,0.086,10.4,0.84,3.69,9.78,0.32,0.76,8.1,151.9,5.11,404,8,802),('W8L802B404P20',0.9919,0.083,10.3,0.87,3.13,8.51,0.6,0.92,8.1,77,10.43,404,8,802),('W8L802B404P21',1.0018,0.082,9.9,0.94,3.09,5.48,0.66,0.28,35.8,116.5,15.64,404,8,802),('W8L802B404P22',0.9937,0.014,12.7,0.58,3.64,5.33,0.17,0.6,37.7,24.8,4.62,404,8,802),('W8L802B404P23',1.001,0.04,10.4,0.93,3.59,8.54,0.31,0.5,27.7,132.9,2.6,404,8,802),('W8L802B404P3',0.9935,0.024,8.7,0.64,3.49,9.18,0.23,0.84,44.9,231.3,1.45,404,8,802),('W8L802B404P4',1.0042,0.016,9.4,0.3,3.67,8.92,0.07,0.53,47.2,10.5,1.54,404,8,802),('W8L802B404P5',0.9918,0.048,10.4,0.33,3.71,6.23,0.36,0.11,50,183,7.04,404,8,802),('W8L802B404P6',0.9928,0.062,10.8,0.69,2.99,5.14,0.45,0.35,14.5,212.9,5.45,404,8,802),('W8L802B404P7',0.9995,0.028,9,0.34,3.61,7.82,0.48,0.27,36,34.3,11.18,404,8,802),('W8L802B404P8',0.9986,0.065,13.1,0.93,3.49,9.17,0.63,0.15,13.9,205.5,12.03,404,8,802),('W8L802B404P9',0.9925,0.039,9.6,0.88,3.64,9.16,0.53,0.59,64.7,54.5,16.26,404,8,802),('W8L802B405P1',0.9953,0.033,13.1,0.62,3.31,9.51,0.44,0.39,27.4,43.4,12.32,405,8,802),('W8L802B405P10',1.0046,0.05,12.8,0.45,3.33,7.34,0.35,0.9,33.3,182.9,14.54,405,8,802),('W8L802B405P11',0.9915,0.061,10.5,0.56,2.91,6.49,0.07,0.84,12.4,170.9,19.71,405,8,802),('W8L802B405P12',0.9945,0.089,12.3,0.8,3.67,7.63,0.4,0.42,29.2,79.9,16.32,405,8,802),('W8L802B405P13',0.9904,0.073,12.9,0.37,3.41,8.46,0.02,0.1,62,81.3,16.41,405,8,802),('W8L802B405P14',0.9926,0.092,13.8,0.49,2.95,6.17,0.73,0.74,67.5,82.5,4.83,405,8,802),('W8L802B405P15',1.0012,0.093,9.8,0.93,3.31,8.08,0.45,0.11,42.3,110.7,7.95,405,8,802),('W8L802B405P16',0.9915,0.028,8.3,0.8,3.02,9.95,0.38,0.92,62.8,133.1,15.18,405,8,802),('W8L802B405P17',1.0024,0.047,8.3,0.33,2.84,7.44,0.64,0.66,12.5,56.9,10.02,405,8,802),('W8L802B405P18',0.9911,0.062,13.6,0.61,2.87,5.47,0.5,0.1,25.8,20.5,2.74,405,8,802),('W8L802B405P19',0.9961,0.068,8.3,0.48,3.53,9.54,0.66,0.65,53.2,25.2,2.65,405,8,802),('W8L802B405P2',0.9913,0.025,11.2,0.88,2.86,5.52,0.34,0.44,21,191.9,8.18,405,8,802),('W8L802B405P20',0.9969,0.018,9.6,0.45,3.61,5.44,0.43,0.83,43.1,162.7,1.8,405,8,802),('W8L802B405P3',0.9959,0.014,10.2,0.8,2.82,5.74,0.72,0.7,55.6,220.9,5.71,405,8,802),('W8L802B405P4',0.9985,0.068,11.1,0.44,3.34,6.82,0.61,0.56,5.9,182.3,12.78,405,8,802),('W8L802B405P5',1.0032,0.044,10.4,0.69,3.45,8.83,0.38,0.55,49,125.5,16.03,405,8,802),('W8L802B405P6',0.9905,0.034,8.9,0.45,3.73,6.79,0.37,0.37,55.6,180.9,8.26,405,8,802),('W8L802B405P7',1.0045,0.046,12.2,0.72,3.69,9.89,0.61,0.19,26.5,118.5,1.36,405,8,802),('W8L802B405P8',0.9962,0.031,13.8,0.82,3.37,7.67,0.32,0.3,13.1,181.3,8.21,405,8,802),('W8L802B405P9',0.9967,0.086,12,0.84,3.01,7.95,0.63,0.24,65.1,85.1,3.21,405,8,802),('W8L802B406P1',1,0.019,11.6,0.52,3.02,5.48,0.71,0.87,47.8,158.9,1.36,406,8,802),('W8L802B406P10',0.996,0.081,13.8,0.91,3.46,8.78,0.6,0.95,66.9,207.5,5.55,406,8,802),('W8L802B406P11',1.0033,0.049,11.6,0.46,3.07,6.48,0.26,0.86,53.5,162.6,18.39,406,8,802),('W8L802B406P12',1.0048,0.025,9.8,0.33,3.6,5.93,0.11,0.92,21.7,30.6,0.71,406,8,802),('W8L802B406P13',0.9931,0.093,12.9,0.74,3.1,7.8,0.09,0.9,33.6,75.3,17.34,406,8,802),('W8L802B406P14',0.997,0.064,10.8,0.9,3.55,8.91,0.67,0.75,29.2,248.6,16.01,406,8,802),('W8L802B406P15',1.0041,0.069,8.3,0.37,3.45,6.45,0.21,0.32,36.3,38.4,2.1,406,8,802),('W8L802B406P16',0.9972,0.054,9.2,0.71,3.42,6.67,0.43,0.36,9.1,191.7,18.55,406,8,802),('W8L802B406P17',0.9993,0.048,9.8,0.86,2.97,7.07,0.55,0.43,30.8,219.4,11.66,406,8,802),('W8L802B406P18',0.9971,0.012,10.7,0.4,3.54,6.67,0.59,0.93,27.1,51.8,18.69,406,8,802),('W8L802B406P19',0.9974,0.054,12.9,0.74,3.78,7.35,0.09,0.23,8.7,129.5,15.09,406,8,802),('W8L802B406P2',0.9907,0.067,9.7,0.37,3.59,8.53,0.18,0.9,11.1,40,17.05,406,8,802),('W8L802B406P20',0.9969,0.065,9.3,0.77,3.34,8.5,0.19,0.63,10.6,170.8,18.09,406,8,802),('W8L802B406P21',1.0024,0.034,11.8,0.92,2.93,7.69,0.46,0.71,53.4,57.9,16.82,406,8,802),('W8L802B406P3',0.9929,0.023,13.6,0.48,3.53,8.65,0.45,0.92,53.9,105.7,17.44,406,8,802),('W8L802B406P4',0.9999,0.013,13.6,0.89,2.88,9.58,0.64,0.53,55.7,78.4,19.75,406,8,802),('W8L802B406P5',1.0014,0.053,13.4,0.87,2.9,6.49,0.03,0.71,58.7,214.2,14.32,406,8,802),('W8L802B406P6',0.9963,0.078,10.1,0.88,3.76,5.91,0.01,0.54,7.4,123.1,19.69,406,8,802),('W8L802B406P7',1.0037,0.068,13.5,0.64,3.64,8.31,0.23,0.49,64.1,115.1,1.31,406,8,802),('W8L802B406P8',0.9924,0.042,9.1,0.99,3.61,6.79,0.59,0.13,58.1,183.5,3.96,406,8,802),('W8L802B406P9',1.0038,0.018,12.4,0.58,2.86,6.1,0.76,0.35,47.3,146.6,3.93,406,8,802),('W8L802B407P1',0.9953,0.029,12.1,0.69,3.55,9.25,0.41,0.12,40.3,17.6,15.01,407,8,802),('W8L802B407P10',1.0005,0.05,11.8,0.57,2.85,7.68,0.71,0.31,14.9,155.7,8.16,407,8,802),('W8L802B407P11',0.993,0.057,9.4,0.31,3.36,8.33,0.34,0.75,11.4,147.9,10.65,407,8,802),('W8L802B407P12',0.9929,0.013,8,0.78,3.52,8.89,0.13,0.76,49.7,49.3,17.6,407,8,802),('W8L802B407P13',0.9923,0.015,9.9,0.7,2.9,9.82,0.16,0.16,48.1,120.4,1.69,407,8,802),('W8L802B407P14',0.9942,0.077,13.6,0.72,2.94,6.63,0.18,0.29,35.5,110.3,13.37,407,8,802),('W8L802B407P15',1.0002,0.043,13.1,0.96,3.77,7.88,0.36,0.79,58.8,121.8,13.53,407,8,802),('W8L802B407P16',1.0032,0.099,10.4,0.45,3.36,7.93,0.46,0.89,53.6,156.5,9.97,407,8,802),('W8L802B407P17',0.9948,0.054,8.1,0.74,3.41,8.03,0.38,0.28,60.1,79.5,11.4,407,8,802),('W8L802B407P18',1.0036,0.055,8.9,0.37,3.56,6.09,0.37,0.41,35.3,135.4,2.16,407,8,802),('W8L802B407P19',0.9942,0.082,11.1,0.53,3.23,9.01,0.03,0.39,43.9,114.5,2.05,407,8,802),('W8L802B407P2',1.0016,0.085,8.5,0.79,3.46,9.32,0.08,0.53,49.2,246.9,13.04,407,8,802),('W8L802B407P20',1.0017,0.066,10.5,0.4,3.13,5.6,0.63,0.43,29.6,222,15.37,407,8,802),('W8L802B407P21',0.9955,0.021,13.1,0.69,2.92,6.89,0.64,0.87,25.5,73.8,5.25,407,8,802),('W8L802B407P22',1.0022,0.08,9.2,0.82,3.72,7.68,0.08,0.84,49.9,129.9,8.43,407,8,802),('W8L802B407P23',1.0037,0.018,9.4,0.9,3.1,9.38,0.39,0.3,45,13.9,16.48,407,8,802),('W8L802B407P24',0.9975,0.097,13.3,0.92,3.02,6.47,0.36,0.38,60.8,75.2,18.59,407,8,802),('W8L802B407P25',1.0021,0.011,10,0.86,3.16,5.14,0.77,0.23,55.4,184,2.74,407,8,802),('W8L802B407P26',0.9955,0.043,9.5,0.72,3.75,5.31,0.05,0.42,65.2,217.6,2.02,407,8,802),('W8L802B407P3',0.9967,0.018,8.2,0.58,3.15,8.76,0.66,0.84,33.7,241.7,9.83,407,8,802),('W8L802B407P4',0.9971,0.013,12,0.35,3.28,7.53,0.08,0.33,65.4,156.7,15.1,407,8,802),('W8L802B407P5',1.0001,0.095,8.2,0.95,2.99,5.57,0.07,0.17,22.2,209.3,19.55,407,8,802),('W8L802B407P6',1.0028,0.03,10.1,0.63,3.24,5.3,0.32,0.83,44.8,198.6,17.56,407,8,802),('W8L802B407P7',0.9929,0.075,13.5,0.49,3.59,8.73,0.59,0.25,59.2,186.9,2.55,407,8,802),('W8L802B407P8',1.0007,0.048,11.1,0.46,3.7,6.99,0.3,0.18,30.4,50.6,12.18,407,8,802),('W8L802B407P9',0.9945,0.09,9.5,0.31,3.36,5.6,0.71,0.14,8.1,223,5.21,407,8,802),('W8L802B408P1',1.0012,0.074,11.7,0.75,3.25,8.46,0.67,0.59,53.7,24.4,19,408,8,802),('W8L802B408P10',0.9946,0.019,11.9,0.64,3.55,8.7,0.35,0.63,23.6,118.1,0.87,408,8,802),('W8L802B408P11',0.9928,0.022,12.3,0.97,3.69,8.49,0.06,0.43,7,107.3,9.01,408,8,802),('W8L802B408P12',1.002,0.07,9.1,0.91,3.45,9.36,0.73,0.42,59.9,132.1,13.96,408,8,802),('W8L802B408P13',0.9958,0.037,9.1,0.67,2.88,7.04,0.6,0.26,46.2,11.7,3.76,408,8,802),('W8L802B408P14',0.9919,0.074,12.6,0.52,3.43,9.52,0.19,0.96,42,172.5,9.36,408,8,802),('W8L802B408P15',0.9984,0.071,10,0.76,3.6,8.12,0,0.43,59.7,141.4,6.33,408,8,802),('W8L802B408P16',0.9953,0.079,9.8,0.72,3.12,5.98,0.75,0.3,51.8,200.3,5.01,408,8,802),('W8L802B408P17',1.0034,0.093,8.4,1,3.65,8.65,0.48,0.4,38.5,181.9,3.59,408,8,802),('W8L802B408P18',1.0049,0.036,11.5,0.92,3.32,6.63,0.57,0.11,67.2,244,5.78,408,8,802),('W8L802B408P19',0.9982,0.042,11.7,0.55,3.71,8.23,0.24,0.46,6.2,16.2,14.37,408,8,802),('W8L802B408P2',0.9953,0.039,10.6,0.48,2.81,5.85,0.18,0.35,64.5,143.3,10.8,408,8,802),('W8L802B408P20',1.0023,0.038,12.5,0.59,3.03,7.04,0.41,0.11,10.2,12.5,7.63,408,8,802),('W8L802B408P21',0.9955,0.024,11.5,0.53,3.07,9.47,0.35,0.85,9.2,69.9,10.44,408,8,802),('W8L802B408P22',1.0032,0.078,13.4,0.37,3.15,8.6,0.25,0.44,7.5,145.4,9.62,408,8,802),('W8L802B408P23',0.9968,0.024,11.1,0.42,3.19,9.23,0.54,0.82,35.8,217.5,5.06,408,8,802),('W8L802B408P24',0.9958,0.021,13.2,0.72,3.25,5.21,0.12,0.64,13.4,216.6,12.38,408,8,802),('W8L802B408P3',1.0005,0.029,10.3,0.57,3.32,8.73,0.46,0.58,32.6,137.3,3.55,408,8,802),('W8L802B408P4',1.0038,0.085,12.6,0.32,3,5.76,0.32,0.38,43.3,19.1,5.75,408,8,802),('W8L802B408P5',1.0018,0.026,13.9,0.34,3.08,6.75,0.03,0.78,19.4,225.4,8.75,408,8,802),('W8L802B408P6',0.9972,0.049,8.2,0.92,3.06,9.19,0.64,0.23,13.6,46.2,2.73,408,8,802),('W8L802B408P7',0.9958,0.026,10.3,0.32,2.84,7.8,0.17,0.15,64.1,219,7.47,408,8,802),('W8L802B408P8',0.9986,0.039,13.2,0.89,3.18,5.11,0.15,0.6,18.2,97.8,2.58,408,8,802),('W8L802B408P9',0.9961,0.048,13.8,0.65,3.7,9.88,0.13,0.83,26.6,178.8,2.5,408,8,802),('W8L802B409P1',0.9912,0.046,10.4,0.54,3.1,5.97,0.39,0.17,58.3,239.1,13.25,409,8,802),('W8L802B409P10',0.9921,0.05,13.7,0.38,3.34,5.87,0.13,0.63,62,15.9,4.83,409,8,802),('W8L802B409P11',0.9904,0.039,11.3,0.82,3.02,6.86,0.22,0.83,50.6,134.8,9.21,409,8,802),('W8L802B409P12',1.0008,0.098,10.4,0.49,3.62,6.33,0.12,0.18,52.8,173,18.97,409,8,802),('W8L802B409P13',0.9928,0.026,10.9,0.54,2.9,9.42,0.44,0.29,14.6,89.3,11.51,409,8,802),('W8L802B409P14',0.9937,0.081,10.7,0.35,3.1,7.47,0.55,0.44,39,198.2,19.39,409,8,802),('W8L802B409P15',0.9937,0.023,9.7,0.93,2.84,7.33,0.62,0.79,53.5,77.3,11.87,409,8,802),('W8L802B409P16',0.9966,0.061,10.4,0.42,3.79,7.45,0.66,0.41,37,216.5,11.09,409,8,802),('W8L802B409P17',1.0004,0.028,13.8,0.62,2.89,9.4,0.26,0.17,50.3,94.5,6.39,409,8,802),('W8L802B409P18',0.9963,0.098,13.5,0.32,3.51,8.92,0.04,0.36,16.9,24,1.98,409,8,802),('W8L802B409P19',0.9933,0.057,12.4,0.46,3.31,8.55,0.17,0.74,52,160.7,16.93,409,8,802),('W8L802B409P2',0.9908,0.09,9.1,0.53,2.85,9.71,0.27,0.82,24,151.6,0.82,409,8,802),('W8L802B409P20',0.9969,0.041,9.3,0.95,3.23,8.81,0.61,0.97,6.4,87.8,6.91,409,8,802),('W8L802B409P21',0.9938,0.095,8,0.8,2.97,6.84,0.66,0.41,15.7,244.5,5.76,409,8,802),('W8L802B409P22',0.9957,0.086,13.1,0.7,3.24,9.9,0.58,0.99,66.5,204,11.08,409,8,802),('W8L802B409P23',1.002,0.067,12.5,0.71,2.86,6.7,0.49,0.56,20,137.5,1.61,409,8,802),('W8L802B409P24',1.0031,0.021,11.1,0.7,3.48,9.29,0.11,0.63,49.3,192.8,14.78,409,8,802),('W8L802B409P25',0.9914,0.095,8.5,0.67,3.78,7.75,0.77,0.94,51.9,12,8.6,409,8,802),('W8L802B409P26',0.9935,0.039,12.1,0.62,2.89,8.52,0.53,0.31,27.1,77.6,16.37,409,8,802),('W8L802B409P27',0.9977,0.025,12.9,0.9,3.63,7,0.76,0.61,51.1,133.1,12.65,409,8,802),('W8L802B409P28',0.9946,0.091,12.8,0.41,2.85,7,0.66,0.9,33.8,202.8,7.13,409,8,802),('W8L802B409P29',0.9985,0.074,12.6,0.89,3.38,7.61,0.33,0.24,31.3,167.5,6.99,409,8,802),('W8L802B409P3',0.9941,0.092,12.7,0.72,3.73,8.88,0.21,0.46,7.4,198.1,18.54,409,8,802),('W8L802B409P30',0.994,0.059,13.2,0.7,3.46,6.86,0.04,0.64,49.3,106.5,9.93,409,8,802),('W8L802B409P31',0.9913,0.01,12.3,0.55,3.22,5.67,0.55,0.32,27.3,71.8,2.28,409,8,802),('W8L802B409P4',0.9978,0.1,13.8,0.41,3.05,5.93,0.63,0.52,50,14.9,10.97,409,8,802),('W8L802B409P5',1.0022,0.087,11.4,0.68,3.47,6.36,0.6,0.34,39.9,230.8,19.18,409,8,802),('W8L802B409P6',1.0006,0.024,9.3,0.93,3.47,9.44,0.53,0.81,14.9,67,12.72,409,8,802),('W8L802B409P7',1.0033,0.011,11.3,0.39,2.84,9.99,0.23,0.55,26.8,14.8,17.77,409,8,802),('W8L802B409P8',0.9988,0.015,9.7,0.35,3.31,9.5,0.69,0.91,35.3,189.6,17.56,409,8,802),('W8L802B409P9',0.9918,0.04,11.5,0.48,2.84,9.81,0.52,0.13,14.9,40.2,7.4,409,8,802),('W8L802B410P1',1.0022,0.049,10,0.94,3.25,7.44,0.34,0.16,5.3,16.5,3.63,410,8,802),('W8L802B410P10',1.0019,0.057,10.5,0.74,3.33,6.36,0.01,0.17,20.4,218.2,13.3,410,8,802),('W8L802B410P11',1.003,0.06,10.6,0.52,2.87,8.53,0.28,0.19,64.9,198.5,5.85,410,8,802),('W8L802B410P12',1.0045,0.069,12.7,0.41,2.93,5.29,0.5,0.29,35.8,66.5,8.89,410,8,802),('W8L802B410P13',0.9955,0.035,12.9,0.74,3.04,8.16,0.13,0.94,41.7,175.2,18.23,410,8,802),('W8L802B410P14',0.9964,0.042,10.4,0.65,3.71,6.96,0.06,0.61,42.7,192.2,13.11,410,8,802),('W8L802B410P15',0.9939,0.031,11.9,0.65,3.78,5.05,0.08,0.74,45.6,166.7,4.8,410,8,802),('W8L802B410P2',0.9909,0.021,12,0.45,2.84,9.2,0.25,0.91,61.1,185.5,8.76,410,8,802),('W8L802B410P3',0.9946,0.025,10.7,0.6,3.44,5.22,0.05,0.3,64.1,148.3,4.84,410,8,802),('W8L802B410P4',1.0008,0.074,9.1,0.58,3.5,9.6,0.55,0.36,11.7,224.7,5.51,410,8,802),('W8L802B410P5',1.0003,0.056,13.2,0.58,3,5.05,0.56,0.68,51.4,17.1,15.58,410,8,802),('W8L802B410P6',1.0038,0.097,13.8,0.64,3.22,5.12,0.2,0.95,37.7,118.4,3.31,410,8,802),('W8L802B410P7',0.992,0.095,12.8,0.35,3.41,5.51,0.66,0.86,10.5,111.8,4.94,410,8,802),('W8L802B410P8',0.9971,0.1,12.4,0.62,3.65,9.98,0.38,1,8.9,164.9,8.34,410,8,802),('W8L802B410P9',0.9928,0.038,12,0.66,3.72,9.79,0.06,0.54,48.4,246.3,16.01,410,8,802),('W8L803B520P1',0.9911,0.094,11.9,0.31,3.05,5.44,0.01,0.25,9.5,83.6,18.69,520,8,803),('W8L803B520P10',1.0022,0.021,11.7,0.88,3.22,8.66,0.75,0.7,10,243.2,6.88,520,8,803),('W8L803B520P11',0.9916,0.098,11.8,0.81,2.84,9.7,0.26,0.55,22.3,126.2,9.12,520,8,803),('W8L803B520P12',1.0021,0.024,13.6,0.33,3.14,5.48,0.49,0.17,24.6,231.1,7.9,520,8,803),('W8L803B520P13',0.9926,0.097,9.4,0.99,3.6,9.45,0.16,0.79,47.9,77.9,5.65,520,8,803),('W8L803B520P14',0.9968,0.098,12.8,0.93,3.08,7.29,0.03,0.34,29.8,68.5,11.6,520,8,803),('W8L803B520P15',0.9985,0.02,11,0.35,3.61,8.54,0.68,0.96,56.2,212.5,19.6,520,8,803),('W8L803B520P16',0.9946,0.031,12.8,0.83,3.11,6.56,0.16,0.52,25.8,64.1,4.5,520,8,803),('W8L803B520P17',1.0029,0.039,10.3,0.6,3.07,8.81,0.31,0.24,33.9,73.5,3.5,520,8,803),('W8L803B520P18',1.0036,0.055,8.8,0.45,2.91,7.58,0.3,0.81,26.9,142.7,16.92,520,8,803),('W8L803B520P19',1.0026,0.072,9.4,0.83,3.05,8.1,0.1,0.62,53.3,181.4,11.07,520,8,803),('W8L803B520P2',0.9936,0.056,10.4,0.71,3.2,8.81,0.68,0.65,6.3,19.9,6.97,520,8,803),('W8L803B520P20',0.9919,0.024,11.8,0.87,3.72,8.34,0.23,0.57,37.4,71.6,14.51,520,8,803),('W8L803B520P21',1.0002,0.061,9.8,0.38,3.24,9.84,0.45,0.85,9.5,41.9,14.4,520,8,803),('W8L803B520P22',0.9988,0.032,10.8,0.4,3.03,8.4,0.14,0.12,43.4,196.8,0.9,520,8,803),('W8L803B520P23',1.0029,0.017,9.9,0.54,3.47,8.56,0.11,0.74,45.3,156.1,7.21,520,8,803),('W8L803B520P24',1.0046,0.017,10.5,0.63,3.01,7.46,0.07,0.98,31.4,35.6,1.11,520,8,803),('W8L803B520P25',1.0006,0.07,10,0.44,2.85,7.61,0.67,0.74,62.9,214.6,7.12,520,8,803),('W8L803B520P26',1.0015,0.042,12.5,0.88,3.63,7.34,0.76,0.23,26.4,128.4,10.42,520,8,803),('W8L803B520P27',0.9929,0.068,8.3,0.73,3.24,7.09,0.04,0.5,65.2,152,4.31,520,8,803),('W8L803B520P3',0.9996,0.013,8.4,0.96,3.39,6.02,0.75,0.51,53.4,48.9,10.38,520,8,803),('W8L803B520P4',0.9958,0.04,13.2,0.65,3.36,7.2,0.52,0.48,37.9,227.4,18.82,520,8,803),('W8L803B520P5',1.0037,0.089,13.1,0.35,3.06,8.92,0.47,0.71,39.7,220.7,11.06,520,8,803),('W8L803B520P6',0.9978,0.076,8.5,0.42,3.74,5.65,0.05,0.27,52.3,101.2,12.6,520,8,803),('W8L803B520P7',0.9919,0.025,8.6,0.98,3.04,7.79,0.58,0.72,11.1,197.2,0.68,520,8,803),('W8L803B520P8',0.9998,0.082,12,0.71,3.55,5.61,0,0.44,61.4,97.6,13.39,520,8,803),('W8L803B520P9',1.0032,0.069,9.4,0.6,2.9,8.42,0.41,0.78,63.9,180.2,15.07,520,8,803),('W8L803B521P1',0.9925,0.059,13.4,0.81,2.81,6.82,0.07,0.34,41.4,127.8,12.49,521,8,803),('W8L803B521P10',1.0003,0.07,11.8,0.85,3.07,8.95,0.26,0.19,30.4,158.2,3.18,521,8,803),('W8L803B521P11',0.9969,0.045,13.2,0.95,3.77,6.72,0.76,0.91,61.6,223.2,3.38,521,8,803),('W8L803B521P12',0.9943,0.015,9.9,0.47,3.33,7.79,0.18,0.5,34.3,102.6,9.2,521,8,803),('W8L803B521P13',1.002,0.018,9.3,0.71,3.64,8.28,0.61,0.46,56.6,233.8,17.11,521,8,803),('W8L803B521P14',0.9915,0.063,13.2,0.51,2.98,8.24,0.46,0.45,48.9,243.3,8.41,521,8,803),('W8L803B521P15',0.9918,0.062,12,0.49,2.99,9.81,0.4,0.86,32,178.4,15.02,521,8,803),('W8L803B521P16',0.9936,0.033,9.8,0.57,3.73,9.91,0.51,0.82,41.7,234.1,3.64,521,8,803),('W8L803B521P17',0.9964,0.063,9.2,0.54,3.45,6.91,0.65,0.16,29.2,16.4,10.94,521,8,803),('W8L803B521P18',0.9901,0.041,12.7,0.46,3.58,8.98,0.43,0.48,12.4,139.3,7.83,521,8,803),('W8L803B521P19',1.0043,0.071,13.5,0.46,3.45,9.36,0.11,0.58,13.5,132.3,11.52,521,8,803),('W8L803B521P2',0.9994,0.041,8.1,0.96,3.77,8.79,0.15,0.42,41.6,28.9,15.15,521,8,803),('W8L803B521P20',0.9936,0.082,13.6,0.88,3.69,9.3,0.39,0.22,8.1,157.7,1.07,521,8,803),('W8L803B521P21',0.9984,0.099,11.1,0.93,2.86,9.83,0.56,0.85,61.1,17.7,2.19,521,8,803),('W8L803B521P22',0.994,0.095,13.1,0.7,3.38,6.36,0.2,0.31,30.2,19.7,13.74,521,8,803),('W8L803B521P23',0.9935,0.016,11.8,0.52,3.5,8.29,0.37,0.9,57.8,222.7,19.52,521,8,803),('W8L803B521P24',0.9975,0.023,10.4,0.39,3.78,6.83,0.23,0.92,31.4,224.8,14.72,521,8,803),('W8L803B521P25',0.9942,0.061,11.2,0.81,3.04,5.92,0.48,0.44,38.2,223.1,14.34,521,8,803),('W8L803B521P26',1.0015,0.028,8.1,0.57,3.67,5.63,0.32,0.85,59.3,157,14.76,521,8,803),('W8L803B521P3',1.0003,0.023,12.6,0.34,3.53,7.22,0.07,0.23,30.8,249.1,18.78,521,8,803),('W8L803B521P4',1.0028,0.017,11.1,0.92,3.52,8.51,0,0.25,39.4,55.5,18.82,521,8,803),('W8L803B521P5',1.0032,0.065,8.9,0.3,3.11,6.87,0.73,0.21,70,58.5,14.01,521,8,803),('W8L803B521P6',1.0045,0.025,9.6,0.4,2.82,7.93,0.72,0.11,57.2,141.3,13.01,521,8,803),('W8L803B521P7',0.9948,0.034,13.7,0.68,3.13,8.12,0.47,0.97,38.9,249,6.66,521,8,803),('W8L803B521P8',1.0039,0.075,9.5,0.67,3.17,8.19,0.57,0.26,57,217.1,7.56,521,8,803),('W8L803B521P9',1.0042,0.019,9.9,0.58,2.88,6.79,0.63,0.17,54.5,49.7,14.58,521,8,803),('W8L803B522P1',0.9999,0.089,11,0.99,3.13,6.79,0.04,0.38,13.5,178.1,9.93,522,8,803),('W8L803B522P10',0.9994,0.014,11.6,0.89,3.26,7.37,0.65,0.33,16.6,64.7,19.93,522,8,803),('W8L803B522P11',0.9939,0.018,8.9,0.4,2.88,9.69,0.44,0.49,25.2,180,5.34,522,8,803),('W8L803B522P12',0.9902,0.023,8.1,0.84,2.84,9.46,0.68,1,19.5,87,0.65,522,8,803),('W8L803B522P13',0.9981,0.054,9.9,0.95,3.09,6.44,0.66,0.75,24.7,150.1,9.45,522,8,803),('W8L803B522P14',0.9991,0.039,12.6,0.57,3.15,6.63,0.01,0.92,27.2,130.1,16.12,522,8,803),('W8L803B522P15',0.9914,0.068,8.3,0.74,3.7,8.4,0.35,0.53,16.1,27.5,7.57,522,8,803),('W8L803B522P16',1.005,0.063,12.3,0.62,2.87,7.03,0.62,0.57,17.9,61.3,19.55,522,8,803),('W8L803B522P17',1.0033,0.092,11.7,0.57,3.54,9.3,0.1,0.92,37.2,36.9,0.64,522,8,803),('W8L803B522P18',0.998,0.055,9.7,0.73,3.06,7.59,0.38,0.64,42.7,208.4,19.49,522,8,803),('W8L803B522P19',1.0002,0.042,8.2,0.92,3.62,8.99,0.65,0.34,39.2,229.3,18.58,522,8,803),('W8L803B522P2',0.9914,0.05,12.6,0.98,3.42,8.05,0.62,0.46,23.4,91.7,5.83,522,8,803),('W8L803B522P20',1.0016,0.062,13.7,0.32,3.42,6.01,0.34,0.25,24.8,113.9,14.17,522,8,803),('W8L803B522P21',0.9907,0.03,8.9,0.79,3.42,7.22,0.65,0.2,6.4,105.1,1.49,522,8,803),('W8L803B522P22',0.9964,0.062,13.3,0.72,3.77,6.6,0.12,0.98,70,160,17.52,522,8,803),('W8L803B522P23',0.9999,0.068,9.6,0.7,3.18,6.67,0.42,0.4,20,43.5,6.96,522,8,803),('W8L803B522P24',0.9941,0.034,12.3,0.85,3.49,7.59,0.23,0.37,61.1,85.2,3.99,522,8,803),('W8L803B522P25',1.0019,0.057,10.8,0.93,3.49,6.35,0.75,0.66,45.8,108,10.17,522,8,803),('W8L803B522P26',0.9948,0.022,12.7,0.7,3.05,6.35,0.76,0.64,65.7,180.1,1.45,522,8,803),('W8L803B522P27',0.9929,0.077,9,0.56,2.89,7.12,0.7,0.22,60.4,215.3,15.47,522,8,803),('W8L803B522P28',0.9991,0.023,13.8,0.59,3.28,5.45,0.53,0.76,46,163.4,16.03,522,8,803),('W8L803B522P29',0.9982,0.076,10.2,0.7,2.89,6.7,0.34,0.59,8.1,147.6,10.23,522,8,803),('W8L803B522P3',0.9933,0.049,12.3,0.43,3.68,5.79,0.31,0.15,48.7,96.4,5.26,522,8,803),('W8L803B522P4',0.9968,0.081,14,0.72,3.49,5.13,0.34,0.97,16.9,56,6.29,522,8,803),('W8L803B522P5',0.9995,0.056,10.3,0.58,3.75,6.52,0.15,0.8,65.2,131.7,7.68,522,8,803),('W8L803B522P6',1.0047,0.089,14,0.31,2.93,8.79,0.52,0.75,46.9,143.2,5.83,522,8,803),('W8L803B522P7',0.9999,0.019,10.1,0.65,3.4,7.75,0.67,0.37,12.5,127.5,3.69,522,8,803),('W8L803B522P8',0.9978,0.056,13.3,0.9,2.94,9.11,0.03,0.82,16.2,115.4,6.65,522,8,803),('W8L803B522P9',0.9904,0.071,10.9,0.87,3.76,8.9,0.32,0.14,37.2,128.3,18.18,522,8,803),('W8L803B523P1',0.9931,0.029,13.6,0.4,3.45,7.42,0.67,0.32,24,81.5,16.26,523,8,803),('W8L803B523P10',0.9945,0.057,12.2,0.84,2.91,9.22,0.71,0.82,49.1,73.3,8.32,523,8,803),('W8L803B523P11',1.0032,0.083,8.4,0.59,3.56,7.97,0.6,0.91,63.1,17.2,16.11,523,8,803),('W8L803B523P12',1.0012,0.025,8,0.53,3.05,7.61,0.19,0.15,17.1,182.7,18.8,523,8,803),('W8L803B523P13',1.0008,0.075,10.6,0.36,3.46,5.78,0.53,0.97,9.5,10.2,18.33,523,8,803),('W8L803B523P14',0.9986,0.071,9,0.34,3.34,6.49,0.47,0.74,52.2,233.9,11.17,523,8,803),('W8L803B523P15',1.0048,0.045,12,0.63,2.95,5.03,0.5,0.42,23.5,41,17.82,523,8,803),('W8L803B523P16',1.0002,0.076,10.5,0.44,3.7,6.62,0.19,0.15,46.4,172,1.18,523,8,803),('W8L803B523P17',0.996,0.069,10.7,0.48,3.14,9,0.8,0.99,17,142.9,10.07,523,8,803),('W8L803B523P18',0.9956,0.085,13,0.31,3.6,7.97,0.78,0.24,42.4,67.8,0.86,523,8,803),('W8L803B523P19',0.9955,0.053,11.7,0.92,3.46,5.69,0.56,0.15,22.3,193.7,6.36,523,8,803),('W8L803B523P2',0.9963,0.085,13,0.35,3.64,8.2,0.73,0.34,39.5,129.8,15.54,523,8,803),('W8L803B523P20',0.9933,0.034,13.5,0.67,3.35,8.59,0.41,0.87,60.5,192.7,12.54,523,8,803),('W8L803B523P21',1.0045,0.054,11.9,0.87,3.6,7.51,0.24,0.81,53.4,57,5.65,523,8,803),('W8L803B523P22',0.9963,0.027,8.1,0.8,3.56,8.57,0.34,0.41,67.3,22.5,9.58,523,8,803),('W8L803B523P23',0.9925,0.04,11.5,0.31,3.64,5.14,0.29,0.73,53.3,197.3,17.71,523,8,803),('W8L803B523P24',0.9923,0.054,13.1,0.42,3.19,9.49,0.67,0.98,42.7,185.5,14.98,523,8,803),('W8L803B523P25',0.9988,0.031,13.7,0.97,3.16,7.07,0.29,0.78,17.3,31.6,8.07,523,8,803),('W8L803B523P26',0.9949,0.019,12.3,0.91,2.93,9.36,0.06,0.94,11.7,54.8,19.97,523,8,803),('W8L803B523P27',1.003,0.057,13.1,0.68,3.7,7.9,0.58,0.48,12.2,126.6,10.74,523,8,803),('W8L803B523P28',0.9967,0.071,10.3,0.99,3.45,9.83,0.04,0.42,59.5,17,10.84,523,8,803),('W8L803B523P29',0.9916,0.076,10.8,0.53,2.95,6.03,0.25,0.8,14.6,46.1,2.99,523,8,803),('W8L803B523P3',0.9952,0.026,10.2,0.84,3.68,7.73,0.64,0.18,54.7,148.3,15.48,523,8,803),('W8L803B523P4',1.0041,0.079,8.3,0.49,3.04,5.69,0.49,0.81,14.3,101,19.29,523,8,803),('W8L803B523P5',0.9982,0.092,10.2,0.51,3.5,6.74,0.51,0.45,25.1,45.4,1.38,523,8,803),('W8L803B523P6',1.0008,0.021,13.8,0.62,3.12,9.36,0.52,0.43,61.4,143,6.25,523,8,803),('W8L803B523P7',0.9918,0.032,8.3,0.33,3.75,8.8,0.22,0.49,8.3,113.8,15.07,523,8,803),('W8L803B523P8',0.998,0.077,9.2,0.96,3.19,7.12,0.7,0.27,49.1,124.1,3.34,523,8,803),('W8L803B523P9',0.9974,0.04,12,0.91,3.44,6.72,0.39,0.52,57,16.6,18.5,523,8,803),('W8L803B524P1',0.9906,0.093,10.3,0.47,2.99,6.98,0.47,0.25,36.3,212.4,13.11,524,8,803),('W8L803B524P10',0.9997,0.063,8.9,1,2.84,9.13,0.57,0.72,41.2,223.3,15.18,524,8,803),('W8L803B524P11',0.9901,0.086,12.6,0.62,3.16,6.02,0.25,0.43,32.7,24.4,7.3,524,8,803),('W8L803B524P12',0.9927,0.094,11,0.48,3.18,5.11,0.04,0.63,7.5,156.4,7.66,524,8,803),('W8L803B524P13',0.995,0.034,13.7,0.75,3.28,6.61,0.04,0.51,7.2,35.3,2.92,524,8,803),('W8L803B524P14',0.9994,0.044,12.3,0.47,3.79,6.65,0.72,0.34,17.3,135.4,6.55,524,8,803),('W8L803B524P15',0.9998,0.099,10.5,0.88,3.45,6,0.33,0.11,49.4,156.1,17.49,524,8,803),('W8L803B524P16',0.9961,0.068,13.4,0.89,3.24,8.97,0.76,0.51,12.3,167.1,14.06,524,8,803),('W8L803B524P17',0.9962,0.022,13.1,0.5,3.65,5.79,0.07,0.77,20.1,37.4,11.65,524,8,803),('W8L803B524P18',1.0034,0.035,10.4,0.6,3.49,7.23,0.01,0.18,58.7,110.8,10.14,524,8,803),('W8L803B524P19',0.998,0.069,8.3,0.79,3.03,8.01,0.06,0.38,61.2,26.9,10.55,524,8,803),('W8L803B524P2',1.0043,0.049,10.8,0.36,2.87,8.26,0.71,0.62,38.2,156.7,14.69,524,8,803),('W8L803B524P20',0.9937,0.08,14,1,3.18,6.66,0.02,0.13,35.6,83.1,7.49,524,8,803),('W8L803B524P21',0.997,0.036,13.1,0.39,2.9,6.11,0.39,0.47,28.4,186.6,17.7,524,8,803),('W8L803B524P22',0.9917,0.064,11.2,0.44,3.4,8.69,0.55,0.33,7.7,87,9.21,524,8,803),('W8L803B524P3',0.9904,0.052,12.9,0.36,3.14,6.36,0.78,0.88,42.2,10.6,10.15,524,8,803),('W8L803B524P4',1.0047,0.07,9.2,0.33,3.25,8.84,0.59,0.57,17.1,97.5,11.28,524,8,803),('W8L803B524P5',0.9948,0.083,9.2,0.34,3.4,9.7,0.01,0.59,26.3,141.7,4.93,524,8,803),('W8L803B524P6',0.9902,0.096,9.5,0.78,2.99,7.46,0.65,0.94,68,208.3,1.21,524,8,803),('W8L803B524P7',1.0017,0.075,13.1,0.96,3.45,5.63,0.71,0.82,34.3,137.4,17.85,524,8,803),('W8L803B524P8',0.991,0.016,13,0.93,3.62,6.84,0.17,0.26,56.6,51.3,10.12,524,8,803),('W8L803B524P9',0.9956,0.086,13,0.84,2.81,6.91,0.55,0.79,40.6,240.3,12.33,524,8,803),('W8L803B525P1',0.9977,0.011,13.5,0.82,2.99,8.68,0.05,0.93,28,13.5,8.82,525,8,803),('W8L803B525P10',1.0018,0.079,13.3,1,3.54,6.99,0.49,0.77,64.9,158.9,1.26,525,8,803),('W8L803B525P11',0.9935,0.069,13.7,0.44,3.14,6.09,0.14,0.35,18.6,174.7,5.83,525,8,803),('W8L803B525P12',0.999,0.066,12.5,0.37,3.34,8.51,0.42,0.75,9.2,77.6,7.42,525,8,803),('W8L803B525P13',0.9916,0.023,12.4,0.6,2.92,8.13,0.73,0.41,59.6,185.8,4.79,525,8,803),('W8L803B525P14',1.0019,0.025,14,0.96,3.73,9.97,0.36,0.35,22.6,208.9,12.33,525,8,803),('W8L803B525P15',0.9943,0.055,13,0.88,3,9.77,0.78,0.77,57.1,169.1,6.88,525,8,803),('W8L803B525P16',0.9982,0.055,12.7,0.64,2.98,6.22,0.43,0.82,9.1,229,9.33,525,8,803),('W8L803B525P17',1.0032,0.038,11.3,0.53,3.21,5.7,0.46,0.55,40,169,11.8,525,8,803),('W8L803B525P18',0.9974,0.021,9.8,0.5,3.7,6.04,0.11,0.83,54.6,122.2,7.35,525,8,803),('W8L803B525P19',0.9957,0.081,12.5,0.92,3.62,9.21,0.78,0.87,48.8,157.4,15.31,525,8,803),('W8L803B525P2',0.9945,0.046,8.1,0.85,2.94,6.08,0.07,0.9,41.9,200.9,9.12,525,8,803),('W8L803B525P20',0.9928,0.026,9.5,0.48,3.05,5.47,0.74,0.88,60.5,139.5,10.69,525,8,803),('W8L803B525P21',0.9985,0.068,13.9,0.52,2.8,8.89,0.05,0.26,51.8,169.5,4.9,525,8,803),('W8L803B525P22',0.9994,0.095,9.8,0.37,3.22,6.59,0.34,0.73,48.9,130.9,17.05,525,8,803),('W8L803B525P3',1.0027,0.081,13.6,0.78,3.3,5.19,0.45,0.52,7,212.7,17.62,525,8,803),('W8L803B525P4',0.9997,0.021,9.7,0.39,2.87,5.61,0.72,0.48,32,201.9,9.03,525,8,803),('W8L803B525P5',0.995,0.098,10.8,0.46,3.18,5.81,0.33,1,20.7,98.6,19.24,525,8,803),('W8L803B525P6',0.9901,0.085,10.1,0.68,3.42,8.58,0.27,0.3,26.4,135.6,10.46,525,8,803),('W8L803B525P7',0.99,0.082,13.8,0.93,3.25,6.2,0.34,0.31,17.2,46,8.58,525,8,803),('W8L803B525P8',0.9929,0.035,11.9,0.33,2.9,9.51,0.52,0.18,57.7,118.7,6.01,525,8,803),('W8L803B525P9',1.0014,0.085,8.4,0.31,3.63,5.48,0.27,0.87,12.8,198.2,10.21,525,8,803),('W8L803B526P1',0.99,0.094,11.6,0.69,3.19,8.26,0.1,0.49,65.7,97.3,14.32,526,8,803),('W8L803B526P10',1.0015,0.016,10.9,0.94,3.07,5.66,0.59,0.49,48.7,238.9,5.82,526,8,803),('W8L803B526P11',0.9956,0.096,11.5,0.38,3.61,7.43,0.54,0.16,51.4,202.5,11.9,526,8,803),('W8L803B526P12',0.9933,0.046,13.7,0.98,3.25,7.63,0.29,0.42,59.3,240.2,14.75,526,8,803),('W8L803B526P13',1.0014,0.058,9.3,0.48,2.9,5.15,0.68,1,52.5,113.2,3.34,526,8,803),('W8L803B526P14',1.0035,0.092,13.5,0.47,3.42,5.06,0.11,0.19,30.2,210.7,7.67,526,8,803),('W8L803B526P15',1.0017,0.058,13.8,0.33,3.55,9.66,0.77,0.24,27.9,117.2,10.89,526,8,803),('W8L803B526P16',1.0025,0.073,13.9,0.74,3.08,9.75,0.71,0.31,37.8,249.2,19.15,526,8,803),('W8L803B526P17',1.0049,0.047,12.2,0.6,3.48,7.85,0.13,0.85,45.7,59.4,9.53,526,8,803),('W8L803B526P18',0.996,0.083,13.4,0.9,2.99,5.93,0.48,0.7,51,88.7,17.56,526,8,803),('W8L803B526P19',1.0024,0.075,12,0.59,2.94,6.02,0.64,0.5,8.5,225,9.43,526,8,803),('W8L803B526P2',0.9994,0.063,11.3,0.93,3.07,6.03,0.26,0.38,61.5,153.6,15.13,526,8,803),('W8L803B526P20',1.0019,0.1,9.8,0.41,3.44,5.45,0.19,0.29,27.5,47.2,1.17,526,8,803),('W8L803B526P21',1.0007,0.081,12.1,0.83,3.67,5.97,0.35,0.29,57.1,52.1,17.39,526,8,803),('W8L803B526P22',0.9994,0.023,13,0.75,3.37,7.15,0.6,0.36,27.7,92.5,18.3,526,8,803),('W8L803B526P3',1.001,0.098,13.6,0.45,2.87,7.99,0.47,0.8,17.4,94.3,11.21,526,8,803),('W8L803B526P4',1.0001,0.072,10.8,0.92,3.27,5.64,0.73,0.47,7.5,115.6,19.25,526,8,803),('W8L803B526P5',0.9999,0.093,9.1,0.6,3.38,7.3,0.53,0.29,6.2,88.7,16.51,526,8,803),('W8L803B526P6',0.9948,0.033,12.3,0.64,2.88,5.71,0.38,0.24,51,49.5,16.32,526,8,803),('W8L803B526P7',0.9993,0.025,8.4,0.5,2.85,7.87,0.41,0.56,62.2,239,11.05,526,8,803),('W8L803B526P8',1.0022,0.045,11.2,0.87,2.99,7.55,0.69,0.75,39.8,195.3,12.49,526,8,803),('W8L803B526P9',0.9927,0.046,12.4,0.7,3.42,6.01,0.73,0.92,48.6,34.3,3.58,526,8,803),('W8L803B527P1',1.0002,0.072,8.9,0.48,3.77,6.6,0.21,0.28,46.3,29.3,13.7,527,8,803),('W8L803B527P10',0.9904,0.093,12.8,0.87,2.98,9.68,0.44,0.86,29.6,182.6,4.26,527,8,803),('W8L803B527P11',0.9934,0.085,10.5,0.45,3.17,9.02,0.08,0.73,16.1,92.1,8.01,527,8,803),('W8L803B527P12',1.0005,0.084,13.4,0.38,3.62,9.72,0.68,0.81,5.5,47.4,7.56,527,8,803),('W8L803B527P13',0.9985,0.059,11.5,0.33,2.9,5.7,0.41,0.99,44.4,99,18.56,527,8,803),('W8L803B527P14',0.9952,0.067,10.3,0.97,3.08,7.94,0.33,0.13,22.6,216.5,5.33,527,8,803),('W8L803B527P15',0.9967,0.037,8.1,0.65,3.28,6.76,0.35,0.17,42.2,66.4,11.01,527,8,803),('W8L803B527P16',0.9951,0.071,11.1,0.56,3.14,8.25,0.34,0.78,39.4,52.5,19.93,527,8,803),('W8L803B527P17',1.0018,0.024,10.3,0.7,3.29,8.66,0.77,0.52,6.6,35.9,10.1,527,8,803),('W8L803B527P18',0.9935,0.05,12.5,0.41,2.91,8.09,0.26,0.54,63.4,120.6,1.39,527,8,803),('W8L803B527P19',0.9942,0.079,11.4,0.62,3.41,7.54,0.62,0.93,13.5,114.6,8.45,527,8,803),('W8L803B527P2',1.0046,0.026,12.5,0.82,3.24,8.18,0.59,0.55,65.9,84.9,17.06,527,8,803),('W8L803B527P20',0.9929,0.056,12.1,0.88,2.94,7.65,0.58,0.17,27.9,227.5,3.28,527,8,803),('W8L803B527P21',1.0041,0.023,10.2,0.97,2.9,8.5,0.53,0.35,27.7,52.6,1.62,527,8,803),('W8L803B527P22',0.9981,0.021,13.8,0.83,2.93,8.36,0.31,0.82,19.1,149.1,7.41,527,8,803),('W8L803B527P23',0.991,0.096,9.4,0.3,3.45,5.03,0.26,0.42,60.8,30.6,19.86,527,8,803),('W8L803B527P24',0.9906,0.042,12.2,0.42,3.37,5.66,0.75,0.93,53.3,49,1.64,527,8,803),('W8L803B527P25',0.9977,0.045,8.2,0.66,2.91,9.61,0.27,0.33,38,43.8,17.73,527,8,803),('W8L803B527P3',0.9955,0.081,10.9,0.41,3.47,7.72,0.07,0.93,34.4,208.9,1.59,527,8,803),('W8L803B527P4',0.9908,0.014,9.1,0.78,2.96,9.28,0.73,0.44,27.3,175.8,7.58,527,8,803),('W8L803B527P5',1.0046,0.063,10.3,0.68,3.62,7.96,0.76,0.2,15.4,113.4,17.14,527,8,803),('W8L803B527P6',1.0031,0.029,9.5,0.8,3.23,5.78,0.59,0.97,33.2,24.4,12.08,527,8,803),('W8L803B527P7',0.9961,0.08,8.4,0.45,3.14,6.35,0.57,0.48,45.7,224.7,13.47,527,8,803),('W8L803B527P8',1.001,0.078,9.9,0.8,3.53,7.46,0.36,0.71,45.7,156.7,16.05,527,8,803),('W8L803B527P9',1.0016,0.044,12.3,0.57,3.62,5.59,0.64,0.99,16.5,153.3,1.54,527,8,803),('W8L803B528P1',0.9998,0.024,11.9,0.45,3.73,5.99,0.67,0.88,17.8,43.4,7.33,528,8,803),('W8L803B528P10',0.9953,0.053,11.2,0.59,2.86,6.38,0.46,0.16,45.3,104.6,19.14,528,8,803),('W8L803B528P11',0.993,0.014,10.5,0.81,3.01,8.68,0.71,0.8,48.6,33.4,15.78,528,8,803),('W8L803B528P12',0.9964,0.084,13.2,0.73,3.75,9.34,0.69,0.5,62.3,10.1,17.84,528,8,803),('W8L803B528P13',0.9973,0.067,12.9,0.76,3.27,5.27,0.58,0.48,45.9,165.2,18.77,528,8,803),('W8L803B528P14',0.9996,0.037,9.1,0.91,3.34,8.44,0.42,0.46,24,146.9,15.16,528,8,803),('W8L803B528P15',1.0027,0.064,13.8,0.84,3.75,9.81,0.6,0.91,39.4,57.2,17.47,528,8,803),('W8L803B528P16',0.9918,0.088,11.9,0.75,2.93,6.25,0,0.33,31.9,144.1,10.25,528,8,803),('W8L803B528P17',0.9914,0.01,10.9,0.79,2.81,7.33,0.66,0.39,62.7,107.9,15.58,528,8,803),('W8L803B528P18',0.9981,0.073,13.1,0.39,3.68,5.64,0.53,0.54,33.7,201.8,7.92,528,8,803),('W8L803B528P19',0.9918,0.075,13.6,0.41,3.32,9.18,0.25,0.83,32.3,127.3,2.09,528,8,803),('W8L803B528P2',1.0049,0.022,11.6,0.88,3.63,7.61,0.14,0.74,38.7,189.5,6.04,528,8,803),('W8L803B528P20',1.0024,0.094,11.6,0.71,2.96,8.96,0.72,0.67,54.9,111.7,11.03,528,8,803),('W8L803B528P21',0.9956,0.069,8.5,0.45,3.34,5.5,0.53,0.47,27.6,223.8,4.07,528,8,803),('W8L803B528P22',0.9995,0.085,13.8,0.39,3.01,5.56,0.6,0.73,56.2,165.4,6.56,528,8,803),('W8L803B528P23',1.0025,0.068,10.7,0.74,3.65,8.13,0.43,0.48,24.7,160.8,11.6,528,8,803),('W8L803B528P24',0.9935,0.075,13.5,0.42,3.11,5.84,0.22,0.68,66.7,233.4,2.65,528,8,803),('W8L803B528P25',0.991,0.01,11.1,0.43,3.75,6.91,0.56,0.26,17.3,194.4,5.19,528,8,803),('W8L803B528P26',0.9957,0.036,12.9,0.38,2.81,6.1,0.47,0.33,7.2,190.1,3.14,528,8,803),('W8L803B528P27',1.0017,0.086,11.4,0.45,3.66,5.05,0.76,0.42,62.1,236.5,14.4,528,8,803),('W8L803B528P28',0.9951,0.013,11.3,0.53,3.14,8.04,0.3,0.71,51.7,144.7,13.62,528,8,803),('W8L803B528P29',0.9901,0.046,11.4,0.95,3.14,7.46,0.15,0.69,17.9,173.3,10.38,528,8,803),('W8L803B528P3',0.9951,0.083,9.3,0.73,3.04,7.86,0.43,0.74,20.2,42.5,14.77,528,8,803),('W8L803B528P4',0.9967,0.064,11.6,0.5,3.22,8.55,0.63,0.57,40.9,159.4,5.97,528,8,803),('W8L803B528P5',0.9977,0.013,9.4,0.77,3.77,6.31,0.15,0.77,52.6,51.9,10.62,528,8,803),('W8L803B528P6',0.9938,0.051,13.9,0.57,3.01,6.03,0.58,0.84,34.4,22.3,1.02,528,8,803),('W8L803B528P7',1.0008,0.039,13.8,0.41,3.52,9.62,0.05,0.1,54.9,106.2,6.12,528,8,803),('W8L803B528P8',0.9952,0.054,13.2,0.76,3.51,6.85,0.66,0.23,69.1,163.5,3.02,528,8,803),('W8L803B528P9',0.9932,0.018,9.8,0.59,3.8,8.53,0.67,0.82,69.9,148.3,9.55,528,8,803),('W8L803B529P1',0.9927,0.081,11.1,0.99,3.71,8.17,0.78,0.76,65.8,224.4,7.02,529,8,803),('W8L803B529P10',0.9966,0.062,12.7,0.46,3.29,7.93,0.48,0.34,67.2,212,11.61,529,8,803),('W8L803B529P11',0.9981,0.011,10,0.33,3.58,6.97,0.65,0.65,49.1,190.2,1.31,529,8,803),('W8L803B529P12',0.9987,0.094,10.9,0.56,3.12,5.75,0.62,0.43,54.2,170.3,11.74,529,8,803),('W8L803B529P13',1.0003,0.052,9.8,0.37,2.9,5.7,0.34,0.3,65.1,223.2,11.9,529,8,803),('W8L803B529P14',0.9944,0.038,12,0.49,3.38,9.85,0.6,0.55,26.4,38.4,9.26,529,8,803),('W8L803B529P15',0.9939,0.067,12.1,0.75,3.58,9.67,0.17,0.52,20.6,108.5,17.52,529,8,803),('W8L803B529P16',1.0041,0.099,11.5,0.8,3.76,6.56,0.56,0.36,10.9,34.8,1.6,529,8,803),('W8L803B529P17',0.9956,0.064,9.7,0.78,3.73,7.96,0.75,0.19,35.3,138.9,2.35,529,8,803),('W8L803B529P18',0.9938,0.046,13.2,0.46,2.92,9.14,0.21,0.95,68.2,222.5,0.76,529,8,803),('W8L803B529P19',0.996,0.02,11.8,0.55,3.46,5.26,0.8,0.1,10.6,124.2,11.64,529,8,803),('W8L803B529P2',0.9949,0.022,13.4,0.75,3.53,6.41,0.12,0.18,45.4,168.5,6.27,529,8,803),('W8L803B529P20',0.9919,0.093,12.5,0.99,3.48,8.09,0.57,0.42,22,140.1,9.62,529,8,803),('W8L803B529P21',0.9953,0.069,11.2,0.38,3.49,8.86,0.06,0.37,12.5,199.5,18.69,529,8,803),('W8L803B529P22',0.9951,0.092,12.3,0.54,3.31,8.9,0.49,0.65,52.2,228.6,6.97,529,8,803),('W8L803B529P23',0.9918,0.066,13.6,0.65,3.49,5.61,0.68,0.59,33.8,126.8,15.38,529,8,803),('W8L803B529P24',0.9983,0.075,13.9,0.31,3.21,6.56,0.07,0.55,41.9,101.5,9.09,529,8,803),('W8L803B529P3',0.999,0.012,12.6,0.77,3.07,5.65,0.69,0.48,58,118.4,1.28,529,8,803),('W8L803B529P4',0.9906,0.075,9.2,0.31,3.02,7.11,0.24,0.44,62.1,162.9,3.14,529,8,803),('W8L803B529P5',0.9936,0.069,12.9,0.67,3.23,7.26,0.63,0.95,34.5,70.4,0.94,529,8,803),('W8L803B529P6',1.0039,0.014,10.6,0.43,3.43,6.29,0.26,0.78,59.9,161.6,7.59,529,8,803),('W8L803B529P7',1.0026,0.05,12,0.89,3.74,8.61,0,0.51,62.9,234,19.84,529,8,803),('W8L803B529P8',0.9986,0.094,13.6,0.88,3.27,8.22,0.21,0.33,25.5,233.8,14.04,529,8,803),('W8L803B529P9',0.9992,0.011,8.9,0.69,3.55,9.63,0.76,0.72,17.8,27.4,13.98,529,8,803),('W8L803B530P1',1.0025,0.05,12.2,0.54,3.73,7.07,0.5,0.56,9.2,182.8,4.7,530,8,803),('W8L803B530P10',0.9959,0.092,12.1,0.8,3.33,9.41,0.26,0.49,43.5,165.2,19.43,530,8,803),('W8L803B530P11',1.0017,0.069,13.6,0.61,3.12,9.23,0.44,0.69,51.3,42.9,5.41,530,8,803),('W8L803B530P12',0.9958,0.015,11.3,0.37,3.25,8.93,0.01,0.61,56.6,159.3,16.76,530,8,803),('W8L803B530P13',0.9947,0.04,11.6,0.8,3.09,5.66,0.46,0.12,49.2,205.6,19.88,530,8,803),('W8L803B530P14',1.0035,0.027,13.4,0.67,2.99,7.12,0.77,0.88,11.9,187.9,5.59,530,8,803),('W8L803B530P15',1.0043,0.044,12.6,0.94,3.18,9.86,0.38,0.11,40.3,218.9,12.04,530,8,803),('W8L803B530P16',0.9954,0.045,11.7,0.55,3.69,5.54,0.41,0.27,9.7,214,6.01,530,8,803),('W8L803B530P17',0.9969,0.037,12.6,0.78,3.58,6.82,0.28,0.88,34.1,141.6,14.86,530,8,803),('W8L803B530P18',1.0049,0.015,11.3,0.98,3.42,5.4,0.58,0.6,64.9,193.8,18.09,530,8,803),('W8L803B530P19',0.9972,0.098,11,0.8,3.33,7.17,0.19,0.53,16.2,65.2,19.69,530,8,803),('W8L803B530P2',0.9997,0.071,9.5,0.69,3.4,5.91,0.24,0.73,22.3,71.2,2.71,530,8,803),('W8L803B530P20',0.9994,0.034,9.9,0.4,3.49,9.56,0.36,0.48,46.1,220.8,15.56,530,8,803),('W8L803B530P21',0.9987,0.051,8.9,0.57,3.63,9.71,0.64,0.36,9.4,233.2,3.99,530,8,803),('W8L803B530P22',0.9933,0.022,8.6,0.79,2.9,8.45,0.76,0.9,68.9,100.2,3.78,530,8,803),('W8L803B530P23',1.001,0.079,10.9,0.33,3.1,6.57,0.02,0.62,39.7,169.2,9.12,530,8,803),('W8L803B530P24',1.001,0.028,10.9,0.44,2.95,6.4,0.33,0.98,6.5,56.9,12.38,530,8,803),('W8L803B530P25',0.9947,0.072,13.8,0.73,3.22,9.44,0.55,0.15,6.2,161.9,14.32,530,8,803),('W8L803B530P3',1.0021,0.031,11.8,0.52,3.72,8.15,0.21,0.86,50.9,238.8,6.92,530,8,803),('W8L803B530P4',0.998,0.023,8.4,0.71,3.71,9.58,0.64,0.88,32.8,33.2,9.54,530,8,803),('W8L803B530P5',1.0041,0.036,10.3,0.91,3.25,8.87,0.54,0.82,48,170,14.91,530,8,803),('W8L803B530P6',0.9975,0.069,12.2,0.61,3.58,6.72,0.15,0.7,65.2,131.4,19.7,530,8,803),('W8L803B530P7',0.9944,0.066,12.7,0.85,3.32,6.66,0.74,0.68,42.3,192.2,5.23,530,8,803),('W8L803B530P8',1.0044,0.05,13.3,0.57,3.31,9.54,0.05,0.15,27.2,26.5,2.77,530,8,803),('W8L803B530P9',1.0005,0.016,12.9,0.37,3.31,8.43,0.66,0.21,63.6,119.3,7.22,530,8,803),('W8L803B531P1',0.9902,0.088,12.5,0.5,3.54,5.54,0.39,0.83,34,124.1,17.21,531,8,803),('W8L803B531P10',0.9997,0.056,9.5,0.85,2.84,5.14,0.09,0.76,12.8,96.4,18.68,531,8,803),('W8L803B531P11',0.9903,0.097,10.6,0.46,3.45,5.11,0.76,0.73,8,156.8,4.84,531,8,803),('W8L803B531P12',0.9968,0.056,10.6,0.56,3.47,8.37,0,0.42,63.1,203.7,9.94,531,8,803),('W8L803B531P13',0.9985,0.056,12.6,0.95,3.38,5.09,0.13,0.28,12.6,16.4,12.01,531,8,803),('W8L803B531P14',0.9962,0.056,10.9,0.75,3.31,6.34,0.62,0.67,23.7,36.1,1.31,531,8,803),('W8L803B531P15',0.9992,0.062,8.4,0.74,3.29,5.66,0.23,0.42,18,19.8,3.85,531,8,803),('W8L803B531P16',0.9984,0.079,13.7,0.81,2.99,7.02,0.52,0.57,11.2,64.2,2.33,531,8,803),('W8L803B531P17',1.0002,0.01,11.9,0.58,3.23,8.17,0.09,0.25,30.1,171.9,19.46,531,8,803),('W8L803B531P18',1.002,0.034,8.8,0.8,3.25,9.48,0.12,0.83,66.9,231.3,13.01,531,8,803),('W8L803B531P19',0.9912,0.084,14,0.38,3.29,5.44,0.33,0.32,20.8,225.4,7.24,531,8,803),('W8L803B531P2',0.9951,0.017,12.8,0.9,3.13,9.51,0.47,0.47,57.4,189.4,16.26,531,8,803),('W8L803B531P20',1.0045,0.07,9.8,0.45,3.06,6.13,0.68,0.71,20.5,243.4,7.54,531,8,803),('W8L803B531P21',0.9931,0.056,12.8,0.79,3.46,7.44,0.12,0.78,37.9,229.6,2.4,531,8,803),('W8L803B531P22',0.9994,0.022,9.8,0.89,3.29,8.66,0.65,0.15,54.7,73,3.45,531,8,803),('W8L803B531P23',1.005,0.033,9.7,0.95,3.28,8.07,0.29,0.61,20.1,118.1,8.92,531,8,803),('W8L803B531P24',1.0014,0.082,10.1,0.51,3.51,9.76,0.77,0.96,10.7,136.6,14.64,531,8,803),('W8L803B531P25',1.0036,0.05,9.5,0.79,3.67,5.99,0.66,0.99,37.8,236.2,7.67,531,8,803),('W8L803B531P3',0.9997,0.074,13.5,0.31,3.67,9.29,0.18,0.21,35.3,229.2,11.99,531,8,803),('W8L803B531P4',1.0045,0.096,9.7,0.77,3.66,5.99,0.23,0.3,18.2,86.8,11.26,531,8,803),('W8L803B531P5',0.9983,0.069,9.4,0.7,2.99,5.69,0.34,0.27,12.4,159.6,3.64,531,8,803),('W8L803B531P6',0.9934,0.055,9.7,0.38,3.49,8.86,0.09,0.43,45.3,196.2,10.48,531,8,803),('W8L803B531P7',1.0026,0.043,13.5,0.86,3.6,9.25,0.34,0.72,32.3,91.9,3.34,531,8,803),('W8L803B531P8',1.0015,0.094,8,0.35,3.7,7.54,0.52,0.43,51.2,100.5,15.06,531,8,803),('W8L803B531P9',0.9961,0.025,13,0.72,3.2,6.2,0.09,0.28,20.2,27.9,10.32,531,8,803),('W8L803B532P1',0.9977,0.058,10.8,0.33,2.9,8.46,0.26,0.33,8.5,227.4,7.45,532,8,803),('W8L803B532P2',1.0008,0.073,11.6,0.48,3.51,8.02,0.15,0.79,43.5,80.7,17.69,532,8,803),('W8L804B430P1',1.0023,0.024,13.6,0.64,3.19,9.7,0.24,0.72,37,76.5,8.41,430,8,804),('W8L804B430P10',0.9997,0.031,11.2,0.81,2.81,9.28,0.51,0.12,55.5,216.4,18.72,430,8,804),('W8L804B430P11',0.9966,0.02,12.1,0.54,2.89,7.14,0.1,0.46,51.8,107,7.66,430,8,804),('W8L804B430P12',1.0049,0.068,12.8,0.52,3.41,6.44,0.11,0.25,38.7,102.3,10.05,430,8,804),('W8L804B430P13',0.9905,0.025,9.1,0.36,3.31,9.13,0.15,0.49,39.2,185,2.9,430,8,804),('W8L804B430P14',0.9974,0.1,11.4,0.64,3.13,7.45,0.52,0.3,63.6,189.6,8.34,430,8,804),('W8L804B430P15',1.002,0.052,9.5,0.65,3.45,8.96,0.02,0.95,61,136.7,17.17,430,8,804),('W8L804B430P16',0.993,0.064,8.2,0.92,2.88,7.04,0.42,0.93,39.8,197.4,19.25,430,8,804),('W8L804B430P17',0.995,0.021,13.6,0.99,2.82,9.17,0.01,0.6,38.5,106.8,19.87,430,8,804),('W8L804B430P18',0.9943,0.014,9.7,0.56,2.87,6.01,0.29,0.94,53.4,76,10.47,430,8,804),('W8L804B430P19',0.9984,0.06,10.7,0.32,3.22,7.07,0.34,0.58,43.1,73.3,7.01,430,8,804),('W8L804B430P2',0.9933,0.089,13.8,0.5,2.83,6.46,0.68,0.68,28.7,70.2,13.23,430,8,804),('W8L804B430P20',0.9968,0.093,9.9,0.55,2.92,9.76,0.09,0.76,8.2,167.9,16.87,430,8,804),('W8L804B430P21',0.9971,0.015,11.9,0.57,3.44,9.74,0.13,0.73,29,233.9,16.85,430,8,804),('W8L804B430P3',1.0008,0.082,13.4,0.36,3.17,8.68,0.05,0.14,18,115.4,2.19,430,8,804),('W8L804B430P4',1.0014,0.094,9.9,0.7,3.57,5.71,0.52,0.91,43.9,27.2,18.63,430,8,804),('W8L804B430P5',0.9952,0.096,10.3,0.65,3.57,10,0.51,0.2,21.1,242.4,2.07,430,8,804),('W8L804B430P6',0.9977,0.068,8.1,0.49,3.02,10,0.02,0.11,57.7,138.5,5.63,430,8,804),('W8L804B430P7',0.9945,0.014,13.1,0.53,3.47,7.05,0.2,0.23,19.2,211,1.65,430,8,804),('W8L804B430P8',0.992,0.026,13.1,0.56,2.8,8.86,0.38,0.25,27.8,112,14.25,430,8,804),('W8L804B430P9',0.9981,0.049,10.2,0.83,3.54,7.91,0.71,0.85,36.9,91.6,15.48,430,8,804),('W8L804B431P1',0.9925,0.012,8.8,0.94,2.83,8.2,0.04,0.88,44.1,72.8,17.55,431,8,804),('W8L804B431P10',0.9949,0.016,8.4,0.4,3.65,8.17,0.62,0.32,55,105,8.32,431,8,804),('W8L804B431P11',1.0033,0.079,13.5,0.76,2.8,6.24,0.28,0.84,58.5,78.1,19.86,431,8,804),('W8L804B431P12',1.0008,0.041,12.6,0.67,3.5,7.3,0.8,0.18,45.9,114.4,11.08,431,8,804),('W8L804B431P13',1.0007,0.025,9.6,0.93,2.84,7.61,0.63,0.58,15.5,65.2,4.32,431,8,804),('W8L804B431P14',0.9953,0.014,9.7,0.63,3.71,7.04,0.4,0.6,20.4,234.2,11.35,431,8,804),('W8L804B431P15',0.9926,0.058,9.8,0.54,3.24,6.32,0.11,0.17,14.7,82.2,14.74,431,8,804),('W8L804B431P16',0.9933,0.042,9.9,0.68,2.93,8.15,0.5,0.67,58.1,86,18.68,431,8,804),('W8L804B431P17',0.9971,0.083,10.6,0.82,3.28,5.27,0.19,0.75,12.4,86.7,17.87,431,8,804),('W8L804B431P18',0.9982,0.039,13.5,0.82,3.57,7.45,0.21,0.76,35.4,41.9,10.39,431,8,804),('W8L804B431P19',1.0017,0.032,13.4,0.5,3.61,5.66,0.76,0.63,47.4,75,9.38,431,8,804),('W8L804B431P2',0.9914,0.029,9.2,0.82,3.09,8.19,0.75,0.76,61.4,233.1,14.82,431,8,804),('W8L804B431P20',0.9901,0.066,8.4,0.49,3.24,6.53,0.69,0.58,40.3,51.3,8.64,431,8,804),('W8L804B431P21',0.9936,0.037,11.8,0.87,2.93,7.42,0.14,0.44,34,57.1,19.68,431,8,804),('W8L804B431P22',0.9942,0.019,13.7,0.5,3.48,6.95,0.62,0.62,28.3,149.2,4.93,431,8,804),('W8L804B431P3',0.9997,0.049,13,0.93,3.74,9.49,0.8,0.72,60.9,231.5,2.86,431,8,804),('W8L804B431P4',0.9953,0.077,10.2,0.86,3.63,8.95,0.14,0.91,18.4,151.7,13.98,431,8,804),('W8L804B431P5',0.9959,0.094,9.3,0.6,3.53,8.38,0.01,0.36,15.2,88.9,6.67,431,8,804),('W8L804B431P6',1.0026,0.05,10.2,0.56,3.37,9.68,0.39,0.18,11.4,72.1,3.01,431,8,804),('W8L804B431P7',0.9946,0.072,8.1,0.44,2.98,7.2,0.55,0.63,53.3,19.7,2.93,431,8,804),('W8L804B431P8',1.0049,0.025,12.3,0.73,3.47,7.25,0.04,0.83,14.6,234.9,2.69,431,8,804),('W8L804B431P9',0.9919,0.038,10.3,0.38,3.68,7.8,0.57,0.39,64.4,163.3,5.11,431,8,804),('W8L804B432P1',0.9911,0.038,8.2,0.85,3.74,5.6,0.22,0.94,30.7,56.6,8.08,432,8,804),('W8L804B432P10',0.9914,0.077,9,0.85,2.98,5.86,0.19,0.81,47,121.5,18.85,432,8,804),('W8L804B432P11',0.9927,0.072,8.5,0.44,3.31,6.7,0.41,0.29,33.3,188,10.49,432,8,804),('W8L804B432P12',1.0013,0.079,10.8,0.59,3.21,8.62,0.17,0.23,30.7,23.9,19.07,432,8,804),('W8L804B432P13',1.0042,0.079,9.3,0.38,2.94,5.04,0.41,0.68,51.3,77.9,13.92,432,8,804),('W8L804B432P14',0.9934,0.032,11.4,0.31,2.86,9.2,0.52,0.89,37.9,67.8,6.96,432,8,804),('W8L804B432P15',1.0026,0.022,11.1,0.5,3.79,7.41,0.69,0.19,41.1,188.7,8.91,432,8,804),('W8L804B432P16',1.0006,0.027,8.2,0.79,3.73,7.05,0.39,0.64,62.2,231.7,15.41,432,8,804),('W8L804B432P17',0.9955,0.051,9.9,0.78,3.79,6.6,0.07,0.25,26.4,24.6,17.47,432,8,804),('W8L804B432P18',1.0035,0.02,10,0.87,3.02,7.32,0.17,0.97,36.9,47.7,19.49,432,8,804),('W8L804B432P19',0.9969,0.019,10.9,0.48,3.46,5.01,0.2,0.86,57,47.9,12.97,432,8,804),('W8L804B432P2',1.004,0.062,11.8,0.77,3.66,7.64,0.56,0.76,10.5,11.6,18.32,432,8,804),('W8L804B432P20',0.9903,0.074,9.9,0.35,3.3,7.42,0.52,0.81,13.7,35.7,10.19,432,8,804),('W8L804B432P21',0.996,0.073,11.3,0.59,3.15,6.43,0.76,0.91,42.2,229.1,5.91,432,8,804),('W8L804B432P22',0.9937,0.038,8.7,0.91,2.83,9.92,0.19,0.41,14.6,85.4,9.92,432,8,804),('W8L804B432P23',0.9969,0.06,8.4,0.39,2.98,9.34,0.52,0.11,48.8,150.5,13.95,432,8,804),('W8L804B432P3',0.9905,0.088,12.9,0.32,3.77,8.74,0.37,0.28,13.7,44.7,9.3,432,8,804),('W8L804B432P4',1.0046,0.08,8.7,0.32,2.81,8.88,0.06,0.59,23.5,200.1,15.24,432,8,804),('W8L804B432P5',0.9938,0.055,12.4,0.43,3.73,8.07,0.1,0.59,33.1,189.3,7.26,432,8,804),('W8L804B432P6',1.0026,0.081,13.2,0.54,3.15,7.83,0.2,0.84,35.4,41.3,9.4,432,8,804),('W8L804B432P7',0.9958,0.091,13.2,0.99,3.75,8.83,0.41,0.33,50.2,87.5,0.92,432,8,804),('W8L804B432P8',1.0035,0.093,10.9,0.86,3.56,5.09,0.53,0.5,13,172.3,2.19,432,8,804),('W8L804B432P9',0.9915,0.08,12.5,0.9,2.88,7.61,0.67,0.44,69.8,30.6,10.54,432,8,804),('W8L804B433P1',0.9998,0.031,13.3,0.34,2.81,9.38,0.26,0.83,18.4,248.3,4.13,433,8,804),('W8L804B433P10',0.9914,0.016,11.7,0.54,2.81,5.34,0.5,0.9,46.5,198.6,1.35,433,8,804),('W8L804B433P11',1.0013,0.046,11.2,0.32,3.59,9.47,0.22,0.7,34,41.5,17.45,433,8,804),('W8L804B433P12',1.0041,0.016,11.4,0.69,3.26,5.11,0.44,0.62,33.2,95.4,2.85,433,8,804),('W8L804B433P13',0.9975,0.092,9,0.68,3.42,8.41,0.54,0.42,59.7,47.4,16.73,433,8,804),('W8L804B433P14',1.0018,0.07,12.4,0.86,3.76,5.6,0.71,0.19,8.8,77.7,19.62,433,8,804),('W8L804B433P15',1,0.019,10.8,0.88,2.86,5.53,0.51,0.16,40.5,205.9,18.45,433,8,804),('W8L804B433P16',0.9969,0.077,10,0.79,2.92,7.89,0.65,0.7,52.8,132.1,10.09,433,8,804),('W8L804B433P17',0.9994,0.019,8.7,0.98,3.75,8.31,0.23,0.38,16,35.2,13.52,433,8,804),('W8L804B433P18',0.9938,0.054,10,0.77,3.13,7.74,0.28,0.96,10.8,114.2,4.17,433,8,804),('W8L804B433P19',0.9929,0.058,12.5,0.59,2.98,6.86,0.35,0.29,13.3,41.7,5.72,433,8,804),('W8L804B433P2',1.0009,0.051,11,0.74,3.07,7.03,0.37,0.81,43.7,165,11.09,433,8,804),('W8L804B433P20',0.9913,0.02,11.4,0.54,3.36,7.52,0.43,0.19,48.1,178.3,16.08,433,8,804),('W8L804B433P21',1.0006,0.039,12.7,0.94,3.56,8.43,0.56,0.2,27.5,236.3,3.76,433,8,804),('W8L804B433P22',1.0038,0.012,13.6,0.51,3.67,8.87,0.42,1,31.5,138.2,6.07,433,8,804),('W8L804B433P23',1.0016,0.083,11.8,0.31,2.85,6.52,0.22,0.72,55.7,246.9,15.05,433,8,804),('W8L804B433P24',0.9953,0.055,9.9,0.98,3.17,8.72,0.21,0.83,27.2,194,5.86,433,8,804),('W8L804B433P25',0.995,0.043,12.6,0.5,2.88,5.14,0.32,0.33,68.6,131.3,18.2,433,8,804),('W8L804B433P3',0.9985,0.055,12,0.91,3.7,8.95,0.73,0.52,21.1,184.6,9.93,433,8,804),('W8L804B433P4',0.9919,0.089,13.9,0.39,3.18,7.9,0.71,0.55,19.3,38.6,18.11,433,8,804),('W8L804B433P5',1.0039,0.028,9.9,0.81,3.53,9.45,0.71,0.13,69.2,194.2,14.9,433,8,804),('W8L804B433P6',0.9967,0.026,13.9,0.58,3.12,6.22,0.12,0.8,25.5,27.5,14.7,433,8,804),('W8L804B433P7',0.9969,0.057,12.9,0.77,2.84,9.32,0.33,0.91,7.3,92.5,0.72,433,8,804),('W8L804B433P8',0.9941,0.069,11.3,0.58,2.85,8.92,0.29,0.18,9.7,28.9,3.4,433,8,804),('W8L804B433P9',0.9983,0.026,8.2,0.64,3.13,8.29,0.6,0.83,61.7,67.6,11.68,433,8,804),('W8L804B434P1',1.0029,0.053,9.4,0.91,3.36,6.67,0.5,0.63,6.5,18.2,3.49,434,8,804),('W8L804B434P10',0.994,0.015,13.1,0.88,3.6,9.55,0.29,0.66,40.3,159.7,4.23,434,8,804),('W8L804B434P11',0.9927,0.013,12.5,0.5,2.89,6.13,0.48,0.8,40.2,56.7,6.74,434,8,804),('W8L804B434P12',1.0047,0.04,13,0.41,2.85,9.6,0.6,0.77,33.2,58.9,10.56,434,8,804),('W8L804B434P13',0.9975,0.098,9.3,0.89,2.9,7.44,0.31,0.36,29.2,214.4,6.69,434,8,804),('W8L804B434P14',0.9965,0.03,13,0.99,3.43,6.56,0.14,0.28,10.1,152.1,8.13,434,8,804),('W8L804B434P15',0.9934,0.078,12.2,0.42,3.22,5.93,0.39,0.43,29.6,132,10.57,434,8,804),('W8L804B434P16',1.0026,0.075,8.8,0.7,3.78,9.19,0.2,0.67,9.5,159,18.01,434,8,804),('W8L804B434P17',0.9948,0.021,11.8,0.74,3.28,6.4,0.38,0.63,17,99.5,7.85,434,8,804),('W8L804B434P18',0.9928,0.022,13.8,0.95,3.51,6.1,0.19,0.48,34.2,79.9,1.97,434,8,804),('W8L804B434P19',0.9985,0.032,12.7,0.82,3.11,6.98,0.72,0.73,10.3,150.8,19.24,434,8,804),('W8L804B434P2',0.9916,0.078,13.9,0.74,3.51,9.62,0.51,0.44,62.6,225.3,3.16,434,8,804),('W8L804B434P20',0.9983,0.048,9.2,0.49,3.54,8.21,0.33,0.1,19,157.1,5.5,434,8,804),('W8L804B434P21',0.9961,0.072,9.1,0.62,3.21,7.57,0.76,0.57,32.6,111.3,9.68,434,8,804),('W8L804B434P22',1.0008,0.025,8.8,0.49,3.59,9.53,0.33,0.77,7.6,38.3,12.78,434,8,804),('W8L804B434P23',0.9923,0.023,13.4,0.82,3.41,8.29,0.72,0.61,27.4,57.4,11.24,434,8,804),('W8L804B434P24',0.9995,0.091,13.2,0.81,3.22,9.4,0.31,0.57,34.7,169.7,4.84,434,8,804),('W8L804B434P25',1.0023,0.061,10.6,0.74,2.85,5.03,0.19,0.28,49.2,158.6,4.9,434,8,804),('W8L804B434P26',0.9972,0.075,10,0.84,3,6.19,0.29,0.75,10.3,68.9,9.27,434,8,804),('W8L804B434P27',0.9993,0.038,11.4,0.31,3.75,7.17,0.52,0.8,38.4,67.9,15.38,434,8,804),('W8L804B434P3',1.0015,0.048,8.5,0.41,3.37,5.7,0.04,0.2,36.4,248.1,18.35,434,8,804),('W8L804B434P4',1.0044,0.033,9.3,0.32,2.88,8.99,0.1,0.72,5.9,43.8,3.75,434,8,804),('W8L804B434P5',1.0018,0.058,12.4,0.67,3.4,5.49,0.34,0.7,46,212.6,14.52,434,8,804),('W8L804B434P6',1.0019,0.016,10.5,0.51,3.43,9.84,0.72,0.57,17.5,242.1,0.79,434,8,804),('W8L804B434P7',1.0007,0.073,9,0.41,3.32,8.9,0.35,0.14,10.6,245,6.77,434,8,804),('W8L804B434P8',0.9995,0.041,8.1,0.86,3.09,9.93,0.4,0.75,20.6,236.8,9.23,434,8,804),('W8L804B434P9',1.0017,0.063,9.1,0.89,3.4,6.5,0.68,0.19,66,240.4,19.76,434,8,804),('W8L804B435P1',1.0049,0.023,8.9,0.69,2.88,7.34,0.15,0.58,54.9,120.2,17.78,435,8,804),('W8L804B435P10',1.001,0.069,13.6,0.6,2.97,8.8,0.09,0.81,21.3,152.9,7.88,435,8,804),('W8L804B435P11',0.9966,0.056,8.6,0.33,3.37,7.85,0.64,0.37,42.7,222.4,18.51,435,8,804),('W8L804B435P12',0.9989,0.042,13.8,0.75,3.64,9.9,0.61,0.7,67.4,240.9,9.37,435,8,804),('W8L804B435P13',1.002,0.078,13.1,0.68,3.58,8.7,0.38,0.77,13,46.8,7.96,435,8,804),('W8L804B435P14',0.9968,0.024,13.2,0.91,3.5,5.09,0.53,0.36,47,110.3,3.45,435,8,804),('W8L804B435P15',0.9901,0.07,9.3,0.97,3.62,7.45,0.64,0.54,45.6,35.2,18.18,435,8,804),('W8L804B435P16',0.9936,0.086,10.6,0.51,2.88,5.75,0.75,0.2,27,246.3,6.5,435,8,804),('W8L804B435P17',0.9933,0.062,11.7,0.42,3.56,8.12,0.38,0.94,13,153.2,4.17,435,8,804),('W8L804B435P18',0.9902,0.015,10.1,0.53,3.25,7.57,0.71,0.36,21,106.8,7.82,435,8,804),('W8L804B435P19',0.9994,0.033,11.8,0.54,2.83,7.16,0.74,0.82,19.1,213.2,13.3,435,8,804),('W8L804B435P2',1.0017,0.034,9.6,0.33,2.99,9.85,0.72,0.74,31.8,114.7,6.31,435,8,804),('W8L804B435P20',1.0043,0.042,11.2,0.65,2.99,9.41,0.5,0.93,19.7,72.8,18.56,435,8,804),('W8L804B435P21',1.0026,0.046,13,0.77,3.48,9.81,0.78,0.41,14.2,15.7,17.25,435,8,804),('W8L804B435P22',0.9994,0.017,13.7,0.91,2.81,7.65,0.24,0.93,16.4,123.4,14.62,435,8,804),('W8L804B435P23',0.9965,0.035,13.4,0.39,3.2,7.61,0.57,0.83,59.5,146.7,3.52,435,8,804),('W8L804B435P24',0.9985,0.032,11,0.37,3.48,8.28,0.69,0.92,70,123.8,18.92,435,8,804),('W8L804B435P25',0.993,0.083,12,0.95,3.49,9.35,0.69,0.14,36.8,68.9,2.36,435,8,804),('W8L804B435P3',1.0048,0.082,8.8,0.35,3.31,6.45,0.45,0.92,68.8,211.5,2.31,435,8,804),('W8L804B435P4',0.9931,0.047,13.4,0.98,3.2,5.18,0.38,0.78,16.9,118.4,12.99,435,8,804),('W8L804B435P5',0.9932,0.012,8.9,0.93,3.21,5.56,0.12,0.38,35.9,123.2,15.41,435,8,804),('W8L804B435P6',1.0024,0.082,10.8,0.88,3.68,9.22,0.53,0.27,35.8,229.6,12.33,435,8,804),('W8L804B435P7',0.9932,0.057,9.1,0.91,3.63,7.73,0.55,0.4,37.2,121.2,0.92,435,8,804),('W8L804B435P8',1.0041,0.029,8.8,0.63,3.74,5.72,0.74,0.1,47.5,116.4,15.6,435,8,804),('W8L804B435P9',0.9969,0.042,9.2,0.9,2.97,9.49,0.36,0.62,34.5,193.9,9.4,435,8,804),('W8L804B436P1',0.9995,0.055,9.1,0.59,3.47,7.81,0.22,0.96,28.9,224.4,2.07,436,8,804),('W8L804B436P10',1.0036,0.097,9,0.77,3.35,7.45,0.58,0.78,41.2,86.2,8.69,436,8,804),('W8L804B436P11',1.004,0.073,10.7,0.46,3.54,8.37,0.75,0.5,43.4,87.5,15.14,436,8,804),('W8L804B436P12',0.9906,0.094,10.2,0.81,3.6,7.57,0.79,0.12,29.4,151.7,14.17,436,8,804),('W8L804B436P13',0.9969,0.029,10.6,0.69,3.18,9.53,0.35,0.62,20.6,58.4,13.43,436,8,804),('W8L804B436P14',1.004,0.032,11.6,0.59,3.36,8.47,0.65,0.21,23.1,137.3,2.78,436,8,804),('W8L804B436P15',1.0001,0.058,10.6,0.61,3.42,9.61,0.18,0.76,61.1,133.8,6.98,436,8,804),('W8L804B436P16',1.0016,0.044,8.3,0.5,3.61,6.09,0.54,0.84,11.6,89.4,16.21,436,8,804),('W8L804B436P17',0.995,0.037,12,0.59,3.26,6.4,0.09,0.67,32.1,249,10.46,436,8,804),('W8L804B436P18',1.0026,0.064,8.9,0.72,3.55,7.97,0.29,0.38,18.3,79.9,16.7,436,8,804),('W8L804B436P19',0.999,0.011,8.4,0.52,3.65,6.64,0.77,0.25,14,192.3,4.74,436,8,804),('W8L804B436P2',1.0008,0.084,12.2,0.64,2.93,7.04,0.17,0.97,10.6,119.3,16.65,436,8,804),('W8L804B436P20',0.9914,0.066,13.1,0.98,3.57,5.72,0,0.31,18.2,249.8,14.59,436,8,804),('W8L804B436P21',1.0043,0.078,13.4,0.9,3.58,7.11,0.55,0.32,33,46.7,13.37,436,8,804),('W8L804B436P22',1.004,0.016,11,0.65,3.37,6.9,0.8,0.11,30.3,179.7,18.17,436,8,804),('W8L804B436P23',1.0015,0.038,12.2,0.53,3.68,5.11,0.37,0.2,62.5,74.3,14.41,436,8,804),('W8L804B436P24',0.9968,0.074,11.9,0.61,3.51,7,0.26,0.3,42.8,112.6,13.18,436,8,804),('W8L804B436P25',0.9908,0.049,9.6,0.57,3.52,9.66,0.76,0.71,68.7,147.4,12.16,436,8,804),('W8L804B436P26',0.9905,0.099,9,0.94,3.68,8.91,0.73,0.64,11.3,98.3,8.77,436,8,804),('W8L804B436P27',0.9963,0.021,10.4,0.9,2.98,8.71,0.06,0.33,49.1,204.6,7.26,436,8,804),('W8L804B436P28',0.9982,0.093,8.6,0.3,3.2,8.49,0.22,0.16,16.9,233,14.6,436,8,804),('W8L804B436P29',0.9949,0.022,12.5,0.37,2.94,7.16,0.62,0.61,37.1,80.8,17.87,436,8,804),('W8L804B436P3',1.0049,0.013,9.6,0.79,3.56,9.56,0.24,0.89,51,11.6,7.45,436,8,804),('W8L804B436P30',0.9946,0.065,11.7,0.85,3.4,9.14,0.24,0.49,23.9,240.4,1.59,436,8,804),('W8L804B436P4',0.9942,0.038,13,0.57,3.45,5.28,0.1,0.2,56.9,203.9,19.66,436,8,804),('W8L804B436P5',0.9982,0.063,12.3,0.8,3.66,6.03,0.55,0.26,57.1,166.9,9.41,436,8,804),('W8L804B436P6',0.9924,0.096,9.8,0.33,3.33,9.76,0.7,0.99,34.5,77.4,15.38,436,8,804),('W8L804B436P7',1.0021,0.076,8.6,0.59,2.82,5.05,0.6,0.12,10,39,6.73,436,8,804),('W8L804B436P8',0.9941,0.034,9.1,0.51,3.55,5.89,0.02,0.29,40.5,41.3,3.02,436,8,804),('W8L804B436P9',0.9949,0.056,9.4,0.33,3.08,9.3,0.66,0.77,8.1,149.2,4.66,436,8,804),('W8L804B437P1',0.9927,0.072,11.4,0.86,3.79,5.02,0.77,0.53,14.4,173.1,6.33,437,8,804),('W8L804B437P10',1.0022,0.06,13.5,0.86,3.55,9.34,0.58,0.23,33.8,235.7,8.09,437,8,804),('W8L804B437P11',0.9938,0.072,10.3,0.4,3.25,6.23,0.44,0.96,54.5,208.7,18.25,437,8,804),('W8L804B437P12',0.9944,0.036,9.9,0.49,3.07,6.3,0.47,0.68,22.7,29.7,1.85,437,8,804),('W8L804B437P13',0.9949,0.021,10,0.63,3.28,5.82,0.53,0.84,26.4,235.7,7.14,437,8,804),('W8L804B437P14',1.004,0.035,10.4,0.9,2.99,8.34,0.41,0.49,15.1,123.5,1.88,437,8,804),('W8L804B437P15',1.0025,0.054,8.9,0.66,3.34,9.08,0.11,0.6,33.2,124,16.3,437,8,804),('W8L804B437P16',1.0018,0.037,12.9,0.31,3.01,8.38,0.73,0.72,6.5,202.6,1.34,437,8,804),('W8L804B437P17',0.9949,0.027,11.3,0.48,3.43,6.26,0.25,0.38,67.6,159.1,15.94,437,8,804),('W8L804B437P18',0.9907,0.014,11.5,0.48,3.4,8.18,0.48,0.71,34.1,175.5,17.99,437,8,804),('W8L804B437P19',0.9935,0.066,12.2,0.93,3.38,6.95,0.22,0.77,20.2,124.5,17.14,437,8,804),('W8L804B437P2',0.9913,0.078,11,0.68,3.41,5.52,0.64,0.58,59.1,208,4.24,437,8,804),('W8L804B437P20',0.9994,0.059,12.5,0.87,2.82,6.46,0.21,0.27,32.1,31.2,1.24,437,8,804),('W8L804B437P21',0.9921,0.063,11.6,0.54,3.68,7.72,0.17,0.42,28.8,33.2,8.76,437,8,804),('W8L804B437P22',1.0021,0.061,10.1,0.41,2.94,8.23,0.17,0.38,39.9,237.9,13.5,437,8,804),('W8L804B437P23',0.9998,0.094,8.9,0.71,3.4,6.61,0.15,0.51,23.5,112,14.66,437,8,804),('W8L804B437P24',0.9988,0.057,10.7,0.76,2.88,9.95,0.59,0.61,43.2,110.9,7.52,437,8,804),('W8L804B437P25',1.0023,0.011,10.7,0.39,3.58,9.48,0.47,0.14,18.4,124,8.11,437,8,804),('W8L804B437P26',0.999,0.018,10.3,0.35,3.43,6.89,0.71,0.86,15.9,69.6,14.99,437,8,804),('W8L804B437P27',1.0027,0.082,11.2,0.39,3.34,7.48,0.39,0.68,52.4,122.7,11.12,437,8,804),('W8L804B437P3',0.9922,0.062,8.6,0.41,3.47,9.61,0.64,0.88,64,120.5,6.83,437,8,804),('W8L804B437P4',1.0018,0.025,8.4,0.7,3.74,6.27,0.59,0.4,20.5,188.2,3.12,437,8,804),('W8L804B437P5',0.9993,0.09,12,0.99,3.55,8.64,0.45,0.82,9.9,169.6,16.29,437,8,804),('W8L804B437P6',0.9939,0.032,9.2,0.46,3.6,9.74,0.07,0.43,20.3,140,0.91,437,8,804),('W8L804B437P7',1.0004,0.022,9.2,0.46,3.04,7.85,0.4,0.8,65.5,21.1,14.83,437,8,804),('W8L804B437P8',0.9903,0.022,11.8,0.62,2.83,9.57,0.49,0.24,18,129.2,3.42,437,8,804),('W8L804B437P9',1.0008,0.025,12.7,0.86,3.08,9.09,0.65,0.13,31.9,213.9,10.78,437,8,804),('W8L804B438P1',0.9969,0.099,10.7,0.66,3.04,7.08,0.63,0.93,16.1,69,10,438,8,804),('W8L804B438P10',0.9961,0.085,12.2,0.38,3.36,6.03,0.42,0.25,51.5,142,2.46,438,8,804),('W8L804B438P11',0.9952,0.099,13.8,0.7,3.27,6.59,0.65,0.37,5.6,129,9.5,438,8,804),('W8L804B438P12',1.0031,0.05,11.6,0.53,3.47,8.6,0.52,0.88,67.6,88.1,19.38,438,8,804),('W8L804B438P13',0.9998,0.023,11,1,2.89,6.84,0.79,0.45,64.3,189.7,16.21,438,8,804),('W8L804B438P14',1.0001,0.042,14,0.93,3.38,5.58,0.4,0.99,9.2,120.9,15.19,438,8,804),('W8L804B438P15',0.9967,0.019,12.9,0.94,3.35,9.18,0.16,0.23,25.6,242.1,14.96,438,8,804),('W8L804B438P16',0.9984,0.097,8.4,0.36,3.1,7.25,0.73,0.71,48.5,14,4.09,438,8,804),('W8L804B438P17',0.9935,0.062,11.3,0.56,3.48,5.14,0.67,0.15,46.5,68,2.15,438,8,804),('W8L804B438P18',0.9964,0.018,10.9,0.47,3.59,8.75,0.75,0.42,63.8,196,4.44,438,8,804),('W8L804B438P19',0.9971,0.075,9.8,0.73,3.7,9.93,0.38,0.6,8.1,160.1,7.57,438,8,804),('W8L804B438P2',0.9981,0.069,13.5,0.77,3.73,8.92,0.23,0.36,23.5,241.2,7.1,438,8,804),('W8L804B438P20',0.9968,0.014,9.8,0.69,2.94,9.18,0.12,0.2,18.1,19.6,8.05,438,8,804),('W8L804B438P21',0.9998,0.06,8.3,0.36,3.34,8.93,0.62,0.46,67.1,125.7,9.16,438,8,804),('W8L804B438P22',0.996,0.091,8.1,0.45,2.93,6.77,0.33,0.38,69.5,174.9,9.65,438,8,804),('W8L804B438P23',1.0038,0.068,10.1,0.67,3.45,8.26,0.53,0.34,25.9,140.2,16.46,438,8,804),('W8L804B438P24',1,0.023,8,0.81,2.93,5.9,0.37,0.35,20,165,17.99,438,8,804),('W8L804B438P25',0.9962,0.017,8,0.92,3.44,9.01,0.19,0.35,21.8,76.8,0.89,438,8,804),('W8L804B438P26',0.9987,0.059,10.9,0.69,3.01,6.12,0.24,0.21,17.5,15.2,0.62,438,8,804),('W8L804B438P27',1.0022,0.046,13.8,0.95,3.3,7.17,0.28,0.62,51.8,27.9,18.81,438,8,804),('W8L804B438P3',1.0027,0.052,11.9,0.47,2.93,6.8,0.32,0.86,46.3,213,12.97,438,8,804),('W8L804B438P4',0.9911,0.072,13.5,0.86,3.64,5.24,0.04,0.75,48,180.4,5.54,438,8,804),('W8L804B438P5',0.9975,0.052,10.4,0.32,3.52,5.63,0.37,0.76,63.1,220.1,16.06,438,8,804),('W8L804B438P6',0.9933,0.082,8,0.44,3.22,9.73,0.76,0.56,9.9,107,10.11,438,8,804),('W8L804B438P7',1.0047,0.065,13.3,0.9,2.85,9.71,0.66,0.96,50.4,180.9,19.72,438,8,804),('W8L804B438P8',0.9945,0.047,14,0.91,3.37,6.1,0.45,0.13,12.1,165.9,1.33,438,8,804),('W8L804B438P9',0.9951,0.041,10.3,0.73,2.99,7.09,0.2,0.47,23.7,114.4,9.55,438,8,804),('W8L804B439P1',0.9995,0.034,10.5,1,3.62,8.75,0.71,0.68,66.4,121.1,16.88,439,8,804),('W8L804B439P10',0.9918,0.095,10.1,0.47,3.02,8.02,0.38,0.56,27.9,158.3,13.38,439,8,804),('W8L804B439P11',0.9923,0.017,10.9,0.77,3.67,8.75,0.76,0.2,17.5,238.4,10.62,439,8,804),('W8L804B439P12',1.0019,0.043,12.6,0.39,3.8,9.74,0.43,0.42,55.8,237.4,16.84,439,8,804),('W8L804B439P13',1.005,0.023,10,0.83,3.32,6.67,0.64,0.44,66.1,148,5.17,439,8,804),('W8L804B439P14',1.0013,0.069,10,0.52,3.68,6.93,0.16,0.15,29.1,33.5,11.32,439,8,804),('W8L804B439P15',1.0028,0.034,12.5,0.61,3.34,6.63,0.56,0.45,28.7,231,7.67,439,8,804),('W8L804B439P16',0.9977,0.024,11.8,0.76,3.53,8.01,0.62,0.37,54.6,24.9,6.38,439,8,804),('W8L804B439P17',0.9937,0.018,10.3,0.76,3.53,6.68,0.55,0.94,27.3,233.9,10.85,439,8,804),('W8L804B439P18',0.9909,0.062,12.7,0.68,3.4,5.19,0.47,0.88,46.1,240.6,10.15,439,8,804),('W8L804B439P19',0.9948,0.026,11.9,0.32,2.91,5.35,0.78,0.68,64.8,76.8,5.43,439,8,804),('W8L804B439P2',0.9938,0.049,9.4,0.47,2.88,7.65,0.24,0.31,34,86.4,18.15,439,8,804),('W8L804B439P20',1.0006,0.018,11,0.58,3.02,7.38,0.56,0.99,63.9,135.3,5.33,439,8,804),('W8L804B439P21',1.0029,0.043,11.2,0.45,3.48,6.23,0.5,0.48,53.4,49.4,12.67,439,8,804),('W8L804B439P22',1.0027,0.057,8.6,0.34,3.51,9.06,0.5,0.54,38.7,246.1,3.1,439,8,804),('W8L804B439P23',0.9933,0.066,9.8,0.88,3.76,8.64,0.21,0.77,13.9,13.3,16.63,439,8,804),('W8L804B439P3',0.9983,0.031,11.9,0.93,2.8,5.04,0.63,0.33,43.3,27.8,15.01,439,8,804),('W8L804B439P4',1.0049,0.097,9.9,0.89,3.59,7.36,0.62,0.83,48.3,156.6,2.82,439,8,804),('W8L804B439P5',0.9992,0.05,8.4,0.85,3.75,6.33,0.51,0.86,46.7,163.7,1.25,439,8,804),('W8L804B439P6',1.0033,0.093,11.5,0.79,2.84,8.94,0.26,0.52,48.5,47,16.37,439,8,804),('W8L804B439P7',0.9928,0.02,9.2,0.74,3.04,8.15,0.56,0.5,50.2,78,19.57,439,8,804),('W8L804B439P8',0.9972,0.04,9.8,0.79,3.07,7.33,0.24,0.44,9.6,195.1,15.48,439,8,804),('W8L804B439P9',1.0041,0.073,13.9,0.9,3.45,9.26,0.6,0.52,26.1,120.1,9.65,439,8,804),('W8L804B440P1',0.9998,0.094,13,0.74,3.09,7.04,0.04,0.78,17.3,24.6,8.5,440,8,804),('W8L804B440P10',1.0012,0.038,13.6,0.44,3.57,9.19,0.75,0.42,54.6,139.2,1.9,440,8,804),('W8L804B440P11',0.9946,0.02,8.7,0.61,3.31,8.49,0.27,0.46,52.7,15.1,4.43,440,8,804),('W8L804B440P12',0.9933,0.038,13.6,0.7,2.84,7.69,0.07,0.72,24,113.2,8.61,440,8,804),('W8L804B440P13',1.0017,0.048,9,0.5,3.02,6.35,0.16,0.42,50.5,36.1,15.29,440,8,804),('W8L804B440P14',0.9948,0.013,10.6,0.47,3.65,9.47,0.49,0.65,39.3,10.7,7.21,440,8,804),('W8L804B440P15',1.0041,0.077,10.6,0.69,3.36,5.06,0.23,0.72,60.3,54.1,9.84,440,8,804),('W8L804B440P16',1.0031,0.034,11.8,0.39,3.21,5.1,0.49,0.86,16.2,214.2,17.03,440,8,804),('W8L804B440P17',1.0048,0.079,10.1,0.64,3.05,8.68,0.04,0.88,58.8,149.9,14.53,440,8,804),('W8L804B440P18',1.0025,0.093,8.7,0.99,3.3,6.32,0.59,0.83,8.8,82.4,10.07,440,8,804),('W8L804B440P19',0.997,0.074,8.8,0.8,3.62,6.72,0.73,0.88,52.5,159.9,14.63,440,8,804),('W8L804B440P2',0.9998,0.1,10.4,0.99,3.4,9.88,0.2,0.78,8.8,199.1,0.69,440,8,804),('W8L804B440P20',0.9935,0.072,8,0.32,3.1,5.09,0.74,0.73,16,247.1,17.8,440,8,804),('W8L804B440P21',0.9974,0.051,13.9,0.74,3.45,9.79,0.58,0.95,50.2,51.5,15.9,440,8,804),('W8L804B440P22',0.999,0.07,9,0.66,3.72,6.15,0.47,0.42,39.9,180.1,8.23,440,8,804),('W8L804B440P23',1.0003,0.079,10.3,0.69,3.25,7.34,0.03,0.63,5.9,164.3,1.48,440,8,804),('W8L804B440P24',0.9942,0.094,10.2,0.36,3.25,7.65,0.43,0.29,9.1,128.7,4.8,440,8,804),('W8L804B440P3',1.0019,0.069,10.3,0.51,3.06,8.23,0.26,0.94,19.3,184.6,15.21,440,8,804),('W8L804B440P4',1.0003,0.046,13,0.42,2.95,5.81,0.37,0.44,36.6,114.2,1.92,440,8,804),('W8L804B440P5',0.9923,0.074,10.9,0.63,3.23,9.17,0.15,0.44,61.5,73.7,15.78,440,8,804),('W8L804B440P6',1.0025,0.046,11,0.57,2.86,5.15,0.46,0.47,39.1,56.4,5.02,440,8,804),('W8L804B440P7',0.9913,0.071,11.3,0.54,3.22,6.67,0.25,0.23,66.9,167.1,0.75,440,8,804),('W8L804B440P8',1.0029,0.047,12.2,0.8,3.19,8.98,0.45,0.91,50.7,29.4,16.35,440,8,804),('W8L804B440P9',0.9919,0.092,10.6,0.94,3.72,7.18,0,0.36,56.9,135.6,8.64,440,8,804),('W8L804B441P1',1.002,0.062,11.7,0.52,3.17,7.55,0.59,0.53,56.4,128.5,6.59,441,8,804),('W8L804B441P10',1.0024,0.024,13,0.85,3.71,9.51,0.04,0.13,45.4,71.1,6.79,441,8,804),('W8L804B441P11',1.001,0.025,12,0.76,3.67,7.99,0.62,0.57,40.1,53.1,9.66,441,8,804),('W8L804B441P12',0.9954,0.089,12.1,0.78,2.87,7.19,0.3,0.77,53.5,106.9,12.08,441,8,804),('W8L804B441P13',1.002,0.084,13.9,0.78,3.04,6.78,0.69,0.7,17,34.4,3.17,441,8,804),('W8L804B441P14',0.991,0.051,13.6,0.87,3.52,5.82,0.23,0.11,51,63,16.42,441,8,804),('W8L804B441P15',0.9959,0.036,13.8,0.71,3.18,6.84,0.11,0.4,36.9,104.8,7.78,441,8,804),('W8L804B441P16',0.9947,0.052,14,0.66,3.05,9.13,0.75,0.23,52.4,47.5,16.2,441,8,804),('W8L804B441P17',1.0018,0.086,13.5,0.49,2.94,6.12,0.29,0.53,33.4,98.3,9.64,441,8,804),('W8L804B441P18',0.9943,0.067,11.2,0.32,2.93,6.58,0.45,0.49,53.6,217.3,3.92,441,8,804),('W8L804B441P19',1.0038,0.03,13.8,0.55,3.19,5.46,0.14,0.81,22,178.4,17.41,441,8,804),('W8L804B441P2',1.0039,0.078,13.9,0.6,3.78,6.27,0.28,0.41,22.8,78.8,13.84,441,8,804),('W8L804B441P20',1.0011,0.054,12.1,0.61,3.76,6.81,0.38,0.4,52.9,206.2,18.86,441,8,804),('W8L804B441P21',0.9997,0.095,12,0.75,3.33,6.79,0.38,0.5,58,63.1,1.1,441,8,804),('W8L804B441P22',1.0018,0.067,13.4,0.64,3.03,9.4,0.01,0.38,44.7,195,2.66,441,8,804),('W8L804B441P23',0.9928,0.021,14,0.45,3.27,6.5,0.38,0.89,15.9,219.7,4.04,441,8,804),('W8L804B441P24',0.9949,0.013,13.3,0.91,3.31,7.31,0.05,0.68,69.1,77.8,13.78,441,8,804),('W8L804B441P25',0.9996,0.066,9.1,0.88,3.3,8.89,0.18,0.3,54.5,184.3,11.69,441,8,804),('W8L804B441P26',0.9977,0.043,8.8,0.73,3.65,7.96,0.23,0.92,27.9,66.4,1.89,441,8,804),('W8L804B441P27',0.991,0.091,11.4,0.67,3.49,7.02,0.74,0.75,45.4,165.7,0.76,441,8,804),('W8L804B441P3',1.0015,0.067,8.5,0.76,3.77,7.67,0.78,0.89,59.5,78.3,2.82,441,8,804),('W8L804B441P4',0.9932,0.091,11.2,0.8,3.72,7.74,0.24,0.28,58.6,141.6,12.91,441,8,804),('W8L804B441P5',0.9911,0.053,13.4,0.58,3.58,7.09,0.21,0.71,6.2,79.5,12.77,441,8,804),('W8L804B441P6',1.0043,0.052,8.6,0.89,3.79,5.33,0.53,0.55,14.9,19,10.47,441,8,804),('W8L804B441P7',0.9978,0.078,13.8,0.74,3.44,5.33,0.1,0.41,39.5,196.5,2.64,441,8,804),('W8L804B441P8',0.9993,0.054,10.4,0.62,3.13,5.84,0.39,0.75,21.6,81.1,1.3,441,8,804),('W8L804B441P9',1.0031,0.091,12.5,0.78,2.88,7.69,0.73,0.12,57.3,233.4,15.89,441,8,804),('W8L804B442P1',1.0035,0.072,11.2,0.91,3.64,5.66,0.67,0.83,26.6,25,3.41,442,8,804),('W8L804B442P10',0.9917,0.061,10,0.32,2.92,8.37,0.38,0.89,38.1,201.6,17.07,442,8,804),('W8L804B442P11',0.9928,0.057,13,0.7,3.05,7.53,0.42,0.82,18.7,23.6,17.24,442,8,804),('W8L804B442P12',0.9907,0.028,10.6,0.82,2.98,5.65,0.47,0.2,45.5,217.1,11.52,442,8,804),('W8L804B442P13',1.0043,0.043,12.1,0.89,3.57,6.31,0.72,0.4,23.6,27.4,5.95,442,8,804),('W8L804B442P14',0.9974,0.054,8.3,0.4,3.46,7.69,0.27,0.45,43.2,112.5,17.87,442,8,804),('W8L804B442P15',0.9928,0.028,13.2,0.57,3.29,9.79,0.7,0.78,50.8,30.5,12.15,442,8,804),('W8L804B442P16',1.003,0.035,9.8,0.32,3.71,6.3,0,0.14,41.7,226.3,4.14,442,8,804),('W8L804B442P17',1.0003,0.029,9.9,0.68,3.17,9.07,0.04,0.43,65,79.2,7.25,442,8,804),('W8L804B442P18',0.9903,0.034,8.8,0.9,3.1,5,0.25,0.49,29.6,100.3,10.92,442,8,804),('W8L804B442P19',0.9958,0.073,10.7,0.42,3.33,7.98,0.75,0.54,35.1,127.6,5.23,442,8,804),('W8L804B442P2',1.0024,0.044,11.2,0.94,3.59,5.27,0.3,0.63,30.7,231.3,14.98,442,8,804),('W8L804B442P20',0.9937,0.042,12.3,0.86,3.24,7.54,0.31,0.37,40.3,16.2,7.37,442,8,804),('W8L804B442P21',0.9946,0.052,11.9,0.89,3.04,5.15,0.09,0.82,69,150.3,9.46,442,8,804),('W8L804B442P3',1.0036,0.062,12.9,0.57,3.21,5.71,0.49,0.34,27.6,125.6,16.65,442,8,804),('W8L804B442P4',0.9902,0.098,9.1,0.55,3.62,7.17,0.68,0.16,49.4,229.1,11.06,442,8,804),('W8L804B442P5',0.9973,0.099,13.2,0.96,3.07,9.04,0.63,0.78,41,144.3,10.3,442,8,804),('W8L804B442P6',0.9916,0.012,13.4,0.87,3.52,9.7,0.33,0.35,55.5,55.8,8.98,442,8,804),('W8L804B442P7',0.9959,0.048,8.3,0.7,3.21,8.14,0.65,0.54,7.3,176.3,19.49,442,8,804),('W8L804B442P8',1.0028,0.09,9.1,0.84,2.94,8.28,0.37,0.95,40.5,132.3,5.82,442,8,804),('W8L804B442P9',0.9986,0.045,9.1,0.76,3.22,6.86,0.2,0.82,55.9,48.4,16.84,442,8,804),('W8L805B265P1',1.0035,0.069,10.5,0.49,3.57,8.5,0.46,0.37,23,240,16.71,265,8,805),('W8L805B265P10',1.005,0.073,12.3,0.42,2.83,8.92,0.19,0.24,17.4,97.3,14.35,265,8,805),('W8L805B265P11',0.9966,0.08,11.9,0.79,3.3,5.19,0.24,0.68,33.5,58,1.57,265,8,805),('W8L805B265P12',1.0038,0.069,11,0.49,3.33,7.81,0.36,0.25,31.4,172.6,8.21,265,8,805),('W8L805B265P13',0.9916,0.021,11.2,0.75,3.64,9.27,0.54,0.38,29.1,164,4.47,265,8,805),('W8L805B265P14',0.9931,0.024,11.1,0.85,3.49,9.89,0.46,0.64,49.5,224.6,12.17,265,8,805),('W8L805B265P15',1.0042,0.091,8.3,0.57,3.59,8.8,0.47,0.34,56.1,14.3,14.28,265,8,805),('W8L805B265P16',0.9945,0.045,9.2,0.71,3.17,5.2,0.01,0.33,67.6,178,0.7,265,8,805),('W8L805B265P17',0.9926,0.013,13.3,0.55,3.62,9.98,0.37,0.4,52.5,133.2,6.66,265,8,805),('W8L805B265P18',0.9952,0.069,8.3,0.58,3.15,5.93,0.7,0.66,19.6,167.3,19.14,265,8,805),('W8L805B265P19',1.0036,0.048,13.3,0.38,3.31,5.89,0.4,0.39,17.8,142.8,0.61,265,8,805),('W8L805B265P2',0.9913,0.05,13,0.46,2.91,9.5,0.59,0.73,32.9,95,6.52,265,8,805),('W8L805B265P20',1.0025,0.044,9.8,0.6,3.59,6.07,0.49,0.91,45.4,157.5,10.71,265,8,805),('W8L805B265P21',1.0014,0.035,10.9,0.48,3.26,5.8,0.55,0.44,56.1,113.3,19.74,265,8,805),('W8L805B265P22',1.0013,0.03,12.1,0.58,3.13,5.27,0.39,0.23,20.8,205.4,17.92,265,8,805),('W8L805B265P23',1.0012,0.078,10.1,0.87,3.04,6.52,0.11,0.75,50.8,184.2,8.19,265,8,805),('W8L805B265P24',1.001,0.019,11.7,0.86,3.14,8.63,0,0.53,34.3,49.8,3.65,265,8,805),('W8L805B265P25',0.9913,0.03,13.3,0.73,3.79,7.68,0.28,0.99,10,105.2,11.59,265,8,805),('W8L805B265P26',0.9978,0.043,12.5,0.94,3.18,8.03,0.18,0.59,26.8,92.1,14.27,265,8,805),('W8L805B265P27',1.0009,0.057,10,0.3,2.9,6.12,0.29,0.83,23.9,124.4,18.53,265,8,805),('W8L805B265P3',1.0006,0.083,9.2,0.34,3.21,9.23,0.45,0.3,6.7,40.9,8.1,265,8,805),('W8L805B265P4',1.0037,0.033,13.7,0.72,3.2,6.67,0.8,0.95,36.7,78.5,15.79,265,8,805),('W8L805B265P5',1.0047,0.028,10.9,0.7,3.62,6.61,0.25,1,56.6,146.7,1.59,265,8,805),('W8L805B265P6',1.0025,0.03,12.3,0.77,3.56,9.03,0.07,0.18,21.1,131.1,16.94,265,8,805),('W8L805B265P7',0.9925,0.039,8.1,0.41,3.11,7.07,0.25,0.12,28.7,32.9,4.93,265,8,805),('W8L805B265P8',0.9934,0.079,11.1,0.88,3.34,5.32,0.05,0.69,61.5,235.1,11.73,265,8,805),('W8L805B265P9',0.9928,0.04,12.4,0.45,3.71,8.74,0.49,0.18,52.9,37.7,14.35,265,8,805),('W8L805B266P1',1.0042,0.059,9,0.67,3.22,7.45,0.58,0.28,60.7,132,13.03,266,8,805),('W8L805B266P10',0.9994,0.046,11.5,0.65,2.96,7.98,0.56,0.68,17.1,204.2,5.35,266,8,805),('W8L805B266P11',0.9995,0.088,10.9,0.48,3.73,5.37,0.76,0.15,42.4,187.5,2.72,266,8,805),('W8L805B266P12',0.9921,0.091,8.8,0.93,3.18,8.72,0.04,0.55,42.4,41.1,2.22,266,8,805),('W8L805B266P13',0.9928,0.022,10.5,0.81,3.64,6.49,0.01,0.71,39.2,196.4,3.29,266,8,805),('W8L805B266P14',1.004,0.074,13.3,0.86,3.41,7.8,0.71,0.9,13.5,205.5,19.29,266,8,805),('W8L805B266P15',0.9978,0.029,12,0.43,3.34,6.13,0.78,0.46,64.2,19.1,8.9,266,8,805),('W8L805B266P16',0.9925,0.093,9.4,0.75,2.92,5.57,0.51,0.79,55.4,239.2,3.41,266,8,805),('W8L805B266P17',1.0039,0.09,11.6,0.55,3.64,6.36,0.34,0.79,33.9,188.4,13.12,266,8,805),('W8L805B266P18',1.0022,0.035,12.4,0.66,3.13,8.06,0.18,0.31,16.8,158.4,13.46,266,8,805),('W8L805B266P19',0.9906,0.088,8.1,0.75,2.84,6.93,0.72,0.94,57.1,28.7,2,266,8,805),('W8L805B266P2',1.001,0.07,9.5,0.98,3.57,7.26,0.56,0.17,55.2,46.9,10.48,266,8,805),('W8L805B266P20',0.9991,0.051,13.5,0.7,3.22,6.17,0.64,0.14,37.2,79.3,14.62,266,8,805),('W8L805B266P21',0.9969,0.098,10.5,0.55,3.26,5.35,0.3,0.16,13.6,140.3,11.21,266,8,805),('W8L805B266P22',0.9929,0.012,9.2,0.44,3.2,5.23,0.51,0.38,9,71.7,1.39,266,8,805),('W8L805B266P23',0.9969,0.069,9.5,0.48,3.7,6.86,0.66,0.81,41.8,127.7,18.04,266,8,805),('W8L805B266P24',0.9935,0.036,12.5,0.49,2.87,8.23,0.2,0.35,42.1,226.6,18.86,266,8,805),('W8L805B266P25',0.9991,0.057,11.8,0.84,3.7,6.84,0.14,0.64,20,27.5,6.03,266,8,805),('W8L805B266P3',0.9907,0.029,12.4,0.77,2.88,9.7,0.01,0.65,41.6,84.7,12.78,266,8,805),('W8L805B266P4',0.9944,0.043,11.9,0.8,3.66,6.14,0.22,0.77,56.1,188.2,2.86,266,8,805),('W8L805B266P5',0.9981,0.069,9.4,0.71,2.81,8.83,0.17,0.55,68.4,218.4,5.09,266,8,805),('W8L805B266P6',0.9979,0.031,13.3,0.51,3.21,6.41,0.17,0.82,47.2,53.3,17.45,266,8,805),('W8L805B266P7',0.9932,0.039,13.3,0.79,2.86,6.07,0.35,0.63,59.8,15.2,13.26,266,8,805),('W8L805B266P8',1.002,0.084,11.6,0.87,3.51,5.81,0.21,0.86,15.5,174.9,13.33,266,8,805),('W8L805B266P9',0.9919,0.072,9.7,0.34,3.3,5.82,0.17,0.99,48.3,238,10.75,266,8,805),('W8L805B267P1',1.001,0.018,12.7,0.91,2.87,5.86,0.65,0.27,53.4,37.3,16.89,267,8,805),('W8L805B267P10',0.9922,0.06,12.6,0.46,3.2,7.75,0.42,0.34,32.9,219,14.06,267,8,805),('W8L805B267P11',1,0.079,8.9,0.61,3.71,9.45,0.43,0.81,56.7,117.6,19.58,267,8,805),('W8L805B267P12',0.9901,0.032,12,0.86,3.23,7.38,0.03,0.41,20.7,208.8,14.93,267,8,805),('W8L805B267P13',0.9932,0.027,10.3,0.8,3.18,5.12,0.79,0.25,57.5,102.3,14.2,267,8,805),('W8L805B267P14',0.9963,0.074,8.5,0.77,2.94,7.87,0,0.77,15.1,242.2,6.16,267,8,805),('W8L805B267P15',0.9915,0.066,11.7,0.36,3.26,8.35,0.71,0.88,51.6,124.9,6.3,267,8,805),('W8L805B267P16',1.0045,0.012,13.1,0.78,3.52,5.28,0.77,0.8,67.1,230.5,2.96,267,8,805),('W8L805B267P17',0.9981,0.041,12.8,0.59,2.96,5.78,0.72,0.57,47,54.8,6.44,267,8,805),('W8L805B267P18',0.9931,0.041,8.5,0.77,3.04,7.52,0.66,0.96,62.2,209,7.17,267,8,805),('W8L805B267P19',1.0005,0.043,10.6,0.64,3.42,6.25,0.1,0.95,47,209.1,14.92,267,8,805),('W8L805B267P2',0.9908,0.098,9.5,0.43,3.65,7.36,0.23,0.82,18.7,108.8,12.76,267,8,805),('W8L805B267P20',0.9941,0.095,12.8,0.3,2.96,5.66,0.5,0.73,65.8,60.5,12.44,267,8,805),('W8L805B267P21',1.0012,0.016,12.6,0.53,2.99,5.96,0.3,0.74,46.2,43.6,12.81,267,8,805),('W8L805B267P22',0.9954,0.069,13.9,0.73,3.48,5.58,0.26,0.17,34.6,29.5,6.2,267,8,805),('W8L805B267P23',1.0049,0.055,10.8,0.45,3.32,6.73,0.23,0.33,56.5,115.4,12.2,267,8,805),('W8L805B267P24',0.9986,0.052,11,0.67,3.45,5.49,0.49,0.59,32.3,139.5,5.65,267,8,805),('W8L805B267P25',1.0043,0.087,12,0.91,3.09,6.93,0.01,0.44,25.1,46.1,14.81,267,8,805),('W8L805B267P26',0.9966,0.082,12.1,0.89,3.12,5.84,0.67,0.46,35.9,112.8,13.79,267,8,805),('W8L805B267P27',0.9983,0.017,9,0.72,3.63,6.17,0.45,0.15,10.3,134.5,15.61,267,8,805),('W8L805B267P28',0.9978,0.02,9.4,0.42,3.63,9.14,0.73,0.52,39.7,241.8,18.27,267,8,805),('W8L805B267P3',1.0032,0.041,12.3,0.71,3.01,5.15,0.78,0.2,67.2,213,5.03,267,8,805),('W8L805B267P4',0.9984,0.088,13.6,0.89,3.38,7.01,0.56,0.63,30.4,186.9,4.35,267,8,805),('W8L805B267P5',0.9918,0.066,12.5,0.35,3.61,9.02,0.35,0.76,49.8,232,5.72,267,8,805),('W8L805B267P6',1.0004,0.035,12.3,0.59,3.47,5.85,0.44,0.9,39.3,18.8,6.8,267,8,805),('W8L805B267P7',0.9929,0.025,9,0.38,3.23,7.77,0.31,0.49,46.6,11.4,12.6,267,8,805),('W8L805B267P8',0.996,0.063,13,0.72,2.86,5.82,0.47,0.89,32.7,231.1,6.5,267,8,805),('W8L805B267P9',0.9971,0.058,10.8,0.84,3.46,9.57,0.53,0.94,66,10.3,8.99,267,8,805),('W8L805B268P1',1.0031,0.08,12.3,0.39,2.9,5.57,0.14,0.7,49.4,152.2,18.93,268,8,805),('W8L805B268P10',1.0037,0.077,11.3,0.71,3.68,7.8,0.48,0.36,37.8,111.4,4.86,268,8,805),('W8L805B268P11',0.9958,0.068,8.9,0.9,3.36,8.74,0.48,0.99,42.7,212.2,1.47,268,8,805),('W8L805B268P12',0.9955,0.088,8.1,0.34,2.81,7.63,0.04,0.51,47,244.9,8.46,268,8,805),('W8L805B268P13',0.9987,0.076,8.6,0.65,2.9,9.48,0.68,0.33,69.9,150.7,13.69,268,8,805),('W8L805B268P14',0.998,0.011,13.7,0.36,3.29,9.48,0.15,0.22,65,191.2,16.02,268,8,805),('W8L805B268P15',0.9906,0.057,9.2,0.57,3.05,8.75,0.21,0.52,49.5,26.9,19.48,268,8,805),('W8L805B268P16',0.994,0.011,11.8,0.35,3.17,9.98,0.11,0.83,19.5,165.3,12.14,268,8,805),('W8L805B268P17',0.9915,0.015,10.7,0.42,3.2,6.37,0.43,0.25,68.5,191.6,1.92,268,8,805),('W8L805B268P18',1.0003,0.035,8.4,0.67,3.12,6.65,0.11,0.47,6.7,90.6,13.29,268,8,805),('W8L805B268P19',1.003,0.09,9.8,0.45,3.18,8.28,0.31,0.14,11,13.7,4.27,268,8,805),('W8L805B268P2',0.9963,0.071,12.1,0.39,2.96,9.57,0.58,0.92,18.3,158.9,16.02,268,8,805),('W8L805B268P20',1.0006,0.031,10.4,0.83,2.82,9.66,0.45,0.48,67.7,103,6.4,268,8,805),('W8L805B268P21',1.0021,0.018,9.6,0.42,3.67,9.18,0.34,0.53,42.6,244.7,9.3,268,8,805),('W8L805B268P22',0.9984,0.099,10.9,0.4,3.68,5.14,0.67,0.55,10.3,74,3.59,268,8,805),('W8L805B268P23',0.9917,0.072,10.3,0.68,2.94,7.47,0.18,0.32,53.4,25.3,11.73,268,8,805),('W8L805B268P24',0.9948,0.049,13.6,0.59,3.14,7.96,0.23,0.84,42.6,69.1,10.22,268,8,805),('W8L805B268P25',0.9929,0.041,12.9,0.38,3.4,8.33,0.08,0.1,47.2,195.6,13.56,268,8,805),('W8L805B268P26',1.0035,0.094,10.2,0.38,3.14,5.13,0.09,0.28,25.5,209.8,8.75,268,8,805),('W8L805B268P27',0.9954,0.06,12,0.3,3.07,5.07,0.32,0.5,21,139.7,4.25,268,8,805),('W8L805B268P28',0.9907,0.028,12.3,0.32,3.63,9.92,0.12,0.2,67.3,62.5,11.02,268,8,805),('W8L805B268P29',0.9988,0.049,8.1,0.34,3.55,8.8,0.48,0.23,51.8,208,12.42,268,8,805),('W8L805B268P3',1.0026,0.061,11.6,0.88,3.12,5.25,0.16,1,41.1,48.5,13.05,268,8,805),('W8L805B268P30',0.997,0.023,8.4,0.88,2.81,7.6,0.45,0.93,18.1,76.7,2.64,268,8,805),('W8L805B268P31',1.0029,0.061,11.4,1,3.44,6.43,0.21,0.42,51.6,210.1,13.71,268,8,805),('W8L805B268P32',0.999,0.073,9.5,0.74,3.36,9.07,0.72,0.97,20.5,42.3,2.49,268,8,805),('W8L805B268P4',0.9951,0.086,11.8,0.89,2.92,5.22,0.5,0.57,15.5,132.1,10.19,268,8,805),('W8L805B268P5',1.0008,0.096,13.4,0.71,3.01,5.58,0.64,0.44,10.9,97.8,0.75,268,8,805),('W8L805B268P6',1.0012,0.078,10.5,0.73,3.05,5.67,0.7,0.28,56.8,30.3,18.15,268,8,805),('W8L805B268P7',1.0029,0.014,9.4,0.85,3.27,8.21,0.23,0.85,29.3,243.5,19.98,268,8,805),('W8L805B268P8',0.9903,0.063,10.9,0.88,3.29,8.41,0.17,0.43,24,163.5,1.06,268,8,805),('W8L805B268P9',1.0034,0.029,12.1,0.44,3.34,8.55,0.11,0.98,33.4,17.1,8.37,268,8,805),('W8L805B269P1',0.9923,0.03,8.7,0.39,3.01,7.09,0.6,0.76,40.1,75.1,8.47,269,8,805),('W8L805B269P10',0.9993,0.015,11.5,0.3,3.6,7.43,0.68,0.91,29.5,87.2,7.7,269,8,805),('W8L805B269P11',0.9966,0.066,10.6,0.8,3.69,9.06,0.47,0.66,53.4,44.8,15.45,269,8,805),('W8L805B269P12',1.0017,0.1,9.7,0.37,3.11,9.87,0.06,0.59,57.4,130.9,12.16,269,8,805),('W8L805B269P13',0.9989,0.065,12.1,0.72,3.07,6.4,0.21,0.61,8.3,174.7,6.59,269,8,805),('W8L805B269P14',0.9945,0.042,9.7,0.41,3.68,8.18,0.72,0.34,48.2,104,4.09,269,8,805),('W8L805B269P15',0.9901,0.027,11,0.51,2.99,5.77,0.06,0.91,30.5,192.3,3.91,269,8,805),('W8L805B269P16',0.9944,0.051,10.5,0.54,3.39,9.49,0.36,0.61,68.1,42.5,10.73,269,8,805),('W8L805B269P17',1.0012,0.099,9.1,0.4,3.68,6.28,0.63,0.71,39.7,164.6,14.23,269,8,805),('W8L805B269P18',1.0044,0.044,8.9,0.75,3.34,5.94,0.72,0.45,67.2,40.3,11.84,269,8,805),('W8L805B269P19',0.9921,0.067,12.5,0.71,3.41,9.2,0.39,0.47,12.4,203.3,14.91,269,8,805),('W8L805B269P2',1.0036,0.079,8.1,0.64,3.37,8.52,0.7,0.18,54.8,116.5,2.81,269,8,805),('W8L805B269P20',0.9916,0.037,8.2,0.36,3.73,5.57,0.14,0.86,66.6,97.3,13.42,269,8,805),('W8L805B269P21',1.0049,0.095,8.1,0.55,3.76,7.17,0.21,0.57,17.9,58.9,13.21,269,8,805),('W8L805B269P22',1.0049,0.022,8.3,0.39,3.65,5.26,0.78,0.15,31,184.2,5.42,269,8,805),('W8L805B269P23',1.0013,0.089,13.6,1,3.62,7.01,0.5,0.54,59.2,196.9,0.88,269,8,805),('W8L805B269P24',0.9902,0.036,11.3,0.92,3.52,9.37,0.47,0.45,40.6,206.1,8.71,269,8,805),('W8L805B269P25',0.9931,0.01,12.7,0.43,3.43,9.91,0.35,0.85,34.7,174,15.91,269,8,805),('W8L805B269P3',1.0002,0.041,9.4,0.76,3.79,5.18,0.4,0.44,46.8,29.4,18.71,269,8,805),('W8L805B269P4',0.9978,0.049,13.9,0.74,2.85,9.14,0.63,0.84,21.8,153.3,13.01,269,8,805),('W8L805B269P5',0.9912,0.07,10.1,0.63,3.66,8.92,0.6,0.51,53.2,231.4,16.96,269,8,805),('W8L805B269P6',0.9925,0.032,9.5,0.41,3.53,8.17,0.42,0.33,15.5,13.3,4.65,269,8,805),('W8L805B269P7',0.9913,0.021,10.4,0.72,3.7,5.41,0.64,0.68,42.3,55.9,17.18,269,8,805),('W8L805B269P8',0.9987,0.035,11.8,0.36,3.63,7.63,0.59,0.19,33.3,219.4,10.66,269,8,805),('W8L805B269P9',1.0039,0.031,11.3,0.5,3.59,9.78,0.21,0.76,32.8,41.5,15.24,269,8,805),('W8L805B270P1',0.9986,0.033,13,0.64,2.88,5.2,0.2,0.22,59.5,184.1,18.55,270,8,805),('W8L805B270P10',0.9972,0.022,12.9,0.49,3.3,8.73,0.69,0.11,13.4,89.1,10.02,270,8,805),('W8L805B270P11',0.9987,0.058,8.9,0.85,3.53,6.6,0.63,0.27,12,129.5,7.35,270,8,805),('W8L805B270P12',1.0039,0.054,12.9,0.75,3.02,8.61,0.07,0.97,24.5,230.6,9.32,270,8,805),('W8L805B270P13',0.9954,0.03,12.5,0.38,2.85,5.99,0.76,0.14,57.4,54.6,8.57,270,8,805),('W8L805B270P14',1.0002,0.014,9.2,0.61,3.11,7.56,0.63,0.48,25.4,134.4,14.59,270,8,805),('W8L805B270P15',0.9964,0.067,10,0.95,2.94,9.64,0.16,0.86,28.2,206.6,2.05,270,8,805),('W8L805B270P16',0.9952,0.08,8.9,0.62,3.35,5.03,0.09,0.99,69.5,200.7,8.4,270,8,805),('W8L805B270P17',0.9993,0.026,11.2,0.84,3.07,5.47,0.71,0.5,43.2,176.4,1.5,270,8,805),('W8L805B270P18',0.9969,0.06,9.9,0.69,3.61,9.22,0.76,0.71,69.1,148.2,5.25,270,8,805),('W8L805B270P19',0.9951,0.095,9,0.46,3.16,8.42,0.12,0.99,13.8,131.1,10.93,270,8,805),('W8L805B270P2',1.0034,0.056,10.5,0.69,3.29,6.85,0.51,0.25,61,138.4,8.13,270,8,805),('W8L805B270P20',0.9986,0.031,12.1,0.56,3.58,8.6,0.2,0.77,38.6,238.1,2.41,270,8,805),('W8L805B270P21',1.0014,0.093,13.2,0.95,3.2,7.11,0.14,0.72,51.6,126.1,2.22,270,8,805),('W8L805B270P22',1.0044,0.063,8,0.99,3.51,8.6,0.63,0.39,39.2,55.8,13.87,270,8,805),('W8L805B270P23',0.9937,0.016,9.6,0.82,3.01,6.98,0.36,0.71,9.5,189.8,17.84,270,8,805),('W8L805B270P3',1.0047,0.084,11.3,0.85,3,5.97,0.74,0.63,10,201.5,11.9,270,8,805),('W8L805B270P4',1.0031,0.075,10.6,0.75,3.58,7.68,0.39,1,18.3,169.1,10.79,270,8,805),('W8L805B270P5',0.996,0.096,10.4,0.64,2.83,5.98,0.37,0.13,56.3,72.6,1.33,270,8,805),('W8L805B270P6',1.0012,0.038,11.9,0.88,3.5,8.54,0,0.27,27,51.8,2.67,270,8,805),('W8L805B270P7',0.9989,0.054,9,0.46,3.48,8.93,0.09,0.61,32.6,98.9,5.01,270,8,805),('W8L805B270P8',0.9919,0.062,12.9,0.85,3.69,7.9,0.66,0.26,26.9,56.3,17.41,270,8,805),('W8L805B270P9',0.9913,0.067,9.3,0.51,3.49,6.74,0.75,0.94,14.2,183.6,5.51,270,8,805),('W8L805B271P1',0.9992,0.079,9.9,0.65,3.48,6.03,0.16,0.21,65.7,206.7,7.12,271,8,805),('W8L805B271P10',0.9909,0.054,10.8,0.69,3.68,8.97,0.13,0.83,59.5,54.6,5.59,271,8,805),('W8L805B271P11',0.9919,0.046,8.3,0.61,3.14,6.5,0.51,0.23,67.1,53.5,9.52,271,8,805),('W8L805B271P12',0.9999,0.09,8.5,0.64,3.04,8.03,0.4,0.51,10.5,36.9,12.68,271,8,805),('W8L805B271P13',1.0016,0.09,11.1,0.53,3.17,9.65,0.77,0.37,64.8,240.9,6.17,271,8,805),('W8L805B271P14',0.9982,0.083,12.2,0.91,3.73,8.07,0.57,0.19,63.5,50.4,5.55,271,8,805),('W8L805B271P15',1.0004,0.085,12.7,0.74,2.95,5.64,0.77,0.43,18.3,228.6,12.54,271,8,805),('W8L805B271P16',1.0023,0.065,12.3,0.52,3.65,6.2,0.07,0.65,15.3,88.9,2.87,271,8,805),('W8L805B271P17',1.0017,0.098,9,0.93,3.22,6.73,0.15,0.96,27.8,221.7,12.79,271,8,805),('W8L805B271P18',1.003,0.051,11.9,0.54,3.07,8.27,0.18,0.4,48.7,67.7,2.59,271,8,805),('W8L805B271P19',0.9908,0.034,9.2,0.51,2.94,6,0.57,0.31,42.8,230.9,6.69,271,8,805),('W8L805B271P2',0.9947,0.02,13.8,0.35,3.77,6.8,0.27,0.16,12.6,11.6,5.16,271,8,805),('W8L805B271P20',0.9932,0.034,8.5,0.77,2.93,8.23,0.68,0.75,19.2,244.7,3.86,271,8,805),('W8L805B271P21',0.9996,0.068,12.5,0.31,3.63,5.47,0.49,0.84,21.2,180.8,7.82,271,8,805),('W8L805B271P22',1.0027,0.024,10.7,0.72,3.15,6.24,0.34,0.63,12.8,234.5,6.43,271,8,805),('W8L805B271P23',1.0002,0.092,10.8,0.87,3.44,6.51,0.38,0.58,26.9,59.3,6.8,271,8,805),('W8L805B271P24',1.0021,0.024,10.1,0.77,2.82,5.81,0.19,0.22,16.7,147.7,17.34,271,8,805),('W8L805B271P25',0.9923,0.066,14,1,3.27,5.12,0.65,0.79,62.9,144.9,8.18,271,8,805),('W8L805B271P3',0.9914,0.083,12.1,0.75,3.37,5.83,0.24,0.15,45.4,161.6,7.3,271,8,805),('W8L805B271P4',0.9942,0.013,10.2,0.61,3.3,6.86,0.33,0.54,8.5,172.4,17.44,271,8,805),('W8L805B271P5',1.0044,0.057,8.4,0.59,3.37,6.1,0.74,0.47,24.1,105.7,4.54,271,8,805),('W8L805B271P6',0.9959,0.083,9.6,0.73,3.48,7.62,0.33,0.71,22.2,10.3,9.12,271,8,805),('W8L805B271P7',0.9951,0.051,12.1,0.58,3.35,8.22,0.48,0.25,57,122.2,19.4,271,8,805),('W8L805B271P8',1.0019,0.098,13.8,0.99,3.28,5.3,0.56,0.21,68.7,128.6,19.54,271,8,805),('W8L805B271P9',0.9948,0.06,13.4,0.69,2.9,8.35,0.07,0.52,24.4,196,19.42,271,8,805),('W8L805B272P1',0.9992,0.034,12.4,0.79,3.71,7.4,0.43,0.37,42.7,153.9,8.07,272,8,805),('W8L805B272P10',1.0018,0.068,12.8,0.87,2.96,6.23,0.2,0.9,38,144,4.79,272,8,805),('W8L805B272P11',0.9904,0.01,11.5,0.42,3.22,8.38,0.53,0.66,28.9,165.1,14.87,272,8,805),('W8L805B272P12',1.0043,0.081,12.6,0.8,3.14,7.23,0.49,0.11,66.7,63.6,2.28,272,8,805),('W8L805B272P13',1.0016,0.046,11.9,0.52,3.19,6.06,0.03,0.32,27.4,167.3,9.03,272,8,805),('W8L805B272P14',0.9948,0.096,8.1,0.47,3.75,7.11,0.34,0.42,67,148.9,3.04,272,8,805),('W8L805B272P15',1.0049,0.015,13,0.79,3.45,5.36,0.39,0.62,30.8,113.8,12.4,272,8,805),('W8L805B272P16',0.9949,0.035,8.1,0.75,3.36,7.06,0.09,0.16,51.9,222.4,6.94,272,8,805),('W8L805B272P17',1.0038,0.065,10.1,0.53,3.03,5.83,0.01,0.27,8.1,63.7,18.98,272,8,805),('W8L805B272P18',0.9942,0.042,8.5,0.65,3.76,7.8,0.63,0.72,57.3,113.6,1.93,272,8,805),('W8L805B272P19',0.9971,0.034,9.8,0.77,2.9,9.46,0.21,0.71,50.8,163.3,8.91,272,8,805),('W8L805B272P2',0.9977,0.061,9,0.56,3.79,8.28,0.06,0.87,51.6,12.1,14.91,272,8,805),('W8L805B272P20',1.0047,0.052,11,0.69,3.61,6.96,0.37,0.8,12.4,65.6,7.39,272,8,805),('W8L805B272P21',1,0.074,8.2,0.38,2.91,6.98,0.22,0.83,5.3,65.1,18.51,272,8,805),('W8L805B272P22',0.997,0.082,12,0.95,2.92,5.36,0.77,0.2,31.6,216.2,8.08,272,8,805),('W8L805B272P23',0.9909,0.096,12.4,0.31,3.6,5.79,0.72,0.95,69.3,243.2,18.29,272,8,805),('W8L805B272P24',1.0027,0.014,13.8,0.91,2.82,8.62,0.69,0.31,51.4,53.9,12.12,272,8,805),('W8L805B272P25',0.9939,0.029,12.1,0.92,3.44,9.2,0.69,0.23,49.2,102.6,7.54,272,8,805),('W8L805B272P3',0.9942,0.079,10.3,0.96,3.31,7.38,0.67,0.35,38.3,153.6,17.78,272,8,805),('W8L805B272P4',0.9927,0.077,11.2,0.59,3.36,6.12,0.18,0.19,64.8,213.1,19.24,272,8,805),('W8L805B272P5',0.9922,0.051,8.2,0.46,3.67,7.15,0.41,0.7,55.3,30.1,8.92,272,8,805),('W8L805B272P6',0.9973,0.039,11.3,0.83,3.27,7.81,0.23,0.69,50.6,168.1,17.45,272,8,805),('W8L805B272P7',0.997,0.015,11.6,0.41,3.35,9.26,0.09,0.2,57.3,150.8,6.35,272,8,805),('W8L805B272P8',0.9994,0.031,8.6,0.4,3.43,6.23,0.59,0.29,67,212.9,4.28,272,8,805),('W8L805B272P9',0.9949,0.019,10.8,0.47,3.41,9.26,0.67,0.5,8.2,129.4,9.87,272,8,805),('W8L805B273P1',1.0015,0.036,9.1,0.36,3.35,6.69,0.56,0.16,9.8,153,10.43,273,8,805),('W8L805B273P10',0.9957,0.058,8.8,0.82,3.7,7.89,0.01,0.97,63.2,13.3,10.59,273,8,805),('W8L805B273P11',0.992,0.096,11.3,0.36,2.96,6.91,0.02,0.52,43.5,107.8,17.61,273,8,805),('W8L805B273P12',0.9927,0.051,11,0.62,3.61,8.42,0.8,0.13,16.4,14.5,7.09,273,8,805),('W8L805B273P13',1.0028,0.092,9.3,0.84,3.37,9.4,0.23,0.67,33.7,171.9,8.03,273,8,805),('W8L805B273P14',0.9966,0.039,10.8,0.51,3.74,8.59,0.21,0.87,57.6,140.6,18.12,273,8,805),('W8L805B273P15',0.9935,0.088,13.4,0.69,3.61,7.68,0.06,0.14,7.6,46.8,5.42,273,8,805),('W8L805B273P16',1.004,0.089,10.4,0.67,3.46,9.53,0.36,0.12,17,152.5,17.22,273,8,805),('W8L805B273P17',1.0019,0.061,8.7,0.7,3.48,6.5,0.38,0.2,42.8,119,8.72,273,8,805),('W8L805B273P18',0.9977,0.099,10.8,0.72,3.01,8.42,0.75,0.3,33.1,113.2,15.83,273,8,805),('W8L805B273P19',1.0025,0.052,13.2,0.96,2.98,6.39,0.38,0.73,13.9,48.1,13.11,273,8,805),('W8L805B273P2',0.9916,0.095,13.6,0.68,3.46,7.23,0.39,0.11,57.7,129.6,4.49,273,8,805),('W8L805B273P20',0.9942,0.021,10,0.34,3.68,9.06,0.64,0.63,41.1,109,8.52,273,8,805),('W8L805B273P21',0.9919,0.027,13.8,0.57,3.16,9.29,0.64,0.63,59,31.3,12.04,273,8,805),('W8L805B273P22',0.9994,0.01,12.2,0.83,3.65,9.89,0.29,0.49,36.9,223.7,6.76,273,8,805),('W8L805B273P23',1.0024,0.028,8.7,0.86,3.05,6.32,0.66,0.44,38.5,73,10.52,273,8,805),('W8L805B273P24',1.001,0.08,10.8,0.45,3.34,9.62,0.2,0.99,28.5,159,12.05,273,8,805),('W8L805B273P25',0.994,0.054,10.7,0.51,3.54,5.75,0.47,0.32,46.3,237.8,17.85,273,8,805),('W8L805B273P26',1.0013,0.059,9.2,0.55,3.17,8.2,0.49,0.72,63.8,234.2,19.87,273,8,805),('W8L805B273P27',0.9921,0.068,9.1,0.72,3.23,7.33,0.45,0.11,55,215.7,15.82,273,8,805),('W8L805B273P28',1.0045,0.067,14,0.94,2.89,6.72,0.31,0.96,59.6,64.9,2.61,273,8,805),('W8L805B273P29',1.0033,0.046,11.5,0.73,3.61,5.83,0.24,0.31,19.5,110.2,10.7,273,8,805),('W8L805B273P3',0.9912,0.077,11.3,0.32,2.82,6.43,0.11,0.89,62.2,125.5,11.61,273,8,805),('W8L805B273P30',0.9972,0.017,9.9,0.56,2.84,9.8,0.13,0.81,19.3,144.4,10.88,273,8,805),('W8L805B273P31',0.9987,0.096,9.7,0.66,3.2,9.13,0.11,0.17,51.7,24.7,7.09,273,8,805),('W8L805B273P32',0.9992,0.058,10,0.36,3.02,8.41,0.18,0.85,19.9,52.9,3.42,273,8,805),('W8L805B273P4',0.9915,0.041,13.5,0.47,2.99,8.17,0.45,0.17,41,193.4,5.53,273,8,805),('W8L805B273P5',0.9949,0.051,9.8,0.54,3.22,9.86,0.29,0.46,22.6,216.3,1.11,273,8,805),('W8L805B273P6',0.9969,0.038,10.2,0.34,3.67,5.85,0.59,0.21,55.4,162.8,3.62,273,8,805),('W8L805B273P7',0.9939,0.041,9.1,0.42,3.29,9.07,0.07,0.32,57.5,142.6,18.46,273,8,805),('W8L805B273P8',0.9989,0.092,12.1,0.9,3.12,6.79,0.62,0.27,21.4,141.7,14.58,273,8,805),('W8L805B273P9',0.9905,0.081,12.2,0.89,3.21,5.82,0.21,0.18,29.3,202.9,14.39,273,8,805),('W8L805B274P1',0.9936,0.032,13.9,0.78,3.42,8.55,0.51,0.83,9.7,159.9,4.57,274,8,805),('W8L805B274P10',0.9921,0.08,10.3,0.75,3,8.41,0.07,0.26,7.1,165.1,17.21,274,8,805),('W8L805B274P11',1.0017,0.075,8.9,0.49,2.99,8.18,0.4,0.95,64.5,156.9,16.29,274,8,805),('W8L805B274P12',0.997,0.091,9.6,0.5,3.71,5.07,0.68,0.45,45.5,143.9,17.41,274,8,805),('W8L805B274P13',0.9934,0.085,10.7,0.7,3.49,8.62,0.64,0.3,35.5,179.5,16.46,274,8,805),('W8L805B274P14',0.9917,0.08,12.9,0.44,2.89,5.78,0.43,0.86,36.1,137.2,4.78,274,8,805),('W8L805B274P15',1.0049,0.079,9.9,0.37,3.13,7.7,0.26,0.66,7.2,115.3,1.49,274,8,805),('W8L805B274P16',0.9983,0.059,13.3,0.49,3.73,7.16,0.61,0.26,27.1,126.3,8.99,274,8,805),('W8L805B274P17',0.9913,0.028,11.1,0.52,2.92,7.53,0.38,0.54,14.4,107.5,10.5,274,8,805),('W8L805B274P18',1,0.012,13.4,0.47,3.5,9.4,0.07,0.62,44.4,165.3,18.17,274,8,805),('W8L805B274P19',0.9908,0.023,13.1,0.36,3.34,7.88,0.65,0.14,68.8,12.4,4.56,274,8,805),('W8L805B274P2',0.9955,0.024,9.4,0.59,3.65,9.09,0.52,0.47,49.9,146,15.4,274,8,805),('W8L805B274P20',0.9994,0.04,10.7,0.42,3.8,6.84,0.35,0.26,7.6,132.1,17.66,274,8,805),('W8L805B274P21',0.9948,0.068,9.7,0.48,3.25,9.59,0.39,0.81,11.3,206.1,7.91,274,8,805),('W8L805B274P22',1.0015,0.045,9.3,0.39,3.78,9.65,0.34,0.79,37.1,160.5,2.06,274,8,805),('W8L805B274P23',0.9984,0.072,10.2,0.73,3.48,5.81,0.72,0.96,25.5,205.1,3.24,274,8,805),('W8L805B274P24',0.9982,0.077,10.1,0.61,3.55,5.66,0.4,0.55,36.5,240.9,9.26,274,8,805),('W8L805B274P3',0.9985,0.096,11.8,0.88,3.47,5.42,0.39,0.89,12.2,171.3,7.61,274,8,805),('W8L805B274P4',0.9974,0.019,8.7,0.55,3.39,6.88,0.29,0.59,64.2,249.8,8.11,274,8,805),('W8L805B274P5',1.0043,0.074,10,0.5,3.52,5.89,0.78,0.12,51.5,154.4,7.37,274,8,805),('W8L805B274P6',0.9997,0.05,10,0.74,3.11,5.92,0.46,0.43,26.3,99.2,19.95,274,8,805),('W8L805B274P7',1.0043,0.089,13.7,0.44,3.19,5.75,0.06,0.84,10.5,18.4,18.92,274,8,805),('W8L805B274P8',0.9927,0.05,12.5,0.81,2.97,9.96,0.77,0.69,14.4,231.9,19.8,274,8,805),('W8L805B274P9',1.0014,0.019,11.1,0.47,3.17,8.52,0.77,0.99,48.1,153.1,3.8,274,8,805),('W8L805B275P1',1.0004,0.062,9.2,0.97,3.77,5.97,0.28,0.34,59.2,158.1,11.61,275,8,805),('W8L805B275P10',0.9931,0.031,13.5,0.53,3.6,9.62,0.15,0.33,33.1,173.2,19.36,275,8,805),('W8L805B275P11',0.9938,0.084,11.2,0.31,3.39,8.69,0.48,0.74,67.4,179,18.63,275,8,805),('W8L805B275P12',1.0021,0.046,13.2,0.47,3.32,7.93,0.61,0.33,22,180.9,17.71,275,8,805),('W8L805B275P13',1.0035,0.062,13.2,0.78,2.82,7.81,0.73,0.6,48,120.8,7.62,275,8,805),('W8L805B275P14',0.9952,0.076,11,0.35,3.7,6.98,0.5,0.75,32.9,249.9,12.66,275,8,805),('W8L805B275P15',0.9994,0.021,8.2,0.79,3.21,6.5,0.47,0.74,65.6,211,11.34,275,8,805),('W8L805B275P16',1.005,0.058,11.9,0.81,2.82,9.75,0.66,0.56,46,180.4,14.96,275,8,805),('W8L805B275P17',0.9964,0.097,13.8,0.93,3.36,9.32,0.36,0.67,7.3,104.3,10.8,275,8,805),('W8L805B275P18',0.997,0.052,9.5,0.88,3.01,5.25,0.21,0.13,30.1,26.4,8.14,275,8,805),('W8L805B275P19',1.0048,0.084,8.8,0.47,3.42,6.24,0.55,0.35,43.3,13.9,18.72,275,8,805),('W8L805B275P2',0.9972,0.078,13.9,0.35,3.1,9.71,0.78,0.27,49.7,43.4,19.4,275,8,805),('W8L805B275P20',0.995,0.031,10,0.83,2.88,6.07,0.74,0.76,47.2,39.7,9.73,275,8,805),('W8L805B275P21',0.9953,0.042,11.6,0.59,3.27,8.53,0.32,0.71,41.1,222.5,7.02,275,8,805),('W8L805B275P22',1.001,0.055,9.9,0.85,3.17,5.08,0.71,0.16,17,172.8,12.27,275,8,805),('W8L805B275P23',0.9914,0.029,8.5,0.78,2.81,7.28,0.05,0.19,55.3,10.1,8.89,275,8,805),('W8L805B275P24',0.9985,0.028,8.7,0.87,3.38,9.87,0.7,0.27,48.5,235,4.44,275,8,805),('W8L805B275P3',0.9924,0.077,13.5,0.82,3.25,6.25,0.33,0.92,49.1,212.1,16.34,275,8,805),('W8L805B275P4',0.9944,0.067,9.6,0.41,3.72,9.32,0.44,0.24,22.5,12.3,1.79,275,8,805),('W8L805B275P5',0.9964,0.06,8.5,0.75,3.75,6.63,0.4,0.54,24.3,93.5,8.11,275,8,805),('W8L805B275P6',0.9974,0.088,13.4,0.35,3.26,8.36,0.26,0.16,5.3,142.9,3.87,275,8,805),('W8L805B275P7',0.9906,0.036,12.5,0.6,3.4,8.32,0.04,0.41,38.7,175.4,13.32,275,8,805),('W8L805B275P8',0.9982,0.025,10,0.5,3.28,8.57,0.73,0.88,19.2,198.3,11.99,275,8,805),('W8L805B275P9',0.9987,0.016,10.7,0.68,3.41,6.32,0.49,0.86,41.7,238.8,2.93,275,8,805),('W8L806B404P1',1.0027,0.016,9.9,0.63,3.19,6.86,0.32,0.29,21.6,54.3,8.42,404,8,806),('W8L806B404P10',1.0022,0.043,9.8,0.48,3.59,5.41,0.75,0.16,13,247.9,13.48,404,8,806),('W8L806B404P11',0.9963,0.069,11.3,0.6,3.1,6.35,0.38,0.25,37.7,83.5,12.58,404,8,806),('W8L806B404P12',0.9969,0.094,14,0.9,2.85,9.55,0.25,0.82,54.1,75.9,3.53,404,8,806),('W8L806B404P13',0.9942,0.023,11.5,0.53,2.88,5.3,0.62,0.22,63.3,16.9,5.42,404,8,806),('W8L806B404P14',0.9917,0.033,13,0.47,3.56,8.64,0.8,0.35,23.6,213.9,18.99,404,8,806),('W8L806B404P15',0.9915,0.064,10.4,0.57,3.44,6.46,0.75,0.42,15.6,34.5,19.7,404,8,806),('W8L806B404P16',1.0005,0.083,13.2,0.72,3.35,9.36,0.06,0.55,33.9,213.6,13.33,404,8,806),('W8L806B404P17',1.0019,0.016,13.7,0.42,2.82,8.89,0.09,0.59,18.5,134.7,12.45,404,8,806),('W8L806B404P18',0.9923,0.027,10,0.43,3.46,8.17,0.51,0.41,7.4,133.1,15.63,404,8,806),('W8L806B404P19',0.9989,0.043,8.6,0.81,3.53,9.67,0.68,0.67,51.1,78.6,14.61,404,8,806),('W8L806B404P2',0.9945,0.065,10,0.9,3.4,6.2,0.52,0.44,35.5,48.9,10.62,404,8,806),('W8L806B404P20',1.0026,0.079,9.9,0.42,3.71,9.15,0.69,0.57,5.1,96.5,10.13,404,8,806),('W8L806B404P21',1.0038,0.066,12.2,0.75,3.09,6.68,0.77,0.47,47.3,65.1,3.45,404,8,806),('W8L806B404P22',0.9919,0.083,11.2,0.86,3.18,5.24,0.59,0.9,17.6,236.2,12.06,404,8,806),('W8L806B404P23',1.0028,0.086,11.3,0.36,3.79,5.82,0.57,0.24,66.4,230.7,16.34,404,8,806),('W8L806B404P24',0.9963,0.022,13.2,0.54,3.06,8.97,0.02,0.51,28.3,168.4,14.52,404,8,806),('W8L806B404P25',0.9909,0.048,12.9,0.46,3.38,5.14,0.27,0.19,19,127.7,18.07,404,8,806),('W8L806B404P3',0.9967,0.035,13.8,0.56,3.7,6.88,0.02,0.6,51.2,154.5,7.37,404,8,806),('W8L806B404P4',0.9932,0.036,9.9,0.85,3.14,5.47,0.56,0.81,17.9,184,17.18,404,8,806),('W8L806B404P5',0.9952,0.091,10.8,0.31,3.24,7.46,0.75,0.45,41.2,239,19.43,404,8,806),('W8L806B404P6',0.9911,0.026,10.1,0.95,3.43,6.14,0.24,0.61,7.2,39.6,10.33,404,8,806),('W8L806B404P7',1.0014,0.076,8.1,0.42,3.75,5.74,0.31,0.12,8.5,197.9,16.98,404,8,806),('W8L806B404P8',0.9961,0.024,9.4,0.83,3.4,5.72,0.34,0.46,64.8,54.6,15.52,404,8,806),('W8L806B404P9',0.9924,0.084,8.6,0.99,3.47,5.81,0.56,0.56,50.7,208.4,15.82,404,8,806),('W8L806B405P1',0.9929,0.055,8.3,0.44,3.27,5.26,0.3,0.26,15.3,140,16.42,405,8,806),('W8L806B405P10',0.9969,0.084,9.7,0.68,3.38,7.11,0.63,0.72,26,214,17.73,405,8,806),('W8L806B405P11',0.9974,0.022,8.2,0.54,3.59,5.95,0.43,0.65,6.8,74.3,10.36,405,8,806),('W8L806B405P12',0.997,0.092,8.3,0.45,3.35,5.39,0.07,0.81,24.5,36.9,3.78,405,8,806),('W8L806B405P13',1.0014,0.093,9.6,0.32,3.34,5.88,0.28,0.94,8.3,186.9,19.97,405,8,806),('W8L806B405P14',0.997,0.046,11,0.99,3.34,8.65,0.39,0.59,48.5,119.3,18.93,405,8,806),('W8L806B405P15',0.9925,0.04,10.7,0.82,2.93,7.36,0.57,0.94,40.4,109.7,9.29,405,8,806),('W8L806B405P16',0.9985,0.096,12.2,0.81,3.78,8.53,0.63,0.17,67.2,178.9,11.12,405,8,806),('W8L806B405P17',0.9927,0.029,12.8,0.94,2.89,6.51,0.79,0.83,29.6,54.9,14.14,405,8,806),('W8L806B405P18',0.9939,0.055,12.2,0.91,2.97,6.97,0.03,0.89,45.8,212.9,8.6,405,8,806),('W8L806B405P19',0.992,0.044,13.9,0.48,3.58,8.17,0.68,0.24,12.4,46.1,6.19,405,8,806),('W8L806B405P2',0.9927,0.094,9.8,0.45,2.96,9.74,0.31,0.38,58.2,106.6,1.84,405,8,806),('W8L806B405P20',0.9977,0.023,8.5,0.4,3.36,5.92,0.6,0.28,32.5,78.5,16.21,405,8,806),('W8L806B405P21',0.9955,0.094,11.4,0.81,2.9,5.89,0.65,0.22,25.6,164,18.01,405,8,806),('W8L806B405P22',1.0044,0.05,8.8,0.74,3.7,6.6,0.44,0.75,42.1,111.7,13.4,405,8,806),('W8L806B405P23',0.9983,0.022,12.2,0.86,2.89,7.89,0.34,1,46.6,239.6,11.06,405,8,806),('W8L806B405P24',0.9996,0.011,12.3,0.47,2.98,8.89,0.32,0.6,21.7,25.1,1.72,405,8,806),('W8L806B405P25',1.0046,0.064,8.2,0.82,3.29,7.33,0.38,0.98,58.5,153.7,1.15,405,8,806),('W8L806B405P26',1.0019,0.058,9.5,0.74,3.2,5.43,0.5,0.38,55.3,189,19.51,405,8,806),('W8L806B405P3',1.0003,0.013,12.1,0.37,3.02,9.73,0.53,0.6,51.6,31.3,9.62,405,8,806),('W8L806B405P4',0.9921,0.081,13.4,0.6,3.67,6.75,0.75,0.47,40.8,83.2,4.72,405,8,806),('W8L806B405P5',0.999,0.039,9.1,0.59,2.99,6.31,0.5,0.77,59.6,125.8,19.32,405,8,806),('W8L806B405P6',0.9946,0.075,8.6,0.77,3.79,6.86,0.46,0.53,65.9,120.4,8.76,405,8,806),('W8L806B405P7',0.9913,0.092,10.7,0.31,3.58,7.04,0.68,0.45,46.9,206,17.77,405,8,806),('W8L806B405P8',0.9964,0.02,9.2,0.42,3.77,5.03,0.8,0.94,41,11.8,2.59,405,8,806),('W8L806B405P9',1.0023,0.038,10.9,0.85,3.03,7.89,0.21,0.74,64.1,70.2,6.41,405,8,806),('W8L806B406P1',0.9912,0.054,8.7,0.88,3.79,8.94,0.74,0.12,40.1,127.8,2.71,406,8,806),('W8L806B406P10',0.9916,0.022,8.2,0.91,3.14,5.01,0.21,0.87,32.6,35.9,15.16,406,8,806),('W8L806B406P11',1.0008,0.091,13.6,0.85,3.14,9.33,0.16,0.38,8,107.9,17.51,406,8,806),('W8L806B406P12',0.9973,0.037,13.6,0.98,2.91,6.83,0.02,0.52,40.9,175.6,13.57,406,8,806),('W8L806B406P13',0.9922,0.026,8.8,0.97,3.57,5.2,0.19,0.72,64.2,231.2,12.78,406,8,806),('W8L806B406P14',1.005,0.098,11.6,0.76,2.89,6.24,0.77,0.44,27.6,51,19.54,406,8,806),('W8L806B406P15',1.0004,0.057,8.6,0.75,3.79,8.25,0.33,0.33,62.3,63.5,11.6,406,8,806),('W8L806B406P16',0.9956,0.061,8.8,0.44,3.18,6.93,0.68,0.2,64.5,233.2,2.21,406,8,806),('W8L806B406P17',0.9944,0.077,12.6,0.77,2.9,9.15,0.28,0.64,10.5,43.9,11.3,406,8,806),('W8L806B406P18',0.9944,0.066,12.4,0.46,3.28,8.59,0.66,0.71,21.8,80.2,1.09,406,8,806),('W8L806B406P19',0.9941,0.026,12.1,0.57,3.09,9.34,0.31,0.63,38.1,145.2,2.43,406,8,806),('W8L806B406P2',0.9968,0.027,10.7,0.94,3.73,6.99,0.65,0.61,14.5,222.5,3.87,406,8,806),('W8L806B406P20',1.0027,0.082,11.3,0.87,2.84,8.52,0.47,0.56,65.7,235.4,11.71,406,8,806),('W8L806B406P21',0.9929,0.078,13.1,0.57,3.56,7.74,0.6,0.46,61.3,228,9.55,406,8,806),('W8L806B406P22',0.9913,0.052,9.4,0.92,3.26,8.97,0.54,0.89,13.4,180.8,9.95,406,8,806),('W8L806B406P23',0.9949,0.088,14,0.69,3.8,8.06,0.24,0.67,24.7,39.4,3.56,406,8,806),('W8L806B406P24',0.994,0.033,9.7,0.61,3.48,9.12,0.61,0.3,30.8,144.6,19.9,406,8,806),('W8L806B406P3',0.9986,0.07,9.6,0.78,3.74,8.75,0.4,0.18,37.2,79.4,6.39,406,8,806),('W8L806B406P4',1.0039,0.099,10.5,0.64,3.43,8.82,0.72,0.28,24.4,43.6,16.16,406,8,806),('W8L806B406P5',0.9957,0.025,11.1,0.87,3.54,5.69,0.77,0.74,5.6,129.4,7.9,406,8,806),('W8L806B406P6',0.9936,0.082,10.7,0.92,3.47,8.36,0.31,0.12,48.4,98.8,15.79,406,8,806),('W8L806B406P7',1.0008,0.054,12.8,0.65,3.69,5.28,0.26,0.54,25,212.6,15.96,406,8,806),('W8L806B406P8',0.998,0.05,9.3,0.98,2.99,5.17,0.49,0.73,69.4,80.7,16.16,406,8,806),('W8L806B406P9',0.9916,0.052,10.5,0.45,3.47,5.49,0.63,0.44,64.2,156,6.94,406,8,806),('W8L806B407P1',0.9964,0.081,13.9,0.85,3.06,6.25,0.69,0.19,14.6,188.9,10.69,407,8,806),('W8L806B407P10',0.9939,0.059,13.7,0.42,3.29,5.39,0.65,0.37,46.2,225.4,5.99,407,8,806),('W8L806B407P11',1.0013,0.085,10,0.47,3,9.98,0.13,0.38,52.8,178.1,16.2,407,8,806),('W8L806B407P12',0.9977,0.08,14,0.87,2.83,7.38,0.42,0.63,28.1,217.6,17.17,407,8,806),('W8L806B407P13',0.998,0.065,10.9,0.89,3.26,8.51,0.49,0.64,61,211.4,15.4,407,8,806),('W8L806B407P14',0.9985,0.019,9.3,0.63,2.86,5.77,0.47,0.59,11.4,74.3,16.42,407,8,806),('W8L806B407P15',0.9907,0.075,12,0.87,3.3,6.94,0.52,0.38,53.9,34.1,8.39,407,8,806),('W8L806B407P16',0.9986,0.023,13.2,0.6,2.8,5.54,0.61,0.77,9.5,136.5,7.99,407,8,806),('W8L806B407P17',0.9944,0.024,12.2,0.91,3.21,6.59,0.8,0.22,46.2,183.2,10.76,407,8,806),('W8L806B407P18',0.998,0.016,10,0.52,2.99,8.64,0.64,0.28,18.9,87.8,17.74,407,8,806),('W8L806B407P19',1.0009,0.085,10.4,0.88,3.32,9.41,0.4,0.39,42,243.2,10.54,407,8,806),('W8L806B407P2',1.0013,0.054,9.8,0.93,2.84,6.87,0.44,0.93,22.1,123.3,8.2,407,8,806),('W8L806B407P20',1.0025,0.028,12.1,0.91,3.71,8.56,0.06,0.48,28.6,103.2,15.83,407,8,806),('W8L806B407P21',0.9958,0.034,10.9,0.47,3.45,6.02,0.63,0.15,62.2,115,16.55,407,8,806),('W8L806B407P22',0.993,0.037,8.9,0.57,3.5,5.65,0.09,0.66,67.2,150,13.57,407,8,806),('W8L806B407P23',0.9906,0.087,13,0.65,3.74,9.45,0.03,0.87,49.1,196.4,2.79,407,8,806),('W8L806B407P24',0.9909,0.02,9.5,0.99,2.85,9.8,0.67,0.67,63.4,114.6,12.64,407,8,806),('W8L806B407P25',1.0017,0.072,13.9,0.65,3.6,9.55,0.13,0.45,29.7,183.3,12.69,407,8,806),('W8L806B407P3',0.9988,0.046,12.6,0.38,2.99,5.56,0.72,0.86,13.7,20.1,9.79,407,8,806),('W8L806B407P4',1.0019,0.019,11.6,0.58,3.17,6.61,0.61,0.56,60.7,206.8,17.85,407,8,806),('W8L806B407P5',0.994,0.067,10.3,0.41,3.01,7.9,0.25,0.14,61.2,16.4,10.45,407,8,806),('W8L806B407P6',1.0022,0.055,14,0.72,3.35,8.58,0.48,0.2,7.2,52.5,9.87,407,8,806),('W8L806B407P7',0.9991,0.059,9.5,0.61,3.72,8.92,0.45,0.2,26.9,212.5,19.69,407,8,806),('W8L806B407P8',1.0001,0.02,10.9,0.53,3.73,8.22,0.1,0.65,50.6,176.4,9.42,407,8,806),('W8L806B407P9',1.0006,0.04,11.4,0.75,3.61,8.3,0.55,0.28,46.5,128,8.91,407,8,806),('W8L806B408P1',1.0028,0.058,10.6,0.46,2.88,5.44,0.22,0.31,54.2,71.7,6.81,408,8,806),('W8L806B408P10',0.9966,0.031,9.8,0.49,3.8,5.32,0.44,0.34,43.8,40.6,3.06,408,8,806),('W8L806B408P11',0.9998,0.08,9.9,0.74,3.48,7.56,0.62,0.9,68.2,163.3,16.14,408,8,806),('W8L806B408P12',0.9992,0.05,13.8,0.66,3.27,8.79,0.51,0.19,29.5,220.2,5.16,408,8,806),('W8L806B408P13',1.0038,0.051,10.1,0.41,3.1,5.87,0.08,0.51,21.5,169.8,15.18,408,8,806),('W8L806B408P14',0.9903,0.096,9.4,0.54,3.31,9.52,0.29,0.43,54.8,217.6,10.23,408,8,806),('W8L806B408P15',0.994,0.025,11.1,0.89,3.64,6.79,0.09,0.4,54.3,135.4,6.71,408,8,806),('W8L806B408P16',1,0.1,11.4,0.75,3.74,6.68,0.47,0.72,31.7,90.4,6.36,408,8,806),('W8L806B408P17',1.0031,0.098,10.2,0.75,3.65,5.09,0.14,0.65,53.6,20.8,3.62,408,8,806),('W8L806B408P18',1.0016,0.084,8.7,0.46,2.95,5.65,0.1,0.11,57.1,139.4,18.87,408,8,806),('W8L806B408P19',0.9946,0.035,10.1,0.78,3.27,8.03,0.32,0.17,31.1,14.9,8.73,408,8,806),('W8L806B408P2',1.0026,0.092,9.5,0.52,2.89,5.85,0,0.42,21.7,219.7,1.18,408,8,806),('W8L806B408P20',1.0031,0.045,8.9,0.61,2.92,9.18,0.38,0.99,34.6,75.4,16.43,408,8,806),('W8L806B408P21',0.9956,0.08,10.2,0.56,3.62,8.59,0.44,0.38,53.2,221.6,6.19,408,8,806),('W8L806B408P22',0.9979,0.053,10.1,0.39,3.12,6.97,0.57,0.24,8.8,206.8,1.32,408,8,806),('W8L806B408P23',0.9938,0.061,11.8,0.87,3.22,8.24,0.19,0.23,6,125.9,4.3,408,8,806),('W8L806B408P24',1.0012,0.075,8.2,0.65,3.72,6.4,0.52,0.53,37.2,47.9,14.88,408,8,806),('W8L806B408P25',0.9961,0.061,8,0.44,3.74,6.04,0.62,0.37,10.3,166.7,6.38,408,8,806),('W8L806B408P26',1.0037,0.057,11.6,0.61,3.53,7.66,0.54,0.8,53,53,18.13,408,8,806),('W8L806B408P27',1.0013,0.075,12.1,0.34,3.22,9.15,0.07,0.83,12.2,196.3,7.54,408,8,806),('W8L806B408P3',1.0008,0.059,12,0.76,3.23,7.16,0.5,0.46,56.1,144.9,15.99,408,8,806),('W8L806B408P4',0.9925,0.055,8.2,0.44,3.67,9.34,0.35,0.23,68,66.5,2.9,408,8,806),('W8L806B408P5',1.0041,0.078,12.9,0.99,3.34,9.26,0.3,0.84,63.4,84.8,6.66,408,8,806),('W8L806B408P6',0.9958,0.045,10.4,0.98,3.42,9.86,0.46,0.52,58.3,172,13.74,408,8,806),('W8L806B408P7',0.9923,0.034,9.6,0.99,3.68,5.19,0.38,0.25,54.8,124,15.4,408,8,806),('W8L806B408P8',1.0038,0.031,13.4,0.83,2.85,9.34,0.4,0.84,67.2,171.7,16.11,408,8,806),('W8L806B408P9',0.9999,0.026,12.7,0.37,3.67,6.18,0.13,0.24,17.9,83.4,5.17,408,8,806),('W8L806B409P1',1.0048,0.028,11.8,0.41,3.72,7.45,0.47,0.41,41.3,248.5,15.42,409,8,806),('W8L806B409P10',1.0046,0.091,12.9,0.6,2.84,8.42,0.05,0.4,33.2,239.4,0.73,409,8,806),('W8L806B409P11',1.0027,0.038,8.8,0.67,3.34,9.96,0.17,0.95,8.4,143.5,12.53,409,8,806),('W8L806B409P12',0.9943,0.083,8.5,0.85,3.27,6.61,0.38,0.18,6.9,23.9,4.34,409,8,806),('W8L806B409P13',0.9916,0.058,12.6,0.8,3.58,8.56,0.76,0.45,65.5,151.2,2.93,409,8,806),('W8L806B409P14',0.9934,0.078,8.5,0.7,3.22,9.28,0.33,0.75,63.4,142.1,0.94,409,8,806),('W8L806B409P15',0.9941,0.095,12.2,0.33,3.07,9.58,0.28,0.57,34.2,152.2,4.51,409,8,806),('W8L806B409P16',1.0016,0.048,8.5,0.64,3.65,5.98,0.43,0.21,50.4,142.7,18.62,409,8,806),('W8L806B409P17',0.99,0.034,8.5,0.82,3.12,5.54,0.23,0.23,33,122.7,0.91,409,8,806),('W8L806B409P18',0.9999,0.011,10.2,0.6,3.68,6.04,0.26,0.73,18.1,158.9,14.69,409,8,806),('W8L806B409P19',0.9901,0.051,13.4,0.6,2.82,6.87,0.06,0.41,25.6,86.1,10.15,409,8,806),('W8L806B409P2',1.0046,0.057,12.7,0.76,3.59,6.69,0.1,0.46,34.6,180.5,1.44,409,8,806),('W8L806B409P20',1.0018,0.039,9.4,0.41,2.83,6.58,0.33,0.5,54.2,74.5,15.13,409,8,806),('W8L806B409P21',0.9952,0.098,9.2,0.93,3.33,9.78,0.56,0.7,22.9,101.7,19.23,409,8,806),('W8L806B409P22',0.9928,0.064,8.8,0.44,3.05,8.56,0.01,0.78,28,168,7.26,409,8,806),('W8L806B409P23',0.9913,0.038,11.1,0.4,3.67,8.68,0.59,0.26,19.3,38.3,3.87,409,8,806),('W8L806B409P24',0.9908,0.014,8.5,0.97,3.26,5.17,0.27,0.12,44.3,169.1,10.54,409,8,806),('W8L806B409P25',0.9968,0.021,13.7,0.49,3.74,8.13,0.08,0.42,39.9,174.1,3.25,409,8,806),('W8L806B409P26',1.003,0.048,11.2,0.77,2.82,8.77,0.23,0.91,17.4,142.6,9.87,409,8,806),('W8L806B409P27',1.003,0.099,9.7,0.62,3.65,7.75,0.68,0.43,69.8,25,10.6,409,8,806),('W8L806B409P28',0.996,0.025,8.7,0.92,3.29,6.52,0.3,0.19,46.4,208.1,9.44,409,8,806),('W8L806B409P29',0.9924,0.094,13,0.45,3.44,6.79,0.36,0.66,49.3,236.8,3.43,409,8,806),('W8L806B409P3',0.9968,0.067,12.3,0.93,3.3,9.48,0.77,0.25,42.4,90.9,17.67,409,8,806),('W8L806B409P30',0.9903,0.049,10.1,0.64,2.92,9.09,0.62,0.17,63.7,235.6,15.99,409,8,806),('W8L806B409P31',1.0014,0.043,8.5,0.44,2.98,6.08,0.28,0.56,24.7,152.4,2.87,409,8,806),('W8L806B409P32',0.9928,0.079,9.6,0.54,3.74,9.56,0.69,0.94,67.1,158.1,16.32,409,8,806),('W8L806B409P33',1.0043,0.068,12.5,0.87,3.1,8.73,0.48,0.15,61.8,182.1,8.87,409,8,806),('W8L806B409P34',0.9944,0.014,8.8,0.42,3.2,9.65,0.65,0.74,36.8,60,1.88,409,8,806),('W8L806B409P35',1.0033,0.053,11.5,0.35,3.35,9.04,0.09,0.72,45.3,227.6,4.11,409,8,806),('W8L806B409P4',1.0044,0.041,8.3,0.66,3.21,7.04,0.76,0.59,34.5,228.5,6.93,409,8,806),('W8L806B409P5',1.0001,0.023,13.4,0.65,3.79,7.5,0.73,0.8,57.4,32.7,2.64,409,8,806),('W8L806B409P6',1.0007,0.042,12.4,0.54,3.65,8.57,0.78,0.26,23.7,201,0.66,409,8,806),('W8L806B409P7',0.9977,0.099,9.5,0.46,3.71,8.6,0.44,0.76,35.1,114.8,19.8,409,8,806),('W8L806B409P8',1.002,0.055,12.4,0.53,3.36,6.78,0.46,0.82,47.6,156.6,5.89,409,8,806),('W8L806B409P9',1.0026,0.011,8.6,0.82,3.39,6.36,0.15,0.56,68.8,43.4,5.79,409,8,806),('W8L806B410P1',1.0046,0.067,11.3,0.61,3.61,6.21,0.45,0.35,50.3,30.1,12.17,410,8,806),('W8L806B410P10',1.0001,0.018,10.2,0.73,2.93,5.52,0.15,0.75,50.6,180.7,17.07,410,8,806),('W8L806B410P11',0.9953,0.052,9.1,0.35,3.56,6.52,0.2,0.77,38.7,113.9,12.19,410,8,806),('W8L806B410P12',0.9924,0.061,12.3,0.35,3.05,9.6,0.64,0.63,58.9,98.2,18.48,410,8,806),('W8L806B410P13',1.0036,0.013,8.2,0.83,2.81,6.17,0.61,0.17,34.4,87.9,1.34,410,8,806),('W8L806B410P14',0.9995,0.074,12.7,0.69,3.15,9.2,0.71,0.61,5.9,154.8,15.25,410,8,806),('W8L806B410P15',0.9987,0.087,10.4,0.78,3.05,6.33,0.04,0.31,26.7,170.1,7.25,410,8,806),('W8L806B410P16',0.9981,0.09,10.3,0.83,3.4,7.26,0.42,0.46,42.9,42.9,8.68,410,8,806),('W8L806B410P17',1.0007,0.078,13.7,0.89,3.74,5.58,0.32,0.18,20.4,80.8,16.59,410,8,806),('W8L806B410P18',1.0013,0.018,9.1,0.67,3.8,8.12,0.69,0.68,33.8,137.5,4.06,410,8,806),('W8L806B410P19',0.9913,0.079,12.1,0.42,3.58,6.09,0.33,0.88,11.9,137.8,14.08,410,8,806),('W8L806B410P2',1.0018,0.032,10.8,0.32,3.67,8.83,0.44,0.45,48.8,154.1,8.34,410,8,806),('W8L806B410P20',1.0014,0.099,10.8,0.8,3.02,8.23,0.62,0.45,41.3,116.3,15.09,410,8,806),('W8L806B410P21',0.9989,0.03,10.3,0.79,3.62,5.48,0.33,0.85,52.2,58.3,10.08,410,8,806),('W8L806B410P22',0.9978,0.044,10.1,0.85,2.95,8.11,0.79,0.38,60.7,83.1,14.91,410,8,806),('W8L806B410P23',0.992,0.081,10.5,0.94,3.35,9.87,0.73,0.25,14.1,247.1,9.51,410,8,806),('W8L806B410P24',0.9972,0.097,10.9,0.78,3.12,8.72,0.27,0.74,69.4,84.3,7.36,410,8,806),('W8L806B410P25',0.9978,0.02,9,0.42,3.39,5.83,0.45,0.92,25.6,222.1,5.06,410,8,806),('W8L806B410P26',0.9975,0.071,10.1,0.78,3.4,7.69,0.05,0.37,61.8,187.4,17.58,410,8,806),('W8L806B410P27',1.0029,0.068,10.6,0.56,3.75,6.48,0.48,0.73,12.4,100.6,13.38,410,8,806),('W8L806B410P3',0.9938,0.082,10.4,0.36,3.22,6.8,0.03,0.95,15.4,26.2,17.36,410,8,806),('W8L806B410P4',0.9928,0.059,10.7,0.31,3.06,8.56,0.04,0.11,29.8,42.6,2.74,410,8,806),('W8L806B410P5',0.9961,0.051,8.3,0.46,3.21,7.29,0.34,0.72,52.2,216.6,3.27,410,8,806),('W8L806B410P6',1.0028,0.083,11.8,0.72,3.5,5.37,0.26,0.77,25.4,53.5,18.43,410,8,806),('W8L806B410P7',1.0014,0.061,8.1,0.7,3.76,5.74,0.31,0.59,35.9,143.2,17.23,410,8,806),('W8L806B410P8',1.0004,0.076,10,0.8,3.57,6.67,0.17,0.59,67.1,170.8,19.01,410,8,806),('W8L806B410P9',0.9909,0.087,8.4,0.95,3.63,6.62,0.4,0.31,68.2,200,1.37,410,8,806),('W8L806B411P1',1.0009,0.021,12.7,0.79,3.42,5.57,0.67,0.46,22.4,218.1,2.35,411,8,806),('W8L806B411P10',1.0012,0.054,12.8,0.7,3.68,9.7,0.3,0.26,36.3,133.2,19.96,411,8,806),('W8L806B411P11',0.9974,0.035,12.5,0.39,3.22,6.41,0.45,0.66,18.5,195.8,3.55,411,8,806),('W8L806B411P12',1.0044,0.055,13.7,0.93,2.91,5.57,0.44,0.5,32.9,178.1,6.09,411,8,806),('W8L806B411P13',0.9958,0.066,12.3,0.9,3.09,5.25,0.47,0.31,68.1,210.3,7.44,411,8,806),('W8L806B411P14',0.9995,0.079,13.2,0.48,3.75,5.92,0.03,0.21,67.1,111.6,14.38,411,8,806),('W8L806B411P15',0.993,0.021,10.6,0.81,2.87,7.24,0.17,0.72,25.8,48,11.95,411,8,806),('W8L806B411P16',1.0021,0.047,13.1,0.64,2.83,9.35,0.28,0.26,30.6,100.2,9.34,411,8,806),('W8L806B411P17',1.0034,0.09,13.7,0.86,3.7,8.7,0.7,0.71,14.8,211.2,2.09,411,8,806),('W8L806B411P18',0.9994,0.091,9.2,0.46,3.32,6.43,0.38,0.94,29.8,64.8,12.12,411,8,806),('W8L806B411P19',1.0048,0.065,11.1,0.9,3.73,7.14,0.77,0.17,56.6,135.4,15.11,411,8,806),('W8L806B411P2',1.0014,0.081,12.3,0.9,3.37,8.65,0.28,0.34,43.8,14.3,14.93,411,8,806),('W8L806B411P20',1.0028,0.016,11.8,0.41,3.12,8.85,0.09,0.56,29.1,178.5,11.41,411,8,806),('W8L806B411P21',0.9934,0.076,11.2,0.61,3.66,9.46,0.61,0.35,69.9,11.5,8.27,411,8,806),('W8L806B411P22',0.9985,0.093,9.2,0.87,3.19,7.26,0.8,0.11,35.4,182.8,8.4,411,8,806),('W8L806B411P23',0.9999,0.016,11.8,0.7,3.58,6.01,0.51,0.82,47.4,19.5,7.03,411,8,806),('W8L806B411P3',0.9985,0.062,13.6,0.46,2.88,9.12,0.57,0.4,8.8,236.5,2.83,411,8,806),('W8L806B411P4',0.9954,0.013,9,0.77,2.83,8.46,0.46,0.17,32.4,55.2,0.91,411,8,806),('W8L806B411P5',0.9946,0.077,13.2,0.72,3.62,6.52,0.51,0.47,35,213.1,9.68,411,8,806),('W8L806B411P6',1.0036,0.096,9.5,0.99,3.37,8.34,0.74,0.55,59.3,189.8,19.66,411,8,806),('W8L806B411P7',0.9945,0.052,9.7,0.9,3.73,9.24,0.67,0.67,18.2,156.7,6.25,411,8,806),('W8L806B411P8',0.9989,0.024,14,0.42,3.09,7.83,0.71,0.66,29.3,183.5,7.5,411,8,806),('W8L806B411P9',1.0029,0.091,11.9,0.94,3.12,9.82,0.21,0.49,7.5,206.2,10.54,411,8,806),('W8L806B412P1',0.9991,0.055,10.3,0.8,2.94,6.21,0.54,0.33,36.5,216.7,18.13,412,8,806),('W8L806B412P10',1.0039,0.075,8.9,0.91,3.38,6.98,0.73,0.48,32.8,246.3,15.12,412,8,806),('W8L806B412P11',0.9977,0.07,8.5,0.57,3.26,7.82,0.46,0.67,56.6,239.6,19.86,412,8,806),('W8L806B412P12',1.0012,0.024,9.7,0.35,3.5,8.86,0.44,0.28,23.5,244.2,17.26,412,8,806),('W8L806B412P13',0.9948,0.093,9.8,0.77,3.14,8.77,0.7,0.48,53.6,141.3,18.51,412,8,806),('W8L806B412P14',1.0044,0.018,8.4,0.82,3.21,9.08,0.69,0.92,24.9,214.3,15.97,412,8,806),('W8L806B412P15',1.0009,0.075,11.6,0.75,2.91,7,0.72,0.93,13,26,5.83,412,8,806),('W8L806B412P16',1.0046,0.03,12.2,0.3,2.81,8.16,0.08,0.1,41.6,189,12.41,412,8,806),('W8L806B412P17',0.9966,0.041,12.7,0.52,2.81,7.96,0.4,0.49,46.8,80.7,6.72,412,8,806),('W8L806B412P18',0.9942,0.036,10.1,0.58,3.42,7.65,0.16,0.46,45.5,73.5,15.88,412,8,806),('W8L806B412P19',0.9987,0.064,11.2,0.93,3.66,6.74,0.62,0.92,62.2,92.9,16.03,412,8,806),('W8L806B412P2',1.0036,0.089,11.8,0.76,3.02,5.11,0.72,0.77,11.4,44.3,12.91,412,8,806),('W8L806B412P20',1.0048,0.051,13.9,0.9,3.41,9.24,0.78,0.45,40.9,48.4,1.18,412,8,806),('W8L806B412P21',1.0033,0.029,13,0.88,2.9,7.54,0.77,0.9,62.8,86.1,12.36,412,8,806),('W8L806B412P22',0.9907,0.049,11.6,0.52,3.39,6.95,0.25,0.81,61.4,222.1,15.91,412,8,806),('W8L806B412P23',1.0025,0.081,12.5,0.53,3.68,6.63,0.79,0.7,26.9,138.6,10.61,412,8,806),('W8L806B412P24',1.002,0.048,13.9,0.47,2.87,7.61,0.79,0.75,51.9,218.2,2.34,412,8,806),('W8L806B412P25',0.9957,0.073,10.1,0.66,3.66,6.04,0.61,0.89,29.1,247.9,13.67,412,8,806),('W8L806B412P3',0.9996,0.013,10.4,0.71,3.15,7.88,0.09,0.15,57.4,242.5,7.32,412,8,806),('W8L806B412P4',1.0041,0.04,8.5,0.7,3.77,9.8,0.77,0.99,38.1,135.3,4.55,412,8,806),('W8L806B412P5',0.998,0.049,13.4,0.68,2.85,8.08,0.02,0.75,29.1,170.3,9.74,412,8,806),('W8L806B412P6',0.9923,0.067,12,0.7,3.37,9.15,0.67,0.23,13.2,157,8.22,412,8,806),('W8L806B412P7',0.9976,0.082,11.7,0.48,3.7,6.27,0.35,0.26,26.6,196.3,16.25,412,8,806),('W8L806B412P8',1.0004,0.039,12.6,0.98,3.61,9.74,0.13,0.45,68.1,161.1,1.07,412,8,806),('W8L806B412P9',0.9932,0.087,10,0.56,3.06,5.97,0.31,0.86,47.7,76.6,19.96,412,8,806),('W8L806B413P1',1.001,0.054,8.9,0.43,3.13,5.94,0.21,0.74,64.8,105,17.12,413,8,806),('W8L806B413P10',0.9913,0.034,10.1,0.88,2.9,7.72,0.64,0.1,36.3,135.6,18.85,413,8,806),('W8L806B413P11',0.9969,0.055,10,0.38,3.11,5.99,0.22,0.12,60.1,188.3,1.61,413,8,806),('W8L806B413P12',1.0016,0.052,8.8,0.97,3.15,6.38,0.28,0.8,57.5,156.3,13.5,413,8,806),('W8L806B413P13',0.9927,0.059,9.9,0.9,3.26,5.79,0.12,0.91,30,164.6,2.36,413,8,806),('W8L806B413P14',0.9932,0.05,13.9,0.54,3.28,5.02,0.44,0.81,28.1,226.5,1.16,413,8,806),('W8L806B413P15',1.0007,0.086,8.8,0.31,3.34,8.51,0.46,0.33,12.4,204.3,14.46,413,8,806),('W8L806B413P16',1.0036,0.022,13.4,0.67,3,9.47,0.6,0.8,10.6,74.6,8.62,413,8,806),('W8L806B413P17',0.9939,0.091,9.1,0.58,2.86,8.78,0.77,0.41,34,69.4,5.97,413,8,806),('W8L806B413P18',0.9981,0.015,10,0.68,3.39,5.22,0.27,0.67,58.7,140.4,15.54,413,8,806),('W8L806B413P19',1.0008,0.079,9.3,0.86,3.21,8.83,0.15,0.46,57.4,94.3,6.75,413,8,806),('W8L806B413P2',0.9953,0.034,13,0.55,3.02,6.35,0.45,0.58,60.3,161.1,1.53,413,8,806),('W8L806B413P20',0.9941,0.094,13.3,0.67,3.69,5,0.27,0.93,23.8,28,4.2,413,8,806),('W8L806B413P21',1.0048,0.099,10.9,0.65,3.55,7.06,0.7,0.33,30.4,137.2,14.83,413,8,806),('W8L806B413P22',0.9912,0.013,9.6,0.7,3.67,9.34,0.42,0.74,44.4,56.8,3.58,413,8,806),('W8L806B413P23',0.9981,0.022,13.2,0.88,2.86,5.8,0.21,0.16,47.1,121.7,4.93,413,8,806),('W8L806B413P24',0.9919,0.054,9.2,0.78,3.04,5.45,0.55,0.37,46.9,48.4,1.33,413,8,806),('W8L806B413P3',1.0012,0.088,12.7,0.35,2.83,6.49,0.76,0.73,66.6,32,6.93,413,8,806),('W8L806B413P4',0.9979,0.067,13.2,0.62,2.83,8.03,0.23,0.32,31,46,11,413,8,806),('W8L806B413P5',0.9937,0.053,12.4,0.74,3.46,9.61,0.04,0.17,16.7,203.6,16.89,413,8,806),('W8L806B413P6',0.9906,0.055,12.4,0.9,3.57,6.58,0.07,0.88,47.9,101,10.11,413,8,806),('W8L806B413P7',1.0013,0.089,8.4,0.63,3.74,9.88,0.23,0.15,13.2,143.8,8.36,413,8,806),('W8L806B413P8',0.9916,0.012,10.8,0.55,3.53,5.68,0.69,0.77,60.2,156,18.83,413,8,806),('W8L806B413P9',0.9961,0.074,8.6,0.51,3.45,9.47,0.36,0.25,19.7,232.6,10.3,413,8,806),('W8L806B414P1',1.0014,0.047,8.2,0.57,3.51,5.85,0.78,0.49,58.2,176.5,3.27,414,8,806),('W8L806B414P10',0.9916,0.088,12,0.62,3.21,8.33,0.26,0.2,16.5,111.5,5.66,414,8,806),('W8L806B414P11',0.9985,0.014,13.7,0.74,2.98,8.09,0.08,0.3,26.8,136.2,7.92,414,8,806),('W8L806B414P12',0.9969,0.036,10.1,0.42,2.88,9.48,0.73,0.87,21,71.2,4.23,414,8,806),('W8L806B414P13',0.9922,0.017,9.8,0.71,2.94,7.99,0.39,0.42,45.3,116.7,3.35,414,8,806),('W8L806B414P14',1.0002,0.069,10.4,0.89,3.68,7.9,0.66,0.21,16.7,206.8,5.05,414,8,806),('W8L806B414P15',0.9939,0.057,9.3,0.43,3.67,7.42,0.48,0.45,41.4,203.9,4.97,414,8,806),('W8L806B414P16',0.994,0.022,8.5,0.57,3.23,8.5,0.61,0.17,37.8,203.6,3.27,414,8,806),('W8L806B414P17',1.0012,0.099,13,0.45,3.23,7.78,0.28,0.96,61.3,224.9,6.57,414,8,806),('W8L806B414P18',0.9945,0.016,12.6,0.52,3.2,9.29,0.27,0.24,41.3,238.2,9.4,414,8,806),('W8L806B414P19',1.0029,0.022,8.9,0.75,2.93,8,0.05,0.11,17.7,221.6,8.55,414,8,806),('W8L806B414P2',0.992,0.071,12.5,0.44,2.92,7.53,0.05,0.96,14.6,87.5,12.51,414,8,806),('W8L806B414P20',0.994,0.03,12.9,0.9,3.49,5.46,0.62,0.16,65.1,242.6,7.74,414,8,806),('W8L806B414P21',0.9976,0.031,11.1,0.64,2.83,5.66,0.27,0.37,22.6,100.6,10.06,414,8,806),('W8L806B414P3',0.9986,0.03,8.2,0.4,3.51,9.19,0.41,0.72,43.5,229.7,13.7,414,8,806),('W8L806B414P4',0.9917,0.099,12.4,0.58,3.56,7.7,0.76,0.26,33.3,105.4,6.97,414,8,806),('W8L806B414P5',0.9942,0.092,9.5,0.92,3.04,8.21,0.04,0.38,24.7,98.6,14.9,414,8,806),('W8L806B414P6',0.9938,0.09,9.6,0.85,3.8,6.83,0.15,0.93,15,112.4,6.12,414,8,806),('W8L806B414P7',0.9924,0.036,13,0.36,3.4,5.45,0.48,0.62,50.4,47,15.61,414,8,806),('W8L806B414P8',0.9983,0.062,8,0.71,3.13,5.53,0.48,0.41,35.2,165.6,3.6,414,8,806),('W8L806B414P9',0.999,0.042,10.7,0.63,3.09,9.63,0.58,0.42,8.8,152,13.87,414,8,806),('W8L806B415P1',0.998,0.033,11.3,0.8,3.69,6.53,0.19,0.39,38.6,44.4,18.9,415,8,806),('W8L806B415P10',0.994,0.052,11,0.59,2.84,5.99,0.23,0.55,44.7,38.4,13.74,415,8,806),('W8L806B415P11',1.0021,0.096,9.1,0.59,3.8,8.32,0.02,0.91,66.2,41.5,2.6,415,8,806),('W8L806B415P12',0.9983,0.058,12.2,0.99,3.03,6.8,0.47,0.68,22.3,164.7,14.8,415,8,806),('W8L806B415P13',0.9973,0.02,10.3,0.78,3.66,5.44,0.53,0.68,35.7,53.5,2.11,415,8,806),('W8L806B415P14',0.9998,0.049,11.7,0.6,3.17,6.31,0.04,0.85,34.6,190.3,5.46,415,8,806),('W8L806B415P15',0.9963,0.062,10.2,0.4,3.47,6.1,0.13,0.9,52.4,164.9,10.25,415,8,806),('W8L806B415P16',1.0031,0.054,10.4,0.82,3.58,7.79,0.72,0.31,12.2,115.3,17.97,415,8,806),('W8L806B415P17',0.9957,0.068,12.9,0.82,2.8,6.53,0.56,0.75,5.7,89,9.14,415,8,806),('W8L806B415P18',0.9939,0.078,8.3,0.64,3.69,7.04,0.77,0.49,8.6,78.6,9.77,415,8,806),('W8L806B415P19',1.0003,0.02,9.6,0.87,3.38,9.62,0.22,0.49,28.3,214,14.4,415,8,806),('W8L806B415P2',0.9908,0.032,10.6,0.96,2.81,7.07,0.29,1,33.4,154.7,15.71,415,8,806),('W8L806B415P20',0.99,0.069,12.9,0.81,3.02,5.92,0.43,0.81,48.8,115.5,8.25,415,8,806),('W8L806B415P21',0.9942,0.097,9.7,0.52,2.86,9.92,0.2,0.17,38.4,142.2,8.72,415,8,806),('W8L806B415P22',0.9919,0.055,11.3,0.61,3.01,7.62,0.48,0.96,49.1,60.7,1.03,415,8,806),('W8L806B415P23',0.9976,0.074,9.5,0.99,3.43,6.15,0.21,0.21,22,23.4,1.02,415,8,806),('W8L806B415P24',1.003,0.077,13,0.31,3.34,5.69,0.51,0.83,45.4,74.8,8.07,415,8,806),('W8L806B415P25',1.0027,0.096,12.9,0.74,3.04,6.62,0.58,0.87,57.6,208.7,5.86,415,8,806),('W8L806B415P26',0.9927,0.093,12.1,0.99,3.3,5.63,0.32,0.68,35,137.9,0.82,415,8,806),('W8L806B415P27',0.9948,0.014,9.9,0.73,2.91,6.11,0.21,0.84,26.6,155.6,3.79,415,8,806),('W8L806B415P3',1.0005,0.041,10.4,0.3,3.17,9.45,0.24,0.19,10.3,58.9,18.46,415,8,806),('W8L806B415P4',0.9923,0.035,11.7,0.79,3.21,6.33,0.14,0.57,59.5,33.8,16.73,415,8,806),('W8L806B415P5',0.9919,0.015,11.8,0.59,2.8,6.13,0.62,0.21,8.5,65.4,2.29,415,8,806),('W8L806B415P6',0.9999,0.068,11.1,0.66,3.42,5.65,0.2,0.64,61.9,242.2,15.26,415,8,806),('W8L806B415P7',0.9976,0.036,13.6,0.7,2.89,6.22,0.17,0.86,22.2,244.7,5.29,415,8,806),('W8L806B415P8',0.997,0.016,11.1,0.46,3.76,9.75,0.37,0.32,60.2,63.9,17.49,415,8,806),('W8L806B415P9',1.0028,0.011,8.7,0.51,2.93,5.87,0.2,0.64,28.7,102.1,15.17,415,8,806),('W8L806B416P1',1.0013,0.069,13.2,0.83,3.12,6.48,0.47,0.48,68.8,89.8,18.14,416,8,806),('W8L806B416P10',1.003,0.048,12,0.88,3.01,5.28,0.25,0.71,49.3,104.7,3.79,416,8,806),('W8L806B416P11',0.9995,0.065,12.2,0.71,3.34,9.95,0.6,0.91,50.2,154,8.67,416,8,806),('W8L806B416P12',0.9992,0.01,11.8,0.74,3.58,6.52,0.1,0.72,42.1,230.2,17.38,416,8,806),('W8L806B416P13',0.9905,0.077,12.7,0.86,3.71,7.54,0.67,0.43,6.7,80.3,3.99,416,8,806),('W8L806B416P14',1.0016,0.024,13.7,0.44,2.8,7.32,0.56,0.26,12.1,193.9,11.72,416,8,806),('W8L806B416P15',0.9932,0.073,12.9,0.66,2.97,7.13,0.57,0.35,43.1,211.4,8.3,416,8,806),('W8L806B416P16',0.9912,0.068,12.8,0.76,3.29,8.42,0.33,0.64,48.9,48.6,19.02,416,8,806),('W8L806B416P17',1.0002,0.023,11.9,0.73,3.31,9.08,0.53,0.38,55.6,153.4,6.93,416,8,806),('W8L806B416P18',1.0038,0.087,8.4,0.48,3.09,5.19,0.33,0.48,14.4,132,7.85,416,8,806),('W8L806B416P19',0.996,0.012,11.8,1,3.49,5.48,0.73,0.25,47.2,117.6,2.07,416,8,806),('W8L806B416P2',1.0023,0.047,9.9,0.64,3.62,6.33,0.74,0.75,21.5,84.6,1.17,416,8,806),('W8L806B416P20',0.9927,0.02,10.5,0.83,2.87,5.8,0.33,0.67,23.5,18.2,1.59,416,8,806),('W8L806B416P21',0.9902,0.045,8.9,0.89,3.5,5.12,0.24,0.49,29.2,55.6,11.9,416,8,806),('W8L806B416P3',0.9908,0.045,10.4,0.32,2.87,8.67,0.64,0.86,55.5,211.6,15.25,416,8,806),('W8L806B416P4',0.9908,0.021,11.9,0.75,3.21,7.11,0.01,0.61,44.9,237.6,4.72,416,8,806),('W8L806B416P5',0.9909,0.086,9,0.99,2.83,7.42,0.07,0.25,35.8,83.5,0.69,416,8,806),('W8L806B416P6',0.9992,0.027,14,0.94,3.02,5.83,0.64,0.27,54.3,146.8,0.61,416,8,806),('W8L806B416P7',1.0041,0.07,12.9,0.4,3.73,9.93,0.44,0.74,28.7,213.8,17.24,416,8,806),('W8L806B416P8',1.0012,0.069,8.7,0.42,2.84,9.74,0.05,0.63,31.9,139.8,11.1,416,8,806),('W8L806B416P9',0.9987,0.073,10.6,0.31,3.54,7.94,0.41,0.52,40,201.6,16.9,416,8,806);
+INSERT INTO `product` VALUES ('W8L801B576P1',0.9936,0.078,10.8,0.79,3.2,7.25,0.41,0.33,55.8,160.5,9.17,576,8,801,NULL),('W8L801B576P10',0.9925,0.02,9.8,0.75,3.53,8.2,0.3,0.89,42.2,66.2,15.31,576,8,801,NULL),('W8L801B576P11',0.9972,0.045,10,0.9,2.86,9.08,0.72,0.15,19.1,61.5,19.9,576,8,801,NULL),('W8L801B576P12',0.997,0.064,12.1,0.87,2.83,6.21,0.19,0.75,49.9,20.2,19.32,576,8,801,NULL),('W8L801B576P13',0.9918,0.091,8.7,0.69,3.13,6.65,0.65,0.35,59.4,205.8,14.03,576,8,801,NULL),('W8L801B576P14',1.0031,0.031,12.6,0.89,3.67,7.86,0.11,0.78,7.7,178.1,14.83,576,8,801,NULL),('W8L801B576P15',1.0049,0.095,8.6,0.84,3.49,6.4,0.27,0.9,8.4,164.4,2.67,576,8,801,NULL),('W8L801B576P16',0.9905,0.09,12.7,0.4,3.47,5.86,0.36,0.67,21.8,92.9,6.79,576,8,801,NULL),('W8L801B576P17',1.0007,0.021,13.6,0.67,3.77,5.85,0.68,0.52,16.2,115.5,13.19,576,8,801,NULL),('W8L801B576P18',1,0.014,10.7,0.77,3.16,5.29,0.46,0.29,18.6,91.1,7.66,576,8,801,NULL),('W8L801B576P19',0.992,0.057,11.9,0.89,3.2,6.11,0.21,0.55,21.3,200.2,17.12,576,8,801,NULL),('W8L801B576P2',1.0017,0.046,11.9,0.43,2.92,5.62,0.03,0.4,33.7,202.2,17.68,576,8,801,NULL),('W8L801B576P20',1.0001,0.1,10.7,0.58,3.51,7.89,0.31,0.23,45,52.6,17.48,576,8,801,NULL),('W8L801B576P21',0.9935,0.051,12.1,0.47,2.95,5.93,0.25,0.95,64.3,221.1,3.21,576,8,801,NULL),('W8L801B576P22',0.9956,0.03,9.2,0.91,3.01,5.77,0.34,0.41,26.9,217.2,16.2,576,8,801,NULL),('W8L801B576P23',0.9999,0.083,11.6,0.77,3.12,8.15,0.3,0.27,45.9,167.6,5.88,576,8,801,NULL),('W8L801B576P24',1.0022,0.026,9.8,0.61,3.25,5.67,0.24,0.96,32.7,193.7,6.76,576,8,801,NULL),('W8L801B576P25',0.9959,0.069,12.1,0.65,3.3,9.2,0.14,0.18,34.5,206.2,17.12,576,8,801,NULL),('W8L801B576P26',1.001,0.085,11.3,0.51,3.38,9.84,0.05,0.25,14.2,122.5,5.62,576,8,801,NULL),('W8L801B576P27',0.9925,0.078,9.9,0.37,3.79,8.81,0.22,0.97,44.3,103.3,13.55,576,8,801,NULL),('W8L801B576P3',0.9965,0.046,10.9,0.57,3.13,9.2,0.76,0.49,34.8,89.9,0.79,576,8,801,NULL),('W8L801B576P4',0.994,0.016,9.4,0.89,3.73,6.24,0.26,0.51,58.1,59.7,17.89,576,8,801,NULL),('W8L801B576P5',0.9956,0.056,10.3,0.99,3.62,6.42,0.56,0.43,57.6,92.7,18.67,576,8,801,NULL),('W8L801B576P6',0.995,0.049,11.6,0.93,3.41,8.74,0.17,0.65,15,237,7.59,576,8,801,NULL),('W8L801B576P7',0.9962,0.086,14,0.3,2.94,9.8,0.5,0.98,50.6,214,16.71,576,8,801,NULL),('W8L801B576P8',1.0022,0.088,8.3,0.8,3.1,7.67,0.66,0.37,9.5,171.5,16.2,576,8,801,NULL),('W8L801B576P9',0.994,0.079,13.1,0.69,3.08,9.51,0.34,0.92,16.1,194.5,13.37,576,8,801,NULL),('W8L801B577P1',1.0026,0.032,11.1,1,3.01,5.86,0.73,0.49,21.2,22.7,11.68,577,8,801,NULL),('W8L801B577P10',0.9906,0.098,8.1,0.92,3.31,9.61,0.6,0.85,55,45.1,11.69,577,8,801,NULL),('W8L801B577P11',1.003,0.075,11.4,0.97,3.66,9.29,0.55,0.16,21.2,75,5.03,577,8,801,NULL),('W8L801B577P12',1.0037,0.026,8.5,0.92,3.73,8.65,0.14,0.68,31.4,153.3,5.89,577,8,801,NULL),('W8L801B577P13',1.0012,0.066,11,0.72,3.71,8.47,0.3,0.61,26.6,104.4,12.93,577,8,801,NULL),('W8L801B577P14',1.0041,0.06,12.5,0.63,3.79,6.39,0.04,0.3,16.3,159.7,3.55,577,8,801,NULL),('W8L801B577P15',0.992,0.013,9.3,0.75,3.2,9.22,0.38,0.12,31.4,16.1,18.68,577,8,801,NULL),('W8L801B577P16',1.0013,0.065,11.2,0.64,2.95,7.07,0.43,0.38,28.6,220.4,14.47,577,8,801,NULL),('W8L801B577P17',0.9956,0.016,13.5,0.65,3.17,9.54,0.05,0.98,14,96.4,16.54,577,8,801,NULL),('W8L801B577P18',0.9938,0.082,11.8,0.34,2.92,8.96,0.33,0.38,48.3,31.8,2.68,577,8,801,NULL),('W8L801B577P19',1.0012,0.093,10.4,0.37,3.66,9.91,0.47,0.24,28.8,84.2,3.16,577,8,801,NULL),('W8L801B577P2',1.0028,0.082,8.3,0.46,3.59,7.02,0.29,0.96,27.8,222.6,1.68,577,8,801,NULL),('W8L801B577P20',1.0014,0.038,10.8,0.36,3.07,9.95,0.04,0.54,63.8,237.4,16.7,577,8,801,NULL),('W8L801B577P3',0.9939,0.016,9.2,0.94,3.55,7.83,0.31,0.13,35.2,57.7,13.29,577,8,801,NULL),('W8L801B577P4',0.9911,0.047,10.5,0.95,3.06,7.25,0.33,0.31,50.6,223.7,17.54,577,8,801,NULL),('W8L801B577P5',0.9938,0.038,12.7,0.32,2.91,6.78,0.52,0.72,62.2,180.4,5.34,577,8,801,NULL),('W8L801B577P6',1.0015,0.091,9.5,0.99,3.77,9.26,0.61,0.64,12.4,15.9,9.56,577,8,801,NULL),('W8L801B577P7',1.0004,0.086,9.9,0.77,3.04,6.97,0.61,0.85,58.6,84.1,13.98,577,8,801,NULL),('W8L801B577P8',1.0019,0.017,8.4,0.32,2.88,9.74,0.35,0.91,42.4,202.9,19.14,577,8,801,NULL),('W8L801B577P9',0.9948,0.074,11.1,0.41,2.88,6.92,0.51,0.62,28.1,113.5,19.55,577,8,801,NULL),('W8L801B578P1',0.993,0.019,9.3,0.39,3.43,5.68,0.29,0.68,41.1,58.3,10.54,578,8,801,NULL),('W8L801B578P10',0.9974,0.029,9.9,0.85,3.25,8.16,0.2,0.83,28.6,49,8.21,578,8,801,NULL),('W8L801B578P11',1.0013,0.046,11.3,0.43,3.73,8.01,0.59,0.29,8.6,169.3,10.84,578,8,801,NULL),('W8L801B578P12',0.9917,0.097,12.1,0.98,2.81,9.39,0.24,0.21,15.8,192.2,6.38,578,8,801,NULL),('W8L801B578P13',0.996,0.048,14,0.58,3.5,9.73,0.18,0.72,43.8,154.2,6.03,578,8,801,NULL),('W8L801B578P14',1.0008,0.093,13.4,0.36,3.46,5.65,0.1,0.5,10.3,26,2.29,578,8,801,NULL),('W8L801B578P15',0.9989,0.073,11,0.35,3.5,9.53,0.65,0.11,7,242.7,12.8,578,8,801,NULL),('W8L801B578P16',1.0009,0.079,12.7,0.45,3.55,8.92,0.03,0.77,43.6,191.6,3,578,8,801,NULL),('W8L801B578P17',0.9959,0.024,8.5,0.69,3.09,8.43,0.45,0.96,49.8,190.7,1.76,578,8,801,NULL),('W8L801B578P18',0.999,0.011,12.4,0.48,2.87,8.77,0.3,0.23,54.1,231.3,14,578,8,801,NULL),('W8L801B578P19',0.9973,0.061,8.8,0.41,3.09,8.87,0.41,0.52,9.3,48.1,10.76,578,8,801,NULL),('W8L801B578P2',1.0049,0.062,12.7,0.74,3.42,8.23,0.28,0.74,32.1,151,15.6,578,8,801,NULL),('W8L801B578P20',0.9918,0.028,10.2,0.32,3.48,6.89,0.08,0.3,40.6,177,18.81,578,8,801,NULL),('W8L801B578P21',1.0013,0.1,9.1,0.48,3.47,5.55,0.76,0.93,69.8,74.6,17,578,8,801,NULL),('W8L801B578P22',1.002,0.091,9.3,0.49,3.78,9.11,0.67,0.31,24.1,100.7,14.89,578,8,801,NULL),('W8L801B578P23',0.9957,0.032,13.1,0.88,3,5.2,0.37,0.2,29.8,139.9,18.59,578,8,801,NULL),('W8L801B578P24',1.0002,0.059,12.2,0.81,3.58,6.04,0.43,0.87,20.8,235.1,16.02,578,8,801,NULL),('W8L801B578P25',1.0001,0.043,12.5,0.93,3.42,7.91,0.76,0.64,50,196.1,17.35,578,8,801,NULL),('W8L801B578P26',1.0026,0.058,9.4,0.79,3.08,5.51,0.61,0.19,17.7,71.1,11.47,578,8,801,NULL),('W8L801B578P27',0.9994,0.069,13.7,0.95,3.26,6.28,0.36,0.86,38.1,67.2,19.06,578,8,801,NULL),('W8L801B578P3',0.9982,0.082,10.3,0.49,3.29,7.66,0.62,0.35,67.7,212.6,14.43,578,8,801,NULL),('W8L801B578P4',0.9922,0.074,12.3,0.95,3.42,8.82,0.07,0.86,43.6,114.8,4.97,578,8,801,NULL),('W8L801B578P5',0.9957,0.029,12.8,0.45,3.78,9.82,0.5,0.18,24,96.3,10.9,578,8,801,NULL),('W8L801B578P6',1.0034,0.036,8.8,0.42,3.62,5.59,0.6,0.83,15.5,114.9,15.6,578,8,801,NULL),('W8L801B578P7',1.001,0.062,9.4,0.53,3.48,8.93,0.38,0.11,19.2,138.7,3.31,578,8,801,NULL),('W8L801B578P8',1.0001,0.074,10.7,0.63,3.78,5.98,0.08,0.43,61.4,51.7,3.09,578,8,801,NULL),('W8L801B578P9',1.0038,0.037,11.5,0.93,3.26,9.48,0.28,0.1,64.6,22.7,19.18,578,8,801,NULL),('W8L801B579P1',0.9924,0.023,8.2,0.79,3.22,9.72,0.78,0.18,37.2,116.1,10.17,579,8,801,NULL),('W8L801B579P10',1,0.077,10.9,0.44,3.48,8.68,0.63,0.93,34.9,244.5,4.13,579,8,801,NULL),('W8L801B579P11',0.9961,0.034,8.5,0.87,3.29,6.05,0.48,0.92,28.2,107.1,2.12,579,8,801,NULL),('W8L801B579P12',1.0002,0.048,9.9,0.53,3.5,5.7,0.72,0.27,15.2,37,11.67,579,8,801,NULL),('W8L801B579P13',1.0043,0.022,11.9,0.46,3.4,8.63,0.17,0.48,13.9,182.5,16.07,579,8,801,NULL),('W8L801B579P14',0.9981,0.086,11.9,0.35,3.3,7.44,0.53,0.71,67.3,181.8,6.21,579,8,801,NULL),('W8L801B579P15',1.0009,0.018,10.1,0.68,3.67,5.35,0.6,0.71,16.5,51.5,10.02,579,8,801,NULL),('W8L801B579P16',0.995,0.032,10.3,0.86,2.82,9.5,0.23,0.36,48.5,146.5,1.52,579,8,801,NULL),('W8L801B579P17',1.0039,0.075,8.6,0.91,3.28,9,0.17,0.31,31,140.1,4.66,579,8,801,NULL),('W8L801B579P18',1.0047,0.045,11.7,0.86,3.02,9.94,0.19,0.48,43.9,35.2,3.37,579,8,801,NULL),('W8L801B579P19',0.9938,0.062,10.6,0.95,3.28,8.26,0.03,0.6,8.9,142.5,2.67,579,8,801,NULL),('W8L801B579P2',0.9917,0.077,10.9,0.79,3.31,8.45,0.23,0.5,29.6,53.9,18.94,579,8,801,NULL),('W8L801B579P20',1.0023,0.051,13.8,0.96,3.4,5.15,0.32,0.29,31,132.2,12.26,579,8,801,NULL),('W8L801B579P21',0.9942,0.077,9.1,0.51,3.18,7.4,0.61,0.88,49.9,22.8,14.34,579,8,801,NULL),('W8L801B579P22',1.003,0.03,9.4,0.7,2.9,7.3,0.49,0.83,33.6,226.5,0.66,579,8,801,NULL),('W8L801B579P23',0.9947,0.084,13.5,0.83,3.68,5.33,0.24,0.78,24.5,95.1,1.71,579,8,801,NULL),('W8L801B579P24',0.9913,0.06,12,0.81,3.28,7.14,0.69,0.9,10.8,96.7,8.14,579,8,801,NULL),('W8L801B579P25',1.0005,0.06,9.7,0.47,3.52,9.74,0.35,0.41,21.6,163,12.25,579,8,801,NULL),('W8L801B579P3',0.999,0.02,9.6,0.51,3.42,8.82,0.32,0.3,68.9,165,14.24,579,8,801,NULL),('W8L801B579P4',1.0006,0.04,8.5,0.72,2.91,7.09,0.27,0.39,21.3,194.1,4.98,579,8,801,NULL),('W8L801B579P5',0.998,0.019,9.6,0.87,3.32,9.97,0.26,0.61,30.9,193,7.03,579,8,801,NULL),('W8L801B579P6',1.0021,0.077,9.6,0.63,3.62,7.72,0.1,0.15,59,124.7,10.73,579,8,801,NULL),('W8L801B579P7',0.9942,0.021,10.5,0.4,3.67,7.85,0.53,0.97,60.1,217.4,2.66,579,8,801,NULL),('W8L801B579P8',1.0034,0.017,13.1,0.7,3.38,6.07,0.1,0.16,67.5,28.2,19.45,579,8,801,NULL),('W8L801B579P9',1.0012,0.065,8.5,0.58,3.52,5.94,0.4,0.83,33.4,211.5,3.43,579,8,801,NULL),('W8L801B580P1',0.9972,0.082,11,0.99,3.58,8.19,0.58,0.6,6.3,78.8,1.23,580,8,801,NULL),('W8L801B580P10',0.9979,0.03,9.3,0.82,3.8,5.81,0.64,0.14,55.1,56.6,15.99,580,8,801,NULL),('W8L801B580P11',1.0037,0.019,8.8,0.78,3.68,5.49,0.2,0.88,38.6,135,8.17,580,8,801,NULL),('W8L801B580P12',0.9916,0.025,13.2,0.74,3.57,6,0.25,0.43,36.5,74.3,17.67,580,8,801,NULL),('W8L801B580P13',0.9953,0.099,9.5,0.54,3.58,5.04,0.37,0.21,11.2,229.9,16.91,580,8,801,NULL),('W8L801B580P14',0.9934,0.067,12.9,0.88,2.89,6.08,0.11,0.74,67.7,112.1,2.91,580,8,801,NULL),('W8L801B580P15',0.9962,0.091,9.1,0.76,3.13,9.76,0.43,0.59,9.3,92.2,16.73,580,8,801,NULL),('W8L801B580P16',0.9984,0.071,9.6,0.45,3.59,8.82,0.07,0.7,32.7,192.3,6.23,580,8,801,NULL),('W8L801B580P17',0.9977,0.076,12.3,0.3,3.01,5.42,0,0.74,57.3,29.6,5.16,580,8,801,NULL),('W8L801B580P18',0.9963,0.011,12,0.88,3.13,6.21,0.53,0.38,56.5,225.4,12.46,580,8,801,NULL),('W8L801B580P19',1.0005,0.066,8.8,0.36,3.08,6.8,0.37,0.98,51.7,151.2,19.28,580,8,801,NULL),('W8L801B580P2',0.999,0.067,9.8,0.71,3.27,9.7,0.07,0.13,55.4,100.8,19,580,8,801,NULL),('W8L801B580P20',0.9905,0.086,10.2,0.36,3.47,7.92,0.29,0.88,39.7,21.3,11.12,580,8,801,NULL),('W8L801B580P21',1.0008,0.043,11.7,0.55,3.79,8.64,0.25,0.5,25,44.6,8.83,580,8,801,NULL),('W8L801B580P22',0.9935,0.051,13.8,0.87,3.33,8.04,0.76,0.81,45.4,196.1,6.5,580,8,801,NULL),('W8L801B580P23',0.9921,0.04,9,0.31,2.82,5.03,0.53,0.46,36.3,10.9,18.23,580,8,801,NULL),('W8L801B580P24',1.0001,0.051,11.3,0.46,3.59,5.81,0.08,0.35,40.1,153.7,10.88,580,8,801,NULL),('W8L801B580P3',0.9948,0.056,9.9,0.33,3.37,6.98,0.42,0.24,29.2,27.5,14.5,580,8,801,NULL),('W8L801B580P4',0.9995,0.049,11.9,0.61,3.23,7.23,0.36,0.7,11.1,81.2,6.36,580,8,801,NULL),('W8L801B580P5',0.9903,0.069,10.1,0.73,3.56,8.1,0.1,0.18,5.7,227.4,11.17,580,8,801,NULL),('W8L801B580P6',0.9975,0.042,9.3,0.48,3.8,6.6,0.44,0.72,15.7,238.3,1.46,580,8,801,NULL),('W8L801B580P7',1.0046,0.02,9.3,0.74,3.47,8.97,0.02,0.69,18.3,29.1,14.13,580,8,801,NULL),('W8L801B580P8',0.992,0.042,10.6,0.48,2.81,8.55,0.32,0.37,42.8,10.8,5.57,580,8,801,NULL),('W8L801B580P9',0.9957,0.043,12.2,0.96,3.58,6.85,0.11,0.12,59.4,11.8,9.18,580,8,801,NULL),('W8L801B581P1',0.9973,0.065,13.4,0.59,2.99,7.98,0.12,0.66,47.3,89.2,13.76,581,8,801,NULL),('W8L801B581P10',1.0049,0.073,12.5,0.79,2.86,8.37,0.34,0.66,38.3,81.1,4.09,581,8,801,NULL),('W8L801B581P11',0.9963,0.017,10.5,0.97,3.08,5.3,0.23,0.53,15.8,143.6,9.49,581,8,801,NULL),('W8L801B581P12',0.9923,0.083,10.8,0.76,3.19,8.78,0.09,0.23,28.5,72.4,12.96,581,8,801,NULL),('W8L801B581P13',0.9953,0.014,11.1,0.84,2.9,9.76,0.17,0.34,64.7,160.5,10.73,581,8,801,NULL),('W8L801B581P14',0.996,0.075,10.8,0.95,3.65,7.71,0.34,0.31,66.9,142.4,5.25,581,8,801,NULL),('W8L801B581P15',1.0016,0.069,9,0.38,3.53,8.38,0.34,0.53,11.6,212.8,16.5,581,8,801,NULL),('W8L801B581P16',0.9998,0.091,12.1,0.42,2.93,8.65,0.44,0.4,14.4,192.2,12.75,581,8,801,NULL),('W8L801B581P17',0.9963,0.063,11.1,0.33,2.83,6.99,0.63,0.17,59.4,185.3,5.41,581,8,801,NULL),('W8L801B581P18',0.9981,0.048,13.9,0.94,3.38,5.5,0.45,0.43,23.6,142.9,6.21,581,8,801,NULL),('W8L801B581P19',0.9934,0.06,8.8,0.51,3.25,8.49,0.71,0.3,13.9,180.8,6.37,581,8,801,NULL),('W8L801B581P2',1.0023,0.032,12.9,0.55,2.99,9.64,0.39,0.79,59.4,155.8,9.12,581,8,801,NULL),('W8L801B581P20',1.004,0.013,10.4,0.32,2.96,8.55,0.17,0.38,64.5,217.5,12.31,581,8,801,NULL),('W8L801B581P21',1.0008,0.035,13.1,0.71,3.19,6.37,0.69,0.14,29.9,139.6,11.54,581,8,801,NULL),('W8L801B581P22',1.0004,0.058,9.6,0.35,3.05,8.89,0.44,0.45,60.8,89.9,9.2,581,8,801,NULL),('W8L801B581P23',1.0017,0.019,10.5,0.74,3.45,9.59,0.23,0.74,49.8,16.9,17.04,581,8,801,NULL),('W8L801B581P24',1.0007,0.018,13.2,0.47,3.3,7.74,0.61,0.57,28.5,33.8,16.12,581,8,801,NULL),('W8L801B581P25',0.9989,0.056,12.7,0.98,3.1,9.21,0.43,0.17,55.9,80,1.22,581,8,801,NULL),('W8L801B581P3',0.9939,0.086,9.7,0.93,3.27,5.78,0.11,0.95,46.5,194.3,16.38,581,8,801,NULL),('W8L801B581P4',1.0032,0.095,10.2,0.34,3.62,6.39,0.57,0.63,69.1,195.4,6.43,581,8,801,NULL),('W8L801B581P5',0.9946,0.021,10.9,0.96,3.65,5.1,0.01,0.41,62.8,118.4,4.53,581,8,801,NULL),('W8L801B581P6',0.9998,0.029,11.5,0.86,3.32,5.14,0.64,0.85,55.1,100.6,6.08,581,8,801,NULL),('W8L801B581P7',0.9988,0.024,13.2,0.67,2.81,6.5,0.1,0.43,45.3,196.9,7.63,581,8,801,NULL),('W8L801B581P8',0.9992,0.06,10.6,0.72,3.38,9.31,0.29,0.92,30.3,48.4,13.07,581,8,801,NULL),('W8L801B581P9',1.0024,0.075,10.8,0.51,3.33,7.64,0.13,0.37,38.1,197.3,1.34,581,8,801,NULL),('W8L801B582P1',1.002,0.075,11.4,0.92,3.43,7.95,0.37,0.72,50.3,94.8,5.81,582,8,801,NULL),('W8L801B582P10',0.9945,0.067,12.5,0.95,3.1,7.58,0.73,0.56,61.6,12,14.75,582,8,801,NULL),('W8L801B582P11',0.9961,0.017,8.4,0.5,3.74,6.63,0.03,0.55,62.8,151.8,16.28,582,8,801,NULL),('W8L801B582P12',0.9933,0.097,9.6,0.56,3.62,5.85,0.24,0.25,32.6,182.4,5.03,582,8,801,NULL),('W8L801B582P13',0.994,0.012,12.4,1,3.55,7.99,0.08,0.55,15.1,132.4,8.05,582,8,801,NULL),('W8L801B582P14',1.0017,0.012,10.9,0.87,3.18,6.42,0.65,0.71,6.4,114.4,6.3,582,8,801,NULL),('W8L801B582P15',0.997,0.061,12.3,0.42,3.57,8.64,0.01,0.58,31.2,38.4,9.21,582,8,801,NULL),('W8L801B582P16',0.9973,0.067,10.4,0.88,3.1,7.52,0.23,0.47,26.2,156.8,0.99,582,8,801,NULL),('W8L801B582P17',0.9902,0.059,11.4,0.63,3.32,6.64,0.31,0.94,49.1,216.6,11.59,582,8,801,NULL),('W8L801B582P18',1.0045,0.092,8.5,0.45,2.87,8.96,0.41,0.14,44.7,14.5,18.4,582,8,801,NULL),('W8L801B582P19',1.0045,0.093,10,0.35,3.01,7.15,0.02,0.41,42.3,11.7,0.99,582,8,801,NULL),('W8L801B582P2',0.9977,0.041,12.8,0.91,2.98,5.64,0.72,0.45,64.7,101.7,8.15,582,8,801,NULL),('W8L801B582P20',1.0029,0.011,9.8,0.8,3.63,8.48,0.17,0.76,53.4,211.6,10.78,582,8,801,NULL),('W8L801B582P21',1.0018,0.062,13.7,0.77,3.72,8.23,0.62,0.69,36,217.8,16.85,582,8,801,NULL),('W8L801B582P22',0.9943,0.082,10.4,0.99,3.64,5.37,0.23,0.84,60.1,30.7,9.14,582,8,801,NULL),('W8L801B582P23',0.9981,0.036,10.9,0.53,3.01,7.81,0.41,0.24,39,123,11.77,582,8,801,NULL),('W8L801B582P3',1.0028,0.033,13.6,0.38,3.13,9.79,0.2,0.54,62.5,153.2,6.32,582,8,801,NULL),('W8L801B582P4',0.9996,0.038,10.5,0.56,3.57,7.35,0.25,0.29,46.1,212.6,15.8,582,8,801,NULL),('W8L801B582P5',0.9949,0.05,13.3,0.71,3.49,9.15,0.49,0.45,53.2,210.9,9.04,582,8,801,NULL),('W8L801B582P6',1.0033,0.018,13.8,0.76,3.08,7.04,0.15,0.71,68.1,85.2,15.52,582,8,801,NULL),('W8L801B582P7',0.9902,0.065,9.2,0.89,3.58,5.06,0.25,0.74,8.6,61.4,2.18,582,8,801,NULL),('W8L801B582P8',1.004,0.051,11.1,0.61,3.11,7.14,0.18,0.59,18.1,121,5.42,582,8,801,NULL),('W8L801B582P9',0.9901,0.051,10.2,0.77,3.31,6.6,0.55,0.12,46.1,215.1,19.01,582,8,801,NULL),('W8L801B583P1',0.9914,0.093,13.3,0.84,3.27,6.48,0.07,0.14,30.5,166.1,5.84,583,8,801,NULL),('W8L801B583P10',0.9981,0.012,8.8,0.91,2.99,6.38,0.1,0.75,7,200.1,6.21,583,8,801,NULL),('W8L801B583P11',0.9917,0.02,9.7,0.95,3.74,8.17,0.01,0.19,30.1,144.9,17.13,583,8,801,NULL),('W8L801B583P12',1.0011,0.049,8.5,0.48,3.58,7.12,0.68,0.28,23.9,67.3,4.36,583,8,801,NULL),('W8L801B583P13',0.9919,0.021,13.5,0.44,3.21,9.19,0.13,0.86,15.4,233.1,15.83,583,8,801,NULL),('W8L801B583P14',0.9918,0.028,13.7,0.39,3.4,5.47,0.4,0.31,16.7,37.8,6.4,583,8,801,NULL),('W8L801B583P15',0.9992,0.096,11.8,0.51,3.77,7.18,0.28,0.4,57.4,229.4,6.72,583,8,801,NULL),('W8L801B583P16',0.9996,0.031,8.8,0.31,3.08,6.5,0.66,0.5,9.2,229.4,1.36,583,8,801,NULL),('W8L801B583P17',0.9954,0.073,10.6,0.76,3.12,5.95,0.39,0.2,19,46.3,12.6,583,8,801,NULL),('W8L801B583P18',0.9938,0.053,13.2,0.94,2.88,7.75,0.19,0.27,11.8,160.2,5.56,583,8,801,NULL),('W8L801B583P19',0.9997,0.039,12.3,0.96,2.83,8.72,0.43,0.55,34.6,141.4,16.59,583,8,801,NULL),('W8L801B583P2',0.9965,0.046,11,0.83,3.46,7.18,0.71,0.5,31.2,23.9,18.84,583,8,801,NULL),('W8L801B583P20',1.0023,0.033,9.4,0.48,3.49,7.8,0.55,0.28,19.3,111.9,8.09,583,8,801,NULL),('W8L801B583P21',0.9936,0.054,13.1,0.68,3.18,6.5,0.05,0.12,35.5,179.7,15.75,583,8,801,NULL),('W8L801B583P22',0.9979,0.028,9.7,0.72,2.96,5.04,0.67,0.38,50.5,224.8,4.44,583,8,801,NULL),('W8L801B583P3',0.9913,0.043,12.7,0.89,3.35,7.1,0.45,0.46,56.3,52.9,15.59,583,8,801,NULL),('W8L801B583P4',1.0012,0.025,13.9,0.83,2.92,7.36,0.4,0.1,24.7,209.9,6.39,583,8,801,NULL),('W8L801B583P5',0.9937,0.014,8.9,0.55,3.67,7,0.43,0.77,14.1,161.7,5.53,583,8,801,NULL),('W8L801B583P6',0.992,0.039,10.9,0.69,3.03,8.34,0.44,0.24,48,210.2,1.56,583,8,801,NULL),('W8L801B583P7',0.9963,0.08,11.6,0.56,3.5,5.86,0.59,0.33,49.6,186.2,3.39,583,8,801,NULL),('W8L801B583P8',0.9952,0.075,13.9,0.68,3.71,8.05,0.71,0.84,17.5,208.8,3.1,583,8,801,NULL),('W8L801B583P9',0.9933,0.011,12,0.33,3.54,7.22,0.75,0.55,56.9,180.7,19.05,583,8,801,NULL),('W8L801B584P1',1.001,0.074,12.1,0.7,3.34,8.77,0.56,0.76,12.7,140.3,11.98,584,8,801,NULL),('W8L801B584P10',0.995,0.071,8.1,0.42,3.17,7.77,0.28,0.39,55,132.9,14.1,584,8,801,NULL),('W8L801B584P11',0.9972,0.012,8.1,0.77,3.17,9.31,0.53,0.59,54.9,86.7,19.05,584,8,801,NULL),('W8L801B584P12',0.9908,0.043,13,0.55,3.23,8.6,0.52,0.56,5.7,67.4,15.95,584,8,801,NULL),('W8L801B584P13',1.0028,0.042,12.2,0.53,3.23,7.57,0.03,0.37,52.3,81.3,5.17,584,8,801,NULL),('W8L801B584P14',1.0048,0.054,9,0.32,3.5,6.28,0.07,0.89,69.2,140.1,6.38,584,8,801,NULL),('W8L801B584P15',1.0016,0.093,10.1,0.42,2.9,6.6,0.15,0.78,69.9,76.7,17.16,584,8,801,NULL),('W8L801B584P16',1.0028,0.016,12.4,0.57,2.88,9.27,0.2,0.67,21.4,40.8,1.32,584,8,801,NULL),('W8L801B584P17',0.9991,0.016,8.3,0.88,3.25,7.16,0.38,0.67,69.9,60.3,8.2,584,8,801,NULL),('W8L801B584P18',0.993,0.033,11,0.32,2.82,6.28,0.01,0.83,20.6,206,2.66,584,8,801,NULL),('W8L801B584P19',0.9942,0.027,8.8,0.57,3.11,9.18,0.06,0.7,37.4,87.5,15,584,8,801,NULL),('W8L801B584P2',0.9942,0.039,8.1,0.52,3.39,9.32,0.6,0.79,23.6,154.9,6.02,584,8,801,NULL),('W8L801B584P20',1.0024,0.01,8.8,0.68,3.6,8.35,0.56,0.52,35.9,77.2,1.22,584,8,801,NULL),('W8L801B584P21',0.9911,0.013,11.9,0.65,2.83,6.57,0.73,0.47,33,74.8,13.05,584,8,801,NULL),('W8L801B584P22',1.0039,0.028,11.4,0.52,3.11,8.2,0.17,0.11,24.7,17.8,7.9,584,8,801,NULL),('W8L801B584P23',0.9938,0.068,11.2,0.96,3.51,6.96,0.34,0.62,29.6,36.1,3.26,584,8,801,NULL),('W8L801B584P24',1.0006,0.088,13.4,0.54,3.72,7.65,0.74,0.97,42.6,109.5,19.11,584,8,801,NULL),('W8L801B584P25',0.992,0.017,9.5,0.47,3.69,5.29,0.15,0.37,60.5,105.1,6.98,584,8,801,NULL),('W8L801B584P26',0.993,0.088,9,0.56,3.74,6.62,0.05,0.8,39.6,100.8,2.14,584,8,801,NULL),('W8L801B584P3',1.0032,0.025,9.5,0.54,3.38,7.39,0.8,0.39,51.4,175.8,2.02,584,8,801,NULL),('W8L801B584P4',0.9915,0.02,9.1,0.63,3.15,7.59,0.43,0.32,22.2,116.5,19.76,584,8,801,NULL),('W8L801B584P5',1.0041,0.037,11.6,0.9,3.04,9.6,0.34,0.48,10.5,135.1,15.86,584,8,801,NULL),('W8L801B584P6',1.0002,0.094,10.3,0.79,3.46,6.96,0.05,0.32,49.6,98.1,7.89,584,8,801,NULL),('W8L801B584P7',0.9927,0.076,13,0.49,3.6,5.35,0.17,0.23,49.8,134.5,5,584,8,801,NULL),('W8L801B584P8',1.0016,0.066,9.7,0.3,3.58,7.92,0.62,0.18,37.4,32,10.3,584,8,801,NULL),('W8L801B584P9',1.0039,0.011,8.7,0.54,3.51,9.92,0.69,0.54,61.6,128.4,12.46,584,8,801,NULL),('W8L801B585P1',0.9994,0.04,13.9,0.49,3.56,5.04,0.19,0.68,54.3,67.3,5.75,585,8,801,NULL),('W8L801B585P10',0.9997,0.043,8.6,0.62,3.06,7.98,0.12,0.27,50.6,72.9,1.94,585,8,801,NULL),('W8L801B585P11',0.9906,0.075,13.6,0.35,3.68,5.1,0.06,0.35,46.5,77.5,18.95,585,8,801,NULL),('W8L801B585P12',1.0038,0.025,12,0.75,3.51,7.27,0.18,0.19,66.4,51,2.1,585,8,801,NULL),('W8L801B585P13',0.9933,0.028,13,0.88,3.78,7.78,0.38,0.46,8.7,120.3,6.51,585,8,801,NULL),('W8L801B585P14',0.9965,0.044,12.2,0.43,3.46,6.86,0.41,0.26,54.6,169.3,4.7,585,8,801,NULL),('W8L801B585P15',1.0023,0.047,13.4,0.4,3.41,7.37,0.76,0.68,33.5,40.4,14.63,585,8,801,NULL),('W8L801B585P16',0.9956,0.054,8.4,0.37,3.5,9.71,0.63,0.75,44.2,236.3,19.31,585,8,801,NULL),('W8L801B585P17',0.9901,0.048,10.3,0.98,3.14,7.12,0,0.37,7.4,222.4,1.88,585,8,801,NULL),('W8L801B585P18',0.9976,0.091,11.4,0.46,3.46,6.62,0.71,0.6,63.9,13.2,8.34,585,8,801,NULL),('W8L801B585P19',0.9979,0.082,11.7,0.95,3.58,5.23,0.35,0.37,39.7,105.3,13.19,585,8,801,NULL),('W8L801B585P2',0.9985,0.088,12.2,0.92,3.21,9.05,0.33,0.41,41.2,116.5,8.36,585,8,801,NULL),('W8L801B585P20',0.994,0.046,10.9,0.81,3.28,9.33,0.18,0.89,13.7,222.7,13.86,585,8,801,NULL),('W8L801B585P21',0.9953,0.015,9.4,0.82,2.87,8.72,0.6,0.29,59.1,27,19.59,585,8,801,NULL),('W8L801B585P22',0.9931,0.074,9.3,0.3,3.13,6.24,0.55,0.94,13.7,56.8,8.76,585,8,801,NULL),('W8L801B585P23',0.9912,0.03,13.5,0.33,3.58,9.94,0.07,0.75,29.5,116.2,16.38,585,8,801,NULL),('W8L801B585P24',0.9984,0.039,8.6,0.93,3.55,6.02,0.76,0.39,63.6,156.6,3.65,585,8,801,NULL),('W8L801B585P25',0.9982,0.094,13.2,0.65,3.09,6.06,0.29,0.14,41.8,169.2,14.36,585,8,801,NULL),('W8L801B585P26',0.9917,0.018,12,0.77,3.44,6.87,0.76,0.43,18.5,161.4,4.83,585,8,801,NULL),('W8L801B585P27',1.0007,0.025,12.2,0.6,3.14,8.05,0.33,0.73,35.8,243,17.36,585,8,801,NULL),('W8L801B585P28',1.0002,0.019,9.4,0.7,3.29,5.04,0.49,0.49,62.3,106.9,6.38,585,8,801,NULL),('W8L801B585P29',1.0021,0.063,12.4,0.81,3.57,7,0.69,0.26,31.4,127.7,8.85,585,8,801,NULL),('W8L801B585P3',0.9913,0.082,8.6,0.41,3.34,8.92,0.79,0.98,58.1,143.5,7.86,585,8,801,NULL),('W8L801B585P30',0.993,0.087,13.6,0.52,3.59,7.39,0.73,0.94,55.7,226,1.05,585,8,801,NULL),('W8L801B585P4',1.001,0.087,14,0.91,3.5,6,0.5,0.13,27.2,170.9,17.69,585,8,801,NULL),('W8L801B585P5',0.9947,0.095,13.7,0.75,3.44,7.27,0.37,0.1,13.9,234.2,13.54,585,8,801,NULL),('W8L801B585P6',0.9927,0.078,13,0.58,2.97,5.62,0.41,0.45,69.6,43,15.88,585,8,801,NULL),('W8L801B585P7',0.9937,0.051,10,0.82,3.36,7.71,0.18,0.64,42.1,84.5,11.11,585,8,801,NULL),('W8L801B585P8',0.9932,0.047,12.1,0.9,3.3,7.45,0.01,0.34,19.6,106,5.72,585,8,801,NULL),('W8L801B585P9',1.0041,0.079,11.4,0.95,2.84,6.41,0.56,0.13,18.2,41.7,2.28,585,8,801,NULL),('W8L801B586P1',0.991,0.09,8.2,0.36,3.47,6.3,0.57,0.37,45.3,233.9,12.48,586,8,801,NULL),('W8L801B586P10',0.9928,0.058,10.3,0.39,3.01,8.96,0.52,0.69,53.7,160.7,11.05,586,8,801,NULL),('W8L801B586P11',0.992,0.046,10.6,0.37,3.7,5.13,0.21,0.82,5.7,206.1,19.36,586,8,801,NULL),('W8L801B586P12',1.001,0.057,11.1,0.64,3.73,9.89,0.67,0.84,50.7,102.4,18.11,586,8,801,NULL),('W8L801B586P13',0.9969,0.068,11.1,0.92,3.2,5.39,0.06,0.91,30.4,73.1,6.88,586,8,801,NULL),('W8L801B586P14',0.9975,0.099,11.6,0.82,3.71,6.82,0.75,0.41,47.8,30,18.95,586,8,801,NULL),('W8L801B586P15',0.9925,0.063,9.9,0.89,3.01,9.32,0.29,0.31,33.6,127.8,11.78,586,8,801,NULL),('W8L801B586P16',0.9911,0.051,12.4,0.55,3.52,5.67,0.56,0.81,6.1,208.1,8.96,586,8,801,NULL),('W8L801B586P17',0.9971,0.018,13.2,0.64,3.5,6.81,0.24,0.37,29.7,52.9,7.32,586,8,801,NULL),('W8L801B586P18',1.0048,0.021,9.8,0.94,3.5,9.26,0.75,0.16,40.9,163,2.8,586,8,801,NULL),('W8L801B586P19',0.9956,0.062,10.5,0.97,3.62,9.71,0.44,0.32,58.4,45,10.06,586,8,801,NULL),('W8L801B586P2',0.9945,0.057,8.3,0.76,3.66,8.99,0.56,0.31,21.9,116.3,16.81,586,8,801,NULL),('W8L801B586P20',0.9956,0.013,11.7,0.61,2.88,8.42,0.05,0.77,11,246,12.21,586,8,801,NULL),('W8L801B586P21',1.0006,0.066,12.7,0.97,3.5,5.95,0.59,0.47,40.6,128.8,19.93,586,8,801,NULL),('W8L801B586P22',0.9962,0.082,9.3,0.77,3.56,8.59,0.23,0.59,53.6,60.6,7.03,586,8,801,NULL),('W8L801B586P23',0.991,0.014,13.8,0.88,3.27,9.48,0.76,0.53,66.7,157.2,16.88,586,8,801,NULL),('W8L801B586P24',0.9938,0.029,12.7,0.94,3.08,7.91,0.15,0.54,42.1,167.8,4.88,586,8,801,NULL),('W8L801B586P3',1.0013,0.028,11.4,0.43,3.26,5.27,0.13,0.41,64.3,223.4,3.7,586,8,801,NULL),('W8L801B586P4',1.0026,0.091,14,0.97,3.28,7.45,0.55,0.78,8.3,212,2.4,586,8,801,NULL),('W8L801B586P5',0.996,0.058,12.9,0.72,2.97,8.69,0.77,0.68,16.1,28.2,5.5,586,8,801,NULL),('W8L801B586P6',0.9961,0.045,11.7,0.71,3.79,5.26,0.33,0.25,31.9,28.2,19.97,586,8,801,NULL),('W8L801B586P7',1.0039,0.034,12.8,0.61,3.18,9.11,0.2,0.1,44.4,27,7.17,586,8,801,NULL),('W8L801B586P8',0.9993,0.046,8,0.56,3.8,9.45,0.29,0.61,38.8,143.2,1.58,586,8,801,NULL),('W8L801B586P9',0.9938,0.094,13.3,0.73,2.83,5.17,0.68,0.28,24.6,106.6,7.65,586,8,801,NULL),('W8L801B587P1',0.9958,0.054,9.2,0.79,3.64,8.33,0.37,0.35,10.8,124.3,10.67,587,8,801,NULL),('W8L801B587P10',1.0039,0.067,11.9,0.81,3.8,6.24,0.24,0.74,38.6,100.5,12.04,587,8,801,NULL),('W8L801B587P11',0.9973,0.044,9.6,0.68,3.31,9.55,0.75,0.78,33.6,203.6,10.3,587,8,801,NULL),('W8L801B587P12',1.0037,0.081,9.8,0.95,3.71,5.74,0.62,0.66,29.6,228.3,10.8,587,8,801,NULL),('W8L801B587P13',1.0005,0.039,10.8,0.54,3.71,7.64,0.21,0.88,39.9,65.4,10.71,587,8,801,NULL),('W8L801B587P14',0.9918,0.066,11.7,0.49,3.8,5.16,0.22,0.2,24.4,129.7,2.69,587,8,801,NULL),('W8L801B587P15',1.0009,0.032,11,0.73,3.31,5.6,0.46,0.6,57.6,215.8,3.46,587,8,801,NULL),('W8L801B587P16',0.9904,0.041,12.6,0.43,3.71,5.86,0.08,0.81,58.3,119.5,2.18,587,8,801,NULL),('W8L801B587P17',0.9973,0.085,11.7,0.74,3.64,5.97,0.19,0.66,69.9,165.4,15.88,587,8,801,NULL),('W8L801B587P18',0.9958,0.024,12.3,0.73,2.9,5.7,0.05,0.41,28,196.7,6.91,587,8,801,NULL),('W8L801B587P19',1.0034,0.058,11.3,0.41,2.86,9.91,0.56,0.34,33.8,88.3,14.91,587,8,801,NULL),('W8L801B587P2',0.9932,0.033,12.7,0.88,3.19,5.88,0.09,0.34,11.7,240.4,18.19,587,8,801,NULL),('W8L801B587P20',0.992,0.049,8.2,0.66,3.16,7.68,0.74,0.6,27.5,23.2,14.25,587,8,801,NULL),('W8L801B587P21',0.9913,0.027,8.5,0.86,2.95,8.95,0.75,0.29,44.2,130.9,17.69,587,8,801,NULL),('W8L801B587P22',1.0043,0.022,12.6,0.51,3.45,9.8,0.74,0.55,49.4,209.4,14,587,8,801,NULL),('W8L801B587P23',0.9994,0.044,9.4,0.59,2.82,6.97,0.12,0.15,20.1,203.6,18.05,587,8,801,NULL),('W8L801B587P24',1.001,0.09,10.4,0.56,3.36,6.33,0.51,0.61,52.9,222.9,7.94,587,8,801,NULL),('W8L801B587P25',1.001,0.046,10.3,0.45,3.56,9.06,0.09,0.79,34.6,50.8,13.25,587,8,801,NULL),('W8L801B587P3',1.0045,0.023,10.3,0.71,3.3,5.11,0.24,0.22,30.6,100.6,18.7,587,8,801,NULL),('W8L801B587P4',1.0011,0.081,12.2,0.79,3.29,5.76,0.52,0.87,36.4,123.3,12.07,587,8,801,NULL),('W8L801B587P5',1.0013,0.089,12.3,0.92,3.8,5.69,0.23,0.58,67.8,44.4,15.1,587,8,801,NULL),('W8L801B587P6',0.9943,0.011,9,0.54,3.25,6.76,0.27,0.4,36.4,230.5,14.36,587,8,801,NULL),('W8L801B587P7',0.9958,0.076,12,0.74,3.19,9.31,0.43,0.2,57.8,208,12.89,587,8,801,NULL),('W8L801B587P8',1.0009,0.092,10.1,0.52,3.76,6.08,0.49,0.2,63.7,131.2,12.34,587,8,801,NULL),('W8L801B587P9',1.0041,0.069,12.3,0.68,3.41,6.3,0.61,0.58,15.2,234.1,1.25,587,8,801,NULL),('W8L801B588P1',1.004,0.027,12.7,0.7,3.13,9.75,0.63,0.13,39.4,235.1,3.57,588,8,801,NULL),('W8L801B588P10',1.0002,0.031,13.5,0.86,3.33,8.32,0.27,0.45,61.4,115.8,14.4,588,8,801,NULL),('W8L801B588P11',1.0038,0.036,11.7,0.84,3.7,9.09,0.63,0.91,67.9,81.6,5.42,588,8,801,NULL),('W8L801B588P12',0.995,0.038,9.8,0.83,3.45,9.59,0.28,0.4,43.8,213,6.99,588,8,801,NULL),('W8L801B588P13',1.004,0.08,12.4,0.62,3.62,6.32,0.56,0.36,46.4,205.6,15.89,588,8,801,NULL),('W8L801B588P14',0.9954,0.078,14,0.92,2.8,8.64,0.33,0.69,8.1,69.4,17.89,588,8,801,NULL),('W8L801B588P15',0.9991,0.014,11.2,0.96,3.41,9.84,0.38,0.35,53.4,92.4,10.11,588,8,801,NULL),('W8L801B588P16',0.9989,0.037,11.7,0.45,3.02,5.92,0.78,0.84,20.6,230.3,14.3,588,8,801,NULL),('W8L801B588P17',0.9901,0.013,8.4,0.95,2.85,6.96,0.3,0.64,42,190.8,3.8,588,8,801,NULL),('W8L801B588P18',0.9925,0.091,14,0.5,3.27,8.6,0.68,0.66,11.7,56.7,15.86,588,8,801,NULL),('W8L801B588P19',1.0044,0.078,11.7,0.76,2.97,9.73,0.33,0.27,56.6,153.1,6.7,588,8,801,NULL),('W8L801B588P2',1.0029,0.038,13.5,0.58,3.67,9.88,0.15,0.37,51.8,131.7,3.89,588,8,801,NULL),('W8L801B588P20',0.996,0.058,10.7,0.42,3.49,6.54,0.16,0.9,62.6,115.7,16.42,588,8,801,NULL),('W8L801B588P21',0.9945,0.056,9.5,0.52,3.38,8.28,0.8,0.39,23.5,137.3,4.27,588,8,801,NULL),('W8L801B588P22',1.0019,0.065,13.8,0.69,3.75,9.92,0.3,0.99,5.3,207.9,10.98,588,8,801,NULL),('W8L801B588P3',1.003,0.048,10.8,0.61,3.45,5.89,0.12,0.2,10.8,77.8,14.39,588,8,801,NULL),('W8L801B588P4',0.9961,0.075,8.7,0.56,3.52,8.8,0.05,0.12,53.6,217,15.73,588,8,801,NULL),('W8L801B588P5',0.9938,0.021,10.3,0.42,3.02,5.51,0.56,0.89,39,104.2,5.94,588,8,801,NULL),('W8L801B588P6',1.0037,0.025,12.2,0.82,3.42,5.52,0.31,0.98,46,110.7,15.93,588,8,801,NULL),('W8L801B588P7',0.9913,0.02,11.3,0.64,3.41,5.44,0.15,0.28,5.7,246.7,14.4,588,8,801,NULL),('W8L801B588P8',1.0004,0.066,10.5,0.95,3.75,9.44,0.01,0.91,41.6,196.5,9.05,588,8,801,NULL),('W8L801B588P9',0.9962,0.077,11.3,0.93,2.91,9.27,0.67,0.81,13.8,88.2,18.09,588,8,801,NULL),('W8L801B589P1',0.9947,0.061,9.4,0.36,2.8,8.88,0.72,0.93,69.9,108.6,14.45,589,8,801,NULL),('W8L801B589P2',1.0044,0.026,9.9,0.74,2.91,8.59,0.51,0.98,24.6,29.5,12.08,589,8,801,NULL),('W8L801B589P3',0.9971,0.035,9.3,0.69,3.14,6.94,0.7,0.7,52.4,37.2,10.13,589,8,801,NULL),('W8L802B399P1',0.9968,0.042,8.2,0.43,3.41,9.38,0.59,0.95,54,132.7,9.65,399,8,802,NULL),('W8L802B399P10',1.0026,0.036,10.5,0.59,3.79,8.78,0.53,0.19,40.8,10.4,18.46,399,8,802,NULL),('W8L802B399P11',0.9997,0.03,9,0.46,2.86,5.08,0.29,0.4,17.9,69.5,10.83,399,8,802,NULL),('W8L802B399P12',0.9919,0.059,10,0.99,3.45,8.5,0.13,0.46,48.4,63.6,6.95,399,8,802,NULL),('W8L802B399P13',0.9962,0.046,12.9,0.75,3.22,6.23,0.26,0.69,19.9,134.3,17.18,399,8,802,NULL),('W8L802B399P14',0.9903,0.038,8.9,0.84,3.04,8.42,0.64,0.87,62.7,106.1,8.92,399,8,802,NULL),('W8L802B399P15',1.004,0.075,8.7,0.71,3.12,8.33,0.75,0.92,63.5,248.9,11.83,399,8,802,NULL),('W8L802B399P16',1.001,0.023,9.7,0.51,3.24,6.82,0.38,0.59,20.4,190.1,18.65,399,8,802,NULL),('W8L802B399P17',0.9956,0.07,10.6,0.83,3.4,8.51,0.61,0.39,33.1,62.1,17.32,399,8,802,NULL),('W8L802B399P18',0.9916,0.052,12.5,0.63,3.62,8.77,0.69,0.82,55.2,243.7,11.77,399,8,802,NULL),('W8L802B399P19',1.0004,0.068,9.4,0.68,2.96,6.81,0.69,0.68,54.6,215.2,1.48,399,8,802,NULL),('W8L802B399P2',0.9993,0.024,12.5,0.42,2.93,7.4,0.57,0.53,66.8,71.8,19.57,399,8,802,NULL),('W8L802B399P20',0.9985,0.058,11.1,0.73,2.94,5.59,0.68,0.79,58.5,129,7.19,399,8,802,NULL),('W8L802B399P21',1.0044,0.019,12.4,0.59,3.47,8.89,0.41,0.71,55.5,13.4,0.93,399,8,802,NULL),('W8L802B399P22',0.9914,0.013,8.6,0.65,2.89,6.07,0.2,0.78,13.6,104.9,12.48,399,8,802,NULL),('W8L802B399P23',0.9904,0.096,8.4,0.84,2.99,5.65,0.45,0.15,55.1,53,8.28,399,8,802,NULL),('W8L802B399P24',1.0034,0.097,9.1,0.67,3.73,7.55,0.21,0.55,69.8,129.5,18.88,399,8,802,NULL),('W8L802B399P3',0.9985,0.039,11.4,0.3,3.75,6.76,0.16,0.47,11.3,236.8,17.55,399,8,802,NULL),('W8L802B399P4',0.9913,0.014,9.7,0.8,2.82,6.96,0.28,0.4,60.8,193.5,4.3,399,8,802,NULL),('W8L802B399P5',0.9946,0.038,13.5,0.45,2.89,8.25,0.63,0.24,63.1,210.2,17.42,399,8,802,NULL),('W8L802B399P6',0.9934,0.093,9.9,0.42,3.06,6.43,0.02,0.31,37.7,82.8,8.83,399,8,802,NULL),('W8L802B399P7',0.9982,0.084,9.9,0.31,3.54,5.4,0.77,0.37,8,190.9,16.09,399,8,802,NULL),('W8L802B399P8',0.995,0.011,10.3,0.41,3.09,9.64,0.58,0.12,33.1,66.9,12.45,399,8,802,NULL),('W8L802B399P9',1.0004,0.044,8.6,0.34,3.55,9.93,0.41,0.39,59.9,101,13.23,399,8,802,NULL),('W8L802B400P1',0.9953,0.026,12.9,0.78,3.25,6.97,0.41,0.55,14.8,55.2,9.82,400,8,802,NULL),('W8L802B400P10',0.9986,0.072,11.9,0.87,3.54,8.7,0.6,0.25,9.9,243.7,3.55,400,8,802,NULL),('W8L802B400P11',1.0004,0.014,13,0.55,3.51,8.34,0.12,0.57,5.9,62.1,12.18,400,8,802,NULL),('W8L802B400P12',0.9933,0.078,8.1,0.36,3.53,7.13,0.72,0.62,45.3,58.1,14.76,400,8,802,NULL),('W8L802B400P13',0.9945,0.061,8.1,0.48,3.7,5.57,0.15,0.29,59.6,85.4,8.97,400,8,802,NULL),('W8L802B400P14',1.001,0.043,12.1,0.35,3.12,8.21,0.34,0.82,46.2,32.2,8.58,400,8,802,NULL),('W8L802B400P15',1.0049,0.067,13.9,0.63,3.29,9.71,0.11,0.51,14,146.1,14.77,400,8,802,NULL),('W8L802B400P16',0.9996,0.046,9.3,0.78,3.66,9.21,0.06,0.43,64.5,81.8,17.85,400,8,802,NULL),('W8L802B400P17',0.9945,0.043,9.2,0.98,2.92,9.69,0.06,0.49,9,219.7,17.31,400,8,802,NULL),('W8L802B400P18',1.0042,0.087,14,0.37,3.66,7.11,0.17,0.28,54.6,109.6,9.77,400,8,802,NULL),('W8L802B400P19',0.9964,0.052,11.7,0.34,3.68,8.33,0.64,0.32,38.7,57.1,17.85,400,8,802,NULL),('W8L802B400P2',0.9917,0.054,13,0.37,3.54,5.07,0.32,0.19,34,213,18.42,400,8,802,NULL),('W8L802B400P20',1.0045,0.033,13.3,0.62,3.54,7.92,0.31,0.47,20,156,12.63,400,8,802,NULL),('W8L802B400P21',0.9992,0.02,8.6,0.58,3.37,5.65,0.25,0.11,69.6,249.4,6,400,8,802,NULL),('W8L802B400P22',0.9913,0.011,11.1,0.56,2.88,5.3,0.7,0.8,34,42.7,1.71,400,8,802,NULL),('W8L802B400P23',0.9986,0.098,10.7,0.55,3.67,7.3,0.62,0.33,9.5,65.8,11.26,400,8,802,NULL),('W8L802B400P24',1.0007,0.053,13.6,0.53,2.95,5.36,0.49,0.69,11.5,219.2,5.7,400,8,802,NULL),('W8L802B400P25',1.0007,0.074,13.2,0.46,3.46,5.69,0.68,0.77,16.7,134.8,12.64,400,8,802,NULL),('W8L802B400P26',0.9993,0.073,12.3,0.37,3.44,5.82,0.19,0.97,61.1,79.1,3.33,400,8,802,NULL),('W8L802B400P27',0.99,0.062,9.9,0.94,3.75,9.5,0.17,0.14,12.4,168.2,7.1,400,8,802,NULL),('W8L802B400P3',0.9999,0.012,10.6,0.64,3.26,6.76,0.29,0.59,57.3,33.8,5.82,400,8,802,NULL),('W8L802B400P4',0.9966,0.084,13.5,0.34,3.72,6.07,0.17,0.46,15.5,27.1,0.88,400,8,802,NULL),('W8L802B400P5',0.9977,0.081,11.9,0.6,3.34,5.06,0.17,0.94,65.5,207.7,1.14,400,8,802,NULL),('W8L802B400P6',0.997,0.024,10.7,0.99,3.62,6.43,0.62,0.73,58.1,185,10.31,400,8,802,NULL),('W8L802B400P7',1.0039,0.079,11.8,0.57,3.7,9.86,0.71,0.43,37.7,42.4,19.31,400,8,802,NULL),('W8L802B400P8',0.994,0.041,13.8,0.52,3.47,9.11,0.44,0.95,45.9,81.1,15.85,400,8,802,NULL),('W8L802B400P9',0.9924,0.013,12.6,0.34,2.87,9.11,0.61,0.96,44,249.9,10.2,400,8,802,NULL),('W8L802B401P1',0.9959,0.032,11.2,0.6,3.53,5.62,0.43,0.64,13.9,135.2,1.76,401,8,802,NULL),('W8L802B401P10',0.9905,0.077,13.7,0.72,3.31,5.18,0.57,0.71,21.1,219.4,6.64,401,8,802,NULL),('W8L802B401P11',1.0022,0.051,9.7,0.48,3.47,7.35,0.46,0.71,17.8,49.7,5.55,401,8,802,NULL),('W8L802B401P12',0.9939,0.085,13.1,0.73,2.9,8.54,0.2,0.7,53.9,64.7,6.79,401,8,802,NULL),('W8L802B401P13',0.9971,0.026,8.5,0.86,3.18,8.83,0.15,0.43,35.3,221.2,12.82,401,8,802,NULL),('W8L802B401P14',1.0018,0.08,9.4,0.91,2.89,9.32,0.73,0.54,52.5,116.4,11.48,401,8,802,NULL),('W8L802B401P15',0.9955,0.081,10.9,0.49,3.69,7.98,0.38,0.64,16.6,242.8,13.99,401,8,802,NULL),('W8L802B401P16',0.9928,0.021,10.2,0.78,2.94,5.8,0.56,0.31,46.5,124.1,9.37,401,8,802,NULL),('W8L802B401P17',1.0048,0.086,13.7,0.4,3.29,8.19,0.79,0.55,27.2,57.9,6.63,401,8,802,NULL),('W8L802B401P18',1.0002,0.011,13,0.46,3.54,5.42,0.09,0.37,7.7,157.9,16.55,401,8,802,NULL),('W8L802B401P19',0.9967,0.028,8.7,0.77,3.25,7.93,0.35,0.41,17.5,137.8,2.64,401,8,802,NULL),('W8L802B401P2',1.0032,0.087,11.4,0.61,3.29,7.58,0.31,0.32,19.3,38.7,11.89,401,8,802,NULL),('W8L802B401P20',0.991,0.063,8.2,0.83,3,5.41,0.43,0.49,52.8,162.3,12.38,401,8,802,NULL),('W8L802B401P21',0.9982,0.015,10,0.39,3.18,7.55,0.74,0.43,64.9,22.8,2.92,401,8,802,NULL),('W8L802B401P22',0.9981,0.054,11.5,0.38,3.32,7.35,0.02,0.55,28.9,97.6,13.99,401,8,802,NULL),('W8L802B401P23',0.9963,0.015,11.8,0.4,3.54,8.58,0.64,0.27,54.3,46.9,14.24,401,8,802,NULL),('W8L802B401P24',0.9985,0.038,9,0.41,3.46,6.88,0.7,0.32,18.4,26.9,11.38,401,8,802,NULL),('W8L802B401P3',0.997,0.052,9.1,0.55,3.72,8.33,0.53,0.61,61.8,33.8,14.95,401,8,802,NULL),('W8L802B401P4',1.0025,0.078,10.8,0.81,3.04,6.04,0.41,0.19,15.7,34.8,15.54,401,8,802,NULL),('W8L802B401P5',1.0003,0.024,8.7,0.34,3.28,5.25,0.8,0.51,44.7,44.6,19.38,401,8,802,NULL),('W8L802B401P6',1.0035,0.084,9.2,0.91,3.15,9.16,0.16,0.69,24.2,13,12.67,401,8,802,NULL),('W8L802B401P7',0.9937,0.013,11,0.92,3.07,5.17,0.79,0.38,10,98.7,4.36,401,8,802,NULL),('W8L802B401P8',0.9942,0.058,10.2,0.36,3.51,5.61,0.47,0.29,8.1,166.3,8.32,401,8,802,NULL),('W8L802B401P9',1.0031,0.092,11,0.52,2.9,7.57,0.3,0.25,29.8,196.8,0.87,401,8,802,NULL),('W8L802B402P1',0.9901,0.096,11.9,0.3,2.96,8.99,0.59,0.19,28.9,141.5,7.44,402,8,802,NULL),('W8L802B402P10',0.9979,0.06,10.4,0.71,3.41,8.64,0.66,0.83,13,182.5,9.23,402,8,802,NULL),('W8L802B402P11',0.9923,0.033,8.6,0.85,3.55,7.8,0.36,0.13,50.9,38.1,9.75,402,8,802,NULL),('W8L802B402P12',0.9912,0.044,11.4,0.88,2.94,8.82,0.23,0.14,16,235.1,2.29,402,8,802,NULL),('W8L802B402P13',1.0034,0.014,11,0.86,2.87,7.2,0.4,0.19,26.1,193.9,8.24,402,8,802,NULL),('W8L802B402P14',0.9965,0.016,13.9,0.59,3.52,9.99,0.36,0.59,59.6,47.2,5.65,402,8,802,NULL),('W8L802B402P15',0.9906,0.051,13.9,0.51,3,5.15,0.57,0.78,54.8,53.4,7.37,402,8,802,NULL),('W8L802B402P16',0.9999,0.013,9.6,0.91,3.35,5.06,0.45,0.2,60.1,28.8,8.86,402,8,802,NULL),('W8L802B402P17',0.9947,0.011,10.3,0.77,3.42,6.5,0.53,0.19,20.5,145.9,19.17,402,8,802,NULL),('W8L802B402P18',0.992,0.017,11,0.91,3.43,8.69,0.77,0.68,65.2,127.2,9.63,402,8,802,NULL),('W8L802B402P19',0.9937,0.03,10.7,0.78,3.28,8.9,0.21,0.59,7.5,117.8,16.73,402,8,802,NULL),('W8L802B402P2',0.9987,0.079,8.2,0.84,3.24,6.96,0.46,0.73,51.2,221,16.17,402,8,802,NULL),('W8L802B402P20',0.9944,0.033,11.5,0.47,3.19,5.99,0.14,0.25,6,220.3,7.96,402,8,802,NULL),('W8L802B402P21',0.9936,0.012,12.6,0.49,3.68,5.94,0.07,0.22,16.1,86.5,5.5,402,8,802,NULL),('W8L802B402P22',0.9983,0.075,11.3,0.61,3.24,6.33,0.66,0.76,67.9,133.1,3.41,402,8,802,NULL),('W8L802B402P23',1.0012,0.036,8.6,0.44,2.9,5.49,0.55,0.55,62,239.1,3.12,402,8,802,NULL),('W8L802B402P24',0.9977,0.015,8.3,0.68,3.77,8.76,0.48,0.91,69.5,222.4,15.84,402,8,802,NULL),('W8L802B402P3',0.9904,0.024,8.9,0.76,2.84,5.14,0.4,0.45,43.1,214.5,9.93,402,8,802,NULL),('W8L802B402P4',1.0021,0.037,12.6,0.37,3.07,5.59,0.05,0.82,25.9,27.4,7.48,402,8,802,NULL),('W8L802B402P5',1,0.085,9.4,0.57,3.34,5.59,0.55,0.25,64.6,198.9,15.65,402,8,802,NULL),('W8L802B402P6',1.002,0.063,11.3,0.53,3.53,8.22,0.47,0.89,58.7,160.7,10.8,402,8,802,NULL),('W8L802B402P7',0.9938,0.079,9,0.5,2.93,5.95,0.41,0.9,10.8,34,3.47,402,8,802,NULL),('W8L802B402P8',0.9937,0.08,11,0.52,3.31,8.22,0.63,0.98,69.6,109.9,0.75,402,8,802,NULL),('W8L802B402P9',1.0039,0.029,12.8,0.77,3.78,8.5,0.37,0.83,28.8,147.3,13.38,402,8,802,NULL),('W8L802B403P1',1.0017,0.069,9.3,0.53,3.57,6.88,0.02,0.45,61.5,225.9,3.28,403,8,802,NULL),('W8L802B403P10',0.9928,0.052,12.3,0.47,3.71,6.75,0.6,0.4,22.3,51.5,1.65,403,8,802,NULL),('W8L802B403P11',1.0005,0.055,13.6,0.95,3.02,8.39,0.16,0.41,5.9,146.3,9.21,403,8,802,NULL),('W8L802B403P12',0.9929,0.077,11.5,0.9,3.07,6.35,0.41,0.27,24.8,108,4.71,403,8,802,NULL),('W8L802B403P13',1.0043,0.047,13.4,0.68,3.7,5.66,0.74,0.4,50.8,69.6,11.46,403,8,802,NULL),('W8L802B403P14',1.0034,0.029,13.4,0.92,3.7,6.19,0.02,0.24,43.6,235.3,2.42,403,8,802,NULL),('W8L802B403P15',0.9998,0.024,10.7,0.58,3.34,9.28,0.6,0.55,63.2,23.1,17,403,8,802,NULL),('W8L802B403P16',0.9921,0.091,11.9,0.6,3.69,7.71,0.04,0.22,12.3,64,1.94,403,8,802,NULL),('W8L802B403P17',0.9995,0.094,12.7,0.89,3.7,6.28,0.1,0.79,45.2,167.8,13.57,403,8,802,NULL),('W8L802B403P18',0.9952,0.069,8.8,0.57,3.68,9.3,0.5,0.1,36.5,229.2,10.95,403,8,802,NULL),('W8L802B403P19',0.9996,0.091,10,0.36,3.36,7.38,0.73,0.28,5.4,193.2,2.12,403,8,802,NULL),('W8L802B403P2',0.9965,0.015,8.2,0.7,3.45,5.77,0.33,0.71,43.8,210.3,3.95,403,8,802,NULL),('W8L802B403P20',1.0032,0.095,9.3,0.35,2.86,7.93,0.47,0.12,15.8,138.3,2.17,403,8,802,NULL),('W8L802B403P21',1.0045,0.019,11,0.6,3.75,7.89,0.01,0.65,24,125.3,11.32,403,8,802,NULL),('W8L802B403P22',0.9976,0.076,9.7,0.96,2.83,7.29,0.62,0.96,44.5,44.9,15.1,403,8,802,NULL),('W8L802B403P23',1.0021,0.087,10.9,0.56,2.96,6.27,0.16,0.1,23.1,217.7,14.52,403,8,802,NULL),('W8L802B403P24',0.994,0.042,8.3,0.67,3.07,5.95,0.56,0.13,24.9,191.7,12.49,403,8,802,NULL),('W8L802B403P25',1.0009,0.076,13.1,0.36,2.81,9.96,0.1,0.34,59.7,96.8,13.93,403,8,802,NULL),('W8L802B403P26',0.9937,0.019,12.3,0.46,3.17,6.85,0.07,0.47,54.4,22.8,2.89,403,8,802,NULL),('W8L802B403P27',1.0042,0.034,13.7,0.72,2.9,8.64,0.69,0.98,26.7,222.2,10.85,403,8,802,NULL),('W8L802B403P3',0.9953,0.027,11.3,0.8,3.56,9.72,0.46,0.99,22.9,39.3,5.3,403,8,802,NULL),('W8L802B403P4',0.9958,0.04,8.6,0.9,3.17,7.44,0.78,0.89,32.2,43.5,2.59,403,8,802,NULL),('W8L802B403P5',0.9963,0.024,8.4,0.51,3.1,7.37,0.43,0.45,38,15.4,5.05,403,8,802,NULL),('W8L802B403P6',0.9957,0.088,12.6,0.96,3.49,8.19,0.62,0.8,21.7,77.6,11.32,403,8,802,NULL),('W8L802B403P7',0.9907,0.073,13.9,0.97,2.97,7.16,0.73,0.99,54.8,206,5.68,403,8,802,NULL),('W8L802B403P8',0.9938,0.067,12.5,0.97,3.77,6.76,0.08,0.71,29.1,231.6,6.46,403,8,802,NULL),('W8L802B403P9',1.0041,0.024,8.7,0.63,3.38,5.24,0.16,0.85,48.6,161,14.24,403,8,802,NULL),('W8L802B404P1',1.0022,0.044,13.4,0.93,3.12,7.01,0.11,0.32,43.7,54.4,9.32,404,8,802,NULL),('W8L802B404P10',1.0006,0.084,12.3,0.35,3.45,6.53,0.07,0.65,42,189.9,15.97,404,8,802,NULL),('W8L802B404P11',0.9955,0.088,10.1,0.8,3.37,8.36,0.51,0.86,42.7,177.4,12.72,404,8,802,NULL),('W8L802B404P12',0.9908,0.068,10.1,0.76,2.96,9.94,0.61,0.98,16.7,12.9,17.29,404,8,802,NULL),('W8L802B404P13',1.002,0.046,8.2,0.5,3.44,9.43,0.15,0.62,50.9,219.8,11.9,404,8,802,NULL),('W8L802B404P14',0.9912,0.033,8.8,0.34,3.67,9.85,0,0.85,56.6,34.4,11.8,404,8,802,NULL),('W8L802B404P15',1.0036,0.062,9.6,0.39,3.1,9.8,0.7,0.56,48.7,14,2.92,404,8,802,NULL),('W8L802B404P16',0.9932,0.059,11.6,0.64,3.18,9.4,0.37,0.19,11.5,229.3,10.6,404,8,802,NULL),('W8L802B404P17',0.9926,0.062,11.7,0.83,3.18,8.81,0.6,0.18,43.7,114.5,8.35,404,8,802,NULL),('W8L802B404P18',1.0027,0.024,12,0.7,3.5,7.63,0.21,0.42,22.2,221.4,13.73,404,8,802,NULL),('W8L802B404P19',0.9921,0.054,9.3,0.65,3.07,8.45,0.34,0.87,7.5,20.2,15.99,404,8,802,NULL),('W8L802B404P2',0.9938,0.086,10.4,0.84,3.69,9.78,0.32,0.76,8.1,151.9,5.11,404,8,802,NULL),('W8L802B404P20',0.9919,0.083,10.3,0.87,3.13,8.51,0.6,0.92,8.1,77,10.43,404,8,802,NULL),('W8L802B404P21',1.0018,0.082,9.9,0.94,3.09,5.48,0.66,0.28,35.8,116.5,15.64,404,8,802,NULL),('W8L802B404P22',0.9937,0.014,12.7,0.58,3.64,5.33,0.17,0.6,37.7,24.8,4.62,404,8,802,NULL),('W8L802B404P23',1.001,0.04,10.4,0.93,3.59,8.54,0.31,0.5,27.7,132.9,2.6,404,8,802,NULL),('W8L802B404P3',0.9935,0.024,8.7,0.64,3.49,9.18,0.23,0.84,44.9,231.3,1.45,404,8,802,NULL),('W8L802B404P4',1.0042,0.016,9.4,0.3,3.67,8.92,0.07,0.53,47.2,10.5,1.54,404,8,802,NULL),('W8L802B404P5',0.9918,0.048,10.4,0.33,3.71,6.23,0.36,0.11,50,183,7.04,404,8,802,NULL),('W8L802B404P6',0.9928,0.062,10.8,0.69,2.99,5.14,0.45,0.35,14.5,212.9,5.45,404,8,802,NULL),('W8L802B404P7',0.9995,0.028,9,0.34,3.61,7.82,0.48,0.27,36,34.3,11.18,404,8,802,NULL),('W8L802B404P8',0.9986,0.065,13.1,0.93,3.49,9.17,0.63,0.15,13.9,205.5,12.03,404,8,802,NULL),('W8L802B404P9',0.9925,0.039,9.6,0.88,3.64,9.16,0.53,0.59,64.7,54.5,16.26,404,8,802,NULL),('W8L802B405P1',0.9953,0.033,13.1,0.62,3.31,9.51,0.44,0.39,27.4,43.4,12.32,405,8,802,NULL),('W8L802B405P10',1.0046,0.05,12.8,0.45,3.33,7.34,0.35,0.9,33.3,182.9,14.54,405,8,802,NULL),('W8L802B405P11',0.9915,0.061,10.5,0.56,2.91,6.49,0.07,0.84,12.4,170.9,19.71,405,8,802,NULL),('W8L802B405P12',0.9945,0.089,12.3,0.8,3.67,7.63,0.4,0.42,29.2,79.9,16.32,405,8,802,NULL),('W8L802B405P13',0.9904,0.073,12.9,0.37,3.41,8.46,0.02,0.1,62,81.3,16.41,405,8,802,NULL),('W8L802B405P14',0.9926,0.092,13.8,0.49,2.95,6.17,0.73,0.74,67.5,82.5,4.83,405,8,802,NULL),('W8L802B405P15',1.0012,0.093,9.8,0.93,3.31,8.08,0.45,0.11,42.3,110.7,7.95,405,8,802,NULL),('W8L802B405P16',0.9915,0.028,8.3,0.8,3.02,9.95,0.38,0.92,62.8,133.1,15.18,405,8,802,NULL),('W8L802B405P17',1.0024,0.047,8.3,0.33,2.84,7.44,0.64,0.66,12.5,56.9,10.02,405,8,802,NULL),('W8L802B405P18',0.9911,0.062,13.6,0.61,2.87,5.47,0.5,0.1,25.8,20.5,2.74,405,8,802,NULL),('W8L802B405P19',0.9961,0.068,8.3,0.48,3.53,9.54,0.66,0.65,53.2,25.2,2.65,405,8,802,NULL),('W8L802B405P2',0.9913,0.025,11.2,0.88,2.86,5.52,0.34,0.44,21,191.9,8.18,405,8,802,NULL),('W8L802B405P20',0.9969,0.018,9.6,0.45,3.61,5.44,0.43,0.83,43.1,162.7,1.8,405,8,802,NULL),('W8L802B405P3',0.9959,0.014,10.2,0.8,2.82,5.74,0.72,0.7,55.6,220.9,5.71,405,8,802,NULL),('W8L802B405P4',0.9985,0.068,11.1,0.44,3.34,6.82,0.61,0.56,5.9,182.3,12.78,405,8,802,NULL),('W8L802B405P5',1.0032,0.044,10.4,0.69,3.45,8.83,0.38,0.55,49,125.5,16.03,405,8,802,NULL),('W8L802B405P6',0.9905,0.034,8.9,0.45,3.73,6.79,0.37,0.37,55.6,180.9,8.26,405,8,802,NULL),('W8L802B405P7',1.0045,0.046,12.2,0.72,3.69,9.89,0.61,0.19,26.5,118.5,1.36,405,8,802,NULL),('W8L802B405P8',0.9962,0.031,13.8,0.82,3.37,7.67,0.32,0.3,13.1,181.3,8.21,405,8,802,NULL),('W8L802B405P9',0.9967,0.086,12,0.84,3.01,7.95,0.63,0.24,65.1,85.1,3.21,405,8,802,NULL),('W8L802B406P1',1,0.019,11.6,0.52,3.02,5.48,0.71,0.87,47.8,158.9,1.36,406,8,802,NULL),('W8L802B406P10',0.996,0.081,13.8,0.91,3.46,8.78,0.6,0.95,66.9,207.5,5.55,406,8,802,NULL),('W8L802B406P11',1.0033,0.049,11.6,0.46,3.07,6.48,0.26,0.86,53.5,162.6,18.39,406,8,802,NULL),('W8L802B406P12',1.0048,0.025,9.8,0.33,3.6,5.93,0.11,0.92,21.7,30.6,0.71,406,8,802,NULL),('W8L802B406P13',0.9931,0.093,12.9,0.74,3.1,7.8,0.09,0.9,33.6,75.3,17.34,406,8,802,NULL),('W8L802B406P14',0.997,0.064,10.8,0.9,3.55,8.91,0.67,0.75,29.2,248.6,16.01,406,8,802,NULL),('W8L802B406P15',1.0041,0.069,8.3,0.37,3.45,6.45,0.21,0.32,36.3,38.4,2.1,406,8,802,NULL),('W8L802B406P16',0.9972,0.054,9.2,0.71,3.42,6.67,0.43,0.36,9.1,191.7,18.55,406,8,802,NULL),('W8L802B406P17',0.9993,0.048,9.8,0.86,2.97,7.07,0.55,0.43,30.8,219.4,11.66,406,8,802,NULL),('W8L802B406P18',0.9971,0.012,10.7,0.4,3.54,6.67,0.59,0.93,27.1,51.8,18.69,406,8,802,NULL),('W8L802B406P19',0.9974,0.054,12.9,0.74,3.78,7.35,0.09,0.23,8.7,129.5,15.09,406,8,802,NULL),('W8L802B406P2',0.9907,0.067,9.7,0.37,3.59,8.53,0.18,0.9,11.1,40,17.05,406,8,802,NULL),('W8L802B406P20',0.9969,0.065,9.3,0.77,3.34,8.5,0.19,0.63,10.6,170.8,18.09,406,8,802,NULL),('W8L802B406P21',1.0024,0.034,11.8,0.92,2.93,7.69,0.46,0.71,53.4,57.9,16.82,406,8,802,NULL),('W8L802B406P3',0.9929,0.023,13.6,0.48,3.53,8.65,0.45,0.92,53.9,105.7,17.44,406,8,802,NULL),('W8L802B406P4',0.9999,0.013,13.6,0.89,2.88,9.58,0.64,0.53,55.7,78.4,19.75,406,8,802,NULL),('W8L802B406P5',1.0014,0.053,13.4,0.87,2.9,6.49,0.03,0.71,58.7,214.2,14.32,406,8,802,NULL),('W8L802B406P6',0.9963,0.078,10.1,0.88,3.76,5.91,0.01,0.54,7.4,123.1,19.69,406,8,802,NULL),('W8L802B406P7',1.0037,0.068,13.5,0.64,3.64,8.31,0.23,0.49,64.1,115.1,1.31,406,8,802,NULL),('W8L802B406P8',0.9924,0.042,9.1,0.99,3.61,6.79,0.59,0.13,58.1,183.5,3.96,406,8,802,NULL),('W8L802B406P9',1.0038,0.018,12.4,0.58,2.86,6.1,0.76,0.35,47.3,146.6,3.93,406,8,802,NULL),('W8L802B407P1',0.9953,0.029,12.1,0.69,3.55,9.25,0.41,0.12,40.3,17.6,15.01,407,8,802,NULL),('W8L802B407P10',1.0005,0.05,11.8,0.57,2.85,7.68,0.71,0.31,14.9,155.7,8.16,407,8,802,NULL),('W8L802B407P11',0.993,0.057,9.4,0.31,3.36,8.33,0.34,0.75,11.4,147.9,10.65,407,8,802,NULL),('W8L802B407P12',0.9929,0.013,8,0.78,3.52,8.89,0.13,0.76,49.7,49.3,17.6,407,8,802,NULL),('W8L802B407P13',0.9923,0.015,9.9,0.7,2.9,9.82,0.16,0.16,48.1,120.4,1.69,407,8,802,NULL),('W8L802B407P14',0.9942,0.077,13.6,0.72,2.94,6.63,0.18,0.29,35.5,110.3,13.37,407,8,802,NULL),('W8L802B407P15',1.0002,0.043,13.1,0.96,3.77,7.88,0.36,0.79,58.8,121.8,13.53,407,8,802,NULL),('W8L802B407P16',1.0032,0.099,10.4,0.45,3.36,7.93,0.46,0.89,53.6,156.5,9.97,407,8,802,NULL),('W8L802B407P17',0.9948,0.054,8.1,0.74,3.41,8.03,0.38,0.28,60.1,79.5,11.4,407,8,802,NULL),('W8L802B407P18',1.0036,0.055,8.9,0.37,3.56,6.09,0.37,0.41,35.3,135.4,2.16,407,8,802,NULL),('W8L802B407P19',0.9942,0.082,11.1,0.53,3.23,9.01,0.03,0.39,43.9,114.5,2.05,407,8,802,NULL),('W8L802B407P2',1.0016,0.085,8.5,0.79,3.46,9.32,0.08,0.53,49.2,246.9,13.04,407,8,802,NULL),('W8L802B407P20',1.0017,0.066,10.5,0.4,3.13,5.6,0.63,0.43,29.6,222,15.37,407,8,802,NULL),('W8L802B407P21',0.9955,0.021,13.1,0.69,2.92,6.89,0.64,0.87,25.5,73.8,5.25,407,8,802,NULL),('W8L802B407P22',1.0022,0.08,9.2,0.82,3.72,7.68,0.08,0.84,49.9,129.9,8.43,407,8,802,NULL),('W8L802B407P23',1.0037,0.018,9.4,0.9,3.1,9.38,0.39,0.3,45,13.9,16.48,407,8,802,NULL),('W8L802B407P24',0.9975,0.097,13.3,0.92,3.02,6.47,0.36,0.38,60.8,75.2,18.59,407,8,802,NULL),('W8L802B407P25',1.0021,0.011,10,0.86,3.16,5.14,0.77,0.23,55.4,184,2.74,407,8,802,NULL),('W8L802B407P26',0.9955,0.043,9.5,0.72,3.75,5.31,0.05,0.42,65.2,217.6,2.02,407,8,802,NULL),('W8L802B407P3',0.9967,0.018,8.2,0.58,3.15,8.76,0.66,0.84,33.7,241.7,9.83,407,8,802,NULL),('W8L802B407P4',0.9971,0.013,12,0.35,3.28,7.53,0.08,0.33,65.4,156.7,15.1,407,8,802,NULL),('W8L802B407P5',1.0001,0.095,8.2,0.95,2.99,5.57,0.07,0.17,22.2,209.3,19.55,407,8,802,NULL),('W8L802B407P6',1.0028,0.03,10.1,0.63,3.24,5.3,0.32,0.83,44.8,198.6,17.56,407,8,802,NULL),('W8L802B407P7',0.9929,0.075,13.5,0.49,3.59,8.73,0.59,0.25,59.2,186.9,2.55,407,8,802,NULL),('W8L802B407P8',1.0007,0.048,11.1,0.46,3.7,6.99,0.3,0.18,30.4,50.6,12.18,407,8,802,NULL),('W8L802B407P9',0.9945,0.09,9.5,0.31,3.36,5.6,0.71,0.14,8.1,223,5.21,407,8,802,NULL),('W8L802B408P1',1.0012,0.074,11.7,0.75,3.25,8.46,0.67,0.59,53.7,24.4,19,408,8,802,NULL),('W8L802B408P10',0.9946,0.019,11.9,0.64,3.55,8.7,0.35,0.63,23.6,118.1,0.87,408,8,802,NULL),('W8L802B408P11',0.9928,0.022,12.3,0.97,3.69,8.49,0.06,0.43,7,107.3,9.01,408,8,802,NULL),('W8L802B408P12',1.002,0.07,9.1,0.91,3.45,9.36,0.73,0.42,59.9,132.1,13.96,408,8,802,NULL),('W8L802B408P13',0.9958,0.037,9.1,0.67,2.88,7.04,0.6,0.26,46.2,11.7,3.76,408,8,802,NULL),('W8L802B408P14',0.9919,0.074,12.6,0.52,3.43,9.52,0.19,0.96,42,172.5,9.36,408,8,802,NULL),('W8L802B408P15',0.9984,0.071,10,0.76,3.6,8.12,0,0.43,59.7,141.4,6.33,408,8,802,NULL),('W8L802B408P16',0.9953,0.079,9.8,0.72,3.12,5.98,0.75,0.3,51.8,200.3,5.01,408,8,802,NULL),('W8L802B408P17',1.0034,0.093,8.4,1,3.65,8.65,0.48,0.4,38.5,181.9,3.59,408,8,802,NULL),('W8L802B408P18',1.0049,0.036,11.5,0.92,3.32,6.63,0.57,0.11,67.2,244,5.78,408,8,802,NULL),('W8L802B408P19',0.9982,0.042,11.7,0.55,3.71,8.23,0.24,0.46,6.2,16.2,14.37,408,8,802,NULL),('W8L802B408P2',0.9953,0.039,10.6,0.48,2.81,5.85,0.18,0.35,64.5,143.3,10.8,408,8,802,NULL),('W8L802B408P20',1.0023,0.038,12.5,0.59,3.03,7.04,0.41,0.11,10.2,12.5,7.63,408,8,802,NULL),('W8L802B408P21',0.9955,0.024,11.5,0.53,3.07,9.47,0.35,0.85,9.2,69.9,10.44,408,8,802,NULL),('W8L802B408P22',1.0032,0.078,13.4,0.37,3.15,8.6,0.25,0.44,7.5,145.4,9.62,408,8,802,NULL),('W8L802B408P23',0.9968,0.024,11.1,0.42,3.19,9.23,0.54,0.82,35.8,217.5,5.06,408,8,802,NULL),('W8L802B408P24',0.9958,0.021,13.2,0.72,3.25,5.21,0.12,0.64,13.4,216.6,12.38,408,8,802,NULL),('W8L802B408P3',1.0005,0.029,10.3,0.57,3.32,8.73,0.46,0.58,32.6,137.3,3.55,408,8,802,NULL),('W8L802B408P4',1.0038,0.085,12.6,0.32,3,5.76,0.32,0.38,43.3,19.1,5.75,408,8,802,NULL),('W8L802B408P5',1.0018,0.026,13.9,0.34,3.08,6.75,0.03,0.78,19.4,225.4,8.75,408,8,802,NULL),('W8L802B408P6',0.9972,0.049,8.2,0.92,3.06,9.19,0.64,0.23,13.6,46.2,2.73,408,8,802,NULL),('W8L802B408P7',0.9958,0.026,10.3,0.32,2.84,7.8,0.17,0.15,64.1,219,7.47,408,8,802,NULL),('W8L802B408P8',0.9986,0.039,13.2,0.89,3.18,5.11,0.15,0.6,18.2,97.8,2.58,408,8,802,NULL),('W8L802B408P9',0.9961,0.048,13.8,0.65,3.7,9.88,0.13,0.83,26.6,178.8,2.5,408,8,802,NULL),('W8L802B409P1',0.9912,0.046,10.4,0.54,3.1,5.97,0.39,0.17,58.3,239.1,13.25,409,8,802,NULL),('W8L802B409P10',0.9921,0.05,13.7,0.38,3.34,5.87,0.13,0.63,62,15.9,4.83,409,8,802,NULL),('W8L802B409P11',0.9904,0.039,11.3,0.82,3.02,6.86,0.22,0.83,50.6,134.8,9.21,409,8,802,NULL),('W8L802B409P12',1.0008,0.098,10.4,0.49,3.62,6.33,0.12,0.18,52.8,173,18.97,409,8,802,NULL),('W8L802B409P13',0.9928,0.026,10.9,0.54,2.9,9.42,0.44,0.29,14.6,89.3,11.51,409,8,802,NULL),('W8L802B409P14',0.9937,0.081,10.7,0.35,3.1,7.47,0.55,0.44,39,198.2,19.39,409,8,802,NULL),('W8L802B409P15',0.9937,0.023,9.7,0.93,2.84,7.33,0.62,0.79,53.5,77.3,11.87,409,8,802,NULL),('W8L802B409P16',0.9966,0.061,10.4,0.42,3.79,7.45,0.66,0.41,37,216.5,11.09,409,8,802,NULL),('W8L802B409P17',1.0004,0.028,13.8,0.62,2.89,9.4,0.26,0.17,50.3,94.5,6.39,409,8,802,NULL),('W8L802B409P18',0.9963,0.098,13.5,0.32,3.51,8.92,0.04,0.36,16.9,24,1.98,409,8,802,NULL),('W8L802B409P19',0.9933,0.057,12.4,0.46,3.31,8.55,0.17,0.74,52,160.7,16.93,409,8,802,NULL),('W8L802B409P2',0.9908,0.09,9.1,0.53,2.85,9.71,0.27,0.82,24,151.6,0.82,409,8,802,NULL),('W8L802B409P20',0.9969,0.041,9.3,0.95,3.23,8.81,0.61,0.97,6.4,87.8,6.91,409,8,802,NULL),('W8L802B409P21',0.9938,0.095,8,0.8,2.97,6.84,0.66,0.41,15.7,244.5,5.76,409,8,802,NULL),('W8L802B409P22',0.9957,0.086,13.1,0.7,3.24,9.9,0.58,0.99,66.5,204,11.08,409,8,802,NULL),('W8L802B409P23',1.002,0.067,12.5,0.71,2.86,6.7,0.49,0.56,20,137.5,1.61,409,8,802,NULL),('W8L802B409P24',1.0031,0.021,11.1,0.7,3.48,9.29,0.11,0.63,49.3,192.8,14.78,409,8,802,NULL),('W8L802B409P25',0.9914,0.095,8.5,0.67,3.78,7.75,0.77,0.94,51.9,12,8.6,409,8,802,NULL),('W8L802B409P26',0.9935,0.039,12.1,0.62,2.89,8.52,0.53,0.31,27.1,77.6,16.37,409,8,802,NULL),('W8L802B409P27',0.9977,0.025,12.9,0.9,3.63,7,0.76,0.61,51.1,133.1,12.65,409,8,802,NULL),('W8L802B409P28',0.9946,0.091,12.8,0.41,2.85,7,0.66,0.9,33.8,202.8,7.13,409,8,802,NULL),('W8L802B409P29',0.9985,0.074,12.6,0.89,3.38,7.61,0.33,0.24,31.3,167.5,6.99,409,8,802,NULL),('W8L802B409P3',0.9941,0.092,12.7,0.72,3.73,8.88,0.21,0.46,7.4,198.1,18.54,409,8,802,NULL),('W8L802B409P30',0.994,0.059,13.2,0.7,3.46,6.86,0.04,0.64,49.3,106.5,9.93,409,8,802,NULL),('W8L802B409P31',0.9913,0.01,12.3,0.55,3.22,5.67,0.55,0.32,27.3,71.8,2.28,409,8,802,NULL),('W8L802B409P4',0.9978,0.1,13.8,0.41,3.05,5.93,0.63,0.52,50,14.9,10.97,409,8,802,NULL),('W8L802B409P5',1.0022,0.087,11.4,0.68,3.47,6.36,0.6,0.34,39.9,230.8,19.18,409,8,802,NULL),('W8L802B409P6',1.0006,0.024,9.3,0.93,3.47,9.44,0.53,0.81,14.9,67,12.72,409,8,802,NULL),('W8L802B409P7',1.0033,0.011,11.3,0.39,2.84,9.99,0.23,0.55,26.8,14.8,17.77,409,8,802,NULL),('W8L802B409P8',0.9988,0.015,9.7,0.35,3.31,9.5,0.69,0.91,35.3,189.6,17.56,409,8,802,NULL),('W8L802B409P9',0.9918,0.04,11.5,0.48,2.84,9.81,0.52,0.13,14.9,40.2,7.4,409,8,802,NULL),('W8L802B410P1',1.0022,0.049,10,0.94,3.25,7.44,0.34,0.16,5.3,16.5,3.63,410,8,802,NULL),('W8L802B410P10',1.0019,0.057,10.5,0.74,3.33,6.36,0.01,0.17,20.4,218.2,13.3,410,8,802,NULL),('W8L802B410P11',1.003,0.06,10.6,0.52,2.87,8.53,0.28,0.19,64.9,198.5,5.85,410,8,802,NULL),('W8L802B410P12',1.0045,0.069,12.7,0.41,2.93,5.29,0.5,0.29,35.8,66.5,8.89,410,8,802,NULL),('W8L802B410P13',0.9955,0.035,12.9,0.74,3.04,8.16,0.13,0.94,41.7,175.2,18.23,410,8,802,NULL),('W8L802B410P14',0.9964,0.042,10.4,0.65,3.71,6.96,0.06,0.61,42.7,192.2,13.11,410,8,802,NULL),('W8L802B410P15',0.9939,0.031,11.9,0.65,3.78,5.05,0.08,0.74,45.6,166.7,4.8,410,8,802,NULL),('W8L802B410P2',0.9909,0.021,12,0.45,2.84,9.2,0.25,0.91,61.1,185.5,8.76,410,8,802,NULL),('W8L802B410P3',0.9946,0.025,10.7,0.6,3.44,5.22,0.05,0.3,64.1,148.3,4.84,410,8,802,NULL),('W8L802B410P4',1.0008,0.074,9.1,0.58,3.5,9.6,0.55,0.36,11.7,224.7,5.51,410,8,802,NULL),('W8L802B410P5',1.0003,0.056,13.2,0.58,3,5.05,0.56,0.68,51.4,17.1,15.58,410,8,802,NULL),('W8L802B410P6',1.0038,0.097,13.8,0.64,3.22,5.12,0.2,0.95,37.7,118.4,3.31,410,8,802,NULL),('W8L802B410P7',0.992,0.095,12.8,0.35,3.41,5.51,0.66,0.86,10.5,111.8,4.94,410,8,802,NULL),('W8L802B410P8',0.9971,0.1,12.4,0.62,3.65,9.98,0.38,1,8.9,164.9,8.34,410,8,802,NULL),('W8L802B410P9',0.9928,0.038,12,0.66,3.72,9.79,0.06,0.54,48.4,246.3,16.01,410,8,802,NULL),('W8L803B520P1',0.9911,0.094,11.9,0.31,3.05,5.44,0.01,0.25,9.5,83.6,18.69,520,8,803,NULL),('W8L803B520P10',1.0022,0.021,11.7,0.88,3.22,8.66,0.75,0.7,10,243.2,6.88,520,8,803,NULL),('W8L803B520P11',0.9916,0.098,11.8,0.81,2.84,9.7,0.26,0.55,22.3,126.2,9.12,520,8,803,NULL),('W8L803B520P12',1.0021,0.024,13.6,0.33,3.14,5.48,0.49,0.17,24.6,231.1,7.9,520,8,803,NULL),('W8L803B520P13',0.9926,0.097,9.4,0.99,3.6,9.45,0.16,0.79,47.9,77.9,5.65,520,8,803,NULL),('W8L803B520P14',0.9968,0.098,12.8,0.93,3.08,7.29,0.03,0.34,29.8,68.5,11.6,520,8,803,NULL),('W8L803B520P15',0.9985,0.02,11,0.35,3.61,8.54,0.68,0.96,56.2,212.5,19.6,520,8,803,NULL),('W8L803B520P16',0.9946,0.031,12.8,0.83,3.11,6.56,0.16,0.52,25.8,64.1,4.5,520,8,803,NULL),('W8L803B520P17',1.0029,0.039,10.3,0.6,3.07,8.81,0.31,0.24,33.9,73.5,3.5,520,8,803,NULL),('W8L803B520P18',1.0036,0.055,8.8,0.45,2.91,7.58,0.3,0.81,26.9,142.7,16.92,520,8,803,NULL),('W8L803B520P19',1.0026,0.072,9.4,0.83,3.05,8.1,0.1,0.62,53.3,181.4,11.07,520,8,803,NULL),('W8L803B520P2',0.9936,0.056,10.4,0.71,3.2,8.81,0.68,0.65,6.3,19.9,6.97,520,8,803,NULL),('W8L803B520P20',0.9919,0.024,11.8,0.87,3.72,8.34,0.23,0.57,37.4,71.6,14.51,520,8,803,NULL),('W8L803B520P21',1.0002,0.061,9.8,0.38,3.24,9.84,0.45,0.85,9.5,41.9,14.4,520,8,803,NULL),('W8L803B520P22',0.9988,0.032,10.8,0.4,3.03,8.4,0.14,0.12,43.4,196.8,0.9,520,8,803,NULL),('W8L803B520P23',1.0029,0.017,9.9,0.54,3.47,8.56,0.11,0.74,45.3,156.1,7.21,520,8,803,NULL),('W8L803B520P24',1.0046,0.017,10.5,0.63,3.01,7.46,0.07,0.98,31.4,35.6,1.11,520,8,803,NULL),('W8L803B520P25',1.0006,0.07,10,0.44,2.85,7.61,0.67,0.74,62.9,214.6,7.12,520,8,803,NULL),('W8L803B520P26',1.0015,0.042,12.5,0.88,3.63,7.34,0.76,0.23,26.4,128.4,10.42,520,8,803,NULL),('W8L803B520P27',0.9929,0.068,8.3,0.73,3.24,7.09,0.04,0.5,65.2,152,4.31,520,8,803,NULL),('W8L803B520P3',0.9996,0.013,8.4,0.96,3.39,6.02,0.75,0.51,53.4,48.9,10.38,520,8,803,NULL),('W8L803B520P4',0.9958,0.04,13.2,0.65,3.36,7.2,0.52,0.48,37.9,227.4,18.82,520,8,803,NULL),('W8L803B520P5',1.0037,0.089,13.1,0.35,3.06,8.92,0.47,0.71,39.7,220.7,11.06,520,8,803,NULL),('W8L803B520P6',0.9978,0.076,8.5,0.42,3.74,5.65,0.05,0.27,52.3,101.2,12.6,520,8,803,NULL),('W8L803B520P7',0.9919,0.025,8.6,0.98,3.04,7.79,0.58,0.72,11.1,197.2,0.68,520,8,803,NULL),('W8L803B520P8',0.9998,0.082,12,0.71,3.55,5.61,0,0.44,61.4,97.6,13.39,520,8,803,NULL),('W8L803B520P9',1.0032,0.069,9.4,0.6,2.9,8.42,0.41,0.78,63.9,180.2,15.07,520,8,803,NULL),('W8L803B521P1',0.9925,0.059,13.4,0.81,2.81,6.82,0.07,0.34,41.4,127.8,12.49,521,8,803,NULL),('W8L803B521P10',1.0003,0.07,11.8,0.85,3.07,8.95,0.26,0.19,30.4,158.2,3.18,521,8,803,NULL),('W8L803B521P11',0.9969,0.045,13.2,0.95,3.77,6.72,0.76,0.91,61.6,223.2,3.38,521,8,803,NULL),('W8L803B521P12',0.9943,0.015,9.9,0.47,3.33,7.79,0.18,0.5,34.3,102.6,9.2,521,8,803,NULL),('W8L803B521P13',1.002,0.018,9.3,0.71,3.64,8.28,0.61,0.46,56.6,233.8,17.11,521,8,803,NULL),('W8L803B521P14',0.9915,0.063,13.2,0.51,2.98,8.24,0.46,0.45,48.9,243.3,8.41,521,8,803,NULL),('W8L803B521P15',0.9918,0.062,12,0.49,2.99,9.81,0.4,0.86,32,178.4,15.02,521,8,803,NULL),('W8L803B521P16',0.9936,0.033,9.8,0.57,3.73,9.91,0.51,0.82,41.7,234.1,3.64,521,8,803,NULL),('W8L803B521P17',0.9964,0.063,9.2,0.54,3.45,6.91,0.65,0.16,29.2,16.4,10.94,521,8,803,NULL),('W8L803B521P18',0.9901,0.041,12.7,0.46,3.58,8.98,0.43,0.48,12.4,139.3,7.83,521,8,803,NULL),('W8L803B521P19',1.0043,0.071,13.5,0.46,3.45,9.36,0.11,0.58,13.5,132.3,11.52,521,8,803,NULL),('W8L803B521P2',0.9994,0.041,8.1,0.96,3.77,8.79,0.15,0.42,41.6,28.9,15.15,521,8,803,NULL),('W8L803B521P20',0.9936,0.082,13.6,0.88,3.69,9.3,0.39,0.22,8.1,157.7,1.07,521,8,803,NULL),('W8L803B521P21',0.9984,0.099,11.1,0.93,2.86,9.83,0.56,0.85,61.1,17.7,2.19,521,8,803,NULL),('W8L803B521P22',0.994,0.095,13.1,0.7,3.38,6.36,0.2,0.31,30.2,19.7,13.74,521,8,803,NULL),('W8L803B521P23',0.9935,0.016,11.8,0.52,3.5,8.29,0.37,0.9,57.8,222.7,19.52,521,8,803,NULL),('W8L803B521P24',0.9975,0.023,10.4,0.39,3.78,6.83,0.23,0.92,31.4,224.8,14.72,521,8,803,NULL),('W8L803B521P25',0.9942,0.061,11.2,0.81,3.04,5.92,0.48,0.44,38.2,223.1,14.34,521,8,803,NULL),('W8L803B521P26',1.0015,0.028,8.1,0.57,3.67,5.63,0.32,0.85,59.3,157,14.76,521,8,803,NULL),('W8L803B521P3',1.0003,0.023,12.6,0.34,3.53,7.22,0.07,0.23,30.8,249.1,18.78,521,8,803,NULL),('W8L803B521P4',1.0028,0.017,11.1,0.92,3.52,8.51,0,0.25,39.4,55.5,18.82,521,8,803,NULL),('W8L803B521P5',1.0032,0.065,8.9,0.3,3.11,6.87,0.73,0.21,70,58.5,14.01,521,8,803,NULL),('W8L803B521P6',1.0045,0.025,9.6,0.4,2.82,7.93,0.72,0.11,57.2,141.3,13.01,521,8,803,NULL),('W8L803B521P7',0.9948,0.034,13.7,0.68,3.13,8.12,0.47,0.97,38.9,249,6.66,521,8,803,NULL),('W8L803B521P8',1.0039,0.075,9.5,0.67,3.17,8.19,0.57,0.26,57,217.1,7.56,521,8,803,NULL),('W8L803B521P9',1.0042,0.019,9.9,0.58,2.88,6.79,0.63,0.17,54.5,49.7,14.58,521,8,803,NULL),('W8L803B522P1',0.9999,0.089,11,0.99,3.13,6.79,0.04,0.38,13.5,178.1,9.93,522,8,803,NULL),('W8L803B522P10',0.9994,0.014,11.6,0.89,3.26,7.37,0.65,0.33,16.6,64.7,19.93,522,8,803,NULL),('W8L803B522P11',0.9939,0.018,8.9,0.4,2.88,9.69,0.44,0.49,25.2,180,5.34,522,8,803,NULL),('W8L803B522P12',0.9902,0.023,8.1,0.84,2.84,9.46,0.68,1,19.5,87,0.65,522,8,803,NULL),('W8L803B522P13',0.9981,0.054,9.9,0.95,3.09,6.44,0.66,0.75,24.7,150.1,9.45,522,8,803,NULL),('W8L803B522P14',0.9991,0.039,12.6,0.57,3.15,6.63,0.01,0.92,27.2,130.1,16.12,522,8,803,NULL),('W8L803B522P15',0.9914,0.068,8.3,0.74,3.7,8.4,0.35,0.53,16.1,27.5,7.57,522,8,803,NULL),('W8L803B522P16',1.005,0.063,12.3,0.62,2.87,7.03,0.62,0.57,17.9,61.3,19.55,522,8,803,NULL),('W8L803B522P17',1.0033,0.092,11.7,0.57,3.54,9.3,0.1,0.92,37.2,36.9,0.64,522,8,803,NULL),('W8L803B522P18',0.998,0.055,9.7,0.73,3.06,7.59,0.38,0.64,42.7,208.4,19.49,522,8,803,NULL),('W8L803B522P19',1.0002,0.042,8.2,0.92,3.62,8.99,0.65,0.34,39.2,229.3,18.58,522,8,803,NULL),('W8L803B522P2',0.9914,0.05,12.6,0.98,3.42,8.05,0.62,0.46,23.4,91.7,5.83,522,8,803,NULL),('W8L803B522P20',1.0016,0.062,13.7,0.32,3.42,6.01,0.34,0.25,24.8,113.9,14.17,522,8,803,NULL),('W8L803B522P21',0.9907,0.03,8.9,0.79,3.42,7.22,0.65,0.2,6.4,105.1,1.49,522,8,803,NULL),('W8L803B522P22',0.9964,0.062,13.3,0.72,3.77,6.6,0.12,0.98,70,160,17.52,522,8,803,NULL),('W8L803B522P23',0.9999,0.068,9.6,0.7,3.18,6.67,0.42,0.4,20,43.5,6.96,522,8,803,NULL),('W8L803B522P24',0.9941,0.034,12.3,0.85,3.49,7.59,0.23,0.37,61.1,85.2,3.99,522,8,803,NULL),('W8L803B522P25',1.0019,0.057,10.8,0.93,3.49,6.35,0.75,0.66,45.8,108,10.17,522,8,803,NULL),('W8L803B522P26',0.9948,0.022,12.7,0.7,3.05,6.35,0.76,0.64,65.7,180.1,1.45,522,8,803,NULL),('W8L803B522P27',0.9929,0.077,9,0.56,2.89,7.12,0.7,0.22,60.4,215.3,15.47,522,8,803,NULL),('W8L803B522P28',0.9991,0.023,13.8,0.59,3.28,5.45,0.53,0.76,46,163.4,16.03,522,8,803,NULL),('W8L803B522P29',0.9982,0.076,10.2,0.7,2.89,6.7,0.34,0.59,8.1,147.6,10.23,522,8,803,NULL),('W8L803B522P3',0.9933,0.049,12.3,0.43,3.68,5.79,0.31,0.15,48.7,96.4,5.26,522,8,803,NULL),('W8L803B522P4',0.9968,0.081,14,0.72,3.49,5.13,0.34,0.97,16.9,56,6.29,522,8,803,NULL),('W8L803B522P5',0.9995,0.056,10.3,0.58,3.75,6.52,0.15,0.8,65.2,131.7,7.68,522,8,803,NULL),('W8L803B522P6',1.0047,0.089,14,0.31,2.93,8.79,0.52,0.75,46.9,143.2,5.83,522,8,803,NULL),('W8L803B522P7',0.9999,0.019,10.1,0.65,3.4,7.75,0.67,0.37,12.5,127.5,3.69,522,8,803,NULL),('W8L803B522P8',0.9978,0.056,13.3,0.9,2.94,9.11,0.03,0.82,16.2,115.4,6.65,522,8,803,NULL),('W8L803B522P9',0.9904,0.071,10.9,0.87,3.76,8.9,0.32,0.14,37.2,128.3,18.18,522,8,803,NULL),('W8L803B523P1',0.9931,0.029,13.6,0.4,3.45,7.42,0.67,0.32,24,81.5,16.26,523,8,803,NULL),('W8L803B523P10',0.9945,0.057,12.2,0.84,2.91,9.22,0.71,0.82,49.1,73.3,8.32,523,8,803,NULL),('W8L803B523P11',1.0032,0.083,8.4,0.59,3.56,7.97,0.6,0.91,63.1,17.2,16.11,523,8,803,NULL),('W8L803B523P12',1.0012,0.025,8,0.53,3.05,7.61,0.19,0.15,17.1,182.7,18.8,523,8,803,NULL),('W8L803B523P13',1.0008,0.075,10.6,0.36,3.46,5.78,0.53,0.97,9.5,10.2,18.33,523,8,803,NULL),('W8L803B523P14',0.9986,0.071,9,0.34,3.34,6.49,0.47,0.74,52.2,233.9,11.17,523,8,803,NULL),('W8L803B523P15',1.0048,0.045,12,0.63,2.95,5.03,0.5,0.42,23.5,41,17.82,523,8,803,NULL),('W8L803B523P16',1.0002,0.076,10.5,0.44,3.7,6.62,0.19,0.15,46.4,172,1.18,523,8,803,NULL),('W8L803B523P17',0.996,0.069,10.7,0.48,3.14,9,0.8,0.99,17,142.9,10.07,523,8,803,NULL),('W8L803B523P18',0.9956,0.085,13,0.31,3.6,7.97,0.78,0.24,42.4,67.8,0.86,523,8,803,NULL),('W8L803B523P19',0.9955,0.053,11.7,0.92,3.46,5.69,0.56,0.15,22.3,193.7,6.36,523,8,803,NULL),('W8L803B523P2',0.9963,0.085,13,0.35,3.64,8.2,0.73,0.34,39.5,129.8,15.54,523,8,803,NULL),('W8L803B523P20',0.9933,0.034,13.5,0.67,3.35,8.59,0.41,0.87,60.5,192.7,12.54,523,8,803,NULL),('W8L803B523P21',1.0045,0.054,11.9,0.87,3.6,7.51,0.24,0.81,53.4,57,5.65,523,8,803,NULL),('W8L803B523P22',0.9963,0.027,8.1,0.8,3.56,8.57,0.34,0.41,67.3,22.5,9.58,523,8,803,NULL),('W8L803B523P23',0.9925,0.04,11.5,0.31,3.64,5.14,0.29,0.73,53.3,197.3,17.71,523,8,803,NULL),('W8L803B523P24',0.9923,0.054,13.1,0.42,3.19,9.49,0.67,0.98,42.7,185.5,14.98,523,8,803,NULL),('W8L803B523P25',0.9988,0.031,13.7,0.97,3.16,7.07,0.29,0.78,17.3,31.6,8.07,523,8,803,NULL),('W8L803B523P26',0.9949,0.019,12.3,0.91,2.93,9.36,0.06,0.94,11.7,54.8,19.97,523,8,803,NULL),('W8L803B523P27',1.003,0.057,13.1,0.68,3.7,7.9,0.58,0.48,12.2,126.6,10.74,523,8,803,NULL),('W8L803B523P28',0.9967,0.071,10.3,0.99,3.45,9.83,0.04,0.42,59.5,17,10.84,523,8,803,NULL),('W8L803B523P29',0.9916,0.076,10.8,0.53,2.95,6.03,0.25,0.8,14.6,46.1,2.99,523,8,803,NULL),('W8L803B523P3',0.9952,0.026,10.2,0.84,3.68,7.73,0.64,0.18,54.7,148.3,15.48,523,8,803,NULL),('W8L803B523P4',1.0041,0.079,8.3,0.49,3.04,5.69,0.49,0.81,14.3,101,19.29,523,8,803,NULL),('W8L803B523P5',0.9982,0.092,10.2,0.51,3.5,6.74,0.51,0.45,25.1,45.4,1.38,523,8,803,NULL),('W8L803B523P6',1.0008,0.021,13.8,0.62,3.12,9.36,0.52,0.43,61.4,143,6.25,523,8,803,NULL),('W8L803B523P7',0.9918,0.032,8.3,0.33,3.75,8.8,0.22,0.49,8.3,113.8,15.07,523,8,803,NULL),('W8L803B523P8',0.998,0.077,9.2,0.96,3.19,7.12,0.7,0.27,49.1,124.1,3.34,523,8,803,NULL),('W8L803B523P9',0.9974,0.04,12,0.91,3.44,6.72,0.39,0.52,57,16.6,18.5,523,8,803,NULL),('W8L803B524P1',0.9906,0.093,10.3,0.47,2.99,6.98,0.47,0.25,36.3,212.4,13.11,524,8,803,NULL),('W8L803B524P10',0.9997,0.063,8.9,1,2.84,9.13,0.57,0.72,41.2,223.3,15.18,524,8,803,NULL),('W8L803B524P11',0.9901,0.086,12.6,0.62,3.16,6.02,0.25,0.43,32.7,24.4,7.3,524,8,803,NULL),('W8L803B524P12',0.9927,0.094,11,0.48,3.18,5.11,0.04,0.63,7.5,156.4,7.66,524,8,803,NULL),('W8L803B524P13',0.995,0.034,13.7,0.75,3.28,6.61,0.04,0.51,7.2,35.3,2.92,524,8,803,NULL),('W8L803B524P14',0.9994,0.044,12.3,0.47,3.79,6.65,0.72,0.34,17.3,135.4,6.55,524,8,803,NULL),('W8L803B524P15',0.9998,0.099,10.5,0.88,3.45,6,0.33,0.11,49.4,156.1,17.49,524,8,803,NULL),('W8L803B524P16',0.9961,0.068,13.4,0.89,3.24,8.97,0.76,0.51,12.3,167.1,14.06,524,8,803,NULL),('W8L803B524P17',0.9962,0.022,13.1,0.5,3.65,5.79,0.07,0.77,20.1,37.4,11.65,524,8,803,NULL),('W8L803B524P18',1.0034,0.035,10.4,0.6,3.49,7.23,0.01,0.18,58.7,110.8,10.14,524,8,803,NULL),('W8L803B524P19',0.998,0.069,8.3,0.79,3.03,8.01,0.06,0.38,61.2,26.9,10.55,524,8,803,NULL),('W8L803B524P2',1.0043,0.049,10.8,0.36,2.87,8.26,0.71,0.62,38.2,156.7,14.69,524,8,803,NULL),('W8L803B524P20',0.9937,0.08,14,1,3.18,6.66,0.02,0.13,35.6,83.1,7.49,524,8,803,NULL),('W8L803B524P21',0.997,0.036,13.1,0.39,2.9,6.11,0.39,0.47,28.4,186.6,17.7,524,8,803,NULL),('W8L803B524P22',0.9917,0.064,11.2,0.44,3.4,8.69,0.55,0.33,7.7,87,9.21,524,8,803,NULL),('W8L803B524P3',0.9904,0.052,12.9,0.36,3.14,6.36,0.78,0.88,42.2,10.6,10.15,524,8,803,NULL),('W8L803B524P4',1.0047,0.07,9.2,0.33,3.25,8.84,0.59,0.57,17.1,97.5,11.28,524,8,803,NULL),('W8L803B524P5',0.9948,0.083,9.2,0.34,3.4,9.7,0.01,0.59,26.3,141.7,4.93,524,8,803,NULL),('W8L803B524P6',0.9902,0.096,9.5,0.78,2.99,7.46,0.65,0.94,68,208.3,1.21,524,8,803,NULL),('W8L803B524P7',1.0017,0.075,13.1,0.96,3.45,5.63,0.71,0.82,34.3,137.4,17.85,524,8,803,NULL),('W8L803B524P8',0.991,0.016,13,0.93,3.62,6.84,0.17,0.26,56.6,51.3,10.12,524,8,803,NULL),('W8L803B524P9',0.9956,0.086,13,0.84,2.81,6.91,0.55,0.79,40.6,240.3,12.33,524,8,803,NULL),('W8L803B525P1',0.9977,0.011,13.5,0.82,2.99,8.68,0.05,0.93,28,13.5,8.82,525,8,803,NULL),('W8L803B525P10',1.0018,0.079,13.3,1,3.54,6.99,0.49,0.77,64.9,158.9,1.26,525,8,803,NULL),('W8L803B525P11',0.9935,0.069,13.7,0.44,3.14,6.09,0.14,0.35,18.6,174.7,5.83,525,8,803,NULL),('W8L803B525P12',0.999,0.066,12.5,0.37,3.34,8.51,0.42,0.75,9.2,77.6,7.42,525,8,803,NULL),('W8L803B525P13',0.9916,0.023,12.4,0.6,2.92,8.13,0.73,0.41,59.6,185.8,4.79,525,8,803,NULL),('W8L803B525P14',1.0019,0.025,14,0.96,3.73,9.97,0.36,0.35,22.6,208.9,12.33,525,8,803,NULL),('W8L803B525P15',0.9943,0.055,13,0.88,3,9.77,0.78,0.77,57.1,169.1,6.88,525,8,803,NULL),('W8L803B525P16',0.9982,0.055,12.7,0.64,2.98,6.22,0.43,0.82,9.1,229,9.33,525,8,803,NULL),('W8L803B525P17',1.0032,0.038,11.3,0.53,3.21,5.7,0.46,0.55,40,169,11.8,525,8,803,NULL),('W8L803B525P18',0.9974,0.021,9.8,0.5,3.7,6.04,0.11,0.83,54.6,122.2,7.35,525,8,803,NULL),('W8L803B525P19',0.9957,0.081,12.5,0.92,3.62,9.21,0.78,0.87,48.8,157.4,15.31,525,8,803,NULL),('W8L803B525P2',0.9945,0.046,8.1,0.85,2.94,6.08,0.07,0.9,41.9,200.9,9.12,525,8,803,NULL),('W8L803B525P20',0.9928,0.026,9.5,0.48,3.05,5.47,0.74,0.88,60.5,139.5,10.69,525,8,803,NULL),('W8L803B525P21',0.9985,0.068,13.9,0.52,2.8,8.89,0.05,0.26,51.8,169.5,4.9,525,8,803,NULL),('W8L803B525P22',0.9994,0.095,9.8,0.37,3.22,6.59,0.34,0.73,48.9,130.9,17.05,525,8,803,NULL),('W8L803B525P3',1.0027,0.081,13.6,0.78,3.3,5.19,0.45,0.52,7,212.7,17.62,525,8,803,NULL),('W8L803B525P4',0.9997,0.021,9.7,0.39,2.87,5.61,0.72,0.48,32,201.9,9.03,525,8,803,NULL),('W8L803B525P5',0.995,0.098,10.8,0.46,3.18,5.81,0.33,1,20.7,98.6,19.24,525,8,803,NULL),('W8L803B525P6',0.9901,0.085,10.1,0.68,3.42,8.58,0.27,0.3,26.4,135.6,10.46,525,8,803,NULL),('W8L803B525P7',0.99,0.082,13.8,0.93,3.25,6.2,0.34,0.31,17.2,46,8.58,525,8,803,NULL),('W8L803B525P8',0.9929,0.035,11.9,0.33,2.9,9.51,0.52,0.18,57.7,118.7,6.01,525,8,803,NULL),('W8L803B525P9',1.0014,0.085,8.4,0.31,3.63,5.48,0.27,0.87,12.8,198.2,10.21,525,8,803,NULL),('W8L803B526P1',0.99,0.094,11.6,0.69,3.19,8.26,0.1,0.49,65.7,97.3,14.32,526,8,803,NULL),('W8L803B526P10',1.0015,0.016,10.9,0.94,3.07,5.66,0.59,0.49,48.7,238.9,5.82,526,8,803,NULL),('W8L803B526P11',0.9956,0.096,11.5,0.38,3.61,7.43,0.54,0.16,51.4,202.5,11.9,526,8,803,NULL),('W8L803B526P12',0.9933,0.046,13.7,0.98,3.25,7.63,0.29,0.42,59.3,240.2,14.75,526,8,803,NULL),('W8L803B526P13',1.0014,0.058,9.3,0.48,2.9,5.15,0.68,1,52.5,113.2,3.34,526,8,803,NULL),('W8L803B526P14',1.0035,0.092,13.5,0.47,3.42,5.06,0.11,0.19,30.2,210.7,7.67,526,8,803,NULL),('W8L803B526P15',1.0017,0.058,13.8,0.33,3.55,9.66,0.77,0.24,27.9,117.2,10.89,526,8,803,NULL),('W8L803B526P16',1.0025,0.073,13.9,0.74,3.08,9.75,0.71,0.31,37.8,249.2,19.15,526,8,803,NULL),('W8L803B526P17',1.0049,0.047,12.2,0.6,3.48,7.85,0.13,0.85,45.7,59.4,9.53,526,8,803,NULL),('W8L803B526P18',0.996,0.083,13.4,0.9,2.99,5.93,0.48,0.7,51,88.7,17.56,526,8,803,NULL),('W8L803B526P19',1.0024,0.075,12,0.59,2.94,6.02,0.64,0.5,8.5,225,9.43,526,8,803,NULL),('W8L803B526P2',0.9994,0.063,11.3,0.93,3.07,6.03,0.26,0.38,61.5,153.6,15.13,526,8,803,NULL),('W8L803B526P20',1.0019,0.1,9.8,0.41,3.44,5.45,0.19,0.29,27.5,47.2,1.17,526,8,803,NULL),('W8L803B526P21',1.0007,0.081,12.1,0.83,3.67,5.97,0.35,0.29,57.1,52.1,17.39,526,8,803,NULL),('W8L803B526P22',0.9994,0.023,13,0.75,3.37,7.15,0.6,0.36,27.7,92.5,18.3,526,8,803,NULL),('W8L803B526P3',1.001,0.098,13.6,0.45,2.87,7.99,0.47,0.8,17.4,94.3,11.21,526,8,803,NULL),('W8L803B526P4',1.0001,0.072,10.8,0.92,3.27,5.64,0.73,0.47,7.5,115.6,19.25,526,8,803,NULL),('W8L803B526P5',0.9999,0.093,9.1,0.6,3.38,7.3,0.53,0.29,6.2,88.7,16.51,526,8,803,NULL),('W8L803B526P6',0.9948,0.033,12.3,0.64,2.88,5.71,0.38,0.24,51,49.5,16.32,526,8,803,NULL),('W8L803B526P7',0.9993,0.025,8.4,0.5,2.85,7.87,0.41,0.56,62.2,239,11.05,526,8,803,NULL),('W8L803B526P8',1.0022,0.045,11.2,0.87,2.99,7.55,0.69,0.75,39.8,195.3,12.49,526,8,803,NULL),('W8L803B526P9',0.9927,0.046,12.4,0.7,3.42,6.01,0.73,0.92,48.6,34.3,3.58,526,8,803,NULL),('W8L803B527P1',1.0002,0.072,8.9,0.48,3.77,6.6,0.21,0.28,46.3,29.3,13.7,527,8,803,NULL),('W8L803B527P10',0.9904,0.093,12.8,0.87,2.98,9.68,0.44,0.86,29.6,182.6,4.26,527,8,803,NULL),('W8L803B527P11',0.9934,0.085,10.5,0.45,3.17,9.02,0.08,0.73,16.1,92.1,8.01,527,8,803,NULL),('W8L803B527P12',1.0005,0.084,13.4,0.38,3.62,9.72,0.68,0.81,5.5,47.4,7.56,527,8,803,NULL),('W8L803B527P13',0.9985,0.059,11.5,0.33,2.9,5.7,0.41,0.99,44.4,99,18.56,527,8,803,NULL),('W8L803B527P14',0.9952,0.067,10.3,0.97,3.08,7.94,0.33,0.13,22.6,216.5,5.33,527,8,803,NULL),('W8L803B527P15',0.9967,0.037,8.1,0.65,3.28,6.76,0.35,0.17,42.2,66.4,11.01,527,8,803,NULL),('W8L803B527P16',0.9951,0.071,11.1,0.56,3.14,8.25,0.34,0.78,39.4,52.5,19.93,527,8,803,NULL),('W8L803B527P17',1.0018,0.024,10.3,0.7,3.29,8.66,0.77,0.52,6.6,35.9,10.1,527,8,803,NULL),('W8L803B527P18',0.9935,0.05,12.5,0.41,2.91,8.09,0.26,0.54,63.4,120.6,1.39,527,8,803,NULL),('W8L803B527P19',0.9942,0.079,11.4,0.62,3.41,7.54,0.62,0.93,13.5,114.6,8.45,527,8,803,NULL),('W8L803B527P2',1.0046,0.026,12.5,0.82,3.24,8.18,0.59,0.55,65.9,84.9,17.06,527,8,803,NULL),('W8L803B527P20',0.9929,0.056,12.1,0.88,2.94,7.65,0.58,0.17,27.9,227.5,3.28,527,8,803,NULL),('W8L803B527P21',1.0041,0.023,10.2,0.97,2.9,8.5,0.53,0.35,27.7,52.6,1.62,527,8,803,NULL),('W8L803B527P22',0.9981,0.021,13.8,0.83,2.93,8.36,0.31,0.82,19.1,149.1,7.41,527,8,803,NULL),('W8L803B527P23',0.991,0.096,9.4,0.3,3.45,5.03,0.26,0.42,60.8,30.6,19.86,527,8,803,NULL),('W8L803B527P24',0.9906,0.042,12.2,0.42,3.37,5.66,0.75,0.93,53.3,49,1.64,527,8,803,NULL),('W8L803B527P25',0.9977,0.045,8.2,0.66,2.91,9.61,0.27,0.33,38,43.8,17.73,527,8,803,NULL),('W8L803B527P3',0.9955,0.081,10.9,0.41,3.47,7.72,0.07,0.93,34.4,208.9,1.59,527,8,803,NULL),('W8L803B527P4',0.9908,0.014,9.1,0.78,2.96,9.28,0.73,0.44,27.3,175.8,7.58,527,8,803,NULL),('W8L803B527P5',1.0046,0.063,10.3,0.68,3.62,7.96,0.76,0.2,15.4,113.4,17.14,527,8,803,NULL),('W8L803B527P6',1.0031,0.029,9.5,0.8,3.23,5.78,0.59,0.97,33.2,24.4,12.08,527,8,803,NULL),('W8L803B527P7',0.9961,0.08,8.4,0.45,3.14,6.35,0.57,0.48,45.7,224.7,13.47,527,8,803,NULL),('W8L803B527P8',1.001,0.078,9.9,0.8,3.53,7.46,0.36,0.71,45.7,156.7,16.05,527,8,803,NULL),('W8L803B527P9',1.0016,0.044,12.3,0.57,3.62,5.59,0.64,0.99,16.5,153.3,1.54,527,8,803,NULL),('W8L803B528P1',0.9998,0.024,11.9,0.45,3.73,5.99,0.67,0.88,17.8,43.4,7.33,528,8,803,NULL),('W8L803B528P10',0.9953,0.053,11.2,0.59,2.86,6.38,0.46,0.16,45.3,104.6,19.14,528,8,803,NULL),('W8L803B528P11',0.993,0.014,10.5,0.81,3.01,8.68,0.71,0.8,48.6,33.4,15.78,528,8,803,NULL),('W8L803B528P12',0.9964,0.084,13.2,0.73,3.75,9.34,0.69,0.5,62.3,10.1,17.84,528,8,803,NULL),('W8L803B528P13',0.9973,0.067,12.9,0.76,3.27,5.27,0.58,0.48,45.9,165.2,18.77,528,8,803,NULL),('W8L803B528P14',0.9996,0.037,9.1,0.91,3.34,8.44,0.42,0.46,24,146.9,15.16,528,8,803,NULL),('W8L803B528P15',1.0027,0.064,13.8,0.84,3.75,9.81,0.6,0.91,39.4,57.2,17.47,528,8,803,NULL),('W8L803B528P16',0.9918,0.088,11.9,0.75,2.93,6.25,0,0.33,31.9,144.1,10.25,528,8,803,NULL),('W8L803B528P17',0.9914,0.01,10.9,0.79,2.81,7.33,0.66,0.39,62.7,107.9,15.58,528,8,803,NULL),('W8L803B528P18',0.9981,0.073,13.1,0.39,3.68,5.64,0.53,0.54,33.7,201.8,7.92,528,8,803,NULL),('W8L803B528P19',0.9918,0.075,13.6,0.41,3.32,9.18,0.25,0.83,32.3,127.3,2.09,528,8,803,NULL),('W8L803B528P2',1.0049,0.022,11.6,0.88,3.63,7.61,0.14,0.74,38.7,189.5,6.04,528,8,803,NULL),('W8L803B528P20',1.0024,0.094,11.6,0.71,2.96,8.96,0.72,0.67,54.9,111.7,11.03,528,8,803,NULL),('W8L803B528P21',0.9956,0.069,8.5,0.45,3.34,5.5,0.53,0.47,27.6,223.8,4.07,528,8,803,NULL),('W8L803B528P22',0.9995,0.085,13.8,0.39,3.01,5.56,0.6,0.73,56.2,165.4,6.56,528,8,803,NULL),('W8L803B528P23',1.0025,0.068,10.7,0.74,3.65,8.13,0.43,0.48,24.7,160.8,11.6,528,8,803,NULL),('W8L803B528P24',0.9935,0.075,13.5,0.42,3.11,5.84,0.22,0.68,66.7,233.4,2.65,528,8,803,NULL),('W8L803B528P25',0.991,0.01,11.1,0.43,3.75,6.91,0.56,0.26,17.3,194.4,5.19,528,8,803,NULL),('W8L803B528P26',0.9957,0.036,12.9,0.38,2.81,6.1,0.47,0.33,7.2,190.1,3.14,528,8,803,NULL),('W8L803B528P27',1.0017,0.086,11.4,0.45,3.66,5.05,0.76,0.42,62.1,236.5,14.4,528,8,803,NULL),('W8L803B528P28',0.9951,0.013,11.3,0.53,3.14,8.04,0.3,0.71,51.7,144.7,13.62,528,8,803,NULL),('W8L803B528P29',0.9901,0.046,11.4,0.95,3.14,7.46,0.15,0.69,17.9,173.3,10.38,528,8,803,NULL),('W8L803B528P3',0.9951,0.083,9.3,0.73,3.04,7.86,0.43,0.74,20.2,42.5,14.77,528,8,803,NULL),('W8L803B528P4',0.9967,0.064,11.6,0.5,3.22,8.55,0.63,0.57,40.9,159.4,5.97,528,8,803,NULL),('W8L803B528P5',0.9977,0.013,9.4,0.77,3.77,6.31,0.15,0.77,52.6,51.9,10.62,528,8,803,NULL),('W8L803B528P6',0.9938,0.051,13.9,0.57,3.01,6.03,0.58,0.84,34.4,22.3,1.02,528,8,803,NULL),('W8L803B528P7',1.0008,0.039,13.8,0.41,3.52,9.62,0.05,0.1,54.9,106.2,6.12,528,8,803,NULL),('W8L803B528P8',0.9952,0.054,13.2,0.76,3.51,6.85,0.66,0.23,69.1,163.5,3.02,528,8,803,NULL),('W8L803B528P9',0.9932,0.018,9.8,0.59,3.8,8.53,0.67,0.82,69.9,148.3,9.55,528,8,803,NULL),('W8L803B529P1',0.9927,0.081,11.1,0.99,3.71,8.17,0.78,0.76,65.8,224.4,7.02,529,8,803,NULL),('W8L803B529P10',0.9966,0.062,12.7,0.46,3.29,7.93,0.48,0.34,67.2,212,11.61,529,8,803,NULL),('W8L803B529P11',0.9981,0.011,10,0.33,3.58,6.97,0.65,0.65,49.1,190.2,1.31,529,8,803,NULL),('W8L803B529P12',0.9987,0.094,10.9,0.56,3.12,5.75,0.62,0.43,54.2,170.3,11.74,529,8,803,NULL),('W8L803B529P13',1.0003,0.052,9.8,0.37,2.9,5.7,0.34,0.3,65.1,223.2,11.9,529,8,803,NULL),('W8L803B529P14',0.9944,0.038,12,0.49,3.38,9.85,0.6,0.55,26.4,38.4,9.26,529,8,803,NULL),('W8L803B529P15',0.9939,0.067,12.1,0.75,3.58,9.67,0.17,0.52,20.6,108.5,17.52,529,8,803,NULL),('W8L803B529P16',1.0041,0.099,11.5,0.8,3.76,6.56,0.56,0.36,10.9,34.8,1.6,529,8,803,NULL),('W8L803B529P17',0.9956,0.064,9.7,0.78,3.73,7.96,0.75,0.19,35.3,138.9,2.35,529,8,803,NULL),('W8L803B529P18',0.9938,0.046,13.2,0.46,2.92,9.14,0.21,0.95,68.2,222.5,0.76,529,8,803,NULL),('W8L803B529P19',0.996,0.02,11.8,0.55,3.46,5.26,0.8,0.1,10.6,124.2,11.64,529,8,803,NULL),('W8L803B529P2',0.9949,0.022,13.4,0.75,3.53,6.41,0.12,0.18,45.4,168.5,6.27,529,8,803,NULL),('W8L803B529P20',0.9919,0.093,12.5,0.99,3.48,8.09,0.57,0.42,22,140.1,9.62,529,8,803,NULL),('W8L803B529P21',0.9953,0.069,11.2,0.38,3.49,8.86,0.06,0.37,12.5,199.5,18.69,529,8,803,NULL),('W8L803B529P22',0.9951,0.092,12.3,0.54,3.31,8.9,0.49,0.65,52.2,228.6,6.97,529,8,803,NULL),('W8L803B529P23',0.9918,0.066,13.6,0.65,3.49,5.61,0.68,0.59,33.8,126.8,15.38,529,8,803,NULL),('W8L803B529P24',0.9983,0.075,13.9,0.31,3.21,6.56,0.07,0.55,41.9,101.5,9.09,529,8,803,NULL),('W8L803B529P3',0.999,0.012,12.6,0.77,3.07,5.65,0.69,0.48,58,118.4,1.28,529,8,803,NULL),('W8L803B529P4',0.9906,0.075,9.2,0.31,3.02,7.11,0.24,0.44,62.1,162.9,3.14,529,8,803,NULL),('W8L803B529P5',0.9936,0.069,12.9,0.67,3.23,7.26,0.63,0.95,34.5,70.4,0.94,529,8,803,NULL),('W8L803B529P6',1.0039,0.014,10.6,0.43,3.43,6.29,0.26,0.78,59.9,161.6,7.59,529,8,803,NULL),('W8L803B529P7',1.0026,0.05,12,0.89,3.74,8.61,0,0.51,62.9,234,19.84,529,8,803,NULL),('W8L803B529P8',0.9986,0.094,13.6,0.88,3.27,8.22,0.21,0.33,25.5,233.8,14.04,529,8,803,NULL),('W8L803B529P9',0.9992,0.011,8.9,0.69,3.55,9.63,0.76,0.72,17.8,27.4,13.98,529,8,803,NULL),('W8L803B530P1',1.0025,0.05,12.2,0.54,3.73,7.07,0.5,0.56,9.2,182.8,4.7,530,8,803,NULL),('W8L803B530P10',0.9959,0.092,12.1,0.8,3.33,9.41,0.26,0.49,43.5,165.2,19.43,530,8,803,NULL),('W8L803B530P11',1.0017,0.069,13.6,0.61,3.12,9.23,0.44,0.69,51.3,42.9,5.41,530,8,803,NULL),('W8L803B530P12',0.9958,0.015,11.3,0.37,3.25,8.93,0.01,0.61,56.6,159.3,16.76,530,8,803,NULL),('W8L803B530P13',0.9947,0.04,11.6,0.8,3.09,5.66,0.46,0.12,49.2,205.6,19.88,530,8,803,NULL),('W8L803B530P14',1.0035,0.027,13.4,0.67,2.99,7.12,0.77,0.88,11.9,187.9,5.59,530,8,803,NULL),('W8L803B530P15',1.0043,0.044,12.6,0.94,3.18,9.86,0.38,0.11,40.3,218.9,12.04,530,8,803,NULL),('W8L803B530P16',0.9954,0.045,11.7,0.55,3.69,5.54,0.41,0.27,9.7,214,6.01,530,8,803,NULL),('W8L803B530P17',0.9969,0.037,12.6,0.78,3.58,6.82,0.28,0.88,34.1,141.6,14.86,530,8,803,NULL),('W8L803B530P18',1.0049,0.015,11.3,0.98,3.42,5.4,0.58,0.6,64.9,193.8,18.09,530,8,803,NULL),('W8L803B530P19',0.9972,0.098,11,0.8,3.33,7.17,0.19,0.53,16.2,65.2,19.69,530,8,803,NULL),('W8L803B530P2',0.9997,0.071,9.5,0.69,3.4,5.91,0.24,0.73,22.3,71.2,2.71,530,8,803,NULL),('W8L803B530P20',0.9994,0.034,9.9,0.4,3.49,9.56,0.36,0.48,46.1,220.8,15.56,530,8,803,NULL),('W8L803B530P21',0.9987,0.051,8.9,0.57,3.63,9.71,0.64,0.36,9.4,233.2,3.99,530,8,803,NULL),('W8L803B530P22',0.9933,0.022,8.6,0.79,2.9,8.45,0.76,0.9,68.9,100.2,3.78,530,8,803,NULL),('W8L803B530P23',1.001,0.079,10.9,0.33,3.1,6.57,0.02,0.62,39.7,169.2,9.12,530,8,803,NULL),('W8L803B530P24',1.001,0.028,10.9,0.44,2.95,6.4,0.33,0.98,6.5,56.9,12.38,530,8,803,NULL),('W8L803B530P25',0.9947,0.072,13.8,0.73,3.22,9.44,0.55,0.15,6.2,161.9,14.32,530,8,803,NULL),('W8L803B530P3',1.0021,0.031,11.8,0.52,3.72,8.15,0.21,0.86,50.9,238.8,6.92,530,8,803,NULL),('W8L803B530P4',0.998,0.023,8.4,0.71,3.71,9.58,0.64,0.88,32.8,33.2,9.54,530,8,803,NULL),('W8L803B530P5',1.0041,0.036,10.3,0.91,3.25,8.87,0.54,0.82,48,170,14.91,530,8,803,NULL),('W8L803B530P6',0.9975,0.069,12.2,0.61,3.58,6.72,0.15,0.7,65.2,131.4,19.7,530,8,803,NULL),('W8L803B530P7',0.9944,0.066,12.7,0.85,3.32,6.66,0.74,0.68,42.3,192.2,5.23,530,8,803,NULL),('W8L803B530P8',1.0044,0.05,13.3,0.57,3.31,9.54,0.05,0.15,27.2,26.5,2.77,530,8,803,NULL),('W8L803B530P9',1.0005,0.016,12.9,0.37,3.31,8.43,0.66,0.21,63.6,119.3,7.22,530,8,803,NULL),('W8L803B531P1',0.9902,0.088,12.5,0.5,3.54,5.54,0.39,0.83,34,124.1,17.21,531,8,803,NULL),('W8L803B531P10',0.9997,0.056,9.5,0.85,2.84,5.14,0.09,0.76,12.8,96.4,18.68,531,8,803,NULL),('W8L803B531P11',0.9903,0.097,10.6,0.46,3.45,5.11,0.76,0.73,8,156.8,4.84,531,8,803,NULL),('W8L803B531P12',0.9968,0.056,10.6,0.56,3.47,8.37,0,0.42,63.1,203.7,9.94,531,8,803,NULL),('W8L803B531P13',0.9985,0.056,12.6,0.95,3.38,5.09,0.13,0.28,12.6,16.4,12.01,531,8,803,NULL),('W8L803B531P14',0.9962,0.056,10.9,0.75,3.31,6.34,0.62,0.67,23.7,36.1,1.31,531,8,803,NULL),('W8L803B531P15',0.9992,0.062,8.4,0.74,3.29,5.66,0.23,0.42,18,19.8,3.85,531,8,803,NULL),('W8L803B531P16',0.9984,0.079,13.7,0.81,2.99,7.02,0.52,0.57,11.2,64.2,2.33,531,8,803,NULL),('W8L803B531P17',1.0002,0.01,11.9,0.58,3.23,8.17,0.09,0.25,30.1,171.9,19.46,531,8,803,NULL),('W8L803B531P18',1.002,0.034,8.8,0.8,3.25,9.48,0.12,0.83,66.9,231.3,13.01,531,8,803,NULL),('W8L803B531P19',0.9912,0.084,14,0.38,3.29,5.44,0.33,0.32,20.8,225.4,7.24,531,8,803,NULL),('W8L803B531P2',0.9951,0.017,12.8,0.9,3.13,9.51,0.47,0.47,57.4,189.4,16.26,531,8,803,NULL),('W8L803B531P20',1.0045,0.07,9.8,0.45,3.06,6.13,0.68,0.71,20.5,243.4,7.54,531,8,803,NULL),('W8L803B531P21',0.9931,0.056,12.8,0.79,3.46,7.44,0.12,0.78,37.9,229.6,2.4,531,8,803,NULL),('W8L803B531P22',0.9994,0.022,9.8,0.89,3.29,8.66,0.65,0.15,54.7,73,3.45,531,8,803,NULL),('W8L803B531P23',1.005,0.033,9.7,0.95,3.28,8.07,0.29,0.61,20.1,118.1,8.92,531,8,803,NULL),('W8L803B531P24',1.0014,0.082,10.1,0.51,3.51,9.76,0.77,0.96,10.7,136.6,14.64,531,8,803,NULL),('W8L803B531P25',1.0036,0.05,9.5,0.79,3.67,5.99,0.66,0.99,37.8,236.2,7.67,531,8,803,NULL),('W8L803B531P3',0.9997,0.074,13.5,0.31,3.67,9.29,0.18,0.21,35.3,229.2,11.99,531,8,803,NULL),('W8L803B531P4',1.0045,0.096,9.7,0.77,3.66,5.99,0.23,0.3,18.2,86.8,11.26,531,8,803,NULL),('W8L803B531P5',0.9983,0.069,9.4,0.7,2.99,5.69,0.34,0.27,12.4,159.6,3.64,531,8,803,NULL),('W8L803B531P6',0.9934,0.055,9.7,0.38,3.49,8.86,0.09,0.43,45.3,196.2,10.48,531,8,803,NULL),('W8L803B531P7',1.0026,0.043,13.5,0.86,3.6,9.25,0.34,0.72,32.3,91.9,3.34,531,8,803,NULL),('W8L803B531P8',1.0015,0.094,8,0.35,3.7,7.54,0.52,0.43,51.2,100.5,15.06,531,8,803,NULL),('W8L803B531P9',0.9961,0.025,13,0.72,3.2,6.2,0.09,0.28,20.2,27.9,10.32,531,8,803,NULL),('W8L803B532P1',0.9977,0.058,10.8,0.33,2.9,8.46,0.26,0.33,8.5,227.4,7.45,532,8,803,NULL),('W8L803B532P2',1.0008,0.073,11.6,0.48,3.51,8.02,0.15,0.79,43.5,80.7,17.69,532,8,803,NULL),('W8L804B430P1',1.0023,0.024,13.6,0.64,3.19,9.7,0.24,0.72,37,76.5,8.41,430,8,804,NULL),('W8L804B430P10',0.9997,0.031,11.2,0.81,2.81,9.28,0.51,0.12,55.5,216.4,18.72,430,8,804,NULL),('W8L804B430P11',0.9966,0.02,12.1,0.54,2.89,7.14,0.1,0.46,51.8,107,7.66,430,8,804,NULL),('W8L804B430P12',1.0049,0.068,12.8,0.52,3.41,6.44,0.11,0.25,38.7,102.3,10.05,430,8,804,NULL),('W8L804B430P13',0.9905,0.025,9.1,0.36,3.31,9.13,0.15,0.49,39.2,185,2.9,430,8,804,NULL),('W8L804B430P14',0.9974,0.1,11.4,0.64,3.13,7.45,0.52,0.3,63.6,189.6,8.34,430,8,804,NULL),('W8L804B430P15',1.002,0.052,9.5,0.65,3.45,8.96,0.02,0.95,61,136.7,17.17,430,8,804,NULL),('W8L804B430P16',0.993,0.064,8.2,0.92,2.88,7.04,0.42,0.93,39.8,197.4,19.25,430,8,804,NULL),('W8L804B430P17',0.995,0.021,13.6,0.99,2.82,9.17,0.01,0.6,38.5,106.8,19.87,430,8,804,NULL),('W8L804B430P18',0.9943,0.014,9.7,0.56,2.87,6.01,0.29,0.94,53.4,76,10.47,430,8,804,NULL),('W8L804B430P19',0.9984,0.06,10.7,0.32,3.22,7.07,0.34,0.58,43.1,73.3,7.01,430,8,804,NULL),('W8L804B430P2',0.9933,0.089,13.8,0.5,2.83,6.46,0.68,0.68,28.7,70.2,13.23,430,8,804,NULL),('W8L804B430P20',0.9968,0.093,9.9,0.55,2.92,9.76,0.09,0.76,8.2,167.9,16.87,430,8,804,NULL),('W8L804B430P21',0.9971,0.015,11.9,0.57,3.44,9.74,0.13,0.73,29,233.9,16.85,430,8,804,NULL),('W8L804B430P3',1.0008,0.082,13.4,0.36,3.17,8.68,0.05,0.14,18,115.4,2.19,430,8,804,NULL),('W8L804B430P4',1.0014,0.094,9.9,0.7,3.57,5.71,0.52,0.91,43.9,27.2,18.63,430,8,804,NULL),('W8L804B430P5',0.9952,0.096,10.3,0.65,3.57,10,0.51,0.2,21.1,242.4,2.07,430,8,804,NULL),('W8L804B430P6',0.9977,0.068,8.1,0.49,3.02,10,0.02,0.11,57.7,138.5,5.63,430,8,804,NULL),('W8L804B430P7',0.9945,0.014,13.1,0.53,3.47,7.05,0.2,0.23,19.2,211,1.65,430,8,804,NULL),('W8L804B430P8',0.992,0.026,13.1,0.56,2.8,8.86,0.38,0.25,27.8,112,14.25,430,8,804,NULL),('W8L804B430P9',0.9981,0.049,10.2,0.83,3.54,7.91,0.71,0.85,36.9,91.6,15.48,430,8,804,NULL),('W8L804B431P1',0.9925,0.012,8.8,0.94,2.83,8.2,0.04,0.88,44.1,72.8,17.55,431,8,804,NULL),('W8L804B431P10',0.9949,0.016,8.4,0.4,3.65,8.17,0.62,0.32,55,105,8.32,431,8,804,NULL),('W8L804B431P11',1.0033,0.079,13.5,0.76,2.8,6.24,0.28,0.84,58.5,78.1,19.86,431,8,804,NULL),('W8L804B431P12',1.0008,0.041,12.6,0.67,3.5,7.3,0.8,0.18,45.9,114.4,11.08,431,8,804,NULL),('W8L804B431P13',1.0007,0.025,9.6,0.93,2.84,7.61,0.63,0.58,15.5,65.2,4.32,431,8,804,NULL),('W8L804B431P14',0.9953,0.014,9.7,0.63,3.71,7.04,0.4,0.6,20.4,234.2,11.35,431,8,804,NULL),('W8L804B431P15',0.9926,0.058,9.8,0.54,3.24,6.32,0.11,0.17,14.7,82.2,14.74,431,8,804,NULL),('W8L804B431P16',0.9933,0.042,9.9,0.68,2.93,8.15,0.5,0.67,58.1,86,18.68,431,8,804,NULL),('W8L804B431P17',0.9971,0.083,10.6,0.82,3.28,5.27,0.19,0.75,12.4,86.7,17.87,431,8,804,NULL),('W8L804B431P18',0.9982,0.039,13.5,0.82,3.57,7.45,0.21,0.76,35.4,41.9,10.39,431,8,804,NULL),('W8L804B431P19',1.0017,0.032,13.4,0.5,3.61,5.66,0.76,0.63,47.4,75,9.38,431,8,804,NULL),('W8L804B431P2',0.9914,0.029,9.2,0.82,3.09,8.19,0.75,0.76,61.4,233.1,14.82,431,8,804,NULL),('W8L804B431P20',0.9901,0.066,8.4,0.49,3.24,6.53,0.69,0.58,40.3,51.3,8.64,431,8,804,NULL),('W8L804B431P21',0.9936,0.037,11.8,0.87,2.93,7.42,0.14,0.44,34,57.1,19.68,431,8,804,NULL),('W8L804B431P22',0.9942,0.019,13.7,0.5,3.48,6.95,0.62,0.62,28.3,149.2,4.93,431,8,804,NULL),('W8L804B431P3',0.9997,0.049,13,0.93,3.74,9.49,0.8,0.72,60.9,231.5,2.86,431,8,804,NULL),('W8L804B431P4',0.9953,0.077,10.2,0.86,3.63,8.95,0.14,0.91,18.4,151.7,13.98,431,8,804,NULL),('W8L804B431P5',0.9959,0.094,9.3,0.6,3.53,8.38,0.01,0.36,15.2,88.9,6.67,431,8,804,NULL),('W8L804B431P6',1.0026,0.05,10.2,0.56,3.37,9.68,0.39,0.18,11.4,72.1,3.01,431,8,804,NULL),('W8L804B431P7',0.9946,0.072,8.1,0.44,2.98,7.2,0.55,0.63,53.3,19.7,2.93,431,8,804,NULL),('W8L804B431P8',1.0049,0.025,12.3,0.73,3.47,7.25,0.04,0.83,14.6,234.9,2.69,431,8,804,NULL),('W8L804B431P9',0.9919,0.038,10.3,0.38,3.68,7.8,0.57,0.39,64.4,163.3,5.11,431,8,804,NULL),('W8L804B432P1',0.9911,0.038,8.2,0.85,3.74,5.6,0.22,0.94,30.7,56.6,8.08,432,8,804,NULL),('W8L804B432P10',0.9914,0.077,9,0.85,2.98,5.86,0.19,0.81,47,121.5,18.85,432,8,804,NULL),('W8L804B432P11',0.9927,0.072,8.5,0.44,3.31,6.7,0.41,0.29,33.3,188,10.49,432,8,804,NULL),('W8L804B432P12',1.0013,0.079,10.8,0.59,3.21,8.62,0.17,0.23,30.7,23.9,19.07,432,8,804,NULL),('W8L804B432P13',1.0042,0.079,9.3,0.38,2.94,5.04,0.41,0.68,51.3,77.9,13.92,432,8,804,NULL),('W8L804B432P14',0.9934,0.032,11.4,0.31,2.86,9.2,0.52,0.89,37.9,67.8,6.96,432,8,804,NULL),('W8L804B432P15',1.0026,0.022,11.1,0.5,3.79,7.41,0.69,0.19,41.1,188.7,8.91,432,8,804,NULL),('W8L804B432P16',1.0006,0.027,8.2,0.79,3.73,7.05,0.39,0.64,62.2,231.7,15.41,432,8,804,NULL),('W8L804B432P17',0.9955,0.051,9.9,0.78,3.79,6.6,0.07,0.25,26.4,24.6,17.47,432,8,804,NULL),('W8L804B432P18',1.0035,0.02,10,0.87,3.02,7.32,0.17,0.97,36.9,47.7,19.49,432,8,804,NULL),('W8L804B432P19',0.9969,0.019,10.9,0.48,3.46,5.01,0.2,0.86,57,47.9,12.97,432,8,804,NULL),('W8L804B432P2',1.004,0.062,11.8,0.77,3.66,7.64,0.56,0.76,10.5,11.6,18.32,432,8,804,NULL),('W8L804B432P20',0.9903,0.074,9.9,0.35,3.3,7.42,0.52,0.81,13.7,35.7,10.19,432,8,804,NULL),('W8L804B432P21',0.996,0.073,11.3,0.59,3.15,6.43,0.76,0.91,42.2,229.1,5.91,432,8,804,NULL),('W8L804B432P22',0.9937,0.038,8.7,0.91,2.83,9.92,0.19,0.41,14.6,85.4,9.92,432,8,804,NULL),('W8L804B432P23',0.9969,0.06,8.4,0.39,2.98,9.34,0.52,0.11,48.8,150.5,13.95,432,8,804,NULL),('W8L804B432P3',0.9905,0.088,12.9,0.32,3.77,8.74,0.37,0.28,13.7,44.7,9.3,432,8,804,NULL),('W8L804B432P4',1.0046,0.08,8.7,0.32,2.81,8.88,0.06,0.59,23.5,200.1,15.24,432,8,804,NULL),('W8L804B432P5',0.9938,0.055,12.4,0.43,3.73,8.07,0.1,0.59,33.1,189.3,7.26,432,8,804,NULL),('W8L804B432P6',1.0026,0.081,13.2,0.54,3.15,7.83,0.2,0.84,35.4,41.3,9.4,432,8,804,NULL),('W8L804B432P7',0.9958,0.091,13.2,0.99,3.75,8.83,0.41,0.33,50.2,87.5,0.92,432,8,804,NULL),('W8L804B432P8',1.0035,0.093,10.9,0.86,3.56,5.09,0.53,0.5,13,172.3,2.19,432,8,804,NULL),('W8L804B432P9',0.9915,0.08,12.5,0.9,2.88,7.61,0.67,0.44,69.8,30.6,10.54,432,8,804,NULL),('W8L804B433P1',0.9998,0.031,13.3,0.34,2.81,9.38,0.26,0.83,18.4,248.3,4.13,433,8,804,NULL),('W8L804B433P10',0.9914,0.016,11.7,0.54,2.81,5.34,0.5,0.9,46.5,198.6,1.35,433,8,804,NULL),('W8L804B433P11',1.0013,0.046,11.2,0.32,3.59,9.47,0.22,0.7,34,41.5,17.45,433,8,804,NULL),('W8L804B433P12',1.0041,0.016,11.4,0.69,3.26,5.11,0.44,0.62,33.2,95.4,2.85,433,8,804,NULL),('W8L804B433P13',0.9975,0.092,9,0.68,3.42,8.41,0.54,0.42,59.7,47.4,16.73,433,8,804,NULL),('W8L804B433P14',1.0018,0.07,12.4,0.86,3.76,5.6,0.71,0.19,8.8,77.7,19.62,433,8,804,NULL),('W8L804B433P15',1,0.019,10.8,0.88,2.86,5.53,0.51,0.16,40.5,205.9,18.45,433,8,804,NULL),('W8L804B433P16',0.9969,0.077,10,0.79,2.92,7.89,0.65,0.7,52.8,132.1,10.09,433,8,804,NULL),('W8L804B433P17',0.9994,0.019,8.7,0.98,3.75,8.31,0.23,0.38,16,35.2,13.52,433,8,804,NULL),('W8L804B433P18',0.9938,0.054,10,0.77,3.13,7.74,0.28,0.96,10.8,114.2,4.17,433,8,804,NULL),('W8L804B433P19',0.9929,0.058,12.5,0.59,2.98,6.86,0.35,0.29,13.3,41.7,5.72,433,8,804,NULL),('W8L804B433P2',1.0009,0.051,11,0.74,3.07,7.03,0.37,0.81,43.7,165,11.09,433,8,804,NULL),('W8L804B433P20',0.9913,0.02,11.4,0.54,3.36,7.52,0.43,0.19,48.1,178.3,16.08,433,8,804,NULL),('W8L804B433P21',1.0006,0.039,12.7,0.94,3.56,8.43,0.56,0.2,27.5,236.3,3.76,433,8,804,NULL),('W8L804B433P22',1.0038,0.012,13.6,0.51,3.67,8.87,0.42,1,31.5,138.2,6.07,433,8,804,NULL),('W8L804B433P23',1.0016,0.083,11.8,0.31,2.85,6.52,0.22,0.72,55.7,246.9,15.05,433,8,804,NULL),('W8L804B433P24',0.9953,0.055,9.9,0.98,3.17,8.72,0.21,0.83,27.2,194,5.86,433,8,804,NULL),('W8L804B433P25',0.995,0.043,12.6,0.5,2.88,5.14,0.32,0.33,68.6,131.3,18.2,433,8,804,NULL),('W8L804B433P3',0.9985,0.055,12,0.91,3.7,8.95,0.73,0.52,21.1,184.6,9.93,433,8,804,NULL),('W8L804B433P4',0.9919,0.089,13.9,0.39,3.18,7.9,0.71,0.55,19.3,38.6,18.11,433,8,804,NULL),('W8L804B433P5',1.0039,0.028,9.9,0.81,3.53,9.45,0.71,0.13,69.2,194.2,14.9,433,8,804,NULL),('W8L804B433P6',0.9967,0.026,13.9,0.58,3.12,6.22,0.12,0.8,25.5,27.5,14.7,433,8,804,NULL),('W8L804B433P7',0.9969,0.057,12.9,0.77,2.84,9.32,0.33,0.91,7.3,92.5,0.72,433,8,804,NULL),('W8L804B433P8',0.9941,0.069,11.3,0.58,2.85,8.92,0.29,0.18,9.7,28.9,3.4,433,8,804,NULL),('W8L804B433P9',0.9983,0.026,8.2,0.64,3.13,8.29,0.6,0.83,61.7,67.6,11.68,433,8,804,NULL),('W8L804B434P1',1.0029,0.053,9.4,0.91,3.36,6.67,0.5,0.63,6.5,18.2,3.49,434,8,804,NULL),('W8L804B434P10',0.994,0.015,13.1,0.88,3.6,9.55,0.29,0.66,40.3,159.7,4.23,434,8,804,NULL),('W8L804B434P11',0.9927,0.013,12.5,0.5,2.89,6.13,0.48,0.8,40.2,56.7,6.74,434,8,804,NULL),('W8L804B434P12',1.0047,0.04,13,0.41,2.85,9.6,0.6,0.77,33.2,58.9,10.56,434,8,804,NULL),('W8L804B434P13',0.9975,0.098,9.3,0.89,2.9,7.44,0.31,0.36,29.2,214.4,6.69,434,8,804,NULL),('W8L804B434P14',0.9965,0.03,13,0.99,3.43,6.56,0.14,0.28,10.1,152.1,8.13,434,8,804,NULL),('W8L804B434P15',0.9934,0.078,12.2,0.42,3.22,5.93,0.39,0.43,29.6,132,10.57,434,8,804,NULL),('W8L804B434P16',1.0026,0.075,8.8,0.7,3.78,9.19,0.2,0.67,9.5,159,18.01,434,8,804,NULL),('W8L804B434P17',0.9948,0.021,11.8,0.74,3.28,6.4,0.38,0.63,17,99.5,7.85,434,8,804,NULL),('W8L804B434P18',0.9928,0.022,13.8,0.95,3.51,6.1,0.19,0.48,34.2,79.9,1.97,434,8,804,NULL),('W8L804B434P19',0.9985,0.032,12.7,0.82,3.11,6.98,0.72,0.73,10.3,150.8,19.24,434,8,804,NULL),('W8L804B434P2',0.9916,0.078,13.9,0.74,3.51,9.62,0.51,0.44,62.6,225.3,3.16,434,8,804,NULL),('W8L804B434P20',0.9983,0.048,9.2,0.49,3.54,8.21,0.33,0.1,19,157.1,5.5,434,8,804,NULL),('W8L804B434P21',0.9961,0.072,9.1,0.62,3.21,7.57,0.76,0.57,32.6,111.3,9.68,434,8,804,NULL),('W8L804B434P22',1.0008,0.025,8.8,0.49,3.59,9.53,0.33,0.77,7.6,38.3,12.78,434,8,804,NULL),('W8L804B434P23',0.9923,0.023,13.4,0.82,3.41,8.29,0.72,0.61,27.4,57.4,11.24,434,8,804,NULL),('W8L804B434P24',0.9995,0.091,13.2,0.81,3.22,9.4,0.31,0.57,34.7,169.7,4.84,434,8,804,NULL),('W8L804B434P25',1.0023,0.061,10.6,0.74,2.85,5.03,0.19,0.28,49.2,158.6,4.9,434,8,804,NULL),('W8L804B434P26',0.9972,0.075,10,0.84,3,6.19,0.29,0.75,10.3,68.9,9.27,434,8,804,NULL),('W8L804B434P27',0.9993,0.038,11.4,0.31,3.75,7.17,0.52,0.8,38.4,67.9,15.38,434,8,804,NULL),('W8L804B434P3',1.0015,0.048,8.5,0.41,3.37,5.7,0.04,0.2,36.4,248.1,18.35,434,8,804,NULL),('W8L804B434P4',1.0044,0.033,9.3,0.32,2.88,8.99,0.1,0.72,5.9,43.8,3.75,434,8,804,NULL),('W8L804B434P5',1.0018,0.058,12.4,0.67,3.4,5.49,0.34,0.7,46,212.6,14.52,434,8,804,NULL),('W8L804B434P6',1.0019,0.016,10.5,0.51,3.43,9.84,0.72,0.57,17.5,242.1,0.79,434,8,804,NULL),('W8L804B434P7',1.0007,0.073,9,0.41,3.32,8.9,0.35,0.14,10.6,245,6.77,434,8,804,NULL),('W8L804B434P8',0.9995,0.041,8.1,0.86,3.09,9.93,0.4,0.75,20.6,236.8,9.23,434,8,804,NULL),('W8L804B434P9',1.0017,0.063,9.1,0.89,3.4,6.5,0.68,0.19,66,240.4,19.76,434,8,804,NULL),('W8L804B435P1',1.0049,0.023,8.9,0.69,2.88,7.34,0.15,0.58,54.9,120.2,17.78,435,8,804,NULL),('W8L804B435P10',1.001,0.069,13.6,0.6,2.97,8.8,0.09,0.81,21.3,152.9,7.88,435,8,804,NULL),('W8L804B435P11',0.9966,0.056,8.6,0.33,3.37,7.85,0.64,0.37,42.7,222.4,18.51,435,8,804,NULL),('W8L804B435P12',0.9989,0.042,13.8,0.75,3.64,9.9,0.61,0.7,67.4,240.9,9.37,435,8,804,NULL),('W8L804B435P13',1.002,0.078,13.1,0.68,3.58,8.7,0.38,0.77,13,46.8,7.96,435,8,804,NULL),('W8L804B435P14',0.9968,0.024,13.2,0.91,3.5,5.09,0.53,0.36,47,110.3,3.45,435,8,804,NULL),('W8L804B435P15',0.9901,0.07,9.3,0.97,3.62,7.45,0.64,0.54,45.6,35.2,18.18,435,8,804,NULL),('W8L804B435P16',0.9936,0.086,10.6,0.51,2.88,5.75,0.75,0.2,27,246.3,6.5,435,8,804,NULL),('W8L804B435P17',0.9933,0.062,11.7,0.42,3.56,8.12,0.38,0.94,13,153.2,4.17,435,8,804,NULL),('W8L804B435P18',0.9902,0.015,10.1,0.53,3.25,7.57,0.71,0.36,21,106.8,7.82,435,8,804,NULL),('W8L804B435P19',0.9994,0.033,11.8,0.54,2.83,7.16,0.74,0.82,19.1,213.2,13.3,435,8,804,NULL),('W8L804B435P2',1.0017,0.034,9.6,0.33,2.99,9.85,0.72,0.74,31.8,114.7,6.31,435,8,804,NULL),('W8L804B435P20',1.0043,0.042,11.2,0.65,2.99,9.41,0.5,0.93,19.7,72.8,18.56,435,8,804,NULL),('W8L804B435P21',1.0026,0.046,13,0.77,3.48,9.81,0.78,0.41,14.2,15.7,17.25,435,8,804,NULL),('W8L804B435P22',0.9994,0.017,13.7,0.91,2.81,7.65,0.24,0.93,16.4,123.4,14.62,435,8,804,NULL),('W8L804B435P23',0.9965,0.035,13.4,0.39,3.2,7.61,0.57,0.83,59.5,146.7,3.52,435,8,804,NULL),('W8L804B435P24',0.9985,0.032,11,0.37,3.48,8.28,0.69,0.92,70,123.8,18.92,435,8,804,NULL),('W8L804B435P25',0.993,0.083,12,0.95,3.49,9.35,0.69,0.14,36.8,68.9,2.36,435,8,804,NULL),('W8L804B435P3',1.0048,0.082,8.8,0.35,3.31,6.45,0.45,0.92,68.8,211.5,2.31,435,8,804,NULL),('W8L804B435P4',0.9931,0.047,13.4,0.98,3.2,5.18,0.38,0.78,16.9,118.4,12.99,435,8,804,NULL),('W8L804B435P5',0.9932,0.012,8.9,0.93,3.21,5.56,0.12,0.38,35.9,123.2,15.41,435,8,804,NULL),('W8L804B435P6',1.0024,0.082,10.8,0.88,3.68,9.22,0.53,0.27,35.8,229.6,12.33,435,8,804,NULL),('W8L804B435P7',0.9932,0.057,9.1,0.91,3.63,7.73,0.55,0.4,37.2,121.2,0.92,435,8,804,NULL),('W8L804B435P8',1.0041,0.029,8.8,0.63,3.74,5.72,0.74,0.1,47.5,116.4,15.6,435,8,804,NULL),('W8L804B435P9',0.9969,0.042,9.2,0.9,2.97,9.49,0.36,0.62,34.5,193.9,9.4,435,8,804,NULL),('W8L804B436P1',0.9995,0.055,9.1,0.59,3.47,7.81,0.22,0.96,28.9,224.4,2.07,436,8,804,NULL),('W8L804B436P10',1.0036,0.097,9,0.77,3.35,7.45,0.58,0.78,41.2,86.2,8.69,436,8,804,NULL),('W8L804B436P11',1.004,0.073,10.7,0.46,3.54,8.37,0.75,0.5,43.4,87.5,15.14,436,8,804,NULL),('W8L804B436P12',0.9906,0.094,10.2,0.81,3.6,7.57,0.79,0.12,29.4,151.7,14.17,436,8,804,NULL),('W8L804B436P13',0.9969,0.029,10.6,0.69,3.18,9.53,0.35,0.62,20.6,58.4,13.43,436,8,804,NULL),('W8L804B436P14',1.004,0.032,11.6,0.59,3.36,8.47,0.65,0.21,23.1,137.3,2.78,436,8,804,NULL),('W8L804B436P15',1.0001,0.058,10.6,0.61,3.42,9.61,0.18,0.76,61.1,133.8,6.98,436,8,804,NULL),('W8L804B436P16',1.0016,0.044,8.3,0.5,3.61,6.09,0.54,0.84,11.6,89.4,16.21,436,8,804,NULL),('W8L804B436P17',0.995,0.037,12,0.59,3.26,6.4,0.09,0.67,32.1,249,10.46,436,8,804,NULL),('W8L804B436P18',1.0026,0.064,8.9,0.72,3.55,7.97,0.29,0.38,18.3,79.9,16.7,436,8,804,NULL),('W8L804B436P19',0.999,0.011,8.4,0.52,3.65,6.64,0.77,0.25,14,192.3,4.74,436,8,804,NULL),('W8L804B436P2',1.0008,0.084,12.2,0.64,2.93,7.04,0.17,0.97,10.6,119.3,16.65,436,8,804,NULL),('W8L804B436P20',0.9914,0.066,13.1,0.98,3.57,5.72,0,0.31,18.2,249.8,14.59,436,8,804,NULL),('W8L804B436P21',1.0043,0.078,13.4,0.9,3.58,7.11,0.55,0.32,33,46.7,13.37,436,8,804,NULL),('W8L804B436P22',1.004,0.016,11,0.65,3.37,6.9,0.8,0.11,30.3,179.7,18.17,436,8,804,NULL),('W8L804B436P23',1.0015,0.038,12.2,0.53,3.68,5.11,0.37,0.2,62.5,74.3,14.41,436,8,804,NULL),('W8L804B436P24',0.9968,0.074,11.9,0.61,3.51,7,0.26,0.3,42.8,112.6,13.18,436,8,804,NULL),('W8L804B436P25',0.9908,0.049,9.6,0.57,3.52,9.66,0.76,0.71,68.7,147.4,12.16,436,8,804,NULL),('W8L804B436P26',0.9905,0.099,9,0.94,3.68,8.91,0.73,0.64,11.3,98.3,8.77,436,8,804,NULL),('W8L804B436P27',0.9963,0.021,10.4,0.9,2.98,8.71,0.06,0.33,49.1,204.6,7.26,436,8,804,NULL),('W8L804B436P28',0.9982,0.093,8.6,0.3,3.2,8.49,0.22,0.16,16.9,233,14.6,436,8,804,NULL),('W8L804B436P29',0.9949,0.022,12.5,0.37,2.94,7.16,0.62,0.61,37.1,80.8,17.87,436,8,804,NULL),('W8L804B436P3',1.0049,0.013,9.6,0.79,3.56,9.56,0.24,0.89,51,11.6,7.45,436,8,804,NULL),('W8L804B436P30',0.9946,0.065,11.7,0.85,3.4,9.14,0.24,0.49,23.9,240.4,1.59,436,8,804,NULL),('W8L804B436P4',0.9942,0.038,13,0.57,3.45,5.28,0.1,0.2,56.9,203.9,19.66,436,8,804,NULL),('W8L804B436P5',0.9982,0.063,12.3,0.8,3.66,6.03,0.55,0.26,57.1,166.9,9.41,436,8,804,NULL),('W8L804B436P6',0.9924,0.096,9.8,0.33,3.33,9.76,0.7,0.99,34.5,77.4,15.38,436,8,804,NULL),('W8L804B436P7',1.0021,0.076,8.6,0.59,2.82,5.05,0.6,0.12,10,39,6.73,436,8,804,NULL),('W8L804B436P8',0.9941,0.034,9.1,0.51,3.55,5.89,0.02,0.29,40.5,41.3,3.02,436,8,804,NULL),('W8L804B436P9',0.9949,0.056,9.4,0.33,3.08,9.3,0.66,0.77,8.1,149.2,4.66,436,8,804,NULL),('W8L804B437P1',0.9927,0.072,11.4,0.86,3.79,5.02,0.77,0.53,14.4,173.1,6.33,437,8,804,NULL),('W8L804B437P10',1.0022,0.06,13.5,0.86,3.55,9.34,0.58,0.23,33.8,235.7,8.09,437,8,804,NULL),('W8L804B437P11',0.9938,0.072,10.3,0.4,3.25,6.23,0.44,0.96,54.5,208.7,18.25,437,8,804,NULL),('W8L804B437P12',0.9944,0.036,9.9,0.49,3.07,6.3,0.47,0.68,22.7,29.7,1.85,437,8,804,NULL),('W8L804B437P13',0.9949,0.021,10,0.63,3.28,5.82,0.53,0.84,26.4,235.7,7.14,437,8,804,NULL),('W8L804B437P14',1.004,0.035,10.4,0.9,2.99,8.34,0.41,0.49,15.1,123.5,1.88,437,8,804,NULL),('W8L804B437P15',1.0025,0.054,8.9,0.66,3.34,9.08,0.11,0.6,33.2,124,16.3,437,8,804,NULL),('W8L804B437P16',1.0018,0.037,12.9,0.31,3.01,8.38,0.73,0.72,6.5,202.6,1.34,437,8,804,NULL),('W8L804B437P17',0.9949,0.027,11.3,0.48,3.43,6.26,0.25,0.38,67.6,159.1,15.94,437,8,804,NULL),('W8L804B437P18',0.9907,0.014,11.5,0.48,3.4,8.18,0.48,0.71,34.1,175.5,17.99,437,8,804,NULL),('W8L804B437P19',0.9935,0.066,12.2,0.93,3.38,6.95,0.22,0.77,20.2,124.5,17.14,437,8,804,NULL),('W8L804B437P2',0.9913,0.078,11,0.68,3.41,5.52,0.64,0.58,59.1,208,4.24,437,8,804,NULL),('W8L804B437P20',0.9994,0.059,12.5,0.87,2.82,6.46,0.21,0.27,32.1,31.2,1.24,437,8,804,NULL),('W8L804B437P21',0.9921,0.063,11.6,0.54,3.68,7.72,0.17,0.42,28.8,33.2,8.76,437,8,804,NULL),('W8L804B437P22',1.0021,0.061,10.1,0.41,2.94,8.23,0.17,0.38,39.9,237.9,13.5,437,8,804,NULL),('W8L804B437P23',0.9998,0.094,8.9,0.71,3.4,6.61,0.15,0.51,23.5,112,14.66,437,8,804,NULL),('W8L804B437P24',0.9988,0.057,10.7,0.76,2.88,9.95,0.59,0.61,43.2,110.9,7.52,437,8,804,NULL),('W8L804B437P25',1.0023,0.011,10.7,0.39,3.58,9.48,0.47,0.14,18.4,124,8.11,437,8,804,NULL),('W8L804B437P26',0.999,0.018,10.3,0.35,3.43,6.89,0.71,0.86,15.9,69.6,14.99,437,8,804,NULL),('W8L804B437P27',1.0027,0.082,11.2,0.39,3.34,7.48,0.39,0.68,52.4,122.7,11.12,437,8,804,NULL),('W8L804B437P3',0.9922,0.062,8.6,0.41,3.47,9.61,0.64,0.88,64,120.5,6.83,437,8,804,NULL),('W8L804B437P4',1.0018,0.025,8.4,0.7,3.74,6.27,0.59,0.4,20.5,188.2,3.12,437,8,804,NULL),('W8L804B437P5',0.9993,0.09,12,0.99,3.55,8.64,0.45,0.82,9.9,169.6,16.29,437,8,804,NULL),('W8L804B437P6',0.9939,0.032,9.2,0.46,3.6,9.74,0.07,0.43,20.3,140,0.91,437,8,804,NULL),('W8L804B437P7',1.0004,0.022,9.2,0.46,3.04,7.85,0.4,0.8,65.5,21.1,14.83,437,8,804,NULL),('W8L804B437P8',0.9903,0.022,11.8,0.62,2.83,9.57,0.49,0.24,18,129.2,3.42,437,8,804,NULL),('W8L804B437P9',1.0008,0.025,12.7,0.86,3.08,9.09,0.65,0.13,31.9,213.9,10.78,437,8,804,NULL),('W8L804B438P1',0.9969,0.099,10.7,0.66,3.04,7.08,0.63,0.93,16.1,69,10,438,8,804,NULL),('W8L804B438P10',0.9961,0.085,12.2,0.38,3.36,6.03,0.42,0.25,51.5,142,2.46,438,8,804,NULL),('W8L804B438P11',0.9952,0.099,13.8,0.7,3.27,6.59,0.65,0.37,5.6,129,9.5,438,8,804,NULL),('W8L804B438P12',1.0031,0.05,11.6,0.53,3.47,8.6,0.52,0.88,67.6,88.1,19.38,438,8,804,NULL),('W8L804B438P13',0.9998,0.023,11,1,2.89,6.84,0.79,0.45,64.3,189.7,16.21,438,8,804,NULL),('W8L804B438P14',1.0001,0.042,14,0.93,3.38,5.58,0.4,0.99,9.2,120.9,15.19,438,8,804,NULL),('W8L804B438P15',0.9967,0.019,12.9,0.94,3.35,9.18,0.16,0.23,25.6,242.1,14.96,438,8,804,NULL),('W8L804B438P16',0.9984,0.097,8.4,0.36,3.1,7.25,0.73,0.71,48.5,14,4.09,438,8,804,NULL),('W8L804B438P17',0.9935,0.062,11.3,0.56,3.48,5.14,0.67,0.15,46.5,68,2.15,438,8,804,NULL),('W8L804B438P18',0.9964,0.018,10.9,0.47,3.59,8.75,0.75,0.42,63.8,196,4.44,438,8,804,NULL),('W8L804B438P19',0.9971,0.075,9.8,0.73,3.7,9.93,0.38,0.6,8.1,160.1,7.57,438,8,804,NULL),('W8L804B438P2',0.9981,0.069,13.5,0.77,3.73,8.92,0.23,0.36,23.5,241.2,7.1,438,8,804,NULL),('W8L804B438P20',0.9968,0.014,9.8,0.69,2.94,9.18,0.12,0.2,18.1,19.6,8.05,438,8,804,NULL),('W8L804B438P21',0.9998,0.06,8.3,0.36,3.34,8.93,0.62,0.46,67.1,125.7,9.16,438,8,804,NULL),('W8L804B438P22',0.996,0.091,8.1,0.45,2.93,6.77,0.33,0.38,69.5,174.9,9.65,438,8,804,NULL),('W8L804B438P23',1.0038,0.068,10.1,0.67,3.45,8.26,0.53,0.34,25.9,140.2,16.46,438,8,804,NULL),('W8L804B438P24',1,0.023,8,0.81,2.93,5.9,0.37,0.35,20,165,17.99,438,8,804,NULL),('W8L804B438P25',0.9962,0.017,8,0.92,3.44,9.01,0.19,0.35,21.8,76.8,0.89,438,8,804,NULL),('W8L804B438P26',0.9987,0.059,10.9,0.69,3.01,6.12,0.24,0.21,17.5,15.2,0.62,438,8,804,NULL),('W8L804B438P27',1.0022,0.046,13.8,0.95,3.3,7.17,0.28,0.62,51.8,27.9,18.81,438,8,804,NULL),('W8L804B438P3',1.0027,0.052,11.9,0.47,2.93,6.8,0.32,0.86,46.3,213,12.97,438,8,804,NULL),('W8L804B438P4',0.9911,0.072,13.5,0.86,3.64,5.24,0.04,0.75,48,180.4,5.54,438,8,804,NULL),('W8L804B438P5',0.9975,0.052,10.4,0.32,3.52,5.63,0.37,0.76,63.1,220.1,16.06,438,8,804,NULL),('W8L804B438P6',0.9933,0.082,8,0.44,3.22,9.73,0.76,0.56,9.9,107,10.11,438,8,804,NULL),('W8L804B438P7',1.0047,0.065,13.3,0.9,2.85,9.71,0.66,0.96,50.4,180.9,19.72,438,8,804,NULL),('W8L804B438P8',0.9945,0.047,14,0.91,3.37,6.1,0.45,0.13,12.1,165.9,1.33,438,8,804,NULL),('W8L804B438P9',0.9951,0.041,10.3,0.73,2.99,7.09,0.2,0.47,23.7,114.4,9.55,438,8,804,NULL),('W8L804B439P1',0.9995,0.034,10.5,1,3.62,8.75,0.71,0.68,66.4,121.1,16.88,439,8,804,NULL),('W8L804B439P10',0.9918,0.095,10.1,0.47,3.02,8.02,0.38,0.56,27.9,158.3,13.38,439,8,804,NULL),('W8L804B439P11',0.9923,0.017,10.9,0.77,3.67,8.75,0.76,0.2,17.5,238.4,10.62,439,8,804,NULL),('W8L804B439P12',1.0019,0.043,12.6,0.39,3.8,9.74,0.43,0.42,55.8,237.4,16.84,439,8,804,NULL),('W8L804B439P13',1.005,0.023,10,0.83,3.32,6.67,0.64,0.44,66.1,148,5.17,439,8,804,NULL),('W8L804B439P14',1.0013,0.069,10,0.52,3.68,6.93,0.16,0.15,29.1,33.5,11.32,439,8,804,NULL),('W8L804B439P15',1.0028,0.034,12.5,0.61,3.34,6.63,0.56,0.45,28.7,231,7.67,439,8,804,NULL),('W8L804B439P16',0.9977,0.024,11.8,0.76,3.53,8.01,0.62,0.37,54.6,24.9,6.38,439,8,804,NULL),('W8L804B439P17',0.9937,0.018,10.3,0.76,3.53,6.68,0.55,0.94,27.3,233.9,10.85,439,8,804,NULL),('W8L804B439P18',0.9909,0.062,12.7,0.68,3.4,5.19,0.47,0.88,46.1,240.6,10.15,439,8,804,NULL),('W8L804B439P19',0.9948,0.026,11.9,0.32,2.91,5.35,0.78,0.68,64.8,76.8,5.43,439,8,804,NULL),('W8L804B439P2',0.9938,0.049,9.4,0.47,2.88,7.65,0.24,0.31,34,86.4,18.15,439,8,804,NULL),('W8L804B439P20',1.0006,0.018,11,0.58,3.02,7.38,0.56,0.99,63.9,135.3,5.33,439,8,804,NULL),('W8L804B439P21',1.0029,0.043,11.2,0.45,3.48,6.23,0.5,0.48,53.4,49.4,12.67,439,8,804,NULL),('W8L804B439P22',1.0027,0.057,8.6,0.34,3.51,9.06,0.5,0.54,38.7,246.1,3.1,439,8,804,NULL),('W8L804B439P23',0.9933,0.066,9.8,0.88,3.76,8.64,0.21,0.77,13.9,13.3,16.63,439,8,804,NULL),('W8L804B439P3',0.9983,0.031,11.9,0.93,2.8,5.04,0.63,0.33,43.3,27.8,15.01,439,8,804,NULL),('W8L804B439P4',1.0049,0.097,9.9,0.89,3.59,7.36,0.62,0.83,48.3,156.6,2.82,439,8,804,NULL),('W8L804B439P5',0.9992,0.05,8.4,0.85,3.75,6.33,0.51,0.86,46.7,163.7,1.25,439,8,804,NULL),('W8L804B439P6',1.0033,0.093,11.5,0.79,2.84,8.94,0.26,0.52,48.5,47,16.37,439,8,804,NULL),('W8L804B439P7',0.9928,0.02,9.2,0.74,3.04,8.15,0.56,0.5,50.2,78,19.57,439,8,804,NULL),('W8L804B439P8',0.9972,0.04,9.8,0.79,3.07,7.33,0.24,0.44,9.6,195.1,15.48,439,8,804,NULL),('W8L804B439P9',1.0041,0.073,13.9,0.9,3.45,9.26,0.6,0.52,26.1,120.1,9.65,439,8,804,NULL),('W8L804B440P1',0.9998,0.094,13,0.74,3.09,7.04,0.04,0.78,17.3,24.6,8.5,440,8,804,NULL),('W8L804B440P10',1.0012,0.038,13.6,0.44,3.57,9.19,0.75,0.42,54.6,139.2,1.9,440,8,804,NULL),('W8L804B440P11',0.9946,0.02,8.7,0.61,3.31,8.49,0.27,0.46,52.7,15.1,4.43,440,8,804,NULL),('W8L804B440P12',0.9933,0.038,13.6,0.7,2.84,7.69,0.07,0.72,24,113.2,8.61,440,8,804,NULL),('W8L804B440P13',1.0017,0.048,9,0.5,3.02,6.35,0.16,0.42,50.5,36.1,15.29,440,8,804,NULL),('W8L804B440P14',0.9948,0.013,10.6,0.47,3.65,9.47,0.49,0.65,39.3,10.7,7.21,440,8,804,NULL),('W8L804B440P15',1.0041,0.077,10.6,0.69,3.36,5.06,0.23,0.72,60.3,54.1,9.84,440,8,804,NULL),('W8L804B440P16',1.0031,0.034,11.8,0.39,3.21,5.1,0.49,0.86,16.2,214.2,17.03,440,8,804,NULL),('W8L804B440P17',1.0048,0.079,10.1,0.64,3.05,8.68,0.04,0.88,58.8,149.9,14.53,440,8,804,NULL),('W8L804B440P18',1.0025,0.093,8.7,0.99,3.3,6.32,0.59,0.83,8.8,82.4,10.07,440,8,804,NULL),('W8L804B440P19',0.997,0.074,8.8,0.8,3.62,6.72,0.73,0.88,52.5,159.9,14.63,440,8,804,NULL),('W8L804B440P2',0.9998,0.1,10.4,0.99,3.4,9.88,0.2,0.78,8.8,199.1,0.69,440,8,804,NULL),('W8L804B440P20',0.9935,0.072,8,0.32,3.1,5.09,0.74,0.73,16,247.1,17.8,440,8,804,NULL),('W8L804B440P21',0.9974,0.051,13.9,0.74,3.45,9.79,0.58,0.95,50.2,51.5,15.9,440,8,804,NULL),('W8L804B440P22',0.999,0.07,9,0.66,3.72,6.15,0.47,0.42,39.9,180.1,8.23,440,8,804,NULL),('W8L804B440P23',1.0003,0.079,10.3,0.69,3.25,7.34,0.03,0.63,5.9,164.3,1.48,440,8,804,NULL),('W8L804B440P24',0.9942,0.094,10.2,0.36,3.25,7.65,0.43,0.29,9.1,128.7,4.8,440,8,804,NULL),('W8L804B440P3',1.0019,0.069,10.3,0.51,3.06,8.23,0.26,0.94,19.3,184.6,15.21,440,8,804,NULL),('W8L804B440P4',1.0003,0.046,13,0.42,2.95,5.81,0.37,0.44,36.6,114.2,1.92,440,8,804,NULL),('W8L804B440P5',0.9923,0.074,10.9,0.63,3.23,9.17,0.15,0.44,61.5,73.7,15.78,440,8,804,NULL),('W8L804B440P6',1.0025,0.046,11,0.57,2.86,5.15,0.46,0.47,39.1,56.4,5.02,440,8,804,NULL),('W8L804B440P7',0.9913,0.071,11.3,0.54,3.22,6.67,0.25,0.23,66.9,167.1,0.75,440,8,804,NULL),('W8L804B440P8',1.0029,0.047,12.2,0.8,3.19,8.98,0.45,0.91,50.7,29.4,16.35,440,8,804,NULL),('W8L804B440P9',0.9919,0.092,10.6,0.94,3.72,7.18,0,0.36,56.9,135.6,8.64,440,8,804,NULL),('W8L804B441P1',1.002,0.062,11.7,0.52,3.17,7.55,0.59,0.53,56.4,128.5,6.59,441,8,804,NULL),('W8L804B441P10',1.0024,0.024,13,0.85,3.71,9.51,0.04,0.13,45.4,71.1,6.79,441,8,804,NULL),('W8L804B441P11',1.001,0.025,12,0.76,3.67,7.99,0.62,0.57,40.1,53.1,9.66,441,8,804,NULL),('W8L804B441P12',0.9954,0.089,12.1,0.78,2.87,7.19,0.3,0.77,53.5,106.9,12.08,441,8,804,NULL),('W8L804B441P13',1.002,0.084,13.9,0.78,3.04,6.78,0.69,0.7,17,34.4,3.17,441,8,804,NULL),('W8L804B441P14',0.991,0.051,13.6,0.87,3.52,5.82,0.23,0.11,51,63,16.42,441,8,804,NULL),('W8L804B441P15',0.9959,0.036,13.8,0.71,3.18,6.84,0.11,0.4,36.9,104.8,7.78,441,8,804,NULL),('W8L804B441P16',0.9947,0.052,14,0.66,3.05,9.13,0.75,0.23,52.4,47.5,16.2,441,8,804,NULL),('W8L804B441P17',1.0018,0.086,13.5,0.49,2.94,6.12,0.29,0.53,33.4,98.3,9.64,441,8,804,NULL),('W8L804B441P18',0.9943,0.067,11.2,0.32,2.93,6.58,0.45,0.49,53.6,217.3,3.92,441,8,804,NULL),('W8L804B441P19',1.0038,0.03,13.8,0.55,3.19,5.46,0.14,0.81,22,178.4,17.41,441,8,804,NULL),('W8L804B441P2',1.0039,0.078,13.9,0.6,3.78,6.27,0.28,0.41,22.8,78.8,13.84,441,8,804,NULL),('W8L804B441P20',1.0011,0.054,12.1,0.61,3.76,6.81,0.38,0.4,52.9,206.2,18.86,441,8,804,NULL),('W8L804B441P21',0.9997,0.095,12,0.75,3.33,6.79,0.38,0.5,58,63.1,1.1,441,8,804,NULL),('W8L804B441P22',1.0018,0.067,13.4,0.64,3.03,9.4,0.01,0.38,44.7,195,2.66,441,8,804,NULL),('W8L804B441P23',0.9928,0.021,14,0.45,3.27,6.5,0.38,0.89,15.9,219.7,4.04,441,8,804,NULL),('W8L804B441P24',0.9949,0.013,13.3,0.91,3.31,7.31,0.05,0.68,69.1,77.8,13.78,441,8,804,NULL),('W8L804B441P25',0.9996,0.066,9.1,0.88,3.3,8.89,0.18,0.3,54.5,184.3,11.69,441,8,804,NULL),('W8L804B441P26',0.9977,0.043,8.8,0.73,3.65,7.96,0.23,0.92,27.9,66.4,1.89,441,8,804,NULL),('W8L804B441P27',0.991,0.091,11.4,0.67,3.49,7.02,0.74,0.75,45.4,165.7,0.76,441,8,804,NULL),('W8L804B441P3',1.0015,0.067,8.5,0.76,3.77,7.67,0.78,0.89,59.5,78.3,2.82,441,8,804,NULL),('W8L804B441P4',0.9932,0.091,11.2,0.8,3.72,7.74,0.24,0.28,58.6,141.6,12.91,441,8,804,NULL),('W8L804B441P5',0.9911,0.053,13.4,0.58,3.58,7.09,0.21,0.71,6.2,79.5,12.77,441,8,804,NULL),('W8L804B441P6',1.0043,0.052,8.6,0.89,3.79,5.33,0.53,0.55,14.9,19,10.47,441,8,804,NULL),('W8L804B441P7',0.9978,0.078,13.8,0.74,3.44,5.33,0.1,0.41,39.5,196.5,2.64,441,8,804,NULL),('W8L804B441P8',0.9993,0.054,10.4,0.62,3.13,5.84,0.39,0.75,21.6,81.1,1.3,441,8,804,NULL),('W8L804B441P9',1.0031,0.091,12.5,0.78,2.88,7.69,0.73,0.12,57.3,233.4,15.89,441,8,804,NULL),('W8L804B442P1',1.0035,0.072,11.2,0.91,3.64,5.66,0.67,0.83,26.6,25,3.41,442,8,804,NULL),('W8L804B442P10',0.9917,0.061,10,0.32,2.92,8.37,0.38,0.89,38.1,201.6,17.07,442,8,804,NULL),('W8L804B442P11',0.9928,0.057,13,0.7,3.05,7.53,0.42,0.82,18.7,23.6,17.24,442,8,804,NULL),('W8L804B442P12',0.9907,0.028,10.6,0.82,2.98,5.65,0.47,0.2,45.5,217.1,11.52,442,8,804,NULL),('W8L804B442P13',1.0043,0.043,12.1,0.89,3.57,6.31,0.72,0.4,23.6,27.4,5.95,442,8,804,NULL),('W8L804B442P14',0.9974,0.054,8.3,0.4,3.46,7.69,0.27,0.45,43.2,112.5,17.87,442,8,804,NULL),('W8L804B442P15',0.9928,0.028,13.2,0.57,3.29,9.79,0.7,0.78,50.8,30.5,12.15,442,8,804,NULL),('W8L804B442P16',1.003,0.035,9.8,0.32,3.71,6.3,0,0.14,41.7,226.3,4.14,442,8,804,NULL),('W8L804B442P17',1.0003,0.029,9.9,0.68,3.17,9.07,0.04,0.43,65,79.2,7.25,442,8,804,NULL),('W8L804B442P18',0.9903,0.034,8.8,0.9,3.1,5,0.25,0.49,29.6,100.3,10.92,442,8,804,NULL),('W8L804B442P19',0.9958,0.073,10.7,0.42,3.33,7.98,0.75,0.54,35.1,127.6,5.23,442,8,804,NULL),('W8L804B442P2',1.0024,0.044,11.2,0.94,3.59,5.27,0.3,0.63,30.7,231.3,14.98,442,8,804,NULL),('W8L804B442P20',0.9937,0.042,12.3,0.86,3.24,7.54,0.31,0.37,40.3,16.2,7.37,442,8,804,NULL),('W8L804B442P21',0.9946,0.052,11.9,0.89,3.04,5.15,0.09,0.82,69,150.3,9.46,442,8,804,NULL),('W8L804B442P3',1.0036,0.062,12.9,0.57,3.21,5.71,0.49,0.34,27.6,125.6,16.65,442,8,804,NULL),('W8L804B442P4',0.9902,0.098,9.1,0.55,3.62,7.17,0.68,0.16,49.4,229.1,11.06,442,8,804,NULL),('W8L804B442P5',0.9973,0.099,13.2,0.96,3.07,9.04,0.63,0.78,41,144.3,10.3,442,8,804,NULL),('W8L804B442P6',0.9916,0.012,13.4,0.87,3.52,9.7,0.33,0.35,55.5,55.8,8.98,442,8,804,NULL),('W8L804B442P7',0.9959,0.048,8.3,0.7,3.21,8.14,0.65,0.54,7.3,176.3,19.49,442,8,804,NULL),('W8L804B442P8',1.0028,0.09,9.1,0.84,2.94,8.28,0.37,0.95,40.5,132.3,5.82,442,8,804,NULL),('W8L804B442P9',0.9986,0.045,9.1,0.76,3.22,6.86,0.2,0.82,55.9,48.4,16.84,442,8,804,NULL),('W8L805B265P1',1.0035,0.069,10.5,0.49,3.57,8.5,0.46,0.37,23,240,16.71,265,8,805,NULL),('W8L805B265P10',1.005,0.073,12.3,0.42,2.83,8.92,0.19,0.24,17.4,97.3,14.35,265,8,805,NULL),('W8L805B265P11',0.9966,0.08,11.9,0.79,3.3,5.19,0.24,0.68,33.5,58,1.57,265,8,805,NULL),('W8L805B265P12',1.0038,0.069,11,0.49,3.33,7.81,0.36,0.25,31.4,172.6,8.21,265,8,805,NULL),('W8L805B265P13',0.9916,0.021,11.2,0.75,3.64,9.27,0.54,0.38,29.1,164,4.47,265,8,805,NULL),('W8L805B265P14',0.9931,0.024,11.1,0.85,3.49,9.89,0.46,0.64,49.5,224.6,12.17,265,8,805,NULL),('W8L805B265P15',1.0042,0.091,8.3,0.57,3.59,8.8,0.47,0.34,56.1,14.3,14.28,265,8,805,NULL),('W8L805B265P16',0.9945,0.045,9.2,0.71,3.17,5.2,0.01,0.33,67.6,178,0.7,265,8,805,NULL),('W8L805B265P17',0.9926,0.013,13.3,0.55,3.62,9.98,0.37,0.4,52.5,133.2,6.66,265,8,805,NULL),('W8L805B265P18',0.9952,0.069,8.3,0.58,3.15,5.93,0.7,0.66,19.6,167.3,19.14,265,8,805,NULL),('W8L805B265P19',1.0036,0.048,13.3,0.38,3.31,5.89,0.4,0.39,17.8,142.8,0.61,265,8,805,NULL),('W8L805B265P2',0.9913,0.05,13,0.46,2.91,9.5,0.59,0.73,32.9,95,6.52,265,8,805,NULL),('W8L805B265P20',1.0025,0.044,9.8,0.6,3.59,6.07,0.49,0.91,45.4,157.5,10.71,265,8,805,NULL),('W8L805B265P21',1.0014,0.035,10.9,0.48,3.26,5.8,0.55,0.44,56.1,113.3,19.74,265,8,805,NULL),('W8L805B265P22',1.0013,0.03,12.1,0.58,3.13,5.27,0.39,0.23,20.8,205.4,17.92,265,8,805,NULL),('W8L805B265P23',1.0012,0.078,10.1,0.87,3.04,6.52,0.11,0.75,50.8,184.2,8.19,265,8,805,NULL),('W8L805B265P24',1.001,0.019,11.7,0.86,3.14,8.63,0,0.53,34.3,49.8,3.65,265,8,805,NULL),('W8L805B265P25',0.9913,0.03,13.3,0.73,3.79,7.68,0.28,0.99,10,105.2,11.59,265,8,805,NULL),('W8L805B265P26',0.9978,0.043,12.5,0.94,3.18,8.03,0.18,0.59,26.8,92.1,14.27,265,8,805,NULL),('W8L805B265P27',1.0009,0.057,10,0.3,2.9,6.12,0.29,0.83,23.9,124.4,18.53,265,8,805,NULL),('W8L805B265P3',1.0006,0.083,9.2,0.34,3.21,9.23,0.45,0.3,6.7,40.9,8.1,265,8,805,NULL),('W8L805B265P4',1.0037,0.033,13.7,0.72,3.2,6.67,0.8,0.95,36.7,78.5,15.79,265,8,805,NULL),('W8L805B265P5',1.0047,0.028,10.9,0.7,3.62,6.61,0.25,1,56.6,146.7,1.59,265,8,805,NULL),('W8L805B265P6',1.0025,0.03,12.3,0.77,3.56,9.03,0.07,0.18,21.1,131.1,16.94,265,8,805,NULL),('W8L805B265P7',0.9925,0.039,8.1,0.41,3.11,7.07,0.25,0.12,28.7,32.9,4.93,265,8,805,NULL),('W8L805B265P8',0.9934,0.079,11.1,0.88,3.34,5.32,0.05,0.69,61.5,235.1,11.73,265,8,805,NULL),('W8L805B265P9',0.9928,0.04,12.4,0.45,3.71,8.74,0.49,0.18,52.9,37.7,14.35,265,8,805,NULL),('W8L805B266P1',1.0042,0.059,9,0.67,3.22,7.45,0.58,0.28,60.7,132,13.03,266,8,805,NULL),('W8L805B266P10',0.9994,0.046,11.5,0.65,2.96,7.98,0.56,0.68,17.1,204.2,5.35,266,8,805,NULL),('W8L805B266P11',0.9995,0.088,10.9,0.48,3.73,5.37,0.76,0.15,42.4,187.5,2.72,266,8,805,NULL),('W8L805B266P12',0.9921,0.091,8.8,0.93,3.18,8.72,0.04,0.55,42.4,41.1,2.22,266,8,805,NULL),('W8L805B266P13',0.9928,0.022,10.5,0.81,3.64,6.49,0.01,0.71,39.2,196.4,3.29,266,8,805,NULL),('W8L805B266P14',1.004,0.074,13.3,0.86,3.41,7.8,0.71,0.9,13.5,205.5,19.29,266,8,805,NULL),('W8L805B266P15',0.9978,0.029,12,0.43,3.34,6.13,0.78,0.46,64.2,19.1,8.9,266,8,805,NULL),('W8L805B266P16',0.9925,0.093,9.4,0.75,2.92,5.57,0.51,0.79,55.4,239.2,3.41,266,8,805,NULL),('W8L805B266P17',1.0039,0.09,11.6,0.55,3.64,6.36,0.34,0.79,33.9,188.4,13.12,266,8,805,NULL),('W8L805B266P18',1.0022,0.035,12.4,0.66,3.13,8.06,0.18,0.31,16.8,158.4,13.46,266,8,805,NULL),('W8L805B266P19',0.9906,0.088,8.1,0.75,2.84,6.93,0.72,0.94,57.1,28.7,2,266,8,805,NULL),('W8L805B266P2',1.001,0.07,9.5,0.98,3.57,7.26,0.56,0.17,55.2,46.9,10.48,266,8,805,NULL),('W8L805B266P20',0.9991,0.051,13.5,0.7,3.22,6.17,0.64,0.14,37.2,79.3,14.62,266,8,805,NULL),('W8L805B266P21',0.9969,0.098,10.5,0.55,3.26,5.35,0.3,0.16,13.6,140.3,11.21,266,8,805,NULL),('W8L805B266P22',0.9929,0.012,9.2,0.44,3.2,5.23,0.51,0.38,9,71.7,1.39,266,8,805,NULL),('W8L805B266P23',0.9969,0.069,9.5,0.48,3.7,6.86,0.66,0.81,41.8,127.7,18.04,266,8,805,NULL),('W8L805B266P24',0.9935,0.036,12.5,0.49,2.87,8.23,0.2,0.35,42.1,226.6,18.86,266,8,805,NULL),('W8L805B266P25',0.9991,0.057,11.8,0.84,3.7,6.84,0.14,0.64,20,27.5,6.03,266,8,805,NULL),('W8L805B266P3',0.9907,0.029,12.4,0.77,2.88,9.7,0.01,0.65,41.6,84.7,12.78,266,8,805,NULL),('W8L805B266P4',0.9944,0.043,11.9,0.8,3.66,6.14,0.22,0.77,56.1,188.2,2.86,266,8,805,NULL),('W8L805B266P5',0.9981,0.069,9.4,0.71,2.81,8.83,0.17,0.55,68.4,218.4,5.09,266,8,805,NULL),('W8L805B266P6',0.9979,0.031,13.3,0.51,3.21,6.41,0.17,0.82,47.2,53.3,17.45,266,8,805,NULL),('W8L805B266P7',0.9932,0.039,13.3,0.79,2.86,6.07,0.35,0.63,59.8,15.2,13.26,266,8,805,NULL),('W8L805B266P8',1.002,0.084,11.6,0.87,3.51,5.81,0.21,0.86,15.5,174.9,13.33,266,8,805,NULL),('W8L805B266P9',0.9919,0.072,9.7,0.34,3.3,5.82,0.17,0.99,48.3,238,10.75,266,8,805,NULL),('W8L805B267P1',1.001,0.018,12.7,0.91,2.87,5.86,0.65,0.27,53.4,37.3,16.89,267,8,805,NULL),('W8L805B267P10',0.9922,0.06,12.6,0.46,3.2,7.75,0.42,0.34,32.9,219,14.06,267,8,805,NULL),('W8L805B267P11',1,0.079,8.9,0.61,3.71,9.45,0.43,0.81,56.7,117.6,19.58,267,8,805,NULL),('W8L805B267P12',0.9901,0.032,12,0.86,3.23,7.38,0.03,0.41,20.7,208.8,14.93,267,8,805,NULL),('W8L805B267P13',0.9932,0.027,10.3,0.8,3.18,5.12,0.79,0.25,57.5,102.3,14.2,267,8,805,NULL),('W8L805B267P14',0.9963,0.074,8.5,0.77,2.94,7.87,0,0.77,15.1,242.2,6.16,267,8,805,NULL),('W8L805B267P15',0.9915,0.066,11.7,0.36,3.26,8.35,0.71,0.88,51.6,124.9,6.3,267,8,805,NULL),('W8L805B267P16',1.0045,0.012,13.1,0.78,3.52,5.28,0.77,0.8,67.1,230.5,2.96,267,8,805,NULL),('W8L805B267P17',0.9981,0.041,12.8,0.59,2.96,5.78,0.72,0.57,47,54.8,6.44,267,8,805,NULL),('W8L805B267P18',0.9931,0.041,8.5,0.77,3.04,7.52,0.66,0.96,62.2,209,7.17,267,8,805,NULL),('W8L805B267P19',1.0005,0.043,10.6,0.64,3.42,6.25,0.1,0.95,47,209.1,14.92,267,8,805,NULL),('W8L805B267P2',0.9908,0.098,9.5,0.43,3.65,7.36,0.23,0.82,18.7,108.8,12.76,267,8,805,NULL),('W8L805B267P20',0.9941,0.095,12.8,0.3,2.96,5.66,0.5,0.73,65.8,60.5,12.44,267,8,805,NULL),('W8L805B267P21',1.0012,0.016,12.6,0.53,2.99,5.96,0.3,0.74,46.2,43.6,12.81,267,8,805,NULL),('W8L805B267P22',0.9954,0.069,13.9,0.73,3.48,5.58,0.26,0.17,34.6,29.5,6.2,267,8,805,NULL),('W8L805B267P23',1.0049,0.055,10.8,0.45,3.32,6.73,0.23,0.33,56.5,115.4,12.2,267,8,805,NULL),('W8L805B267P24',0.9986,0.052,11,0.67,3.45,5.49,0.49,0.59,32.3,139.5,5.65,267,8,805,NULL),('W8L805B267P25',1.0043,0.087,12,0.91,3.09,6.93,0.01,0.44,25.1,46.1,14.81,267,8,805,NULL),('W8L805B267P26',0.9966,0.082,12.1,0.89,3.12,5.84,0.67,0.46,35.9,112.8,13.79,267,8,805,NULL),('W8L805B267P27',0.9983,0.017,9,0.72,3.63,6.17,0.45,0.15,10.3,134.5,15.61,267,8,805,NULL),('W8L805B267P28',0.9978,0.02,9.4,0.42,3.63,9.14,0.73,0.52,39.7,241.8,18.27,267,8,805,NULL),('W8L805B267P3',1.0032,0.041,12.3,0.71,3.01,5.15,0.78,0.2,67.2,213,5.03,267,8,805,NULL),('W8L805B267P4',0.9984,0.088,13.6,0.89,3.38,7.01,0.56,0.63,30.4,186.9,4.35,267,8,805,NULL),('W8L805B267P5',0.9918,0.066,12.5,0.35,3.61,9.02,0.35,0.76,49.8,232,5.72,267,8,805,NULL),('W8L805B267P6',1.0004,0.035,12.3,0.59,3.47,5.85,0.44,0.9,39.3,18.8,6.8,267,8,805,NULL),('W8L805B267P7',0.9929,0.025,9,0.38,3.23,7.77,0.31,0.49,46.6,11.4,12.6,267,8,805,NULL),('W8L805B267P8',0.996,0.063,13,0.72,2.86,5.82,0.47,0.89,32.7,231.1,6.5,267,8,805,NULL),('W8L805B267P9',0.9971,0.058,10.8,0.84,3.46,9.57,0.53,0.94,66,10.3,8.99,267,8,805,NULL),('W8L805B268P1',1.0031,0.08,12.3,0.39,2.9,5.57,0.14,0.7,49.4,152.2,18.93,268,8,805,NULL),('W8L805B268P10',1.0037,0.077,11.3,0.71,3.68,7.8,0.48,0.36,37.8,111.4,4.86,268,8,805,NULL),('W8L805B268P11',0.9958,0.068,8.9,0.9,3.36,8.74,0.48,0.99,42.7,212.2,1.47,268,8,805,NULL),('W8L805B268P12',0.9955,0.088,8.1,0.34,2.81,7.63,0.04,0.51,47,244.9,8.46,268,8,805,NULL),('W8L805B268P13',0.9987,0.076,8.6,0.65,2.9,9.48,0.68,0.33,69.9,150.7,13.69,268,8,805,NULL),('W8L805B268P14',0.998,0.011,13.7,0.36,3.29,9.48,0.15,0.22,65,191.2,16.02,268,8,805,NULL),('W8L805B268P15',0.9906,0.057,9.2,0.57,3.05,8.75,0.21,0.52,49.5,26.9,19.48,268,8,805,NULL),('W8L805B268P16',0.994,0.011,11.8,0.35,3.17,9.98,0.11,0.83,19.5,165.3,12.14,268,8,805,NULL),('W8L805B268P17',0.9915,0.015,10.7,0.42,3.2,6.37,0.43,0.25,68.5,191.6,1.92,268,8,805,NULL),('W8L805B268P18',1.0003,0.035,8.4,0.67,3.12,6.65,0.11,0.47,6.7,90.6,13.29,268,8,805,NULL),('W8L805B268P19',1.003,0.09,9.8,0.45,3.18,8.28,0.31,0.14,11,13.7,4.27,268,8,805,NULL),('W8L805B268P2',0.9963,0.071,12.1,0.39,2.96,9.57,0.58,0.92,18.3,158.9,16.02,268,8,805,NULL),('W8L805B268P20',1.0006,0.031,10.4,0.83,2.82,9.66,0.45,0.48,67.7,103,6.4,268,8,805,NULL),('W8L805B268P21',1.0021,0.018,9.6,0.42,3.67,9.18,0.34,0.53,42.6,244.7,9.3,268,8,805,NULL),('W8L805B268P22',0.9984,0.099,10.9,0.4,3.68,5.14,0.67,0.55,10.3,74,3.59,268,8,805,NULL),('W8L805B268P23',0.9917,0.072,10.3,0.68,2.94,7.47,0.18,0.32,53.4,25.3,11.73,268,8,805,NULL),('W8L805B268P24',0.9948,0.049,13.6,0.59,3.14,7.96,0.23,0.84,42.6,69.1,10.22,268,8,805,NULL),('W8L805B268P25',0.9929,0.041,12.9,0.38,3.4,8.33,0.08,0.1,47.2,195.6,13.56,268,8,805,NULL),('W8L805B268P26',1.0035,0.094,10.2,0.38,3.14,5.13,0.09,0.28,25.5,209.8,8.75,268,8,805,NULL),('W8L805B268P27',0.9954,0.06,12,0.3,3.07,5.07,0.32,0.5,21,139.7,4.25,268,8,805,NULL),('W8L805B268P28',0.9907,0.028,12.3,0.32,3.63,9.92,0.12,0.2,67.3,62.5,11.02,268,8,805,NULL),('W8L805B268P29',0.9988,0.049,8.1,0.34,3.55,8.8,0.48,0.23,51.8,208,12.42,268,8,805,NULL),('W8L805B268P3',1.0026,0.061,11.6,0.88,3.12,5.25,0.16,1,41.1,48.5,13.05,268,8,805,NULL),('W8L805B268P30',0.997,0.023,8.4,0.88,2.81,7.6,0.45,0.93,18.1,76.7,2.64,268,8,805,NULL),('W8L805B268P31',1.0029,0.061,11.4,1,3.44,6.43,0.21,0.42,51.6,210.1,13.71,268,8,805,NULL),('W8L805B268P32',0.999,0.073,9.5,0.74,3.36,9.07,0.72,0.97,20.5,42.3,2.49,268,8,805,NULL),('W8L805B268P4',0.9951,0.086,11.8,0.89,2.92,5.22,0.5,0.57,15.5,132.1,10.19,268,8,805,NULL),('W8L805B268P5',1.0008,0.096,13.4,0.71,3.01,5.58,0.64,0.44,10.9,97.8,0.75,268,8,805,NULL),('W8L805B268P6',1.0012,0.078,10.5,0.73,3.05,5.67,0.7,0.28,56.8,30.3,18.15,268,8,805,NULL),('W8L805B268P7',1.0029,0.014,9.4,0.85,3.27,8.21,0.23,0.85,29.3,243.5,19.98,268,8,805,NULL),('W8L805B268P8',0.9903,0.063,10.9,0.88,3.29,8.41,0.17,0.43,24,163.5,1.06,268,8,805,NULL),('W8L805B268P9',1.0034,0.029,12.1,0.44,3.34,8.55,0.11,0.98,33.4,17.1,8.37,268,8,805,NULL),('W8L805B269P1',0.9923,0.03,8.7,0.39,3.01,7.09,0.6,0.76,40.1,75.1,8.47,269,8,805,NULL),('W8L805B269P10',0.9993,0.015,11.5,0.3,3.6,7.43,0.68,0.91,29.5,87.2,7.7,269,8,805,NULL),('W8L805B269P11',0.9966,0.066,10.6,0.8,3.69,9.06,0.47,0.66,53.4,44.8,15.45,269,8,805,NULL),('W8L805B269P12',1.0017,0.1,9.7,0.37,3.11,9.87,0.06,0.59,57.4,130.9,12.16,269,8,805,NULL),('W8L805B269P13',0.9989,0.065,12.1,0.72,3.07,6.4,0.21,0.61,8.3,174.7,6.59,269,8,805,NULL),('W8L805B269P14',0.9945,0.042,9.7,0.41,3.68,8.18,0.72,0.34,48.2,104,4.09,269,8,805,NULL),('W8L805B269P15',0.9901,0.027,11,0.51,2.99,5.77,0.06,0.91,30.5,192.3,3.91,269,8,805,NULL),('W8L805B269P16',0.9944,0.051,10.5,0.54,3.39,9.49,0.36,0.61,68.1,42.5,10.73,269,8,805,NULL),('W8L805B269P17',1.0012,0.099,9.1,0.4,3.68,6.28,0.63,0.71,39.7,164.6,14.23,269,8,805,NULL),('W8L805B269P18',1.0044,0.044,8.9,0.75,3.34,5.94,0.72,0.45,67.2,40.3,11.84,269,8,805,NULL),('W8L805B269P19',0.9921,0.067,12.5,0.71,3.41,9.2,0.39,0.47,12.4,203.3,14.91,269,8,805,NULL),('W8L805B269P2',1.0036,0.079,8.1,0.64,3.37,8.52,0.7,0.18,54.8,116.5,2.81,269,8,805,NULL),('W8L805B269P20',0.9916,0.037,8.2,0.36,3.73,5.57,0.14,0.86,66.6,97.3,13.42,269,8,805,NULL),('W8L805B269P21',1.0049,0.095,8.1,0.55,3.76,7.17,0.21,0.57,17.9,58.9,13.21,269,8,805,NULL),('W8L805B269P22',1.0049,0.022,8.3,0.39,3.65,5.26,0.78,0.15,31,184.2,5.42,269,8,805,NULL),('W8L805B269P23',1.0013,0.089,13.6,1,3.62,7.01,0.5,0.54,59.2,196.9,0.88,269,8,805,NULL),('W8L805B269P24',0.9902,0.036,11.3,0.92,3.52,9.37,0.47,0.45,40.6,206.1,8.71,269,8,805,NULL),('W8L805B269P25',0.9931,0.01,12.7,0.43,3.43,9.91,0.35,0.85,34.7,174,15.91,269,8,805,NULL),('W8L805B269P3',1.0002,0.041,9.4,0.76,3.79,5.18,0.4,0.44,46.8,29.4,18.71,269,8,805,NULL),('W8L805B269P4',0.9978,0.049,13.9,0.74,2.85,9.14,0.63,0.84,21.8,153.3,13.01,269,8,805,NULL),('W8L805B269P5',0.9912,0.07,10.1,0.63,3.66,8.92,0.6,0.51,53.2,231.4,16.96,269,8,805,NULL),('W8L805B269P6',0.9925,0.032,9.5,0.41,3.53,8.17,0.42,0.33,15.5,13.3,4.65,269,8,805,NULL),('W8L805B269P7',0.9913,0.021,10.4,0.72,3.7,5.41,0.64,0.68,42.3,55.9,17.18,269,8,805,NULL),('W8L805B269P8',0.9987,0.035,11.8,0.36,3.63,7.63,0.59,0.19,33.3,219.4,10.66,269,8,805,NULL),('W8L805B269P9',1.0039,0.031,11.3,0.5,3.59,9.78,0.21,0.76,32.8,41.5,15.24,269,8,805,NULL),('W8L805B270P1',0.9986,0.033,13,0.64,2.88,5.2,0.2,0.22,59.5,184.1,18.55,270,8,805,NULL),('W8L805B270P10',0.9972,0.022,12.9,0.49,3.3,8.73,0.69,0.11,13.4,89.1,10.02,270,8,805,NULL),('W8L805B270P11',0.9987,0.058,8.9,0.85,3.53,6.6,0.63,0.27,12,129.5,7.35,270,8,805,NULL),('W8L805B270P12',1.0039,0.054,12.9,0.75,3.02,8.61,0.07,0.97,24.5,230.6,9.32,270,8,805,NULL),('W8L805B270P13',0.9954,0.03,12.5,0.38,2.85,5.99,0.76,0.14,57.4,54.6,8.57,270,8,805,NULL),('W8L805B270P14',1.0002,0.014,9.2,0.61,3.11,7.56,0.63,0.48,25.4,134.4,14.59,270,8,805,NULL),('W8L805B270P15',0.9964,0.067,10,0.95,2.94,9.64,0.16,0.86,28.2,206.6,2.05,270,8,805,NULL),('W8L805B270P16',0.9952,0.08,8.9,0.62,3.35,5.03,0.09,0.99,69.5,200.7,8.4,270,8,805,NULL),('W8L805B270P17',0.9993,0.026,11.2,0.84,3.07,5.47,0.71,0.5,43.2,176.4,1.5,270,8,805,NULL),('W8L805B270P18',0.9969,0.06,9.9,0.69,3.61,9.22,0.76,0.71,69.1,148.2,5.25,270,8,805,NULL),('W8L805B270P19',0.9951,0.095,9,0.46,3.16,8.42,0.12,0.99,13.8,131.1,10.93,270,8,805,NULL),('W8L805B270P2',1.0034,0.056,10.5,0.69,3.29,6.85,0.51,0.25,61,138.4,8.13,270,8,805,NULL),('W8L805B270P20',0.9986,0.031,12.1,0.56,3.58,8.6,0.2,0.77,38.6,238.1,2.41,270,8,805,NULL),('W8L805B270P21',1.0014,0.093,13.2,0.95,3.2,7.11,0.14,0.72,51.6,126.1,2.22,270,8,805,NULL),('W8L805B270P22',1.0044,0.063,8,0.99,3.51,8.6,0.63,0.39,39.2,55.8,13.87,270,8,805,NULL),('W8L805B270P23',0.9937,0.016,9.6,0.82,3.01,6.98,0.36,0.71,9.5,189.8,17.84,270,8,805,NULL),('W8L805B270P3',1.0047,0.084,11.3,0.85,3,5.97,0.74,0.63,10,201.5,11.9,270,8,805,NULL),('W8L805B270P4',1.0031,0.075,10.6,0.75,3.58,7.68,0.39,1,18.3,169.1,10.79,270,8,805,NULL),('W8L805B270P5',0.996,0.096,10.4,0.64,2.83,5.98,0.37,0.13,56.3,72.6,1.33,270,8,805,NULL),('W8L805B270P6',1.0012,0.038,11.9,0.88,3.5,8.54,0,0.27,27,51.8,2.67,270,8,805,NULL),('W8L805B270P7',0.9989,0.054,9,0.46,3.48,8.93,0.09,0.61,32.6,98.9,5.01,270,8,805,NULL),('W8L805B270P8',0.9919,0.062,12.9,0.85,3.69,7.9,0.66,0.26,26.9,56.3,17.41,270,8,805,NULL),('W8L805B270P9',0.9913,0.067,9.3,0.51,3.49,6.74,0.75,0.94,14.2,183.6,5.51,270,8,805,NULL),('W8L805B271P1',0.9992,0.079,9.9,0.65,3.48,6.03,0.16,0.21,65.7,206.7,7.12,271,8,805,NULL),('W8L805B271P10',0.9909,0.054,10.8,0.69,3.68,8.97,0.13,0.83,59.5,54.6,5.59,271,8,805,NULL),('W8L805B271P11',0.9919,0.046,8.3,0.61,3.14,6.5,0.51,0.23,67.1,53.5,9.52,271,8,805,NULL),('W8L805B271P12',0.9999,0.09,8.5,0.64,3.04,8.03,0.4,0.51,10.5,36.9,12.68,271,8,805,NULL),('W8L805B271P13',1.0016,0.09,11.1,0.53,3.17,9.65,0.77,0.37,64.8,240.9,6.17,271,8,805,NULL),('W8L805B271P14',0.9982,0.083,12.2,0.91,3.73,8.07,0.57,0.19,63.5,50.4,5.55,271,8,805,NULL),('W8L805B271P15',1.0004,0.085,12.7,0.74,2.95,5.64,0.77,0.43,18.3,228.6,12.54,271,8,805,NULL),('W8L805B271P16',1.0023,0.065,12.3,0.52,3.65,6.2,0.07,0.65,15.3,88.9,2.87,271,8,805,NULL),('W8L805B271P17',1.0017,0.098,9,0.93,3.22,6.73,0.15,0.96,27.8,221.7,12.79,271,8,805,NULL),('W8L805B271P18',1.003,0.051,11.9,0.54,3.07,8.27,0.18,0.4,48.7,67.7,2.59,271,8,805,NULL),('W8L805B271P19',0.9908,0.034,9.2,0.51,2.94,6,0.57,0.31,42.8,230.9,6.69,271,8,805,NULL),('W8L805B271P2',0.9947,0.02,13.8,0.35,3.77,6.8,0.27,0.16,12.6,11.6,5.16,271,8,805,NULL),('W8L805B271P20',0.9932,0.034,8.5,0.77,2.93,8.23,0.68,0.75,19.2,244.7,3.86,271,8,805,NULL),('W8L805B271P21',0.9996,0.068,12.5,0.31,3.63,5.47,0.49,0.84,21.2,180.8,7.82,271,8,805,NULL),('W8L805B271P22',1.0027,0.024,10.7,0.72,3.15,6.24,0.34,0.63,12.8,234.5,6.43,271,8,805,NULL),('W8L805B271P23',1.0002,0.092,10.8,0.87,3.44,6.51,0.38,0.58,26.9,59.3,6.8,271,8,805,NULL),('W8L805B271P24',1.0021,0.024,10.1,0.77,2.82,5.81,0.19,0.22,16.7,147.7,17.34,271,8,805,NULL),('W8L805B271P25',0.9923,0.066,14,1,3.27,5.12,0.65,0.79,62.9,144.9,8.18,271,8,805,NULL),('W8L805B271P3',0.9914,0.083,12.1,0.75,3.37,5.83,0.24,0.15,45.4,161.6,7.3,271,8,805,NULL),('W8L805B271P4',0.9942,0.013,10.2,0.61,3.3,6.86,0.33,0.54,8.5,172.4,17.44,271,8,805,NULL),('W8L805B271P5',1.0044,0.057,8.4,0.59,3.37,6.1,0.74,0.47,24.1,105.7,4.54,271,8,805,NULL),('W8L805B271P6',0.9959,0.083,9.6,0.73,3.48,7.62,0.33,0.71,22.2,10.3,9.12,271,8,805,NULL),('W8L805B271P7',0.9951,0.051,12.1,0.58,3.35,8.22,0.48,0.25,57,122.2,19.4,271,8,805,NULL),('W8L805B271P8',1.0019,0.098,13.8,0.99,3.28,5.3,0.56,0.21,68.7,128.6,19.54,271,8,805,NULL),('W8L805B271P9',0.9948,0.06,13.4,0.69,2.9,8.35,0.07,0.52,24.4,196,19.42,271,8,805,NULL),('W8L805B272P1',0.9992,0.034,12.4,0.79,3.71,7.4,0.43,0.37,42.7,153.9,8.07,272,8,805,NULL),('W8L805B272P10',1.0018,0.068,12.8,0.87,2.96,6.23,0.2,0.9,38,144,4.79,272,8,805,NULL),('W8L805B272P11',0.9904,0.01,11.5,0.42,3.22,8.38,0.53,0.66,28.9,165.1,14.87,272,8,805,NULL),('W8L805B272P12',1.0043,0.081,12.6,0.8,3.14,7.23,0.49,0.11,66.7,63.6,2.28,272,8,805,NULL),('W8L805B272P13',1.0016,0.046,11.9,0.52,3.19,6.06,0.03,0.32,27.4,167.3,9.03,272,8,805,NULL),('W8L805B272P14',0.9948,0.096,8.1,0.47,3.75,7.11,0.34,0.42,67,148.9,3.04,272,8,805,NULL),('W8L805B272P15',1.0049,0.015,13,0.79,3.45,5.36,0.39,0.62,30.8,113.8,12.4,272,8,805,NULL),('W8L805B272P16',0.9949,0.035,8.1,0.75,3.36,7.06,0.09,0.16,51.9,222.4,6.94,272,8,805,NULL),('W8L805B272P17',1.0038,0.065,10.1,0.53,3.03,5.83,0.01,0.27,8.1,63.7,18.98,272,8,805,NULL),('W8L805B272P18',0.9942,0.042,8.5,0.65,3.76,7.8,0.63,0.72,57.3,113.6,1.93,272,8,805,NULL),('W8L805B272P19',0.9971,0.034,9.8,0.77,2.9,9.46,0.21,0.71,50.8,163.3,8.91,272,8,805,NULL),('W8L805B272P2',0.9977,0.061,9,0.56,3.79,8.28,0.06,0.87,51.6,12.1,14.91,272,8,805,NULL),('W8L805B272P20',1.0047,0.052,11,0.69,3.61,6.96,0.37,0.8,12.4,65.6,7.39,272,8,805,NULL),('W8L805B272P21',1,0.074,8.2,0.38,2.91,6.98,0.22,0.83,5.3,65.1,18.51,272,8,805,NULL),('W8L805B272P22',0.997,0.082,12,0.95,2.92,5.36,0.77,0.2,31.6,216.2,8.08,272,8,805,NULL),('W8L805B272P23',0.9909,0.096,12.4,0.31,3.6,5.79,0.72,0.95,69.3,243.2,18.29,272,8,805,NULL),('W8L805B272P24',1.0027,0.014,13.8,0.91,2.82,8.62,0.69,0.31,51.4,53.9,12.12,272,8,805,NULL),('W8L805B272P25',0.9939,0.029,12.1,0.92,3.44,9.2,0.69,0.23,49.2,102.6,7.54,272,8,805,NULL),('W8L805B272P3',0.9942,0.079,10.3,0.96,3.31,7.38,0.67,0.35,38.3,153.6,17.78,272,8,805,NULL),('W8L805B272P4',0.9927,0.077,11.2,0.59,3.36,6.12,0.18,0.19,64.8,213.1,19.24,272,8,805,NULL),('W8L805B272P5',0.9922,0.051,8.2,0.46,3.67,7.15,0.41,0.7,55.3,30.1,8.92,272,8,805,NULL),('W8L805B272P6',0.9973,0.039,11.3,0.83,3.27,7.81,0.23,0.69,50.6,168.1,17.45,272,8,805,NULL),('W8L805B272P7',0.997,0.015,11.6,0.41,3.35,9.26,0.09,0.2,57.3,150.8,6.35,272,8,805,NULL),('W8L805B272P8',0.9994,0.031,8.6,0.4,3.43,6.23,0.59,0.29,67,212.9,4.28,272,8,805,NULL),('W8L805B272P9',0.9949,0.019,10.8,0.47,3.41,9.26,0.67,0.5,8.2,129.4,9.87,272,8,805,NULL),('W8L805B273P1',1.0015,0.036,9.1,0.36,3.35,6.69,0.56,0.16,9.8,153,10.43,273,8,805,NULL),('W8L805B273P10',0.9957,0.058,8.8,0.82,3.7,7.89,0.01,0.97,63.2,13.3,10.59,273,8,805,NULL),('W8L805B273P11',0.992,0.096,11.3,0.36,2.96,6.91,0.02,0.52,43.5,107.8,17.61,273,8,805,NULL),('W8L805B273P12',0.9927,0.051,11,0.62,3.61,8.42,0.8,0.13,16.4,14.5,7.09,273,8,805,NULL),('W8L805B273P13',1.0028,0.092,9.3,0.84,3.37,9.4,0.23,0.67,33.7,171.9,8.03,273,8,805,NULL),('W8L805B273P14',0.9966,0.039,10.8,0.51,3.74,8.59,0.21,0.87,57.6,140.6,18.12,273,8,805,NULL),('W8L805B273P15',0.9935,0.088,13.4,0.69,3.61,7.68,0.06,0.14,7.6,46.8,5.42,273,8,805,NULL),('W8L805B273P16',1.004,0.089,10.4,0.67,3.46,9.53,0.36,0.12,17,152.5,17.22,273,8,805,NULL),('W8L805B273P17',1.0019,0.061,8.7,0.7,3.48,6.5,0.38,0.2,42.8,119,8.72,273,8,805,NULL),('W8L805B273P18',0.9977,0.099,10.8,0.72,3.01,8.42,0.75,0.3,33.1,113.2,15.83,273,8,805,NULL),('W8L805B273P19',1.0025,0.052,13.2,0.96,2.98,6.39,0.38,0.73,13.9,48.1,13.11,273,8,805,NULL),('W8L805B273P2',0.9916,0.095,13.6,0.68,3.46,7.23,0.39,0.11,57.7,129.6,4.49,273,8,805,NULL),('W8L805B273P20',0.9942,0.021,10,0.34,3.68,9.06,0.64,0.63,41.1,109,8.52,273,8,805,NULL),('W8L805B273P21',0.9919,0.027,13.8,0.57,3.16,9.29,0.64,0.63,59,31.3,12.04,273,8,805,NULL),('W8L805B273P22',0.9994,0.01,12.2,0.83,3.65,9.89,0.29,0.49,36.9,223.7,6.76,273,8,805,NULL),('W8L805B273P23',1.0024,0.028,8.7,0.86,3.05,6.32,0.66,0.44,38.5,73,10.52,273,8,805,NULL),('W8L805B273P24',1.001,0.08,10.8,0.45,3.34,9.62,0.2,0.99,28.5,159,12.05,273,8,805,NULL),('W8L805B273P25',0.994,0.054,10.7,0.51,3.54,5.75,0.47,0.32,46.3,237.8,17.85,273,8,805,NULL),('W8L805B273P26',1.0013,0.059,9.2,0.55,3.17,8.2,0.49,0.72,63.8,234.2,19.87,273,8,805,NULL),('W8L805B273P27',0.9921,0.068,9.1,0.72,3.23,7.33,0.45,0.11,55,215.7,15.82,273,8,805,NULL),('W8L805B273P28',1.0045,0.067,14,0.94,2.89,6.72,0.31,0.96,59.6,64.9,2.61,273,8,805,NULL),('W8L805B273P29',1.0033,0.046,11.5,0.73,3.61,5.83,0.24,0.31,19.5,110.2,10.7,273,8,805,NULL),('W8L805B273P3',0.9912,0.077,11.3,0.32,2.82,6.43,0.11,0.89,62.2,125.5,11.61,273,8,805,NULL),('W8L805B273P30',0.9972,0.017,9.9,0.56,2.84,9.8,0.13,0.81,19.3,144.4,10.88,273,8,805,NULL),('W8L805B273P31',0.9987,0.096,9.7,0.66,3.2,9.13,0.11,0.17,51.7,24.7,7.09,273,8,805,NULL),('W8L805B273P32',0.9992,0.058,10,0.36,3.02,8.41,0.18,0.85,19.9,52.9,3.42,273,8,805,NULL),('W8L805B273P4',0.9915,0.041,13.5,0.47,2.99,8.17,0.45,0.17,41,193.4,5.53,273,8,805,NULL),('W8L805B273P5',0.9949,0.051,9.8,0.54,3.22,9.86,0.29,0.46,22.6,216.3,1.11,273,8,805,NULL),('W8L805B273P6',0.9969,0.038,10.2,0.34,3.67,5.85,0.59,0.21,55.4,162.8,3.62,273,8,805,NULL),('W8L805B273P7',0.9939,0.041,9.1,0.42,3.29,9.07,0.07,0.32,57.5,142.6,18.46,273,8,805,NULL),('W8L805B273P8',0.9989,0.092,12.1,0.9,3.12,6.79,0.62,0.27,21.4,141.7,14.58,273,8,805,NULL),('W8L805B273P9',0.9905,0.081,12.2,0.89,3.21,5.82,0.21,0.18,29.3,202.9,14.39,273,8,805,NULL),('W8L805B274P1',0.9936,0.032,13.9,0.78,3.42,8.55,0.51,0.83,9.7,159.9,4.57,274,8,805,NULL),('W8L805B274P10',0.9921,0.08,10.3,0.75,3,8.41,0.07,0.26,7.1,165.1,17.21,274,8,805,NULL),('W8L805B274P11',1.0017,0.075,8.9,0.49,2.99,8.18,0.4,0.95,64.5,156.9,16.29,274,8,805,NULL),('W8L805B274P12',0.997,0.091,9.6,0.5,3.71,5.07,0.68,0.45,45.5,143.9,17.41,274,8,805,NULL),('W8L805B274P13',0.9934,0.085,10.7,0.7,3.49,8.62,0.64,0.3,35.5,179.5,16.46,274,8,805,NULL),('W8L805B274P14',0.9917,0.08,12.9,0.44,2.89,5.78,0.43,0.86,36.1,137.2,4.78,274,8,805,NULL),('W8L805B274P15',1.0049,0.079,9.9,0.37,3.13,7.7,0.26,0.66,7.2,115.3,1.49,274,8,805,NULL),('W8L805B274P16',0.9983,0.059,13.3,0.49,3.73,7.16,0.61,0.26,27.1,126.3,8.99,274,8,805,NULL),('W8L805B274P17',0.9913,0.028,11.1,0.52,2.92,7.53,0.38,0.54,14.4,107.5,10.5,274,8,805,NULL),('W8L805B274P18',1,0.012,13.4,0.47,3.5,9.4,0.07,0.62,44.4,165.3,18.17,274,8,805,NULL),('W8L805B274P19',0.9908,0.023,13.1,0.36,3.34,7.88,0.65,0.14,68.8,12.4,4.56,274,8,805,NULL),('W8L805B274P2',0.9955,0.024,9.4,0.59,3.65,9.09,0.52,0.47,49.9,146,15.4,274,8,805,NULL),('W8L805B274P20',0.9994,0.04,10.7,0.42,3.8,6.84,0.35,0.26,7.6,132.1,17.66,274,8,805,NULL),('W8L805B274P21',0.9948,0.068,9.7,0.48,3.25,9.59,0.39,0.81,11.3,206.1,7.91,274,8,805,NULL),('W8L805B274P22',1.0015,0.045,9.3,0.39,3.78,9.65,0.34,0.79,37.1,160.5,2.06,274,8,805,NULL),('W8L805B274P23',0.9984,0.072,10.2,0.73,3.48,5.81,0.72,0.96,25.5,205.1,3.24,274,8,805,NULL),('W8L805B274P24',0.9982,0.077,10.1,0.61,3.55,5.66,0.4,0.55,36.5,240.9,9.26,274,8,805,NULL),('W8L805B274P3',0.9985,0.096,11.8,0.88,3.47,5.42,0.39,0.89,12.2,171.3,7.61,274,8,805,NULL),('W8L805B274P4',0.9974,0.019,8.7,0.55,3.39,6.88,0.29,0.59,64.2,249.8,8.11,274,8,805,NULL),('W8L805B274P5',1.0043,0.074,10,0.5,3.52,5.89,0.78,0.12,51.5,154.4,7.37,274,8,805,NULL),('W8L805B274P6',0.9997,0.05,10,0.74,3.11,5.92,0.46,0.43,26.3,99.2,19.95,274,8,805,NULL),('W8L805B274P7',1.0043,0.089,13.7,0.44,3.19,5.75,0.06,0.84,10.5,18.4,18.92,274,8,805,NULL),('W8L805B274P8',0.9927,0.05,12.5,0.81,2.97,9.96,0.77,0.69,14.4,231.9,19.8,274,8,805,NULL),('W8L805B274P9',1.0014,0.019,11.1,0.47,3.17,8.52,0.77,0.99,48.1,153.1,3.8,274,8,805,NULL),('W8L805B275P1',1.0004,0.062,9.2,0.97,3.77,5.97,0.28,0.34,59.2,158.1,11.61,275,8,805,NULL),('W8L805B275P10',0.9931,0.031,13.5,0.53,3.6,9.62,0.15,0.33,33.1,173.2,19.36,275,8,805,NULL),('W8L805B275P11',0.9938,0.084,11.2,0.31,3.39,8.69,0.48,0.74,67.4,179,18.63,275,8,805,NULL),('W8L805B275P12',1.0021,0.046,13.2,0.47,3.32,7.93,0.61,0.33,22,180.9,17.71,275,8,805,NULL),('W8L805B275P13',1.0035,0.062,13.2,0.78,2.82,7.81,0.73,0.6,48,120.8,7.62,275,8,805,NULL),('W8L805B275P14',0.9952,0.076,11,0.35,3.7,6.98,0.5,0.75,32.9,249.9,12.66,275,8,805,NULL),('W8L805B275P15',0.9994,0.021,8.2,0.79,3.21,6.5,0.47,0.74,65.6,211,11.34,275,8,805,NULL),('W8L805B275P16',1.005,0.058,11.9,0.81,2.82,9.75,0.66,0.56,46,180.4,14.96,275,8,805,NULL),('W8L805B275P17',0.9964,0.097,13.8,0.93,3.36,9.32,0.36,0.67,7.3,104.3,10.8,275,8,805,NULL),('W8L805B275P18',0.997,0.052,9.5,0.88,3.01,5.25,0.21,0.13,30.1,26.4,8.14,275,8,805,NULL),('W8L805B275P19',1.0048,0.084,8.8,0.47,3.42,6.24,0.55,0.35,43.3,13.9,18.72,275,8,805,NULL),('W8L805B275P2',0.9972,0.078,13.9,0.35,3.1,9.71,0.78,0.27,49.7,43.4,19.4,275,8,805,NULL),('W8L805B275P20',0.995,0.031,10,0.83,2.88,6.07,0.74,0.76,47.2,39.7,9.73,275,8,805,NULL),('W8L805B275P21',0.9953,0.042,11.6,0.59,3.27,8.53,0.32,0.71,41.1,222.5,7.02,275,8,805,NULL),('W8L805B275P22',1.001,0.055,9.9,0.85,3.17,5.08,0.71,0.16,17,172.8,12.27,275,8,805,NULL),('W8L805B275P23',0.9914,0.029,8.5,0.78,2.81,7.28,0.05,0.19,55.3,10.1,8.89,275,8,805,NULL),('W8L805B275P24',0.9985,0.028,8.7,0.87,3.38,9.87,0.7,0.27,48.5,235,4.44,275,8,805,NULL),('W8L805B275P3',0.9924,0.077,13.5,0.82,3.25,6.25,0.33,0.92,49.1,212.1,16.34,275,8,805,NULL),('W8L805B275P4',0.9944,0.067,9.6,0.41,3.72,9.32,0.44,0.24,22.5,12.3,1.79,275,8,805,NULL),('W8L805B275P5',0.9964,0.06,8.5,0.75,3.75,6.63,0.4,0.54,24.3,93.5,8.11,275,8,805,NULL),('W8L805B275P6',0.9974,0.088,13.4,0.35,3.26,8.36,0.26,0.16,5.3,142.9,3.87,275,8,805,NULL),('W8L805B275P7',0.9906,0.036,12.5,0.6,3.4,8.32,0.04,0.41,38.7,175.4,13.32,275,8,805,NULL),('W8L805B275P8',0.9982,0.025,10,0.5,3.28,8.57,0.73,0.88,19.2,198.3,11.99,275,8,805,NULL),('W8L805B275P9',0.9987,0.016,10.7,0.68,3.41,6.32,0.49,0.86,41.7,238.8,2.93,275,8,805,NULL),('W8L806B404P1',1.0027,0.016,9.9,0.63,3.19,6.86,0.32,0.29,21.6,54.3,8.42,404,8,806,NULL),('W8L806B404P10',1.0022,0.043,9.8,0.48,3.59,5.41,0.75,0.16,13,247.9,13.48,404,8,806,NULL),('W8L806B404P11',0.9963,0.069,11.3,0.6,3.1,6.35,0.38,0.25,37.7,83.5,12.58,404,8,806,NULL),('W8L806B404P12',0.9969,0.094,14,0.9,2.85,9.55,0.25,0.82,54.1,75.9,3.53,404,8,806,NULL),('W8L806B404P13',0.9942,0.023,11.5,0.53,2.88,5.3,0.62,0.22,63.3,16.9,5.42,404,8,806,NULL),('W8L806B404P14',0.9917,0.033,13,0.47,3.56,8.64,0.8,0.35,23.6,213.9,18.99,404,8,806,NULL),('W8L806B404P15',0.9915,0.064,10.4,0.57,3.44,6.46,0.75,0.42,15.6,34.5,19.7,404,8,806,NULL),('W8L806B404P16',1.0005,0.083,13.2,0.72,3.35,9.36,0.06,0.55,33.9,213.6,13.33,404,8,806,NULL),('W8L806B404P17',1.0019,0.016,13.7,0.42,2.82,8.89,0.09,0.59,18.5,134.7,12.45,404,8,806,NULL),('W8L806B404P18',0.9923,0.027,10,0.43,3.46,8.17,0.51,0.41,7.4,133.1,15.63,404,8,806,NULL),('W8L806B404P19',0.9989,0.043,8.6,0.81,3.53,9.67,0.68,0.67,51.1,78.6,14.61,404,8,806,NULL),('W8L806B404P2',0.9945,0.065,10,0.9,3.4,6.2,0.52,0.44,35.5,48.9,10.62,404,8,806,NULL),('W8L806B404P20',1.0026,0.079,9.9,0.42,3.71,9.15,0.69,0.57,5.1,96.5,10.13,404,8,806,NULL),('W8L806B404P21',1.0038,0.066,12.2,0.75,3.09,6.68,0.77,0.47,47.3,65.1,3.45,404,8,806,NULL),('W8L806B404P22',0.9919,0.083,11.2,0.86,3.18,5.24,0.59,0.9,17.6,236.2,12.06,404,8,806,NULL),('W8L806B404P23',1.0028,0.086,11.3,0.36,3.79,5.82,0.57,0.24,66.4,230.7,16.34,404,8,806,NULL),('W8L806B404P24',0.9963,0.022,13.2,0.54,3.06,8.97,0.02,0.51,28.3,168.4,14.52,404,8,806,NULL),('W8L806B404P25',0.9909,0.048,12.9,0.46,3.38,5.14,0.27,0.19,19,127.7,18.07,404,8,806,NULL),('W8L806B404P3',0.9967,0.035,13.8,0.56,3.7,6.88,0.02,0.6,51.2,154.5,7.37,404,8,806,NULL),('W8L806B404P4',0.9932,0.036,9.9,0.85,3.14,5.47,0.56,0.81,17.9,184,17.18,404,8,806,NULL),('W8L806B404P5',0.9952,0.091,10.8,0.31,3.24,7.46,0.75,0.45,41.2,239,19.43,404,8,806,NULL),('W8L806B404P6',0.9911,0.026,10.1,0.95,3.43,6.14,0.24,0.61,7.2,39.6,10.33,404,8,806,NULL),('W8L806B404P7',1.0014,0.076,8.1,0.42,3.75,5.74,0.31,0.12,8.5,197.9,16.98,404,8,806,NULL),('W8L806B404P8',0.9961,0.024,9.4,0.83,3.4,5.72,0.34,0.46,64.8,54.6,15.52,404,8,806,NULL),('W8L806B404P9',0.9924,0.084,8.6,0.99,3.47,5.81,0.56,0.56,50.7,208.4,15.82,404,8,806,NULL),('W8L806B405P1',0.9929,0.055,8.3,0.44,3.27,5.26,0.3,0.26,15.3,140,16.42,405,8,806,NULL),('W8L806B405P10',0.9969,0.084,9.7,0.68,3.38,7.11,0.63,0.72,26,214,17.73,405,8,806,NULL),('W8L806B405P11',0.9974,0.022,8.2,0.54,3.59,5.95,0.43,0.65,6.8,74.3,10.36,405,8,806,NULL),('W8L806B405P12',0.997,0.092,8.3,0.45,3.35,5.39,0.07,0.81,24.5,36.9,3.78,405,8,806,NULL),('W8L806B405P13',1.0014,0.093,9.6,0.32,3.34,5.88,0.28,0.94,8.3,186.9,19.97,405,8,806,NULL),('W8L806B405P14',0.997,0.046,11,0.99,3.34,8.65,0.39,0.59,48.5,119.3,18.93,405,8,806,NULL),('W8L806B405P15',0.9925,0.04,10.7,0.82,2.93,7.36,0.57,0.94,40.4,109.7,9.29,405,8,806,NULL),('W8L806B405P16',0.9985,0.096,12.2,0.81,3.78,8.53,0.63,0.17,67.2,178.9,11.12,405,8,806,NULL),('W8L806B405P17',0.9927,0.029,12.8,0.94,2.89,6.51,0.79,0.83,29.6,54.9,14.14,405,8,806,NULL),('W8L806B405P18',0.9939,0.055,12.2,0.91,2.97,6.97,0.03,0.89,45.8,212.9,8.6,405,8,806,NULL),('W8L806B405P19',0.992,0.044,13.9,0.48,3.58,8.17,0.68,0.24,12.4,46.1,6.19,405,8,806,NULL),('W8L806B405P2',0.9927,0.094,9.8,0.45,2.96,9.74,0.31,0.38,58.2,106.6,1.84,405,8,806,NULL),('W8L806B405P20',0.9977,0.023,8.5,0.4,3.36,5.92,0.6,0.28,32.5,78.5,16.21,405,8,806,NULL),('W8L806B405P21',0.9955,0.094,11.4,0.81,2.9,5.89,0.65,0.22,25.6,164,18.01,405,8,806,NULL),('W8L806B405P22',1.0044,0.05,8.8,0.74,3.7,6.6,0.44,0.75,42.1,111.7,13.4,405,8,806,NULL),('W8L806B405P23',0.9983,0.022,12.2,0.86,2.89,7.89,0.34,1,46.6,239.6,11.06,405,8,806,NULL),('W8L806B405P24',0.9996,0.011,12.3,0.47,2.98,8.89,0.32,0.6,21.7,25.1,1.72,405,8,806,NULL),('W8L806B405P25',1.0046,0.064,8.2,0.82,3.29,7.33,0.38,0.98,58.5,153.7,1.15,405,8,806,NULL),('W8L806B405P26',1.0019,0.058,9.5,0.74,3.2,5.43,0.5,0.38,55.3,189,19.51,405,8,806,NULL),('W8L806B405P3',1.0003,0.013,12.1,0.37,3.02,9.73,0.53,0.6,51.6,31.3,9.62,405,8,806,NULL),('W8L806B405P4',0.9921,0.081,13.4,0.6,3.67,6.75,0.75,0.47,40.8,83.2,4.72,405,8,806,NULL),('W8L806B405P5',0.999,0.039,9.1,0.59,2.99,6.31,0.5,0.77,59.6,125.8,19.32,405,8,806,NULL),('W8L806B405P6',0.9946,0.075,8.6,0.77,3.79,6.86,0.46,0.53,65.9,120.4,8.76,405,8,806,NULL),('W8L806B405P7',0.9913,0.092,10.7,0.31,3.58,7.04,0.68,0.45,46.9,206,17.77,405,8,806,NULL),('W8L806B405P8',0.9964,0.02,9.2,0.42,3.77,5.03,0.8,0.94,41,11.8,2.59,405,8,806,NULL),('W8L806B405P9',1.0023,0.038,10.9,0.85,3.03,7.89,0.21,0.74,64.1,70.2,6.41,405,8,806,NULL),('W8L806B406P1',0.9912,0.054,8.7,0.88,3.79,8.94,0.74,0.12,40.1,127.8,2.71,406,8,806,NULL),('W8L806B406P10',0.9916,0.022,8.2,0.91,3.14,5.01,0.21,0.87,32.6,35.9,15.16,406,8,806,NULL),('W8L806B406P11',1.0008,0.091,13.6,0.85,3.14,9.33,0.16,0.38,8,107.9,17.51,406,8,806,NULL),('W8L806B406P12',0.9973,0.037,13.6,0.98,2.91,6.83,0.02,0.52,40.9,175.6,13.57,406,8,806,NULL),('W8L806B406P13',0.9922,0.026,8.8,0.97,3.57,5.2,0.19,0.72,64.2,231.2,12.78,406,8,806,NULL),('W8L806B406P14',1.005,0.098,11.6,0.76,2.89,6.24,0.77,0.44,27.6,51,19.54,406,8,806,NULL),('W8L806B406P15',1.0004,0.057,8.6,0.75,3.79,8.25,0.33,0.33,62.3,63.5,11.6,406,8,806,NULL),('W8L806B406P16',0.9956,0.061,8.8,0.44,3.18,6.93,0.68,0.2,64.5,233.2,2.21,406,8,806,NULL),('W8L806B406P17',0.9944,0.077,12.6,0.77,2.9,9.15,0.28,0.64,10.5,43.9,11.3,406,8,806,NULL),('W8L806B406P18',0.9944,0.066,12.4,0.46,3.28,8.59,0.66,0.71,21.8,80.2,1.09,406,8,806,NULL),('W8L806B406P19',0.9941,0.026,12.1,0.57,3.09,9.34,0.31,0.63,38.1,145.2,2.43,406,8,806,NULL),('W8L806B406P2',0.9968,0.027,10.7,0.94,3.73,6.99,0.65,0.61,14.5,222.5,3.87,406,8,806,NULL),('W8L806B406P20',1.0027,0.082,11.3,0.87,2.84,8.52,0.47,0.56,65.7,235.4,11.71,406,8,806,NULL),('W8L806B406P21',0.9929,0.078,13.1,0.57,3.56,7.74,0.6,0.46,61.3,228,9.55,406,8,806,NULL),('W8L806B406P22',0.9913,0.052,9.4,0.92,3.26,8.97,0.54,0.89,13.4,180.8,9.95,406,8,806,NULL),('W8L806B406P23',0.9949,0.088,14,0.69,3.8,8.06,0.24,0.67,24.7,39.4,3.56,406,8,806,NULL),('W8L806B406P24',0.994,0.033,9.7,0.61,3.48,9.12,0.61,0.3,30.8,144.6,19.9,406,8,806,NULL),('W8L806B406P3',0.9986,0.07,9.6,0.78,3.74,8.75,0.4,0.18,37.2,79.4,6.39,406,8,806,NULL),('W8L806B406P4',1.0039,0.099,10.5,0.64,3.43,8.82,0.72,0.28,24.4,43.6,16.16,406,8,806,NULL),('W8L806B406P5',0.9957,0.025,11.1,0.87,3.54,5.69,0.77,0.74,5.6,129.4,7.9,406,8,806,NULL),('W8L806B406P6',0.9936,0.082,10.7,0.92,3.47,8.36,0.31,0.12,48.4,98.8,15.79,406,8,806,NULL),('W8L806B406P7',1.0008,0.054,12.8,0.65,3.69,5.28,0.26,0.54,25,212.6,15.96,406,8,806,NULL),('W8L806B406P8',0.998,0.05,9.3,0.98,2.99,5.17,0.49,0.73,69.4,80.7,16.16,406,8,806,NULL),('W8L806B406P9',0.9916,0.052,10.5,0.45,3.47,5.49,0.63,0.44,64.2,156,6.94,406,8,806,NULL),('W8L806B407P1',0.9964,0.081,13.9,0.85,3.06,6.25,0.69,0.19,14.6,188.9,10.69,407,8,806,NULL),('W8L806B407P10',0.9939,0.059,13.7,0.42,3.29,5.39,0.65,0.37,46.2,225.4,5.99,407,8,806,NULL),('W8L806B407P11',1.0013,0.085,10,0.47,3,9.98,0.13,0.38,52.8,178.1,16.2,407,8,806,NULL),('W8L806B407P12',0.9977,0.08,14,0.87,2.83,7.38,0.42,0.63,28.1,217.6,17.17,407,8,806,NULL),('W8L806B407P13',0.998,0.065,10.9,0.89,3.26,8.51,0.49,0.64,61,211.4,15.4,407,8,806,NULL),('W8L806B407P14',0.9985,0.019,9.3,0.63,2.86,5.77,0.47,0.59,11.4,74.3,16.42,407,8,806,NULL),('W8L806B407P15',0.9907,0.075,12,0.87,3.3,6.94,0.52,0.38,53.9,34.1,8.39,407,8,806,NULL),('W8L806B407P16',0.9986,0.023,13.2,0.6,2.8,5.54,0.61,0.77,9.5,136.5,7.99,407,8,806,NULL),('W8L806B407P17',0.9944,0.024,12.2,0.91,3.21,6.59,0.8,0.22,46.2,183.2,10.76,407,8,806,NULL),('W8L806B407P18',0.998,0.016,10,0.52,2.99,8.64,0.64,0.28,18.9,87.8,17.74,407,8,806,NULL),('W8L806B407P19',1.0009,0.085,10.4,0.88,3.32,9.41,0.4,0.39,42,243.2,10.54,407,8,806,NULL),('W8L806B407P2',1.0013,0.054,9.8,0.93,2.84,6.87,0.44,0.93,22.1,123.3,8.2,407,8,806,NULL),('W8L806B407P20',1.0025,0.028,12.1,0.91,3.71,8.56,0.06,0.48,28.6,103.2,15.83,407,8,806,NULL),('W8L806B407P21',0.9958,0.034,10.9,0.47,3.45,6.02,0.63,0.15,62.2,115,16.55,407,8,806,NULL),('W8L806B407P22',0.993,0.037,8.9,0.57,3.5,5.65,0.09,0.66,67.2,150,13.57,407,8,806,NULL),('W8L806B407P23',0.9906,0.087,13,0.65,3.74,9.45,0.03,0.87,49.1,196.4,2.79,407,8,806,NULL),('W8L806B407P24',0.9909,0.02,9.5,0.99,2.85,9.8,0.67,0.67,63.4,114.6,12.64,407,8,806,NULL),('W8L806B407P25',1.0017,0.072,13.9,0.65,3.6,9.55,0.13,0.45,29.7,183.3,12.69,407,8,806,NULL),('W8L806B407P3',0.9988,0.046,12.6,0.38,2.99,5.56,0.72,0.86,13.7,20.1,9.79,407,8,806,NULL),('W8L806B407P4',1.0019,0.019,11.6,0.58,3.17,6.61,0.61,0.56,60.7,206.8,17.85,407,8,806,NULL),('W8L806B407P5',0.994,0.067,10.3,0.41,3.01,7.9,0.25,0.14,61.2,16.4,10.45,407,8,806,NULL),('W8L806B407P6',1.0022,0.055,14,0.72,3.35,8.58,0.48,0.2,7.2,52.5,9.87,407,8,806,NULL),('W8L806B407P7',0.9991,0.059,9.5,0.61,3.72,8.92,0.45,0.2,26.9,212.5,19.69,407,8,806,NULL),('W8L806B407P8',1.0001,0.02,10.9,0.53,3.73,8.22,0.1,0.65,50.6,176.4,9.42,407,8,806,NULL),('W8L806B407P9',1.0006,0.04,11.4,0.75,3.61,8.3,0.55,0.28,46.5,128,8.91,407,8,806,NULL),('W8L806B408P1',1.0028,0.058,10.6,0.46,2.88,5.44,0.22,0.31,54.2,71.7,6.81,408,8,806,NULL),('W8L806B408P10',0.9966,0.031,9.8,0.49,3.8,5.32,0.44,0.34,43.8,40.6,3.06,408,8,806,NULL),('W8L806B408P11',0.9998,0.08,9.9,0.74,3.48,7.56,0.62,0.9,68.2,163.3,16.14,408,8,806,NULL),('W8L806B408P12',0.9992,0.05,13.8,0.66,3.27,8.79,0.51,0.19,29.5,220.2,5.16,408,8,806,NULL),('W8L806B408P13',1.0038,0.051,10.1,0.41,3.1,5.87,0.08,0.51,21.5,169.8,15.18,408,8,806,NULL),('W8L806B408P14',0.9903,0.096,9.4,0.54,3.31,9.52,0.29,0.43,54.8,217.6,10.23,408,8,806,NULL),('W8L806B408P15',0.994,0.025,11.1,0.89,3.64,6.79,0.09,0.4,54.3,135.4,6.71,408,8,806,NULL),('W8L806B408P16',1,0.1,11.4,0.75,3.74,6.68,0.47,0.72,31.7,90.4,6.36,408,8,806,NULL),('W8L806B408P17',1.0031,0.098,10.2,0.75,3.65,5.09,0.14,0.65,53.6,20.8,3.62,408,8,806,NULL),('W8L806B408P18',1.0016,0.084,8.7,0.46,2.95,5.65,0.1,0.11,57.1,139.4,18.87,408,8,806,NULL),('W8L806B408P19',0.9946,0.035,10.1,0.78,3.27,8.03,0.32,0.17,31.1,14.9,8.73,408,8,806,NULL),('W8L806B408P2',1.0026,0.092,9.5,0.52,2.89,5.85,0,0.42,21.7,219.7,1.18,408,8,806,NULL),('W8L806B408P20',1.0031,0.045,8.9,0.61,2.92,9.18,0.38,0.99,34.6,75.4,16.43,408,8,806,NULL),('W8L806B408P21',0.9956,0.08,10.2,0.56,3.62,8.59,0.44,0.38,53.2,221.6,6.19,408,8,806,NULL),('W8L806B408P22',0.9979,0.053,10.1,0.39,3.12,6.97,0.57,0.24,8.8,206.8,1.32,408,8,806,NULL),('W8L806B408P23',0.9938,0.061,11.8,0.87,3.22,8.24,0.19,0.23,6,125.9,4.3,408,8,806,NULL),('W8L806B408P24',1.0012,0.075,8.2,0.65,3.72,6.4,0.52,0.53,37.2,47.9,14.88,408,8,806,NULL),('W8L806B408P25',0.9961,0.061,8,0.44,3.74,6.04,0.62,0.37,10.3,166.7,6.38,408,8,806,NULL),('W8L806B408P26',1.0037,0.057,11.6,0.61,3.53,7.66,0.54,0.8,53,53,18.13,408,8,806,NULL),('W8L806B408P27',1.0013,0.075,12.1,0.34,3.22,9.15,0.07,0.83,12.2,196.3,7.54,408,8,806,NULL),('W8L806B408P3',1.0008,0.059,12,0.76,3.23,7.16,0.5,0.46,56.1,144.9,15.99,408,8,806,NULL),('W8L806B408P4',0.9925,0.055,8.2,0.44,3.67,9.34,0.35,0.23,68,66.5,2.9,408,8,806,NULL),('W8L806B408P5',1.0041,0.078,12.9,0.99,3.34,9.26,0.3,0.84,63.4,84.8,6.66,408,8,806,NULL),('W8L806B408P6',0.9958,0.045,10.4,0.98,3.42,9.86,0.46,0.52,58.3,172,13.74,408,8,806,NULL),('W8L806B408P7',0.9923,0.034,9.6,0.99,3.68,5.19,0.38,0.25,54.8,124,15.4,408,8,806,NULL),('W8L806B408P8',1.0038,0.031,13.4,0.83,2.85,9.34,0.4,0.84,67.2,171.7,16.11,408,8,806,NULL),('W8L806B408P9',0.9999,0.026,12.7,0.37,3.67,6.18,0.13,0.24,17.9,83.4,5.17,408,8,806,NULL),('W8L806B409P1',1.0048,0.028,11.8,0.41,3.72,7.45,0.47,0.41,41.3,248.5,15.42,409,8,806,NULL),('W8L806B409P10',1.0046,0.091,12.9,0.6,2.84,8.42,0.05,0.4,33.2,239.4,0.73,409,8,806,NULL),('W8L806B409P11',1.0027,0.038,8.8,0.67,3.34,9.96,0.17,0.95,8.4,143.5,12.53,409,8,806,NULL),('W8L806B409P12',0.9943,0.083,8.5,0.85,3.27,6.61,0.38,0.18,6.9,23.9,4.34,409,8,806,NULL),('W8L806B409P13',0.9916,0.058,12.6,0.8,3.58,8.56,0.76,0.45,65.5,151.2,2.93,409,8,806,NULL),('W8L806B409P14',0.9934,0.078,8.5,0.7,3.22,9.28,0.33,0.75,63.4,142.1,0.94,409,8,806,NULL),('W8L806B409P15',0.9941,0.095,12.2,0.33,3.07,9.58,0.28,0.57,34.2,152.2,4.51,409,8,806,NULL),('W8L806B409P16',1.0016,0.048,8.5,0.64,3.65,5.98,0.43,0.21,50.4,142.7,18.62,409,8,806,NULL),('W8L806B409P17',0.99,0.034,8.5,0.82,3.12,5.54,0.23,0.23,33,122.7,0.91,409,8,806,NULL),('W8L806B409P18',0.9999,0.011,10.2,0.6,3.68,6.04,0.26,0.73,18.1,158.9,14.69,409,8,806,NULL),('W8L806B409P19',0.9901,0.051,13.4,0.6,2.82,6.87,0.06,0.41,25.6,86.1,10.15,409,8,806,NULL),('W8L806B409P2',1.0046,0.057,12.7,0.76,3.59,6.69,0.1,0.46,34.6,180.5,1.44,409,8,806,NULL),('W8L806B409P20',1.0018,0.039,9.4,0.41,2.83,6.58,0.33,0.5,54.2,74.5,15.13,409,8,806,NULL),('W8L806B409P21',0.9952,0.098,9.2,0.93,3.33,9.78,0.56,0.7,22.9,101.7,19.23,409,8,806,NULL),('W8L806B409P22',0.9928,0.064,8.8,0.44,3.05,8.56,0.01,0.78,28,168,7.26,409,8,806,NULL),('W8L806B409P23',0.9913,0.038,11.1,0.4,3.67,8.68,0.59,0.26,19.3,38.3,3.87,409,8,806,NULL),('W8L806B409P24',0.9908,0.014,8.5,0.97,3.26,5.17,0.27,0.12,44.3,169.1,10.54,409,8,806,NULL),('W8L806B409P25',0.9968,0.021,13.7,0.49,3.74,8.13,0.08,0.42,39.9,174.1,3.25,409,8,806,NULL),('W8L806B409P26',1.003,0.048,11.2,0.77,2.82,8.77,0.23,0.91,17.4,142.6,9.87,409,8,806,NULL),('W8L806B409P27',1.003,0.099,9.7,0.62,3.65,7.75,0.68,0.43,69.8,25,10.6,409,8,806,NULL),('W8L806B409P28',0.996,0.025,8.7,0.92,3.29,6.52,0.3,0.19,46.4,208.1,9.44,409,8,806,NULL),('W8L806B409P29',0.9924,0.094,13,0.45,3.44,6.79,0.36,0.66,49.3,236.8,3.43,409,8,806,NULL),('W8L806B409P3',0.9968,0.067,12.3,0.93,3.3,9.48,0.77,0.25,42.4,90.9,17.67,409,8,806,NULL),('W8L806B409P30',0.9903,0.049,10.1,0.64,2.92,9.09,0.62,0.17,63.7,235.6,15.99,409,8,806,NULL),('W8L806B409P31',1.0014,0.043,8.5,0.44,2.98,6.08,0.28,0.56,24.7,152.4,2.87,409,8,806,NULL),('W8L806B409P32',0.9928,0.079,9.6,0.54,3.74,9.56,0.69,0.94,67.1,158.1,16.32,409,8,806,NULL),('W8L806B409P33',1.0043,0.068,12.5,0.87,3.1,8.73,0.48,0.15,61.8,182.1,8.87,409,8,806,NULL),('W8L806B409P34',0.9944,0.014,8.8,0.42,3.2,9.65,0.65,0.74,36.8,60,1.88,409,8,806,NULL),('W8L806B409P35',1.0033,0.053,11.5,0.35,3.35,9.04,0.09,0.72,45.3,227.6,4.11,409,8,806,NULL),('W8L806B409P4',1.0044,0.041,8.3,0.66,3.21,7.04,0.76,0.59,34.5,228.5,6.93,409,8,806,NULL),('W8L806B409P5',1.0001,0.023,13.4,0.65,3.79,7.5,0.73,0.8,57.4,32.7,2.64,409,8,806,NULL),('W8L806B409P6',1.0007,0.042,12.4,0.54,3.65,8.57,0.78,0.26,23.7,201,0.66,409,8,806,NULL),('W8L806B409P7',0.9977,0.099,9.5,0.46,3.71,8.6,0.44,0.76,35.1,114.8,19.8,409,8,806,NULL),('W8L806B409P8',1.002,0.055,12.4,0.53,3.36,6.78,0.46,0.82,47.6,156.6,5.89,409,8,806,NULL),('W8L806B409P9',1.0026,0.011,8.6,0.82,3.39,6.36,0.15,0.56,68.8,43.4,5.79,409,8,806,NULL),('W8L806B410P1',1.0046,0.067,11.3,0.61,3.61,6.21,0.45,0.35,50.3,30.1,12.17,410,8,806,NULL),('W8L806B410P10',1.0001,0.018,10.2,0.73,2.93,5.52,0.15,0.75,50.6,180.7,17.07,410,8,806,NULL),('W8L806B410P11',0.9953,0.052,9.1,0.35,3.56,6.52,0.2,0.77,38.7,113.9,12.19,410,8,806,NULL),('W8L806B410P12',0.9924,0.061,12.3,0.35,3.05,9.6,0.64,0.63,58.9,98.2,18.48,410,8,806,NULL),('W8L806B410P13',1.0036,0.013,8.2,0.83,2.81,6.17,0.61,0.17,34.4,87.9,1.34,410,8,806,NULL),('W8L806B410P14',0.9995,0.074,12.7,0.69,3.15,9.2,0.71,0.61,5.9,154.8,15.25,410,8,806,NULL),('W8L806B410P15',0.9987,0.087,10.4,0.78,3.05,6.33,0.04,0.31,26.7,170.1,7.25,410,8,806,NULL),('W8L806B410P16',0.9981,0.09,10.3,0.83,3.4,7.26,0.42,0.46,42.9,42.9,8.68,410,8,806,NULL),('W8L806B410P17',1.0007,0.078,13.7,0.89,3.74,5.58,0.32,0.18,20.4,80.8,16.59,410,8,806,NULL),('W8L806B410P18',1.0013,0.018,9.1,0.67,3.8,8.12,0.69,0.68,33.8,137.5,4.06,410,8,806,NULL),('W8L806B410P19',0.9913,0.079,12.1,0.42,3.58,6.09,0.33,0.88,11.9,137.8,14.08,410,8,806,NULL),('W8L806B410P2',1.0018,0.032,10.8,0.32,3.67,8.83,0.44,0.45,48.8,154.1,8.34,410,8,806,NULL),('W8L806B410P20',1.0014,0.099,10.8,0.8,3.02,8.23,0.62,0.45,41.3,116.3,15.09,410,8,806,NULL),('W8L806B410P21',0.9989,0.03,10.3,0.79,3.62,5.48,0.33,0.85,52.2,58.3,10.08,410,8,806,NULL),('W8L806B410P22',0.9978,0.044,10.1,0.85,2.95,8.11,0.79,0.38,60.7,83.1,14.91,410,8,806,NULL),('W8L806B410P23',0.992,0.081,10.5,0.94,3.35,9.87,0.73,0.25,14.1,247.1,9.51,410,8,806,NULL),('W8L806B410P24',0.9972,0.097,10.9,0.78,3.12,8.72,0.27,0.74,69.4,84.3,7.36,410,8,806,NULL),('W8L806B410P25',0.9978,0.02,9,0.42,3.39,5.83,0.45,0.92,25.6,222.1,5.06,410,8,806,NULL),('W8L806B410P26',0.9975,0.071,10.1,0.78,3.4,7.69,0.05,0.37,61.8,187.4,17.58,410,8,806,NULL),('W8L806B410P27',1.0029,0.068,10.6,0.56,3.75,6.48,0.48,0.73,12.4,100.6,13.38,410,8,806,NULL),('W8L806B410P3',0.9938,0.082,10.4,0.36,3.22,6.8,0.03,0.95,15.4,26.2,17.36,410,8,806,NULL),('W8L806B410P4',0.9928,0.059,10.7,0.31,3.06,8.56,0.04,0.11,29.8,42.6,2.74,410,8,806,NULL),('W8L806B410P5',0.9961,0.051,8.3,0.46,3.21,7.29,0.34,0.72,52.2,216.6,3.27,410,8,806,NULL),('W8L806B410P6',1.0028,0.083,11.8,0.72,3.5,5.37,0.26,0.77,25.4,53.5,18.43,410,8,806,NULL),('W8L806B410P7',1.0014,0.061,8.1,0.7,3.76,5.74,0.31,0.59,35.9,143.2,17.23,410,8,806,NULL),('W8L806B410P8',1.0004,0.076,10,0.8,3.57,6.67,0.17,0.59,67.1,170.8,19.01,410,8,806,NULL),('W8L806B410P9',0.9909,0.087,8.4,0.95,3.63,6.62,0.4,0.31,68.2,200,1.37,410,8,806,NULL),('W8L806B411P1',1.0009,0.021,12.7,0.79,3.42,5.57,0.67,0.46,22.4,218.1,2.35,411,8,806,NULL),('W8L806B411P10',1.0012,0.054,12.8,0.7,3.68,9.7,0.3,0.26,36.3,133.2,19.96,411,8,806,NULL),('W8L806B411P11',0.9974,0.035,12.5,0.39,3.22,6.41,0.45,0.66,18.5,195.8,3.55,411,8,806,NULL),('W8L806B411P12',1.0044,0.055,13.7,0.93,2.91,5.57,0.44,0.5,32.9,178.1,6.09,411,8,806,NULL),('W8L806B411P13',0.9958,0.066,12.3,0.9,3.09,5.25,0.47,0.31,68.1,210.3,7.44,411,8,806,NULL),('W8L806B411P14',0.9995,0.079,13.2,0.48,3.75,5.92,0.03,0.21,67.1,111.6,14.38,411,8,806,NULL),('W8L806B411P15',0.993,0.021,10.6,0.81,2.87,7.24,0.17,0.72,25.8,48,11.95,411,8,806,NULL),('W8L806B411P16',1.0021,0.047,13.1,0.64,2.83,9.35,0.28,0.26,30.6,100.2,9.34,411,8,806,NULL),('W8L806B411P17',1.0034,0.09,13.7,0.86,3.7,8.7,0.7,0.71,14.8,211.2,2.09,411,8,806,NULL),('W8L806B411P18',0.9994,0.091,9.2,0.46,3.32,6.43,0.38,0.94,29.8,64.8,12.12,411,8,806,NULL),('W8L806B411P19',1.0048,0.065,11.1,0.9,3.73,7.14,0.77,0.17,56.6,135.4,15.11,411,8,806,NULL),('W8L806B411P2',1.0014,0.081,12.3,0.9,3.37,8.65,0.28,0.34,43.8,14.3,14.93,411,8,806,NULL),('W8L806B411P20',1.0028,0.016,11.8,0.41,3.12,8.85,0.09,0.56,29.1,178.5,11.41,411,8,806,NULL),('W8L806B411P21',0.9934,0.076,11.2,0.61,3.66,9.46,0.61,0.35,69.9,11.5,8.27,411,8,806,NULL),('W8L806B411P22',0.9985,0.093,9.2,0.87,3.19,7.26,0.8,0.11,35.4,182.8,8.4,411,8,806,NULL),('W8L806B411P23',0.9999,0.016,11.8,0.7,3.58,6.01,0.51,0.82,47.4,19.5,7.03,411,8,806,NULL),('W8L806B411P3',0.9985,0.062,13.6,0.46,2.88,9.12,0.57,0.4,8.8,236.5,2.83,411,8,806,NULL),('W8L806B411P4',0.9954,0.013,9,0.77,2.83,8.46,0.46,0.17,32.4,55.2,0.91,411,8,806,NULL),('W8L806B411P5',0.9946,0.077,13.2,0.72,3.62,6.52,0.51,0.47,35,213.1,9.68,411,8,806,NULL),('W8L806B411P6',1.0036,0.096,9.5,0.99,3.37,8.34,0.74,0.55,59.3,189.8,19.66,411,8,806,NULL),('W8L806B411P7',0.9945,0.052,9.7,0.9,3.73,9.24,0.67,0.67,18.2,156.7,6.25,411,8,806,NULL),('W8L806B411P8',0.9989,0.024,14,0.42,3.09,7.83,0.71,0.66,29.3,183.5,7.5,411,8,806,NULL),('W8L806B411P9',1.0029,0.091,11.9,0.94,3.12,9.82,0.21,0.49,7.5,206.2,10.54,411,8,806,NULL),('W8L806B412P1',0.9991,0.055,10.3,0.8,2.94,6.21,0.54,0.33,36.5,216.7,18.13,412,8,806,NULL),('W8L806B412P10',1.0039,0.075,8.9,0.91,3.38,6.98,0.73,0.48,32.8,246.3,15.12,412,8,806,NULL),('W8L806B412P11',0.9977,0.07,8.5,0.57,3.26,7.82,0.46,0.67,56.6,239.6,19.86,412,8,806,NULL),('W8L806B412P12',1.0012,0.024,9.7,0.35,3.5,8.86,0.44,0.28,23.5,244.2,17.26,412,8,806,NULL),('W8L806B412P13',0.9948,0.093,9.8,0.77,3.14,8.77,0.7,0.48,53.6,141.3,18.51,412,8,806,NULL),('W8L806B412P14',1.0044,0.018,8.4,0.82,3.21,9.08,0.69,0.92,24.9,214.3,15.97,412,8,806,NULL),('W8L806B412P15',1.0009,0.075,11.6,0.75,2.91,7,0.72,0.93,13,26,5.83,412,8,806,NULL),('W8L806B412P16',1.0046,0.03,12.2,0.3,2.81,8.16,0.08,0.1,41.6,189,12.41,412,8,806,NULL),('W8L806B412P17',0.9966,0.041,12.7,0.52,2.81,7.96,0.4,0.49,46.8,80.7,6.72,412,8,806,NULL),('W8L806B412P18',0.9942,0.036,10.1,0.58,3.42,7.65,0.16,0.46,45.5,73.5,15.88,412,8,806,NULL),('W8L806B412P19',0.9987,0.064,11.2,0.93,3.66,6.74,0.62,0.92,62.2,92.9,16.03,412,8,806,NULL),('W8L806B412P2',1.0036,0.089,11.8,0.76,3.02,5.11,0.72,0.77,11.4,44.3,12.91,412,8,806,NULL),('W8L806B412P20',1.0048,0.051,13.9,0.9,3.41,9.24,0.78,0.45,40.9,48.4,1.18,412,8,806,NULL),('W8L806B412P21',1.0033,0.029,13,0.88,2.9,7.54,0.77,0.9,62.8,86.1,12.36,412,8,806,NULL),('W8L806B412P22',0.9907,0.049,11.6,0.52,3.39,6.95,0.25,0.81,61.4,222.1,15.91,412,8,806,NULL),('W8L806B412P23',1.0025,0.081,12.5,0.53,3.68,6.63,0.79,0.7,26.9,138.6,10.61,412,8,806,NULL),('W8L806B412P24',1.002,0.048,13.9,0.47,2.87,7.61,0.79,0.75,51.9,218.2,2.34,412,8,806,NULL),('W8L806B412P25',0.9957,0.073,10.1,0.66,3.66,6.04,0.61,0.89,29.1,247.9,13.67,412,8,806,NULL),('W8L806B412P3',0.9996,0.013,10.4,0.71,3.15,7.88,0.09,0.15,57.4,242.5,7.32,412,8,806,NULL),('W8L806B412P4',1.0041,0.04,8.5,0.7,3.77,9.8,0.77,0.99,38.1,135.3,4.55,412,8,806,NULL),('W8L806B412P5',0.998,0.049,13.4,0.68,2.85,8.08,0.02,0.75,29.1,170.3,9.74,412,8,806,NULL),('W8L806B412P6',0.9923,0.067,12,0.7,3.37,9.15,0.67,0.23,13.2,157,8.22,412,8,806,NULL),('W8L806B412P7',0.9976,0.082,11.7,0.48,3.7,6.27,0.35,0.26,26.6,196.3,16.25,412,8,806,NULL),('W8L806B412P8',1.0004,0.039,12.6,0.98,3.61,9.74,0.13,0.45,68.1,161.1,1.07,412,8,806,NULL),('W8L806B412P9',0.9932,0.087,10,0.56,3.06,5.97,0.31,0.86,47.7,76.6,19.96,412,8,806,NULL),('W8L806B413P1',1.001,0.054,8.9,0.43,3.13,5.94,0.21,0.74,64.8,105,17.12,413,8,806,NULL),('W8L806B413P10',0.9913,0.034,10.1,0.88,2.9,7.72,0.64,0.1,36.3,135.6,18.85,413,8,806,NULL),('W8L806B413P11',0.9969,0.055,10,0.38,3.11,5.99,0.22,0.12,60.1,188.3,1.61,413,8,806,NULL),('W8L806B413P12',1.0016,0.052,8.8,0.97,3.15,6.38,0.28,0.8,57.5,156.3,13.5,413,8,806,NULL),('W8L806B413P13',0.9927,0.059,9.9,0.9,3.26,5.79,0.12,0.91,30,164.6,2.36,413,8,806,NULL),('W8L806B413P14',0.9932,0.05,13.9,0.54,3.28,5.02,0.44,0.81,28.1,226.5,1.16,413,8,806,NULL),('W8L806B413P15',1.0007,0.086,8.8,0.31,3.34,8.51,0.46,0.33,12.4,204.3,14.46,413,8,806,NULL),('W8L806B413P16',1.0036,0.022,13.4,0.67,3,9.47,0.6,0.8,10.6,74.6,8.62,413,8,806,NULL),('W8L806B413P17',0.9939,0.091,9.1,0.58,2.86,8.78,0.77,0.41,34,69.4,5.97,413,8,806,NULL),('W8L806B413P18',0.9981,0.015,10,0.68,3.39,5.22,0.27,0.67,58.7,140.4,15.54,413,8,806,NULL),('W8L806B413P19',1.0008,0.079,9.3,0.86,3.21,8.83,0.15,0.46,57.4,94.3,6.75,413,8,806,NULL),('W8L806B413P2',0.9953,0.034,13,0.55,3.02,6.35,0.45,0.58,60.3,161.1,1.53,413,8,806,NULL),('W8L806B413P20',0.9941,0.094,13.3,0.67,3.69,5,0.27,0.93,23.8,28,4.2,413,8,806,NULL),('W8L806B413P21',1.0048,0.099,10.9,0.65,3.55,7.06,0.7,0.33,30.4,137.2,14.83,413,8,806,NULL),('W8L806B413P22',0.9912,0.013,9.6,0.7,3.67,9.34,0.42,0.74,44.4,56.8,3.58,413,8,806,NULL),('W8L806B413P23',0.9981,0.022,13.2,0.88,2.86,5.8,0.21,0.16,47.1,121.7,4.93,413,8,806,NULL),('W8L806B413P24',0.9919,0.054,9.2,0.78,3.04,5.45,0.55,0.37,46.9,48.4,1.33,413,8,806,NULL),('W8L806B413P3',1.0012,0.088,12.7,0.35,2.83,6.49,0.76,0.73,66.6,32,6.93,413,8,806,NULL),('W8L806B413P4',0.9979,0.067,13.2,0.62,2.83,8.03,0.23,0.32,31,46,11,413,8,806,NULL),('W8L806B413P5',0.9937,0.053,12.4,0.74,3.46,9.61,0.04,0.17,16.7,203.6,16.89,413,8,806,NULL),('W8L806B413P6',0.9906,0.055,12.4,0.9,3.57,6.58,0.07,0.88,47.9,101,10.11,413,8,806,NULL),('W8L806B413P7',1.0013,0.089,8.4,0.63,3.74,9.88,0.23,0.15,13.2,143.8,8.36,413,8,806,NULL),('W8L806B413P8',0.9916,0.012,10.8,0.55,3.53,5.68,0.69,0.77,60.2,156,18.83,413,8,806,NULL),('W8L806B413P9',0.9961,0.074,8.6,0.51,3.45,9.47,0.36,0.25,19.7,232.6,10.3,413,8,806,NULL),('W8L806B414P1',1.0014,0.047,8.2,0.57,3.51,5.85,0.78,0.49,58.2,176.5,3.27,414,8,806,NULL),('W8L806B414P10',0.9916,0.088,12,0.62,3.21,8.33,0.26,0.2,16.5,111.5,5.66,414,8,806,NULL),('W8L806B414P11',0.9985,0.014,13.7,0.74,2.98,8.09,0.08,0.3,26.8,136.2,7.92,414,8,806,NULL),('W8L806B414P12',0.9969,0.036,10.1,0.42,2.88,9.48,0.73,0.87,21,71.2,4.23,414,8,806,NULL),('W8L806B414P13',0.9922,0.017,9.8,0.71,2.94,7.99,0.39,0.42,45.3,116.7,3.35,414,8,806,NULL),('W8L806B414P14',1.0002,0.069,10.4,0.89,3.68,7.9,0.66,0.21,16.7,206.8,5.05,414,8,806,NULL),('W8L806B414P15',0.9939,0.057,9.3,0.43,3.67,7.42,0.48,0.45,41.4,203.9,4.97,414,8,806,NULL),('W8L806B414P16',0.994,0.022,8.5,0.57,3.23,8.5,0.61,0.17,37.8,203.6,3.27,414,8,806,NULL),('W8L806B414P17',1.0012,0.099,13,0.45,3.23,7.78,0.28,0.96,61.3,224.9,6.57,414,8,806,NULL),('W8L806B414P18',0.9945,0.016,12.6,0.52,3.2,9.29,0.27,0.24,41.3,238.2,9.4,414,8,806,NULL),('W8L806B414P19',1.0029,0.022,8.9,0.75,2.93,8,0.05,0.11,17.7,221.6,8.55,414,8,806,NULL),('W8L806B414P2',0.992,0.071,12.5,0.44,2.92,7.53,0.05,0.96,14.6,87.5,12.51,414,8,806,NULL),('W8L806B414P20',0.994,0.03,12.9,0.9,3.49,5.46,0.62,0.16,65.1,242.6,7.74,414,8,806,NULL),('W8L806B414P21',0.9976,0.031,11.1,0.64,2.83,5.66,0.27,0.37,22.6,100.6,10.06,414,8,806,NULL),('W8L806B414P3',0.9986,0.03,8.2,0.4,3.51,9.19,0.41,0.72,43.5,229.7,13.7,414,8,806,NULL),('W8L806B414P4',0.9917,0.099,12.4,0.58,3.56,7.7,0.76,0.26,33.3,105.4,6.97,414,8,806,NULL),('W8L806B414P5',0.9942,0.092,9.5,0.92,3.04,8.21,0.04,0.38,24.7,98.6,14.9,414,8,806,NULL),('W8L806B414P6',0.9938,0.09,9.6,0.85,3.8,6.83,0.15,0.93,15,112.4,6.12,414,8,806,NULL),('W8L806B414P7',0.9924,0.036,13,0.36,3.4,5.45,0.48,0.62,50.4,47,15.61,414,8,806,NULL),('W8L806B414P8',0.9983,0.062,8,0.71,3.13,5.53,0.48,0.41,35.2,165.6,3.6,414,8,806,NULL),('W8L806B414P9',0.999,0.042,10.7,0.63,3.09,9.63,0.58,0.42,8.8,152,13.87,414,8,806,NULL),('W8L806B415P1',0.998,0.033,11.3,0.8,3.69,6.53,0.19,0.39,38.6,44.4,18.9,415,8,806,NULL),('W8L806B415P10',0.994,0.052,11,0.59,2.84,5.99,0.23,0.55,44.7,38.4,13.74,415,8,806,NULL),('W8L806B415P11',1.0021,0.096,9.1,0.59,3.8,8.32,0.02,0.91,66.2,41.5,2.6,415,8,806,NULL),('W8L806B415P12',0.9983,0.058,12.2,0.99,3.03,6.8,0.47,0.68,22.3,164.7,14.8,415,8,806,NULL),('W8L806B415P13',0.9973,0.02,10.3,0.78,3.66,5.44,0.53,0.68,35.7,53.5,2.11,415,8,806,NULL),('W8L806B415P14',0.9998,0.049,11.7,0.6,3.17,6.31,0.04,0.85,34.6,190.3,5.46,415,8,806,NULL),('W8L806B415P15',0.9963,0.062,10.2,0.4,3.47,6.1,0.13,0.9,52.4,164.9,10.25,415,8,806,NULL),('W8L806B415P16',1.0031,0.054,10.4,0.82,3.58,7.79,0.72,0.31,12.2,115.3,17.97,415,8,806,NULL),('W8L806B415P17',0.9957,0.068,12.9,0.82,2.8,6.53,0.56,0.75,5.7,89,9.14,415,8,806,NULL),('W8L806B415P18',0.9939,0.078,8.3,0.64,3.69,7.04,0.77,0.49,8.6,78.6,9.77,415,8,806,NULL),('W8L806B415P19',1.0003,0.02,9.6,0.87,3.38,9.62,0.22,0.49,28.3,214,14.4,415,8,806,NULL),('W8L806B415P2',0.9908,0.032,10.6,0.96,2.81,7.07,0.29,1,33.4,154.7,15.71,415,8,806,NULL),('W8L806B415P20',0.99,0.069,12.9,0.81,3.02,5.92,0.43,0.81,48.8,115.5,8.25,415,8,806,NULL),('W8L806B415P21',0.9942,0.097,9.7,0.52,2.86,9.92,0.2,0.17,38.4,142.2,8.72,415,8,806,NULL),('W8L806B415P22',0.9919,0.055,11.3,0.61,3.01,7.62,0.48,0.96,49.1,60.7,1.03,415,8,806,NULL),('W8L806B415P23',0.9976,0.074,9.5,0.99,3.43,6.15,0.21,0.21,22,23.4,1.02,415,8,806,NULL),('W8L806B415P24',1.003,0.077,13,0.31,3.34,5.69,0.51,0.83,45.4,74.8,8.07,415,8,806,NULL),('W8L806B415P25',1.0027,0.096,12.9,0.74,3.04,6.62,0.58,0.87,57.6,208.7,5.86,415,8,806,NULL),('W8L806B415P26',0.9927,0.093,12.1,0.99,3.3,5.63,0.32,0.68,35,137.9,0.82,415,8,806,NULL),('W8L806B415P27',0.9948,0.014,9.9,0.73,2.91,6.11,0.21,0.84,26.6,155.6,3.79,415,8,806,NULL),('W8L806B415P3',1.0005,0.041,10.4,0.3,3.17,9.45,0.24,0.19,10.3,58.9,18.46,415,8,806,NULL),('W8L806B415P4',0.9923,0.035,11.7,0.79,3.21,6.33,0.14,0.57,59.5,33.8,16.73,415,8,806,NULL),('W8L806B415P5',0.9919,0.015,11.8,0.59,2.8,6.13,0.62,0.21,8.5,65.4,2.29,415,8,806,NULL),('W8L806B415P6',0.9999,0.068,11.1,0.66,3.42,5.65,0.2,0.64,61.9,242.2,15.26,415,8,806,NULL),('W8L806B415P7',0.9976,0.036,13.6,0.7,2.89,6.22,0.17,0.86,22.2,244.7,5.29,415,8,806,NULL),('W8L806B415P8',0.997,0.016,11.1,0.46,3.76,9.75,0.37,0.32,60.2,63.9,17.49,415,8,806,NULL),('W8L806B415P9',1.0028,0.011,8.7,0.51,2.93,5.87,0.2,0.64,28.7,102.1,15.17,415,8,806,NULL),('W8L806B416P1',1.0013,0.069,13.2,0.83,3.12,6.48,0.47,0.48,68.8,89.8,18.14,416,8,806,NULL),('W8L806B416P10',1.003,0.048,12,0.88,3.01,5.28,0.25,0.71,49.3,104.7,3.79,416,8,806,NULL),('W8L806B416P11',0.9995,0.065,12.2,0.71,3.34,9.95,0.6,0.91,50.2,154,8.67,416,8,806,NULL),('W8L806B416P12',0.9992,0.01,11.8,0.74,3.58,6.52,0.1,0.72,42.1,230.2,17.38,416,8,806,NULL),('W8L806B416P13',0.9905,0.077,12.7,0.86,3.71,7.54,0.67,0.43,6.7,80.3,3.99,416,8,806,NULL),('W8L806B416P14',1.0016,0.024,13.7,0.44,2.8,7.32,0.56,0.26,12.1,193.9,11.72,416,8,806,NULL),('W8L806B416P15',0.9932,0.073,12.9,0.66,2.97,7.13,0.57,0.35,43.1,211.4,8.3,416,8,806,NULL),('W8L806B416P16',0.9912,0.068,12.8,0.76,3.29,8.42,0.33,0.64,48.9,48.6,19.02,416,8,806,NULL),('W8L806B416P17',1.0002,0.023,11.9,0.73,3.31,9.08,0.53,0.38,55.6,153.4,6.93,416,8,806,NULL),('W8L806B416P18',1.0038,0.087,8.4,0.48,3.09,5.19,0.33,0.48,14.4,132,7.85,416,8,806,NULL),('W8L806B416P19',0.996,0.012,11.8,1,3.49,5.48,0.73,0.25,47.2,117.6,2.07,416,8,806,NULL),('W8L806B416P2',1.0023,0.047,9.9,0.64,3.62,6.33,0.74,0.75,21.5,84.6,1.17,416,8,806,NULL),('W8L806B416P20',0.9927,0.02,10.5,0.83,2.87,5.8,0.33,0.67,23.5,18.2,1.59,416,8,806,NULL),('W8L806B416P21',0.9902,0.045,8.9,0.89,3.5,5.12,0.24,0.49,29.2,55.6,11.9,416,8,806,NULL),('W8L806B416P3',0.9908,0.045,10.4,0.32,2.87,8.67,0.64,0.86,55.5,211.6,15.25,416,8,806,NULL),('W8L806B416P4',0.9908,0.021,11.9,0.75,3.21,7.11,0.01,0.61,44.9,237.6,4.72,416,8,806,NULL),('W8L806B416P5',0.9909,0.086,9,0.99,2.83,7.42,0.07,0.25,35.8,83.5,0.69,416,8,806,NULL),('W8L806B416P6',0.9992,0.027,14,0.94,3.02,5.83,0.64,0.27,54.3,146.8,0.61,416,8,806,NULL),('W8L806B416P7',1.0041,0.07,12.9,0.4,3.73,9.93,0.44,0.74,28.7,213.8,17.24,416,8,806,NULL),('W8L806B416P8',1.0012,0.069,8.7,0.42,2.84,9.74,0.05,0.63,31.9,139.8,11.1,416,8,806,NULL),('W8L806B416P9',0.9987,0.073,10.6,0.31,3.54,7.94,0.41,0.52,40,201.6,16.9,416,8,806,NULL);
 /*!40000 ALTER TABLE `product` ENABLE KEYS */;
 UNLOCK TABLES;
 
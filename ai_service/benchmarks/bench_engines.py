@@ -0,0 +1,72 @@
+import argparse
+import os
+import time
+import warnings
+
+import numpy as np
+
+from ai_service.inference.bundle import load_artifacts_dir
+from ai_service.inference.engines import ENGINES, build_engine, check_parity, parity_probe
+
+warnings.filterwarnings('ignore')
+
+# Usage (from the repository root):
+#   python -m ai_service.benchmarks.bench_engines --engines xgboost booster compiled onnx lightgbm
+#   python -m ai_service.benchmarks.bench_engines --artifacts path/to/artifacts --threads 2
+#
+# Per backend: parity against its reference, max difference from the XGBoost
+# wrapper (non-zero for LightGBM, which is a different model), then p50/p99
+# latency and rows/s per batch size. Backends whose runtime or model is not
+# available are reported and skipped.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARTIFACTS_DIR = os.path.join(BASE_DIR, "../artifacts")
+BATCH_SIZES = [1, 16, 1024]
+
+
+def measure(engine, X, batch_size, repeats):
+    batch = X[:batch_size]
+    engine.predict(batch)  # warm up
+    timings = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        engine.predict(batch)
+        timings[i] = time.perf_counter() - start
+    return np.percentile(timings, 50), np.percentile(timings, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inference engine latency benchmark')
+    parser.add_argument('--engines', nargs='+', default=list(ENGINES))
+    parser.add_argument('--artifacts', default=ARTIFACTS_DIR)
+    parser.add_argument('--threads', type=int, default=1, help='Threads per predict call')
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+
+    artifacts = load_artifacts_dir(os.path.abspath(args.artifacts))
+    model = artifacts.model
+    n_features = len(artifacts.feature_names)
+
+    # Rows in scaled feature space, like what the service hands to the engine
+    X = np.random.default_rng(42).normal(size=(max(BATCH_SIZES), n_features))
+    probe = parity_probe(n_features)
+    baseline = model.predict(probe)
+
+    print(f"{'engine':<10} {'batch':>6} {'p50 (us)':>12} {'p99 (us)':>12} {'rows/s':>12}")
+    for name in args.engines:
+        try:
+            engine = build_engine(name, model, artifacts)
+            engine.set_threads(args.threads)
+            diff = check_parity(engine, n_features)
+        except Exception as e:
+            print(f"{name:<10} skipped: {e}")
+            continue
+        for batch_size in BATCH_SIZES:
+            p50, p99 = measure(engine, X, batch_size, args.repeats)
+            print(f"{name:<10} {batch_size:>6} {p50 * 1e6:>12.1f} {p99 * 1e6:>12.1f} {batch_size / p50:>12.0f}")
+        vs_xgboost = float(np.max(np.abs(np.asarray(engine.predict(probe), dtype=np.float64) - baseline)))
+        print(f"{name:<10} parity: max |diff| vs reference = {diff:.3g}, vs xgboost wrapper = {vs_xgboost:.3g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import time
+import warnings
+
+import numpy as np
+
+warnings.filterwarnings('ignore')
+
+# Usage (from the repository root):
+#   python -m ai_service.benchmarks.bench_formats --rows 1000
+#
+# End-to-end rows/sec through the FastAPI app (in-process test client), from
+# request bytes to response bytes, for /predict_batch (one JSON object per row)
+# and each /predict/bulk format. The prediction cache is off so every request
+# pays for the model.
+
+os.environ.setdefault("CACHE_MAX_BYTES", "0")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from ai_service.inference.main import app, MAX_BATCH_SIZE  # noqa: E402
+from ai_service.inference.schemas import WineInput  # noqa: E402
+
+
+def make_rows(n, seed=42):
+    # Schema example with +-20% noise, both wine types
+    example = WineInput.model_json_schema()["example"]
+    rng = np.random.default_rng(seed)
+    columns = {"type": np.where(rng.random(n) < 0.5, "white", "red")}
+    for col, value in example.items():
+        if col != "type":
+            columns[col] = value * rng.uniform(0.8, 1.2, n)
+    return columns
+
+
+def encode_requests(columns, layout):
+    # (name, path, content type, body) per format; formats with missing
+    # optional packages are skipped
+    n = len(columns["type"])
+    rows = [{col: (str(v[i]) if col == "type" else float(v[i])) for col, v in columns.items()} for i in range(n)]
+    requests = []
+
+    for start in range(0, n, MAX_BATCH_SIZE):
+        body = json.dumps({"items": rows[start:start + MAX_BATCH_SIZE]}).encode("utf-8")
+        requests.append(("rows json (/predict_batch)", "/predict_batch", "application/json", body))
+
+    as_lists = {col: v.tolist() for col, v in columns.items()}
+    requests.append(("columnar json", "/predict/bulk", "application/json", json.dumps(as_lists).encode("utf-8")))
+
+    try:
+        import msgpack
+        packed = {col: (v.tolist() if col == "type" else v.astype("<f4").tobytes()) for col, v in columns.items()}
+        requests.append(("msgpack", "/predict/bulk", "application/msgpack", msgpack.packb(packed)))
+    except ImportError:
+        print("msgpack not installed, skipping")
+
+    try:
+        import pyarrow as pa
+        table = pa.table({col: pa.array(v) for col, v in columns.items()})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        requests.append(("arrow ipc", "/predict/bulk", "application/vnd.apache.arrow.stream", sink.getvalue().to_pybytes()))
+    except ImportError:
+        print("pyarrow not installed, skipping")
+
+    codes = layout["categories"]["type"]
+    matrix = np.empty((n, len(layout["feature_names"])), dtype="<f4")
+    for pos, col in enumerate(layout["feature_names"]):
+        values = columns[col]
+        matrix[:, pos] = [codes.get(v, 0) for v in values] if col in layout["categories"] else values
+    requests.append(("raw float32", "/predict/bulk", "application/octet-stream", matrix.tobytes()))
+    return requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk request format throughput benchmark')
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+
+    with TestClient(app) as client:
+        layout = client.get("/predict/bulk/layout").json()
+        requests = encode_requests(make_rows(args.rows), layout)
+
+        # Group the chunked /predict_batch requests under one name
+        formats = {}
+        for name, path, content_type, body in requests:
+            formats.setdefault(name, []).append((path, content_type, body))
+
+        print(f"{'format':<28} {'request bytes':>14} {'response bytes':>15} {'rows/s':>12}")
+        for name, calls in formats.items():
+            for path, content_type, body in calls:  # warm up
+                response = client.post(path, content=body, headers={"Content-Type": content_type})
+                response.raise_for_status()
+            timings = np.empty(args.repeats)
+            for i in range(args.repeats):
+                start = time.perf_counter()
+                for path, content_type, body in calls:
+                    response = client.post(path, content=body, headers={"Content-Type": content_type})
+                timings[i] = time.perf_counter() - start
+            request_bytes = sum(len(body) for _, _, body in calls)
+            print(f"{name:<28} {request_bytes:>14} {len(response.content) * len(calls):>15} {args.rows / np.median(timings):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import os
+import time
+import warnings
+
+import numpy as np
+
+from ai_service.inference.bundle import load_artifacts_dir
+from ai_service.inference.engines import build_engine
+from ai_service.inference.intervals import IntervalHeads
+
+warnings.filterwarnings('ignore')
+
+# Usage (from the repository root, with a bundle trained with quantile heads):
+#   python -m ai_service.benchmarks.bench_intervals
+#   python -m ai_service.benchmarks.bench_intervals --engines compiled booster --artifacts path/to/artifacts
+#
+# Per engine and batch size: p50 latency of the point prediction alone, of
+# point + interval + confidence, and the added cost. With the compiled engine
+# the heads are fused into the point forest; other engines run them after.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARTIFACTS_DIR = os.path.join(BASE_DIR, "../artifacts")
+BATCH_SIZES = [1, 16, 1024]
+
+
+def p50(fn, repeats):
+    fn()  # warm up
+    timings = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings[i] = time.perf_counter() - start
+    return np.percentile(timings, 50)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Prediction interval overhead benchmark')
+    parser.add_argument('--engines', nargs='+', default=['compiled', 'booster', 'xgboost'])
+    parser.add_argument('--artifacts', default=ARTIFACTS_DIR)
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+
+    artifacts = load_artifacts_dir(os.path.abspath(args.artifacts))
+    if artifacts.quantile_forest is None:
+        raise SystemExit("The bundle has no quantile heads, retrain with train.py")
+    n_features = len(artifacts.feature_names)
+    X = np.random.default_rng(42).normal(size=(max(BATCH_SIZES), n_features))
+
+    print(f"{'engine':<10} {'mode':<9} {'batch':>6} {'point (us)':>12} {'+interval (us)':>15} {'added':>8}")
+    for name in args.engines:
+        engine = build_engine(name, artifacts.model, artifacts)
+        engine.set_threads(1)
+        heads = IntervalHeads(artifacts.quantile_forest, artifacts.quantiles, artifacts.quantile_model, engine)
+        heads.check_parity(n_features, engine)
+
+        def with_interval(batch):
+            point, lower, upper = heads.predict(batch, engine)
+            return heads.confidence(point, lower, upper)
+
+        for batch_size in BATCH_SIZES:
+            batch = X[:batch_size]
+            point = p50(lambda: engine.predict(batch), args.repeats)
+            full = p50(lambda: with_interval(batch), args.repeats)
+            print(f"{name:<10} {heads.mode:<9} {batch_size:>6} {point * 1e6:>12.1f} {full * 1e6:>15.1f} "
+                  f"{(full / point - 1) * 100:>7.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from ai_service.inference.schemas import WineInput
+from ai_service.inference.uds import UDSClient
+
+# Usage (from the repository root):
+#   python -m ai_service.benchmarks.bench_uds --requests 2000 --batch 1 64
+#
+# Starts the service (uvicorn, one process) with UDS_PATH set, then scores
+# the same readings over
+#   http keep-alive:  POST /predict (or /predict_batch) on one reused connection
+#   http new conn:    the same, opening a connection per request like the
+#                     backend's axios calls
+#   uds:              the framed Unix socket protocol on one connection
+# and prints p50/p99 client latency and rows/s. The prediction cache and
+# micro-batching are off so every request pays for the model.
+
+SERVER_ENV = {"CACHE_MAX_BYTES": "0", "MICRO_BATCHING": "0"}
+
+
+def start_server(port, socket_path):
+    env = {**os.environ, **SERVER_ENV, "UDS_PATH": socket_path}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "ai_service.inference.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/ready")
+            response = conn.getresponse()
+            response.read()
+            ready = response.status == 200
+            conn.close()
+            if ready and os.path.exists(socket_path):
+                return server
+        except OSError:
+            pass
+        time.sleep(0.2)
+    server.kill()
+    raise SystemExit("Service did not start")
+
+
+def make_wines(n, seed=42):
+    example = WineInput.model_json_schema()["example"]
+    rng = np.random.default_rng(seed)
+    return [
+        {col: ("white" if rng.random() < 0.5 else "red") if col == "type" else float(value * rng.uniform(0.8, 1.2))
+         for col, value in example.items()}
+        for _ in range(n)
+    ]
+
+
+def http_call(port, batch, keep_alive):
+    if len(batch) == 1:
+        path, body = "/predict", json.dumps(batch[0])
+    else:
+        path, body = "/predict_batch", json.dumps({"items": batch})
+    headers = {"Content-Type": "application/json"}
+    state = {"conn": None}
+
+    def call():
+        conn = state["conn"] or http.client.HTTPConnection("127.0.0.1", port)
+        conn.request("POST", path, body, headers)
+        response = conn.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+        if keep_alive:
+            state["conn"] = conn
+        else:
+            conn.close()
+    return call
+
+
+def measure(call, n_requests):
+    call()  # warm up (and connect)
+    timings = np.empty(n_requests)
+    for i in range(n_requests):
+        start = time.perf_counter()
+        call()
+        timings[i] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Unix socket vs HTTP transport benchmark')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--batch', type=int, nargs='+', default=[1, 64])
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    socket_path = os.path.join(tempfile.mkdtemp(), "bench.sock")
+    server = start_server(args.port, socket_path)
+    try:
+        client = UDSClient(socket_path)
+        print(f"{'transport':<16} {'batch':>6} {'p50 (us)':>10} {'p99 (us)':>10} {'rows/s':>10}")
+        for batch_size in args.batch:
+            batch = make_wines(batch_size)
+            transports = [
+                ("http keep-alive", http_call(args.port, batch, keep_alive=True)),
+                ("http new conn", http_call(args.port, batch, keep_alive=False)),
+                ("uds", lambda: client.predict(batch)),
+            ]
+            for name, call in transports:
+                timings = measure(call, args.requests)
+                p50, p99 = np.percentile(timings, 50), np.percentile(timings, 99)
+                rows_per_s = batch_size * len(timings) / timings.sum()
+                print(f"{name:<16} {batch_size:>6} {p50 * 1e6:>10.0f} {p99 * 1e6:>10.0f} {rows_per_s:>10.0f}")
+        client.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+import asyncio
+import math
+from collections import deque
+from contextlib import asynccontextmanager
+
+# Admission control for scoring requests.
+#
+# At most `concurrency` requests hold an execution slot at a time, and each
+# lane at most its own share of them (lane_concurrency), so bulk work can't
+# take every slot. Micro-batched requests (batched=True) share a slot
+# `batch_size` ways, since one flush scores up to that many of them on one
+# executor thread; everything else holds a whole slot. The rest wait in one
+# bounded FIFO per priority lane; a freed slot always goes to the oldest
+# waiter of the most urgent lane that may take it, so live line traffic is
+# served ahead of bulk/backfill scoring. When a lane's queue is full the
+# request is shed right away (429 + Retry-After) instead of piling up.
+# Streams are the exception (wait=True): they always queue, since each holds
+# at most one waiter, and a stream that waits stops reading its socket, so
+# TCP backpressure throttles the sender instead of a 429.
+#
+# Requests may carry a deadline. If the estimated queueing + service time
+# already overshoots it, the request is rejected on arrival; if it expires
+# while queued, it leaves the queue and is rejected then. Work that has
+# started is never interrupted.
+
+LANES = ("live", "bulk")  # scheduling order, most urgent first
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, status_code, detail, retry_after=None):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    def __init__(self, concurrency, max_queue, lane_concurrency=None, batch_size=1, smoothing=0.2):
+        # max_queue: {lane: max waiting requests}
+        # lane_concurrency: {lane: max slots held by that lane}, default: all of them
+        self.max_queue = dict(max_queue)
+        self.smoothing = smoothing
+        self.configure(concurrency, lane_concurrency, batch_size)
+
+        self._active = 0  # in slot shares: a whole slot is batch_size shares
+        self._active_by_lane = {lane: 0 for lane in LANES}
+        self._waiters = {lane: deque() for lane in LANES}  # of (future, shares)
+        self._service_time = None  # EWMA of slot hold time, seconds
+
+        self.counters = {lane: {"admitted": 0, "queued": 0, "rejected_full": 0, "rejected_deadline": 0,
+                                "expired": 0} for lane in LANES}
+
+    def configure(self, concurrency, lane_concurrency=None, batch_size=1):
+        # Also called once the executor size is known
+        self.concurrency = concurrency
+        self.lane_concurrency = {lane: min(concurrency, (lane_concurrency or {}).get(lane) or concurrency)
+                                 for lane in LANES}
+        self.batch_size = max(1, batch_size)
+
+    def lane(self, name, default):
+        if name is None:
+            return default
+        if name not in self._waiters:
+            raise AdmissionRejected(400, f"Unknown priority '{name}', expected one of {list(LANES)}")
+        return name
+
+    @asynccontextmanager
+    async def slot(self, lane, deadline=None, batched=False, wait=False):
+        # deadline: absolute time on the event loop clock (loop.time()), or None
+        # wait: queue even when the lane's queue is full
+        loop = asyncio.get_running_loop()
+        shares = 1 if batched else self.batch_size
+        await self._acquire(loop, lane, deadline, shares, wait)
+        start = loop.time()
+        try:
+            yield
+        finally:
+            self._release(lane, shares, loop.time() - start)
+
+    def _fits(self, lane, shares):
+        return (self._active + shares <= self.concurrency * self.batch_size
+                and self._active_by_lane[lane] + shares <= self.lane_concurrency[lane] * self.batch_size)
+
+    def _take(self, lane, shares):
+        self._active += shares
+        self._active_by_lane[lane] += shares
+
+    async def _acquire(self, loop, lane, deadline, shares, wait=False):
+        counters = self.counters[lane]
+        if not self._waiters[lane] and self._fits(lane, shares):
+            self._take(lane, shares)
+            counters["admitted"] += 1
+            return
+
+        queue = self._waiters[lane]
+        if not wait and len(queue) >= self.max_queue[lane]:
+            counters["rejected_full"] += 1
+            raise AdmissionRejected(429, f"Too many queued '{lane}' requests", self.retry_after())
+
+        if deadline is not None:
+            remaining = deadline - loop.time()
+            if remaining <= 0 or self.estimated_wait(lane) + (self._service_time or 0.0) > remaining:
+                counters["rejected_deadline"] += 1
+                raise AdmissionRejected(504, "Deadline cannot be met at the current queue depth")
+
+        future = loop.create_future()
+        queue.append((future, shares))
+        counters["queued"] += 1
+        try:
+            if deadline is None:
+                await future
+            else:
+                await asyncio.wait_for(asyncio.shield(future), deadline - loop.time())
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # The slot arrived just as we gave up: pass it on
+                self._release(lane, shares, None)
+            else:
+                future.cancel()
+                try:
+                    queue.remove((future, shares))
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.TimeoutError):
+                counters["expired"] += 1
+                raise AdmissionRejected(504, "Deadline expired while queued")
+            raise
+        counters["admitted"] += 1
+
+    def _release(self, lane, shares, duration):
+        if duration is not None:
+            if self._service_time is None:
+                self._service_time = duration
+            else:
+                self._service_time += self.smoothing * (duration - self._service_time)
+        self._active -= shares
+        self._active_by_lane[lane] -= shares
+        # Hand the freed shares straight to the next waiters, most urgent lane first
+        for name in LANES:
+            queue = self._waiters[name]
+            while queue:
+                future, wanted = queue[0]
+                if future.done():
+                    queue.popleft()
+                    continue
+                if not self._fits(name, wanted):
+                    break
+                queue.popleft()
+                self._take(name, wanted)
+                future.set_result(None)
+            if queue and self._active + queue[0][1] > self.concurrency * self.batch_size:
+                # Out of slots, not just out of this lane's share: less urgent lanes wait too
+                return
+
+    def waiting(self, lane):
+        return len(self._waiters[lane])
+
+    def estimated_wait(self, lane):
+        # Everyone queued in this lane or a more urgent one goes first
+        ahead = 0
+        for name in LANES:
+            ahead += len(self._waiters[name])
+            if name == lane:
+                break
+        return (ahead + 1) * (self._service_time or 0.0) / self.lane_concurrency[lane]
+
+    def retry_after(self):
+        # Seconds until the current queue should have drained, at least 1
+        waiting = sum(len(queue) for queue in self._waiters.values())
+        return max(1, math.ceil(waiting * (self._service_time or 0.0) / self.concurrency))
+
+    def state(self):
+        return {"service_time": self._service_time}
+
+    def checkpoint(self):
+        return {lane: dict(counters) for lane, counters in self.counters.items()}, self._service_time
+
+    def rollback(self, checkpoint):
+        # Forget requests admitted since the checkpoint (warmup traffic)
+        counters, self._service_time = checkpoint
+        self.counters = {lane: dict(values) for lane, values in counters.items()}
+
+    def restore(self, state):
+        # Seed the service time estimate from a snapshot; live measurements take over from there
+        if self._service_time is None:
+            self._service_time = state.get("service_time")
+
+    def stats(self):
+        return {
+            "concurrency": self.concurrency,
+            "batch_size": self.batch_size,
+            "active": self._active / self.batch_size,
+            "service_time_ms": self._service_time * 1000 if self._service_time is not None else None,
+            "lanes": {
+                lane: {"concurrency": self.lane_concurrency[lane], "active": self._active_by_lane[lane] / self.batch_size,
+                       "waiting": len(self._waiters[lane]), "max_queue": self.max_queue[lane], **self.counters[lane]}
+                for lane in LANES
+            },
+        }
@@ -0,0 +1,147 @@
+import asyncio
+
+
+class MicroBatcher:
+    """Coalesces concurrent single-row requests into one vectorized predict.
+
+    Callers `await submit(item)` and get their own result back through a
+    future. A background task collects queued items and flushes when either
+    `max_batch_size` items are waiting or the wait window has elapsed.
+
+    The window adapts to traffic: it tracks an exponentially weighted average
+    of the gap between arrivals. When the next request is not expected within
+    `max_wait` (idle periods) the batch is flushed right away, so a lone
+    request pays no extra latency. Under bursts it waits just long enough to
+    fill the batch, capped at `max_wait`.
+
+    Up to one flush per executor thread runs at a time; when all of them are
+    busy, new arrivals queue up and form the next batch.
+    """
+
+    def __init__(self, predict_batch, max_batch_size=64, max_wait=0.002, smoothing=0.2, executor=None):
+        # predict_batch: sync callable(list of items) -> sequence of results, run
+        # off the event loop on `executor` (the loop's default one if None)
+        self.predict_batch = predict_batch
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.smoothing = smoothing
+
+        self._queue = None
+        self._task = None
+        self._flushes = set()
+        self._flush_done = None  # asyncio.Event, set whenever a flush finishes
+        self._last_arrival = None
+        self._avg_gap = None
+
+        # Simple counters, handy when tuning the limits
+        self.batches = 0
+        self.items = 0
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._flush_done = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Flushes already on the executor finish and answer their callers
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        # Fail anything still waiting rather than leaving callers hanging
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher stopped"))
+
+    async def submit(self, item):
+        loop = asyncio.get_running_loop()
+        self._record_arrival(loop.time())
+        future = loop.create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    def _record_arrival(self, now):
+        if self._last_arrival is not None:
+            gap = now - self._last_arrival
+            if self._avg_gap is None:
+                self._avg_gap = gap
+            else:
+                self._avg_gap += self.smoothing * (gap - self._avg_gap)
+        self._last_arrival = now
+
+    def max_flushes(self):
+        # One per executor thread (read each time: calibration may resize it)
+        return max(1, getattr(self.executor, "workers", 1))
+
+    def current_window(self, pending):
+        # How long to keep collecting once `pending` items are in hand
+        if self._avg_gap is None or self._avg_gap >= self.max_wait:
+            return 0.0
+        return min(self.max_wait, self._avg_gap * (self.max_batch_size - pending))
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            while len(self._flushes) >= self.max_flushes():
+                self._flush_done.clear()
+                await self._flush_done.wait()
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.current_window(len(batch))
+
+            while len(batch) < self.max_batch_size:
+                # Take whatever is already queued before considering a wait
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Runs next to the other flushes; the next batch starts collecting right away
+            task = asyncio.create_task(self._flush(loop, batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._finished)
+
+    def _finished(self, task):
+        self._flushes.discard(task)
+        self._flush_done.set()
+
+    async def _flush(self, loop, batch):
+        items = [item for item, _ in batch]
+        try:
+            results = await loop.run_in_executor(self.executor, self.predict_batch, items)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.items += len(batch)
+        for (_, future), result in zip(batch, results):
+            # The caller may have gone away (client disconnect cancels the await)
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self):
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "batches": self.batches,
+            "items": self.items,
+            "flushing": len(self._flushes),
+            "max_flushes": self.max_flushes(),
+            "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+            "avg_arrival_gap_ms": self._avg_gap * 1000 if self._avg_gap is not None else None,
+        }
@@ -0,0 +1,325 @@
+import argparse
+import hashlib
+import json
+import os
+import struct
+import time
+
+import numpy as np
+
+from .compiled_forest import CompiledForest
+from .engines import export_onnx, parity_probe
+
+# Single-file model bundle
+#
+#   MAGIC (8 bytes) | format version (uint32) | reserved (uint32)
+#   manifest length (uint64) | array section offset (uint64)
+#   manifest (UTF-8 JSON)
+#   raw arrays, each starting on a 64-byte boundary
+#
+# The manifest holds the model version, dataset hash, feature order, the small
+# preprocessing parameters and, for every array, its dtype, shape, offset and
+# sha256. Arrays are read through one read-only memory map, so loading does
+# not copy them and the pages are shared by every process that maps the file.
+#
+# Optional arrays feed the alternative inference engines (engines.py): the
+# ONNX export of the XGBoost model and a LightGBM model trained on the same
+# features, with its outputs on the parity probe. Quantile heads for
+# prediction intervals (intervals.py) are stored both as the XGBoost model
+# and pre-flattened, like the point model.
+
+MAGIC = b"WQBUNDLE"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+HEADER = struct.Struct("<8sIIQQ")
+BUNDLE_FILENAME = "model_bundle.wqb"
+
+LEGACY_FILES = ('xgb_model', 'scaler', 'label_encoders', 'imputation_values', 'feature_names')
+
+
+class LoadedArtifacts:
+    # Everything the service needs, whichever layout it came from
+    def __init__(self, model, scaler, label_encoders, imputation_values, feature_names,
+                 version, manifest, forest=None, source=None, onnx_model=None,
+                 lightgbm_model=None, lightgbm_reference=None, quantile_model=None,
+                 quantile_forest=None, quantiles=None, feature_ranges=None):
+        self.model = model
+        self.scaler = scaler
+        self.label_encoders = label_encoders
+        self.imputation_values = imputation_values
+        self.feature_names = feature_names
+        self.version = version
+        self.manifest = manifest
+        self.forest = forest
+        self.source = source
+        self.onnx_model = onnx_model  # serialized ONNX graph (bytes-like)
+        self.lightgbm_model = lightgbm_model  # LightGBM model text
+        self.lightgbm_reference = lightgbm_reference  # its predictions on the parity probe
+        self.quantile_model = quantile_model  # lower/upper quantile heads (XGBRegressor)
+        self.quantile_forest = quantile_forest  # the same heads as a CompiledForest
+        self.quantiles = quantiles
+        self.feature_ranges = feature_ranges  # {column: [min, max]} seen in training
+
+
+def _sha256(data):
+    return hashlib.sha256(memoryview(data).cast("B")).hexdigest()
+
+
+def write_bundle(path, model, scaler, label_encoders, imputation_values, feature_names,
+                 dataset_hash=None, version=None, lightgbm_model=None, quantile_model=None, quantiles=None,
+                 feature_ranges=None):
+    model_bytes = bytes(model.get_booster().save_raw("ubj"))
+    forest = CompiledForest.from_model(model)
+    n_features = len(feature_names)
+
+    arrays = {
+        "xgb_model": np.frombuffer(model_bytes, dtype=np.uint8),
+        "scaler_mean": np.asarray(scaler.mean_, dtype=np.float64),
+        "scaler_scale": np.asarray(scaler.scale_, dtype=np.float64),
+        "scaler_var": np.asarray(scaler.var_, dtype=np.float64),
+    }
+    # Pre-flattened trees, so the compiled engine can serve straight from the map
+    for name, array in forest.to_arrays().items():
+        arrays[f"forest/{name}"] = array
+
+    try:
+        arrays["onnx_model"] = np.frombuffer(export_onnx(model, n_features), dtype=np.uint8)
+    except ImportError:
+        print("onnxmltools not installed, bundle written without the ONNX export")
+
+    if lightgbm_model is not None:
+        booster = getattr(lightgbm_model, "booster_", lightgbm_model)
+        arrays["lightgbm/model"] = np.frombuffer(booster.model_to_string().encode("utf-8"), dtype=np.uint8)
+        arrays["lightgbm/reference"] = np.asarray(booster.predict(parity_probe(n_features)), dtype=np.float64)
+
+    quantile_forest = None
+    if quantile_model is not None:
+        quantile_forest = CompiledForest.from_model(quantile_model)
+        arrays["quantile/xgb_model"] = np.frombuffer(bytes(quantile_model.get_booster().save_raw("ubj")), dtype=np.uint8)
+        for name, array in quantile_forest.to_arrays().items():
+            arrays[f"quantile_forest/{name}"] = array
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        # Content-derived by default so caches keyed on it can never go stale
+        "version": version or hashlib.sha256(model_bytes).hexdigest()[:12],
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "dataset_hash": dataset_hash,
+        "feature_names": [str(col) for col in feature_names],
+        "label_encoders": {col: [str(c) for c in le.classes_] for col, le in label_encoders.items()},
+        "imputation_values": {col: float(v) for col, v in imputation_values.items()},
+        "feature_ranges": {col: [float(low), float(high)] for col, (low, high) in (feature_ranges or {}).items()},
+        "scaler": {
+            "with_mean": bool(scaler.with_mean),
+            "with_std": bool(scaler.with_std),
+            "n_samples_seen": int(np.max(scaler.n_samples_seen_)),
+        },
+        "model": {"class": type(model).__name__, "xgboost_params": _json_params(model)},
+        "forest": {"base_score": forest.base_score.tolist(), "max_depth": forest.max_depth},
+        "arrays": {},
+    }
+    if quantile_forest is not None:
+        manifest["quantile_forest"] = {
+            "quantiles": [float(q) for q in quantiles],
+            "base_score": quantile_forest.base_score.tolist(),
+            "max_depth": quantile_forest.max_depth,
+        }
+
+    # Array offsets are relative to the start of the array section
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+            "nbytes": int(array.nbytes),
+            "sha256": _sha256(array),
+        }
+        offset = _align(offset + array.nbytes)
+    manifest["arrays"] = layout
+
+    manifest_bytes = json.dumps(manifest, indent=1).encode("utf-8")
+    data_start = _align(HEADER.size + len(manifest_bytes))
+
+    # Write next to the target and rename, so readers never see a partial file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(manifest_bytes), data_start))
+        f.write(manifest_bytes)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]["offset"])
+            f.write(array.tobytes())
+    os.replace(tmp_path, path)
+    return manifest
+
+
+def read_header(path):
+    with open(path, "rb") as f:
+        magic, format_version, _, manifest_len, data_start = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a model bundle")
+        if format_version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported bundle format version {format_version}")
+        manifest = json.loads(f.read(manifest_len).decode("utf-8"))
+    return manifest, data_start
+
+
+def read_manifest(path):
+    return read_header(path)[0]
+
+
+def load_bundle(path, verify=True):
+    from sklearn.preprocessing import LabelEncoder, StandardScaler
+    from xgboost import XGBRegressor
+
+    manifest, data_start = read_header(path)
+    mm = np.memmap(path, dtype=np.uint8, mode="r")
+
+    arrays = {}
+    for name, spec in manifest["arrays"].items():
+        start = data_start + spec["offset"]
+        raw = mm[start:start + spec["nbytes"]]
+        if verify and _sha256(raw) != spec["sha256"]:
+            raise ValueError(f"Checksum mismatch for '{name}' in {path}")
+        arrays[name] = raw.view(np.dtype(spec["dtype"])).reshape(spec["shape"])
+
+    feature_names = manifest["feature_names"]
+
+    model = XGBRegressor()
+    # The booster keeps its own copy; everything else below stays on the map
+    model.load_model(bytearray(arrays["xgb_model"]))
+
+    scaler_spec = manifest["scaler"]
+    scaler = StandardScaler(with_mean=scaler_spec["with_mean"], with_std=scaler_spec["with_std"])
+    scaler.mean_ = arrays["scaler_mean"]
+    scaler.scale_ = arrays["scaler_scale"]
+    scaler.var_ = arrays["scaler_var"]
+    scaler.n_samples_seen_ = scaler_spec["n_samples_seen"]
+    scaler.n_features_in_ = len(feature_names)
+    scaler.feature_names_in_ = np.asarray(feature_names, dtype=object)
+
+    label_encoders = {}
+    for col, classes in manifest["label_encoders"].items():
+        le = LabelEncoder()
+        le.classes_ = np.asarray(classes, dtype=object)
+        label_encoders[col] = le
+
+    forest_arrays = {name.split("/", 1)[1]: a for name, a in arrays.items() if name.startswith("forest/")}
+    forest = CompiledForest.from_arrays(forest_arrays, **manifest["forest"]) if forest_arrays else None
+    lightgbm_model = arrays.get("lightgbm/model")
+
+    quantile_model = quantile_forest = quantiles = None
+    if "quantile_forest" in manifest:
+        quantile_spec = dict(manifest["quantile_forest"])
+        quantiles = quantile_spec.pop("quantiles")
+        quantile_model = XGBRegressor()
+        quantile_model.load_model(bytearray(arrays["quantile/xgb_model"]))
+        quantile_arrays = {name.split("/", 1)[1]: a for name, a in arrays.items()
+                           if name.startswith("quantile_forest/")}
+        quantile_forest = CompiledForest.from_arrays(quantile_arrays, **quantile_spec)
+
+    return LoadedArtifacts(
+        model=model,
+        scaler=scaler,
+        label_encoders=label_encoders,
+        imputation_values=manifest["imputation_values"],
+        feature_ranges=manifest.get("feature_ranges") or None,
+        feature_names=feature_names,
+        version=manifest["version"],
+        manifest=manifest,
+        forest=forest,
+        source=os.path.abspath(path),
+        onnx_model=arrays.get("onnx_model"),
+        lightgbm_model=lightgbm_model.tobytes().decode("utf-8") if lightgbm_model is not None else None,
+        lightgbm_reference=arrays.get("lightgbm/reference"),
+        quantile_model=quantile_model,
+        quantile_forest=quantile_forest,
+        quantiles=quantiles,
+    )
+
+
+def load_legacy(artifacts_dir):
+    # The original five-pickle layout written by older train.py runs
+    import joblib
+
+    loaded = {name: joblib.load(os.path.join(artifacts_dir, f"{name}.joblib")) for name in LEGACY_FILES}
+    with open(os.path.join(artifacts_dir, "xgb_model.joblib"), "rb") as f:
+        version = hashlib.sha256(f.read()).hexdigest()[:12]
+    manifest = {
+        "format_version": None,
+        "version": version,
+        "dataset_hash": None,
+        "feature_names": [str(col) for col in loaded["feature_names"]],
+    }
+    return LoadedArtifacts(
+        model=loaded["xgb_model"],
+        scaler=loaded["scaler"],
+        label_encoders=loaded["label_encoders"],
+        imputation_values=loaded["imputation_values"],
+        feature_names=list(loaded["feature_names"]),
+        version=version,
+        manifest=manifest,
+        source=os.path.abspath(artifacts_dir),
+    )
+
+
+def load_artifacts_dir(artifacts_dir, verify=True):
+    # Prefer the bundle, fall back to the legacy five-file layout
+    bundle_path = os.path.join(artifacts_dir, BUNDLE_FILENAME)
+    if os.path.exists(bundle_path):
+        return load_bundle(bundle_path, verify=verify)
+    return load_legacy(artifacts_dir)
+
+
+def dataset_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _align(n):
+    return (n + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _json_params(model):
+    params = {}
+    for key, value in model.get_params().items():
+        if isinstance(value, (int, float, str, bool)) and value == value:  # skip NaN
+            params[key] = value
+    return params
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Model bundle tools')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    convert = sub.add_parser('convert', help='Build a bundle from the legacy five-file layout')
+    convert.add_argument('artifacts_dir')
+    convert.add_argument('--dataset', help='CSV the model was trained on, to record its hash')
+    convert.add_argument('--output', help=f'Defaults to <artifacts_dir>/{BUNDLE_FILENAME}')
+
+    inspect = sub.add_parser('inspect', help='Print a bundle manifest')
+    inspect.add_argument('path')
+
+    args = parser.parse_args()
+    if args.command == 'convert':
+        legacy = load_legacy(args.artifacts_dir)
+        output = args.output or os.path.join(args.artifacts_dir, BUNDLE_FILENAME)
+        manifest = write_bundle(
+            output, legacy.model, legacy.scaler, legacy.label_encoders, legacy.imputation_values,
+            legacy.feature_names, dataset_hash=dataset_sha256(args.dataset) if args.dataset else None,
+        )
+        print(f"Bundle written to {output} (version {manifest['version']})")
+    else:
+        manifest = read_manifest(args.path)
+        manifest["arrays"] = {name: {k: v for k, v in spec.items() if k != "sha256"} for name, spec in manifest["arrays"].items()}
+        print(json.dumps(manifest, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import math
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# Rough per-entry bookkeeping cost of the OrderedDict (links + hash slot)
+ENTRY_OVERHEAD_BYTES = 100
+
+
+class PredictionCache:
+    """In-process LRU cache of predictions with TTL and a memory cap.
+
+    Keys are canonicalized feature tuples that start with the model version,
+    so entries from different models never mix. Sizes are estimated with
+    sys.getsizeof, which is close enough to keep the cache within budget.
+    Thread-safe: sync handlers run in a threadpool.
+    """
+
+    def __init__(self, max_bytes, ttl):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value, size)
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0
+
+    @staticmethod
+    def make_key(version, values, decimals):
+        # Sensors report at fixed resolution, rounding folds float noise into one key.
+        # A missing reading (None/NaN/inf, imputed the same way) keys as None: NaN
+        # never compares equal, so a key holding it could never be hit again.
+        return (version,) + tuple(
+            (round(v, decimals) if math.isfinite(v) else None) if isinstance(v, float) else v
+            for v in values
+        )
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value, size = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, ttl=None):
+        if not self.enabled:
+            return
+        size = _estimate_size(key) + sys.getsizeof(value) + ENTRY_OVERHEAD_BYTES
+        expires_at = time.monotonic() + (self.ttl if ttl is None else min(ttl, self.ttl))
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (expires_at, value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def entries(self):
+        # Live entries, least recently used first, as (key, value, seconds left); for snapshots
+        now = time.monotonic()
+        with self._lock:
+            return [(key, value, expires_at - now)
+                    for key, (expires_at, value, _) in self._entries.items() if expires_at > now]
+
+    def restore(self, entries, versions):
+        # Inverse of entries(), keeping only keys of the given model versions.
+        # Goes through put(), so the memory cap and eviction order still hold.
+        restored = 0
+        for key, value, ttl in entries:
+            if key[0] in versions:
+                self.put(key, value, ttl)
+                restored += 1
+        return restored
+
+    def invalidate(self):
+        # Called when the model is (re)loaded: cached scores belong to the old model
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+def _estimate_size(key):
+    return sys.getsizeof(key) + sum(sys.getsizeof(part) for part in key)
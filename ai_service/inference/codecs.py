@@ -0,0 +1,134 @@
+import json
+
+import numpy as np
+
+# Bulk request/response formats for POST /predict/bulk, chosen by Content-Type.
+#
+# Every codec decodes straight into the model's input matrix, column by column
+# or as one buffer, instead of building a WineInput per row, and answers in the
+# format it was asked in:
+#
+#   application/json                     {"type": [...], "fixed acidity": [...], ...}
+#   application/msgpack                  same map; numeric columns may also be
+#                                        raw little-endian float32 bytes
+#   application/vnd.apache.arrow.stream  one or more record batches, one column per feature
+#   application/octet-stream             raw little-endian float32 matrix, row-major,
+#                                        in feature order with the type already encoded
+#                                        (see GET /predict/bulk/layout)
+#
+# msgpack and pyarrow are optional; their formats answer 415 when missing.
+
+
+class CodecUnavailable(Exception):
+    pass
+
+
+class ColumnarJSONCodec:
+    name = "json"
+    media_type = "application/json"
+
+    def decode(self, body, vectorizer):
+        columns = json.loads(body)
+        if not isinstance(columns, dict):
+            raise ValueError("Expected an object mapping column names to arrays")
+        return vectorizer.transform_columns(columns)
+
+    def encode(self, scores, classes, model_version):
+        body = json.dumps({
+            "quality_score": scores.tolist(),
+            "quality_class": classes.tolist(),
+            "model_version": model_version,
+        })
+        return body.encode("utf-8"), {}
+
+
+class MessagePackCodec:
+    name = "msgpack"
+    media_type = "application/msgpack"
+
+    def decode(self, body, vectorizer):
+        msgpack = _import("msgpack", self.media_type)
+        columns = msgpack.unpackb(body, raw=False)
+        if not isinstance(columns, dict):
+            raise ValueError("Expected a map of column names to arrays")
+        for col, values in columns.items():
+            if isinstance(values, (bytes, bytearray)):
+                columns[col] = np.frombuffer(values, dtype="<f4")
+        return vectorizer.transform_columns(columns)
+
+    def encode(self, scores, classes, model_version):
+        msgpack = _import("msgpack", self.media_type)
+        body = msgpack.packb({
+            "quality_score": scores.tolist(),
+            "quality_class": classes.tolist(),
+            "model_version": model_version,
+        })
+        return body, {}
+
+
+class ArrowCodec:
+    name = "arrow"
+    media_type = "application/vnd.apache.arrow.stream"
+
+    def decode(self, body, vectorizer):
+        pa = _import("pyarrow", self.media_type)
+        try:
+            table = pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+        except pa.ArrowInvalid as e:
+            raise ValueError(f"Invalid Arrow IPC stream: {e}")
+        # Numeric columns without nulls come out zero-copy
+        columns = {name: table.column(name).to_numpy() for name in table.column_names}
+        return vectorizer.transform_columns(columns)
+
+    def encode(self, scores, classes, model_version):
+        pa = _import("pyarrow", self.media_type)
+        batch = pa.record_batch(
+            [pa.array(scores), pa.array(classes)],
+            schema=pa.schema(
+                [("quality_score", pa.float32()), ("quality_class", pa.int32())],
+                metadata={"model_version": model_version or ""},
+            ),
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+        return sink.getvalue().to_pybytes(), {}
+
+
+class RawFloat32Codec:
+    name = "float32"
+    media_type = "application/octet-stream"
+
+    def decode(self, body, vectorizer):
+        if len(body) % (4 * vectorizer.n_features):
+            raise ValueError(f"Body is not a whole number of rows of {vectorizer.n_features} float32 values")
+        raw = np.frombuffer(body, dtype="<f4").reshape(-1, vectorizer.n_features)
+        return vectorizer.transform_matrix(raw)
+
+    def encode(self, scores, classes, model_version):
+        # Scores only, one float32 per row; the class is the rounded score
+        headers = {"X-Model-Version": model_version} if model_version else {}
+        return scores.astype("<f4").tobytes(), headers
+
+
+CODECS = {codec.media_type: codec for codec in (
+    ColumnarJSONCodec(), MessagePackCodec(), ArrowCodec(), RawFloat32Codec(),
+)}
+
+# Other names clients commonly send for the same formats
+CODECS["application/x-msgpack"] = CODECS[MessagePackCodec.media_type]
+
+
+def codec_for(content_type):
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    codec = CODECS.get(media_type)
+    if codec is None:
+        raise CodecUnavailable(f"Unsupported Content-Type '{media_type}', expected one of {sorted(CODECS)}")
+    return codec
+
+
+def _import(module, media_type):
+    try:
+        return __import__(module)
+    except ImportError:
+        raise CodecUnavailable(f"{media_type} needs the optional '{module}' package")
@@ -0,0 +1,215 @@
+import json
+
+import numpy as np
+
+
+class CompiledForest:
+    """XGBoost tree ensemble flattened into NumPy arrays.
+
+    All trees share one set of node arrays (feature index, threshold, children,
+    default direction for missing values, leaf value). A batch walks every tree
+    at once, one tree level per step, so prediction is a handful of vectorized
+    gathers instead of a DMatrix build and a call into the booster.
+    """
+
+    def __init__(self, feature, threshold, left, right, default_left, value,
+                 roots, tree_group, base_score, max_depth):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.default_left = default_left
+        self.value = value
+        self.roots = roots
+        self.tree_group = tree_group
+        self.base_score = base_score
+        self.max_depth = max_depth
+        self.n_trees = len(roots)
+        self.n_outputs = len(base_score)
+
+        # Interleaved (left, right) children so one take() picks the next node
+        self.children = np.stack([left, right], axis=1).ravel()
+
+        # Trees are walked deepest first, so each level only touches the trees
+        # that are still descending (shallow trees drop out early). _active[l]
+        # is how many trees take part in level l.
+        depths = _tree_depths(self.children, roots, max_depth)
+        self._order = np.argsort(-depths, kind="stable")
+        self._sorted_roots = roots[self._order]
+        self._active = [int(np.count_nonzero(depths > level)) for level in range(max_depth)]
+
+        # Columns (in walk order) contributing to each output, in original tree
+        # order so accumulation matches XGBoost
+        position = np.empty(self.n_trees, dtype=np.int64)
+        position[self._order] = np.arange(self.n_trees)
+        self._group_columns = [position[np.flatnonzero(tree_group == g)] for g in range(self.n_outputs)]
+
+    # Array names used when storing a forest in the model bundle
+    ARRAY_NAMES = ("feature", "threshold", "left", "right", "default_left", "value", "roots", "tree_group")
+
+    def to_arrays(self):
+        return {name: getattr(self, name) for name in self.ARRAY_NAMES}
+
+    @classmethod
+    def from_arrays(cls, arrays, base_score, max_depth):
+        # Arrays can be read-only views into a memory-mapped bundle
+        return cls(
+            base_score=np.asarray(base_score, dtype=np.float32),
+            max_depth=max_depth,
+            **{name: arrays[name] for name in cls.ARRAY_NAMES},
+        )
+
+    @classmethod
+    def from_model(cls, model):
+        # Accepts the sklearn wrapper (XGBRegressor) or a raw Booster
+        booster = model.get_booster() if hasattr(model, "get_booster") else model
+        return cls.from_json(json.loads(booster.save_raw("json")))
+
+    @classmethod
+    def from_json(cls, model_json):
+        learner = model_json["learner"]
+        gbm = learner["gradient_booster"]
+        if gbm["name"] != "gbtree":
+            raise ValueError(f"Unsupported booster for compiled inference: {gbm['name']}")
+        if learner["objective"]["name"] not in ("reg:squarederror", "reg:quantileerror", "reg:absoluteerror"):
+            # Only identity-link objectives, so margin == prediction
+            raise ValueError(f"Unsupported objective for compiled inference: {learner['objective']['name']}")
+
+        trees = gbm["model"]["trees"]
+        features, thresholds, lefts, rights, defaults, values = [], [], [], [], [], []
+        roots = np.empty(len(trees), dtype=np.int32)
+        max_depth = 0
+        offset = 0
+        for t, tree in enumerate(trees):
+            if any(tree["split_type"]):
+                raise ValueError("Categorical splits are not supported by compiled inference")
+
+            left = np.asarray(tree["left_children"], dtype=np.int32)
+            right = np.asarray(tree["right_children"], dtype=np.int32)
+            n_nodes = len(left)
+            max_depth = max(max_depth, _tree_depth(left, right))
+            node_ids = np.arange(n_nodes, dtype=np.int32)
+            is_leaf = left == -1
+
+            # Leaves point back at themselves so extra traversal steps are no-ops
+            left = np.where(is_leaf, node_ids, left)
+            right = np.where(is_leaf, node_ids, right)
+
+            # For leaves, split_conditions holds the leaf value
+            conditions = np.asarray(tree["split_conditions"], dtype=np.float32)
+            features.append(np.where(is_leaf, 0, np.asarray(tree["split_indices"], dtype=np.int32)))
+            thresholds.append(np.where(is_leaf, np.float32(0), conditions))
+            values.append(np.where(is_leaf, conditions, np.float32(0)))
+            defaults.append(np.asarray(tree["default_left"], dtype=bool))
+            lefts.append(left + offset)
+            rights.append(right + offset)
+
+            roots[t] = offset
+            offset += n_nodes
+
+        base_score = np.atleast_1d(np.asarray(
+            json.loads(learner["learner_model_param"]["base_score"]), dtype=np.float32
+        ))
+        tree_group = np.asarray(gbm["model"]["tree_info"], dtype=np.int32)
+
+        return cls(
+            feature=np.concatenate(features).astype(np.int32),
+            threshold=np.concatenate(thresholds).astype(np.float32),
+            left=np.concatenate(lefts).astype(np.int32),
+            right=np.concatenate(rights).astype(np.int32),
+            default_left=np.concatenate(defaults),
+            value=np.concatenate(values).astype(np.float32),
+            roots=roots,
+            tree_group=tree_group,
+            base_score=base_score,
+            max_depth=max_depth,
+        )
+
+    @classmethod
+    def concat(cls, forests):
+        # One forest evaluating several models in a single pass: outputs are
+        # stacked in order (model 0's groups first), each keeping its own trees
+        # and base score, so every output is unchanged
+        node_offsets = np.cumsum([0] + [len(f.feature) for f in forests[:-1]])
+        group_offsets = np.cumsum([0] + [f.n_outputs for f in forests[:-1]])
+        return cls(
+            feature=np.concatenate([f.feature for f in forests]),
+            threshold=np.concatenate([f.threshold for f in forests]),
+            left=np.concatenate([f.left + o for f, o in zip(forests, node_offsets)]).astype(np.int32),
+            right=np.concatenate([f.right + o for f, o in zip(forests, node_offsets)]).astype(np.int32),
+            default_left=np.concatenate([f.default_left for f in forests]),
+            value=np.concatenate([f.value for f in forests]),
+            roots=np.concatenate([f.roots + o for f, o in zip(forests, node_offsets)]).astype(np.int32),
+            tree_group=np.concatenate([f.tree_group + o for f, o in zip(forests, group_offsets)]).astype(np.int32),
+            base_score=np.concatenate([f.base_score for f in forests]).astype(np.float32),
+            max_depth=max(f.max_depth for f in forests),
+        )
+
+    def predict(self, X):
+        # XGBoost compares in float32, so do the same to land on identical leaves
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        n, n_features = X.shape
+        X_flat = X.ravel()
+        row_offset = np.arange(n, dtype=np.int64) * n_features
+        has_missing = np.isnan(X_flat.sum())
+
+        # Tree-major (n_trees, n), so the still-active trees are a contiguous block
+        node = np.repeat(self._sorted_roots.astype(np.int64)[:, None], n, axis=1)
+        for active in self._active:
+            sub = node[:active]
+            x = X_flat.take(row_offset + self.feature.take(sub))
+            # NaN compares False both ways, so missing values first go right...
+            go_right = x >= self.threshold.take(sub)
+            if has_missing:
+                # ...then follow the split's default direction instead
+                missing = np.isnan(x)
+                go_right[missing] = ~self.default_left.take(sub[missing])
+            sub *= 2
+            sub += go_right
+            node[:active] = self.children.take(sub)
+
+        leaves = self.value.take(node)
+
+        # XGBoost adds tree outputs one by one onto the base score in float32.
+        # cumsum accumulates in the same order, which keeps results bit-identical.
+        out = np.empty((n, self.n_outputs), dtype=np.float32)
+        for g, columns in enumerate(self._group_columns):
+            acc = np.empty((n, len(columns) + 1), dtype=np.float32)
+            acc[:, 0] = self.base_score[g]
+            acc[:, 1:] = leaves.take(columns, axis=0).T
+            out[:, g] = np.cumsum(acc, axis=1)[:, -1]
+        return out[:, 0] if self.n_outputs == 1 else out
+
+
+def _tree_depths(children, roots, max_depth):
+    # Per-tree depth from the flattened arrays: follow every path one level at a
+    # time; leaves point back at themselves
+    pairs = children.reshape(-1, 2)
+    depths = np.zeros(len(roots), dtype=np.int64)
+    frontier = np.asarray(roots, dtype=np.int64)
+    tree = np.arange(len(roots))
+    for level in range(max_depth):
+        internal = pairs[frontier, 0] != frontier
+        frontier, tree = frontier[internal], tree[internal]
+        if not len(frontier):
+            break
+        depths[tree] = level + 1
+        frontier = pairs[frontier].ravel()
+        tree = np.repeat(tree, 2)
+    return depths
+
+
+def _tree_depth(left, right):
+    # Longest root-to-leaf path, counted in edges
+    max_depth = 0
+    stack = [(0, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if left[node] == -1:
+            max_depth = max(max_depth, depth)
+        else:
+            stack.append((left[node], depth + 1))
+            stack.append((right[node], depth + 1))
+    return max_depth
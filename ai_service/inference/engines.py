@@ -0,0 +1,187 @@
+import numpy as np
+
+from .compiled_forest import CompiledForest
+
+# Inference backends. Every engine takes scaled feature rows and returns one
+# score per row; INFERENCE_ENGINE picks one and check_parity() must pass
+# before it serves traffic (the registry falls back to "xgboost" otherwise).
+#
+# Engines are built from the model wrapper plus the loaded artifacts, which
+# carry what the other runtimes need: the pre-flattened forest, the ONNX
+# export and the LightGBM model written into the bundle by train.py.
+# lightgbm and onnxruntime are optional and imported only when selected.
+#
+# contributions() returns per-feature TreeSHAP attributions (last column: the
+# bias) for the model the engine serves. Engines that run a converted copy of
+# the XGBoost trees explain the original booster, which has the same trees.
+
+
+class XGBoostEngine:
+    # Default: the sklearn wrapper, exactly what training used for evaluation
+    name = "xgboost"
+    parity_atol = 1e-5
+
+    def __init__(self, model, artifacts=None):
+        self.model = model
+        self.threads = None
+
+    def set_threads(self, threads):
+        # OpenMP threads per predict call; the training default (n_jobs=-1)
+        # would use every core on each of several concurrent calls
+        self.model.set_params(n_jobs=threads)
+        self.threads = threads
+
+    def reference(self, X):
+        # What parity is checked against
+        return self.model.predict(X)
+
+    def predict(self, X):
+        return self.model.predict(X)
+
+    def contributions(self, X):
+        from xgboost import DMatrix
+
+        booster = self.model.get_booster() if hasattr(self.model, "get_booster") else self.model
+        return booster.predict(DMatrix(X), pred_contribs=True, validate_features=False)
+
+
+class BoosterEngine(XGBoostEngine):
+    # The raw Booster: inplace_predict on the array, no DMatrix and none of the
+    # wrapper's per-call config/validation
+    name = "booster"
+
+    def __init__(self, model, artifacts=None):
+        super().__init__(model, artifacts)
+        self.booster = model.get_booster() if hasattr(model, "get_booster") else model
+
+    def set_threads(self, threads):
+        self.booster.set_param({"nthread": threads})
+        self.threads = threads
+
+    def predict(self, X):
+        return self.booster.inplace_predict(X, validate_features=False)
+
+
+class CompiledEngine(XGBoostEngine):
+    # Trees exported to flat NumPy arrays, see compiled_forest.py
+    name = "compiled"
+
+    def __init__(self, model, artifacts=None):
+        super().__init__(model, artifacts)
+        forest = getattr(artifacts, "forest", None)
+        # A forest from the model bundle is used as-is (memory-mapped, shared)
+        self.forest = forest if forest is not None else CompiledForest.from_model(model)
+        self.threads = 1
+
+    def set_threads(self, threads):
+        # Plain NumPy on the calling thread, nothing to configure
+        pass
+
+    def predict(self, X):
+        return self.forest.predict(X)
+
+
+class ONNXEngine(XGBoostEngine):
+    # The same trees exported to ONNX (TreeEnsembleRegressor) and run by
+    # onnxruntime on CPU. ORT accumulates tree outputs in float32 in its own
+    # order, so parity is checked at a slightly looser tolerance.
+    name = "onnx"
+    parity_atol = 1e-4
+
+    def __init__(self, model, artifacts=None):
+        super().__init__(model, artifacts)
+        import onnxruntime
+
+        self._ort = onnxruntime
+        onnx_model = getattr(artifacts, "onnx_model", None)
+        if onnx_model is None:
+            # Older bundles: convert now (slow, and needs onnxmltools on the server)
+            n_features = model.get_booster().num_features()
+            onnx_model = export_onnx(model, n_features)
+        self.onnx_model = bytes(onnx_model)
+        self.set_threads(1)
+
+    def set_threads(self, threads):
+        options = self._ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        self.session = self._ort.InferenceSession(self.onnx_model, options, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+        self.threads = threads
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        return self.session.run(None, {self.input_name: X})[0].ravel()
+
+
+class LightGBMEngine:
+    # A LightGBM model trained alongside the XGBoost one (see train.py). It is
+    # a different model, so parity is checked against the predictions train.py
+    # recorded on the parity probe, i.e. the serving runtime must reproduce
+    # what training produced.
+    name = "lightgbm"
+    parity_atol = 1e-6
+
+    def __init__(self, model, artifacts=None):
+        import lightgbm
+
+        model_text = getattr(artifacts, "lightgbm_model", None)
+        self.recorded = getattr(artifacts, "lightgbm_reference", None)
+        if model_text is None or self.recorded is None:
+            raise ValueError("the model bundle has no LightGBM model (retrain with lightgbm installed)")
+        self.booster = lightgbm.Booster(model_str=model_text)
+        self.threads = 1
+
+    def set_threads(self, threads):
+        self.threads = threads
+
+    def reference(self, X):
+        return self.recorded
+
+    def predict(self, X):
+        return self.booster.predict(X, num_threads=self.threads)
+
+    def contributions(self, X):
+        return self.booster.predict(X, num_threads=self.threads, pred_contrib=True)
+
+
+ENGINES = {
+    engine.name: engine
+    for engine in (XGBoostEngine, BoosterEngine, CompiledEngine, ONNXEngine, LightGBMEngine)
+}
+
+
+def build_engine(name, model, artifacts=None):
+    if name not in ENGINES:
+        raise ValueError(f"Unknown inference engine '{name}', expected one of {sorted(ENGINES)}")
+    return ENGINES[name](model, artifacts)
+
+
+def parity_probe(n_features, n_rows=512, seed=0):
+    # Random rows in scaled feature space, including some missing values.
+    # Deterministic, so train.py can record reference outputs on the same rows.
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, n_features))
+    X[rng.random(X.shape) < 0.02] = np.nan
+    return X
+
+
+def check_parity(engine, n_features, atol=None):
+    # Compare an engine against its reference on the parity probe. Returns the
+    # max absolute difference.
+    X = parity_probe(n_features)
+    atol = engine.parity_atol if atol is None else atol
+    diff = float(np.max(np.abs(np.asarray(engine.predict(X), dtype=np.float64) - engine.reference(X))))
+    if diff > atol:
+        raise ValueError(f"Engine '{engine.name}' differs from its reference by {diff:.3g}")
+    return diff
+
+
+def export_onnx(model, n_features):
+    # XGBoost -> ONNX bytes; needs onnxmltools (training/requirements.txt only)
+    from onnxmltools import convert_xgboost
+    from onnxmltools.convert.common.data_types import FloatTensorType
+
+    onnx_model = convert_xgboost(model, initial_types=[("input", FloatTensorType([None, n_features]))],
+                                 target_opset=15)
+    return onnx_model.SerializeToString()
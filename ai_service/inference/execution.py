@@ -0,0 +1,170 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+import numpy as np
+
+# Thread budget for inference.
+#
+# Three pools can compete for the same cores: the threads that run predict
+# calls, XGBoost's OpenMP threads inside each call (n_jobs=-1 at training time
+# means "all cores", per call) and BLAS threads under NumPy/sklearn. With N
+# concurrent requests that's N x cores runnable threads, and p99 balloons.
+#
+# Here the service owns all three: a dedicated executor with a fixed number
+# of workers, an explicit per-call booster thread count and a process-wide
+# BLAS limit. calibrate() measures a few combinations under concurrent load
+# and picks the best one for the host.
+
+
+class InferenceExecutor(Executor):
+    """Fixed-size thread pool for model calls that can be resized in place.
+
+    Callers keep a reference to this object; resize() swaps the pool behind
+    it, letting work already submitted finish on the old one.
+    """
+
+    def __init__(self, workers, name="inference", nice=0):
+        self._lock = threading.Lock()
+        self.workers = workers
+        self.name = name  # thread name prefix, shows up in /debug/profile stacks
+        self.nice = nice  # > 0: background work that should yield the CPU to the other pools
+        self._pool = self._new_pool(workers)
+
+    def _new_pool(self, workers):
+        initializer = _lower_thread_priority if self.nice > 0 else None
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.name,
+                                  initializer=initializer, initargs=(self.nice,) if initializer else ())
+
+    def submit(self, fn, /, *args, **kwargs):
+        return self._pool.submit(fn, *args, **kwargs)
+
+    async def run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self, fn, *args)
+
+    def run_on_each_thread(self, fn, *args, timeout=60):
+        # Blocking: fn once on every worker thread, e.g. to set up per-thread
+        # state before traffic arrives. The barrier keeps each thread busy
+        # until all of them hold a call, so no thread runs two.
+        barrier = threading.Barrier(self.workers, timeout=timeout)
+
+        def call():
+            barrier.wait()
+            return fn(*args)
+        futures = [self.submit(call) for _ in range(self.workers)]
+        return [future.result() for future in futures]
+
+    def resize(self, workers):
+        with self._lock:
+            if workers == self.workers:
+                return
+            old, self._pool = self._pool, self._new_pool(workers)
+            self.workers = workers
+        old.shutdown(wait=False)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def _lower_thread_priority(nice):
+    # Linux schedules threads individually: setpriority on the thread id renices
+    # only this worker. Elsewhere it's a no-op.
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), nice)
+    except (AttributeError, OSError):
+        pass
+
+
+def limit_blas_threads(threads):
+    # Process-wide: BLAS/OpenMP pools are global, they can't be set per call.
+    # threadpoolctl ships with scikit-learn; without it this is a no-op.
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return None
+    return threadpool_limits(limits=threads, user_api="blas")
+
+
+def blas_info():
+    try:
+        from threadpoolctl import threadpool_info
+    except ImportError:
+        return []
+    return [
+        {"library": pool.get("internal_api"), "threads": pool.get("num_threads")}
+        for pool in threadpool_info() if pool.get("user_api") == "blas"
+    ]
+
+
+def candidate_settings(cpus):
+    # (executor workers, booster threads per call), keeping the total thread
+    # count within 2x the cores
+    workers = sorted({1, 2, max(1, cpus // 2), cpus, 2 * cpus})
+    threads = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+    return [(w, t) for w in workers for t in threads if w * t <= 2 * cpus]
+
+
+def run_load(executor, fn, clients, duration):
+    # Closed loop: `clients` threads each submit fn and wait for it, like
+    # concurrent requests would. Returns per-call latencies (queueing included).
+    latencies = [[] for _ in range(clients)]
+    deadline = time.perf_counter() + duration
+
+    def client(out):
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            executor.submit(fn).result()
+            out.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(out,)) for out in latencies]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return np.concatenate([np.asarray(out) for out in latencies])
+
+
+def calibrate(registry, executor, duration=0.3, clients=None, candidates=None):
+    """Try each (workers, booster threads) setting under concurrent single-row load.
+
+    Runs against the active version before traffic is served. Picks the
+    lowest p99 among settings within 10% of the best throughput, applies it
+    to the executor and the registry, and returns a report.
+    """
+    version = registry.active
+    cpus = os.cpu_count() or 1
+    clients = clients or 2 * cpus
+    candidates = candidates or candidate_settings(cpus)
+    wine = version.example_wine()
+
+    results = []
+    for workers, threads in candidates:
+        executor.resize(workers)
+        registry.set_booster_threads(threads)
+        run_load(executor, lambda: version.predict_one(wine), clients, duration / 5)  # warm up
+        latencies = run_load(executor, lambda: version.predict_one(wine), clients, duration)
+        results.append({
+            "workers": workers,
+            "booster_threads": threads,
+            "requests_per_s": round(len(latencies) / duration, 1),
+            "p50_ms": round(float(np.percentile(latencies, 50)) * 1000, 3),
+            "p99_ms": round(float(np.percentile(latencies, 99)) * 1000, 3),
+        })
+
+    best_throughput = max(r["requests_per_s"] for r in results)
+    best = min((r for r in results if r["requests_per_s"] >= 0.9 * best_throughput), key=lambda r: r["p99_ms"])
+    executor.resize(best["workers"])
+    registry.set_booster_threads(best["booster_threads"])
+    return {"cpus": cpus, "clients": clients, "duration_s": duration, "chosen": best, "results": results}
+
+
+def format_report(report):
+    lines = [f"Thread calibration ({report['cpus']} CPUs, {report['clients']} concurrent clients):",
+             f"  {'workers':>7} {'threads':>7} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9}"]
+    for r in report["results"]:
+        marker = "  <- chosen" if r is report["chosen"] else ""
+        lines.append(f"  {r['workers']:>7} {r['booster_threads']:>7} {r['requests_per_s']:>10} "
+                     f"{r['p50_ms']:>9} {r['p99_ms']:>9}{marker}")
+    return "\n".join(lines)
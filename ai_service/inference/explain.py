@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import numpy as np
+
+from .admission import AdmissionController, AdmissionRejected
+from .cache import PredictionCache
+from .execution import InferenceExecutor
+from .metrics import STAGE_LATENCY, BATCH_SIZE, muted, now
+
+# Feature attributions (TreeSHAP) for /explain.
+#
+# Explanations never run on the scoring path: they have their own executor
+# and their own admission control, so a burst of explain requests cannot
+# delay /predict. Rows are explained in vectorized chunks, one
+# pred_contribs call per chunk. A product explanation is a single row in the
+# live lane; a batch explanation is split into chunks in the bulk lane, and
+# each chunk gives the worker back between calls, so a product request
+# waits at most one chunk behind a running batch.
+#
+# calibrate() measures the worker's rows/s at startup and sizes the chunks to
+# about `chunk_seconds` each. That rate is what a batch explanation gets and
+# what /explain/stats reports; a request with a deadline that the misses
+# cannot meet at that rate is rejected up front instead of half-done.
+# Attributions are cached by model version and
+# canonical input vector, the same key as cached predictions.
+
+
+class Explainer:
+    def __init__(self, workers=1, chunk_seconds=0.05, max_rows=5000, cache_bytes=0, cache_ttl=300,
+                 decimals=6, live_queue=64, bulk_queue=4):
+        self.executor = InferenceExecutor(workers, name="explain")
+        self.admission = AdmissionController(workers, {"live": live_queue, "bulk": bulk_queue})
+        self.cache = PredictionCache(cache_bytes, cache_ttl)
+        self.chunk_seconds = chunk_seconds
+        self.max_rows = max_rows
+        self.decimals = decimals
+
+        self.chunk_rows = 256  # until calibrated
+        self.rows_per_second = None
+        self.rows = 0
+        self.calls = 0
+        self.busy_seconds = 0.0
+
+    def calibrate(self, version, rows=256):
+        # Blocking: time one full chunk on this host and size chunks from it
+        wines = [version.example_wine()] * rows
+        with muted():
+            X = version.transform_wines(wines)
+        version.engine.contributions(X[:1])  # warm up
+        start = time.perf_counter()
+        version.engine.contributions(X)
+        self.rows_per_second = rows / (time.perf_counter() - start)
+        self.chunk_rows = max(1, int(self.rows_per_second * self.chunk_seconds))
+        return self.rows_per_second
+
+    def state(self, version):
+        return {"model_version": version.version_id, "rows_per_second": self.rows_per_second}
+
+    def restore(self, state, version):
+        # A snapshot's calibration holds for the same model on the same host
+        if state.get("model_version") != version.version_id or not state.get("rows_per_second"):
+            return False
+        self.rows_per_second = state["rows_per_second"]
+        self.chunk_rows = max(1, int(self.rows_per_second * self.chunk_seconds))
+        return True
+
+    async def explain(self, version, wines, lane, deadline=None):
+        # -> one attribution row (n_features + bias) per wine, and the number of cache hits
+        results = [None] * len(wines)
+        keys = [None] * len(wines)
+        misses = []
+        for i, wine in enumerate(wines):
+            if self.cache.enabled:
+                keys[i] = version.cache_key(wine, self.decimals)
+                results[i] = self.cache.get(keys[i])
+            if results[i] is None:
+                misses.append(i)
+
+        if deadline is not None and misses and self.rows_per_second:
+            needed = len(misses) / (self.rows_per_second * self.executor.workers)
+            if asyncio.get_running_loop().time() + needed > deadline:
+                raise AdmissionRejected(504, f"{len(misses)} rows need about {needed:.1f}s to explain, past the deadline")
+
+        for start in range(0, len(misses), self.chunk_rows):
+            chunk = misses[start:start + self.chunk_rows]
+            async with self.admission.slot(lane, deadline):
+                rows = await self.executor.run(self._compute, version, [wines[i] for i in chunk])
+            for i, row in zip(chunk, rows):
+                results[i] = row
+                if keys[i] is not None:
+                    self.cache.put(keys[i], row)
+        return results, len(wines) - len(misses)
+
+    def _compute(self, version, wines):
+        start = now()
+        X = version.transform_wines(wines)
+        contributions = np.asarray(version.engine.contributions(X), dtype=np.float32)
+        elapsed = now() - start
+        STAGE_LATENCY.observe(elapsed, "explain")
+        BATCH_SIZE.observe(len(wines), "explain")
+        self.rows += len(wines)
+        self.calls += 1
+        self.busy_seconds += elapsed
+        # Own copies, so cached rows don't pin the whole chunk
+        return [row.copy() for row in contributions]
+
+    def stats(self):
+        return {
+            "workers": self.executor.workers,
+            "rows_per_second": self.rows_per_second,
+            "chunk_rows": self.chunk_rows,
+            "max_rows": self.max_rows,
+            "rows": self.rows,
+            "calls": self.calls,
+            "busy_seconds": self.busy_seconds,
+            "admission": self.admission.stats(),
+            "cache": self.cache.stats(),
+        }
@@ -0,0 +1,299 @@
+import argparse
+import asyncio
+import hmac
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import httpx
+import uvicorn
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
+
+from .routing import ReplicaSet, shard_key
+
+# Sharding gateway in front of several inference replicas (see routing.py):
+#   GATEWAY_REPLICAS=http://127.0.0.1:8001,http://127.0.0.1:8002 \
+#       uvicorn ai_service.inference.gateway:app --port 8000
+#
+# or, to try it on one machine, start the replicas and the gateway together:
+#   python -m ai_service.inference.gateway --spawn 3 --port 8000
+#
+# Requests are forwarded unchanged to the replica that owns their warehouse:
+# the X-Warehouse-Id header when present, otherwise "warehouse_id" (and
+# "line_id" with GATEWAY_SHARD_BY=line) in a JSON body. Each warehouse
+# always lands on the same replica, so that replica's prediction cache and
+# warehouse model stay warm; requests without a warehouse go round robin.
+# Sharding by line spreads a big warehouse over several replicas, at the
+# cost of each of them loading its model.
+#
+# Replicas are polled on GET /ready every GATEWAY_HEALTH_INTERVAL_MS. A replica
+# that fails GATEWAY_HEALTH_FALL checks or forwarded requests in a row
+# leaves the ring and its warehouses move to the next
+# replica clockwise; the others keep theirs. When a replica (re)joins, the
+# gateway loads the models of the recently seen warehouses it now owns
+# before they arrive. Connection errors and timeouts are retried once on the
+# next replica.
+#
+# /gateway/replicas shows health, ring shares and recent rebalances;
+# replicas can be added and removed there at runtime with
+# "Authorization: Bearer <GATEWAY_ADMIN_TOKEN>" (disabled without a token).
+# WebSockets and the replicas' own admin endpoints (models, shadow,
+# snapshot, warehouses, debug) are not proxied: they act on one replica, so
+# call it directly.
+
+GATEWAY_REPLICAS = [url for url in os.environ.get("GATEWAY_REPLICAS", "").split(",") if url.strip()]
+GATEWAY_SHARD_BY = os.environ.get("GATEWAY_SHARD_BY", "warehouse")  # or "line"
+GATEWAY_VNODES = int(os.environ.get("GATEWAY_VNODES", "128"))
+GATEWAY_ATTEMPTS = int(os.environ.get("GATEWAY_ATTEMPTS", "2"))
+GATEWAY_TIMEOUT_S = float(os.environ.get("GATEWAY_TIMEOUT_S", "30"))
+GATEWAY_HEALTH_INTERVAL_MS = float(os.environ.get("GATEWAY_HEALTH_INTERVAL_MS", "1000"))
+GATEWAY_HEALTH_TIMEOUT_MS = float(os.environ.get("GATEWAY_HEALTH_TIMEOUT_MS", "500"))
+GATEWAY_HEALTH_FALL = int(os.environ.get("GATEWAY_HEALTH_FALL", "2"))
+GATEWAY_HEALTH_RISE = int(os.environ.get("GATEWAY_HEALTH_RISE", "2"))
+# Recently seen warehouses, remembered to warm up replicas that join
+GATEWAY_WARM_WAREHOUSES = int(os.environ.get("GATEWAY_WARM_WAREHOUSES", "1024"))
+GATEWAY_ADMIN_TOKEN = os.environ.get("GATEWAY_ADMIN_TOKEN") or None
+
+# Not forwarded: per-connection headers and the ones httpx sets itself
+HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "te", "upgrade", "proxy-connection",
+               "host", "content-length", "content-encoding"}
+# First path segments never forwarded to a replica
+ADMIN_PATHS = {"gateway", "models", "shadow", "snapshot", "warehouses", "debug"}
+
+replicas = ReplicaSet(GATEWAY_REPLICAS, GATEWAY_VNODES, GATEWAY_HEALTH_FALL, GATEWAY_HEALTH_RISE)
+client = None
+health_task = None
+seen_warehouses = {}  # shard key -> warehouse id, oldest first
+warm_tasks = set()
+
+
+async def check_replica(url):
+    start = time.perf_counter()
+    try:
+        # 200 only once the replica's model is loaded and warmed up
+        response = await client.get(url + "/ready", timeout=GATEWAY_HEALTH_TIMEOUT_MS / 1000)
+        body = response.json()
+        ok = response.status_code == 200
+        error = None if ok else f"HTTP {response.status_code}, phase={body.get('phase')}"
+        replicas.record_check(url, ok, time.perf_counter() - start, body.get("model_version"), error)
+    except (httpx.HTTPError, ValueError) as e:
+        replicas.record_check(url, False, error=f"{type(e).__name__}: {e}")
+
+
+async def check_all():
+    await asyncio.gather(*(check_replica(url) for url in list(replicas.replicas)))
+
+
+async def run_health_checks():
+    while True:
+        await asyncio.sleep(GATEWAY_HEALTH_INTERVAL_MS / 1000)
+        await check_all()
+
+
+def schedule_warmup(url):
+    # Called from the ring when a replica joins: load the models of the
+    # warehouses it takes over. The layout call resolves (and loads) the
+    # warehouse model without scoring anything.
+    owned = {warehouse_id for key, warehouse_id in seen_warehouses.items() if replicas.owns(url, key)}
+    if not owned or client is None:
+        return
+    task = asyncio.get_running_loop().create_task(warm_up(url, owned))
+    warm_tasks.add(task)
+    task.add_done_callback(warm_tasks.discard)
+
+
+async def warm_up(url, warehouse_ids):
+    for warehouse_id in warehouse_ids:
+        try:
+            await client.get(url + "/predict/bulk/layout", headers={"X-Warehouse-Id": str(warehouse_id)})
+        except httpx.HTTPError:
+            return
+
+
+replicas.on_join.append(schedule_warmup)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global client, health_task
+    client = httpx.AsyncClient(timeout=GATEWAY_TIMEOUT_S, limits=httpx.Limits(max_keepalive_connections=64))
+    await check_all()
+    print(f"Gateway: {len(replicas.ring.nodes)}/{len(replicas.replicas)} replicas healthy, sharding by {GATEWAY_SHARD_BY}")
+    health_task = asyncio.create_task(run_health_checks())
+
+    yield
+
+    health_task.cancel()
+    for task in list(warm_tasks):
+        task.cancel()
+    await client.aclose()
+    client = None
+
+
+app = FastAPI(title="Wine Quality Prediction Gateway", lifespan=lifespan)
+
+
+def request_key(request: Request, body: bytes):
+    warehouse_id = request.headers.get("x-warehouse-id")
+    line_id = request.headers.get("x-line-id")
+    if warehouse_id is None and body[:1] == b"{":
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            payload = None
+        if isinstance(payload, dict):
+            warehouse_id = payload.get("warehouse_id")
+            line_id = payload.get("line_id")
+    if warehouse_id is None:
+        return None, None
+    return shard_key(warehouse_id, line_id if GATEWAY_SHARD_BY == "line" else None), warehouse_id
+
+
+def remember(key, warehouse_id):
+    seen_warehouses.pop(key, None)
+    seen_warehouses[key] = warehouse_id
+    if len(seen_warehouses) > GATEWAY_WARM_WAREHOUSES:
+        del seen_warehouses[next(iter(seen_warehouses))]
+
+
+@app.get("/")
+def health_check():
+    healthy = len(replicas.ring.nodes)
+    return {
+        "status": "running" if healthy else "degraded",
+        "model_loaded": healthy > 0,
+        "gateway": True,
+        "replicas_healthy": healthy,
+        "replicas_total": len(replicas.replicas),
+    }
+
+
+@app.get("/ready")
+def readiness_check():
+    # Ready while at least one replica is (not forwarded: each replica has its own)
+    healthy = len(replicas.ring.nodes)
+    return JSONResponse({"ready": healthy > 0, "replicas_healthy": healthy}, status_code=200 if healthy else 503)
+
+
+@app.get("/gateway/replicas")
+def replica_stats():
+    return {"shard_by": GATEWAY_SHARD_BY, **replicas.stats()}
+
+
+def require_admin_token(authorization: Optional[str] = Header(None)):
+    if GATEWAY_ADMIN_TOKEN is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), GATEWAY_ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token", headers={"WWW-Authenticate": "Bearer"})
+
+
+@app.post("/gateway/replicas", status_code=201, dependencies=[Depends(require_admin_token)])
+async def add_replica(url: str = Query(...)):
+    replicas.add(url)
+    await check_replica(url.rstrip("/"))
+    return replicas.replicas[url.rstrip("/")].stats()
+
+
+@app.delete("/gateway/replicas", dependencies=[Depends(require_admin_token)])
+def remove_replica(url: str = Query(...)):
+    replica = replicas.remove(url)
+    if replica is None:
+        raise HTTPException(status_code=404, detail=f"Unknown replica '{url}'")
+    return replica.stats()
+
+
+@app.get("/gateway/route")
+def route(warehouse_id: str = Query(...), line_id: Optional[str] = Query(None)):
+    key = shard_key(warehouse_id, line_id if GATEWAY_SHARD_BY == "line" else None)
+    return {"key": key, "replicas": replicas.route(key, len(replicas.ring.nodes))}
+
+
+@app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE"])
+async def forward(path: str, request: Request):
+    if path.split("/", 1)[0] in ADMIN_PATHS:
+        raise HTTPException(status_code=404, detail="Not Found")
+    body = await request.body()
+    key, warehouse_id = request_key(request, body)
+    if key is not None:
+        remember(key, warehouse_id)
+    headers = [(name, value) for name, value in request.headers.items() if name not in HOP_HEADERS]
+
+    targets = replicas.route(key, GATEWAY_ATTEMPTS)
+    if not targets:
+        raise HTTPException(status_code=503, detail="No healthy inference replica")
+    attempted = []
+    for url in targets:
+        replica = replicas.replicas.get(url)
+        if replica is None:
+            # Removed since it was routed to: try the next one
+            continue
+        attempted.append(url)
+        replica.requests += 1
+        try:
+            upstream = await client.request(request.method, f"{url}/{path}", params=request.query_params,
+                                            headers=headers, content=body)
+        except httpx.TransportError as e:
+            # Down or stuck: count it towards taking the replica off the ring and try the next one
+            replica.errors += 1
+            replicas.record_failure(url, f"{type(e).__name__}: {e}")
+            continue
+        response_headers = {name: value for name, value in upstream.headers.items() if name not in HOP_HEADERS}
+        response_headers["X-Replica"] = url
+        return Response(upstream.content, status_code=upstream.status_code, headers=response_headers)
+    if not attempted:
+        raise HTTPException(status_code=503, detail="No healthy inference replica")
+    raise HTTPException(status_code=502, detail=f"Inference replicas unavailable: {', '.join(attempted)}")
+
+
+def spawn_replicas(count, base_port, host, snapshot_dir=None):
+    processes = []
+    for i in range(count):
+        port = base_port + i
+        env = dict(os.environ)
+        if snapshot_dir:
+            # One state snapshot per replica, so each restarts with its own shard warm
+            env["SNAPSHOT_PATH"] = os.path.join(snapshot_dir, f"replica-{port}.wqs")
+        processes.append(subprocess.Popen([
+            sys.executable, "-m", "uvicorn", "ai_service.inference.main:app",
+            "--host", host, "--port", str(port), "--log-level", "warning",
+        ], env=env))
+    return processes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sharding gateway for inference replicas')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--replicas', nargs='*', default=[], help='Replica URLs (default: GATEWAY_REPLICAS)')
+    parser.add_argument('--spawn', type=int, default=0, help='Start this many local replicas first')
+    parser.add_argument('--base-port', type=int, default=8001, help='Port of the first spawned replica')
+    parser.add_argument('--snapshot-dir', help='Private directory (created 0700) for the spawned replicas\' '
+                        'state snapshots (default: no snapshots)')
+    args = parser.parse_args()
+
+    processes = spawn_replicas(args.spawn, args.base_port, args.host, args.snapshot_dir)
+    for url in args.replicas + [f"http://{args.host}:{args.base_port + i}" for i in range(args.spawn)]:
+        replicas.add(url)
+    if not replicas.replicas:
+        raise SystemExit("No replicas: pass --replicas, --spawn or set GATEWAY_REPLICAS")
+    # uvicorn re-raises SIGTERM after its shutdown; exit through the finally below
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        # Spawned replicas come up while the gateway runs and join on their first good check
+        uvicorn.run(app, host=args.host, port=args.port)
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
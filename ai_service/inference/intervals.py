@@ -0,0 +1,78 @@
+from statistics import NormalDist
+
+import numpy as np
+
+from .compiled_forest import CompiledForest
+from .engines import CompiledEngine, parity_probe
+
+# Prediction intervals from quantile heads.
+#
+# train.py fits one multi-output XGBoost model on the 10% and 90% quantiles
+# (reg:quantileerror) next to the point model; the bundle stores it as a
+# compiled forest. With the compiled engine the point trees and both heads
+# are concatenated into one forest, so a request walks all of them in the
+# same pass. With any other engine the heads run as a second, much smaller
+# forest after the point prediction.
+#
+# `confidence` is the probability that the true quality falls in the
+# predicted class, i.e. within 0.5 of the rounded score, assuming a normal
+# error centred on the point score with the spread implied by the interval.
+
+INTERVAL_QUANTILES = (0.1, 0.9)
+
+
+class IntervalHeads:
+    parity_atol = 1e-5
+
+    def __init__(self, forest, quantiles, reference_model=None, point_engine=None):
+        if forest.n_outputs != 2:
+            raise ValueError(f"Expected 2 quantile outputs, got {forest.n_outputs}")
+        self.forest = forest
+        self.quantiles = tuple(float(q) for q in quantiles)
+        self.reference_model = reference_model
+        z_low, z_high = (NormalDist().inv_cdf(q) for q in self.quantiles)
+        self.z_width = z_high - z_low
+
+        # Point trees first, so output 0 is the point score and 1-2 the bounds
+        self.fused = None
+        if isinstance(point_engine, CompiledEngine):
+            self.fused = CompiledForest.concat([point_engine.forest, forest])
+
+    @property
+    def mode(self):
+        return "fused" if self.fused is not None else "separate"
+
+    def check_parity(self, n_features, point_engine):
+        # The heads must reproduce the quantile model, and fusing must leave the point score alone
+        X = parity_probe(n_features)
+        diff = 0.0
+        if self.reference_model is not None:
+            expected = self.reference_model.predict(X)
+            diff = float(np.max(np.abs(self.forest.predict(X) - expected)))
+        if self.fused is not None:
+            fused = self.fused.predict(X)
+            diff = max(diff, float(np.max(np.abs(fused[:, 0] - point_engine.predict(X)))),
+                       float(np.max(np.abs(fused[:, 1:] - self.forest.predict(X)))))
+        if diff > self.parity_atol:
+            raise ValueError(f"Quantile heads differ from their reference by {diff:.3g}")
+        return diff
+
+    def predict(self, X, point_engine):
+        # -> (point scores, lower bounds, upper bounds)
+        if self.fused is not None:
+            out = self.fused.predict(X)
+            point, bounds = out[:, 0], out[:, 1:]
+        else:
+            point = np.asarray(point_engine.predict(X), dtype=np.float32)
+            bounds = self.forest.predict(X).reshape(-1, 2)
+        # Separately trained quantiles can cross on odd inputs
+        bounds = np.sort(bounds, axis=1)
+        return point, bounds[:, 0], bounds[:, 1]
+
+    def confidence(self, point, lower, upper):
+        # Imported here: scipy only matters for models with quantile heads
+        from scipy.special import ndtr
+        point = np.asarray(point, dtype=np.float64)
+        sigma = np.maximum((np.asarray(upper, dtype=np.float64) - lower) / self.z_width, 1e-6)
+        quality_class = np.rint(point)
+        return ndtr((quality_class + 0.5 - point) / sigma) - ndtr((quality_class - 0.5 - point) / sigma)
@@ -1,95 +1,1097 @@
-import pandas as pd
-import numpy as np
-import joblib
+import time
+IMPORT_STARTED = time.perf_counter()  # module import time is part of the startup reported by /ready
 import os
-from fastapi import FastAPI, HTTPException
-from contextlib import asynccontextmanager
-from .schemas import WineInput, PredictionOutput
-
-# Global variables to hold artifacts
-model = None
-scaler = None
-label_encoders = None
-imputation_values = None
-feature_names = None
+import json
+import struct
+import hmac
+import asyncio
+import numpy as np
+from fastapi import Depends, FastAPI, HTTPException, Header, Query, Request, Response, WebSocket
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager, contextmanager
+from typing import Optional
+from pydantic import ValidationError
+from .schemas import (
+    WineInput, PredictionOutput, BatchWineInput, BatchPredictionOutput, LoadModelInput,
+    ExplainInput, ExplainBatchInput, ExplanationOutput, BatchExplanationOutput,
+)
+from .admission import AdmissionController, AdmissionRejected
+from .batching import MicroBatcher
+from .codecs import CodecUnavailable, codec_for
+from .explain import Explainer
+from .execution import InferenceExecutor, limit_blas_threads, blas_info, calibrate, format_report
+from .predictor import Predictor, ModelNotLoaded
+from .registry import WARMUP_BATCH_SIZES as DEFAULT_WARMUP_BATCH_SIZES
+from .profiler import SamplingProfiler, ProfilerBusy
+from .metrics import METRICS, MetricsMiddleware, STAGE_LATENCY, BATCH_SIZE, now
+from .uds import FrameServer, bind_unix_socket
+from .shadow import ShadowScorer
+from .snapshot import ensure_private_dir, read_snapshot, write_snapshot
+from .streaming import StreamPipeline, NDJSONStreamResponse, serve_websocket, validate_items, invalid_input
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ARTIFACTS_DIR = os.path.join(BASE_DIR, "../artifacts")
 
+# Extra model versions live in <MODEL_VERSIONS_DIR>/<version_id>/ (bundle or legacy files)
+MODEL_VERSIONS_DIR = os.environ.get("MODEL_VERSIONS_DIR", os.path.join(ARTIFACTS_DIR, "versions"))
+
+# Warehouse-specific models live in <WAREHOUSE_MODELS_DIR>/<warehouse_id>/ and are
+# loaded on first use; at most WAREHOUSE_MODELS_MAX_BYTES of them stay resident
+# (least recently used evicted first). Failed loads are retried after
+# WAREHOUSE_RETRY_SECONDS; until then that warehouse uses the global model.
+WAREHOUSE_MODELS_DIR = os.environ.get("WAREHOUSE_MODELS_DIR", os.path.join(ARTIFACTS_DIR, "warehouses"))
+WAREHOUSE_MODELS_MAX_BYTES = int(os.environ.get("WAREHOUSE_MODELS_MAX_BYTES", str(256 * 1024 * 1024)))
+WAREHOUSE_RETRY_SECONDS = float(os.environ.get("WAREHOUSE_RETRY_SECONDS", "60"))
+
+# Id for the startup model; defaults to the bundle version / content hash
+MODEL_VERSION = os.environ.get("MODEL_VERSION") or None
+
+# Upper bound on the number of wines accepted by /predict_batch
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "1024"))
+
+# Upper bound on the rows accepted by /predict/bulk (columnar / binary formats)
+BULK_MAX_ROWS = int(os.environ.get("BULK_MAX_ROWS", "100000"))
+
+# Inference backend (engines.py): "xgboost" (sklearn wrapper), "booster" (Booster.inplace_predict),
+# "compiled" (NumPy arrays), "onnx" (onnxruntime) or "lightgbm" (the bundle's LightGBM model)
+INFERENCE_ENGINE = os.environ.get("INFERENCE_ENGINE", "xgboost")
+
+# Micro-batching of concurrent /predict calls (off unless MICRO_BATCHING=1)
+MICRO_BATCHING = os.environ.get("MICRO_BATCHING", "0") == "1"
+MICRO_BATCH_MAX_SIZE = int(os.environ.get("MICRO_BATCH_MAX_SIZE", "64"))
+MICRO_BATCH_MAX_WAIT_MS = float(os.environ.get("MICRO_BATCH_MAX_WAIT_MS", "2"))
+
+# Prediction cache (CACHE_MAX_BYTES=0 disables it)
+CACHE_MAX_BYTES = int(os.environ.get("CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+CACHE_TTL_SECONDS = float(os.environ.get("CACHE_TTL_SECONDS", "300"))
+CACHE_DECIMALS = int(os.environ.get("CACHE_DECIMALS", "6"))
+
+# Streaming endpoints: readings buffered per stream, readings scored per batch, max NDJSON line size
+STREAM_BUFFER_SIZE = int(os.environ.get("STREAM_BUFFER_SIZE", "256"))
+STREAM_MAX_BATCH = int(os.environ.get("STREAM_MAX_BATCH", "64"))
+STREAM_MAX_LINE_BYTES = int(os.environ.get("STREAM_MAX_LINE_BYTES", "65536"))
+
+# Thread budget: executor threads running model calls, OpenMP threads per booster
+# call, process-wide BLAS threads. THREAD_CALIBRATION=1 measures the options at
+# startup and keeps the best (see execution.py).
+INFERENCE_WORKERS = int(os.environ.get("INFERENCE_WORKERS", str(os.cpu_count() or 1)))
+BOOSTER_THREADS = int(os.environ.get("BOOSTER_THREADS", "1"))
+BLAS_THREADS = int(os.environ.get("BLAS_THREADS", "1"))
+THREAD_CALIBRATION = os.environ.get("THREAD_CALIBRATION", "0") == "1"
+THREAD_CALIBRATION_SECONDS = float(os.environ.get("THREAD_CALIBRATION_SECONDS", "0.3"))
+
+# Admission control: execution slots (0 = executor workers; micro-batched
+# /predict requests share a slot MICRO_BATCH_MAX_SIZE ways), the slots bulk
+# work (batches, bulk formats, streams) may hold at once (0 = half of them, at
+# least one), waiting requests per priority lane before shedding with 429,
+# and the default deadline for live requests without an X-Deadline-Ms header
+# (0 = none)
+ADMISSION_CONCURRENCY = int(os.environ.get("ADMISSION_CONCURRENCY", "0"))
+BULK_CONCURRENCY = int(os.environ.get("BULK_CONCURRENCY", "0"))
+LIVE_QUEUE_SIZE = int(os.environ.get("LIVE_QUEUE_SIZE", "256"))
+BULK_QUEUE_SIZE = int(os.environ.get("BULK_QUEUE_SIZE", "16"))
+LIVE_DEADLINE_MS = float(os.environ.get("LIVE_DEADLINE_MS", "0"))
+
+# /debug/profile and the admin routes (loading/activating/unloading models,
+# shadowing, snapshots, evicting warehouse models) need
+# "Authorization: Bearer <DEBUG_TOKEN>"; without a token they are disabled
+DEBUG_TOKEN = os.environ.get("DEBUG_TOKEN") or None
+PROFILE_MAX_SECONDS = float(os.environ.get("PROFILE_MAX_SECONDS", "60"))
+
+# Explanations (TreeSHAP, see explain.py): worker threads, target seconds per
+# vectorized chunk, max rows per batch explanation, attribution cache size and
+# waiting product/batch requests before shedding with 429
+EXPLAIN_WORKERS = int(os.environ.get("EXPLAIN_WORKERS", "1"))
+EXPLAIN_CHUNK_MS = float(os.environ.get("EXPLAIN_CHUNK_MS", "50"))
+EXPLAIN_MAX_ROWS = int(os.environ.get("EXPLAIN_MAX_ROWS", "5000"))
+EXPLAIN_CACHE_MAX_BYTES = int(os.environ.get("EXPLAIN_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+EXPLAIN_LIVE_QUEUE_SIZE = int(os.environ.get("EXPLAIN_LIVE_QUEUE_SIZE", "64"))
+EXPLAIN_BULK_QUEUE_SIZE = int(os.environ.get("EXPLAIN_BULK_QUEUE_SIZE", "4"))
+
+# Unix domain socket transport (see uds.py), off unless UDS_PATH is set; frames
+# larger than UDS_MAX_FRAME_BYTES close the connection
+UDS_PATH = os.environ.get("UDS_PATH") or None
+UDS_MAX_FRAME_BYTES = int(os.environ.get("UDS_MAX_FRAME_BYTES", str(64 * 1024 * 1024)))
+
+# Warm state snapshot (see snapshot.py): written every SNAPSHOT_INTERVAL_S and
+# on shutdown, restored on startup. Off unless SNAPSHOT_PATH is set; its
+# directory must be private to the service user (created 0700 if missing),
+# e.g. SNAPSHOT_PATH=/var/lib/wine-inference/state.wqs
+SNAPSHOT_PATH = os.environ.get("SNAPSHOT_PATH") or None
+SNAPSHOT_INTERVAL_S = float(os.environ.get("SNAPSHOT_INTERVAL_S", "60"))
+
+# Shadow scoring (see shadow.py): SHADOW_VERSIONS lists candidate versions
+# (from MODEL_VERSIONS_DIR) scored on a sample of live traffic after the live
+# answer is sent; PUT/DELETE /shadow/{version_id} changes the set at runtime
+SHADOW_VERSIONS = [v.strip() for v in os.environ.get("SHADOW_VERSIONS", "").split(",") if v.strip()]
+SHADOW_SAMPLE_RATE = float(os.environ.get("SHADOW_SAMPLE_RATE", "0.05"))
+SHADOW_WORKERS = int(os.environ.get("SHADOW_WORKERS", "1"))
+SHADOW_MAX_BATCH = int(os.environ.get("SHADOW_MAX_BATCH", "256"))
+SHADOW_MAX_WAIT_MS = float(os.environ.get("SHADOW_MAX_WAIT_MS", "500"))
+SHADOW_MAX_QUEUE = int(os.environ.get("SHADOW_MAX_QUEUE", "4096"))
+SHADOW_NICE = int(os.environ.get("SHADOW_NICE", "10"))
+
+# Check bundle array checksums on load (BUNDLE_VERIFY=0 skips it for the fastest start)
+BUNDLE_VERIFY = os.environ.get("BUNDLE_VERIFY", "1") == "1"
+
+# Startup warmup: synthetic predictions at these batch sizes (plus the
+# micro-batch and stream batch sizes) on every inference thread, for every
+# loaded model, before GET /ready turns green. WARMUP_BATCH_SIZES= skips it.
+WARMUP_BATCH_SIZES = [int(v) for v in os.environ.get(
+    "WARMUP_BATCH_SIZES", ",".join(map(str, DEFAULT_WARMUP_BATCH_SIZES))).split(",") if v.strip()]
+
+# Global serving state: the models and prediction cache live in the Predictor
+# (predictor.py); this module adds HTTP, admission, batching and executors
+predictor = Predictor(
+    MODEL_VERSIONS_DIR, INFERENCE_ENGINE, verify=BUNDLE_VERIFY, booster_threads=BOOSTER_THREADS,
+    cache_max_bytes=CACHE_MAX_BYTES, cache_ttl=CACHE_TTL_SECONDS, cache_decimals=CACHE_DECIMALS,
+    warehouses_dir=WAREHOUSE_MODELS_DIR, warehouse_max_bytes=WAREHOUSE_MODELS_MAX_BYTES,
+    warehouse_retry_seconds=WAREHOUSE_RETRY_SECONDS)
+registry, cache, warehouses = predictor.registry, predictor.cache, predictor.warehouses
+executor = InferenceExecutor(INFERENCE_WORKERS)
+batcher = None
+uds_server = None
+uds_listener = None  # pre-bound by the pre-fork master, shared by its workers
+calibration_report = None
+snapshot_task = None
+snapshot_info = {"last_save": None, "restore": None, "error": None}
+explain_calibration_task = None
+# Reported by GET /ready: phase timings in ms, from module import to ready
+readiness = {"ready": False, "phase": "starting", "import_ms": None, "phases": {}, "warmup": None,
+             "startup_ms": None, "since_import_ms": None, "ready_at": None, "background": {}, "error": None}
+profiler = SamplingProfiler()
+admission = AdmissionController(
+    ADMISSION_CONCURRENCY or INFERENCE_WORKERS, {"live": LIVE_QUEUE_SIZE, "bulk": BULK_QUEUE_SIZE})
+explainer = Explainer(
+    EXPLAIN_WORKERS, EXPLAIN_CHUNK_MS / 1000, EXPLAIN_MAX_ROWS, EXPLAIN_CACHE_MAX_BYTES, CACHE_TTL_SECONDS,
+    CACHE_DECIMALS, EXPLAIN_LIVE_QUEUE_SIZE, EXPLAIN_BULK_QUEUE_SIZE)
+
+shadow = ShadowScorer(
+    registry, SHADOW_WORKERS, SHADOW_SAMPLE_RATE, SHADOW_MAX_BATCH, SHADOW_MAX_WAIT_MS / 1000, SHADOW_MAX_QUEUE,
+    SHADOW_NICE, busy=lambda: admission.waiting("live") > 0)
+
+def load_artifacts():
+    abs_artifacts_dir = os.path.abspath(ARTIFACTS_DIR)
+    print(f"Loading AI models and artifacts from: {abs_artifacts_dir}")
+    
+    if not os.path.exists(abs_artifacts_dir):
+         print(f"ERROR: Artifacts directory not found at {abs_artifacts_dir}")
+
+    # Single-file bundle if present, otherwise the legacy five joblib files
+    return predictor.load(abs_artifacts_dir, MODEL_VERSION)
+
+def save_state():
+    # Blocking: collect and write the snapshot (periodic task, shutdown, POST /snapshot)
+    active = registry.active
+    state = {
+        "model_version": active.version_id,
+        # Extra versions and warehouse models that were loaded, reloaded on start
+        "models": [v for v in registry.versions if v != active.version_id],
+        "warehouses": warehouses.resident_ids(),
+        "admission": admission.state(),
+        "explain": explainer.state(active),
+        "execution": {"cpus": os.cpu_count(), "model_version": active.version_id, "report": calibration_report},
+    }
+    try:
+        snapshot_info["last_save"] = write_snapshot(SNAPSHOT_PATH, state,
+                                                    {"predictions": cache, "explanations": explainer.cache})
+        snapshot_info["error"] = None
+    except OSError as e:
+        snapshot_info["error"] = f"save failed: {e}"
+        print(f"WARNING: Could not write the state snapshot: {e}")
+        return None
+    return snapshot_info["last_save"]
+
+def read_saved_state():
+    try:
+        ensure_private_dir(SNAPSHOT_PATH)
+        if not os.path.exists(SNAPSHOT_PATH):
+            return None
+        return read_snapshot(SNAPSHOT_PATH)
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        # A damaged or foreign snapshot only costs the warm start
+        snapshot_info["error"] = f"restore failed: {e}"
+        print(f"WARNING: Ignoring state snapshot {SNAPSHOT_PATH}: {e}")
+        return None
+
+def restore_calibration(saved):
+    # Thread calibration measures this host with this model; reuse a matching result
+    report = saved.get("report")
+    if not report or saved.get("cpus") != os.cpu_count() or saved.get("model_version") != registry.active.version_id:
+        return None
+    executor.resize(report["chosen"]["workers"])
+    registry.set_booster_threads(report["chosen"]["booster_threads"])
+    # format_report marks the chosen row by identity
+    report["chosen"] = next(r for r in report["results"] if r == report["chosen"])
+    print("Thread calibration restored from the state snapshot.")
+    return report
+
+async def restore_state(state, caches):
+    start = time.perf_counter()
+    for version_id in state.get("models", []):
+        try:
+            # Only ids that name a directory inside MODEL_VERSIONS_DIR
+            path = registry.version_path(version_id)
+            if version_id not in registry.versions and os.path.isdir(path):
+                await run_in_threadpool(registry.load, path, version_id)
+        except Exception as e:
+            print(f"WARNING: Could not reload model version {version_id!r}: {e}")
+    if warehouses.enabled:
+        for warehouse_id in state.get("warehouses", []):
+            try:
+                await run_in_threadpool(warehouses.get, warehouse_id)
+            except ValueError as e:
+                print(f"WARNING: Could not reload the model of warehouse {warehouse_id!r}: {e}")
+    admission.restore(state.get("admission") or {})
+
+    # Cached results only count for models that are loaded again
+    versions = set(registry.versions) | {entry["version_id"] for entry in warehouses.stats()["resident"]}
+    restored = {
+        "predictions": cache.restore(caches.get("predictions", []), versions),
+        "explanations": explainer.cache.restore(caches.get("explanations", []), versions),
+    }
+    snapshot_info["restore"] = {
+        "path": SNAPSHOT_PATH,
+        "restore_ms": round((time.perf_counter() - start) * 1000, 3),
+        "models": len(state.get("models", [])),
+        "warehouses": len(warehouses.resident_ids()),
+        "entries": restored,
+    }
+    print(f"State restored from {SNAPSHOT_PATH} in {snapshot_info['restore']['restore_ms']:.0f} ms: "
+          f"{restored['predictions']} cached predictions, {restored['explanations']} explanations, "
+          f"{snapshot_info['restore']['warehouses']} warehouse models.")
+
+@contextmanager
+def startup_phase(name):
+    readiness["phase"] = name
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        readiness["phases"][name] = round((time.perf_counter() - start) * 1000, 3)
+
+def warmup_batch_sizes():
+    sizes = set(WARMUP_BATCH_SIZES)
+    if sizes and MICRO_BATCHING:
+        sizes.add(MICRO_BATCH_MAX_SIZE)
+    if sizes:
+        sizes.add(STREAM_MAX_BATCH)
+    return sorted(sizes)
+
+async def warm_up_serving():
+    # Loading warmed each model on the loading thread only; XGBoost and the
+    # vectorizer also set up per-thread state, so without this the first
+    # requests on every inference thread pay for it
+    sizes = warmup_batch_sizes()
+    versions = list(registry.versions.values()) + warehouses.resident_versions()
+    batch_ms = dict.fromkeys(sizes, 0.0)
+    with unrecorded(versions):
+        for version in versions:
+            with version:
+                for timings in await run_in_threadpool(executor.run_on_each_thread, version.synthetic_predictions, sizes):
+                    for size, ms in timings.items():
+                        # The slowest thread: what a first request would have paid
+                        batch_ms[size] = max(batch_ms[size], ms)
+        requests_ms = await warm_up_endpoints(sizes)
+    return {
+        "batch_sizes": sizes,
+        "threads": executor.workers,
+        "versions": [version.version_id for version in versions],
+        "batch_ms": {str(size): round(ms, 3) for size, ms in batch_ms.items()},
+        "requests_ms": requests_ms,
+    }
+
+async def warm_up_endpoints(sizes):
+    # One synthetic request per batch size through the app itself (/predict
+    # for 1, /predict_batch above), for the first-call costs of routing,
+    # validation and serialization. Not sent over the network.
+    wine = registry.active.example_wine().model_dump(by_alias=True)
+    timings = {}
+    for size in sizes:
+        # Distinct readings (alcohol in 0.01 steps), so every row is really scored
+        rows = [{**wine, "alcohol": wine["alcohol"] + i * 0.01} for i in range(size)]
+        if size == 1:
+            path, body = "/predict", rows[0]
+        else:
+            path, body = "/predict_batch", {"items": rows}
+        start = time.perf_counter()
+        status = await asgi_request("POST", path, json.dumps(body).encode("utf-8"))
+        if status != 200:
+            print(f"WARNING: Warmup request {path} ({size} rows) answered HTTP {status}")
+        timings[f"{path}:{size}"] = round((time.perf_counter() - start) * 1000, 3)
+    return timings
+
+@contextmanager
+def unrecorded(versions):
+    # Warmup traffic leaves no trace: the prediction cache is bypassed, and
+    # metrics, admission, batcher and per-version request counts are rolled
+    # back afterwards. Only safe before the server accepts requests.
+    metrics, admitted = METRICS.checkpoint(), admission.checkpoint()
+    batches = (batcher.batches, batcher.items) if batcher is not None else None
+    requests = {version: version.requests for version in versions}
+    cache_bytes, cache.max_bytes = cache.max_bytes, 0
+    try:
+        yield
+    finally:
+        cache.max_bytes = cache_bytes
+        METRICS.rollback(metrics)
+        admission.rollback(admitted)
+        if batches is not None:
+            batcher.batches, batcher.items = batches
+        for version, count in requests.items():
+            version.requests = count
+
+async def asgi_request(method, path, body):
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = [None]
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status[0] = message["status"]
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"content-type", b"application/json")], "client": ("127.0.0.1", 0), "server": ("127.0.0.1", 0),
+    }
+    await app(scope, receive, send)
+    return status[0]
+
+async def calibrate_explanations(version):
+    # Off the startup path: /explain is not needed for readiness and works
+    # with the default chunk size until this finishes
+    start = time.perf_counter()
+    try:
+        rate = await explainer.executor.run(explainer.calibrate, version)
+        print(f"Explanations: {rate:.0f} rows/s per worker, {explainer.chunk_rows} rows per chunk")
+    except Exception as e:
+        print(f"WARNING: Explanation calibration failed: {e}")
+    readiness["background"]["explain_calibration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+async def snapshot_periodically():
+    while True:
+        await asyncio.sleep(SNAPSHOT_INTERVAL_S)
+        if registry.active is not None:
+            await run_in_threadpool(save_state)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Load artifacts on startup
-    global model, scaler, label_encoders, imputation_values, feature_names
-    try:
-        abs_artifacts_dir = os.path.abspath(ARTIFACTS_DIR)
-        print(f"Loading AI models and artifacts from: {abs_artifacts_dir}")
-        
-        if not os.path.exists(abs_artifacts_dir):
-             print(f"ERROR: Artifacts directory not found at {abs_artifacts_dir}")
-             
-        model = joblib.load(os.path.join(abs_artifacts_dir, 'xgb_model.joblib'))
-        scaler = joblib.load(os.path.join(abs_artifacts_dir, 'scaler.joblib'))
-        label_encoders = joblib.load(os.path.join(abs_artifacts_dir, 'label_encoders.joblib'))
-        imputation_values = joblib.load(os.path.join(abs_artifacts_dir, 'imputation_values.joblib'))
-        feature_names = joblib.load(os.path.join(abs_artifacts_dir, 'feature_names.joblib'))
-        print("Artifacts loaded successfully.")
-    except Exception as e:
-        print(f"Error loading artifacts: {e}")
-        print("Ensure you have run the training script first!")
+    global batcher, calibration_report, uds_server, snapshot_task, explain_calibration_task
+    started = time.perf_counter()
+    limit_blas_threads(BLAS_THREADS)
+    with startup_phase("load"):
+        try:
+            if registry.active is None:
+                load_artifacts()
+            else:
+                # Pre-fork mode: the master already loaded everything before forking us
+                print(f"Using preloaded artifacts (model version {registry.active.version_id}).")
+        except Exception as e:
+            readiness["error"] = f"Error loading artifacts: {e}"
+            print(f"Error loading artifacts: {e}")
+            print("Ensure you have run the training script first!")
+
+    with startup_phase("snapshot_read"):
+        snapshot = await run_in_threadpool(read_saved_state) if SNAPSHOT_PATH and registry.active is not None else None
+    state = snapshot[0] if snapshot is not None else {}
+
+    if THREAD_CALIBRATION and registry.active is not None:
+        with startup_phase("thread_calibration"):
+            calibration_report = restore_calibration(state.get("execution") or {})
+            if calibration_report is None:
+                calibration_report = await run_in_threadpool(calibrate, registry, executor, THREAD_CALIBRATION_SECONDS)
+        print(format_report(calibration_report))
+
+    if MICRO_BATCHING:
+        batcher = MicroBatcher(predict_batched, MICRO_BATCH_MAX_SIZE, MICRO_BATCH_MAX_WAIT_MS / 1000, executor=executor)
+        await batcher.start()
+        print(f"Micro-batching enabled (max size {MICRO_BATCH_MAX_SIZE}, max wait {MICRO_BATCH_MAX_WAIT_MS} ms)")
+
+    calibrate_explainer = registry.active is not None and not explainer.restore(state.get("explain") or {}, registry.active)
+
+    if snapshot is not None:
+        with startup_phase("snapshot_restore"):
+            await restore_state(*snapshot)
+
+    # Slots follow the (possibly calibrated) executor size
+    slots = ADMISSION_CONCURRENCY or executor.workers
+    admission.configure(slots, {"bulk": BULK_CONCURRENCY or max(1, slots // 2)},
+                        MICRO_BATCH_MAX_SIZE if batcher is not None else 1)
+
+    if UDS_PATH:
+        uds_server = FrameServer(uds_predict, uds_layout, UDS_MAX_FRAME_BYTES)
+        await uds_server.start(uds_listener or bind_unix_socket(UDS_PATH))
+        print(f"Listening on Unix socket {UDS_PATH}")
+
+    if SNAPSHOT_PATH and SNAPSHOT_INTERVAL_S > 0:
+        snapshot_task = asyncio.create_task(snapshot_periodically())
+
+    for version_id in SHADOW_VERSIONS:
+        try:
+            if version_id not in registry.versions:
+                await run_in_threadpool(registry.load, registry.version_path(version_id), version_id)
+            shadow.add(version_id)
+            print(f"Shadow scoring model version {version_id} on {SHADOW_SAMPLE_RATE:.0%} of live traffic")
+        except Exception as e:
+            print(f"WARNING: Could not shadow model version {version_id}: {e}")
+
+    # Last, once the thread count and the set of loaded models are final
+    if registry.active is not None and WARMUP_BATCH_SIZES:
+        with startup_phase("warmup"):
+            readiness["warmup"] = await warm_up_serving()
+    # After the warmup, whose requests are not live traffic to sample
+    await shadow.start()
+
+    readiness["startup_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    readiness["since_import_ms"] = round((time.perf_counter() - IMPORT_STARTED) * 1000, 3)
+    readiness["ready"] = registry.active is not None
+    readiness["phase"] = "ready" if readiness["ready"] else "no_model"
+    readiness["ready_at"] = time.time()
+    if readiness["ready"]:
+        print(f"Ready in {readiness['since_import_ms']:.0f} ms since import "
+              f"({', '.join(f'{name} {ms:.0f} ms' for name, ms in readiness['phases'].items())}).")
+    if calibrate_explainer:
+        explain_calibration_task = asyncio.create_task(calibrate_explanations(registry.active))
     
     yield
     
     # Clean up on shutdown
-    model = None
+    readiness["ready"] = False
+    readiness["phase"] = "stopping"
+    if explain_calibration_task is not None:
+        explain_calibration_task.cancel()
+        explain_calibration_task = None
+    if snapshot_task is not None:
+        snapshot_task.cancel()
+        snapshot_task = None
+    if SNAPSHOT_PATH and registry.active is not None:
+        # The freshest state is what the next start wants
+        await run_in_threadpool(save_state)
+    await shadow.stop()
+    if uds_server is not None:
+        await uds_server.stop()
+        uds_server = None
+    if batcher is not None:
+        await batcher.stop()
+        batcher = None
+    predictor.close()
 
 app = FastAPI(title="Wine Quality Prediction Service", lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
+
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected(request: Request, exc: AdmissionRejected):
+    headers = {"Retry-After": str(exc.retry_after)} if exc.retry_after is not None else None
+    return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail}, headers=headers)
+
+# Serving state exported next to the request/stage histograms on /metrics
+METRICS.gauge(
+    "wine_cache", "Prediction cache entries, bytes and hit/miss/eviction/expiration counts", ("field",),
+    lambda: {(field,): cache.stats()[field] for field in ("entries", "bytes", "hits", "misses", "evictions", "expirations")})
+METRICS.gauge(
+    "wine_admission_waiting", "Requests queued for an execution slot, by priority lane", ("lane",),
+    lambda: {(lane,): stats["waiting"] for lane, stats in admission.stats()["lanes"].items()})
+METRICS.gauge(
+    "wine_admission_rejected", "Requests shed (queue full) or rejected for their deadline, by lane", ("lane", "reason"),
+    lambda: {(lane, reason): stats[f"rejected_{reason}"] + (stats["expired"] if reason == "deadline" else 0)
+             for lane, stats in admission.stats()["lanes"].items() for reason in ("full", "deadline")})
+METRICS.gauge(
+    "wine_model_in_flight", "Requests currently using each loaded model version", ("version",),
+    lambda: {(v.version_id,): v.in_flight for v in list(registry.versions.values())})
+
+def request_deadline(deadline_ms, default_ms=0):
+    # X-Deadline-Ms is the caller's remaining budget, counted from arrival
+    budget = deadline_ms if deadline_ms is not None else default_ms
+    return asyncio.get_running_loop().time() + budget / 1000 if budget else None
+
+def resolve_version(version_id):
+    try:
+        return predictor.version(version_id)
+    except ModelNotLoaded as e:
+        raise HTTPException(status_code=404 if version_id is not None else 503, detail=str(e))
+
+def warehouse_header(value):
+    # X-Warehouse-Id: an integer, like WineInput.warehouse_id
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid X-Warehouse-Id '{value}': expected an integer")
+
+async def resolve_model(version_id, warehouse_id):
+    # Pinned version > the warehouse's own model > the global active model
+    if version_id is None and warehouse_id is not None and warehouses.enabled:
+        version = warehouses.resident(warehouse_id)
+        if version is None and warehouses.has_model(warehouse_id):
+            # First request for a cold warehouse pays for the load
+            version = await run_in_threadpool(warehouses.get, warehouse_id)
+        if version is not None:
+            return version
+        warehouses.fallbacks += 1
+    return resolve_version(version_id)
+
+def predict_batched(items):
+    # Micro-batcher flush: items are (version, wine) pairs, one predict per version
+    BATCH_SIZE.observe(len(items), "micro_batch")
+    results = [None] * len(items)
+    groups = {}
+    for i, (version, wine) in enumerate(items):
+        groups.setdefault(version, []).append(i)
+    for version, indices in groups.items():
+        predictions = version.predict_wines([items[i][1] for i in indices])
+        for i, prediction in zip(indices, predictions):
+            results[i] = prediction
+    return results
+
+def score_groups(groups):
+    # {version: [wine, ...]} -> {version: scores}, on one executor thread
+    return {version: predictor.score_wines(version, wines) for version, wines in groups.items()}
+
+def stream_pipeline(version_id, lane):
+    async def score(batch):
+        BATCH_SIZE.observe(len(batch), "stream")
+        start = now()
+        wines, positions, results = validate_items(batch)
+        STAGE_LATENCY.observe(now() - start, "validate")
+        if not wines:
+            return results
+        # Each reading gets its model like a /predict request would: the pinned
+        # version, else its warehouse's model, else the active one
+        resolved = {}  # warehouse id -> version or HTTPException
+        groups = {}  # version -> [(position, wine)]
+        for pos, wine in zip(positions, wines):
+            if wine.warehouse_id not in resolved:
+                try:
+                    resolved[wine.warehouse_id] = await resolve_model(version_id, wine.warehouse_id)
+                except HTTPException as e:
+                    resolved[wine.warehouse_id] = e
+            version = resolved[wine.warehouse_id]
+            if isinstance(version, HTTPException):
+                results[pos] = {"seq": batch[pos][0], "error": version.detail}
+                continue
+            groups.setdefault(version, []).append((pos, wine))
+        if not groups:
+            return results
+        try:
+            # No deadline and never shed: while the stream waits for a slot it
+            # stops reading, and backpressure slows the sender down
+            async with admission.slot(lane, wait=True):
+                scores = await executor.run(
+                    score_groups, {version: [wine for _, wine in items] for version, items in groups.items()})
+        except Exception as e:
+            for items in groups.values():
+                for pos, _ in items:
+                    results[pos] = {"seq": batch[pos][0], "error": f"Prediction error: {str(e)}"}
+            return results
+        for version, items in groups.items():
+            shadow.offer(version, [wine for _, wine in items], scores[version])
+            for (pos, wine), quality_score in zip(items, scores[version]):
+                seq, payload = batch[pos]
+                results[pos] = {
+                    "seq": seq,
+                    "product_id": payload.get("product_id"),
+                    "quality_score": quality_score,
+                    "quality_class": int(round(quality_score)),
+                    "model_version": version.version_id,
+                    **(version.input_flags(wine) or {})
+                }
+        return results
+
+    return StreamPipeline(score, STREAM_BUFFER_SIZE, STREAM_MAX_BATCH)
+
+def check_debug_token(authorization):
+    if DEBUG_TOKEN is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), DEBUG_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid debug token", headers={"WWW-Authenticate": "Bearer"})
+
+def require_debug_token(authorization: Optional[str] = Header(None)):
+    check_debug_token(authorization)
+
+admin = [Depends(require_debug_token)]
 
 @app.get("/")
 def health_check():
-    return {"status": "running", "model_loaded": model is not None}
+    # Liveness; GET /ready says whether to send traffic
+    active = registry.active
+    return {
+        "status": "running",
+        "model_loaded": active is not None,
+        "ready": readiness["ready"],
+        "model_version": active.version_id if active is not None else None,
+        "engine": active.engine.name if active is not None else None,
+        "micro_batching": batcher.stats() if batcher is not None else None
+    }
+
+@app.get("/ready")
+def readiness_check():
+    # 200 once the model is loaded and warmed up on every inference thread, 503 before and while stopping
+    active = registry.active
+    body = {
+        **readiness,
+        "model_version": active.version_id if active is not None else None,
+        # Artifact load and the warmup on the loading thread, from the registry
+        "load_ms": active.load_ms if active is not None else None,
+        "model_warmup_ms": active.warmup_ms if active is not None else None,
+    }
+    return JSONResponse(body, status_code=200 if readiness["ready"] else 503)
+
+@app.get("/execution")
+def execution_settings():
+    return {
+        "inference_workers": executor.workers,
+        "booster_threads": registry.booster_threads,
+        "blas": blas_info(),
+        "calibration": calibration_report,
+    }
+
+@app.get("/admission")
+def admission_stats():
+    return admission.stats()
+
+@app.get("/warehouses")
+def warehouse_models():
+    return warehouses.stats()
+
+@app.delete("/warehouses/{warehouse_id}", dependencies=admin)
+def evict_warehouse_model(warehouse_id: int):
+    try:
+        return warehouses.evict(warehouse_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"No resident model for warehouse '{warehouse_id}'")
+
+@app.get("/cache/stats")
+def cache_stats():
+    active = registry.active
+    return {"model_version": active.version_id if active is not None else None, **cache.stats()}
+
+@app.get("/shadow")
+def shadow_stats():
+    return shadow.stats()
+
+@app.put("/shadow/{version_id}", dependencies=admin)
+def start_shadow(version_id: str):
+    # The candidate must be loaded (POST /models/load without activate)
+    try:
+        shadow.add(version_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Model version '{version_id}' is not loaded")
+    return shadow.stats()
+
+@app.delete("/shadow/{version_id}", dependencies=admin)
+def stop_shadow(version_id: str):
+    try:
+        shadow.remove(version_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Model version '{version_id}' is not being shadowed")
+    return shadow.stats()
 
-@app.post("/predict", response_model=PredictionOutput)
-def predict_quality(wine: WineInput):
-    if model is None:
+@app.get("/snapshot", dependencies=admin)
+def snapshot_stats():
+    return {"path": SNAPSHOT_PATH, "interval_s": SNAPSHOT_INTERVAL_S, **snapshot_info}
+
+@app.post("/snapshot", dependencies=admin)
+def take_snapshot():
+    # e.g. from a deploy script right before a restart
+    if SNAPSHOT_PATH is None:
+        raise HTTPException(status_code=404, detail="State snapshots are disabled (SNAPSHOT_PATH is empty)")
+    if registry.active is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
+    result = save_state()
+    if result is None:
+        raise HTTPException(status_code=500, detail=snapshot_info["error"])
+    return result
+
+@app.get("/models")
+def list_models():
+    return registry.info()
 
+@app.post("/models/load", status_code=202, dependencies=admin)
+def load_model(request: LoadModelInput):
+    # Loads <MODEL_VERSIONS_DIR>/<version_id> and warms it up in the background;
+    # poll GET /models for the state
     try:
-        # 1. Convert input to DataFrame
-        # by_alias=True ensures we get keys like "fixed acidity" matching the schema aliases
-        input_data = wine.model_dump(by_alias=True)
-        df = pd.DataFrame([input_data])
+        path = registry.version_path(request.version_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not os.path.isdir(path):
+        raise HTTPException(status_code=404, detail=f"No artifacts for model version '{request.version_id}'")
+    try:
+        registry.load_in_background(path, request.version_id, request.activate)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"version_id": request.version_id, "state": "loading"}
 
-        # 2. Preprocessing (Must match training logic exactly)
-        
-        # Handle Categorical (Type)
-        if 'type' in df.columns and 'type' in label_encoders:
-            le = label_encoders['type']
-            # Handle unseen labels safely
-            try:
-                df['type'] = le.transform(df['type'])
-            except ValueError:
-                # Fallback for unseen label, e.g., map to most common or 0
-                df['type'] = 0 
+@app.post("/models/{version_id}/activate", dependencies=admin)
+def activate_model(version_id: str):
+    try:
+        version = registry.activate(version_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Model version '{version_id}' is not loaded")
+    return version.info()
+
+@app.delete("/models/{version_id}", dependencies=admin)
+def unload_model(version_id: str):
+    try:
+        version = registry.unload(version_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Model version '{version_id}' is not loaded")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"version_id": version_id, "in_flight": version.in_flight, "state": "unloaded"}
+
+@app.get("/debug/profile", response_class=PlainTextResponse)
+async def debug_profile(
+    seconds: float = Query(10, gt=0),
+    hz: int = Query(100, ge=1, le=1000),
+    idle: bool = False,
+    authorization: Optional[str] = Header(None),
+):
+    # Samples this worker process for `seconds` and returns collapsed stacks,
+    # e.g. `flamegraph.pl profile.collapsed > profile.svg` or drop it into speedscope.
+    # In pre-fork mode each call profiles whichever worker accepted it.
+    check_debug_token(authorization)
+    if seconds > PROFILE_MAX_SECONDS:
+        raise HTTPException(status_code=422, detail=f"seconds must be <= {PROFILE_MAX_SECONDS}")
+    try:
+        # The sampler sleeps between ticks on its own thread; the event loop keeps serving
+        collapsed, info = await run_in_threadpool(profiler.profile, seconds, hz, idle)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    filename = f"profile-{info['pid']}-{int(time.time())}.collapsed"
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "X-Profile-Pid": str(info["pid"]),
+        "X-Profile-Samples": str(info["samples"]),
+        "X-Profile-Overhead": str(info["overhead"]),
+    }
+    return PlainTextResponse(collapsed, headers=headers)
+
+def explanation(version, row, product_id=None):
+    # row: one contribution per feature, then the bias
+    return {
+        "product_id": product_id,
+        "quality_score": float(row.sum(dtype=np.float64)),
+        "base_value": float(row[-1]),
+        "contributions": dict(zip(version.feature_names, row[:-1].tolist())),
+    }
+
+@app.post("/explain", response_model=ExplanationOutput)
+async def explain_product(
+    wine: ExplainInput,
+    x_model_version: Optional[str] = Header(None),
+    x_deadline_ms: Optional[float] = Header(None),
+):
+    # Why a single product scored the way it did; runs on the explain worker, live lane
+    deadline = request_deadline(x_deadline_ms)
+    version = await resolve_model(x_model_version, wine.warehouse_id)
+    with version:
+        rows, _ = await explainer.explain(version, [wine], "live", deadline)
+    return {**explanation(version, rows[0], wine.product_id), "model_version": version.version_id}
+
+@app.post("/explain/batch", response_model=BatchExplanationOutput)
+async def explain_batch(
+    batch: ExplainBatchInput,
+    x_model_version: Optional[str] = Header(None),
+    x_deadline_ms: Optional[float] = Header(None),
+    x_warehouse_id: Optional[str] = Header(None),
+):
+    # Every product of a production batch, in chunks behind product requests
+    if len(batch.items) > explainer.max_rows:
+        raise HTTPException(status_code=413, detail=f"Batch too large: {len(batch.items)} items (max {explainer.max_rows})")
+    deadline = request_deadline(x_deadline_ms)
+    version = await resolve_model(x_model_version, warehouse_header(x_warehouse_id))
+
+    wines, positions, results = validate_items(list(enumerate(batch.items)))
+    for result in results:
+        if result is not None:
+            result["index"] = result.pop("seq")
+
+    with version:
+        rows, cached = await explainer.explain(version, wines, "bulk", deadline)
+    for pos, row in zip(positions, rows):
+        results[pos] = {"index": pos, **explanation(version, row, batch.items[pos].get("product_id"))}
+    return {"batch_id": batch.batch_id, "results": results, "model_version": version.version_id, "cached": cached}
 
-        # Ensure column order matches training
-        # Reorder columns to match feature_names
-        df = df[feature_names]
+@app.get("/explain/stats")
+def explain_stats():
+    return explainer.stats()
 
-        # Scale features
-        X_scaled = scaler.transform(df)
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    # Prometheus text exposition format
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4")
 
-        # 3. Predict
-        prediction = model.predict(X_scaled)
-        quality_score = float(prediction[0])
+@app.post(
+    "/predict",
+    response_model=PredictionOutput,
+    openapi_extra={"requestBody": {"required": True, "content": {"application/json": {"schema": WineInput.model_json_schema()}}}},
+)
+async def predict_quality(
+    request: Request,
+    x_model_version: Optional[str] = Header(None),
+    x_priority: Optional[str] = Header(None),
+    x_deadline_ms: Optional[float] = Header(None),
+    interval: bool = Query(False, description=(
+        "Also return a prediction interval and class confidence. Needs a model trained with quantile heads: "
+        "interval_available is false otherwise. Single pass over the model only with INFERENCE_ENGINE=compiled; "
+        "other engines run the heads as a second pass")),
+):
+    # X-Model-Version pins a specific loaded version, otherwise the reading's
+    # warehouse model or the active one is used.
+    # Live lane by default; X-Priority: bulk lets backfills queue behind the line.
+    # ?interval=true on a model without quantile heads still scores the wine,
+    # flagged with interval_available: false.
+    deadline = request_deadline(x_deadline_ms, LIVE_DEADLINE_MS)
+    lane = admission.lane(x_priority, "live")
 
-        return {
+    # Validate (and serialize, below) by hand so both stages show up in the metrics
+    start = now()
+    try:
+        wine = WineInput.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+    STAGE_LATENCY.observe(now() - start, "validate")
+
+    version = await resolve_model(x_model_version, wine.warehouse_id)
+    if interval and version.intervals is not None:
+        return await predict_interval(version, wine, lane, deadline)
+
+    try:
+        with version:
+            key = predictor.cache_key(version, wine)
+            quality_score = cache.get(key) if key is not None else None
+            if quality_score is None:
+                # Cache hits above never queue; misses wait for an execution slot
+                async with admission.slot(lane, deadline, batched=batcher is not None):
+                    if batcher is not None:
+                        # Queued together with other concurrent requests, one predict per flush
+                        prediction = await batcher.submit((version, wine))
+                    else:
+                        prediction = await executor.run(version.predict_one, wine)
+                quality_score = float(prediction)
+                if key is not None:
+                    cache.put(key, quality_score)
+        shadow.offer(version, [wine], [quality_score])
+
+        start = now()
+        body = json.dumps({
             "quality_score": quality_score,
-            "quality_class": int(round(quality_score))
-        }
+            "quality_class": int(round(quality_score)),
+            "model_version": version.version_id,
+            **({"interval_available": False} if interval else {}),
+            **(version.input_flags(wine) or {})
+        })
+        STAGE_LATENCY.observe(now() - start, "serialize")
+        return Response(content=body, media_type="application/json")
 
+    except AdmissionRejected:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
+async def predict_interval(version, wine, lane, deadline):
+    # Point score and interval from one pass over the model (see intervals.py).
+    # Not micro-batched: the batcher returns point scores only.
+    try:
+        with version:
+            key = predictor.cache_key(version, wine, "interval")
+            result = cache.get(key) if key is not None else None
+            if result is None:
+                async with admission.slot(lane, deadline):
+                    result = await executor.run(version.predict_interval, wine)
+                if key is not None:
+                    cache.put(key, result)
+
+        quality_score, lower, upper, confidence = result
+        shadow.offer(version, [wine], [quality_score])
+        start = now()
+        body = json.dumps({
+            "quality_score": quality_score,
+            "quality_class": int(round(quality_score)),
+            "model_version": version.version_id,
+            "lower": lower,
+            "upper": upper,
+            "confidence": confidence,
+            "interval_available": True,
+            **(version.input_flags(wine) or {})
+        })
+        STAGE_LATENCY.observe(now() - start, "serialize")
+        return Response(content=body, media_type="application/json")
+
+    except AdmissionRejected:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
+
+def score_batch(version, batch):
+    # Runs on the inference executor: validation, cache lookups and the predict
+    BATCH_SIZE.observe(len(batch.items), "predict_batch")
+
+    # 1. Validate every item on its own, remembering where the valid ones came from
+    start = now()
+    results = [None] * len(batch.items)
+    valid_wines = []
+    valid_index = []
+    for i, item in enumerate(batch.items):
+        try:
+            wine = WineInput.model_validate(item)
+        except ValidationError as e:
+            results[i] = {"index": i, "error": invalid_input(e)}
+            continue
+        valid_wines.append(wine)
+        valid_index.append(i)
+    STAGE_LATENCY.observe(now() - start, "validate")
+
+    if valid_wines:
+        try:
+            # 2. Preprocess and predict the whole matrix in one go (cache hits are skipped)
+            scores = predictor.score_wines(version, valid_wines)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
+        shadow.offer(version, valid_wines, scores)
+
+        # 3. Scatter predictions back to their original positions
+        for i, wine, quality_score in zip(valid_index, valid_wines, scores):
+            results[i] = {
+                "index": i,
+                "quality_score": quality_score,
+                "quality_class": int(round(quality_score)),
+                **(version.input_flags(wine) or {})
+            }
+
+    return {"results": results, "model_version": version.version_id}
+
+@app.post("/predict_batch", response_model=BatchPredictionOutput)
+async def predict_quality_batch(
+    batch: BatchWineInput,
+    x_model_version: Optional[str] = Header(None),
+    x_priority: Optional[str] = Header(None),
+    x_deadline_ms: Optional[float] = Header(None),
+    x_warehouse_id: Optional[str] = Header(None),
+):
+    deadline = request_deadline(x_deadline_ms)
+    lane = admission.lane(x_priority, "bulk")
+    version = await resolve_model(x_model_version, warehouse_header(x_warehouse_id))
+
+    if len(batch.items) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch too large: {len(batch.items)} items (max {MAX_BATCH_SIZE})")
+
+    async with admission.slot(lane, deadline):
+        return await executor.run(score_batch, version, batch)
+
+def score_bulk(version, codec, body):
+    # Decode straight into the scaled matrix, predict, encode in the same format.
+    # Bulk rows skip the per-row prediction cache.
+    start = now()
+    X_scaled = codec.decode(body, version.vectorizer)
+    STAGE_LATENCY.observe(now() - start, "decode")
+    if len(X_scaled) > BULK_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"Too many rows: {len(X_scaled)} (max {BULK_MAX_ROWS})")
+    BATCH_SIZE.observe(len(X_scaled), "bulk")
+
+    scores = predictor.score_matrix(version, X_scaled)
+
+    start = now()
+    content, headers = codec.encode(scores, np.rint(scores).astype(np.int32), version.version_id)
+    STAGE_LATENCY.observe(now() - start, "serialize")
+    return content, headers
+
+@app.get("/predict/bulk/layout")
+async def bulk_layout(x_model_version: Optional[str] = Header(None), x_warehouse_id: Optional[str] = Header(None)):
+    # Feature order and label codes for the raw float32 format
+    version = await resolve_model(x_model_version, warehouse_header(x_warehouse_id))
+    if version.vectorizer is None:
+        raise HTTPException(status_code=503, detail="Bulk formats need the NumPy preprocessing path")
+    return {"model_version": version.version_id, **version.vectorizer.layout()}
+
+@app.post("/predict/bulk")
+async def predict_bulk(
+    request: Request,
+    x_model_version: Optional[str] = Header(None),
+    x_priority: Optional[str] = Header(None),
+    x_deadline_ms: Optional[float] = Header(None),
+    x_warehouse_id: Optional[str] = Header(None),
+):
+    # Columnar JSON, MessagePack, Arrow IPC or raw float32, answered in the same format.
+    # X-Warehouse-Id routes the whole request to that warehouse's model.
+    deadline = request_deadline(x_deadline_ms)
+    lane = admission.lane(x_priority, "bulk")
+    version = await resolve_model(x_model_version, warehouse_header(x_warehouse_id))
+    if version.vectorizer is None:
+        raise HTTPException(status_code=503, detail="Bulk formats need the NumPy preprocessing path")
+    try:
+        codec = codec_for(request.headers.get("content-type"))
+        body = await request.body()
+        async with admission.slot(lane, deadline):
+            content, headers = await executor.run(score_bulk, version, codec, body)
+    except CodecUnavailable as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return Response(content=content, media_type=codec.media_type, headers=headers)
+
+def score_frame(version, n_rows, n_features, body):
+    # Unix socket requests: raw float64 rows -> float32 scores + per-row repair flags
+    raw = np.frombuffer(body, dtype="<f8").reshape(n_rows, n_features)
+    flags = version.guard.flag_matrix(raw)
+    scores = predictor.score_matrix(version, version.vectorizer.transform_matrix(raw))
+    return scores.astype("<f4").tobytes(), flags.tobytes()
+
+async def uds_predict(version_id, warehouse_id, lane, deadline_ms, n_rows, n_features, body):
+    deadline = request_deadline(deadline_ms or None, LIVE_DEADLINE_MS if lane == "live" else 0)
+    version = await resolve_model(version_id, warehouse_id)
+    if version.vectorizer is None:
+        raise HTTPException(status_code=503, detail="The socket transport needs the NumPy preprocessing path")
+    if n_features != version.vectorizer.n_features:
+        raise HTTPException(status_code=400, detail=f"Expected {version.vectorizer.n_features} features per row, got {n_features}")
+    if n_rows == 0:
+        raise HTTPException(status_code=400, detail="No rows to score")
+    if n_rows > BULK_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"Too many rows: {n_rows} (max {BULK_MAX_ROWS})")
+    BATCH_SIZE.observe(n_rows, "uds")
+    async with admission.slot(lane, deadline):
+        scores, flags = await executor.run(score_frame, version, n_rows, n_features, body)
+    return version.version_id, scores, flags
+
+async def uds_layout(version_id, warehouse_id):
+    version = await resolve_model(version_id, warehouse_id)
+    if version.vectorizer is None:
+        raise HTTPException(status_code=503, detail="The socket transport needs the NumPy preprocessing path")
+    return version.version_id, version.vectorizer.layout()
+
+@app.websocket("/ws/predict")
+async def predict_websocket(websocket: WebSocket, model_version: Optional[str] = None,
+                            priority: Optional[str] = None):
+    # Long-lived line feed: push readings, receive one result per reading.
+    # ?model_version= pins the stream to a loaded version. Live lane by
+    # default; ?priority=bulk for backfills.
+    try:
+        lane = admission.lane(priority, "live")
+    except AdmissionRejected as e:
+        await websocket.close(code=1008, reason=e.detail)
+        return
+    await websocket.accept()
+    hello = {"buffer_size": STREAM_BUFFER_SIZE, "max_batch": STREAM_MAX_BATCH}
+    await serve_websocket(websocket, stream_pipeline(model_version, lane), hello)
+
+@app.post("/predict/stream")
+async def predict_stream(request: Request, x_model_version: Optional[str] = Header(None),
+                         x_priority: Optional[str] = Header(None)):
+    # Same as the WebSocket, as NDJSON over one chunked HTTP request/response
+    lane = admission.lane(x_priority, "live")
+    return NDJSONStreamResponse(stream_pipeline(x_model_version, lane), STREAM_MAX_LINE_BYTES)
+
+readiness["import_ms"] = round((time.perf_counter() - IMPORT_STARTED) * 1000, 3)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
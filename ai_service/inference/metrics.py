@@ -0,0 +1,209 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Low-overhead metrics in Prometheus text format.
+#
+# Instruments are plain Python objects with fixed buckets: an observation is
+# a bisect plus three additions under an uncontended lock, well under a
+# microsecond, so they stay on in production.
+
+LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+
+_local = threading.local()
+
+
+@contextmanager
+def muted():
+    # Nothing this thread records inside the block counts (synthetic warmup work)
+    previous = getattr(_local, "muted", False)
+    _local.muted = True
+    try:
+        yield
+    finally:
+        _local.muted = previous
+
+
+class Counter:
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        if getattr(_local, "muted", False):
+            return
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def checkpoint(self):
+        with self._lock:
+            return dict(self._values)
+
+    def rollback(self, values):
+        with self._lock:
+            self._values = dict(values)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = list(self._values.items())
+        for label_values, value in values:
+            lines.append(f"{self.name}{_labels(self.labels, label_values)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [bucket counts (+Inf last), sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        if getattr(_local, "muted", False):
+            return
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+
+    def checkpoint(self):
+        return self.snapshot()
+
+    def rollback(self, series):
+        with self._lock:
+            self._series = {labels: [list(counts), total, count] for labels, (counts, total, count) in series.items()}
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for label_values, (counts, total, count) in self.snapshot().items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_labels(self.labels + ('le',), label_values + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, label_values)} {total}")
+            lines.append(f"{self.name}_count{_labels(self.labels, label_values)} {count}")
+        return lines
+
+
+class Gauge:
+    # Value read at scrape time from a callback: callable() -> {label values: value}
+    def __init__(self, name, help, labels, collect):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.collect = collect
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        for label_values, value in self.collect().items():
+            lines.append(f"{self.name}{_labels(self.labels, label_values)} {value}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.instruments = []
+
+    def counter(self, name, help, labels=()):
+        return self._add(Counter(name, help, labels))
+
+    def histogram(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        return self._add(Histogram(name, help, labels, buckets))
+
+    def gauge(self, name, help, labels, collect):
+        return self._add(Gauge(name, help, labels, collect))
+
+    def _add(self, instrument):
+        self.instruments.append(instrument)
+        return instrument
+
+    def checkpoint(self):
+        # Counter and histogram values, to drop what was recorded since (e.g. warmup traffic)
+        return {instrument: instrument.checkpoint() for instrument in self.instruments if hasattr(instrument, "checkpoint")}
+
+    def rollback(self, checkpoint):
+        for instrument, values in checkpoint.items():
+            instrument.rollback(values)
+
+    def render(self):
+        lines = []
+        for instrument in self.instruments:
+            lines.extend(instrument.render())
+        return "\n".join(lines) + "\n"
+
+
+def _labels(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Service-wide instruments
+METRICS = MetricsRegistry()
+
+REQUESTS = METRICS.counter(
+    "wine_requests_total", "HTTP requests handled, by route and status", ("route", "status"))
+REQUEST_LATENCY = METRICS.histogram(
+    "wine_request_latency_seconds", "End-to-end request latency inside the service", ("route",))
+STAGE_LATENCY = METRICS.histogram(
+    "wine_stage_latency_seconds",
+    "Latency of each inference stage (validate, dataframe, encode, scale, vectorize, predict, serialize)",
+    ("stage",))
+BATCH_SIZE = METRICS.histogram(
+    "wine_batch_size", "Rows per model call / per request, by source", ("source",), BATCH_SIZE_BUCKETS)
+
+now = time.perf_counter
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request counts and latency per route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start = now()
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the scope; use its template
+            # (e.g. /models/{version_id}) so label cardinality stays bounded
+            route = scope.get("route")
+            route_name = getattr(route, "path", None) or "unmatched"
+            REQUEST_LATENCY.observe(now() - start, route_name)
+            REQUESTS.inc(route_name, status[0])
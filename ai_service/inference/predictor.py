@@ -0,0 +1,309 @@
+import argparse
+import os
+import sys
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .schemas import WineInput
+from .cache import PredictionCache
+from .registry import ModelRegistry
+from .warehouses import WarehouseModels
+
+# In-process scoring, without the HTTP service:
+#
+#   from ai_service.inference.predictor import Predictor
+#
+#   predictor = Predictor.from_artifacts("ai_service/artifacts")
+#   predictor.predict_one({"type": "white", "alcohol": 8.8, ...})       # -> float
+#   predictor.predict_many(df)                                          # -> float32 array
+#   for scores in predictor.predict_iter(pd.read_csv(path, chunksize=50_000)):
+#       ...
+#
+# Models load (and warm up) once, the same way the service loads them; the
+# service itself is a thin layer over one Predictor (see main.py). Input can be
+#   - readings: WineInput objects or dicts with the /predict fields
+#   - columns: a pandas DataFrame, pyarrow Table/RecordBatch or a dict of
+#     arrays, named like the /predict fields ("fixed acidity" or
+#     fixed_acidity); "type" may hold labels or encoded codes
+#   - a raw NumPy matrix in feature order with the type already encoded
+#     (see layout(), same as the float32 bulk format)
+# Readings go through the prediction cache when it is on; columns and
+# matrices are scored as one matrix each, like /predict/bulk.
+#
+# As a bulk job, appending quality_score/quality_class to every row:
+#   python -m ai_service.inference.predictor readings.csv --output scored.csv
+
+DEFAULT_ARTIFACTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../artifacts")
+DEFAULT_CHUNK_ROWS = 65536
+
+
+class ModelNotLoaded(LookupError):
+    def __init__(self, version_id=None):
+        self.version_id = version_id
+        super().__init__(f"Model version '{version_id}' is not loaded" if version_id is not None else "Model not loaded")
+
+
+class Predictor:
+    """Loaded models, warehouse models and the prediction cache, callable in-process.
+
+    Thread-safe like the service: each call resolves its model version once
+    and holds it until it returns, so activating another version never
+    affects calls already running.
+    """
+
+    def __init__(self, versions_dir=None, engine="xgboost", verify=True, booster_threads=None,
+                 cache_max_bytes=0, cache_ttl=300, cache_decimals=6,
+                 warehouses_dir=None, warehouse_max_bytes=0, warehouse_retry_seconds=60):
+        self.registry = ModelRegistry(versions_dir or "", engine, verify=verify, booster_threads=booster_threads)
+        self.cache = PredictionCache(cache_max_bytes, cache_ttl)
+        self.cache_decimals = cache_decimals
+        self.warehouses = WarehouseModels(warehouses_dir or "", self.registry, warehouse_max_bytes,
+                                          warehouse_retry_seconds)
+        # A new active model invalidates cached predictions of the previous one
+        self.registry.on_activate.append(lambda version: self.cache.invalidate())
+
+    @classmethod
+    def from_artifacts(cls, path=DEFAULT_ARTIFACTS_DIR, version_id=None, **kwargs):
+        predictor = cls(**kwargs)
+        predictor.load(path, version_id)
+        return predictor
+
+    def load(self, path, version_id=None, activate=True):
+        # Bundle or legacy joblib files; blocking load + warmup
+        return self.registry.load(path, version_id, activate=activate)
+
+    @property
+    def active(self):
+        return self.registry.active
+
+    def version(self, version_id=None, warehouse_id=None):
+        # Pinned version > the warehouse's own model > the active model.
+        # May block to load a warehouse model.
+        if version_id is None and warehouse_id is not None and self.warehouses.enabled:
+            version = self.warehouses.get(warehouse_id)
+            if version is not None:
+                return version
+            self.warehouses.fallbacks += 1
+        version = self.registry.resolve(version_id)
+        if version is None:
+            raise ModelNotLoaded(version_id)
+        return version
+
+    def layout(self, version_id=None, warehouse_id=None):
+        # Feature order and label codes for raw matrices
+        return self._vectorizer(self.version(version_id, warehouse_id)).layout()
+
+    def predict_one(self, wine, version_id=None, warehouse_id=None):
+        wine = _validate(wine)
+        version = self.version(version_id, warehouse_id if warehouse_id is not None else wine.warehouse_id)
+        return self.score_wines(version, [wine])[0]
+
+    def predict_many(self, data, version_id=None, warehouse_id=None):
+        # Readings, columns or a raw matrix -> one float32 score per row
+        version = self.version(version_id, warehouse_id)
+        if _is_readings(data):
+            return np.asarray(self.score_wines(version, [_validate(wine) for wine in data]), dtype=np.float32)
+        return self.score_matrix(version, self.transform(version, data))
+
+    def predict_iter(self, chunks, chunk_rows=DEFAULT_CHUNK_ROWS, version_id=None, warehouse_id=None,
+                     prefetch=None):
+        """Scores per chunk, in order, from one model version for the whole stream.
+
+        `chunks` is an iterable of inputs predict_many accepts (e.g.
+        pd.read_csv(..., chunksize=n), a pyarrow RecordBatchReader, a
+        generator of arrays), or one large input, which is cut into
+        `chunk_rows` rows. With `prefetch` (default: when there is more than
+        one CPU to overlap on), the next chunk is read and preprocessed on a
+        helper thread while the current one is predicted. Rows skip the
+        prediction cache.
+        """
+        if prefetch is None:
+            prefetch = (os.cpu_count() or 1) > 1
+        version = self.version(version_id, warehouse_id)
+        source = iter(_split(chunks, chunk_rows) if _is_batch(chunks) else chunks)
+
+        def prepare():
+            chunk = next(source, None)
+            return None if chunk is None else self.transform(version, chunk)
+
+        with version:
+            if not prefetch:
+                while (X_scaled := prepare()) is not None:
+                    yield np.asarray(version.predict_matrix(X_scaled), dtype=np.float32)
+                return
+            with ThreadPoolExecutor(1, thread_name_prefix="predict-prefetch") as pool:
+                pending = pool.submit(prepare)
+                while True:
+                    X_scaled = pending.result()
+                    if X_scaled is None:
+                        return
+                    pending = pool.submit(prepare)
+                    yield np.asarray(version.predict_matrix(X_scaled), dtype=np.float32)
+
+    def cache_key(self, version, wine, *tags):
+        # None when the cache is off
+        if not self.cache.enabled:
+            return None
+        return version.cache_key(wine, self.cache_decimals) + tags
+
+    def score_wines(self, version, wines):
+        # Cache lookups first, then one predict over the misses; returns floats in input order
+        scores = [None] * len(wines)
+        keys = [None] * len(wines)
+        misses = []
+        for i, wine in enumerate(wines):
+            keys[i] = self.cache_key(version, wine)
+            if keys[i] is not None:
+                scores[i] = self.cache.get(keys[i])
+            if scores[i] is None:
+                misses.append(i)
+
+        if misses:
+            with version:
+                predictions = version.predict_wines([wines[i] for i in misses])
+            for i, prediction in zip(misses, predictions):
+                scores[i] = float(prediction)
+                if keys[i] is not None:
+                    self.cache.put(keys[i], scores[i])
+        return scores
+
+    def score_matrix(self, version, X_scaled):
+        with version:
+            return np.asarray(version.predict_matrix(X_scaled), dtype=np.float32)
+
+    def transform(self, version, data):
+        # Any accepted input -> the scaled model input matrix
+        if _is_readings(data):
+            return version.transform_wines([_validate(wine) for wine in data])
+        if isinstance(data, np.ndarray):
+            return self._vectorizer(version).transform_matrix(data)
+        columns = _columns(data)
+        if version.vectorizer is not None:
+            return version.vectorizer.transform_columns(columns)
+        # pandas fallback of a version whose NumPy path failed its check
+        import pandas as pd
+        aliases = {name: info.alias or name for name, info in WineInput.model_fields.items()}
+        df = pd.DataFrame({aliases.get(col, col): values for col, values in columns.items()})
+        return version.preprocess_frame(df)
+
+    @staticmethod
+    def _vectorizer(version):
+        if version.vectorizer is None:
+            raise ValueError("Raw matrices need the NumPy preprocessing path")
+        return version.vectorizer
+
+    def close(self):
+        self.warehouses.clear()
+        self.registry.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _validate(wine):
+    return wine if isinstance(wine, WineInput) else WineInput.model_validate(wine)
+
+
+def _is_readings(data):
+    return isinstance(data, (list, tuple)) and (not data or isinstance(data[0], (Mapping, WineInput)))
+
+
+def _is_frame(data):
+    # Checked without importing pandas/pyarrow: if they aren't loaded, data can't be theirs
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(data, pd.DataFrame)
+
+
+def _is_arrow(data):
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(data, (pa.Table, pa.RecordBatch))
+
+
+def _is_batch(data):
+    # One input to cut into chunks, as opposed to an iterable of chunks
+    return (isinstance(data, (np.ndarray, Mapping)) or _is_readings(data)
+            or _is_frame(data) or _is_arrow(data))
+
+
+def _columns(data):
+    if _is_frame(data):
+        return {col: data[col].to_numpy() for col in data.columns}
+    if _is_arrow(data):
+        # Numeric columns without nulls come out zero-copy; nulls become NaN
+        return {name: data.column(name).to_numpy(zero_copy_only=False) for name in data.column_names}
+    if isinstance(data, Mapping):
+        return data
+    raise TypeError(f"Unsupported input type {type(data).__name__}")
+
+
+def _split(data, chunk_rows):
+    if isinstance(data, Mapping):
+        n_rows = len(next(iter(data.values()), ()))
+        for start in range(0, n_rows, chunk_rows):
+            yield {col: values[start:start + chunk_rows] for col, values in data.items()}
+        return
+    n_rows = data.num_rows if _is_arrow(data) else len(data)
+    for start in range(0, n_rows, chunk_rows):
+        if _is_frame(data):
+            yield data.iloc[start:start + chunk_rows]
+        elif _is_arrow(data):
+            yield data.slice(start, chunk_rows)
+        else:
+            yield data[start:start + chunk_rows]
+
+
+def _read_chunks(path, chunk_rows):
+    # CSV through pandas, Parquet / Arrow IPC through pyarrow, both streamed
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        return (batch.to_pandas() for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows))
+    if path.endswith((".arrow", ".arrows")):
+        import pyarrow as pa
+        return (batch.to_pandas() for batch in pa.ipc.open_stream(pa.OSFile(path)))
+    import pandas as pd
+    return pd.read_csv(path, chunksize=chunk_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score a file of wine readings in-process')
+    parser.add_argument('input', help='CSV, Parquet (.parquet) or Arrow IPC stream (.arrow)')
+    parser.add_argument('--output', help='CSV with the input columns plus quality_score/quality_class '
+                        '(default: only print throughput)')
+    parser.add_argument('--artifacts', default=DEFAULT_ARTIFACTS_DIR)
+    parser.add_argument('--engine', default=os.environ.get("INFERENCE_ENGINE", "xgboost"))
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    predictor = Predictor.from_artifacts(args.artifacts, engine=args.engine)
+    rows = 0
+    start = time.perf_counter()
+    first = True
+    # The chunk rides along with its scores so they can be written next to it
+    chunks = []
+
+    def tracked():
+        for chunk in _read_chunks(args.input, args.chunk_rows):
+            chunks.append(chunk)
+            yield chunk
+
+    for scores in predictor.predict_iter(tracked(), args.chunk_rows):
+        chunk = chunks.pop(0)
+        rows += len(scores)
+        if args.output:
+            chunk = chunk.assign(quality_score=scores, quality_class=np.rint(scores).astype(np.int32))
+            chunk.to_csv(args.output, mode="w" if first else "a", header=first, index=False)
+            first = False
+    elapsed = time.perf_counter() - start
+    print(f"Scored {rows} rows in {elapsed:.2f} s ({rows / elapsed if elapsed else 0:.0f} rows/s) "
+          f"with model version {predictor.active.version_id}")
+
+
+if __name__ == "__main__":
+    main()
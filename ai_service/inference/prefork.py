@@ -0,0 +1,189 @@
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+
+import uvicorn
+
+from . import main
+from .uds import bind_unix_socket
+
+# Pre-fork serving mode (Linux/macOS):
+#   python -m ai_service.inference.prefork --workers 4 --port 8000 --report
+#
+# The master process loads the artifacts once, then forks the workers. The
+# workers share the model pages copy-on-write instead of each one unpickling
+# its own copy like `uvicorn --workers N` does. All workers accept on the same
+# listening socket, and on the same Unix socket when UDS_PATH is set.
+
+MEMORY_FIELDS = ('Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty', 'Private_Clean', 'Private_Dirty')
+
+
+def read_memory_kb(pid):
+    # smaps_rollup gives PSS, which splits shared pages fairly between processes
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                name = parts[0].rstrip(':')
+                if name in MEMORY_FIELDS:
+                    fields[name] = int(parts[1])
+    except (FileNotFoundError, PermissionError):
+        pass
+    if not fields:
+        # Older kernels: fall back to plain RSS
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        fields['Rss'] = int(line.split()[1])
+        except FileNotFoundError:
+            pass
+    return fields
+
+
+def create_socket(host, port, backlog):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(sock, args):
+    # Default signal handling in the child, uvicorn installs its own
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+    config = uvicorn.Config(main.app, log_level=args.log_level)
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+
+
+class PreforkMaster:
+    def __init__(self, args):
+        self.args = args
+        self.sock = None
+        self.workers = {}  # pid -> worker slot
+        self.stopping = False
+        self.load_cost_kb = 0
+
+    def preload(self):
+        before = read_memory_kb(os.getpid()).get('Rss', 0)
+        main.load_artifacts()
+        after = read_memory_kb(os.getpid()).get('Rss', 0)
+        # What every worker would pay again if it loaded the artifacts itself
+        self.load_cost_kb = max(after - before, 0)
+
+        # Move everything allocated so far out of the GC's reach, so collections
+        # in the workers don't touch (and un-share) the model's pages
+        gc.collect()
+        gc.freeze()
+
+    def spawn(self, slot):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(self.sock, self.args)
+            finally:
+                os._exit(0)
+        self.workers[pid] = slot
+        print(f"[prefork] worker {slot} started (pid {pid})")
+
+    def stop(self, signum, frame):
+        self.stopping = True
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def report(self, signum=None, frame=None):
+        print(f"[prefork] memory report ({len(self.workers)} workers, kB)")
+        print(f"{'process':<18} {'RSS':>10} {'PSS':>10} {'shared':>10} {'private':>10}")
+        processes = [('master', os.getpid())] + [(f"worker {slot}", pid) for pid, slot in sorted(self.workers.items(), key=lambda kv: kv[1])]
+        total_rss = total_pss = 0
+        worker_rss = []
+        for name, pid in processes:
+            mem = read_memory_kb(pid)
+            shared = mem.get('Shared_Clean', 0) + mem.get('Shared_Dirty', 0)
+            private = mem.get('Private_Clean', 0) + mem.get('Private_Dirty', 0)
+            total_rss += mem.get('Rss', 0)
+            total_pss += mem.get('Pss', mem.get('Rss', 0))
+            if name != 'master':
+                worker_rss.append(mem.get('Rss', 0))
+            print(f"{name:<18} {mem.get('Rss', 0):>10} {mem.get('Pss', 0):>10} {shared:>10} {private:>10}")
+
+        # Per-worker loading: each worker would hold the same pages, but as its
+        # own private copy, so the footprint is roughly the sum of their RSS
+        per_worker_estimate = sum(worker_rss)
+        print(f"{'total (PSS)':<18} {total_pss:>10}  <- actual footprint with pre-fork")
+        print(f"{'total (RSS)':<18} {total_rss:>10}  <- double-counts shared pages")
+        print(f"{'per-worker load':<18} {per_worker_estimate:>10}  <- estimate for uvicorn --workers {len(worker_rss)}"
+              f" (loading the artifacts costs ~{self.load_cost_kb} kB each)")
+        sys.stdout.flush()
+
+    def run(self):
+        self.preload()
+        self.sock = create_socket(self.args.host, self.args.port, self.args.backlog)
+        print(f"[prefork] listening on {self.args.host}:{self.args.port} with {self.args.workers} workers")
+        if main.UDS_PATH:
+            main.uds_listener = bind_unix_socket(main.UDS_PATH)
+
+        for slot in range(self.args.workers):
+            self.spawn(slot)
+
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGUSR1, self.report)
+
+        report_at = time.monotonic() + self.args.report_delay if self.args.report else None
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                if report_at is not None and time.monotonic() >= report_at:
+                    self.report()
+                    report_at = None
+                time.sleep(0.2)
+                continue
+
+            slot = self.workers.pop(pid, None)
+            if slot is not None and not self.stopping:
+                # Keep the pool at full size if a worker dies unexpectedly
+                print(f"[prefork] worker {slot} (pid {pid}) exited with status {status}, restarting")
+                self.spawn(slot)
+
+        self.sock.close()
+        if main.uds_listener is not None:
+            main.uds_listener.close()
+        print("[prefork] all workers stopped")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description='Pre-fork server for the wine quality inference service')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Defaults to the number of cores')
+    parser.add_argument('--backlog', type=int, default=2048)
+    parser.add_argument('--log-level', default='info')
+    parser.add_argument('--report', action='store_true', help='Print per-worker memory once the workers are up (also on SIGUSR1)')
+    parser.add_argument('--report-delay', type=float, default=5.0)
+    args = parser.parse_args()
+
+    if not hasattr(os, 'fork'):
+        print("Pre-fork mode needs os.fork (Linux/macOS). Use `uvicorn --workers N` on this platform.")
+        sys.exit(1)
+
+    PreforkMaster(args).run()
+
+
+if __name__ == "__main__":
+    main_cli()
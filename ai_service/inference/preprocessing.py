@@ -0,0 +1,201 @@
+import math
+import threading
+from operator import attrgetter
+
+import numpy as np
+
+from .schemas import WineInput
+
+
+class InputGuard:
+    """Fills missing readings and clips out-of-range ones, in raw feature space.
+
+    A missing (None/NaN/inf) reading gets the training median from
+    imputation_values; older artifacts without a median for a column fall
+    back to the scaler's training mean. Readings are clipped to the range
+    seen in training when the bundle records one (feature_ranges).
+
+    repair() works in place on whole matrices and allocates nothing for
+    complete batches: one sum tells whether any reading is missing (only then
+    is a mask built), and clipping is two in-place ufuncs, cheaper than
+    checking the bounds first.
+    """
+
+    def __init__(self, feature_names, imputation_values, feature_ranges, scaler, categorical=()):
+        self.feature_names = list(feature_names)
+        n_features = len(self.feature_names)
+        mean = scaler.mean_ if scaler.with_mean else np.zeros(n_features)
+        self.fill = np.array([
+            0.0 if col in categorical else float(imputation_values.get(col, mean[pos]))
+            for pos, col in enumerate(self.feature_names)
+        ])
+        ranges = feature_ranges or {}
+        self.low = np.array([ranges[col][0] if col in ranges else -np.inf for col in self.feature_names])
+        self.high = np.array([ranges[col][1] if col in ranges else np.inf for col in self.feature_names])
+        self.bounded = bool(ranges)
+
+        # Schema aliases ("fixed acidity") -> WineInput attribute names (fixed_acidity)
+        alias_to_field = {(info.alias or name): name for name, info in WineInput.model_fields.items()}
+        self._getter = attrgetter(*(alias_to_field[col] for col in self.feature_names))
+        self._numeric = [pos for pos, col in enumerate(self.feature_names) if col not in categorical]
+
+    def repair(self, X):
+        # X: raw (n, n_features) float64 matrix, modified in place
+        if not np.isfinite(np.add.reduce(X, axis=None)):
+            np.copyto(X, self.fill, where=~np.isfinite(X))
+        if self.bounded:
+            np.maximum(X, self.low, out=X)
+            np.minimum(X, self.high, out=X)
+        return X
+
+    def flag_matrix(self, raw):
+        # Per-row flags for a raw matrix, before repair: bit 0 imputed, bit 1
+        # clipped. Readings only, like flags(): a missing category isn't imputed
+        flags = np.zeros(len(raw), dtype=np.uint8)
+        if not np.isfinite(np.add.reduce(raw, axis=None)):
+            flags |= ~np.isfinite(raw[:, self._numeric]).all(axis=1)
+        if self.bounded:
+            # Bounds in the matrix's own precision, so a float32 reading at the edge isn't flagged
+            low, high = self.low.astype(raw.dtype), self.high.astype(raw.dtype)
+            flags |= ((raw < low) | (raw > high)).any(axis=1).astype(np.uint8) << 1
+        return flags
+
+    def repair_frame(self, df):
+        # DataFrame path, same rules
+        df = df.astype(np.float64).replace([np.inf, -np.inf], np.nan)
+        df = df.fillna(dict(zip(self.feature_names, self.fill)))
+        if self.bounded:
+            df = df.clip(self.low, self.high, axis=1)
+        return df
+
+    def flags(self, wine):
+        # Which readings of this wine get imputed or clipped; None when it is clean
+        values = self._getter(wine)
+        imputed = clipped = None
+        for pos in self._numeric:
+            value = values[pos]
+            if value is None or not math.isfinite(value):
+                imputed = (imputed or []) + [self.feature_names[pos]]
+            elif not self.low[pos] <= value <= self.high[pos]:
+                clipped = (clipped or []) + [self.feature_names[pos]]
+        if imputed is None and clipped is None:
+            return None
+        return {"imputed": imputed, "clipped": clipped}
+
+
+class FeatureVectorizer:
+    """Turns validated WineInput objects into scaled model input arrays.
+
+    Built once from the loaded label encoders, feature order and scaler so the
+    request path never touches pandas or sklearn.
+    """
+
+    def __init__(self, label_encoders, feature_names, scaler, guard=None):
+        self.feature_names = list(feature_names)
+        self.guard = guard  # InputGuard applied to every matrix before scaling
+        self.n_features = len(self.feature_names)
+
+        # Schema aliases ("fixed acidity") -> WineInput attribute names (fixed_acidity)
+        alias_to_field = {(info.alias or name): name for name, info in WineInput.model_fields.items()}
+        self._fields = [alias_to_field[col] for col in self.feature_names]
+        self._getter = attrgetter(*self._fields)
+
+        # Column position -> {label: code}, same codes as LabelEncoder.transform
+        self._categorical = {}
+        for col, le in label_encoders.items():
+            if col in self.feature_names:
+                self._categorical[self.feature_names.index(col)] = {
+                    label: code for code, label in enumerate(le.classes_)
+                }
+
+        # StandardScaler parameters, applied with the same arithmetic as scaler.transform
+        self._mean = np.asarray(scaler.mean_ if scaler.with_mean else np.zeros(self.n_features), dtype=np.float64)
+        self._scale = np.asarray(scaler.scale_ if scaler.with_std else np.ones(self.n_features), dtype=np.float64)
+
+        # One preallocated row per worker thread (FastAPI runs sync handlers in a threadpool)
+        self._local = threading.local()
+
+    def raw_values(self, wine):
+        values = list(self._getter(wine))
+        if None in values:
+            # Dead sensor: NaN here, the guard fills it
+            values = [np.nan if value is None else value for value in values]
+        for pos, mapping in self._categorical.items():
+            # Unseen labels fall back to 0, same as the DataFrame path
+            values[pos] = mapping.get(values[pos], 0)
+        return values
+
+    def _scale_inplace(self, X):
+        if self.guard is not None:
+            self.guard.repair(X)
+        np.subtract(X, self._mean, out=X)
+        np.divide(X, self._scale, out=X)
+        return X
+
+    def transform_one(self, wine):
+        # Returns this thread's reusable (1, n_features) buffer: consume it
+        # before the next call on the same thread.
+        row = getattr(self._local, "row", None)
+        if row is None:
+            row = np.empty((1, self.n_features), dtype=np.float64)
+            self._local.row = row
+        row[0] = self.raw_values(wine)
+        return self._scale_inplace(row)
+
+    def transform_many(self, wines):
+        X = np.empty((len(wines), self.n_features), dtype=np.float64)
+        for i, wine in enumerate(wines):
+            X[i] = self.raw_values(wine)
+        return self._scale_inplace(X)
+
+    def transform_columns(self, columns):
+        # Bulk path: {column name or field name: 1-D array} -> scaled matrix,
+        # filled one column at a time (no per-row objects). The categorical
+        # column may hold labels ("white") or already-encoded codes.
+        X = None
+        for pos, (col, field) in enumerate(zip(self.feature_names, self._fields)):
+            values = columns.get(col)
+            if values is None:
+                values = columns.get(field)
+            if values is None:
+                raise ValueError(f"Missing column '{col}'")
+            if pos in self._categorical:
+                values = self._encode_labels(values, self._categorical[pos])
+            try:
+                values = np.asarray(values, dtype=np.float64)
+            except (TypeError, ValueError):
+                raise ValueError(f"Column '{col}' is not numeric")
+            if values.ndim != 1:
+                raise ValueError(f"Column '{col}' must be one-dimensional")
+            if X is None:
+                X = np.empty((len(values), self.n_features), dtype=np.float64)
+            elif len(values) != len(X):
+                raise ValueError(f"Column '{col}' has {len(values)} values, expected {len(X)}")
+            X[:, pos] = values
+        return self._scale_inplace(X)
+
+    def transform_matrix(self, raw):
+        # Bulk path: unscaled (n, n_features) matrix in feature order, categorical
+        # columns already encoded. Always copies, so read-only buffers are fine.
+        X = np.array(raw, dtype=np.float64, ndmin=2)
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features per row, got {X.shape[1]}")
+        return self._scale_inplace(X)
+
+    def layout(self):
+        # Column order and label codes for clients building matrices themselves
+        return {
+            "feature_names": self.feature_names,
+            "categories": {self.feature_names[pos]: mapping for pos, mapping in self._categorical.items()},
+        }
+
+    @staticmethod
+    def _encode_labels(values, mapping):
+        labels = np.asarray(values)
+        if labels.dtype.kind in "iuf":
+            return labels
+        # Unseen labels fall back to 0, same as the per-row path
+        codes = np.zeros(len(labels), dtype=np.float64)
+        for label, code in mapping.items():
+            codes[labels == label] = code
+        return codes
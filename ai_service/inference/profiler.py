@@ -0,0 +1,101 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+# In-process sampling profiler for /debug/profile.
+#
+# A background thread wakes up `hz` times a second, grabs every other
+# thread's current Python stack with sys._current_frames() and counts it.
+# Nothing is installed in the profiled code (no sys.setprofile/settrace), so
+# requests run at full speed; the cost is one short GIL hold per sample,
+# reported back as the overhead fraction. The output is the collapsed-stack
+# format ("thread;outer;...;leaf count" per line) read by flamegraph.pl,
+# speedscope and inferno.
+
+# Leaf frames in these stdlib modules mean the thread is parked, not working
+# (an idle executor worker sits in _worker, blocked on its C-level queue)
+IDLE_FILES = ("threading.py", "selectors.py", "queue.py", os.path.join("concurrent", "futures", "thread.py"))
+
+
+class ProfilerBusy(Exception):
+    pass
+
+
+class SamplingProfiler:
+    def __init__(self):
+        self._running = threading.Lock()
+        self._labels = {}  # code object -> frame label
+        self._prefixes = sorted({os.path.abspath(p) + os.sep for p in sys.path if p}, key=len, reverse=True)
+
+    def profile(self, seconds, hz=100, include_idle=False):
+        # Blocks for `seconds`; one profile at a time per process
+        if not self._running.acquire(blocking=False):
+            raise ProfilerBusy("A profile is already running in this process")
+        try:
+            return self._sample(seconds, hz, include_idle)
+        finally:
+            self._running.release()
+
+    def _sample(self, seconds, hz, include_idle):
+        me = threading.get_ident()
+        interval = 1.0 / hz
+        stacks = Counter()
+        samples = 0
+        busy = 0.0
+
+        start = time.perf_counter()
+        deadline = start + seconds
+        next_tick = start
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now < next_tick:
+                time.sleep(next_tick - now)
+                continue
+            next_tick += interval
+
+            tick = time.perf_counter()
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                if not include_idle and frame.f_code.co_filename.endswith(IDLE_FILES):
+                    continue
+                stacks[self._collapse(names.get(ident, f"thread-{ident}"), frame)] += 1
+            samples += 1
+            busy += time.perf_counter() - tick
+
+        elapsed = time.perf_counter() - start
+        collapsed = "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        return collapsed, {
+            "pid": os.getpid(),
+            "seconds": round(elapsed, 3),
+            "samples": samples,
+            "stacks": len(stacks),
+            "overhead": round(busy / elapsed, 5) if elapsed else 0.0,
+        }
+
+    def _collapse(self, thread_name, frame):
+        labels = []
+        while frame is not None:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        labels.append(thread_name.replace(";", ":"))
+        return ";".join(reversed(labels))
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            for prefix in self._prefixes:
+                if filename.startswith(prefix):
+                    filename = filename[len(prefix):]
+                    break
+            name = getattr(code, "co_qualname", code.co_name)
+            # ";" separates frames in the collapsed format
+            label = f"{name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+            self._labels[code] = label
+        return label
@@ -0,0 +1,367 @@
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+from .schemas import WineInput, VERSION_ID_PATTERN
+from .preprocessing import FeatureVectorizer, InputGuard
+from .engines import build_engine, check_parity, XGBoostEngine
+from .intervals import IntervalHeads
+from .cache import PredictionCache
+from .bundle import load_artifacts_dir
+from .metrics import STAGE_LATENCY, BATCH_SIZE, muted, now
+
+# Batch sizes exercised by warmup before a version may serve traffic
+WARMUP_BATCH_SIZES = (1, 16, 64)
+
+
+class ModelVersion:
+    """One loaded model with everything needed to serve it.
+
+    Requests grab a reference to a version when they start and use only that
+    object, so swapping the registry's active version never affects requests
+    already in flight: the old version stays alive until they drop it.
+    """
+
+    def __init__(self, version_id, artifacts, engine_name, booster_threads=None):
+        self.version_id = version_id
+        self.artifacts = artifacts
+        self.model = artifacts.model
+        self.scaler = artifacts.scaler
+        self.label_encoders = artifacts.label_encoders
+        self.imputation_values = artifacts.imputation_values
+        self.feature_names = artifacts.feature_names
+
+        self.guard = InputGuard(self.feature_names, self.imputation_values, artifacts.feature_ranges,
+                                self.scaler, categorical=self.label_encoders)
+        self.vectorizer = self.build_vectorizer()
+        self.engine = self.select_engine(engine_name)
+        if booster_threads is not None:
+            self.engine.set_threads(booster_threads)
+        self.intervals = self.build_intervals()
+
+        self.loaded_at = time.time()
+        self.load_ms = None
+        self.warmup_ms = None
+        self.in_flight = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def preprocess_frame(self, df):
+        # DataFrame path (must match training logic exactly)
+
+        # Handle Categorical (Type)
+        start = now()
+        for col, le in self.label_encoders.items():
+            if col in df.columns:
+                # Encode row by row so one unseen label doesn't break the rest of a batch.
+                # Unseen labels fall back to 0, same as before.
+                mapping = {label: code for code, label in enumerate(le.classes_)}
+                df[col] = [mapping.get(value, 0) for value in df[col]]
+
+        # Ensure column order matches training
+        # Reorder columns to match feature_names, then fill missing / clip out-of-range readings
+        df = self.guard.repair_frame(df[self.feature_names])
+        encoded = now()
+        STAGE_LATENCY.observe(encoded - start, "encode")
+
+        # Scale features
+        X_scaled = self.scaler.transform(df)
+        STAGE_LATENCY.observe(now() - encoded, "scale")
+        return X_scaled
+
+    def build_vectorizer(self):
+        # Precompile the NumPy fast path and check it against the DataFrame path
+        # on the schema example (both wine types) before trusting it.
+        # pandas is imported here and in the fallbacks below, not at module load.
+        import pandas as pd
+        fast = FeatureVectorizer(self.label_encoders, self.feature_names, self.scaler, self.guard)
+        for wine in example_wines(self.label_encoders):
+            with muted():
+                expected = self.preprocess_frame(pd.DataFrame([wine.model_dump(by_alias=True)]))
+            if not np.array_equal(fast.transform_one(wine), expected):
+                print("WARNING: NumPy preprocessing does not match the DataFrame path, falling back to pandas")
+                return None
+        return fast
+
+    def select_engine(self, name):
+        # Alternative engines must reproduce model.predict before they serve traffic
+        if name == XGBoostEngine.name:
+            return XGBoostEngine(self.model)
+        try:
+            candidate = build_engine(name, self.model, self.artifacts)
+            diff = check_parity(candidate, len(self.feature_names))
+            print(f"Inference engine '{name}' enabled (max diff vs reference: {diff:.3g})")
+            return candidate
+        except Exception as e:
+            print(f"WARNING: Inference engine '{name}' unavailable ({e}), falling back to '{XGBoostEngine.name}'")
+            return XGBoostEngine(self.model)
+
+    def build_intervals(self):
+        # Quantile heads from the bundle, if it has them and they check out
+        if self.artifacts.quantile_forest is None:
+            return None
+        try:
+            heads = IntervalHeads(self.artifacts.quantile_forest, self.artifacts.quantiles,
+                                  self.artifacts.quantile_model, self.engine)
+            heads.check_parity(len(self.feature_names), self.engine)
+            return heads
+        except Exception as e:
+            print(f"WARNING: Prediction intervals unavailable ({e})")
+            return None
+
+    def input_flags(self, wine):
+        # {"imputed": [...], "clipped": [...]} for responses, None for a clean reading
+        return self.guard.flags(wine)
+
+    def cache_key(self, wine, decimals):
+        # Canonical form: encoded type + rounded readings in feature order, scoped to the model
+        if self.vectorizer is not None:
+            values = self.vectorizer.raw_values(wine)
+        else:
+            input_data = wine.model_dump(by_alias=True)
+            values = [input_data[col] for col in self.feature_names]
+        return PredictionCache.make_key(self.version_id, values, decimals)
+
+    def predict_wines(self, wines):
+        # Preprocess and predict a list of validated wines as one matrix
+        return self.predict_matrix(self.transform_wines(wines))
+
+    def transform_wines(self, wines):
+        start = now()
+        if self.vectorizer is not None:
+            X_scaled = self.vectorizer.transform_many(wines)
+            STAGE_LATENCY.observe(now() - start, "vectorize")
+        else:
+            import pandas as pd
+            df = pd.DataFrame([wine.model_dump(by_alias=True) for wine in wines])
+            STAGE_LATENCY.observe(now() - start, "dataframe")
+            X_scaled = self.preprocess_frame(df)
+        return X_scaled
+
+    def predict_one(self, wine):
+        start = now()
+        if self.vectorizer is not None:
+            # 1-2. Fast path: straight into a preallocated, already scaled row
+            X_scaled = self.vectorizer.transform_one(wine)
+            STAGE_LATENCY.observe(now() - start, "vectorize")
+        else:
+            # 1. Convert input to DataFrame
+            # by_alias=True ensures we get keys like "fixed acidity" matching the schema aliases
+            input_data = wine.model_dump(by_alias=True)
+            import pandas as pd
+            df = pd.DataFrame([input_data])
+            STAGE_LATENCY.observe(now() - start, "dataframe")
+
+            # 2. Preprocessing (Must match training logic exactly)
+            X_scaled = self.preprocess_frame(df)
+
+        # 3. Predict
+        prediction = self.predict_matrix(X_scaled)
+        return prediction[0]
+
+    def predict_interval(self, wine):
+        # Point score, interval bounds and class confidence for one wine
+        if self.vectorizer is not None:
+            start = now()
+            X_scaled = self.vectorizer.transform_one(wine)
+            STAGE_LATENCY.observe(now() - start, "vectorize")
+        else:
+            import pandas as pd
+            X_scaled = self.preprocess_frame(pd.DataFrame([wine.model_dump(by_alias=True)]))
+        point, lower, upper, confidence = self.predict_matrix_interval(X_scaled)
+        return float(point[0]), float(lower[0]), float(upper[0]), float(confidence[0])
+
+    def predict_matrix_interval(self, X_scaled):
+        start = now()
+        point, lower, upper = self.intervals.predict(X_scaled, self.engine)
+        confidence = self.intervals.confidence(point, lower, upper)
+        STAGE_LATENCY.observe(now() - start, "predict_interval")
+        BATCH_SIZE.observe(len(X_scaled), "model")
+        return point, lower, upper, confidence
+
+    def predict_matrix(self, X_scaled):
+        start = now()
+        predictions = self.engine.predict(X_scaled)
+        STAGE_LATENCY.observe(now() - start, "predict")
+        BATCH_SIZE.observe(len(X_scaled), "model")
+        return predictions
+
+    def example_wine(self):
+        return example_wines(self.label_encoders)[0]
+
+    def warm_up(self):
+        # Touch every code path once per batch size so the first real request
+        # doesn't pay for lazy initialization inside XGBoost/NumPy
+        start = time.perf_counter()
+        self.synthetic_predictions(WARMUP_BATCH_SIZES)
+        self.warmup_ms = (time.perf_counter() - start) * 1000
+
+    def synthetic_predictions(self, batch_sizes):
+        # Schema examples through the single, batch and interval paths on the
+        # calling thread, left out of the metrics; returns ms per batch size
+        wines = example_wines(self.label_encoders)
+        timings = {}
+        with muted():
+            for wine in wines:
+                self.predict_one(wine)
+            for batch_size in batch_sizes:
+                start = time.perf_counter()
+                self.predict_wines([wines[i % len(wines)] for i in range(batch_size)])
+                timings[batch_size] = (time.perf_counter() - start) * 1000
+            if self.intervals is not None:
+                self.predict_interval(wines[0])
+        return timings
+
+    def __enter__(self):
+        with self._lock:
+            self.in_flight += 1
+            self.requests += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._lock:
+            self.in_flight -= 1
+        return False
+
+    def info(self):
+        return {
+            "version_id": self.version_id,
+            "source": self.artifacts.source,
+            "dataset_hash": self.artifacts.manifest.get("dataset_hash"),
+            "engine": self.engine.name,
+            "booster_threads": self.engine.threads,
+            "intervals": self.intervals.mode if self.intervals is not None else None,
+            "loaded_at": self.loaded_at,
+            "load_ms": self.load_ms,
+            "warmup_ms": self.warmup_ms,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+        }
+
+
+class ModelRegistry:
+    """Live model versions plus the one currently serving unpinned traffic.
+
+    New versions load and warm up on a background thread. Activation is a
+    single reference assignment, so requests see either the old or the new
+    version, never a half-loaded one.
+    """
+
+    def __init__(self, versions_dir, engine_name, verify=True, booster_threads=None):
+        self.versions_dir = versions_dir
+        self.engine_name = engine_name
+        self.booster_threads = booster_threads
+        self.verify = verify
+        self.versions = {}
+        self.loading = {}  # version_id -> {"state": ..., "error": ...}
+        self.on_activate = []  # callbacks(version), e.g. cache invalidation
+        self._active = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        return self._active
+
+    def resolve(self, version_id=None):
+        # Unpinned requests get the active version; pinned ones must name a loaded version
+        if version_id is None:
+            return self._active
+        return self.versions.get(version_id)
+
+    def version_path(self, version_id):
+        # Artifacts get unpickled: only plain names, resolving to a directory
+        # directly inside versions_dir (no "..", absolute paths or symlinks out)
+        if not isinstance(version_id, str) or not re.fullmatch(VERSION_ID_PATTERN, version_id):
+            raise ValueError(f"Invalid model version id {version_id!r}")
+        root = os.path.realpath(self.versions_dir)
+        path = os.path.realpath(os.path.join(root, version_id))
+        if os.path.dirname(path) != root:
+            raise ValueError(f"Model version {version_id!r} resolves outside {self.versions_dir}")
+        return path
+
+    def load(self, path, version_id=None, activate=False):
+        # Blocking load + warmup; returns the ready ModelVersion
+        start = time.perf_counter()
+        artifacts = load_artifacts_dir(os.path.abspath(path), verify=self.verify)
+        version_id = version_id or artifacts.version
+        print(f"Artifacts loaded successfully from {artifacts.source} (model version {version_id}).")
+
+        version = ModelVersion(version_id, artifacts, self.engine_name, self.booster_threads)
+        version.load_ms = (time.perf_counter() - start) * 1000
+        version.warm_up()
+
+        with self._lock:
+            if version_id in self.versions:
+                raise ValueError(f"Model version '{version_id}' is already loaded")
+            self.versions[version_id] = version
+        if activate:
+            self.activate(version_id)
+        return version
+
+    def load_in_background(self, path, version_id, activate=False):
+        with self._lock:
+            if version_id in self.versions or self.loading.get(version_id, {}).get("state") == "loading":
+                raise ValueError(f"Model version '{version_id}' is already loaded or loading")
+            self.loading[version_id] = {"state": "loading", "error": None}
+
+        def run():
+            try:
+                self.load(path, version_id, activate)
+                self.loading[version_id] = {"state": "ready", "error": None}
+            except Exception as e:
+                print(f"Error loading model version {version_id}: {e}")
+                self.loading[version_id] = {"state": "failed", "error": str(e)}
+
+        threading.Thread(target=run, name=f"model-load-{version_id}", daemon=True).start()
+
+    def activate(self, version_id):
+        version = self.versions.get(version_id)
+        if version is None:
+            raise KeyError(version_id)
+        # The swap itself: one reference assignment
+        self._active = version
+        for callback in self.on_activate:
+            callback(version)
+        print(f"Model version {version_id} is now active.")
+        return version
+
+    def set_booster_threads(self, threads):
+        # Applies to every loaded version and to versions loaded later
+        self.booster_threads = threads
+        for version in list(self.versions.values()):
+            version.engine.set_threads(threads)
+
+    def unload(self, version_id):
+        with self._lock:
+            version = self.versions.get(version_id)
+            if version is None:
+                raise KeyError(version_id)
+            if version is self._active:
+                raise ValueError("Cannot unload the active model version")
+            # Requests still holding it finish normally; memory goes with the last reference
+            del self.versions[version_id]
+            self.loading.pop(version_id, None)
+        return version
+
+    def clear(self):
+        with self._lock:
+            self._active = None
+            self.versions.clear()
+            self.loading.clear()
+
+    def info(self):
+        return {
+            "active": self._active.version_id if self._active is not None else None,
+            "versions": [v.info() for v in self.versions.values()],
+            "loading": self.loading,
+        }
+
+
+def example_wines(label_encoders):
+    # The schema example, once per known wine type
+    example = WineInput.model_json_schema()["example"]
+    types = label_encoders['type'].classes_ if 'type' in label_encoders else [example["type"]]
+    return [WineInput.model_validate({**example, "type": str(wine_type)}) for wine_type in types]
@@ -0,0 +1,227 @@
+import bisect
+import hashlib
+import time
+
+# Consistent-hash routing of warehouses onto inference replicas.
+#
+# Every replica owns `vnodes` points on a 64-bit hash ring; a shard key
+# (the warehouse id, or "warehouse:line" when sharding by line) belongs to
+# the first point clockwise from its own hash. Adding or removing a replica
+# only moves the keys on the arcs that replica gains or loses, about 1/N of
+# them, so every other replica keeps its warehouses - and with them its warm
+# prediction cache and resident warehouse models.
+#
+# ReplicaSet keeps the health state: only healthy replicas are on the ring.
+# A replica leaves after `fall` failed checks in a row and comes back after
+# `rise` good ones, so a single slow check doesn't shuffle keys back and forth.
+#
+# Standard library only, so a client can route by itself without the gateway.
+
+
+def ring_hash(key):
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def shard_key(warehouse_id, line_id=None):
+    if warehouse_id is None:
+        return None
+    return f"{warehouse_id}" if line_id is None else f"{warehouse_id}:{line_id}"
+
+
+class HashRing:
+    def __init__(self, nodes=(), vnodes=128):
+        self.vnodes = vnodes
+        self._points = []  # sorted hashes
+        self._owners = []  # node of each point
+        self.nodes = set()
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node):
+        if node in self.nodes:
+            return False
+        for i in range(self.vnodes):
+            point = ring_hash(f"{node}#{i}")
+            at = bisect.bisect(self._points, point)
+            self._points.insert(at, point)
+            self._owners.insert(at, node)
+        self.nodes.add(node)
+        return True
+
+    def remove(self, node):
+        if node not in self.nodes:
+            return False
+        keep = [i for i, owner in enumerate(self._owners) if owner != node]
+        self._points = [self._points[i] for i in keep]
+        self._owners = [self._owners[i] for i in keep]
+        self.nodes.discard(node)
+        return True
+
+    def lookup(self, key):
+        if not self._points:
+            return None
+        at = bisect.bisect(self._points, ring_hash(key)) % len(self._points)
+        return self._owners[at]
+
+    def preference(self, key, limit=None):
+        # Distinct nodes clockwise from the key: the owner first, then where
+        # the key would go if the ones before it were gone
+        if not self._points:
+            return []
+        limit = min(limit or len(self.nodes), len(self.nodes))
+        start = bisect.bisect(self._points, ring_hash(key))
+        nodes = []
+        for i in range(len(self._points)):
+            owner = self._owners[(start + i) % len(self._points)]
+            if owner not in nodes:
+                nodes.append(owner)
+                if len(nodes) == limit:
+                    break
+        return nodes
+
+    def shares(self):
+        # Fraction of the hash space each node owns
+        shares = dict.fromkeys(self.nodes, 0.0)
+        if not self._points:
+            return shares
+        previous = self._points[-1] - 2 ** 64
+        for point, owner in zip(self._points, self._owners):
+            shares[owner] += (point - previous) / 2 ** 64
+            previous = point
+        return shares
+
+
+class Replica:
+    def __init__(self, url):
+        self.url = url
+        self.healthy = False
+        self.has_left = False
+        self.failures = 0
+        self.successes = 0
+        self.last_check = None
+        self.last_error = None
+        self.check_ms = None
+        self.model_version = None
+        self.requests = 0
+        self.errors = 0
+
+    def stats(self):
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "model_version": self.model_version,
+            "check_ms": self.check_ms,
+            "last_check_age_s": None if self.last_check is None else round(time.monotonic() - self.last_check, 3),
+            "last_error": self.last_error,
+            "requests": self.requests,
+            "errors": self.errors,
+        }
+
+
+class ReplicaSet:
+    """Replicas, their health, and the ring of the healthy ones.
+
+    A new replica joins the ring on its first good check (or when added with
+    healthy=True); one that has left needs `rise` good checks to come back. Keys are routed with route(), which
+    returns the owner first and the fail-over order after it.
+    """
+
+    def __init__(self, urls=(), vnodes=128, fall=2, rise=2):
+        self.ring = HashRing(vnodes=vnodes)
+        self.fall = fall
+        self.rise = rise
+        self.replicas = {}
+        self.rebalances = []  # recent membership changes, newest last
+        self.on_join = []  # callbacks(url), e.g. to warm the replica up
+        self._round_robin = 0
+        for url in urls:
+            self.add(url)
+
+    def add(self, url, healthy=False):
+        url = url.rstrip("/")
+        if url not in self.replicas:
+            self.replicas[url] = Replica(url)
+        if healthy:
+            self._join(self.replicas[url])
+        return self.replicas[url]
+
+    def remove(self, url):
+        replica = self.replicas.pop(url.rstrip("/"), None)
+        if replica is not None and replica.healthy:
+            self._leave(replica, "removed")
+        return replica
+
+    def owns(self, url, key):
+        return self.ring.lookup(key) == url
+
+    def route(self, key, attempts=2):
+        # Unkeyed requests have no cache affinity to keep: spread them
+        if key is None:
+            healthy = sorted(self.ring.nodes)
+            if not healthy:
+                return []
+            self._round_robin = (self._round_robin + 1) % len(healthy)
+            return (healthy[self._round_robin:] + healthy[:self._round_robin])[:attempts]
+        return self.ring.preference(key, attempts)
+
+    def record_check(self, url, ok, elapsed=None, model_version=None, error=None):
+        replica = self.replicas.get(url)
+        if replica is None:
+            return
+        replica.last_check = time.monotonic()
+        replica.check_ms = None if elapsed is None else round(elapsed * 1000, 3)
+        if ok:
+            replica.model_version = model_version
+            replica.last_error = None
+            replica.failures = 0
+            replica.successes += 1
+            if not replica.healthy and (replica.successes >= self.rise or not replica.has_left):
+                self._join(replica)
+        else:
+            self.record_failure(url, error)
+
+    def record_failure(self, url, error=None):
+        replica = self.replicas.get(url)
+        if replica is None:
+            return
+        replica.last_error = error
+        replica.successes = 0
+        replica.failures += 1
+        if replica.healthy and replica.failures >= self.fall:
+            self._leave(replica, error or "failed checks")
+
+    def _join(self, replica):
+        replica.healthy = True
+        replica.failures = 0
+        self._rebalance(replica.url, "joined", self.ring.add)
+        for callback in self.on_join:
+            callback(replica.url)
+
+    def _leave(self, replica, reason):
+        replica.healthy = False
+        replica.has_left = True
+        self._rebalance(replica.url, f"left: {reason}", self.ring.remove)
+
+    def _rebalance(self, url, event, change):
+        before = self.ring.shares()
+        if not change(url):
+            return
+        after = self.ring.shares()
+        # Share of the key space that changed owner: what url gained or lost
+        moved = abs(after.get(url, 0.0) - before.get(url, 0.0))
+        self.rebalances.append({"time": time.time(), "replica": url, "event": event,
+                                "moved_fraction": round(moved, 4), "replicas": len(self.ring.nodes)})
+        del self.rebalances[:-20]
+
+    def stats(self):
+        shares = self.ring.shares()
+        return {
+            "healthy": len(self.ring.nodes),
+            "total": len(self.replicas),
+            "vnodes": self.ring.vnodes,
+            "replicas": [
+                {**replica.stats(), "ring_share": round(shares.get(url, 0.0), 4)}
+                for url, replica in sorted(self.replicas.items())
+            ],
+            "rebalances": self.rebalances,
+        }
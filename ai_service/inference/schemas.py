@@ -1,18 +1,42 @@
-from pydantic import BaseModel, Field
+import math
+import os
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, model_validator
+
+# Fewest real (present and finite) readings a wine needs. Below that its
+# score would mostly be training medians, so it fails validation (422).
+MIN_READINGS = int(os.environ.get("MIN_READINGS", "6"))
+
+READING_FIELDS = (
+    "fixed_acidity", "volatile_acidity", "citric_acid", "residual_sugar", "chlorides", "free_sulfur_dioxide",
+    "total_sulfur_dioxide", "density", "pH", "sulphates", "alcohol",
+)
 
 class WineInput(BaseModel):
     type: str = Field(..., description="Type of wine (e.g., 'white', 'red')")
-    fixed_acidity: float = Field(..., alias="fixed acidity")
-    volatile_acidity: float = Field(..., alias="volatile acidity")
-    citric_acid: float = Field(..., alias="citric acid")
-    residual_sugar: float = Field(..., alias="residual sugar")
-    chlorides: float
-    free_sulfur_dioxide: float = Field(..., alias="free sulfur dioxide")
-    total_sulfur_dioxide: float = Field(..., alias="total sulfur dioxide")
-    density: float
-    pH: float
-    sulphates: float
-    alcohol: float
+    # Readings may be missing (dead sensor) or out of range: the service fills
+    # them with the training median or clips them, and flags the response
+    fixed_acidity: Optional[float] = Field(None, alias="fixed acidity")
+    volatile_acidity: Optional[float] = Field(None, alias="volatile acidity")
+    citric_acid: Optional[float] = Field(None, alias="citric acid")
+    residual_sugar: Optional[float] = Field(None, alias="residual sugar")
+    chlorides: Optional[float] = None
+    free_sulfur_dioxide: Optional[float] = Field(None, alias="free sulfur dioxide")
+    total_sulfur_dioxide: Optional[float] = Field(None, alias="total sulfur dioxide")
+    density: Optional[float] = None
+    pH: Optional[float] = None
+    sulphates: Optional[float] = None
+    alcohol: Optional[float] = None
+    # Routes to the warehouse's own model when it has one (line metadata, not a feature)
+    warehouse_id: Optional[int] = Field(None, description="Warehouse the reading comes from")
+
+    @model_validator(mode="after")
+    def enough_readings(self):
+        present = sum(1 for name in READING_FIELDS
+                      if getattr(self, name) is not None and math.isfinite(getattr(self, name)))
+        if present < MIN_READINGS:
+            raise ValueError(f"only {present} of {len(READING_FIELDS)} readings present, at least {MIN_READINGS} needed")
+        return self
 
     class Config:
         populate_by_name = True
@@ -36,3 +60,66 @@ class WineInput(BaseModel):
 class PredictionOutput(BaseModel):
     quality_score: float
     quality_class: int
+    model_version: Optional[str] = None
+    # Only with ?interval=true, and null for models trained without quantile heads
+    lower: Optional[float] = Field(None, description="Lower bound of the prediction interval")
+    upper: Optional[float] = Field(None, description="Upper bound of the prediction interval")
+    confidence: Optional[float] = Field(None, description="Probability that quality_class is the true class")
+    interval_available: Optional[bool] = Field(
+        None, description="Only with ?interval=true: false when the model has no quantile heads")
+    # Only when some readings were missing or out of range
+    imputed: Optional[List[str]] = Field(None, description="Readings replaced by the training median")
+    clipped: Optional[List[str]] = Field(None, description="Readings clipped to the training range")
+
+class BatchWineInput(BaseModel):
+    # Items are validated one by one in the endpoint so a single bad wine
+    # (even one that isn't an object) only fails its own slot instead of
+    # rejecting the whole batch
+    items: List[Any] = Field(..., description="Wines to score, same fields as /predict")
+
+class BatchItemOutput(BaseModel):
+    index: int
+    quality_score: Optional[float] = None
+    quality_class: Optional[int] = None
+    imputed: Optional[List[str]] = None
+    clipped: Optional[List[str]] = None
+    error: Optional[str] = None
+
+class BatchPredictionOutput(BaseModel):
+    results: List[BatchItemOutput]
+    model_version: Optional[str] = None
+
+class ExplainInput(WineInput):
+    product_id: Optional[str] = Field(None, description="Echoed back, e.g. the product being explained")
+
+class ExplainBatchInput(BaseModel):
+    batch_id: Optional[int] = Field(None, description="Production batch the items belong to, echoed back")
+    items: List[Any] = Field(..., description="Wines to explain, same fields as /explain")
+
+class ExplanationOutput(BaseModel):
+    product_id: Optional[str] = None
+    quality_score: float
+    base_value: float = Field(..., description="Model output before any feature contributes")
+    contributions: Dict[str, float] = Field(..., description="Per-feature TreeSHAP values, summing to quality_score - base_value")
+    model_version: Optional[str] = None
+
+class BatchExplanationItem(BaseModel):
+    index: int
+    product_id: Optional[str] = None
+    quality_score: Optional[float] = None
+    base_value: Optional[float] = None
+    contributions: Optional[Dict[str, float]] = None
+    error: Optional[str] = None
+
+class BatchExplanationOutput(BaseModel):
+    batch_id: Optional[int] = None
+    results: List[BatchExplanationItem]
+    model_version: Optional[str] = None
+    cached: int = 0
+
+# Model version ids double as directory names under MODEL_VERSIONS_DIR
+VERSION_ID_PATTERN = r"^[A-Za-z0-9][A-Za-z0-9._-]*$"
+
+class LoadModelInput(BaseModel):
+    version_id: str = Field(..., pattern=VERSION_ID_PATTERN, description="Version name, e.g. the ai_model.version in the DB ('v1.0')")
+    activate: bool = Field(False, description="Switch unpinned traffic to this version once it is warm")
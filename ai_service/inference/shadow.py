@@ -0,0 +1,251 @@
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from .execution import InferenceExecutor
+from .metrics import METRICS, STAGE_LATENCY, BATCH_SIZE, muted, now
+
+# Shadow scoring of candidate models on live traffic.
+#
+# The live response never waits for a candidate: after a request is
+# answered, offer() samples its rows into a bounded queue and returns. A
+# background task drains the queue in batches onto its own executor, whose
+# threads run at a lower OS priority (nice), and holds back while live
+# requests are queued for admission. When the queue is full, new samples are
+# dropped, never live work.
+#
+# Each batch is scored by every candidate and, for a fair latency
+# comparison, by the live model again on the same thread and batch. Stats
+# are kept per (candidate, live model) pair: divergence of the scores
+# (mean/max absolute, bias, RMSE, class agreement, recent quantiles) and the
+# latency of both models.
+
+DIVERGENCE = METRICS.histogram(
+    "wine_shadow_divergence", "Absolute score difference between a candidate and the live model",
+    labels=("candidate",), buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0))
+SHADOW_ROWS = METRICS.counter(
+    "wine_shadow_rows_total", "Rows offered to shadow scoring, by outcome", labels=("outcome",))
+
+RECENT = 4096  # rows/batches kept for quantiles
+
+
+class ShadowStats:
+    def __init__(self):
+        self.rows = 0
+        self.batches = 0
+        self.sum_abs = 0.0
+        self.sum_sq = 0.0
+        self.sum_signed = 0.0
+        self.max_abs = 0.0
+        self.class_agree = 0
+        self.recent_abs = deque(maxlen=RECENT)
+        self.candidate_ms = deque(maxlen=RECENT)  # per batch
+        self.live_ms = deque(maxlen=RECENT)
+        self.candidate_seconds = 0.0
+        self.live_seconds = 0.0
+        self.last_seen = None
+
+    def record(self, live_scores, candidate_scores, live_seconds, candidate_seconds):
+        diff = candidate_scores - live_scores
+        abs_diff = np.abs(diff)
+        self.rows += len(diff)
+        self.batches += 1
+        self.sum_abs += float(abs_diff.sum())
+        self.sum_sq += float(np.dot(diff, diff))
+        self.sum_signed += float(diff.sum())
+        self.max_abs = max(self.max_abs, float(abs_diff.max()))
+        self.class_agree += int(np.count_nonzero(np.rint(candidate_scores) == np.rint(live_scores)))
+        self.recent_abs.extend(abs_diff.tolist())
+        self.candidate_ms.append(candidate_seconds * 1000)
+        self.live_ms.append(live_seconds * 1000)
+        self.candidate_seconds += candidate_seconds
+        self.live_seconds += live_seconds
+        self.last_seen = time.time()
+        return abs_diff
+
+    def summary(self):
+        if not self.rows:
+            return {"rows": 0}
+        recent = np.asarray(self.recent_abs)
+        return {
+            "rows": self.rows,
+            "batches": self.batches,
+            "divergence": {
+                "mean_abs": self.sum_abs / self.rows,
+                "rmse": (self.sum_sq / self.rows) ** 0.5,
+                "bias": self.sum_signed / self.rows,  # candidate minus live
+                "max_abs": self.max_abs,
+                "class_agreement": self.class_agree / self.rows,
+                "recent_abs_p50": float(np.percentile(recent, 50)),
+                "recent_abs_p99": float(np.percentile(recent, 99)),
+            },
+            "latency": {
+                "avg_batch_rows": self.rows / self.batches,
+                "candidate_p50_ms": float(np.percentile(self.candidate_ms, 50)),
+                "candidate_p99_ms": float(np.percentile(self.candidate_ms, 99)),
+                "live_p50_ms": float(np.percentile(self.live_ms, 50)),
+                "live_p99_ms": float(np.percentile(self.live_ms, 99)),
+                # > 1: the candidate is slower on the same rows
+                "ratio": self.candidate_seconds / self.live_seconds if self.live_seconds else None,
+            },
+            "last_seen": self.last_seen,
+        }
+
+
+class ShadowScorer:
+    def __init__(self, registry, workers=1, sample_rate=0.05, max_batch_size=256, max_wait=0.5,
+                 max_queue=4096, nice=10, busy=None):
+        # busy: callable() -> True while live requests wait, to hold shadow work back
+        self.registry = registry
+        self.executor = InferenceExecutor(workers, name="shadow", nice=nice)
+        self.sample_rate = sample_rate
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.busy = busy
+
+        self.candidates = {}  # version_id -> time added
+        self._queue = deque()  # (live version, wine, live score)
+        self._ready = None
+        self._loop = None
+        self._task = None
+        self._random = random.Random()
+        self._stats = {}  # (candidate id, live id) -> ShadowStats
+        self._lock = threading.Lock()  # stats are written on the shadow thread, read on the loop
+
+        self.sampled = 0
+        self.dropped = 0
+        self.deferred = 0  # drain rounds held back for live traffic
+        self.errors = 0
+        self.last_error = None
+
+    def add(self, version_id):
+        if self.registry.resolve(version_id) is None:
+            raise KeyError(version_id)
+        self.candidates.setdefault(version_id, time.time())
+
+    def remove(self, version_id):
+        del self.candidates[version_id]
+        with self._lock:
+            for key in [key for key in self._stats if key[0] == version_id]:
+                del self._stats[key]
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._queue.clear()
+
+    def offer(self, version, wines, scores):
+        # After the live answer is ready: sampling only, no waiting. Safe to
+        # call from the event loop or from executor threads.
+        if not self.candidates or self._task is None:
+            return
+        for wine, score in zip(wines, scores):
+            if self._random.random() >= self.sample_rate:
+                continue
+            if len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                SHADOW_ROWS.inc("dropped")
+                continue
+            self._queue.append((version, wine, score))
+            self.sampled += 1
+            SHADOW_ROWS.inc("sampled")
+        if len(self._queue) >= self.max_batch_size:
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._ready.wait(), self.max_wait)
+            except asyncio.TimeoutError:
+                pass
+            self._ready.clear()
+            if not self._queue:
+                continue
+            if self.busy is not None and self.busy():
+                self.deferred += 1
+                continue
+            batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.max_batch_size))]
+            try:
+                await self.executor.run(self._score, batch)
+            except Exception as e:
+                self.errors += 1
+                self.last_error = str(e)
+
+    def _score(self, batch):
+        by_live = {}
+        for version, wine, score in batch:
+            group = by_live.setdefault(version.version_id, (version, [], []))
+            group[1].append(wine)
+            group[2].append(score)
+
+        for candidate_id in list(self.candidates):
+            candidate = self.registry.resolve(candidate_id)
+            if candidate is None:
+                continue  # unloaded since; its stats stay until it's removed
+            for live_id, (live, wines, live_scores) in by_live.items():
+                if live_id == candidate_id:
+                    continue
+                candidate_scores, candidate_seconds = _timed_predict(candidate, wines)
+                _, live_seconds = _timed_predict(live, wines)
+                with self._lock:
+                    stats = self._stats.get((candidate_id, live_id))
+                    if stats is None:
+                        stats = self._stats[(candidate_id, live_id)] = ShadowStats()
+                    abs_diff = stats.record(np.asarray(live_scores, dtype=np.float64), candidate_scores,
+                                            live_seconds, candidate_seconds)
+                for value in abs_diff.tolist():
+                    DIVERGENCE.observe(value, candidate_id)
+        SHADOW_ROWS.inc("scored", amount=len(batch))
+
+    def stats(self):
+        with self._lock:
+            summaries = {key: stats.summary() for key, stats in self._stats.items()}
+        candidates = {}
+        for candidate_id, added in list(self.candidates.items()):
+            candidates[candidate_id] = {
+                "added_at": added,
+                "loaded": self.registry.resolve(candidate_id) is not None,
+                "against": {live_id: summary for (c, live_id), summary in summaries.items() if c == candidate_id},
+            }
+        return {
+            "sample_rate": self.sample_rate,
+            "max_batch_size": self.max_batch_size,
+            "workers": self.executor.workers,
+            "nice": self.executor.nice,
+            "queued": len(self._queue),
+            "max_queue": self.max_queue,
+            "sampled": self.sampled,
+            "dropped": self.dropped,
+            "deferred": self.deferred,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "candidates": candidates,
+        }
+
+
+def _timed_predict(version, wines):
+    # Straight to the engine and muted, outside the version's request
+    # accounting: shadow calls show up in the "shadow" stage only, never in
+    # the live stages or request counts
+    start = now()
+    with muted():
+        scores = np.asarray(version.engine.predict(version.transform_wines(wines)), dtype=np.float64)
+    elapsed = now() - start
+    STAGE_LATENCY.observe(elapsed, "shadow")
+    BATCH_SIZE.observe(len(wines), "shadow")
+    return scores, elapsed
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import stat
+import struct
+import tempfile
+import time
+
+import numpy as np
+
+# Snapshot of warm serving state, so a restarted worker doesn't start cold
+#
+#   MAGIC (8 bytes) | format version (uint32) | reserved (uint32)
+#   manifest length (uint64) | array section offset (uint64)
+#   manifest (UTF-8 JSON)
+#   raw arrays, each starting on a 64-byte boundary
+#
+# Same layout as the model bundle (bundle.py). The manifest holds the small
+# state as JSON (calibration results, admission service time, which models
+# were loaded) and describes the cache arrays. Cache entries are grouped by
+# key shape: per group, one float64 matrix of the numeric key parts, one
+# matrix of the values, the seconds each entry had left and its LRU
+# position. A group shares the model version and any trailing key tag
+# (e.g. "interval"), so 10 000 cached predictions take ~1 MB and restore
+# with one tolist() per array.
+#
+# A missing reading is None in a cache key (see PredictionCache.make_key); it
+# is stored as NaN in the key matrix and turned back into None on restore.
+#
+# Restoring reloads the model versions named in the snapshot, so a snapshot
+# is trusted input. Keep it in a directory only the service user can write
+# (ensure_private_dir creates it 0700); read_snapshot refuses files that
+# another user owns or could have written.
+
+MAGIC = b"WQSNAPST"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+HEADER = struct.Struct("<8sIIQQ")
+
+
+def write_snapshot(path, state, caches):
+    # state: JSON-serializable dict; caches: {name: PredictionCache}
+    start = time.perf_counter()
+    arrays = {}
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "saved_at": time.time(),
+        "state": state,
+        "caches": {},
+        "arrays": {},
+    }
+    for name, cache in caches.items():
+        groups = _encode_cache(cache.entries())
+        specs = []
+        for i, ((version, suffix, kind, _, _), group) in enumerate(groups.items()):
+            prefix = f"{name}/{i}"
+            arrays[f"{prefix}/keys"] = np.asarray(group["keys"], dtype=np.float64)
+            arrays[f"{prefix}/values"] = np.asarray(group["values"], dtype=np.float32 if kind == "array" else np.float64)
+            arrays[f"{prefix}/ttl"] = np.asarray(group["ttl"], dtype=np.float32)
+            arrays[f"{prefix}/order"] = np.asarray(group["order"], dtype=np.uint32)
+            specs.append({"version": version, "suffix": list(suffix), "kind": kind, "arrays": prefix,
+                          "entries": len(group["order"])})
+        manifest["caches"][name] = specs
+
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset,
+                        "nbytes": int(array.nbytes)}
+        offset = _align(offset + array.nbytes)
+    manifest["arrays"] = layout
+    digest = hashlib.sha256()
+    for array in arrays.values():
+        digest.update(array)
+    manifest["sha256"] = digest.hexdigest()
+
+    manifest_bytes = json.dumps(manifest).encode("utf-8")
+    data_start = _align(HEADER.size + len(manifest_bytes))
+    # Fresh 0600 temp file with an unpredictable name (pre-fork workers
+    # snapshot to the same path), then an atomic rename over the snapshot
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                    dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(manifest_bytes), data_start))
+            f.write(manifest_bytes)
+            for name, array in arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(array.tobytes())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return {
+        "path": path,
+        "bytes": os.path.getsize(path),
+        "entries": {name: sum(spec["entries"] for spec in specs) for name, specs in manifest["caches"].items()},
+        "save_ms": round((time.perf_counter() - start) * 1000, 3),
+        "saved_at": manifest["saved_at"],
+    }
+
+
+def read_snapshot(path):
+    # -> (state, {cache name: [(key, value, seconds left), ...] oldest first})
+    with open(path, "rb", opener=lambda p, flags: os.open(p, flags | os.O_NOFOLLOW)) as f:
+        _check_private(os.fstat(f.fileno()), path)
+        _check_private(os.stat(os.path.dirname(os.path.abspath(path))), os.path.dirname(os.path.abspath(path)),
+                       directory=True)
+        data = f.read()
+    magic, format_version, _, manifest_len, data_start = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a state snapshot")
+    if format_version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format version {format_version}")
+    manifest = json.loads(data[HEADER.size:HEADER.size + manifest_len].decode("utf-8"))
+
+    arrays = {}
+    digest = hashlib.sha256()
+    for name, spec in manifest["arrays"].items():
+        start = data_start + spec["offset"]
+        raw = memoryview(data)[start:start + spec["nbytes"]]
+        digest.update(raw)
+        arrays[name] = np.frombuffer(raw, dtype=np.dtype(spec["dtype"])).reshape(spec["shape"])
+    if digest.hexdigest() != manifest["sha256"]:
+        raise ValueError(f"Checksum mismatch in {path}")
+
+    age = max(0.0, time.time() - manifest["saved_at"])
+    caches = {}
+    for name, specs in manifest["caches"].items():
+        caches[name] = _decode_cache(specs, arrays, age)
+    return manifest["state"], caches
+
+
+def _encode_cache(entries):
+    groups = {}
+    for order, (key, value, ttl) in enumerate(entries):
+        version, parts = key[0], list(key[1:])
+        suffix = []
+        while parts and isinstance(parts[-1], str):
+            suffix.insert(0, parts.pop())
+        if not all(v is None or isinstance(v, (int, float)) for v in parts):
+            continue
+        if None in parts:
+            parts = [np.nan if v is None else v for v in parts]
+        if isinstance(value, np.ndarray):
+            kind, value = "array", value.ravel()
+        elif isinstance(value, tuple):
+            kind = "tuple"
+        elif isinstance(value, (int, float)):
+            kind, value = "scalar", (value,)
+        else:
+            continue
+        # Shapes are part of the group so every group packs into matrices
+        group = groups.setdefault((version, tuple(suffix), kind, len(parts), len(value)),
+                                  {"keys": [], "values": [], "ttl": [], "order": []})
+        group["keys"].append(parts)
+        group["values"].append(value)
+        group["ttl"].append(ttl)
+        group["order"].append(order)
+    return groups
+
+
+def _decode_cache(specs, arrays, age):
+    entries = []
+    for spec in specs:
+        prefix = spec["arrays"]
+        ttl = arrays[f"{prefix}/ttl"] - age
+        live = ttl > 0
+        head, tail = (spec["version"],), tuple(spec["suffix"])
+        keys = arrays[f"{prefix}/keys"][live]
+        if np.isnan(keys).any():
+            keys = [[None if v != v else v for v in key] for key in keys.tolist()]
+        else:
+            keys = keys.tolist()
+        values = arrays[f"{prefix}/values"][live]
+        kind = spec["kind"]
+        if kind == "scalar":
+            values = values[:, 0].tolist()
+        elif kind == "tuple":
+            values = [tuple(row) for row in values.tolist()]
+        else:
+            values = [row.copy() for row in values]  # own rows, like the explainer caches
+        entries.extend(zip(arrays[f"{prefix}/order"][live].tolist(),
+                           (head + tuple(key) + tail for key in keys), values, ttl[live].tolist()))
+    entries.sort(key=lambda entry: entry[0])
+    return [entry[1:] for entry in entries]
+
+
+def ensure_private_dir(path):
+    # Creates the snapshot's directory 0700 if missing
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    return directory
+
+
+def _check_private(st, path, directory=False):
+    if st.st_uid != os.geteuid():
+        raise ValueError(f"{path} is not owned by this user")
+    # A sticky directory (like /tmp) stops others from replacing our files
+    if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and not (directory and st.st_mode & stat.S_ISVTX):
+        raise ValueError(f"{path} is writable by other users")
+
+
+def _align(n):
+    return (n + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
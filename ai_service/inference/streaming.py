@@ -0,0 +1,199 @@
+import asyncio
+import json
+
+from pydantic import ValidationError
+from starlette.responses import Response
+from starlette.websockets import WebSocketDisconnect
+
+from .schemas import WineInput
+
+# Streaming scoring for continuous line feeds (WebSocket and NDJSON over HTTP).
+#
+# Every stream is a bounded pipeline:
+#
+#   reader -> inbox (asyncio.Queue, maxsize=buffer_size) -> scorer -> sender
+#
+# The reader stops pulling from the socket while the inbox is full, and the
+# sender awaits the transport, which pauses once the client stops reading.
+# A slow producer or a slow consumer therefore stalls the stream at the TCP
+# level instead of growing buffers in the service. A message or line may
+# carry a list of readings, but at most buffer_size of them, so memory per
+# stream stays bounded by buffer_size readings (plus one message being
+# parsed) and one batch of results.
+
+_END = object()
+
+
+class StreamPipeline:
+    def __init__(self, score, buffer_size, max_batch):
+        # score: async callable(list of (seq, payload)) -> list of result dicts
+        self.score = score
+        self.buffer_size = buffer_size
+        self.max_batch = max_batch
+
+    async def run(self, read_items, send_results):
+        inbox = asyncio.Queue(maxsize=self.buffer_size)
+
+        async def reader():
+            try:
+                async for item in read_items():
+                    # Blocks while the inbox is full: that's the backpressure
+                    await inbox.put(item)
+            finally:
+                await inbox.put(_END)
+
+        reader_task = asyncio.create_task(reader())
+        try:
+            finished = False
+            while not finished:
+                first = await inbox.get()
+                if first is _END:
+                    break
+                # Score whatever has queued up behind the first reading as one batch
+                batch = [first]
+                while len(batch) < self.max_batch and not inbox.empty():
+                    item = inbox.get_nowait()
+                    if item is _END:
+                        finished = True
+                        break
+                    batch.append(item)
+                await send_results(await self.score(batch))
+        finally:
+            reader_task.cancel()
+            try:
+                await reader_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+def parse_payloads(text, seq, max_items):
+    # One message/line may carry a single reading or a list of up to
+    # max_items readings; a longer list is one error, not expanded
+    try:
+        payload = json.loads(text)
+    except ValueError as e:
+        return [(seq, ValueError(f"Invalid JSON: {e}"))]
+    if isinstance(payload, list):
+        if len(payload) > max_items:
+            return [(seq, ValueError(f"Too many readings in one message: {len(payload)}, at most {max_items}"))]
+        return [(seq + i, item) for i, item in enumerate(payload)]
+    return [(seq, payload)]
+
+
+def validate_items(batch):
+    # Split a batch into valid wines and per-item error results
+    wines, positions, results = [], [], [None] * len(batch)
+    for i, (seq, payload) in enumerate(batch):
+        if isinstance(payload, Exception):
+            results[i] = {"seq": seq, "error": str(payload)}
+            continue
+        try:
+            wines.append(WineInput.model_validate(payload))
+            positions.append(i)
+        except ValidationError as e:
+            results[i] = {"seq": seq, "product_id": _product_id(payload), "error": invalid_input(e)}
+    return wines, positions, results
+
+
+def invalid_input(error):
+    # "Invalid input: <bad fields>", or what's wrong with the item as a whole,
+    # for a pydantic ValidationError of one item
+    problems = []
+    for err in error.errors():
+        if err["loc"]:
+            problems.append(".".join(str(p) for p in err["loc"]))
+        elif err["type"] == "model_type":
+            problems.append("expected a JSON object")
+        else:
+            problems.append(err["msg"].removeprefix("Value error, "))
+    return f"Invalid input: {', '.join(problems)}"
+
+
+def _product_id(payload):
+    return payload.get("product_id") if isinstance(payload, dict) else None
+
+
+async def serve_websocket(websocket, pipeline, hello):
+    # Client sends JSON readings (object or list per message), gets one JSON
+    # result per reading back, tagged with its sequence number and product_id
+    await websocket.send_json({"event": "ready", **hello})
+
+    async def read_items():
+        seq = 0
+        try:
+            while True:
+                text = await websocket.receive_text()
+                items = parse_payloads(text, seq, pipeline.buffer_size)
+                seq += len(items)
+                for item in items:
+                    yield item
+        except WebSocketDisconnect:
+            return
+
+    async def send_results(results):
+        for result in results:
+            await websocket.send_json(result)
+
+    try:
+        await pipeline.run(read_items, send_results)
+    except WebSocketDisconnect:
+        pass
+
+
+class NDJSONStreamResponse(Response):
+    """Full-duplex NDJSON: reads request lines and writes result lines concurrently.
+
+    Starlette's StreamingResponse would consume `receive` to watch for
+    disconnects, which would eat the request body, so the pipeline drives the
+    ASGI channel directly.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(self, pipeline, max_line_bytes):
+        super().__init__(media_type=self.media_type)
+        # Length is unknown up front: drop the Content-Length: 0 set for the empty body (chunked instead)
+        self.raw_headers = [(k, v) for k, v in self.raw_headers if k != b"content-length"]
+        self.pipeline = pipeline
+        self.max_line_bytes = max_line_bytes
+
+    async def __call__(self, scope, receive, send):
+        max_line_bytes = self.max_line_bytes
+        max_items = self.pipeline.buffer_size
+
+        async def read_items():
+            buffer = b""
+            seq = 0
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                buffer += message.get("body", b"")
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        items = parse_payloads(line, seq, max_items)
+                        seq += len(items)
+                        for item in items:
+                            yield item
+                if len(buffer) > max_line_bytes:
+                    # Refuse unbounded lines instead of buffering them
+                    yield (seq, ValueError(f"Line exceeds {max_line_bytes} bytes, stream closed"))
+                    return
+                if not message.get("more_body", False):
+                    if buffer.strip():
+                        for item in parse_payloads(buffer, seq, max_items):
+                            yield item
+                    return
+
+        async def send_results(results):
+            body = "".join(json.dumps(result) + "\n" for result in results).encode("utf-8")
+            await send({"type": "http.response.body", "body": body, "more_body": True})
+
+        await send({"type": "http.response.start", "status": 200, "headers": self.raw_headers})
+        try:
+            await self.pipeline.run(read_items, send_results)
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        except OSError:
+            # Client went away mid-stream
+            pass
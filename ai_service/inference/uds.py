@@ -0,0 +1,275 @@
+import asyncio
+import json
+import os
+import socket
+import struct
+import sys
+from array import array
+
+# Unix domain socket transport for local callers (backend, simulation, tools).
+#
+# Same scoring as POST /predict/bulk, minus TCP and HTTP. Every message is
+# a little-endian uint32 payload length followed by the payload. A
+# connection carries any number of request/response pairs, answered in
+# order.
+#
+# Request payload:
+#   kind u8 | priority u8 | n_features u16 | n_rows u32 | warehouse_id i32 |
+#   deadline_ms u32 | version_len u16 | version (UTF-8) | body
+#     kind 1 (predict): body = n_rows x n_features float64, unscaled, in the
+#       model's feature order with categories encoded (see kind 2); NaN marks
+#       a missing reading. Full precision, like JSON: float32 readings would
+#       round before scaling and shift the scores away from /predict's
+#     kind 2 (layout): no body
+#     priority 0 = live, 1 = bulk; warehouse_id -1 = none; deadline_ms 0 = none;
+#     version_len 0 = the active model
+#
+# Response payload:
+#   status u16 | reserved u16 | n_rows u32 | version_len u16 | version | body
+#     status is the HTTP status the same request would get; on errors the
+#     body is the UTF-8 message
+#     predict: body = n_rows float32 scores, then n_rows u8 flags
+#       (bit 0: a reading was imputed, bit 1: a reading was clipped)
+#     layout: body = JSON {"feature_names": [...], "categories": {...}}
+#
+# The module only needs the standard library, so the client below can be
+# imported from scripts that don't have the service's dependencies.
+
+LENGTH = struct.Struct("<I")
+REQUEST = struct.Struct("<BBHIiIH")
+RESPONSE = struct.Struct("<HHIH")
+
+KIND_PREDICT = 1
+KIND_LAYOUT = 2
+PRIORITIES = ("live", "bulk")
+
+FLAG_IMPUTED = 1
+FLAG_CLIPPED = 2
+
+DEFAULT_PATH = "/tmp/wine-inference.sock"
+
+
+def bind_unix_socket(path):
+    # Listening socket for the server; a stale file from a previous run is replaced
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    sock.listen(1024)
+    sock.set_inheritable(True)
+    return sock
+
+
+def encode_response(status, n_rows=0, version="", body=b""):
+    version = version.encode("utf-8")
+    header = RESPONSE.pack(status, 0, n_rows, len(version))
+    return LENGTH.pack(len(header) + len(version) + len(body)) + header + version + body
+
+
+class FrameServer:
+    """Serves the framed protocol on a listening Unix socket.
+
+    predict(version_id, warehouse_id, priority, deadline_ms, n_rows, n_features, body)
+    and layout(version_id, warehouse_id) are coroutines from the app:
+    predict returns (version_id, scores bytes, flags bytes), layout returns
+    (version_id, dict). Exceptions carrying status_code/detail (HTTPException,
+    AdmissionRejected) keep their status; ValueError is a 400, anything else
+    a 500.
+    """
+
+    def __init__(self, predict, layout, max_frame_bytes):
+        self.predict = predict
+        self.layout = layout
+        self.max_frame_bytes = max_frame_bytes
+        self._server = None
+        self.connections = 0
+        self.requests = 0
+
+    async def start(self, sock):
+        self._server = await asyncio.start_unix_server(self._serve, sock=sock)
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    (length,) = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+                    if length > self.max_frame_bytes:
+                        # Can't skip a frame we won't read: answer and drop the connection
+                        writer.write(encode_response(413, body=f"Frame too large: {length} bytes (max {self.max_frame_bytes})".encode()))
+                        await writer.drain()
+                        break
+                    payload = await reader.readexactly(length)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                self.requests += 1
+                writer.write(await self._dispatch(payload))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _dispatch(self, payload):
+        try:
+            if len(payload) < REQUEST.size:
+                raise ValueError("Truncated request header")
+            kind, priority, n_features, n_rows, warehouse_id, deadline_ms, version_len = REQUEST.unpack_from(payload)
+            start = REQUEST.size + version_len
+            version_id = payload[REQUEST.size:start].decode("utf-8") or None
+            warehouse_id = warehouse_id if warehouse_id >= 0 else None
+            if priority >= len(PRIORITIES):
+                raise ValueError(f"Unknown priority {priority}")
+
+            if kind == KIND_PREDICT:
+                body = memoryview(payload)[start:]
+                if len(body) != 8 * n_rows * n_features:
+                    raise ValueError(f"Body has {len(body)} bytes, expected {n_rows} x {n_features} float64 values")
+                version_id, scores, flags = await self.predict(
+                    version_id, warehouse_id, PRIORITIES[priority], deadline_ms, n_rows, n_features, body)
+                return encode_response(200, n_rows, version_id, scores + flags)
+            if kind == KIND_LAYOUT:
+                version_id, layout = await self.layout(version_id, warehouse_id)
+                return encode_response(200, 0, version_id, json.dumps(layout).encode("utf-8"))
+            raise ValueError(f"Unknown request kind {kind}")
+        except Exception as e:
+            status = getattr(e, "status_code", 400 if isinstance(e, ValueError) else 500)
+            detail = getattr(e, "detail", None) or str(e)
+            return encode_response(status, body=str(detail).encode("utf-8"))
+
+
+class UDSError(Exception):
+    def __init__(self, status, message):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class UDSClient:
+    """Blocking client for the framed Unix socket protocol.
+
+        with UDSClient("/tmp/wine-inference.sock") as client:
+            results = client.predict([{"type": "white", "alcohol": 9.5, ...}])
+
+    predict() takes readings as dicts (the /predict field names; missing or
+    None readings are sent as NaN) and returns one dict per row.
+    predict_matrix() sends rows that are already in layout order and returns
+    the raw scores and flags. One client is one connection; use one per thread.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, timeout=5.0):
+        self.path = path
+        self.timeout = timeout
+        self._sock = None
+        self._layout = {}  # (version, warehouse) -> layout
+
+    def connect(self):
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.path)
+            self._sock = sock
+        return self
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self):
+        return self.connect()
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def layout(self, version=None, warehouse_id=None):
+        key = (version, warehouse_id)
+        if key not in self._layout:
+            _, _, body = self._call(KIND_LAYOUT, 0, 0, b"", version, warehouse_id)
+            self._layout[key] = json.loads(bytes(body))
+        return self._layout[key]
+
+    def predict(self, wines, version=None, warehouse_id=None, priority="live", deadline_ms=0):
+        layout = self.layout(version, warehouse_id)
+        names = layout["feature_names"]
+        categories = layout["categories"]
+        flat = array("d")
+        for wine in wines:
+            for name in names:
+                value = wine.get(name)
+                if name in categories:
+                    value = categories[name].get(value, 0)
+                flat.append(float("nan") if value is None else value)
+        model_version, scores, flags = self.predict_matrix(flat, len(wines), len(names), version, warehouse_id,
+                                                           priority, deadline_ms)
+        return [
+            {
+                "quality_score": score,
+                "quality_class": int(round(score)),
+                "model_version": model_version,
+                "imputed": bool(flag & FLAG_IMPUTED),
+                "clipped": bool(flag & FLAG_CLIPPED),
+            }
+            for score, flag in zip(scores, flags)
+        ]
+
+    def predict_matrix(self, rows, n_rows=None, n_features=None, version=None, warehouse_id=None,
+                       priority="live", deadline_ms=0):
+        # rows: NumPy (n_rows, n_features) array, or a flat float64 array('d')
+        # with n_rows/n_features given. Returns (model version, scores, flags).
+        if hasattr(rows, "shape"):
+            n_rows, n_features = rows.shape
+            body = rows.astype("<f8", copy=False).tobytes()
+        else:
+            body = _little_endian(rows).tobytes()
+        model_version, n, body = self._call(KIND_PREDICT, n_rows, n_features, body, version, warehouse_id,
+                                            PRIORITIES.index(priority), deadline_ms)
+        scores = _little_endian(array("f", bytes(body[:4 * n])))
+        return model_version, scores, bytes(body[4 * n:])
+
+    def _call(self, kind, n_rows, n_features, body, version, warehouse_id, priority=0, deadline_ms=0):
+        version = (version or "").encode("utf-8")
+        header = REQUEST.pack(kind, priority, n_features, n_rows, -1 if warehouse_id is None else warehouse_id,
+                              int(deadline_ms), len(version))
+        self.connect()
+        try:
+            self._sock.sendall(LENGTH.pack(len(header) + len(version) + len(body)) + header + version + body)
+            (length,) = LENGTH.unpack(self._recv(LENGTH.size))
+            payload = self._recv(length)
+        except (OSError, ValueError):
+            # Timeout or broken connection: the stream is out of sync, start over next time
+            self.close()
+            raise
+        status, _, n, version_len = RESPONSE.unpack_from(payload)
+        start = RESPONSE.size + version_len
+        model_version = bytes(payload[RESPONSE.size:start]).decode("utf-8")
+        if status != 200:
+            raise UDSError(status, bytes(payload[start:]).decode("utf-8", "replace"))
+        return model_version, n, payload[start:]
+
+    def _recv(self, n):
+        buf = bytearray(n)
+        view = memoryview(buf)
+        while view:
+            received = self._sock.recv_into(view)
+            if not received:
+                raise ConnectionError("Connection closed by the server")
+            view = view[received:]
+        return memoryview(buf)
+
+
+def _little_endian(values):
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
@@ -0,0 +1,214 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from .bundle import load_artifacts_dir
+from .metrics import METRICS
+from .registry import ModelVersion
+
+LOAD_LATENCY = METRICS.histogram(
+    "wine_warehouse_model_load_seconds", "Lazy load + warmup time of warehouse-specific models")
+EVICTIONS = METRICS.counter(
+    "wine_warehouse_model_evictions_total", "Warehouse models evicted to stay under the memory budget")
+
+
+class WarehouseModels:
+    """Warehouse-specific models, loaded on first use and kept in a memory-bounded LRU.
+
+    A warehouse has its own model when <models_dir>/<warehouse_id>/ holds a
+    bundle (or the legacy joblib files). Otherwise, or while its model failed
+    to load, callers fall back to the global model. Residency is charged at the
+    size of the artifacts on disk, a close proxy for the booster copy plus the
+    mapped arrays. Evicted models stay alive until their in-flight requests
+    finish, like unloaded registry versions.
+    """
+
+    def __init__(self, models_dir, registry, max_bytes, retry_seconds=60):
+        self.models_dir = models_dir
+        self.registry = registry  # engine and thread settings for new models
+        self.max_bytes = max_bytes
+        self.retry_seconds = retry_seconds
+
+        self._resident = OrderedDict()  # warehouse_id -> {"version", "bytes", "load_ms", ...}
+        self._bytes = 0
+        self._failures = {}  # warehouse_id -> (monotonic time, error)
+        self._load_locks = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.loads = 0
+        self.load_failures = 0
+        self.evictions = 0
+        self.fallbacks = 0  # requests for a warehouse without a usable model of its own
+        self.recent_evictions = []  # last few {"warehouse_id", "bytes", "load_ms", "idle_s"}
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0 and os.path.isdir(self.models_dir)
+
+    def path(self, warehouse_id):
+        return os.path.join(self.models_dir, warehouse_key(warehouse_id))
+
+    def resident(self, warehouse_id):
+        # Fast path for the event loop: the resident model, or None
+        warehouse_id = warehouse_key(warehouse_id)
+        with self._lock:
+            entry = self._resident.get(warehouse_id)
+            if entry is None:
+                return None
+            self._resident.move_to_end(warehouse_id)
+            entry["last_used"] = time.time()
+            entry["requests"] += 1
+            self.hits += 1
+            return entry["version"]
+
+    def has_model(self, warehouse_id):
+        warehouse_id = warehouse_key(warehouse_id)
+        with self._lock:
+            failure = self._failures.get(warehouse_id)
+        if failure is not None and time.monotonic() - failure[0] < self.retry_seconds:
+            return False
+        return os.path.isdir(self.path(warehouse_id))
+
+    def get(self, warehouse_id):
+        # Resident model, lazily loaded model, or None (use the global one).
+        # May block for a load: call it off the event loop.
+        warehouse_id = warehouse_key(warehouse_id)
+        version = self.resident(warehouse_id)
+        if version is not None:
+            return version
+        if not self.has_model(warehouse_id):
+            return None
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(warehouse_id, threading.Lock())
+        # One load per warehouse; concurrent first requests wait for it
+        with load_lock:
+            version = self.resident(warehouse_id)
+            if version is not None:
+                return version
+            try:
+                return self._load(warehouse_id)
+            except Exception as e:
+                print(f"Error loading model for warehouse {warehouse_id}, using the global model: {e}")
+                with self._lock:
+                    self._failures[warehouse_id] = (time.monotonic(), str(e))
+                    self.load_failures += 1
+                return None
+
+    def _load(self, warehouse_id):
+        path = self.path(warehouse_id)
+        start = time.perf_counter()
+        artifacts = load_artifacts_dir(path, verify=self.registry.verify)
+        version = ModelVersion(f"{warehouse_id}@{artifacts.version}", artifacts,
+                               self.registry.engine_name, self.registry.booster_threads)
+        version.load_ms = (time.perf_counter() - start) * 1000
+        version.warm_up()
+        total = time.perf_counter() - start
+        LOAD_LATENCY.observe(total)
+
+        size = _footprint(path)
+        with self._lock:
+            self._resident[warehouse_id] = {
+                "version": version,
+                "bytes": size,
+                "load_ms": total * 1000,
+                "loaded_at": time.time(),
+                "last_used": time.time(),
+                "requests": 1,
+            }
+            self._bytes += size
+            self._failures.pop(warehouse_id, None)
+            self.loads += 1
+            # Evict the coldest warehouses, never the one just loaded
+            while self._bytes > self.max_bytes and len(self._resident) > 1:
+                self._evict(next(iter(self._resident)))
+        print(f"Model for warehouse {warehouse_id} loaded in {total * 1000:.1f} ms ({version.version_id}).")
+        return version
+
+    def evict(self, warehouse_id):
+        warehouse_id = warehouse_key(warehouse_id)
+        with self._lock:
+            if warehouse_id not in self._resident:
+                raise KeyError(warehouse_id)
+            return self._evict(warehouse_id)
+
+    def _evict(self, warehouse_id):
+        # Caller holds self._lock
+        entry = self._resident.pop(warehouse_id)
+        self._bytes -= entry["bytes"]
+        record = {
+            "warehouse_id": warehouse_id,
+            "version_id": entry["version"].version_id,
+            "bytes": entry["bytes"],
+            # What the next request for this warehouse pays to bring it back
+            "load_ms": entry["load_ms"],
+            "idle_s": round(time.time() - entry["last_used"], 3),
+            "in_flight": entry["version"].in_flight,
+        }
+        self.evictions += 1
+        EVICTIONS.inc()
+        self.recent_evictions = (self.recent_evictions + [record])[-10:]
+        return record
+
+    def resident_versions(self):
+        with self._lock:
+            return [entry["version"] for entry in self._resident.values()]
+
+    def resident_ids(self):
+        # Least recently used first, so reloading them in order rebuilds the LRU
+        with self._lock:
+            return list(self._resident)
+
+    def clear(self):
+        with self._lock:
+            self._resident.clear()
+            self._bytes = 0
+            self._failures.clear()
+
+    def stats(self):
+        with self._lock:
+            resident = [
+                {
+                    "warehouse_id": warehouse_id,
+                    "version_id": entry["version"].version_id,
+                    "bytes": entry["bytes"],
+                    "load_ms": entry["load_ms"],
+                    "loaded_at": entry["loaded_at"],
+                    "last_used": entry["last_used"],
+                    "requests": entry["requests"],
+                    "in_flight": entry["version"].in_flight,
+                }
+                # Most recently used first
+                for warehouse_id, entry in reversed(self._resident.items())
+            ]
+            return {
+                "enabled": self.enabled,
+                "models_dir": self.models_dir,
+                "max_bytes": self.max_bytes,
+                "bytes": self._bytes,
+                "resident": resident,
+                "hits": self.hits,
+                "loads": self.loads,
+                "load_failures": self.load_failures,
+                "evictions": self.evictions,
+                "fallbacks": self.fallbacks,
+                "recent_evictions": self.recent_evictions,
+                "failed": {w: error for w, (_, error) in self._failures.items()},
+            }
+
+
+def warehouse_key(warehouse_id):
+    # Warehouse ids are integers; the canonical string also names the model
+    # directory, so anything else (e.g. "../x") is rejected with ValueError
+    return str(int(warehouse_id))
+
+
+def _footprint(path):
+    total = 0
+    for name in os.listdir(path):
+        full = os.path.join(path, name)
+        if os.path.isfile(full):
+            total += os.path.getsize(full)
+    return total
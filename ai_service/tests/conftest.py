@@ -0,0 +1,38 @@
+import pytest
+
+from ai_service.inference.predictor import DEFAULT_ARTIFACTS_DIR, Predictor
+from ai_service.inference.schemas import WineInput
+
+
+@pytest.fixture(scope="session")
+def predictor():
+    # The shipped artifacts, loaded once, with the prediction cache on
+    with Predictor.from_artifacts(DEFAULT_ARTIFACTS_DIR, cache_max_bytes=1 << 20) as predictor:
+        yield predictor
+
+
+@pytest.fixture(scope="session")
+def service(tmp_path_factory):
+    # The service module on the shipped artifacts. Its settings are read at
+    # import, so they are set before the first import; model directories
+    # point into a scratch dir instead of the artifacts.
+    state = tmp_path_factory.mktemp("service")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MODEL_VERSIONS_DIR", str(state / "versions"))
+        mp.setenv("WAREHOUSE_MODELS_DIR", str(state / "warehouses"))
+        mp.setenv("WARMUP_BATCH_SIZES", "1")
+        mp.setenv("UDS_PATH", str(state / "inference.sock"))
+        from ai_service.inference import main
+    return main
+
+
+@pytest.fixture(scope="session")
+def client(service):
+    from fastapi.testclient import TestClient
+    with TestClient(service.app) as client:
+        yield client
+
+
+@pytest.fixture
+def wine():
+    return dict(WineInput.model_config["json_schema_extra"]["example"])
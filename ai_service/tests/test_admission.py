@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from ai_service.inference.admission import AdmissionController, AdmissionRejected
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def hold(admission, lane, release, **kwargs):
+    async with admission.slot(lane, **kwargs):
+        await release.wait()
+
+
+def test_full_queue_is_shed_with_retry_after():
+    async def scenario():
+        admission = AdmissionController(1, {"live": 1, "bulk": 1})
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(admission, "live", release))
+        queued = asyncio.create_task(hold(admission, "live", release))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as rejected:
+            async with admission.slot("live"):
+                pass
+        release.set()
+        await asyncio.gather(holder, queued)
+        return rejected.value, admission.counters["live"]
+
+    rejected, counters = run(scenario())
+    assert rejected.status_code == 429
+    assert rejected.retry_after >= 1
+    assert counters["rejected_full"] == 1
+    assert counters["admitted"] == 2
+
+
+def test_deadline_expiring_in_queue_is_a_504():
+    async def scenario():
+        admission = AdmissionController(1, {"live": 4, "bulk": 4})
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(admission, "live", release))
+        await asyncio.sleep(0)
+        loop = asyncio.get_running_loop()
+        with pytest.raises(AdmissionRejected) as rejected:
+            async with admission.slot("live", deadline=loop.time() + 0.05):
+                pass
+        # The expired waiter left the queue: the slot goes to the next request
+        release.set()
+        await holder
+        async with admission.slot("live"):
+            pass
+        return rejected.value, admission
+
+    rejected, admission = run(scenario())
+    assert rejected.status_code == 504
+    assert admission.counters["live"]["expired"] == 1
+    assert admission.waiting("live") == 0
+
+
+def test_deadline_that_cannot_be_met_is_rejected_on_arrival():
+    async def scenario():
+        admission = AdmissionController(1, {"live": 4, "bulk": 4})
+        admission.restore({"service_time": 10.0})
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(admission, "live", release))
+        await asyncio.sleep(0)
+        loop = asyncio.get_running_loop()
+        with pytest.raises(AdmissionRejected) as rejected:
+            async with admission.slot("live", deadline=loop.time() + 1):
+                pass
+        release.set()
+        await holder
+        return rejected.value, admission.counters["live"]
+
+    rejected, counters = run(scenario())
+    assert rejected.status_code == 504
+    assert counters["rejected_deadline"] == 1
+
+
+def test_live_waiters_go_before_bulk():
+    async def scenario():
+        admission = AdmissionController(1, {"live": 4, "bulk": 4})
+        release = asyncio.Event()
+        order = []
+
+        async def record(lane):
+            async with admission.slot(lane):
+                order.append(lane)
+
+        holder = asyncio.create_task(hold(admission, "bulk", release))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(record(lane)) for lane in ("bulk", "live")]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, *waiters)
+        return order
+
+    assert run(scenario()) == ["live", "bulk"]
+
+
+def test_waiting_streams_queue_past_a_full_lane():
+    async def scenario():
+        admission = AdmissionController(1, {"live": 1, "bulk": 1})
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(admission, "live", release))
+        queued = asyncio.create_task(hold(admission, "live", release))
+        await asyncio.sleep(0)
+        stream = asyncio.create_task(hold(admission, "live", release, wait=True))
+        await asyncio.sleep(0)
+        waiting = admission.waiting("live")
+        release.set()
+        await asyncio.gather(holder, queued, stream)
+        return waiting, admission.counters["live"]
+
+    waiting, counters = run(scenario())
+    assert waiting == 2
+    assert counters["rejected_full"] == 0
+    assert counters["admitted"] == 3
+
+
+def test_unknown_priority_is_a_400():
+    admission = AdmissionController(1, {"live": 1, "bulk": 1})
+    with pytest.raises(AdmissionRejected) as rejected:
+        admission.lane("urgent", "live")
+    assert rejected.value.status_code == 400
+    assert admission.lane(None, "live") == "live"
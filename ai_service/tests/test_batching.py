@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ai_service.inference.batching import MicroBatcher
+from ai_service.inference.execution import InferenceExecutor
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_each_caller_gets_its_own_result():
+    batches = []
+
+    def predict_batch(items):
+        batches.append(list(items))
+        return [item * 10 for item in items]
+
+    async def scenario():
+        batcher = MicroBatcher(predict_batch, max_batch_size=8, max_wait=0.01)
+        await batcher.start()
+        try:
+            return await asyncio.gather(*(batcher.submit(i) for i in range(20)))
+        finally:
+            await batcher.stop()
+
+    assert run(scenario()) == [i * 10 for i in range(20)]
+    assert all(len(batch) <= 8 for batch in batches)
+    assert sorted(item for batch in batches for item in batch) == list(range(20))
+    assert len(batches) < 20  # concurrent requests were coalesced
+
+
+def test_a_failed_flush_fails_only_its_callers():
+    def predict_batch(items):
+        if -1 in items:
+            raise ValueError("bad batch")
+        return items
+
+    async def scenario():
+        batcher = MicroBatcher(predict_batch, max_batch_size=1, max_wait=0)
+        await batcher.start()
+        try:
+            return await asyncio.gather(batcher.submit(1), batcher.submit(-1), batcher.submit(2),
+                                        return_exceptions=True)
+        finally:
+            await batcher.stop()
+
+    first, failed, last = run(scenario())
+    assert (first, last) == (1, 2)
+    assert isinstance(failed, ValueError)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_one_flush_runs_per_executor_thread(workers):
+    lock = threading.Lock()
+    running = peak = 0
+
+    def predict_batch(items):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return items
+
+    async def scenario():
+        executor = InferenceExecutor(workers)
+        batcher = MicroBatcher(predict_batch, max_batch_size=2, max_wait=0, executor=executor)
+        await batcher.start()
+        try:
+            results = await asyncio.gather(*(batcher.submit(i) for i in range(12)))
+            return results, batcher.stats()
+        finally:
+            await batcher.stop()
+            executor.shutdown()
+
+    results, stats = run(scenario())
+    assert results == list(range(12))
+    assert stats["max_flushes"] == workers
+    assert peak == workers
@@ -0,0 +1,36 @@
+import math
+
+from ai_service.inference.cache import PredictionCache
+from ai_service.inference.schemas import WineInput
+from ai_service.inference.snapshot import read_snapshot, write_snapshot
+
+
+def test_repeated_imputed_request_hits_cache(predictor, wine):
+    wine["pH"] = None
+    first = predictor.predict_one(wine)
+    hits, entries = predictor.cache.hits, len(predictor.cache._entries)
+    assert predictor.predict_one(wine) == first
+    assert predictor.cache.hits == hits + 1
+    assert len(predictor.cache._entries) == entries
+
+
+def test_missing_readings_share_a_key(predictor, wine):
+    keys = set()
+    for missing in (None, math.nan, math.inf):
+        wine["density"] = missing
+        keys.add(predictor.cache_key(predictor.active, WineInput.model_validate(wine)))
+    assert len(keys) == 1
+    assert None in keys.pop()
+
+
+def test_snapshot_keeps_keys_with_missing_readings(tmp_path):
+    cache = PredictionCache(1 << 20, 300)
+    key = PredictionCache.make_key("v1", [1, 7.0, math.nan, 0.45], 6)
+    cache.put(key, 5.5)
+    path = str(tmp_path / "state.wqs")
+    write_snapshot(path, {}, {"predictions": cache})
+    _, caches = read_snapshot(path)
+    restored = PredictionCache(1 << 20, 300)
+    for entry_key, value, ttl in caches["predictions"]:
+        restored.put(entry_key, value, ttl)
+    assert restored.get(key) == 5.5
@@ -0,0 +1,107 @@
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_service.inference.schemas import WineInput
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../winequalityN - Copy.csv")
+
+
+@pytest.fixture(scope="module")
+def readings():
+    # Training rows, some with missing readings, as plain JSON values
+    df = pd.read_csv(DATA_PATH).drop(columns=["quality"]).sample(50, random_state=1)
+    return [{col: None if isinstance(value, float) and math.isnan(value) else value for col, value in row.items()}
+            for row in df.to_dict("records")]
+
+
+@pytest.fixture(scope="module")
+def expected(client, readings):
+    # What /predict_batch says for the same rows
+    results = client.post("/predict_batch", json={"items": readings}).json()["results"]
+    return np.array([result["quality_score"] for result in results])
+
+
+def columns_of(readings):
+    return {col: [row[col] for row in readings] for col in readings[0]}
+
+
+def test_columns_match_dataframe_path(predictor, readings):
+    version = predictor.active
+    wines = [WineInput.model_validate(row) for row in readings]
+    df = pd.DataFrame([wine.model_dump(by_alias=True) for wine in wines])
+    expected = version.preprocess_frame(df.copy())
+    columns = {col: df[col].to_numpy() for col in df.columns}
+    np.testing.assert_array_equal(version.vectorizer.transform_columns(columns), expected)
+
+
+def test_columnar_json(client, readings, expected):
+    response = client.post("/predict/bulk", content=json.dumps(columns_of(readings)),
+                           headers={"Content-Type": "application/json"})
+    assert response.status_code == 200
+    body = response.json()
+    np.testing.assert_allclose(body["quality_score"], expected, rtol=0, atol=1e-6)
+    assert body["quality_class"] == [int(round(score)) for score in body["quality_score"]]
+
+
+def post_json(client, readings):
+    return client.post("/predict/bulk", content=json.dumps(columns_of(readings)),
+                       headers={"Content-Type": "application/json"}).json()["quality_score"]
+
+
+def test_msgpack(client, readings, expected):
+    msgpack = pytest.importorskip("msgpack")
+    response = client.post("/predict/bulk", content=msgpack.packb(columns_of(readings)),
+                           headers={"Content-Type": "application/msgpack"})
+    assert response.status_code == 200
+    np.testing.assert_allclose(msgpack.unpackb(response.content)["quality_score"], expected, rtol=0, atol=1e-6)
+
+    # Numeric columns may also travel as raw float32 bytes
+    alcohol = np.asarray([row["alcohol"] for row in readings], dtype="<f4")
+    columns = {**columns_of(readings), "alcohol": alcohol.tobytes()}
+    response = client.post("/predict/bulk", content=msgpack.packb(columns),
+                           headers={"Content-Type": "application/msgpack"})
+    rounded = [{**row, "alcohol": float(value)} for row, value in zip(readings, alcohol)]
+    np.testing.assert_allclose(msgpack.unpackb(response.content)["quality_score"], post_json(client, rounded),
+                               rtol=0, atol=1e-6)
+
+
+def test_arrow(client, readings, expected):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(columns_of(readings))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=20)  # several record batches
+    response = client.post("/predict/bulk", content=sink.getvalue().to_pybytes(),
+                           headers={"Content-Type": "application/vnd.apache.arrow.stream"})
+    assert response.status_code == 200
+    result = pa.ipc.open_stream(pa.py_buffer(response.content)).read_all()
+    np.testing.assert_allclose(result.column("quality_score").to_numpy(), expected, rtol=0, atol=1e-6)
+
+
+def test_raw_float32(client, readings):
+    layout = client.get("/predict/bulk/layout").json()
+    names, categories = layout["feature_names"], layout["categories"]
+    rows = np.array([[categories[n][row[n]] if n in categories else row[n] for n in names] for row in readings],
+                    dtype=np.float64).astype("<f4")
+    response = client.post("/predict/bulk", content=rows.tobytes(), headers={"Content-Type": "application/octet-stream"})
+    assert response.status_code == 200
+    assert response.headers["X-Model-Version"] == layout["model_version"]
+    scores = np.frombuffer(response.content, dtype="<f4")
+    # Same as columnar JSON given the same float32-rounded readings
+    rounded = [{n: (row[n] if n in categories or row[n] is None else float(np.float32(row[n]))) for n in names}
+               for row in readings]
+    np.testing.assert_allclose(scores, post_json(client, rounded), rtol=0, atol=1e-6)
+
+
+@pytest.mark.parametrize("content_type, body, status", [
+    ("text/csv", b"a,b\n1,2", 415),
+    ("application/json", b"[1, 2]", 422),
+    ("application/octet-stream", b"\x00" * 7, 422),
+])
+def test_bad_requests(client, content_type, body, status):
+    assert client.post("/predict/bulk", content=body, headers={"Content-Type": content_type}).status_code == status
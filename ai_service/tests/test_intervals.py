@@ -0,0 +1,51 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from xgboost import XGBRegressor
+
+from ai_service.inference.bundle import BUNDLE_FILENAME, load_artifacts_dir, write_bundle
+from ai_service.inference.intervals import INTERVAL_QUANTILES
+from ai_service.inference.predictor import DEFAULT_ARTIFACTS_DIR
+from ai_service.inference.registry import ModelVersion
+from ai_service.inference.schemas import WineInput
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../winequalityN - Copy.csv")
+
+
+@pytest.fixture(scope="module")
+def interval_artifacts(tmp_path_factory):
+    # The shipped model plus small quantile heads, as train.py would fit them
+    artifacts = load_artifacts_dir(DEFAULT_ARTIFACTS_DIR)
+    version = ModelVersion("reference", artifacts, "xgboost")
+    df = pd.read_csv(DATA_PATH).head(2000)
+    X = version.preprocess_frame(df.drop(columns=["quality"]))
+    heads = XGBRegressor(objective="reg:quantileerror", quantile_alpha=np.array(INTERVAL_QUANTILES),
+                         n_estimators=30, max_depth=4).fit(X, df["quality"])
+    path = tmp_path_factory.mktemp("intervals")
+    write_bundle(os.path.join(path, BUNDLE_FILENAME), artifacts.model, artifacts.scaler, artifacts.label_encoders,
+                 artifacts.imputation_values, artifacts.feature_names, quantile_model=heads,
+                 quantiles=INTERVAL_QUANTILES)
+    return load_artifacts_dir(str(path))
+
+
+def test_compiled_engine_fuses_heads_into_one_pass(interval_artifacts, wine):
+    fused = ModelVersion("fused", interval_artifacts, "compiled")
+    separate = ModelVersion("separate", interval_artifacts, "xgboost")
+    assert fused.intervals.mode == "fused"
+    assert separate.intervals.mode == "separate"
+
+    wine = WineInput.model_validate(wine)
+    point, lower, upper, confidence = fused.predict_interval(wine)
+    np.testing.assert_allclose([point, lower, upper, confidence], separate.predict_interval(wine), atol=1e-5)
+    assert lower <= upper
+    assert 0 <= confidence <= 1
+    assert point == pytest.approx(separate.predict_one(wine), abs=1e-5)
+
+
+def test_interval_on_a_model_without_heads_is_flagged(client, wine):
+    body = client.post("/predict?interval=true", json=wine).json()
+    assert body["interval_available"] is False
+    assert "confidence" not in body
+    assert "interval_available" not in client.post("/predict", json=wine).json()
@@ -0,0 +1,96 @@
+import math
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_service.inference.bundle import BUNDLE_FILENAME, load_artifacts_dir, write_bundle
+from ai_service.inference.engines import build_engine, check_parity
+from ai_service.inference.predictor import DEFAULT_ARTIFACTS_DIR
+from ai_service.inference.registry import ModelVersion
+from ai_service.inference.schemas import WineInput
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../winequalityN - Copy.csv")
+
+
+@pytest.fixture(scope="module")
+def lightgbm_model():
+    # A small LightGBM model trained on the shipped model's features, as train.py would
+    try:
+        from lightgbm import LGBMRegressor
+    except ImportError:
+        return None
+    version = ModelVersion("reference", load_artifacts_dir(DEFAULT_ARTIFACTS_DIR), "xgboost")
+    df = pd.read_csv(DATA_PATH).head(2000)
+    X = version.preprocess_frame(df.drop(columns=["quality"]))
+    return LGBMRegressor(n_estimators=50, num_leaves=15, verbose=-1).fit(X, df["quality"])
+
+
+@pytest.fixture(scope="module")
+def bundle_dir(tmp_path_factory, lightgbm_model):
+    # The shipped model as a bundle (forest + ONNX export, LightGBM when installed)
+    artifacts = load_artifacts_dir(DEFAULT_ARTIFACTS_DIR)
+    path = tmp_path_factory.mktemp("bundle")
+    write_bundle(os.path.join(path, BUNDLE_FILENAME), artifacts.model, artifacts.scaler, artifacts.label_encoders,
+                 artifacts.imputation_values, artifacts.feature_names, lightgbm_model=lightgbm_model)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def version(bundle_dir):
+    return ModelVersion("parity", load_artifacts_dir(bundle_dir), "xgboost")
+
+
+@pytest.fixture(scope="module")
+def wines():
+    # Sample readings (some with missing values) and the edge cases: dead
+    # sensors, labels training never saw, readings far outside training
+    df = pd.read_csv(DATA_PATH).drop(columns=["quality"]).sample(300, random_state=0)
+    rows = [{col: None if isinstance(value, float) and math.isnan(value) else value for col, value in row.items()}
+            for row in df.to_dict("records")]
+    example = WineInput.model_config["json_schema_extra"]["example"]
+    rows += [
+        {**example, "pH": None, "density": None},
+        {**example, "fixed acidity": None, "volatile acidity": None, "citric acid": None, "residual sugar": None,
+         "chlorides": None},
+        {**example, "alcohol": float("nan"), "chlorides": float("inf")},
+        {**example, "type": "rosé"},
+        {**example, "type": "", "sulphates": None},
+        {**example, "alcohol": 40.0, "pH": -1.0, "density": 0.0, "residual sugar": 1e6},
+        {**example, "type": "red", "fixed acidity": -50.0, "total sulfur dioxide": 1e9},
+    ]
+    return [WineInput.model_validate(row) for row in rows]
+
+
+def test_vectorizer_matches_dataframe_path(version, wines):
+    expected = version.preprocess_frame(pd.DataFrame([wine.model_dump(by_alias=True) for wine in wines]))
+    np.testing.assert_array_equal(version.vectorizer.transform_many(wines), expected)
+    for wine, row in zip(wines, expected):
+        np.testing.assert_array_equal(version.vectorizer.transform_one(wine)[0], row)
+
+
+@pytest.mark.parametrize("name", ["xgboost", "booster", "compiled", "onnx"])
+def test_engine_matches_model_predict(version, wines, name):
+    if name == "onnx":
+        pytest.importorskip("onnxruntime")
+    engine = build_engine(name, version.model, version.artifacts)
+    X = version.vectorizer.transform_many(wines)
+    # Unrepaired NaN as well: the engines must route missing values like XGBoost
+    X_missing = X.copy()
+    X_missing[::5, 1] = np.nan
+    X_missing[::7, -1] = np.nan
+    for matrix in (X, X_missing):
+        np.testing.assert_allclose(engine.predict(matrix), version.model.predict(matrix),
+                                   rtol=0, atol=engine.parity_atol)
+
+
+def test_lightgbm_engine_matches_training(version, wines, lightgbm_model):
+    # A different model than the XGBoost one: it must reproduce the trained LightGBM model
+    if lightgbm_model is None:
+        pytest.skip("lightgbm not installed")
+    engine = build_engine("lightgbm", version.model, version.artifacts)
+    check_parity(engine, len(version.feature_names))
+    X = version.vectorizer.transform_many(wines)
+    X[::5, 1] = np.nan
+    np.testing.assert_allclose(engine.predict(X), lightgbm_model.predict(X), rtol=0, atol=engine.parity_atol)
@@ -0,0 +1,30 @@
+def test_ready_after_warmup(client, service):
+    response = client.get("/ready")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ready"] is True
+    assert body["phase"] == "ready"
+    assert body["model_version"] == service.registry.active.version_id
+    assert "warmup" in body["phases"]
+    # Every batch size the service serves was scored once on each inference thread
+    assert body["warmup"]["batch_sizes"] == service.warmup_batch_sizes()
+    assert set(body["warmup"]["batch_ms"]) == {str(size) for size in service.warmup_batch_sizes()}
+    assert "/predict:1" in body["warmup"]["requests_ms"]
+
+
+def counters(service):
+    return {
+        "metrics": service.METRICS.render(),
+        "admission": service.admission.checkpoint(),
+        "cache": service.cache.stats(),
+        "requests": service.registry.active.requests,
+        "batcher": None if service.batcher is None else (service.batcher.batches, service.batcher.items),
+    }
+
+
+def test_warmup_leaves_no_trace(client, service, wine):
+    client.post("/predict", json=wine)
+    before = counters(service)
+    report = client.portal.call(service.warm_up_serving)
+    assert report["requests_ms"]
+    assert counters(service) == before
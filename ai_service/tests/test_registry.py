@@ -0,0 +1,77 @@
+import shutil
+import time
+
+import pytest
+
+from ai_service.inference.predictor import DEFAULT_ARTIFACTS_DIR
+from ai_service.inference.registry import ModelRegistry
+from ai_service.inference.schemas import WineInput
+
+TOKEN = "test-token"
+
+
+@pytest.fixture
+def admin(service, monkeypatch):
+    monkeypatch.setattr(service, "DEBUG_TOKEN", TOKEN)
+    return {"Authorization": f"Bearer {TOKEN}"}
+
+
+def wait_loaded(client, version_id):
+    for _ in range(200):
+        state = client.get("/models").json()["loading"].get(version_id, {})
+        if state.get("state") != "loading":
+            return state
+        time.sleep(0.05)
+    raise AssertionError(f"{version_id} still loading")
+
+
+def test_swap_keeps_in_flight_requests_on_their_version(wine):
+    registry = ModelRegistry("", "xgboost")
+    old = registry.load(DEFAULT_ARTIFACTS_DIR, "old", activate=True)
+    swapped = []
+    registry.on_activate.append(swapped.append)
+    held = registry.resolve()  # a request that started before the swap
+    new = registry.load(DEFAULT_ARTIFACTS_DIR, "new", activate=True)
+
+    assert held is old and registry.active is new
+    assert swapped == [new]
+    wine = WineInput.model_validate(wine)
+    with held:
+        assert held.predict_one(wine) == new.predict_one(wine)
+    assert registry.resolve("old") is old
+    registry.unload("old")
+    assert registry.resolve("old") is None
+    with pytest.raises(ValueError):
+        registry.unload("new")  # the active one
+
+
+def test_load_pin_activate_and_unload(service, client, admin, wine):
+    active = client.get("/models").json()["active"]
+    versions_dir = service.registry.versions_dir
+    shutil.copytree(DEFAULT_ARTIFACTS_DIR, f"{versions_dir}/candidate")
+    try:
+        assert client.post("/models/load", json={"version_id": "candidate"}).status_code == 401
+        assert client.post("/models/load", json={"version_id": "candidate"}, headers=admin).status_code == 202
+        assert wait_loaded(client, "candidate")["state"] == "ready"
+        assert client.get("/models").json()["active"] == active
+
+        pinned = client.post("/predict", json=wine, headers={"X-Model-Version": "candidate"}).json()
+        assert pinned["model_version"] == "candidate"
+        assert client.post("/predict", json=wine).json()["model_version"] == active
+        assert client.post("/predict", json=wine, headers={"X-Model-Version": "missing"}).status_code == 404
+
+        assert client.post("/models/candidate/activate", headers=admin).status_code == 200
+        assert client.post("/predict", json=wine).json()["model_version"] == "candidate"
+        assert client.delete("/models/candidate", headers=admin).status_code == 409
+    finally:
+        client.post(f"/models/{active}/activate", headers=admin)
+        client.delete("/models/candidate", headers=admin)
+        shutil.rmtree(f"{versions_dir}/candidate")
+    assert client.post("/predict", json=wine).json()["model_version"] == active
+    assert "candidate" not in {v["version_id"] for v in client.get("/models").json()["versions"]}
+
+
+@pytest.mark.parametrize("version_id", ["../artifacts", "/etc", "a/b"])
+def test_load_only_names_inside_the_versions_dir(client, admin, version_id):
+    response = client.post("/models/load", json={"version_id": version_id}, headers=admin)
+    assert response.status_code in (400, 422)
@@ -0,0 +1,98 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from ai_service.inference import gateway
+from ai_service.inference.routing import HashRing, ReplicaSet, shard_key
+
+NODES = [f"http://replica-{i}" for i in range(4)]
+KEYS = [shard_key(warehouse_id) for warehouse_id in range(2000)]
+
+
+def test_removing_a_node_only_moves_its_keys():
+    ring = HashRing(NODES)
+    before = {key: ring.lookup(key) for key in KEYS}
+    ring.remove(NODES[0])
+    after = {key: ring.lookup(key) for key in KEYS}
+    moved = [key for key in KEYS if before[key] != after[key]]
+    assert all(before[key] == NODES[0] for key in moved)
+    # Each of them goes where preference() said it would fail over to
+    full = HashRing(NODES)
+    assert all(after[key] == full.preference(key, 2)[1] for key in moved)
+    assert 0.1 < len(moved) / len(KEYS) < 0.4
+
+
+def test_replica_leaves_after_fall_and_returns_after_rise():
+    replicas = ReplicaSet(NODES[:2], fall=2, rise=2)
+    for url in NODES[:2]:
+        replicas.record_check(url, True)
+    assert replicas.ring.nodes == set(NODES[:2])
+
+    replicas.record_check(NODES[0], False, error="down")
+    assert NODES[0] in replicas.ring.nodes  # one bad check isn't enough
+    replicas.record_check(NODES[0], False, error="down")
+    assert replicas.ring.nodes == {NODES[1]}
+    assert all(replicas.route(key) == [NODES[1]] for key in KEYS[:50])
+
+    replicas.record_check(NODES[0], True)
+    assert NODES[0] not in replicas.ring.nodes
+    replicas.record_check(NODES[0], True)
+    assert NODES[0] in replicas.ring.nodes
+    assert [event["event"] for event in replicas.rebalances][-2:] == ["left: down", "joined"]
+
+
+@pytest.fixture
+def replicas(monkeypatch):
+    # Two healthy replicas behind a fake transport; replica-0 refuses connections
+    replicas = ReplicaSet(NODES[:2])
+    for url in NODES[:2]:
+        replicas.add(url, healthy=True)
+    seen = []
+
+    def handler(request):
+        url = f"{request.url.scheme}://{request.url.host}"
+        seen.append(url)
+        if url == NODES[0]:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    monkeypatch.setattr(gateway, "replicas", replicas)
+    monkeypatch.setattr(gateway, "client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(gateway, "seen_warehouses", {})
+    replicas.seen = seen
+    return replicas
+
+
+def test_forward_fails_over_from_a_dead_replica(replicas):
+    key = next(key for key in KEYS if replicas.ring.lookup(key) == NODES[0])
+    client = TestClient(gateway.app)
+    for _ in range(2):
+        response = client.post("/predict", json={"warehouse_id": int(key)})
+        assert response.status_code == 200
+        assert response.headers["X-Replica"] == NODES[1]
+        assert response.json() == {"path": "/predict"}
+    # Two failed forwards in a row take it off the ring: the third goes straight to replica-1
+    assert replicas.ring.nodes == {NODES[1]}
+    replicas.seen.clear()
+    assert client.post("/predict", headers={"X-Warehouse-Id": key}, json={}).status_code == 200
+    assert replicas.seen == [NODES[1]]
+
+
+def test_all_replicas_down_is_a_502_then_503(replicas):
+    replicas.remove(NODES[1])
+    client = TestClient(gateway.app)
+    assert client.post("/predict", json={}).status_code == 502
+    replicas.record_failure(NODES[0])
+    assert client.post("/predict", json={}).status_code == 503
+
+
+def test_admin_paths_and_token(replicas, monkeypatch):
+    client = TestClient(gateway.app)
+    assert client.get("/models").status_code == 404
+    assert client.delete("/gateway/replicas", params={"url": NODES[1]}).status_code == 404
+    monkeypatch.setattr(gateway, "GATEWAY_ADMIN_TOKEN", "secret")
+    assert client.delete("/gateway/replicas", params={"url": NODES[1]}).status_code == 401
+    response = client.delete("/gateway/replicas", params={"url": NODES[1]},
+                             headers={"Authorization": "Bearer secret"})
+    assert response.status_code == 200
+    assert replicas.ring.nodes == {NODES[0]}
@@ -0,0 +1,37 @@
+import numpy as np
+
+from ai_service.inference.metrics import BATCH_SIZE, STAGE_LATENCY
+from ai_service.inference.predictor import DEFAULT_ARTIFACTS_DIR, Predictor
+from ai_service.inference.schemas import WineInput
+from ai_service.inference.shadow import ShadowScorer
+
+
+def test_candidate_is_scored_against_live_without_counting_as_traffic(wine):
+    with Predictor() as predictor:
+        live = predictor.load(DEFAULT_ARTIFACTS_DIR, "live")
+        predictor.load(DEFAULT_ARTIFACTS_DIR, "candidate", activate=False)
+        scorer = ShadowScorer(predictor.registry, sample_rate=1.0)
+        scorer.add("candidate")
+        wines = [WineInput.model_validate({**wine, "alcohol": 8.0 + i / 10}) for i in range(8)]
+        scores = live.predict_wines(wines)
+
+        stages = STAGE_LATENCY.snapshot()
+        requests = {v.version_id: v.requests for v in predictor.registry.versions.values()}
+        try:
+            scorer._score([(live, wine, score) for wine, score in zip(wines, scores)])
+        finally:
+            scorer.executor.shutdown()
+
+        summary = scorer.stats()["candidates"]["candidate"]["against"]["live"]
+        assert summary["rows"] == len(wines)
+        # Same model on both sides: no divergence
+        assert summary["divergence"]["max_abs"] < 1e-6
+        assert summary["divergence"]["class_agreement"] == 1.0
+
+        after = STAGE_LATENCY.snapshot()
+        for labels in set(stages) | set(after):
+            if labels != ("shadow",):
+                assert after.get(labels, (None, 0, 0))[2] == stages.get(labels, (None, 0, 0))[2], labels
+        assert after[("shadow",)][2] == stages.get(("shadow",), (None, 0, 0))[2] + 2
+        assert BATCH_SIZE.snapshot()[("shadow",)][2] >= 2
+        assert {v.version_id: v.requests for v in predictor.registry.versions.values()} == requests
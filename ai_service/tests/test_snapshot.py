@@ -0,0 +1,70 @@
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from ai_service.inference.cache import PredictionCache
+from ai_service.inference.snapshot import ensure_private_dir, read_snapshot, write_snapshot
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = str(tmp_path / "state" / "state.wqs")
+    ensure_private_dir(path)
+    return path
+
+
+def filled_cache():
+    cache = PredictionCache(1 << 20, 600)
+    cache.put(("v1", 7.0, None, 0.5, 1), 5.75)
+    cache.put(("v1", 7.0, 0.3, 0.5, 0, "interval"), (5.5, 5.0, 6.25, 0.8))
+    cache.put(("v1", 6.5, 0.2), np.array([0.1, -0.2, 0.3], dtype=np.float32))
+    cache.put(("old", 1.0, 2.0), 4.0)
+    return cache
+
+
+def test_round_trip_keeps_entries_and_lru_order(snapshot_path):
+    cache = filled_cache()
+    info = write_snapshot(snapshot_path, {"model_version": "v1"}, {"predictions": cache})
+    assert info["entries"] == {"predictions": 4}
+    assert oct(os.stat(os.path.dirname(snapshot_path)).st_mode & 0o777) == "0o700"
+
+    state, caches = read_snapshot(snapshot_path)
+    assert state == {"model_version": "v1"}
+    restored = PredictionCache(1 << 20, 600)
+    # Only entries of models that are loaded again
+    assert restored.restore(caches["predictions"], {"v1"}) == 3
+    assert [key for key, _, _ in restored.entries()] == [key for key, _, _ in cache.entries() if key[0] == "v1"]
+    assert restored.get(("v1", 7.0, None, 0.5, 1)) == 5.75
+    assert restored.get(("v1", 7.0, 0.3, 0.5, 0, "interval")) == (5.5, 5.0, 6.25, 0.8)
+    np.testing.assert_array_equal(restored.get(("v1", 6.5, 0.2)), np.array([0.1, -0.2, 0.3], dtype=np.float32))
+    assert restored.get(("old", 1.0, 2.0)) is None
+
+
+def test_damaged_or_shared_snapshots_are_refused(snapshot_path):
+    write_snapshot(snapshot_path, {}, {"predictions": filled_cache()})
+    with open(snapshot_path, "r+b") as f:
+        f.seek(-4, os.SEEK_END)
+        f.write(b"\xff\xff\xff\xff")
+    with pytest.raises(ValueError, match="Checksum"):
+        read_snapshot(snapshot_path)
+
+    write_snapshot(snapshot_path, {}, {"predictions": filled_cache()})
+    os.chmod(snapshot_path, 0o666)
+    with pytest.raises(ValueError, match="writable by other users"):
+        read_snapshot(snapshot_path)
+
+
+def test_restarted_service_starts_warm(service, client, wine, snapshot_path, monkeypatch):
+    monkeypatch.setattr(service, "SNAPSHOT_PATH", snapshot_path)
+    score = client.post("/predict", json=wine).json()["quality_score"]
+    assert service.save_state()["entries"]["predictions"] >= 1
+
+    # What a restart does: empty caches, then the snapshot read back on startup
+    service.cache.invalidate()
+    asyncio.run(service.restore_state(*service.read_saved_state()))
+    assert service.snapshot_info["restore"]["entries"]["predictions"] >= 1
+    hits = service.cache.hits
+    assert client.post("/predict", json=wine).json()["quality_score"] == score
+    assert service.cache.hits == hits + 1
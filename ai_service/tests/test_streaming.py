@@ -0,0 +1,54 @@
+import json
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+
+def ndjson(*payloads):
+    return "".join(json.dumps(payload) + "\n" for payload in payloads)
+
+
+def results(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_ndjson_scores_each_reading_in_order(client, wine):
+    body = ndjson({**wine, "product_id": "a"}, [{**wine, "product_id": "b"}, {"type": "white", "pH": "x"}], "nope")
+    response = client.post("/predict/stream", content=body + "{not json\n")
+    assert response.status_code == 200
+    out = results(response)
+    assert [r["seq"] for r in out] == [0, 1, 2, 3, 4]
+    assert [r.get("product_id") for r in out[:2]] == ["a", "b"]
+    assert out[0]["quality_score"] == out[1]["quality_score"]
+    assert out[2]["error"].startswith("Invalid input")
+    assert out[3]["error"] == "Invalid input: expected a JSON object"
+    assert out[4]["error"].startswith("Invalid JSON")
+
+
+def test_websocket_scores_each_reading(client, wine):
+    with client.websocket_connect("/ws/predict") as ws:
+        hello = ws.receive_json()
+        assert hello["event"] == "ready"
+        ws.send_text(json.dumps([{**wine, "product_id": i} for i in range(3)]))
+        out = [ws.receive_json() for _ in range(3)]
+    assert [r["seq"] for r in out] == [0, 1, 2]
+    assert [r["product_id"] for r in out] == [0, 1, 2]
+    assert all("quality_score" in r for r in out)
+
+
+def test_message_longer_than_the_buffer_is_one_error(service, client, wine):
+    too_many = [wine] * (service.STREAM_BUFFER_SIZE + 1)
+    out = results(client.post("/predict/stream", content=ndjson(too_many, wine)))
+    assert len(out) == 2
+    assert out[0]["seq"] == 0 and out[0]["error"].startswith("Too many readings")
+    assert out[1]["seq"] == 1 and "quality_score" in out[1]
+
+
+def test_streams_take_a_priority_lane(client, wine):
+    assert client.post("/predict/stream", content=ndjson(wine), headers={"X-Priority": "urgent"}).status_code == 400
+    assert "quality_score" in results(client.post("/predict/stream", content=ndjson(wine),
+                                                  headers={"X-Priority": "bulk"}))[0]
+    with pytest.raises(WebSocketDisconnect) as closed:
+        with client.websocket_connect("/ws/predict?priority=urgent") as ws:
+            ws.receive_json()
+    assert closed.value.code == 1008
@@ -0,0 +1,61 @@
+import math
+import socket
+
+import numpy as np
+import pytest
+
+from ai_service.inference.uds import FLAG_CLIPPED, FLAG_IMPUTED, LENGTH, REQUEST, RESPONSE, UDSClient, UDSError
+
+
+@pytest.fixture
+def uds(service, client):
+    with UDSClient(service.UDS_PATH) as uds:
+        yield uds
+
+
+def test_scores_match_http(uds, client, wine):
+    wines = [wine, {**wine, "type": "red", "alcohol": 12.5}, {**wine, "pH": None}]
+    results = uds.predict(wines)
+    for sent, result in zip(wines, results):
+        expected = client.post("/predict", json=sent).json()
+        assert result["quality_score"] == pytest.approx(expected["quality_score"], abs=1e-6)
+        assert result["model_version"] == expected["model_version"]
+    assert [r["imputed"] for r in results] == [False, False, True]
+
+
+def test_flags_only_readings(uds, wine):
+    layout = uds.layout()
+    names = layout["feature_names"]
+    categories = layout["categories"]
+    rows = np.array([[categories[n][wine[n]] if n in categories else wine[n] for n in names]] * 3)
+    rows[1, names.index("type")] = math.nan  # a missing category is not an imputed reading
+    rows[2, names.index("alcohol")] = math.nan
+    _, scores, flags = uds.predict_matrix(rows)
+    assert len(scores) == 3
+    assert [flag & FLAG_IMPUTED for flag in flags] == [0, 0, FLAG_IMPUTED]
+    assert not any(flag & FLAG_CLIPPED for flag in flags)
+
+
+@pytest.mark.parametrize("n_rows, n_features", [(0, None), (1, 3)])
+def test_bad_shapes_are_rejected(uds, n_rows, n_features):
+    n_features = n_features or len(uds.layout()["feature_names"])
+    with pytest.raises(UDSError) as error:
+        uds.predict_matrix(np.zeros((n_rows, n_features)))
+    assert error.value.status == 400
+
+
+def test_body_length_must_match_the_header(service, client):
+    # A predict request announcing 2 rows of 12 features but carrying one float64
+    header = REQUEST.pack(1, 0, 12, 2, -1, 0, 0)
+    payload = header + np.zeros(1).tobytes()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(5)
+        sock.connect(service.UDS_PATH)
+        sock.sendall(LENGTH.pack(len(payload)) + payload)
+        (length,) = LENGTH.unpack(sock.recv(LENGTH.size))
+        response = b""
+        while len(response) < length:
+            response += sock.recv(length - len(response))
+    status, _, n_rows, version_len = RESPONSE.unpack_from(response)
+    assert status == 400
+    assert b"expected 2 x 12 float64 values" in response[RESPONSE.size + version_len:]
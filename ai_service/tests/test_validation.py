@@ -0,0 +1,26 @@
+from ai_service.inference.schemas import MIN_READINGS, READING_FIELDS
+
+
+def without(wine, count):
+    # The wine with its first `count` readings missing
+    aliases = [name.replace("_", " ") if name != "pH" else name for name in READING_FIELDS]
+    return {**wine, **{alias: None for alias in aliases[:count]}}
+
+
+def test_wine_with_enough_readings_is_imputed(client, wine):
+    body = client.post("/predict", json=without(wine, len(READING_FIELDS) - MIN_READINGS)).json()
+    assert len(body["imputed"]) == len(READING_FIELDS) - MIN_READINGS
+
+
+def test_wine_without_enough_readings_is_a_422(client, wine):
+    response = client.post("/predict", json={"type": "white"})
+    assert response.status_code == 422
+    assert "at least" in response.text
+    assert client.post("/predict", json=without(wine, len(READING_FIELDS) - MIN_READINGS + 1)).status_code == 422
+
+
+def test_batch_reports_the_wine_without_readings_on_its_own(client, wine):
+    results = client.post("/predict_batch", json={"items": [wine, {"type": "red"}, 7]}).json()["results"]
+    assert "quality_score" in results[0]
+    assert results[1]["error"].startswith("Invalid input: only 0 of 11 readings present")
+    assert results[2]["error"] == "Invalid input: expected a JSON object"
@@ -0,0 +1,54 @@
+import os
+import shutil
+
+import pytest
+
+from ai_service.inference.predictor import DEFAULT_ARTIFACTS_DIR
+from ai_service.inference.registry import ModelRegistry
+from ai_service.inference.warehouses import WarehouseModels, _footprint
+
+
+@pytest.fixture
+def models_dir(tmp_path):
+    # Warehouses 1 and 2 get copies of the shipped model, 3 a broken one
+    for warehouse_id in ("1", "2"):
+        shutil.copytree(DEFAULT_ARTIFACTS_DIR, tmp_path / warehouse_id)
+    (tmp_path / "3").mkdir()
+    (tmp_path / "3" / "xgb_model.joblib").write_bytes(b"not a model")
+    return tmp_path
+
+
+def warehouses(models_dir, models_per_budget):
+    budget = int(_footprint(os.path.join(models_dir, "1")) * models_per_budget)
+    return WarehouseModels(str(models_dir), ModelRegistry("", "xgboost"), budget, retry_seconds=60)
+
+
+def test_least_recently_used_warehouse_is_evicted(models_dir):
+    models = warehouses(models_dir, 1.5)
+    first = models.get(1)
+    assert first.version_id.startswith("1@")
+    assert models.get("1") is first  # resident: no second load
+    models.get(2)
+
+    assert models.resident_ids() == ["2"]
+    stats = models.stats()
+    assert (stats["loads"], stats["hits"], stats["evictions"]) == (2, 1, 1)
+    evicted = stats["recent_evictions"][0]
+    assert evicted["warehouse_id"] == "1"
+    assert evicted["load_ms"] > 0
+
+
+def test_failed_load_falls_back_until_the_retry_window_passes(models_dir):
+    models = warehouses(models_dir, 4)
+    assert models.get(3) is None
+    assert not models.has_model(3)
+    assert "3" in models.stats()["failed"]
+    models.retry_seconds = 0
+    assert models.has_model(3)
+
+
+def test_warehouse_ids_must_be_integers(models_dir):
+    models = warehouses(models_dir, 4)
+    assert models.get(4) is None  # no model of its own
+    with pytest.raises(ValueError):
+        models.get("../1")
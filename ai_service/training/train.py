@@ -5,8 +5,8 @@ from xgboost import XGBRegressor
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error
 from sklearn.preprocessing import StandardScaler, LabelEncoder
-import joblib
 import os
+import sys
 import warnings
 
 warnings.filterwarnings('ignore')
@@ -16,6 +16,12 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_PATH = os.path.join(BASE_DIR, "../../winequalityN - Copy.csv")
 ARTIFACTS_DIR = os.path.join(BASE_DIR, "../artifacts")
 
+# Allow running this file directly as well as with `python -m ai_service.training.train`
+sys.path.insert(0, os.path.abspath(os.path.join(BASE_DIR, "../..")))
+from ai_service.inference.bundle import write_bundle, dataset_sha256, BUNDLE_FILENAME
+from ai_service.inference.compiled_forest import CompiledForest
+from ai_service.inference.intervals import INTERVAL_QUANTILES, IntervalHeads
+
 def load_data(path):
     if not os.path.exists(path):
         raise FileNotFoundError(f"Dataset not found at {path}")
@@ -29,9 +35,11 @@ def preprocess_data(df):
     numeric_columns = df_clean.select_dtypes(include=[np.number]).columns
     imputation_values = {}
     for col in numeric_columns:
+        median_val = df_clean[col].median()
         if df_clean[col].isnull().sum() > 0:
-            median_val = df_clean[col].median()
             df_clean[col].fillna(median_val, inplace=True)
+        if col != 'quality':
+            # Kept for every feature: the service fills dead sensors with it too
             imputation_values[col] = median_val
     
     # 2. Handle Categorical Columns (Label Encoding)
@@ -48,13 +56,16 @@ def preprocess_data(df):
     # 3. Split Features and Target
     X = df_clean.drop('quality', axis=1)
     y = df_clean['quality']
+
+    # Observed range per reading; the service clips out-of-range readings to it
+    feature_ranges = {col: [float(X[col].min()), float(X[col].max())] for col in X.columns if col not in label_encoders}
     
     # 4. Scaling
     scaler = StandardScaler()
     X_scaled = scaler.fit_transform(X)
     
     # Return processed data and artifacts needed for inference
-    return X_scaled, y, scaler, label_encoders, imputation_values, X.columns
+    return X_scaled, y, scaler, label_encoders, imputation_values, X.columns, feature_ranges
 
 def optimize_xgboost(X, y, n_trials=20):
     print(f"Starting XGBoost optimization with {n_trials} trials...")
@@ -84,6 +95,73 @@ def optimize_xgboost(X, y, n_trials=20):
     print(f"Best R2: {study.best_value}")
     return study.best_params
 
+def optimize_lightgbm(X, y, n_trials=20):
+    # Same search space as models.py; the result feeds the "lightgbm" inference engine
+    from lightgbm import LGBMRegressor
+    print(f"Starting LightGBM optimization with {n_trials} trials...")
+
+    def objective(trial):
+        params = {
+            'num_leaves': trial.suggest_int('num_leaves', 10, 100),
+            'learning_rate': trial.suggest_float('learning_rate', 0.01, 0.3),
+            'feature_fraction': trial.suggest_float('feature_fraction', 0.4, 1.0),
+            'bagging_fraction': trial.suggest_float('bagging_fraction', 0.4, 1.0),
+            'bagging_freq': trial.suggest_int('bagging_freq', 1, 7),
+            'min_child_samples': trial.suggest_int('min_child_samples', 5, 100),
+            'reg_alpha': trial.suggest_float('reg_alpha', 0, 1),
+            'reg_lambda': trial.suggest_float('reg_lambda', 0, 1),
+        }
+
+        model = LGBMRegressor(n_estimators=200, random_state=42, verbose=-1, **params)
+        score = cross_val_score(model, X, y, cv=5, scoring='r2')
+        return score.mean()
+
+    study = optuna.create_study(direction='maximize')
+    study.optimize(objective, n_trials=n_trials)
+
+    print(f"Best params: {study.best_params}")
+    print(f"Best R2: {study.best_value}")
+    return study.best_params
+
+def train_lightgbm(X_train, y_train, X_test, y_test):
+    # Optional: without lightgbm the bundle just has no LightGBM model
+    try:
+        from lightgbm import LGBMRegressor
+    except ImportError:
+        print("lightgbm not installed, skipping the LightGBM model")
+        return None
+
+    best_params = optimize_lightgbm(X_train, y_train, n_trials=20)
+    print("Training LightGBM model...")
+    model = LGBMRegressor(n_estimators=200, random_state=42, verbose=-1, **best_params)
+    model.fit(X_train, y_train)
+
+    preds = model.predict(X_test)
+    r2 = r2_score(y_test, preds)
+    rmse = np.sqrt(mean_squared_error(y_test, preds))
+    print(f"LightGBM Performance - R2: {r2:.4f}, RMSE: {rmse:.4f}")
+    return model
+
+def train_quantile_heads(X_train, y_train, X_test, y_test, point_model, quantiles=INTERVAL_QUANTILES):
+    # Lower/upper quantiles as one multi-output model. Kept small (shallow, few
+    # trees) so scoring the interval adds little to the point prediction.
+    print(f"Training quantile heads {quantiles}...")
+    model = XGBRegressor(objective="reg:quantileerror", quantile_alpha=np.asarray(quantiles),
+                         n_estimators=30, max_depth=3, learning_rate=0.3, random_state=42)
+    model.fit(X_train, y_train)
+
+    # Quality is an integer, so bounds landing on it count as covered
+    heads = IntervalHeads(CompiledForest.from_model(model), quantiles)
+    point = point_model.predict(X_test)
+    lower, upper = np.sort(model.predict(X_test), axis=1).T
+    y = np.asarray(y_test)
+    coverage = np.mean((y >= lower) & (y <= upper))
+    confidence = heads.confidence(point, lower, upper)
+    accuracy = np.mean(np.rint(point) == y)
+    print(f"Interval coverage: {coverage:.3f}, mean width: {np.mean(upper - lower):.3f}")
+    print(f"Mean confidence: {np.mean(confidence):.3f}, class accuracy: {accuracy:.3f}")
+    return model
+
 def train_and_save():
     # Ensure artifacts directory exists
     os.makedirs(ARTIFACTS_DIR, exist_ok=True)
@@ -92,7 +170,7 @@ def train_and_save():
     df = load_data(DATA_PATH)
     
     # Preprocess
-    X_scaled, y, scaler, label_encoders, imputation_values, feature_names = preprocess_data(df)
+    X_scaled, y, scaler, label_encoders, imputation_values, feature_names, feature_ranges = preprocess_data(df)
     
     # Split for final evaluation
     X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, random_state=42)
@@ -110,15 +188,22 @@ def train_and_save():
     r2 = r2_score(y_test, preds)
     rmse = np.sqrt(mean_squared_error(y_test, preds))
     print(f"Final Model Performance - R2: {r2:.4f}, RMSE: {rmse:.4f}")
+
+    # Alternative backend model on the same features
+    lgb_model = train_lightgbm(X_train, y_train, X_test, y_test)
+
+    # Prediction interval heads (filled into is_predicted.confidence)
+    quantile_model = train_quantile_heads(X_train, y_train, X_test, y_test, final_model)
     
-    # Save Artifacts
+    # Save Artifacts (single memory-mappable bundle, see inference/bundle.py)
     print("Saving artifacts...")
-    joblib.dump(final_model, os.path.join(ARTIFACTS_DIR, 'xgb_model.joblib'))
-    joblib.dump(scaler, os.path.join(ARTIFACTS_DIR, 'scaler.joblib'))
-    joblib.dump(label_encoders, os.path.join(ARTIFACTS_DIR, 'label_encoders.joblib'))
-    joblib.dump(imputation_values, os.path.join(ARTIFACTS_DIR, 'imputation_values.joblib'))
-    joblib.dump(feature_names, os.path.join(ARTIFACTS_DIR, 'feature_names.joblib'))
-    print(f"Artifacts saved to {ARTIFACTS_DIR}")
+    bundle_path = os.path.join(ARTIFACTS_DIR, BUNDLE_FILENAME)
+    manifest = write_bundle(
+        bundle_path, final_model, scaler, label_encoders, imputation_values, feature_names,
+        dataset_hash=dataset_sha256(DATA_PATH), lightgbm_model=lgb_model,
+        quantile_model=quantile_model, quantiles=INTERVAL_QUANTILES, feature_ranges=feature_ranges,
+    )
+    print(f"Artifacts saved to {bundle_path} (version {manifest['version']})")
 
 if __name__ == "__main__":
     train_and_save()
@@ -21,6 +21,16 @@ async function migrate() {
         console.log("warehouse_id column already exists.");
       }
 
+      // Wine type of each product (a model feature, needed to explain its score)
+      const [typeColumns] = await connection.query(`SHOW COLUMNS FROM product LIKE 'type'`);
+      if (typeColumns.length === 0) {
+        console.log("Adding type column to product table...");
+        await connection.query(`ALTER TABLE product ADD COLUMN type varchar(10) DEFAULT NULL`);
+        console.log("Column added successfully.");
+      } else {
+        console.log("type column already exists.");
+      }
+
       // Check if index exists on is_predicted(time_predict)
       const [indexes] = await connection.query(`SHOW INDEX FROM is_predicted WHERE Key_name = 'idx_time_predict'`);
       if (indexes.length === 0) {
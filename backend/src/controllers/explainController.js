@@ -0,0 +1,76 @@
+import axios from 'axios';
+import { getProductDetails, getBatchProducts, toWineInput } from '../models/Product.js';
+
+const aiServiceUrl = process.env.AI_SERVICE_URL || 'http://127.0.0.1:8000';
+
+// Feature attributions from the AI service: why a product (or every product
+// of a batch) got its quality score. The wine type is a model feature: it comes
+// from the product row, so a batch mixing red and white explains each product
+// with its own type. Rows stored before the type column existed have none:
+// those need ?type=red|white (guessing one would explain a different
+// prediction than the stored score).
+
+const WINE_TYPES = ['red', 'white'];
+
+const wineType = (product, queryType) => product.type || queryType;
+
+const invalidType = (queryType) =>
+    queryType !== undefined && !WINE_TYPES.includes(queryType);
+
+const typeRequired = (res) =>
+    res.status(400).json({ message: `Wine type not stored for this product: pass ?type=${WINE_TYPES.join('|')}` });
+
+const forwardError = (res, error) => {
+    if (error.response) {
+        return res.status(error.response.status).json(error.response.data);
+    }
+    console.error("Error calling AI service:", error.message);
+    return res.status(502).json({ message: "AI Service Unavailable", error: error.message });
+};
+
+export const explainProduct = async (req, res) => {
+    try {
+        if (invalidType(req.query.type)) {
+            return res.status(400).json({ message: `type must be one of ${WINE_TYPES.join(', ')}` });
+        }
+        const product = await getProductDetails(req.params.productId);
+        if (!product) {
+            return res.status(404).json({ message: 'Product not found' });
+        }
+        const type = wineType(product, req.query.type);
+        if (!type) {
+            return typeRequired(res);
+        }
+        const wine = toWineInput(product, type);
+        const aiResponse = await axios.post(`${aiServiceUrl}/explain`, wine);
+        res.status(200).json(aiResponse.data);
+    } catch (error) {
+        forwardError(res, error);
+    }
+};
+
+export const explainBatch = async (req, res) => {
+    try {
+        if (invalidType(req.query.type)) {
+            return res.status(400).json({ message: `type must be one of ${WINE_TYPES.join(', ')}` });
+        }
+        if (!/^\d+$/.test(req.params.batchId)) {
+            return res.status(400).json({ message: 'batchId must be an integer' });
+        }
+        const batchId = parseInt(req.params.batchId, 10);
+        const products = await getBatchProducts(batchId);
+        if (products.length === 0) {
+            return res.status(404).json({ message: 'Batch not found or empty' });
+        }
+        if (products.some((product) => !wineType(product, req.query.type))) {
+            return typeRequired(res);
+        }
+        const items = products.map((product) => toWineInput(product, wineType(product, req.query.type)));
+        // A batch comes off one line, so one warehouse model explains all of it
+        const headers = products[0].warehouse_id ? { 'X-Warehouse-Id': String(products[0].warehouse_id) } : {};
+        const aiResponse = await axios.post(`${aiServiceUrl}/explain/batch`, { batch_id: batchId, items }, { headers });
+        res.status(200).json(aiResponse.data);
+    } catch (error) {
+        forwardError(res, error);
+    }
+};
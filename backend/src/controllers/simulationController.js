@@ -27,9 +27,12 @@ export const processSimulationData = async (req, res) => {
         
         let prediction = null;
         try {
-            const aiResponse = await axios.post(`${aiServiceUrl}/predict`, inputData);
+            const aiResponse = await axios.post(`${aiServiceUrl}/predict?interval=true`, inputData);
             prediction = aiResponse.data;
             console.log("[AI Service] Prediction received:", prediction);
+            if (prediction.interval_available === false) {
+                console.warn("[AI Service] Model has no interval heads: confidence is stored as NULL");
+            }
         } catch (aiError) {
             console.error("Error calling AI service:", aiError.message);
             // We can still proceed without prediction or return error
@@ -88,6 +88,12 @@ export async function storeProduct(data, prediction) {
         const productColumns = ['product_id', 'batch_id', 'warehouse_id', 'line_id'];
         const productValues = [product_id, batch_id, targetWarehouseId, line_id];
 
+        // The wine type is a model feature: keep it so the product can be explained later
+        if (type !== undefined) {
+            productColumns.push('type');
+            productValues.push(type);
+        }
+
         for (const [key, dbCol] of Object.entries(ATTRIBUTE_MAP)) {
             if (attributes[key] !== undefined) {
                 productColumns.push(dbCol);
@@ -141,7 +147,8 @@ export async function storeProduct(data, prediction) {
                      VALUES (NOW(), ?, ?, ?, ?, ?)`,
                     [
                         prediction.quality_score, 
-                        'High', // Mock confidence or calculate it
+                        // Probability that quality_class is right, from the model's interval heads
+                        prediction.confidence != null ? prediction.confidence.toFixed(3) : null,
                         prediction.quality_class.toString(), 
                         product_id, 
                         modelId
@@ -173,6 +180,24 @@ export async function getProductDetails(productId) {
     return rows[0];
 }
 
+export async function getBatchProducts(batchId) {
+    const [rows] = await pool.query(
+        `SELECT * FROM product WHERE batch_id = ? ORDER BY product_id`,
+        [batchId]
+    );
+    return rows;
+}
+
+// Product row -> AI service input. The caller supplies the wine type: the
+// stored one, or a fallback for rows stored without it.
+export function toWineInput(product, type) {
+    const wine = { product_id: product.product_id, type, warehouse_id: product.warehouse_id };
+    for (const [feature, dbCol] of Object.entries(ATTRIBUTE_MAP)) {
+        wine[feature] = product[dbCol];
+    }
+    return wine;
+}
+
 export async function getAverageMetric(metric, filterType, filterValue) {
     // filterType: 'line_id' or 'batch_id'
     const allowedMetrics = [
@@ -235,7 +260,7 @@ export async function getRecentProducts(limit = 50, warehouseId = null) {
         'residual sugar': row.residual_sugar,
         'free sulfur dioxide': row.free_sulfur_dioxide,
         'total sulfur dioxide': row.total_sulfur_dioxide,
-        // Add default type if missing (since we don't store it yet)
+        // Rows stored before the type column existed have none
         type: row.type || 'unknown' 
     }));
 }
@@ -8,6 +8,7 @@ import {
     getAlertsByDate,
     getTesterComparisons
 } from '../controllers/dashboardController.js';
+import { explainProduct, explainBatch } from '../controllers/explainController.js';
 
 const router = express.Router();
 
@@ -18,5 +19,7 @@ router.get('/products', getRecentProducts);
 router.get('/comparison', getComparisonData);
 router.get('/alerts-calendar', getAlertsByDate);
 router.get('/tester-comparisons', getTesterComparisons);
+router.get('/products/:productId/explain', explainProduct);
+router.get('/batches/:batchId/explain', explainBatch);
 
 export default router;
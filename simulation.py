@@ -54,11 +54,25 @@ def main():
     parser = argparse.ArgumentParser(description='Wine Production Simulation')
     parser.add_argument('--warehouse', type=int, default=1, help='Warehouse ID to stream data to')
     parser.add_argument('--interval', type=float, default=1)
+    parser.add_argument('--uds', metavar='PATH', help='Score directly on the inference service Unix socket '
+                        '(UDS_PATH), bypassing the backend; nothing is stored')
+    parser.add_argument('--local', nargs='?', const='ai_service/artifacts', metavar='ARTIFACTS',
+                        help='Score in-process with the model artifacts (default ai_service/artifacts), '
+                        'no service or backend needed; nothing is stored')
     args = parser.parse_args()
     
     warehouse_id = args.warehouse
     INTERVAL = args.interval
-    print(f"Starting simulation for Warehouse {warehouse_id}. Sending data to {BACKEND_URL} every {INTERVAL} seconds.")
+    client = None
+    if args.uds:
+        from ai_service.inference.uds import UDSClient
+        client = UDSClient(args.uds)
+    predictor = None
+    if args.local:
+        from ai_service.inference.predictor import Predictor
+        predictor = Predictor.from_artifacts(args.local)
+    target = args.uds or (f"the local model in {args.local}" if args.local else BACKEND_URL)
+    print(f"Starting simulation for Warehouse {warehouse_id}. Sending data to {target} every {INTERVAL} seconds.")
     
     while True:
         try:
@@ -83,6 +97,18 @@ def main():
             
             print(f"Sending data: Warehouse {data['warehouse_id']} - Line {data['line_id']} - {data['product_id']} ({data['type']})")
             
+            if predictor is not None:
+                quality_score = predictor.predict_one(data)
+                print(f"[Success] AI Prediction: Quality {quality_score:.3f} ({predictor.active.version_id})")
+                time.sleep(INTERVAL)
+                continue
+
+            if client is not None:
+                result = client.predict([data], warehouse_id=warehouse_id)[0]
+                print(f"[Success] AI Prediction: Quality {result['quality_score']:.3f} ({result['model_version']})")
+                time.sleep(INTERVAL)
+                continue
+
             response = requests.post(BACKEND_URL, json=data)
             
             if response.status_code == 200: